@@ -1,19 +1,366 @@
+import itertools
+import threading
+from collections import deque
+from functools import lru_cache
 import numpy as np
-import pyhrv.frequency_domain as fd
+from scipy.linalg import solve_banded
+from scipy.signal import get_window
+
+# 与 pyhrv welch_psd 默认值保持一致
+RESAMPLE_RATE = 4.0
+FREQ_BANDS = {'vlf': (0.0, 0.04), 'lf': (0.04, 0.15), 'hf': (0.15, 0.4)}
+# 增量重采样：样条拟合用的节点数，以及定稿区间前后各保留的节点数
+SPLINE_KNOTS = 8
+SPLINE_LAG = 3
+
+
+@lru_cache(maxsize=None)
+def hamming_window(n):
+    """与 scipy welch(window='hamming') 相同的周期 Hamming 窗，按长度缓存（只读）"""
+    win = get_window('hamming', n)
+    win.setflags(write=False)
+    return win
+
+
+@lru_cache(maxsize=None)
+def band_weights(fs, nfft):
+    """
+    按 pyhrv 的方式计算频带功率所需的权重矩阵：频带两端闭区间求和 × 频率分辨率
+    返回 shape (3, nfft//2+1)，与 PSD 做一次点积即得 (VLF, LF, HF)
+    """
+    freqs = np.fft.rfftfreq(nfft, 1.0 / fs)
+    df = freqs[1] - freqs[0]
+    weights = np.array([((lo <= freqs) & (freqs <= hi)) * df
+                        for lo, hi in (FREQ_BANDS['vlf'], FREQ_BANDS['lf'], FREQ_BANDS['hf'])])
+    weights.setflags(write=False)
+    return weights
+
+
+def welch_band_powers(nni, fs=RESAMPLE_RATE, nfft=128):
+    """
+    pyhrv.frequency_domain.welch_psd(nfft=128, detrend=True, window='hamming') 的精简实现，
+    只算 (VLF, LF, HF) 绝对功率，不构造结果字典也不画图
+    步骤与 pyhrv 相同：NN 间期三次样条插值到 fs 网格 -> 去均值 -> Welch（段长 nfft、半重叠、
+    每段去均值）-> 频带两端闭区间求和 × 频率分辨率；窗函数和频带权重按长度缓存
+    :param nni: NN 间期序列 (ms)，至少 4 个
+    """
+    nn = np.asarray(nni, dtype=float)
+    t = np.cumsum(nn)
+    t -= t[0]
+    x = spline_eval(t, nn, spline_coeffs(t, nn), np.arange(0.0, t[-1], 1000.0 / fs))
+    return tuple(float(p) for p in band_weights(fs, nfft) @ welch_psd(x, fs, nfft))
+
+
+def welch_psd(x, fs, nfft):
+    """
+    与 scipy.signal.welch(window='hamming', nperseg=nfft, detrend='constant') 相同的分段方式：
+    从 x 起点开始按半重叠切段，各段去均值、加窗后批量 FFT 再取平均
+    """
+    # 样本不足一段时与 scipy 一样把段长缩短为样本数
+    nperseg = min(nfft, len(x))
+    hop = nperseg - nperseg // 2
+    segs = np.lib.stride_tricks.sliding_window_view(x, nperseg)[::hop]
+    win = hamming_window(nperseg)
+    spec = np.fft.rfft((segs - segs.mean(axis=1, keepdims=True)) * win, nfft, axis=1)
+    psd = (spec.real ** 2 + spec.imag ** 2).mean(axis=0) / (fs * np.dot(win, win))
+    if nfft % 2:
+        psd[1:] *= 2
+    else:
+        psd[1:-1] *= 2
+    return psd
+
+
+class StreamingResampler:
+    """
+    RR 间期流增量重采样到等间隔网格（网格以第一个心搏时刻为 0 点，与 pyhrv 的 t -= t[0] 一致）
+    每来一个间期只对最近 SPLINE_KNOTS 个节点拟合 not-a-knot 三次样条；中间区间 [t(LAG), t(LAG+1))
+    两侧都有足够节点，与整段样条几乎一致，这部分才定稿写入缓存；更靠后的尾部在取窗口时用同一条样条临时计算。
+    一次推入多个间期时（extend）整批共用一次拟合
+    """
+
+    def __init__(self, fs=RESAMPLE_RATE, unit=1000.0):
+        """
+        :param fs: 重采样频率 (Hz)
+        :param unit: 间期单位对应 1 秒的数值，ms 为 1000，s 为 1
+        """
+        self.step = unit / fs       # 网格间隔（与间期同单位）
+        self.t = None               # 最新心搏时刻（相对第一个心搏）
+        self.count = 0              # 已推入的间期总数
+        self._knots = deque()       # 下次拟合要用的最近节点 (t, rri)
+        self._spline = None         # 最近节点上的样条 (ts, vs, 二阶导数)
+        self._samples = deque()     # 已定稿的网格值
+        self.base = 0               # _samples[0] 对应的绝对网格序号
+        self.end = 0                # 下一个待定稿的绝对网格序号
+
+    def push(self, rri):
+        self.extend((rri,))
+
+    def extend(self, rris):
+        """
+        推入一批间期；整批只拟合一次样条（覆盖新节点和之前保留的 SPLINE_KNOTS-1 个节点），
+        定稿到倒数第 SPLINE_LAG+1 个节点为止
+        """
+        for rri in rris:
+            self.t = 0.0 if self.t is None else self.t + rri
+            self._knots.append((self.t, rri))
+            self.count += 1
+        n = len(self._knots)
+        if n < 4:
+            return
+        ts = np.fromiter((k[0] for k in self._knots), dtype=float, count=n)
+        vs = np.fromiter((k[1] for k in self._knots), dtype=float, count=n)
+        self._spline = ts, vs, spline_coeffs(ts, vs)
+        while len(self._knots) > SPLINE_KNOTS - 1:
+            self._knots.popleft()
+        if n < SPLINE_KNOTS:
+            return
+        first, last = self._grid_range(ts[0], ts[-(SPLINE_LAG + 1)])
+        if last > first:
+            self._samples.extend(spline_eval(*self._spline, np.arange(first, last) * self.step))
+            self.end = last
+
+    @property
+    def ready(self):
+        return self._spline is not None
+
+    def index_at(self, t):
+        """t 时刻及之后的第一个网格序号"""
+        return int(np.ceil((t - 1e-9) / self.step))
+
+    def _grid_range(self, lo, hi):
+        return max(self.end, self.index_at(lo)), self.index_at(hi)
+
+    def array(self, start, end):
+        """已定稿的网格值 [start, end)"""
+        base = self.base
+        return np.fromiter(itertools.islice(self._samples, start - base, end - base),
+                           dtype=float, count=end - start)
+
+    def tail(self):
+        """尚未定稿的尾部网格值，算到最新心搏时刻为止（不含）"""
+        if self._spline is None:
+            return np.empty(0)
+        ts = self._spline[0]
+        first, last = self._grid_range(ts[0], ts[-1])
+        if last <= first:
+            return np.empty(0)
+        return spline_eval(*self._spline, np.arange(first, last) * self.step)
+
+    def window(self, t_start):
+        """
+        从 t_start 到最新心搏时刻的网格值
+        :return: (起始绝对网格序号, 网格值数组)
+        """
+        start = max(self.index_at(t_start), self.base)
+        return start, np.concatenate((self.array(start, self.end), self.tail()))
+
+    def trim(self, t_start):
+        """丢弃 t_start 之前已定稿的网格值"""
+        keep_from = self.index_at(t_start)
+        while self._samples and self.base < keep_from:
+            self._samples.popleft()
+            self.base += 1
+        if not self._samples:
+            self.base = max(self.base, min(keep_from, self.end))
+
+
+class IncrementalHRV:
+    """
+    滑动窗口 HRV 增量计算引擎
+    - 时域：维护窗口内 RR 间期的和、平方和、相邻差平方和，每来一个样本 O(1) 更新 SDNN/RMSSD
+    - 频域：RR 序列经 StreamingResampler 按 4Hz 网格增量重采样（只为新到达的区间补点），
+      查询时 Welch 分段从窗口起点开始切（与 pyhrv 整窗计算的分段位置一致），各段批量 FFT；
+      分段若按绝对网格对齐来缓存周期图，长窗口下 LF/HF 与 pyhrv 的偏差可达 10% 以上
+    """
+
+    def __init__(self, window_size, fs=RESAMPLE_RATE, nfft=128, resync_every=1000):
+        """
+        :param window_size: 窗口内 RR 间期个数
+        :param fs: 重采样频率 (Hz)
+        :param nfft: Welch 段长 / FFT 点数
+        :param resync_every: 每推入多少个样本按窗口重新精确求和一次，防止浮点累计误差
+        """
+        self.window_size = window_size
+        self.fs = fs
+        self.nfft = nfft
+        self.resync_every = resync_every
+        self.lock = threading.Lock()
+
+        # 时域
+        self.rri = deque()          # 窗口内 RR 间期 (ms)
+        self.beat_t = deque()       # 对应的心搏时刻 (ms)
+        self._ref = None            # 求和参考值，减小大数相减的误差
+        self._sum = 0.0
+        self._sumsq = 0.0
+        self._diffsq = 0.0
+        self._pushes = 0
+
+        # 频域
+        self.resampler = StreamingResampler(fs)
+        self._band_weights = band_weights(fs, nfft)
+
+    def push_hr(self, hr):
+        if hr and hr > 0:
+            self.push_rri(60000.0 / hr)
+
+    def push_rri(self, rri):
+        with self.lock:
+            self.resampler.push(rri)
+            self._push_time(rri)
+            self.resampler.trim(self.beat_t[0])
+
+    # ---------- 时域 ----------
+    def _push_time(self, rri):
+        if self._ref is None:
+            self._ref = rri
+        x = rri - self._ref
+        if self.rri:
+            self._diffsq += (rri - self.rri[-1]) ** 2
+        self.rri.append(rri)
+        self.beat_t.append(self.resampler.t)
+        self._sum += x
+        self._sumsq += x * x
+
+        if len(self.rri) > self.window_size:
+            old = self.rri.popleft()
+            self.beat_t.popleft()
+            self._diffsq -= (self.rri[0] - old) ** 2
+            x_old = old - self._ref
+            self._sum -= x_old
+            self._sumsq -= x_old * x_old
+
+        self._pushes += 1
+        if self._pushes % self.resync_every == 0:
+            self._resync()
+
+    def _resync(self):
+        arr = np.fromiter(self.rri, dtype=float)
+        self._ref = float(arr[-1])
+        x = arr - self._ref
+        self._sum = float(x.sum())
+        self._sumsq = float(np.dot(x, x))
+        d = np.diff(arr)
+        self._diffsq = float(np.dot(d, d))
+
+    def time_domain(self):
+        """返回 (rmssd, sdnn)，窗口未满返回 None"""
+        with self.lock:
+            n = len(self.rri)
+            if n < self.window_size:
+                return None
+            mean_x = self._sum / n
+            sdnn = np.sqrt(max(self._sumsq / n - mean_x * mean_x, 0.0))
+            rmssd = np.sqrt(max(self._diffsq, 0.0) / (n - 1)) if n > 1 else 0.0
+            return rmssd, sdnn
+
+    # ---------- 频域 ----------
+    def freq_domain(self):
+        """返回 (LF_HF_ratio, LF, HF)，窗口未满或样本不足返回 None"""
+        with self.lock:
+            if len(self.rri) < self.window_size or not self.resampler.ready:
+                return None
+            _, x = self.resampler.window(self.beat_t[0])
+        if len(x) < 2:
+            return None
+        _, lf, hf = (float(p) for p in self._band_weights @ welch_psd(x, self.fs, self.nfft))
+        ratio = lf / hf if hf > 0 else float('nan')
+        return ratio, lf, hf
+
+
+def spline_coeffs(ts, vs):
+    """
+    not-a-knot 三次样条（与 scipy interp1d(kind='cubic') / CubicSpline 默认边界一致）的节点二阶导数
+    两端的 not-a-knot 条件代入后方程组是三对角的，直接用带状求解，比构造 CubicSpline 对象快得多
+    :param ts: 递增节点（至少 4 个）
+    """
+    n = len(ts)
+    h = np.diff(ts)
+    rhs = 6 * np.diff(np.diff(vs) / h)
+    diag = 2 * (h[:-1] + h[1:])
+    upper = h[1:-1].copy()
+    lower = h[1:-1].copy()
+    # not-a-knot：首尾两个内节点处三阶导数连续，
+    # 即 M0 = ((h0+h1)M1 - h0 M2)/h1，M(n-1) 同理，消去后只剩 M1..M(n-2)
+    h0, h1 = h[0], h[1]
+    diag[0] += h0 * (h0 + h1) / h1
+    upper[0] -= h0 * h0 / h1
+    hl, hl1 = h[-1], h[-2]
+    diag[-1] += hl * (hl + hl1) / hl1
+    lower[-1] -= hl * hl / hl1
+
+    ab = np.zeros((3, n - 2))
+    ab[0, 1:] = upper
+    ab[1] = diag
+    ab[2, :-1] = lower
+    m = np.empty(n)
+    m[1:-1] = solve_banded((1, 1), ab, rhs, check_finite=False)
+    m[0] = ((h0 + h1) * m[1] - h0 * m[2]) / h1
+    m[-1] = ((hl + hl1) * m[-2] - hl * m[-3]) / hl1
+    return m
+
+
+def spline_eval(ts, vs, m, x):
+    """按 spline_coeffs 求得的二阶导数 m 计算 x 处的样条值"""
+    k = np.searchsorted(ts, x, side='right') - 1
+    np.clip(k, 0, len(ts) - 2, out=k)
+    t0, t1 = ts[k], ts[k + 1]
+    hk = t1 - t0
+    left = t1 - x
+    right = x - t0
+    return ((m[k] * left ** 3 + m[k + 1] * right ** 3) / (6 * hk)
+            + (vs[k] / hk - m[k] * hk / 6) * left
+            + (vs[k + 1] / hk - m[k + 1] * hk / 6) * right)
+
 
 class HRVcalculate:
-    def __init__(self, radar, ppg, window_size=40):
+    def __init__(self, radar, ppg, window_size=40, incremental=True, backend='native', bus=None):
         """
         初始化 HRVcalculate 类
         :param radar: MicRadar 实例，须包含 heart_rate 队列
         :param window_size: 触发计算的心率样本数量，每3s一个，40个即120s
+        :param incremental: True 时雷达心率通过 push_hr 增量更新 IncrementalHRV，
+                            compute_time/compute_freq 直接读取引擎结果，不再每次整窗重算
+        :param backend: 整窗频域计算（compute_freq 非增量模式 / compute_freq_rri）的实现：
+                        'native' 使用 welch_band_powers，'pyhrv' 使用 pyhrv.frequency_domain.welch_psd
+                        （只在该后端下才导入 pyhrv）
+        :param bus: SampleBus 实例，得到新的 HRV 结果时发布 sdnn/LF/HF/lf_hf 样本
+                    （增量模式下 sdnn 每推入一个心率发布一次，O(1)；频谱需要重采样 + Welch，
+                    只在 compute_freq 时计算并发布，且两次调用之间有新心率才发布，
+                    因此雷达读线程上不做频域计算；非增量模式在 compute_time/compute_freq 时发布）
         """
+        if backend not in ('native', 'pyhrv'):
+            raise ValueError(f"unknown HRV backend: {backend}")
         self.radar = radar
         self.ppg = ppg
         self.window_size = window_size
+        self.backend = backend
+        self.bus = bus
         self.rri_mat = None
+        self.engine = IncrementalHRV(window_size) if incremental else None
+        self._freq_stale = False  # 上次 compute_freq 之后引擎是否推入了新心率
+
+    def push_hr(self, hr):
+        """雷达每解析到一个有效心率调用一次（在读线程上，只做 O(1) 的时域更新）"""
+        if self.engine is not None:
+            self.engine.push_hr(hr)
+            self._freq_stale = True
+            if self.bus:
+                self._publish_time(self.engine.time_domain())
+
+    def _publish_time(self, result):
+        if result:
+            self.bus.publish('sdnn', float(result[1]), 'radar')
+
+    def _publish_freq(self, result):
+        if result:
+            ratio, lf, hf = result
+            self.bus.publish('LF', lf, 'radar')
+            self.bus.publish('HF', hf, 'radar')
+            self.bus.publish('lf_hf', ratio, 'radar')
 
     def compute_time(self):
+        if self.engine is not None:
+            return self.engine.time_domain()
         if len(self.radar.heart_rate) >= self.window_size:
             # 构建 1×window_size 的心率矩阵
             hr_list = list(self.radar.heart_rate)[-self.window_size:]
@@ -31,36 +378,31 @@ class HRVcalculate:
             sdnn = np.std(self.rri_mat)
             rmssd = np.sqrt(np.mean(np.diff(self.rri_mat)**2))
 
+            if self.bus:
+                self._publish_time((rmssd, sdnn))
             return  rmssd, sdnn
         else:
             return None
 
     def compute_freq(self):
+        if self.engine is not None:
+            # 先清标志再计算：计算期间推入的心率留到下一轮发布
+            fresh, self._freq_stale = self._freq_stale, False
+            result = self.engine.freq_domain()
+            if result:
+                self.LF_HF_ratio, self.LF, self.HF = result
+                if self.bus and fresh:
+                    self._publish_freq(result)
+            return result
         if self.rri_mat is not None and len(self.radar.heart_rate) >= self.window_size:
             # 展平并截取 window_size 个值
             nni = self.rri_mat
             # 过滤掉可能的 nan 或非正值
             nni = nni[np.isfinite(nni) & (nni > 0)]
-            result = fd.welch_psd(
-                nni=nni,
-                nfft=128,
-                detrend=True,
-                window='hamming',
-                show=False
-            )
-
-            # 提取 LF 和 HF 绝对功率
-            fft_abs = result['fft_abs']
-            fft_ratio = result['fft_ratio']
-
-            # 转换为 float
-            vlf_power = float(fft_abs[0])
-            self.LF  = float(fft_abs[1])
-            self.HF  = float(fft_abs[2])
-            self.LF_HF_ratio = float(fft_ratio) if not isinstance(fft_ratio, (list, np.ndarray)) \
-                        else float(fft_ratio[0])
-
-            return self.LF_HF_ratio, self.LF, self.HF
+            result = self.freq_powers(nni)
+            if self.bus:
+                self._publish_freq(result)
+            return result
         return None
         
     def compute_time_rri(self):
@@ -83,6 +425,13 @@ class HRVcalculate:
 
             # 过滤掉可能的 nan 或非正值
             nni = nni[np.isfinite(nni) & (nni > 0)]
+            return self.freq_powers(nni)
+        return None
+
+    def freq_powers(self, nni):
+        """按所选后端对一段 NN 间期做 Welch 频域分析，返回 (LF_HF_ratio, LF, HF)"""
+        if self.backend == 'pyhrv':
+            import pyhrv.frequency_domain as fd
             result = fd.welch_psd(
                 nni=nni,
                 nfft=128,
@@ -96,11 +445,12 @@ class HRVcalculate:
             fft_ratio = result['fft_ratio']
 
             # 转换为 float
-            vlf_power = float(fft_abs[0])
             self.LF  = float(fft_abs[1])
             self.HF  = float(fft_abs[2])
             self.LF_HF_ratio = float(fft_ratio) if not isinstance(fft_ratio, (list, np.ndarray)) \
                         else float(fft_ratio[0])
+        else:
+            _, self.LF, self.HF = welch_band_powers(nni)
+            self.LF_HF_ratio = self.LF / self.HF if self.HF > 0 else float('nan')
 
-            return self.LF_HF_ratio, self.LF, self.HF
-        return None
\ No newline at end of file
+        return self.LF_HF_ratio, self.LF, self.HF
@@ -37,7 +37,7 @@ var BA=Object.defineProperty;var UA=(e,t,n)=>t in e?BA(e,t,{enumerable:!0,config
 `+i[a].replace(" at new "," at ");return e.displayName&&l.includes("<anonymous>")&&(l=l.replace("<anonymous>",e.displayName)),l}while(1<=a&&0<=s);break}}}finally{cd=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?La(e):""}function gj(e){switch(e.tag){case 5:return La(e.type);case 16:return La("Lazy");case 13:return La("Suspense");case 19:return La("SuspenseList");case 0:case 2:case 15:return e=fd(e.type,!1),e;case 11:return e=fd(e.type.render,!1),e;case 1:return e=fd(e.type,!0),e;default:return""}}function mp(e){if(e==null)return null;if(typeof e=="function")return e.displayName||e.name||null;if(typeof e=="string")return e;switch(e){case vo:return"Fragment";case mo:return"Portal";case dp:return"Profiler";case wm:return"StrictMode";case pp:return"Suspense";case hp:return"SuspenseList"}if(typeof e=="object")switch(e.$$typeof){case kb:return(e.displayName||"Context")+".Consumer";case Eb:return(e._context.displayName||"Context")+".Provider";case bm:var t=e.render;return e=e.displayName,e||(e=t.displayName||t.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case Sm:return t=e.displayName||null,t!==null?t:mp(e.type)||"Memo";case zr:t=e._payload,e=e._init;try{return mp(e(t))}catch{}}return null}function yj(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=t.render,e=e.displayName||e.name||"",t.displayName||(e!==""?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return mp(t);case 8:return t===wm?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if(typeof t=="function")return t.displayName||t.name||null;if(typeof t=="string")return t}return null}function oi(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function _b(e){var t=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function xj(e){var t=_b(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&typeof n<"u"&&typeof n.get=="function"&&typeof n.set=="function"){var i=n.get,o=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return i.call(this)},set:function(a){r=""+a,o.call(this,a)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(a){r=""+a},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}function xl(e){e._valueTracker||(e._valueTracker=xj(e))}function Ab(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=_b(e)?e.checked?"true":"false":e.value),e=r,e!==n?(t.setValue(e),!0):!1}function Cu(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch{return e.body}}function vp(e,t){var n=t.checked;return $e({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:n??e._wrapperState.initialChecked})}function by(e,t){var n=t.defaultValue==null?"":t.defaultValue,r=t.checked!=null?t.checked:t.defaultChecked;n=oi(t.value!=null?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:t.type==="checkbox"||t.type==="radio"?t.checked!=null:t.value!=null}}function jb(e,t){t=t.checked,t!=null&&xm(e,"checked",t,!1)}function gp(e,t){jb(e,t);var n=oi(t.value),r=t.type;if(n!=null)r==="number"?(n===0&&e.value===""||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if(r==="submit"||r==="reset"){e.removeAttribute("value");return}t.hasOwnProperty("value")?yp(e,t.type,n):t.hasOwnProperty("defaultValue")&&yp(e,t.type,oi(t.defaultValue)),t.checked==null&&t.defaultChecked!=null&&(e.defaultChecked=!!t.defaultChecked)}function Sy(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!(r!=="submit"&&r!=="reset"||t.value!==void 0&&t.value!==null))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}n=e.name,n!==""&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,n!==""&&(e.name=n)}function yp(e,t,n){(t!=="number"||Cu(e.ownerDocument)!==e)&&(n==null?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}var za=Array.isArray;function jo(e,t,n,r){if(e=e.options,t){t={};for(var i=0;i<n.length;i++)t["$"+n[i]]=!0;for(n=0;n<e.length;n++)i=t.hasOwnProperty("$"+e[n].value),e[n].selected!==i&&(e[n].selected=i),i&&r&&(e[n].defaultSelected=!0)}else{for(n=""+oi(n),t=null,i=0;i<e.length;i++){if(e[i].value===n){e[i].selected=!0,r&&(e[i].defaultSelected=!0);return}t!==null||e[i].disabled||(t=e[i])}t!==null&&(t.selected=!0)}}function xp(e,t){if(t.dangerouslySetInnerHTML!=null)throw Error(F(91));return $e({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function Py(e,t){var n=t.value;if(n==null){if(n=t.children,t=t.defaultValue,n!=null){if(t!=null)throw Error(F(92));if(za(n)){if(1<n.length)throw Error(F(93));n=n[0]}t=n}t==null&&(t=""),n=t}e._wrapperState={initialValue:oi(n)}}function Mb(e,t){var n=oi(t.value),r=oi(t.defaultValue);n!=null&&(n=""+n,n!==e.value&&(e.value=n),t.defaultValue==null&&e.defaultValue!==n&&(e.defaultValue=n)),r!=null&&(e.defaultValue=""+r)}function Oy(e){var t=e.textContent;t===e._wrapperState.initialValue&&t!==""&&t!==null&&(e.value=t)}function Tb(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function wp(e,t){return e==null||e==="http://www.w3.org/1999/xhtml"?Tb(t):e==="http://www.w3.org/2000/svg"&&t==="foreignObject"?"http://www.w3.org/1999/xhtml":e}var wl,$b=function(e){return typeof MSApp<"u"&&MSApp.execUnsafeLocalFunction?function(t,n,r,i){MSApp.execUnsafeLocalFunction(function(){return e(t,n,r,i)})}:e}(function(e,t){if(e.namespaceURI!=="http://www.w3.org/2000/svg"||"innerHTML"in e)e.innerHTML=t;else{for(wl=wl||document.createElement("div"),wl.innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=wl.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}});function rs(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&n.nodeType===3){n.nodeValue=t;return}}e.textContent=t}var Wa={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},wj=["Webkit","ms","Moz","O"];Object.keys(Wa).forEach(function(e){wj.forEach(function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),Wa[t]=Wa[e]})});function Ib(e,t,n){return t==null||typeof t=="boolean"||t===""?"":n||typeof t!="number"||t===0||Wa.hasOwnProperty(e)&&Wa[e]?(""+t).trim():t+"px"}function Nb(e,t){e=e.style;for(var n in t)if(t.hasOwnProperty(n)){var r=n.indexOf("--")===0,i=Ib(n,t[n],r);n==="float"&&(n="cssFloat"),r?e.setProperty(n,i):e[n]=i}}var bj=$e({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function bp(e,t){if(t){if(bj[e]&&(t.children!=null||t.dangerouslySetInnerHTML!=null))throw Error(F(137,e));if(t.dangerouslySetInnerHTML!=null){if(t.children!=null)throw Error(F(60));if(typeof t.dangerouslySetInnerHTML!="object"||!("__html"in t.dangerouslySetInnerHTML))throw Error(F(61))}if(t.style!=null&&typeof t.style!="object")throw Error(F(62))}}function Sp(e,t){if(e.indexOf("-")===-1)return typeof t.is=="string";switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var Pp=null;function Pm(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var Op=null,Mo=null,To=null;function Ey(e){if(e=Us(e)){if(typeof Op!="function")throw Error(F(280));var t=e.stateNode;t&&(t=Xc(t),Op(e.stateNode,e.type,t))}}function Db(e){Mo?To?To.push(e):To=[e]:Mo=e}function Rb(){if(Mo){var e=Mo,t=To;if(To=Mo=null,Ey(e),t)for(e=0;e<t.length;e++)Ey(t[e])}}function Lb(e,t){return e(t)}function zb(){}var dd=!1;function Fb(e,t,n){if(dd)return e(t,n);dd=!0;try{return Lb(e,t,n)}finally{dd=!1,(Mo!==null||To!==null)&&(zb(),Rb())}}function is(e,t){var n=e.stateNode;if(n===null)return null;var r=Xc(n);if(r===null)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(e=e.type,r=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!r;break e;default:e=!1}if(e)return null;if(n&&typeof n!="function")throw Error(F(231,t,typeof n));return n}var Ep=!1;if(hr)try{var ba={};Object.defineProperty(ba,"passive",{get:function(){Ep=!0}}),window.addEventListener("test",ba,ba),window.removeEventListener("test",ba,ba)}catch{Ep=!1}function Sj(e,t,n,r,i,o,a,s,l){var u=Array.prototype.slice.call(arguments,3);try{t.apply(n,u)}catch(c){this.onError(c)}}var Ya=!1,_u=null,Au=!1,kp=null,Pj={onError:function(e){Ya=!0,_u=e}};function Oj(e,t,n,r,i,o,a,s,l){Ya=!1,_u=null,Sj.apply(Pj,arguments)}function Ej(e,t,n,r,i,o,a,s,l){if(Oj.apply(this,arguments),Ya){if(Ya){var u=_u;Ya=!1,_u=null}else throw Error(F(198));Au||(Au=!0,kp=u)}}function Ji(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do t=e,t.flags&4098&&(n=t.return),e=t.return;while(e)}return t.tag===3?n:null}function Bb(e){if(e.tag===13){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function ky(e){if(Ji(e)!==e)throw Error(F(188))}function kj(e){var t=e.alternate;if(!t){if(t=Ji(e),t===null)throw Error(F(188));return t!==e?null:e}for(var n=e,r=t;;){var i=n.return;if(i===null)break;var o=i.alternate;if(o===null){if(r=i.return,r!==null){n=r;continue}break}if(i.child===o.child){for(o=i.child;o;){if(o===n)return ky(i),e;if(o===r)return ky(i),t;o=o.sibling}throw Error(F(188))}if(n.return!==r.return)n=i,r=o;else{for(var a=!1,s=i.child;s;){if(s===n){a=!0,n=i,r=o;break}if(s===r){a=!0,r=i,n=o;break}s=s.sibling}if(!a){for(s=o.child;s;){if(s===n){a=!0,n=o,r=i;break}if(s===r){a=!0,r=o,n=i;break}s=s.sibling}if(!a)throw Error(F(189))}}if(n.alternate!==r)throw Error(F(190))}if(n.tag!==3)throw Error(F(188));return n.stateNode.current===n?e:t}function Ub(e){return e=kj(e),e!==null?Vb(e):null}function Vb(e){if(e.tag===5||e.tag===6)return e;for(e=e.child;e!==null;){var t=Vb(e);if(t!==null)return t;e=e.sibling}return null}var Hb=Zt.unstable_scheduleCallback,Cy=Zt.unstable_cancelCallback,Cj=Zt.unstable_shouldYield,_j=Zt.unstable_requestPaint,Re=Zt.unstable_now,Aj=Zt.unstable_getCurrentPriorityLevel,Om=Zt.unstable_ImmediatePriority,Kb=Zt.unstable_UserBlockingPriority,ju=Zt.unstable_NormalPriority,jj=Zt.unstable_LowPriority,Wb=Zt.unstable_IdlePriority,Wc=null,Un=null;function Mj(e){if(Un&&typeof Un.onCommitFiberRoot=="function")try{Un.onCommitFiberRoot(Wc,e,void 0,(e.current.flags&128)===128)}catch{}}var kn=Math.clz32?Math.clz32:Ij,Tj=Math.log,$j=Math.LN2;function Ij(e){return e>>>=0,e===0?32:31-(Tj(e)/$j|0)|0}var bl=64,Sl=4194304;function Fa(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e&4194240;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return e&130023424;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function Mu(e,t){var n=e.pendingLanes;if(n===0)return 0;var r=0,i=e.suspendedLanes,o=e.pingedLanes,a=n&268435455;if(a!==0){var s=a&~i;s!==0?r=Fa(s):(o&=a,o!==0&&(r=Fa(o)))}else a=n&~i,a!==0?r=Fa(a):o!==0&&(r=Fa(o));if(r===0)return 0;if(t!==0&&t!==r&&!(t&i)&&(i=r&-r,o=t&-t,i>=o||i===16&&(o&4194240)!==0))return t;if(r&4&&(r|=n&16),t=e.entangledLanes,t!==0)for(e=e.entanglements,t&=r;0<t;)n=31-kn(t),i=1<<n,r|=e[n],t&=~i;return r}function Nj(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return-1;case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function Dj(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,i=e.expirationTimes,o=e.pendingLanes;0<o;){var a=31-kn(o),s=1<<a,l=i[a];l===-1?(!(s&n)||s&r)&&(i[a]=Nj(s,t)):l<=t&&(e.expiredLanes|=s),o&=~s}}function Cp(e){return e=e.pendingLanes&-1073741825,e!==0?e:e&1073741824?1073741824:0}function Yb(){var e=bl;return bl<<=1,!(bl&4194240)&&(bl=64),e}function pd(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function Fs(e,t,n){e.pendingLanes|=t,t!==536870912&&(e.suspendedLanes=0,e.pingedLanes=0),e=e.eventTimes,t=31-kn(t),e[t]=n}function Rj(e,t){var n=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<n;){var i=31-kn(n),o=1<<i;t[i]=0,r[i]=-1,e[i]=-1,n&=~o}}function Em(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-kn(n),i=1<<r;i&t|e[r]&t&&(e[r]|=t),n&=~i}}var he=0;function qb(e){return e&=-e,1<e?4<e?e&268435455?16:536870912:4:1}var Gb,km,Xb,Zb,Qb,_p=!1,Pl=[],Gr=null,Xr=null,Zr=null,os=new Map,as=new Map,Vr=[],Lj="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function _y(e,t){switch(e){case"focusin":case"focusout":Gr=null;break;case"dragenter":case"dragleave":Xr=null;break;case"mouseover":case"mouseout":Zr=null;break;case"pointerover":case"pointerout":os.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":as.delete(t.pointerId)}}function Sa(e,t,n,r,i,o){return e===null||e.nativeEvent!==o?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:o,targetContainers:[i]},t!==null&&(t=Us(t),t!==null&&km(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,i!==null&&t.indexOf(i)===-1&&t.push(i),e)}function zj(e,t,n,r,i){switch(t){case"focusin":return Gr=Sa(Gr,e,t,n,r,i),!0;case"dragenter":return Xr=Sa(Xr,e,t,n,r,i),!0;case"mouseover":return Zr=Sa(Zr,e,t,n,r,i),!0;case"pointerover":var o=i.pointerId;return os.set(o,Sa(os.get(o)||null,e,t,n,r,i)),!0;case"gotpointercapture":return o=i.pointerId,as.set(o,Sa(as.get(o)||null,e,t,n,r,i)),!0}return!1}function Jb(e){var t=ki(e.target);if(t!==null){var n=Ji(t);if(n!==null){if(t=n.tag,t===13){if(t=Bb(n),t!==null){e.blockedOn=t,Qb(e.priority,function(){Xb(n)});return}}else if(t===3&&n.stateNode.current.memoizedState.isDehydrated){e.blockedOn=n.tag===3?n.stateNode.containerInfo:null;return}}}e.blockedOn=null}function au(e){if(e.blockedOn!==null)return!1;for(var t=e.targetContainers;0<t.length;){var n=Ap(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(n===null){n=e.nativeEvent;var r=new n.constructor(n.type,n);Pp=r,n.target.dispatchEvent(r),Pp=null}else return t=Us(n),t!==null&&km(t),e.blockedOn=n,!1;t.shift()}return!0}function Ay(e,t,n){au(e)&&n.delete(t)}function Fj(){_p=!1,Gr!==null&&au(Gr)&&(Gr=null),Xr!==null&&au(Xr)&&(Xr=null),Zr!==null&&au(Zr)&&(Zr=null),os.forEach(Ay),as.forEach(Ay)}function Pa(e,t){e.blockedOn===t&&(e.blockedOn=null,_p||(_p=!0,Zt.unstable_scheduleCallback(Zt.unstable_NormalPriority,Fj)))}function ss(e){function t(i){return Pa(i,e)}if(0<Pl.length){Pa(Pl[0],e);for(var n=1;n<Pl.length;n++){var r=Pl[n];r.blockedOn===e&&(r.blockedOn=null)}}for(Gr!==null&&Pa(Gr,e),Xr!==null&&Pa(Xr,e),Zr!==null&&Pa(Zr,e),os.forEach(t),as.forEach(t),n=0;n<Vr.length;n++)r=Vr[n],r.blockedOn===e&&(r.blockedOn=null);for(;0<Vr.length&&(n=Vr[0],n.blockedOn===null);)Jb(n),n.blockedOn===null&&Vr.shift()}var $o=Cr.ReactCurrentBatchConfig,Tu=!0;function Bj(e,t,n,r){var i=he,o=$o.transition;$o.transition=null;try{he=1,Cm(e,t,n,r)}finally{he=i,$o.transition=o}}function Uj(e,t,n,r){var i=he,o=$o.transition;$o.transition=null;try{he=4,Cm(e,t,n,r)}finally{he=i,$o.transition=o}}function Cm(e,t,n,r){if(Tu){var i=Ap(e,t,n,r);if(i===null)Pd(e,t,r,$u,n),_y(e,r);else if(zj(i,e,t,n,r))r.stopPropagation();else if(_y(e,r),t&4&&-1<Lj.indexOf(e)){for(;i!==null;){var o=Us(i);if(o!==null&&Gb(o),o=Ap(e,t,n,r),o===null&&Pd(e,t,r,$u,n),o===i)break;i=o}i!==null&&r.stopPropagation()}else Pd(e,t,r,null,n)}}var $u=null;function Ap(e,t,n,r){if($u=null,e=Pm(r),e=ki(e),e!==null)if(t=Ji(e),t===null)e=null;else if(n=t.tag,n===13){if(e=Bb(t),e!==null)return e;e=null}else if(n===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return $u=e,null}function eS(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(Aj()){case Om:return 1;case Kb:return 4;case ju:case jj:return 16;case Wb:return 536870912;default:return 16}default:return 16}}var Wr=null,_m=null,su=null;function tS(){if(su)return su;var e,t=_m,n=t.length,r,i="value"in Wr?Wr.value:Wr.textContent,o=i.length;for(e=0;e<n&&t[e]===i[e];e++);var a=n-e;for(r=1;r<=a&&t[n-r]===i[o-r];r++);return su=i.slice(e,1<r?1-r:void 0)}function lu(e){var t=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&t===13&&(e=13)):e=t,e===10&&(e=13),32<=e||e===13?e:0}function Ol(){return!0}function jy(){return!1}function tn(e){function t(n,r,i,o,a){this._reactName=n,this._targetInst=i,this.type=r,this.nativeEvent=o,this.target=a,this.currentTarget=null;for(var s in e)e.hasOwnProperty(s)&&(n=e[s],this[s]=n?n(o):o[s]);return this.isDefaultPrevented=(o.defaultPrevented!=null?o.defaultPrevented:o.returnValue===!1)?Ol:jy,this.isPropagationStopped=jy,this}return $e(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var n=this.nativeEvent;n&&(n.preventDefault?n.preventDefault():typeof n.returnValue!="unknown"&&(n.returnValue=!1),this.isDefaultPrevented=Ol)},stopPropagation:function(){var n=this.nativeEvent;n&&(n.stopPropagation?n.stopPropagation():typeof n.cancelBubble!="unknown"&&(n.cancelBubble=!0),this.isPropagationStopped=Ol)},persist:function(){},isPersistent:Ol}),t}var na={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Am=tn(na),Bs=$e({},na,{view:0,detail:0}),Vj=tn(Bs),hd,md,Oa,Yc=$e({},Bs,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:jm,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==Oa&&(Oa&&e.type==="mousemove"?(hd=e.screenX-Oa.screenX,md=e.screenY-Oa.screenY):md=hd=0,Oa=e),hd)},movementY:function(e){return"movementY"in e?e.movementY:md}}),My=tn(Yc),Hj=$e({},Yc,{dataTransfer:0}),Kj=tn(Hj),Wj=$e({},Bs,{relatedTarget:0}),vd=tn(Wj),Yj=$e({},na,{animationName:0,elapsedTime:0,pseudoElement:0}),qj=tn(Yj),Gj=$e({},na,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),Xj=tn(Gj),Zj=$e({},na,{data:0}),Ty=tn(Zj),Qj={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},Jj={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},eM={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function tM(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):(e=eM[e])?!!t[e]:!1}function jm(){return tM}var nM=$e({},Bs,{key:function(e){if(e.key){var t=Qj[e.key]||e.key;if(t!=="Unidentified")return t}return e.type==="keypress"?(e=lu(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?Jj[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:jm,charCode:function(e){return e.type==="keypress"?lu(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?lu(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),rM=tn(nM),iM=$e({},Yc,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),$y=tn(iM),oM=$e({},Bs,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:jm}),aM=tn(oM),sM=$e({},na,{propertyName:0,elapsedTime:0,pseudoElement:0}),lM=tn(sM),uM=$e({},Yc,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),cM=tn(uM),fM=[9,13,27,32],Mm=hr&&"CompositionEvent"in window,qa=null;hr&&"documentMode"in document&&(qa=document.documentMode);var dM=hr&&"TextEvent"in window&&!qa,nS=hr&&(!Mm||qa&&8<qa&&11>=qa),Iy=String.fromCharCode(32),Ny=!1;function rS(e,t){switch(e){case"keyup":return fM.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function iS(e){return e=e.detail,typeof e=="object"&&"data"in e?e.data:null}var go=!1;function pM(e,t){switch(e){case"compositionend":return iS(t);case"keypress":return t.which!==32?null:(Ny=!0,Iy);case"textInput":return e=t.data,e===Iy&&Ny?null:e;default:return null}}function hM(e,t){if(go)return e==="compositionend"||!Mm&&rS(e,t)?(e=tS(),su=_m=Wr=null,go=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return nS&&t.locale!=="ko"?null:t.data;default:return null}}var mM={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Dy(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t==="input"?!!mM[e.type]:t==="textarea"}function oS(e,t,n,r){Db(r),t=Iu(t,"onChange"),0<t.length&&(n=new Am("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var Ga=null,ls=null;function vM(e){vS(e,0)}function qc(e){var t=wo(e);if(Ab(t))return e}function gM(e,t){if(e==="change")return t}var aS=!1;if(hr){var gd;if(hr){var yd="oninput"in document;if(!yd){var Ry=document.createElement("div");Ry.setAttribute("oninput","return;"),yd=typeof Ry.oninput=="function"}gd=yd}else gd=!1;aS=gd&&(!document.documentMode||9<document.documentMode)}function Ly(){Ga&&(Ga.detachEvent("onpropertychange",sS),ls=Ga=null)}function sS(e){if(e.propertyName==="value"&&qc(ls)){var t=[];oS(t,ls,e,Pm(e)),Fb(vM,t)}}function yM(e,t,n){e==="focusin"?(Ly(),Ga=t,ls=n,Ga.attachEvent("onpropertychange",sS)):e==="focusout"&&Ly()}function xM(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return qc(ls)}function wM(e,t){if(e==="click")return qc(t)}function bM(e,t){if(e==="input"||e==="change")return qc(t)}function SM(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var An=typeof Object.is=="function"?Object.is:SM;function us(e,t){if(An(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var i=n[r];if(!fp.call(t,i)||!An(e[i],t[i]))return!1}return!0}function zy(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function Fy(e,t){var n=zy(e);e=0;for(var r;n;){if(n.nodeType===3){if(r=e+n.textContent.length,e<=t&&r>=t)return{node:n,offset:t-e};e=r}e:{for(;n;){if(n.nextSibling){n=n.nextSibling;break e}n=n.parentNode}n=void 0}n=zy(n)}}function lS(e,t){return e&&t?e===t?!0:e&&e.nodeType===3?!1:t&&t.nodeType===3?lS(e,t.parentNode):"contains"in e?e.contains(t):e.compareDocumentPosition?!!(e.compareDocumentPosition(t)&16):!1:!1}function uS(){for(var e=window,t=Cu();t instanceof e.HTMLIFrameElement;){try{var n=typeof t.contentWindow.location.href=="string"}catch{n=!1}if(n)e=t.contentWindow;else break;t=Cu(e.document)}return t}function Tm(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&(t==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||t==="textarea"||e.contentEditable==="true")}function PM(e){var t=uS(),n=e.focusedElem,r=e.selectionRange;if(t!==n&&n&&n.ownerDocument&&lS(n.ownerDocument.documentElement,n)){if(r!==null&&Tm(n)){if(t=r.start,e=r.end,e===void 0&&(e=t),"selectionStart"in n)n.selectionStart=t,n.selectionEnd=Math.min(e,n.value.length);else if(e=(t=n.ownerDocument||document)&&t.defaultView||window,e.getSelection){e=e.getSelection();var i=n.textContent.length,o=Math.min(r.start,i);r=r.end===void 0?o:Math.min(r.end,i),!e.extend&&o>r&&(i=r,r=o,o=i),i=Fy(n,o);var a=Fy(n,r);i&&a&&(e.rangeCount!==1||e.anchorNode!==i.node||e.anchorOffset!==i.offset||e.focusNode!==a.node||e.focusOffset!==a.offset)&&(t=t.createRange(),t.setStart(i.node,i.offset),e.removeAllRanges(),o>r?(e.addRange(t),e.extend(a.node,a.offset)):(t.setEnd(a.node,a.offset),e.addRange(t)))}}for(t=[],e=n;e=e.parentNode;)e.nodeType===1&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for(typeof n.focus=="function"&&n.focus(),n=0;n<t.length;n++)e=t[n],e.element.scrollLeft=e.left,e.element.scrollTop=e.top}}var OM=hr&&"documentMode"in document&&11>=document.documentMode,yo=null,jp=null,Xa=null,Mp=!1;function By(e,t,n){var r=n.window===n?n.document:n.nodeType===9?n:n.ownerDocument;Mp||yo==null||yo!==Cu(r)||(r=yo,"selectionStart"in r&&Tm(r)?r={start:r.selectionStart,end:r.selectionEnd}:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection(),r={anchorNode:r.anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset}),Xa&&us(Xa,r)||(Xa=r,r=Iu(jp,"onSelect"),0<r.length&&(t=new Am("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=yo)))}function El(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var xo={animationend:El("Animation","AnimationEnd"),animationiteration:El("Animation","AnimationIteration"),animationstart:El("Animation","AnimationStart"),transitionend:El("Transition","TransitionEnd")},xd={},cS={};hr&&(cS=document.createElement("div").style,"AnimationEvent"in window||(delete xo.animationend.animation,delete xo.animationiteration.animation,delete xo.animationstart.animation),"TransitionEvent"in window||delete xo.transitionend.transition);function Gc(e){if(xd[e])return xd[e];if(!xo[e])return e;var t=xo[e],n;for(n in t)if(t.hasOwnProperty(n)&&n in cS)return xd[e]=t[n];return e}var fS=Gc("animationend"),dS=Gc("animationiteration"),pS=Gc("animationstart"),hS=Gc("transitionend"),mS=new Map,Uy="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function pi(e,t){mS.set(e,t),Qi(t,[e])}for(var wd=0;wd<Uy.length;wd++){var bd=Uy[wd],EM=bd.toLowerCase(),kM=bd[0].toUpperCase()+bd.slice(1);pi(EM,"on"+kM)}pi(fS,"onAnimationEnd");pi(dS,"onAnimationIteration");pi(pS,"onAnimationStart");pi("dblclick","onDoubleClick");pi("focusin","onFocus");pi("focusout","onBlur");pi(hS,"onTransitionEnd");Fo("onMouseEnter",["mouseout","mouseover"]);Fo("onMouseLeave",["mouseout","mouseover"]);Fo("onPointerEnter",["pointerout","pointerover"]);Fo("onPointerLeave",["pointerout","pointerover"]);Qi("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));Qi("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));Qi("onBeforeInput",["compositionend","keypress","textInput","paste"]);Qi("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));Qi("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));Qi("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Ba="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),CM=new Set("cancel close invalid load scroll toggle".split(" ").concat(Ba));function Vy(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,Ej(r,t,void 0,e),e.currentTarget=null}function vS(e,t){t=(t&4)!==0;for(var n=0;n<e.length;n++){var r=e[n],i=r.event;r=r.listeners;e:{var o=void 0;if(t)for(var a=r.length-1;0<=a;a--){var s=r[a],l=s.instance,u=s.currentTarget;if(s=s.listener,l!==o&&i.isPropagationStopped())break e;Vy(i,s,u),o=l}else for(a=0;a<r.length;a++){if(s=r[a],l=s.instance,u=s.currentTarget,s=s.listener,l!==o&&i.isPropagationStopped())break e;Vy(i,s,u),o=l}}}if(Au)throw e=kp,Au=!1,kp=null,e}function Oe(e,t){var n=t[Dp];n===void 0&&(n=t[Dp]=new Set);var r=e+"__bubble";n.has(r)||(gS(t,e,2,!1),n.add(r))}function Sd(e,t,n){var r=0;t&&(r|=4),gS(n,e,r,t)}var kl="_reactListening"+Math.random().toString(36).slice(2);function cs(e){if(!e[kl]){e[kl]=!0,Ob.forEach(function(n){n!=="selectionchange"&&(CM.has(n)||Sd(n,!1,e),Sd(n,!0,e))});var t=e.nodeType===9?e:e.ownerDocument;t===null||t[kl]||(t[kl]=!0,Sd("selectionchange",!1,t))}}function gS(e,t,n,r){switch(eS(t)){case 1:var i=Bj;break;case 4:i=Uj;break;default:i=Cm}n=i.bind(null,t,n,e),i=void 0,!Ep||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(i=!0),r?i!==void 0?e.addEventListener(t,n,{capture:!0,passive:i}):e.addEventListener(t,n,!0):i!==void 0?e.addEventListener(t,n,{passive:i}):e.addEventListener(t,n,!1)}function Pd(e,t,n,r,i){var o=r;if(!(t&1)&&!(t&2)&&r!==null)e:for(;;){if(r===null)return;var a=r.tag;if(a===3||a===4){var s=r.stateNode.containerInfo;if(s===i||s.nodeType===8&&s.parentNode===i)break;if(a===4)for(a=r.return;a!==null;){var l=a.tag;if((l===3||l===4)&&(l=a.stateNode.containerInfo,l===i||l.nodeType===8&&l.parentNode===i))return;a=a.return}for(;s!==null;){if(a=ki(s),a===null)return;if(l=a.tag,l===5||l===6){r=o=a;continue e}s=s.parentNode}}r=r.return}Fb(function(){var u=o,c=Pm(n),f=[];e:{var d=mS.get(e);if(d!==void 0){var p=Am,h=e;switch(e){case"keypress":if(lu(n)===0)break e;case"keydown":case"keyup":p=rM;break;case"focusin":h="focus",p=vd;break;case"focusout":h="blur",p=vd;break;case"beforeblur":case"afterblur":p=vd;break;case"click":if(n.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":p=My;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":p=Kj;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":p=aM;break;case fS:case dS:case pS:p=qj;break;case hS:p=lM;break;case"scroll":p=Vj;break;case"wheel":p=cM;break;case"copy":case"cut":case"paste":p=Xj;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":p=$y}var v=(t&4)!==0,y=!v&&e==="scroll",g=v?d!==null?d+"Capture":null:d;v=[];for(var x=u,w;x!==null;){w=x;var S=w.stateNode;if(w.tag===5&&S!==null&&(w=S,g!==null&&(S=is(x,g),S!=null&&v.push(fs(x,S,w)))),y)break;x=x.return}0<v.length&&(d=new p(d,h,null,n,c),f.push({event:d,listeners:v}))}}if(!(t&7)){e:{if(d=e==="mouseover"||e==="pointerover",p=e==="mouseout"||e==="pointerout",d&&n!==Pp&&(h=n.relatedTarget||n.fromElement)&&(ki(h)||h[mr]))break e;if((p||d)&&(d=c.window===c?c:(d=c.ownerDocument)?d.defaultView||d.parentWindow:window,p?(h=n.relatedTarget||n.toElement,p=u,h=h?ki(h):null,h!==null&&(y=Ji(h),h!==y||h.tag!==5&&h.tag!==6)&&(h=null)):(p=null,h=u),p!==h)){if(v=My,S="onMouseLeave",g="onMouseEnter",x="mouse",(e==="pointerout"||e==="pointerover")&&(v=$y,S="onPointerLeave",g="onPointerEnter",x="pointer"),y=p==null?d:wo(p),w=h==null?d:wo(h),d=new v(S,x+"leave",p,n,c),d.target=y,d.relatedTarget=w,S=null,ki(c)===u&&(v=new v(g,x+"enter",h,n,c),v.target=w,v.relatedTarget=y,S=v),y=S,p&&h)t:{for(v=p,g=h,x=0,w=v;w;w=so(w))x++;for(w=0,S=g;S;S=so(S))w++;for(;0<x-w;)v=so(v),x--;for(;0<w-x;)g=so(g),w--;for(;x--;){if(v===g||g!==null&&v===g.alternate)break t;v=so(v),g=so(g)}v=null}else v=null;p!==null&&Hy(f,d,p,v,!1),h!==null&&y!==null&&Hy(f,y,h,v,!0)}}e:{if(d=u?wo(u):window,p=d.nodeName&&d.nodeName.toLowerCase(),p==="select"||p==="input"&&d.type==="file")var P=gM;else if(Dy(d))if(aS)P=bM;else{P=xM;var O=yM}else(p=d.nodeName)&&p.toLowerCase()==="input"&&(d.type==="checkbox"||d.type==="radio")&&(P=wM);if(P&&(P=P(e,u))){oS(f,P,n,c);break e}O&&O(e,d,u),e==="focusout"&&(O=d._wrapperState)&&O.controlled&&d.type==="number"&&yp(d,"number",d.value)}switch(O=u?wo(u):window,e){case"focusin":(Dy(O)||O.contentEditable==="true")&&(yo=O,jp=u,Xa=null);break;case"focusout":Xa=jp=yo=null;break;case"mousedown":Mp=!0;break;case"contextmenu":case"mouseup":case"dragend":Mp=!1,By(f,n,c);break;case"selectionchange":if(OM)break;case"keydown":case"keyup":By(f,n,c)}var k;if(Mm)e:{switch(e){case"compositionstart":var j="onCompositionStart";break e;case"compositionend":j="onCompositionEnd";break e;case"compositionupdate":j="onCompositionUpdate";break e}j=void 0}else go?rS(e,n)&&(j="onCompositionEnd"):e==="keydown"&&n.keyCode===229&&(j="onCompositionStart");j&&(nS&&n.locale!=="ko"&&(go||j!=="onCompositionStart"?j==="onCompositionEnd"&&go&&(k=tS()):(Wr=c,_m="value"in Wr?Wr.value:Wr.textContent,go=!0)),O=Iu(u,j),0<O.length&&(j=new Ty(j,e,null,n,c),f.push({event:j,listeners:O}),k?j.data=k:(k=iS(n),k!==null&&(j.data=k)))),(k=dM?pM(e,n):hM(e,n))&&(u=Iu(u,"onBeforeInput"),0<u.length&&(c=new Ty("onBeforeInput","beforeinput",null,n,c),f.push({event:c,listeners:u}),c.data=k))}vS(f,t)})}function fs(e,t,n){return{instance:e,listener:t,currentTarget:n}}function Iu(e,t){for(var n=t+"Capture",r=[];e!==null;){var i=e,o=i.stateNode;i.tag===5&&o!==null&&(i=o,o=is(e,n),o!=null&&r.unshift(fs(e,o,i)),o=is(e,t),o!=null&&r.push(fs(e,o,i))),e=e.return}return r}function so(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5);return e||null}function Hy(e,t,n,r,i){for(var o=t._reactName,a=[];n!==null&&n!==r;){var s=n,l=s.alternate,u=s.stateNode;if(l!==null&&l===r)break;s.tag===5&&u!==null&&(s=u,i?(l=is(n,o),l!=null&&a.unshift(fs(n,l,s))):i||(l=is(n,o),l!=null&&a.push(fs(n,l,s)))),n=n.return}a.length!==0&&e.push({event:t,listeners:a})}var _M=/\r\n?/g,AM=/\u0000|\uFFFD/g;function Ky(e){return(typeof e=="string"?e:""+e).replace(_M,`
 `).replace(AM,"")}function Cl(e,t,n){if(t=Ky(t),Ky(e)!==t&&n)throw Error(F(425))}function Nu(){}var Tp=null,$p=null;function Ip(e,t){return e==="textarea"||e==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Np=typeof setTimeout=="function"?setTimeout:void 0,jM=typeof clearTimeout=="function"?clearTimeout:void 0,Wy=typeof Promise=="function"?Promise:void 0,MM=typeof queueMicrotask=="function"?queueMicrotask:typeof Wy<"u"?function(e){return Wy.resolve(null).then(e).catch(TM)}:Np;function TM(e){setTimeout(function(){throw e})}function Od(e,t){var n=t,r=0;do{var i=n.nextSibling;if(e.removeChild(n),i&&i.nodeType===8)if(n=i.data,n==="/$"){if(r===0){e.removeChild(i),ss(t);return}r--}else n!=="$"&&n!=="$?"&&n!=="$!"||r++;n=i}while(n);ss(t)}function Qr(e){for(;e!=null;e=e.nextSibling){var t=e.nodeType;if(t===1||t===3)break;if(t===8){if(t=e.data,t==="$"||t==="$!"||t==="$?")break;if(t==="/$")return null}}return e}function Yy(e){e=e.previousSibling;for(var t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="$"||n==="$!"||n==="$?"){if(t===0)return e;t--}else n==="/$"&&t++}e=e.previousSibling}return null}var ra=Math.random().toString(36).slice(2),zn="__reactFiber$"+ra,ds="__reactProps$"+ra,mr="__reactContainer$"+ra,Dp="__reactEvents$"+ra,$M="__reactListeners$"+ra,IM="__reactHandles$"+ra;function ki(e){var t=e[zn];if(t)return t;for(var n=e.parentNode;n;){if(t=n[mr]||n[zn]){if(n=t.alternate,t.child!==null||n!==null&&n.child!==null)for(e=Yy(e);e!==null;){if(n=e[zn])return n;e=Yy(e)}return t}e=n,n=e.parentNode}return null}function Us(e){return e=e[zn]||e[mr],!e||e.tag!==5&&e.tag!==6&&e.tag!==13&&e.tag!==3?null:e}function wo(e){if(e.tag===5||e.tag===6)return e.stateNode;throw Error(F(33))}function Xc(e){return e[ds]||null}var Rp=[],bo=-1;function hi(e){return{current:e}}function ke(e){0>bo||(e.current=Rp[bo],Rp[bo]=null,bo--)}function we(e,t){bo++,Rp[bo]=e.current,e.current=t}var ai={},bt=hi(ai),It=hi(!1),zi=ai;function Bo(e,t){var n=e.type.contextTypes;if(!n)return ai;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var i={},o;for(o in n)i[o]=t[o];return r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=i),i}function Nt(e){return e=e.childContextTypes,e!=null}function Du(){ke(It),ke(bt)}function qy(e,t,n){if(bt.current!==ai)throw Error(F(168));we(bt,t),we(It,n)}function yS(e,t,n){var r=e.stateNode;if(t=t.childContextTypes,typeof r.getChildContext!="function")return n;r=r.getChildContext();for(var i in r)if(!(i in t))throw Error(F(108,yj(e)||"Unknown",i));return $e({},n,r)}function Ru(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||ai,zi=bt.current,we(bt,e),we(It,It.current),!0}function Gy(e,t,n){var r=e.stateNode;if(!r)throw Error(F(169));n?(e=yS(e,t,zi),r.__reactInternalMemoizedMergedChildContext=e,ke(It),ke(bt),we(bt,e)):ke(It),we(It,n)}var nr=null,Zc=!1,Ed=!1;function xS(e){nr===null?nr=[e]:nr.push(e)}function NM(e){Zc=!0,xS(e)}function mi(){if(!Ed&&nr!==null){Ed=!0;var e=0,t=he;try{var n=nr;for(he=1;e<n.length;e++){var r=n[e];do r=r(!0);while(r!==null)}nr=null,Zc=!1}catch(i){throw nr!==null&&(nr=nr.slice(e+1)),Hb(Om,mi),i}finally{he=t,Ed=!1}}return null}var So=[],Po=0,Lu=null,zu=0,on=[],an=0,Fi=null,sr=1,lr="";function bi(e,t){So[Po++]=zu,So[Po++]=Lu,Lu=e,zu=t}function wS(e,t,n){on[an++]=sr,on[an++]=lr,on[an++]=Fi,Fi=e;var r=sr;e=lr;var i=32-kn(r)-1;r&=~(1<<i),n+=1;var o=32-kn(t)+i;if(30<o){var a=i-i%5;o=(r&(1<<a)-1).toString(32),r>>=a,i-=a,sr=1<<32-kn(t)+i|n<<i|r,lr=o+e}else sr=1<<o|n<<i|r,lr=e}function $m(e){e.return!==null&&(bi(e,1),wS(e,1,0))}function Im(e){for(;e===Lu;)Lu=So[--Po],So[Po]=null,zu=So[--Po],So[Po]=null;for(;e===Fi;)Fi=on[--an],on[an]=null,lr=on[--an],on[an]=null,sr=on[--an],on[an]=null}var qt=null,Wt=null,_e=!1,Sn=null;function bS(e,t){var n=ln(5,null,null,0);n.elementType="DELETED",n.stateNode=t,n.return=e,t=e.deletions,t===null?(e.deletions=[n],e.flags|=16):t.push(n)}function Xy(e,t){switch(e.tag){case 5:var n=e.type;return t=t.nodeType!==1||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t,t!==null?(e.stateNode=t,qt=e,Wt=Qr(t.firstChild),!0):!1;case 6:return t=e.pendingProps===""||t.nodeType!==3?null:t,t!==null?(e.stateNode=t,qt=e,Wt=null,!0):!1;case 13:return t=t.nodeType!==8?null:t,t!==null?(n=Fi!==null?{id:sr,overflow:lr}:null,e.memoizedState={dehydrated:t,treeContext:n,retryLane:1073741824},n=ln(18,null,null,0),n.stateNode=t,n.return=e,e.child=n,qt=e,Wt=null,!0):!1;default:return!1}}function Lp(e){return(e.mode&1)!==0&&(e.flags&128)===0}function zp(e){if(_e){var t=Wt;if(t){var n=t;if(!Xy(e,t)){if(Lp(e))throw Error(F(418));t=Qr(n.nextSibling);var r=qt;t&&Xy(e,t)?bS(r,n):(e.flags=e.flags&-4097|2,_e=!1,qt=e)}}else{if(Lp(e))throw Error(F(418));e.flags=e.flags&-4097|2,_e=!1,qt=e}}}function Zy(e){for(e=e.return;e!==null&&e.tag!==5&&e.tag!==3&&e.tag!==13;)e=e.return;qt=e}function _l(e){if(e!==qt)return!1;if(!_e)return Zy(e),_e=!0,!1;var t;if((t=e.tag!==3)&&!(t=e.tag!==5)&&(t=e.type,t=t!=="head"&&t!=="body"&&!Ip(e.type,e.memoizedProps)),t&&(t=Wt)){if(Lp(e))throw SS(),Error(F(418));for(;t;)bS(e,t),t=Qr(t.nextSibling)}if(Zy(e),e.tag===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(F(317));e:{for(e=e.nextSibling,t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="/$"){if(t===0){Wt=Qr(e.nextSibling);break e}t--}else n!=="$"&&n!=="$!"&&n!=="$?"||t++}e=e.nextSibling}Wt=null}}else Wt=qt?Qr(e.stateNode.nextSibling):null;return!0}function SS(){for(var e=Wt;e;)e=Qr(e.nextSibling)}function Uo(){Wt=qt=null,_e=!1}function Nm(e){Sn===null?Sn=[e]:Sn.push(e)}var DM=Cr.ReactCurrentBatchConfig;function Ea(e,t,n){if(e=n.ref,e!==null&&typeof e!="function"&&typeof e!="object"){if(n._owner){if(n=n._owner,n){if(n.tag!==1)throw Error(F(309));var r=n.stateNode}if(!r)throw Error(F(147,e));var i=r,o=""+e;return t!==null&&t.ref!==null&&typeof t.ref=="function"&&t.ref._stringRef===o?t.ref:(t=function(a){var s=i.refs;a===null?delete s[o]:s[o]=a},t._stringRef=o,t)}if(typeof e!="string")throw Error(F(284));if(!n._owner)throw Error(F(290,e))}return e}function Al(e,t){throw e=Object.prototype.toString.call(t),Error(F(31,e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function Qy(e){var t=e._init;return t(e._payload)}function PS(e){function t(g,x){if(e){var w=g.deletions;w===null?(g.deletions=[x],g.flags|=16):w.push(x)}}function n(g,x){if(!e)return null;for(;x!==null;)t(g,x),x=x.sibling;return null}function r(g,x){for(g=new Map;x!==null;)x.key!==null?g.set(x.key,x):g.set(x.index,x),x=x.sibling;return g}function i(g,x){return g=ni(g,x),g.index=0,g.sibling=null,g}function o(g,x,w){return g.index=w,e?(w=g.alternate,w!==null?(w=w.index,w<x?(g.flags|=2,x):w):(g.flags|=2,x)):(g.flags|=1048576,x)}function a(g){return e&&g.alternate===null&&(g.flags|=2),g}function s(g,x,w,S){return x===null||x.tag!==6?(x=Td(w,g.mode,S),x.return=g,x):(x=i(x,w),x.return=g,x)}function l(g,x,w,S){var P=w.type;return P===vo?c(g,x,w.props.children,S,w.key):x!==null&&(x.elementType===P||typeof P=="object"&&P!==null&&P.$$typeof===zr&&Qy(P)===x.type)?(S=i(x,w.props),S.ref=Ea(g,x,w),S.return=g,S):(S=mu(w.type,w.key,w.props,null,g.mode,S),S.ref=Ea(g,x,w),S.return=g,S)}function u(g,x,w,S){return x===null||x.tag!==4||x.stateNode.containerInfo!==w.containerInfo||x.stateNode.implementation!==w.implementation?(x=$d(w,g.mode,S),x.return=g,x):(x=i(x,w.children||[]),x.return=g,x)}function c(g,x,w,S,P){return x===null||x.tag!==7?(x=Ii(w,g.mode,S,P),x.return=g,x):(x=i(x,w),x.return=g,x)}function f(g,x,w){if(typeof x=="string"&&x!==""||typeof x=="number")return x=Td(""+x,g.mode,w),x.return=g,x;if(typeof x=="object"&&x!==null){switch(x.$$typeof){case yl:return w=mu(x.type,x.key,x.props,null,g.mode,w),w.ref=Ea(g,null,x),w.return=g,w;case mo:return x=$d(x,g.mode,w),x.return=g,x;case zr:var S=x._init;return f(g,S(x._payload),w)}if(za(x)||wa(x))return x=Ii(x,g.mode,w,null),x.return=g,x;Al(g,x)}return null}function d(g,x,w,S){var P=x!==null?x.key:null;if(typeof w=="string"&&w!==""||typeof w=="number")return P!==null?null:s(g,x,""+w,S);if(typeof w=="object"&&w!==null){switch(w.$$typeof){case yl:return w.key===P?l(g,x,w,S):null;case mo:return w.key===P?u(g,x,w,S):null;case zr:return P=w._init,d(g,x,P(w._payload),S)}if(za(w)||wa(w))return P!==null?null:c(g,x,w,S,null);Al(g,w)}return null}function p(g,x,w,S,P){if(typeof S=="string"&&S!==""||typeof S=="number")return g=g.get(w)||null,s(x,g,""+S,P);if(typeof S=="object"&&S!==null){switch(S.$$typeof){case yl:return g=g.get(S.key===null?w:S.key)||null,l(x,g,S,P);case mo:return g=g.get(S.key===null?w:S.key)||null,u(x,g,S,P);case zr:var O=S._init;return p(g,x,w,O(S._payload),P)}if(za(S)||wa(S))return g=g.get(w)||null,c(x,g,S,P,null);Al(x,S)}return null}function h(g,x,w,S){for(var P=null,O=null,k=x,j=x=0,M=null;k!==null&&j<w.length;j++){k.index>j?(M=k,k=null):M=k.sibling;var A=d(g,k,w[j],S);if(A===null){k===null&&(k=M);break}e&&k&&A.alternate===null&&t(g,k),x=o(A,x,j),O===null?P=A:O.sibling=A,O=A,k=M}if(j===w.length)return n(g,k),_e&&bi(g,j),P;if(k===null){for(;j<w.length;j++)k=f(g,w[j],S),k!==null&&(x=o(k,x,j),O===null?P=k:O.sibling=k,O=k);return _e&&bi(g,j),P}for(k=r(g,k);j<w.length;j++)M=p(k,g,j,w[j],S),M!==null&&(e&&M.alternate!==null&&k.delete(M.key===null?j:M.key),x=o(M,x,j),O===null?P=M:O.sibling=M,O=M);return e&&k.forEach(function(C){return t(g,C)}),_e&&bi(g,j),P}function v(g,x,w,S){var P=wa(w);if(typeof P!="function")throw Error(F(150));if(w=P.call(w),w==null)throw Error(F(151));for(var O=P=null,k=x,j=x=0,M=null,A=w.next();k!==null&&!A.done;j++,A=w.next()){k.index>j?(M=k,k=null):M=k.sibling;var C=d(g,k,A.value,S);if(C===null){k===null&&(k=M);break}e&&k&&C.alternate===null&&t(g,k),x=o(C,x,j),O===null?P=C:O.sibling=C,O=C,k=M}if(A.done)return n(g,k),_e&&bi(g,j),P;if(k===null){for(;!A.done;j++,A=w.next())A=f(g,A.value,S),A!==null&&(x=o(A,x,j),O===null?P=A:O.sibling=A,O=A);return _e&&bi(g,j),P}for(k=r(g,k);!A.done;j++,A=w.next())A=p(k,g,j,A.value,S),A!==null&&(e&&A.alternate!==null&&k.delete(A.key===null?j:A.key),x=o(A,x,j),O===null?P=A:O.sibling=A,O=A);return e&&k.forEach(function(_){return t(g,_)}),_e&&bi(g,j),P}function y(g,x,w,S){if(typeof w=="object"&&w!==null&&w.type===vo&&w.key===null&&(w=w.props.children),typeof w=="object"&&w!==null){switch(w.$$typeof){case yl:e:{for(var P=w.key,O=x;O!==null;){if(O.key===P){if(P=w.type,P===vo){if(O.tag===7){n(g,O.sibling),x=i(O,w.props.children),x.return=g,g=x;break e}}else if(O.elementType===P||typeof P=="object"&&P!==null&&P.$$typeof===zr&&Qy(P)===O.type){n(g,O.sibling),x=i(O,w.props),x.ref=Ea(g,O,w),x.return=g,g=x;break e}n(g,O);break}else t(g,O);O=O.sibling}w.type===vo?(x=Ii(w.props.children,g.mode,S,w.key),x.return=g,g=x):(S=mu(w.type,w.key,w.props,null,g.mode,S),S.ref=Ea(g,x,w),S.return=g,g=S)}return a(g);case mo:e:{for(O=w.key;x!==null;){if(x.key===O)if(x.tag===4&&x.stateNode.containerInfo===w.containerInfo&&x.stateNode.implementation===w.implementation){n(g,x.sibling),x=i(x,w.children||[]),x.return=g,g=x;break e}else{n(g,x);break}else t(g,x);x=x.sibling}x=$d(w,g.mode,S),x.return=g,g=x}return a(g);case zr:return O=w._init,y(g,x,O(w._payload),S)}if(za(w))return h(g,x,w,S);if(wa(w))return v(g,x,w,S);Al(g,w)}return typeof w=="string"&&w!==""||typeof w=="number"?(w=""+w,x!==null&&x.tag===6?(n(g,x.sibling),x=i(x,w),x.return=g,g=x):(n(g,x),x=Td(w,g.mode,S),x.return=g,g=x),a(g)):n(g,x)}return y}var Vo=PS(!0),OS=PS(!1),Fu=hi(null),Bu=null,Oo=null,Dm=null;function Rm(){Dm=Oo=Bu=null}function Lm(e){var t=Fu.current;ke(Fu),e._currentValue=t}function Fp(e,t,n){for(;e!==null;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,r!==null&&(r.childLanes|=t)):r!==null&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function Io(e,t){Bu=e,Dm=Oo=null,e=e.dependencies,e!==null&&e.firstContext!==null&&(e.lanes&t&&(Tt=!0),e.firstContext=null)}function dn(e){var t=e._currentValue;if(Dm!==e)if(e={context:e,memoizedValue:t,next:null},Oo===null){if(Bu===null)throw Error(F(308));Oo=e,Bu.dependencies={lanes:0,firstContext:e}}else Oo=Oo.next=e;return t}var Ci=null;function zm(e){Ci===null?Ci=[e]:Ci.push(e)}function ES(e,t,n,r){var i=t.interleaved;return i===null?(n.next=n,zm(t)):(n.next=i.next,i.next=n),t.interleaved=n,vr(e,r)}function vr(e,t){e.lanes|=t;var n=e.alternate;for(n!==null&&(n.lanes|=t),n=e,e=e.return;e!==null;)e.childLanes|=t,n=e.alternate,n!==null&&(n.childLanes|=t),n=e,e=e.return;return n.tag===3?n.stateNode:null}var Fr=!1;function Fm(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function kS(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function fr(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function Jr(e,t,n){var r=e.updateQueue;if(r===null)return null;if(r=r.shared,ue&2){var i=r.pending;return i===null?t.next=t:(t.next=i.next,i.next=t),r.pending=t,vr(e,n)}return i=r.interleaved,i===null?(t.next=t,zm(r)):(t.next=i.next,i.next=t),r.interleaved=t,vr(e,n)}function uu(e,t,n){if(t=t.updateQueue,t!==null&&(t=t.shared,(n&4194240)!==0)){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,Em(e,n)}}function Jy(e,t){var n=e.updateQueue,r=e.alternate;if(r!==null&&(r=r.updateQueue,n===r)){var i=null,o=null;if(n=n.firstBaseUpdate,n!==null){do{var a={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};o===null?i=o=a:o=o.next=a,n=n.next}while(n!==null);o===null?i=o=t:o=o.next=t}else i=o=t;n={baseState:r.baseState,firstBaseUpdate:i,lastBaseUpdate:o,shared:r.shared,effects:r.effects},e.updateQueue=n;return}e=n.lastBaseUpdate,e===null?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function Uu(e,t,n,r){var i=e.updateQueue;Fr=!1;var o=i.firstBaseUpdate,a=i.lastBaseUpdate,s=i.shared.pending;if(s!==null){i.shared.pending=null;var l=s,u=l.next;l.next=null,a===null?o=u:a.next=u,a=l;var c=e.alternate;c!==null&&(c=c.updateQueue,s=c.lastBaseUpdate,s!==a&&(s===null?c.firstBaseUpdate=u:s.next=u,c.lastBaseUpdate=l))}if(o!==null){var f=i.baseState;a=0,c=u=l=null,s=o;do{var d=s.lane,p=s.eventTime;if((r&d)===d){c!==null&&(c=c.next={eventTime:p,lane:0,tag:s.tag,payload:s.payload,callback:s.callback,next:null});e:{var h=e,v=s;switch(d=t,p=n,v.tag){case 1:if(h=v.payload,typeof h=="function"){f=h.call(p,f,d);break e}f=h;break e;case 3:h.flags=h.flags&-65537|128;case 0:if(h=v.payload,d=typeof h=="function"?h.call(p,f,d):h,d==null)break e;f=$e({},f,d);break e;case 2:Fr=!0}}s.callback!==null&&s.lane!==0&&(e.flags|=64,d=i.effects,d===null?i.effects=[s]:d.push(s))}else p={eventTime:p,lane:d,tag:s.tag,payload:s.payload,callback:s.callback,next:null},c===null?(u=c=p,l=f):c=c.next=p,a|=d;if(s=s.next,s===null){if(s=i.shared.pending,s===null)break;d=s,s=d.next,d.next=null,i.lastBaseUpdate=d,i.shared.pending=null}}while(1);if(c===null&&(l=f),i.baseState=l,i.firstBaseUpdate=u,i.lastBaseUpdate=c,t=i.shared.interleaved,t!==null){i=t;do a|=i.lane,i=i.next;while(i!==t)}else o===null&&(i.shared.lanes=0);Ui|=a,e.lanes=a,e.memoizedState=f}}function e0(e,t,n){if(e=t.effects,t.effects=null,e!==null)for(t=0;t<e.length;t++){var r=e[t],i=r.callback;if(i!==null){if(r.callback=null,r=n,typeof i!="function")throw Error(F(191,i));i.call(r)}}}var Vs={},Vn=hi(Vs),ps=hi(Vs),hs=hi(Vs);function _i(e){if(e===Vs)throw Error(F(174));return e}function Bm(e,t){switch(we(hs,t),we(ps,e),we(Vn,Vs),e=t.nodeType,e){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:wp(null,"");break;default:e=e===8?t.parentNode:t,t=e.namespaceURI||null,e=e.tagName,t=wp(t,e)}ke(Vn),we(Vn,t)}function Ho(){ke(Vn),ke(ps),ke(hs)}function CS(e){_i(hs.current);var t=_i(Vn.current),n=wp(t,e.type);t!==n&&(we(ps,e),we(Vn,n))}function Um(e){ps.current===e&&(ke(Vn),ke(ps))}var Me=hi(0);function Vu(e){for(var t=e;t!==null;){if(t.tag===13){var n=t.memoizedState;if(n!==null&&(n=n.dehydrated,n===null||n.data==="$?"||n.data==="$!"))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if(t.flags&128)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var kd=[];function Vm(){for(var e=0;e<kd.length;e++)kd[e]._workInProgressVersionPrimary=null;kd.length=0}var cu=Cr.ReactCurrentDispatcher,Cd=Cr.ReactCurrentBatchConfig,Bi=0,Te=null,He=null,nt=null,Hu=!1,Za=!1,ms=0,RM=0;function mt(){throw Error(F(321))}function Hm(e,t){if(t===null)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!An(e[n],t[n]))return!1;return!0}function Km(e,t,n,r,i,o){if(Bi=o,Te=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,cu.current=e===null||e.memoizedState===null?BM:UM,e=n(r,i),Za){o=0;do{if(Za=!1,ms=0,25<=o)throw Error(F(301));o+=1,nt=He=null,t.updateQueue=null,cu.current=VM,e=n(r,i)}while(Za)}if(cu.current=Ku,t=He!==null&&He.next!==null,Bi=0,nt=He=Te=null,Hu=!1,t)throw Error(F(300));return e}function Wm(){var e=ms!==0;return ms=0,e}function Rn(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return nt===null?Te.memoizedState=nt=e:nt=nt.next=e,nt}function pn(){if(He===null){var e=Te.alternate;e=e!==null?e.memoizedState:null}else e=He.next;var t=nt===null?Te.memoizedState:nt.next;if(t!==null)nt=t,He=e;else{if(e===null)throw Error(F(310));He=e,e={memoizedState:He.memoizedState,baseState:He.baseState,baseQueue:He.baseQueue,queue:He.queue,next:null},nt===null?Te.memoizedState=nt=e:nt=nt.next=e}return nt}function vs(e,t){return typeof t=="function"?t(e):t}function _d(e){var t=pn(),n=t.queue;if(n===null)throw Error(F(311));n.lastRenderedReducer=e;var r=He,i=r.baseQueue,o=n.pending;if(o!==null){if(i!==null){var a=i.next;i.next=o.next,o.next=a}r.baseQueue=i=o,n.pending=null}if(i!==null){o=i.next,r=r.baseState;var s=a=null,l=null,u=o;do{var c=u.lane;if((Bi&c)===c)l!==null&&(l=l.next={lane:0,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null}),r=u.hasEagerState?u.eagerState:e(r,u.action);else{var f={lane:c,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null};l===null?(s=l=f,a=r):l=l.next=f,Te.lanes|=c,Ui|=c}u=u.next}while(u!==null&&u!==o);l===null?a=r:l.next=s,An(r,t.memoizedState)||(Tt=!0),t.memoizedState=r,t.baseState=a,t.baseQueue=l,n.lastRenderedState=r}if(e=n.interleaved,e!==null){i=e;do o=i.lane,Te.lanes|=o,Ui|=o,i=i.next;while(i!==e)}else i===null&&(n.lanes=0);return[t.memoizedState,n.dispatch]}function Ad(e){var t=pn(),n=t.queue;if(n===null)throw Error(F(311));n.lastRenderedReducer=e;var r=n.dispatch,i=n.pending,o=t.memoizedState;if(i!==null){n.pending=null;var a=i=i.next;do o=e(o,a.action),a=a.next;while(a!==i);An(o,t.memoizedState)||(Tt=!0),t.memoizedState=o,t.baseQueue===null&&(t.baseState=o),n.lastRenderedState=o}return[o,r]}function _S(){}function AS(e,t){var n=Te,r=pn(),i=t(),o=!An(r.memoizedState,i);if(o&&(r.memoizedState=i,Tt=!0),r=r.queue,Ym(TS.bind(null,n,r,e),[e]),r.getSnapshot!==t||o||nt!==null&&nt.memoizedState.tag&1){if(n.flags|=2048,gs(9,MS.bind(null,n,r,i,t),void 0,null),rt===null)throw Error(F(349));Bi&30||jS(n,t,i)}return i}function jS(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},t=Te.updateQueue,t===null?(t={lastEffect:null,stores:null},Te.updateQueue=t,t.stores=[e]):(n=t.stores,n===null?t.stores=[e]:n.push(e))}function MS(e,t,n,r){t.value=n,t.getSnapshot=r,$S(t)&&IS(e)}function TS(e,t,n){return n(function(){$S(t)&&IS(e)})}function $S(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!An(e,n)}catch{return!0}}function IS(e){var t=vr(e,1);t!==null&&Cn(t,e,1,-1)}function t0(e){var t=Rn();return typeof e=="function"&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:vs,lastRenderedState:e},t.queue=e,e=e.dispatch=FM.bind(null,Te,e),[t.memoizedState,e]}function gs(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},t=Te.updateQueue,t===null?(t={lastEffect:null,stores:null},Te.updateQueue=t,t.lastEffect=e.next=e):(n=t.lastEffect,n===null?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e)),e}function NS(){return pn().memoizedState}function fu(e,t,n,r){var i=Rn();Te.flags|=e,i.memoizedState=gs(1|t,n,void 0,r===void 0?null:r)}function Qc(e,t,n,r){var i=pn();r=r===void 0?null:r;var o=void 0;if(He!==null){var a=He.memoizedState;if(o=a.destroy,r!==null&&Hm(r,a.deps)){i.memoizedState=gs(t,n,o,r);return}}Te.flags|=e,i.memoizedState=gs(1|t,n,o,r)}function n0(e,t){return fu(8390656,8,e,t)}function Ym(e,t){return Qc(2048,8,e,t)}function DS(e,t){return Qc(4,2,e,t)}function RS(e,t){return Qc(4,4,e,t)}function LS(e,t){if(typeof t=="function")return e=e(),t(e),function(){t(null)};if(t!=null)return e=e(),t.current=e,function(){t.current=null}}function zS(e,t,n){return n=n!=null?n.concat([e]):null,Qc(4,4,LS.bind(null,t,e),n)}function qm(){}function FS(e,t){var n=pn();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&Hm(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function BS(e,t){var n=pn();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&Hm(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function US(e,t,n){return Bi&21?(An(n,t)||(n=Yb(),Te.lanes|=n,Ui|=n,e.baseState=!0),t):(e.baseState&&(e.baseState=!1,Tt=!0),e.memoizedState=n)}function LM(e,t){var n=he;he=n!==0&&4>n?n:4,e(!0);var r=Cd.transition;Cd.transition={};try{e(!1),t()}finally{he=n,Cd.transition=r}}function VS(){return pn().memoizedState}function zM(e,t,n){var r=ti(e);if(n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},HS(e))KS(t,n);else if(n=ES(e,t,n,r),n!==null){var i=Et();Cn(n,e,r,i),WS(n,t,r)}}function FM(e,t,n){var r=ti(e),i={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if(HS(e))KS(t,i);else{var o=e.alternate;if(e.lanes===0&&(o===null||o.lanes===0)&&(o=t.lastRenderedReducer,o!==null))try{var a=t.lastRenderedState,s=o(a,n);if(i.hasEagerState=!0,i.eagerState=s,An(s,a)){var l=t.interleaved;l===null?(i.next=i,zm(t)):(i.next=l.next,l.next=i),t.interleaved=i;return}}catch{}finally{}n=ES(e,t,i,r),n!==null&&(i=Et(),Cn(n,e,r,i),WS(n,t,r))}}function HS(e){var t=e.alternate;return e===Te||t!==null&&t===Te}function KS(e,t){Za=Hu=!0;var n=e.pending;n===null?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function WS(e,t,n){if(n&4194240){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,Em(e,n)}}var Ku={readContext:dn,useCallback:mt,useContext:mt,useEffect:mt,useImperativeHandle:mt,useInsertionEffect:mt,useLayoutEffect:mt,useMemo:mt,useReducer:mt,useRef:mt,useState:mt,useDebugValue:mt,useDeferredValue:mt,useTransition:mt,useMutableSource:mt,useSyncExternalStore:mt,useId:mt,unstable_isNewReconciler:!1},BM={readContext:dn,useCallback:function(e,t){return Rn().memoizedState=[e,t===void 0?null:t],e},useContext:dn,useEffect:n0,useImperativeHandle:function(e,t,n){return n=n!=null?n.concat([e]):null,fu(4194308,4,LS.bind(null,t,e),n)},useLayoutEffect:function(e,t){return fu(4194308,4,e,t)},useInsertionEffect:function(e,t){return fu(4,2,e,t)},useMemo:function(e,t){var n=Rn();return t=t===void 0?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=Rn();return t=n!==void 0?n(t):t,r.memoizedState=r.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},r.queue=e,e=e.dispatch=zM.bind(null,Te,e),[r.memoizedState,e]},useRef:function(e){var t=Rn();return e={current:e},t.memoizedState=e},useState:t0,useDebugValue:qm,useDeferredValue:function(e){return Rn().memoizedState=e},useTransition:function(){var e=t0(!1),t=e[0];return e=LM.bind(null,e[1]),Rn().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,n){var r=Te,i=Rn();if(_e){if(n===void 0)throw Error(F(407));n=n()}else{if(n=t(),rt===null)throw Error(F(349));Bi&30||jS(r,t,n)}i.memoizedState=n;var o={value:n,getSnapshot:t};return i.queue=o,n0(TS.bind(null,r,o,e),[e]),r.flags|=2048,gs(9,MS.bind(null,r,o,n,t),void 0,null),n},useId:function(){var e=Rn(),t=rt.identifierPrefix;if(_e){var n=lr,r=sr;n=(r&~(1<<32-kn(r)-1)).toString(32)+n,t=":"+t+"R"+n,n=ms++,0<n&&(t+="H"+n.toString(32)),t+=":"}else n=RM++,t=":"+t+"r"+n.toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},UM={readContext:dn,useCallback:FS,useContext:dn,useEffect:Ym,useImperativeHandle:zS,useInsertionEffect:DS,useLayoutEffect:RS,useMemo:BS,useReducer:_d,useRef:NS,useState:function(){return _d(vs)},useDebugValue:qm,useDeferredValue:function(e){var t=pn();return US(t,He.memoizedState,e)},useTransition:function(){var e=_d(vs)[0],t=pn().memoizedState;return[e,t]},useMutableSource:_S,useSyncExternalStore:AS,useId:VS,unstable_isNewReconciler:!1},VM={readContext:dn,useCallback:FS,useContext:dn,useEffect:Ym,useImperativeHandle:zS,useInsertionEffect:DS,useLayoutEffect:RS,useMemo:BS,useReducer:Ad,useRef:NS,useState:function(){return Ad(vs)},useDebugValue:qm,useDeferredValue:function(e){var t=pn();return He===null?t.memoizedState=e:US(t,He.memoizedState,e)},useTransition:function(){var e=Ad(vs)[0],t=pn().memoizedState;return[e,t]},useMutableSource:_S,useSyncExternalStore:AS,useId:VS,unstable_isNewReconciler:!1};function xn(e,t){if(e&&e.defaultProps){t=$e({},t),e=e.defaultProps;for(var n in e)t[n]===void 0&&(t[n]=e[n]);return t}return t}function Bp(e,t,n,r){t=e.memoizedState,n=n(r,t),n=n==null?t:$e({},t,n),e.memoizedState=n,e.lanes===0&&(e.updateQueue.baseState=n)}var Jc={isMounted:function(e){return(e=e._reactInternals)?Ji(e)===e:!1},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=Et(),i=ti(e),o=fr(r,i);o.payload=t,n!=null&&(o.callback=n),t=Jr(e,o,i),t!==null&&(Cn(t,e,i,r),uu(t,e,i))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=Et(),i=ti(e),o=fr(r,i);o.tag=1,o.payload=t,n!=null&&(o.callback=n),t=Jr(e,o,i),t!==null&&(Cn(t,e,i,r),uu(t,e,i))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=Et(),r=ti(e),i=fr(n,r);i.tag=2,t!=null&&(i.callback=t),t=Jr(e,i,r),t!==null&&(Cn(t,e,r,n),uu(t,e,r))}};function r0(e,t,n,r,i,o,a){return e=e.stateNode,typeof e.shouldComponentUpdate=="function"?e.shouldComponentUpdate(r,o,a):t.prototype&&t.prototype.isPureReactComponent?!us(n,r)||!us(i,o):!0}function YS(e,t,n){var r=!1,i=ai,o=t.contextType;return typeof o=="object"&&o!==null?o=dn(o):(i=Nt(t)?zi:bt.current,r=t.contextTypes,o=(r=r!=null)?Bo(e,i):ai),t=new t(n,o),e.memoizedState=t.state!==null&&t.state!==void 0?t.state:null,t.updater=Jc,e.stateNode=t,t._reactInternals=e,r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=i,e.__reactInternalMemoizedMaskedChildContext=o),t}function i0(e,t,n,r){e=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(n,r),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&Jc.enqueueReplaceState(t,t.state,null)}function Up(e,t,n,r){var i=e.stateNode;i.props=n,i.state=e.memoizedState,i.refs={},Fm(e);var o=t.contextType;typeof o=="object"&&o!==null?i.context=dn(o):(o=Nt(t)?zi:bt.current,i.context=Bo(e,o)),i.state=e.memoizedState,o=t.getDerivedStateFromProps,typeof o=="function"&&(Bp(e,t,o,n),i.state=e.memoizedState),typeof t.getDerivedStateFromProps=="function"||typeof i.getSnapshotBeforeUpdate=="function"||typeof i.UNSAFE_componentWillMount!="function"&&typeof i.componentWillMount!="function"||(t=i.state,typeof i.componentWillMount=="function"&&i.componentWillMount(),typeof i.UNSAFE_componentWillMount=="function"&&i.UNSAFE_componentWillMount(),t!==i.state&&Jc.enqueueReplaceState(i,i.state,null),Uu(e,n,i,r),i.state=e.memoizedState),typeof i.componentDidMount=="function"&&(e.flags|=4194308)}function Ko(e,t){try{var n="",r=t;do n+=gj(r),r=r.return;while(r);var i=n}catch(o){i=`
 Error generating stack: `+o.message+`
-`+o.stack}return{value:e,source:t,stack:i,digest:null}}function jd(e,t,n){return{value:e,source:null,stack:n??null,digest:t??null}}function Vp(e,t){try{console.error(t.value)}catch(n){setTimeout(function(){throw n})}}var HM=typeof WeakMap=="function"?WeakMap:Map;function qS(e,t,n){n=fr(-1,n),n.tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){Yu||(Yu=!0,Jp=r),Vp(e,t)},n}function GS(e,t,n){n=fr(-1,n),n.tag=3;var r=e.type.getDerivedStateFromError;if(typeof r=="function"){var i=t.value;n.payload=function(){return r(i)},n.callback=function(){Vp(e,t)}}var o=e.stateNode;return o!==null&&typeof o.componentDidCatch=="function"&&(n.callback=function(){Vp(e,t),typeof r!="function"&&(ei===null?ei=new Set([this]):ei.add(this));var a=t.stack;this.componentDidCatch(t.value,{componentStack:a!==null?a:""})}),n}function o0(e,t,n){var r=e.pingCache;if(r===null){r=e.pingCache=new HM;var i=new Set;r.set(t,i)}else i=r.get(t),i===void 0&&(i=new Set,r.set(t,i));i.has(n)||(i.add(n),e=iT.bind(null,e,t,n),t.then(e,e))}function a0(e){do{var t;if((t=e.tag===13)&&(t=e.memoizedState,t=t!==null?t.dehydrated!==null:!0),t)return e;e=e.return}while(e!==null);return null}function s0(e,t,n,r,i){return e.mode&1?(e.flags|=65536,e.lanes=i,e):(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,n.tag===1&&(n.alternate===null?n.tag=17:(t=fr(-1,1),t.tag=2,Jr(n,t,1))),n.lanes|=1),e)}var KM=Cr.ReactCurrentOwner,Tt=!1;function Pt(e,t,n,r){t.child=e===null?OS(t,null,n,r):Vo(t,e.child,n,r)}function l0(e,t,n,r,i){n=n.render;var o=t.ref;return Io(t,i),r=Km(e,t,n,r,o,i),n=Wm(),e!==null&&!Tt?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~i,gr(e,t,i)):(_e&&n&&$m(t),t.flags|=1,Pt(e,t,r,i),t.child)}function u0(e,t,n,r,i){if(e===null){var o=n.type;return typeof o=="function"&&!nv(o)&&o.defaultProps===void 0&&n.compare===null&&n.defaultProps===void 0?(t.tag=15,t.type=o,XS(e,t,o,r,i)):(e=mu(n.type,null,r,t,t.mode,i),e.ref=t.ref,e.return=t,t.child=e)}if(o=e.child,!(e.lanes&i)){var a=o.memoizedProps;if(n=n.compare,n=n!==null?n:us,n(a,r)&&e.ref===t.ref)return gr(e,t,i)}return t.flags|=1,e=ni(o,r),e.ref=t.ref,e.return=t,t.child=e}function XS(e,t,n,r,i){if(e!==null){var o=e.memoizedProps;if(us(o,r)&&e.ref===t.ref)if(Tt=!1,t.pendingProps=r=o,(e.lanes&i)!==0)e.flags&131072&&(Tt=!0);else return t.lanes=e.lanes,gr(e,t,i)}return Hp(e,t,n,r,i)}function ZS(e,t,n){var r=t.pendingProps,i=r.children,o=e!==null?e.memoizedState:null;if(r.mode==="hidden")if(!(t.mode&1))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},we(ko,Ut),Ut|=n;else{if(!(n&1073741824))return e=o!==null?o.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,we(ko,Ut),Ut|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=o!==null?o.baseLanes:n,we(ko,Ut),Ut|=r}else o!==null?(r=o.baseLanes|n,t.memoizedState=null):r=n,we(ko,Ut),Ut|=r;return Pt(e,t,i,n),t.child}function QS(e,t){var n=t.ref;(e===null&&n!==null||e!==null&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function Hp(e,t,n,r,i){var o=Nt(n)?zi:bt.current;return o=Bo(t,o),Io(t,i),n=Km(e,t,n,r,o,i),r=Wm(),e!==null&&!Tt?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~i,gr(e,t,i)):(_e&&r&&$m(t),t.flags|=1,Pt(e,t,n,i),t.child)}function c0(e,t,n,r,i){if(Nt(n)){var o=!0;Ru(t)}else o=!1;if(Io(t,i),t.stateNode===null)du(e,t),YS(t,n,r),Up(t,n,r,i),r=!0;else if(e===null){var a=t.stateNode,s=t.memoizedProps;a.props=s;var l=a.context,u=n.contextType;typeof u=="object"&&u!==null?u=dn(u):(u=Nt(n)?zi:bt.current,u=Bo(t,u));var c=n.getDerivedStateFromProps,f=typeof c=="function"||typeof a.getSnapshotBeforeUpdate=="function";f||typeof a.UNSAFE_componentWillReceiveProps!="function"&&typeof a.componentWillReceiveProps!="function"||(s!==r||l!==u)&&i0(t,a,r,u),Fr=!1;var d=t.memoizedState;a.state=d,Uu(t,r,a,i),l=t.memoizedState,s!==r||d!==l||It.current||Fr?(typeof c=="function"&&(Bp(t,n,c,r),l=t.memoizedState),(s=Fr||r0(t,n,s,r,d,l,u))?(f||typeof a.UNSAFE_componentWillMount!="function"&&typeof a.componentWillMount!="function"||(typeof a.componentWillMount=="function"&&a.componentWillMount(),typeof a.UNSAFE_componentWillMount=="function"&&a.UNSAFE_componentWillMount()),typeof a.componentDidMount=="function"&&(t.flags|=4194308)):(typeof a.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=l),a.props=r,a.state=l,a.context=u,r=s):(typeof a.componentDidMount=="function"&&(t.flags|=4194308),r=!1)}else{a=t.stateNode,kS(e,t),s=t.memoizedProps,u=t.type===t.elementType?s:xn(t.type,s),a.props=u,f=t.pendingProps,d=a.context,l=n.contextType,typeof l=="object"&&l!==null?l=dn(l):(l=Nt(n)?zi:bt.current,l=Bo(t,l));var p=n.getDerivedStateFromProps;(c=typeof p=="function"||typeof a.getSnapshotBeforeUpdate=="function")||typeof a.UNSAFE_componentWillReceiveProps!="function"&&typeof a.componentWillReceiveProps!="function"||(s!==f||d!==l)&&i0(t,a,r,l),Fr=!1,d=t.memoizedState,a.state=d,Uu(t,r,a,i);var h=t.memoizedState;s!==f||d!==h||It.current||Fr?(typeof p=="function"&&(Bp(t,n,p,r),h=t.memoizedState),(u=Fr||r0(t,n,u,r,d,h,l)||!1)?(c||typeof a.UNSAFE_componentWillUpdate!="function"&&typeof a.componentWillUpdate!="function"||(typeof a.componentWillUpdate=="function"&&a.componentWillUpdate(r,h,l),typeof a.UNSAFE_componentWillUpdate=="function"&&a.UNSAFE_componentWillUpdate(r,h,l)),typeof a.componentDidUpdate=="function"&&(t.flags|=4),typeof a.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof a.componentDidUpdate!="function"||s===e.memoizedProps&&d===e.memoizedState||(t.flags|=4),typeof a.getSnapshotBeforeUpdate!="function"||s===e.memoizedProps&&d===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=h),a.props=r,a.state=h,a.context=l,r=u):(typeof a.componentDidUpdate!="function"||s===e.memoizedProps&&d===e.memoizedState||(t.flags|=4),typeof a.getSnapshotBeforeUpdate!="function"||s===e.memoizedProps&&d===e.memoizedState||(t.flags|=1024),r=!1)}return Kp(e,t,n,r,o,i)}function Kp(e,t,n,r,i,o){QS(e,t);var a=(t.flags&128)!==0;if(!r&&!a)return i&&Gy(t,n,!1),gr(e,t,o);r=t.stateNode,KM.current=t;var s=a&&typeof n.getDerivedStateFromError!="function"?null:r.render();return t.flags|=1,e!==null&&a?(t.child=Vo(t,e.child,null,o),t.child=Vo(t,null,s,o)):Pt(e,t,s,o),t.memoizedState=r.state,i&&Gy(t,n,!0),t.child}function JS(e){var t=e.stateNode;t.pendingContext?qy(e,t.pendingContext,t.pendingContext!==t.context):t.context&&qy(e,t.context,!1),Bm(e,t.containerInfo)}function f0(e,t,n,r,i){return Uo(),Nm(i),t.flags|=256,Pt(e,t,n,r),t.child}var Wp={dehydrated:null,treeContext:null,retryLane:0};function Yp(e){return{baseLanes:e,cachePool:null,transitions:null}}function eP(e,t,n){var r=t.pendingProps,i=Me.current,o=!1,a=(t.flags&128)!==0,s;if((s=a)||(s=e!==null&&e.memoizedState===null?!1:(i&2)!==0),s?(o=!0,t.flags&=-129):(e===null||e.memoizedState!==null)&&(i|=1),we(Me,i&1),e===null)return zp(t),e=t.memoizedState,e!==null&&(e=e.dehydrated,e!==null)?(t.mode&1?e.data==="$!"?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(a=r.children,e=r.fallback,o?(r=t.mode,o=t.child,a={mode:"hidden",children:a},!(r&1)&&o!==null?(o.childLanes=0,o.pendingProps=a):o=nf(a,r,0,null),e=Ii(e,r,n,null),o.return=t,e.return=t,o.sibling=e,t.child=o,t.child.memoizedState=Yp(n),t.memoizedState=Wp,e):Gm(t,a));if(i=e.memoizedState,i!==null&&(s=i.dehydrated,s!==null))return WM(e,t,a,r,s,i,n);if(o){o=r.fallback,a=t.mode,i=e.child,s=i.sibling;var l={mode:"hidden",children:r.children};return!(a&1)&&t.child!==i?(r=t.child,r.childLanes=0,r.pendingProps=l,t.deletions=null):(r=ni(i,l),r.subtreeFlags=i.subtreeFlags&14680064),s!==null?o=ni(s,o):(o=Ii(o,a,n,null),o.flags|=2),o.return=t,r.return=t,r.sibling=o,t.child=r,r=o,o=t.child,a=e.child.memoizedState,a=a===null?Yp(n):{baseLanes:a.baseLanes|n,cachePool:null,transitions:a.transitions},o.memoizedState=a,o.childLanes=e.childLanes&~n,t.memoizedState=Wp,r}return o=e.child,e=o.sibling,r=ni(o,{mode:"visible",children:r.children}),!(t.mode&1)&&(r.lanes=n),r.return=t,r.sibling=null,e!==null&&(n=t.deletions,n===null?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=r,t.memoizedState=null,r}function Gm(e,t){return t=nf({mode:"visible",children:t},e.mode,0,null),t.return=e,e.child=t}function jl(e,t,n,r){return r!==null&&Nm(r),Vo(t,e.child,null,n),e=Gm(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function WM(e,t,n,r,i,o,a){if(n)return t.flags&256?(t.flags&=-257,r=jd(Error(F(422))),jl(e,t,a,r)):t.memoizedState!==null?(t.child=e.child,t.flags|=128,null):(o=r.fallback,i=t.mode,r=nf({mode:"visible",children:r.children},i,0,null),o=Ii(o,i,a,null),o.flags|=2,r.return=t,o.return=t,r.sibling=o,t.child=r,t.mode&1&&Vo(t,e.child,null,a),t.child.memoizedState=Yp(a),t.memoizedState=Wp,o);if(!(t.mode&1))return jl(e,t,a,null);if(i.data==="$!"){if(r=i.nextSibling&&i.nextSibling.dataset,r)var s=r.dgst;return r=s,o=Error(F(419)),r=jd(o,r,void 0),jl(e,t,a,r)}if(s=(a&e.childLanes)!==0,Tt||s){if(r=rt,r!==null){switch(a&-a){case 4:i=2;break;case 16:i=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:i=32;break;case 536870912:i=268435456;break;default:i=0}i=i&(r.suspendedLanes|a)?0:i,i!==0&&i!==o.retryLane&&(o.retryLane=i,vr(e,i),Cn(r,e,i,-1))}return tv(),r=jd(Error(F(421))),jl(e,t,a,r)}return i.data==="$?"?(t.flags|=128,t.child=e.child,t=oT.bind(null,e),i._reactRetry=t,null):(e=o.treeContext,Wt=Qr(i.nextSibling),qt=t,_e=!0,Sn=null,e!==null&&(on[an++]=sr,on[an++]=lr,on[an++]=Fi,sr=e.id,lr=e.overflow,Fi=t),t=Gm(t,r.children),t.flags|=4096,t)}function d0(e,t,n){e.lanes|=t;var r=e.alternate;r!==null&&(r.lanes|=t),Fp(e.return,t,n)}function Md(e,t,n,r,i){var o=e.memoizedState;o===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:i}:(o.isBackwards=t,o.rendering=null,o.renderingStartTime=0,o.last=r,o.tail=n,o.tailMode=i)}function tP(e,t,n){var r=t.pendingProps,i=r.revealOrder,o=r.tail;if(Pt(e,t,r.children,n),r=Me.current,r&2)r=r&1|2,t.flags|=128;else{if(e!==null&&e.flags&128)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&d0(e,n,t);else if(e.tag===19)d0(e,n,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(we(Me,r),!(t.mode&1))t.memoizedState=null;else switch(i){case"forwards":for(n=t.child,i=null;n!==null;)e=n.alternate,e!==null&&Vu(e)===null&&(i=n),n=n.sibling;n=i,n===null?(i=t.child,t.child=null):(i=n.sibling,n.sibling=null),Md(t,!1,i,n,o);break;case"backwards":for(n=null,i=t.child,t.child=null;i!==null;){if(e=i.alternate,e!==null&&Vu(e)===null){t.child=i;break}e=i.sibling,i.sibling=n,n=i,i=e}Md(t,!0,n,null,o);break;case"together":Md(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function du(e,t){!(t.mode&1)&&e!==null&&(e.alternate=null,t.alternate=null,t.flags|=2)}function gr(e,t,n){if(e!==null&&(t.dependencies=e.dependencies),Ui|=t.lanes,!(n&t.childLanes))return null;if(e!==null&&t.child!==e.child)throw Error(F(153));if(t.child!==null){for(e=t.child,n=ni(e,e.pendingProps),t.child=n,n.return=t;e.sibling!==null;)e=e.sibling,n=n.sibling=ni(e,e.pendingProps),n.return=t;n.sibling=null}return t.child}function YM(e,t,n){switch(t.tag){case 3:JS(t),Uo();break;case 5:CS(t);break;case 1:Nt(t.type)&&Ru(t);break;case 4:Bm(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,i=t.memoizedProps.value;we(Fu,r._currentValue),r._currentValue=i;break;case 13:if(r=t.memoizedState,r!==null)return r.dehydrated!==null?(we(Me,Me.current&1),t.flags|=128,null):n&t.child.childLanes?eP(e,t,n):(we(Me,Me.current&1),e=gr(e,t,n),e!==null?e.sibling:null);we(Me,Me.current&1);break;case 19:if(r=(n&t.childLanes)!==0,e.flags&128){if(r)return tP(e,t,n);t.flags|=128}if(i=t.memoizedState,i!==null&&(i.rendering=null,i.tail=null,i.lastEffect=null),we(Me,Me.current),r)break;return null;case 22:case 23:return t.lanes=0,ZS(e,t,n)}return gr(e,t,n)}var nP,qp,rP,iP;nP=function(e,t){for(var n=t.child;n!==null;){if(n.tag===5||n.tag===6)e.appendChild(n.stateNode);else if(n.tag!==4&&n.child!==null){n.child.return=n,n=n.child;continue}if(n===t)break;for(;n.sibling===null;){if(n.return===null||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}};qp=function(){};rP=function(e,t,n,r){var i=e.memoizedProps;if(i!==r){e=t.stateNode,_i(Vn.current);var o=null;switch(n){case"input":i=vp(e,i),r=vp(e,r),o=[];break;case"select":i=$e({},i,{value:void 0}),r=$e({},r,{value:void 0}),o=[];break;case"textarea":i=xp(e,i),r=xp(e,r),o=[];break;default:typeof i.onClick!="function"&&typeof r.onClick=="function"&&(e.onclick=Nu)}bp(n,r);var a;n=null;for(u in i)if(!r.hasOwnProperty(u)&&i.hasOwnProperty(u)&&i[u]!=null)if(u==="style"){var s=i[u];for(a in s)s.hasOwnProperty(a)&&(n||(n={}),n[a]="")}else u!=="dangerouslySetInnerHTML"&&u!=="children"&&u!=="suppressContentEditableWarning"&&u!=="suppressHydrationWarning"&&u!=="autoFocus"&&(ns.hasOwnProperty(u)?o||(o=[]):(o=o||[]).push(u,null));for(u in r){var l=r[u];if(s=i!=null?i[u]:void 0,r.hasOwnProperty(u)&&l!==s&&(l!=null||s!=null))if(u==="style")if(s){for(a in s)!s.hasOwnProperty(a)||l&&l.hasOwnProperty(a)||(n||(n={}),n[a]="");for(a in l)l.hasOwnProperty(a)&&s[a]!==l[a]&&(n||(n={}),n[a]=l[a])}else n||(o||(o=[]),o.push(u,n)),n=l;else u==="dangerouslySetInnerHTML"?(l=l?l.__html:void 0,s=s?s.__html:void 0,l!=null&&s!==l&&(o=o||[]).push(u,l)):u==="children"?typeof l!="string"&&typeof l!="number"||(o=o||[]).push(u,""+l):u!=="suppressContentEditableWarning"&&u!=="suppressHydrationWarning"&&(ns.hasOwnProperty(u)?(l!=null&&u==="onScroll"&&Oe("scroll",e),o||s===l||(o=[])):(o=o||[]).push(u,l))}n&&(o=o||[]).push("style",n);var u=o;(t.updateQueue=u)&&(t.flags|=4)}};iP=function(e,t,n,r){n!==r&&(t.flags|=4)};function ka(e,t){if(!_e)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;t!==null;)t.alternate!==null&&(n=t),t=t.sibling;n===null?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;n!==null;)n.alternate!==null&&(r=n),n=n.sibling;r===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:r.sibling=null}}function vt(e){var t=e.alternate!==null&&e.alternate.child===e.child,n=0,r=0;if(t)for(var i=e.child;i!==null;)n|=i.lanes|i.childLanes,r|=i.subtreeFlags&14680064,r|=i.flags&14680064,i.return=e,i=i.sibling;else for(i=e.child;i!==null;)n|=i.lanes|i.childLanes,r|=i.subtreeFlags,r|=i.flags,i.return=e,i=i.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function qM(e,t,n){var r=t.pendingProps;switch(Im(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return vt(t),null;case 1:return Nt(t.type)&&Du(),vt(t),null;case 3:return r=t.stateNode,Ho(),ke(It),ke(bt),Vm(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),(e===null||e.child===null)&&(_l(t)?t.flags|=4:e===null||e.memoizedState.isDehydrated&&!(t.flags&256)||(t.flags|=1024,Sn!==null&&(nh(Sn),Sn=null))),qp(e,t),vt(t),null;case 5:Um(t);var i=_i(hs.current);if(n=t.type,e!==null&&t.stateNode!=null)rP(e,t,n,r,i),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(t.stateNode===null)throw Error(F(166));return vt(t),null}if(e=_i(Vn.current),_l(t)){r=t.stateNode,n=t.type;var o=t.memoizedProps;switch(r[zn]=t,r[ds]=o,e=(t.mode&1)!==0,n){case"dialog":Oe("cancel",r),Oe("close",r);break;case"iframe":case"object":case"embed":Oe("load",r);break;case"video":case"audio":for(i=0;i<Ba.length;i++)Oe(Ba[i],r);break;case"source":Oe("error",r);break;case"img":case"image":case"link":Oe("error",r),Oe("load",r);break;case"details":Oe("toggle",r);break;case"input":by(r,o),Oe("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!o.multiple},Oe("invalid",r);break;case"textarea":Py(r,o),Oe("invalid",r)}bp(n,o),i=null;for(var a in o)if(o.hasOwnProperty(a)){var s=o[a];a==="children"?typeof s=="string"?r.textContent!==s&&(o.suppressHydrationWarning!==!0&&Cl(r.textContent,s,e),i=["children",s]):typeof s=="number"&&r.textContent!==""+s&&(o.suppressHydrationWarning!==!0&&Cl(r.textContent,s,e),i=["children",""+s]):ns.hasOwnProperty(a)&&s!=null&&a==="onScroll"&&Oe("scroll",r)}switch(n){case"input":xl(r),Sy(r,o,!0);break;case"textarea":xl(r),Oy(r);break;case"select":case"option":break;default:typeof o.onClick=="function"&&(r.onclick=Nu)}r=i,t.updateQueue=r,r!==null&&(t.flags|=4)}else{a=i.nodeType===9?i:i.ownerDocument,e==="http://www.w3.org/1999/xhtml"&&(e=Tb(n)),e==="http://www.w3.org/1999/xhtml"?n==="script"?(e=a.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):typeof r.is=="string"?e=a.createElement(n,{is:r.is}):(e=a.createElement(n),n==="select"&&(a=e,r.multiple?a.multiple=!0:r.size&&(a.size=r.size))):e=a.createElementNS(e,n),e[zn]=t,e[ds]=r,nP(e,t,!1,!1),t.stateNode=e;e:{switch(a=Sp(n,r),n){case"dialog":Oe("cancel",e),Oe("close",e),i=r;break;case"iframe":case"object":case"embed":Oe("load",e),i=r;break;case"video":case"audio":for(i=0;i<Ba.length;i++)Oe(Ba[i],e);i=r;break;case"source":Oe("error",e),i=r;break;case"img":case"image":case"link":Oe("error",e),Oe("load",e),i=r;break;case"details":Oe("toggle",e),i=r;break;case"input":by(e,r),i=vp(e,r),Oe("invalid",e);break;case"option":i=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},i=$e({},r,{value:void 0}),Oe("invalid",e);break;case"textarea":Py(e,r),i=xp(e,r),Oe("invalid",e);break;default:i=r}bp(n,i),s=i;for(o in s)if(s.hasOwnProperty(o)){var l=s[o];o==="style"?Nb(e,l):o==="dangerouslySetInnerHTML"?(l=l?l.__html:void 0,l!=null&&$b(e,l)):o==="children"?typeof l=="string"?(n!=="textarea"||l!=="")&&rs(e,l):typeof l=="number"&&rs(e,""+l):o!=="suppressContentEditableWarning"&&o!=="suppressHydrationWarning"&&o!=="autoFocus"&&(ns.hasOwnProperty(o)?l!=null&&o==="onScroll"&&Oe("scroll",e):l!=null&&xm(e,o,l,a))}switch(n){case"input":xl(e),Sy(e,r,!1);break;case"textarea":xl(e),Oy(e);break;case"option":r.value!=null&&e.setAttribute("value",""+oi(r.value));break;case"select":e.multiple=!!r.multiple,o=r.value,o!=null?jo(e,!!r.multiple,o,!1):r.defaultValue!=null&&jo(e,!!r.multiple,r.defaultValue,!0);break;default:typeof i.onClick=="function"&&(e.onclick=Nu)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}t.ref!==null&&(t.flags|=512,t.flags|=2097152)}return vt(t),null;case 6:if(e&&t.stateNode!=null)iP(e,t,e.memoizedProps,r);else{if(typeof r!="string"&&t.stateNode===null)throw Error(F(166));if(n=_i(hs.current),_i(Vn.current),_l(t)){if(r=t.stateNode,n=t.memoizedProps,r[zn]=t,(o=r.nodeValue!==n)&&(e=qt,e!==null))switch(e.tag){case 3:Cl(r.nodeValue,n,(e.mode&1)!==0);break;case 5:e.memoizedProps.suppressHydrationWarning!==!0&&Cl(r.nodeValue,n,(e.mode&1)!==0)}o&&(t.flags|=4)}else r=(n.nodeType===9?n:n.ownerDocument).createTextNode(r),r[zn]=t,t.stateNode=r}return vt(t),null;case 13:if(ke(Me),r=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if(_e&&Wt!==null&&t.mode&1&&!(t.flags&128))SS(),Uo(),t.flags|=98560,o=!1;else if(o=_l(t),r!==null&&r.dehydrated!==null){if(e===null){if(!o)throw Error(F(318));if(o=t.memoizedState,o=o!==null?o.dehydrated:null,!o)throw Error(F(317));o[zn]=t}else Uo(),!(t.flags&128)&&(t.memoizedState=null),t.flags|=4;vt(t),o=!1}else Sn!==null&&(nh(Sn),Sn=null),o=!0;if(!o)return t.flags&65536?t:null}return t.flags&128?(t.lanes=n,t):(r=r!==null,r!==(e!==null&&e.memoizedState!==null)&&r&&(t.child.flags|=8192,t.mode&1&&(e===null||Me.current&1?We===0&&(We=3):tv())),t.updateQueue!==null&&(t.flags|=4),vt(t),null);case 4:return Ho(),qp(e,t),e===null&&cs(t.stateNode.containerInfo),vt(t),null;case 10:return Lm(t.type._context),vt(t),null;case 17:return Nt(t.type)&&Du(),vt(t),null;case 19:if(ke(Me),o=t.memoizedState,o===null)return vt(t),null;if(r=(t.flags&128)!==0,a=o.rendering,a===null)if(r)ka(o,!1);else{if(We!==0||e!==null&&e.flags&128)for(e=t.child;e!==null;){if(a=Vu(e),a!==null){for(t.flags|=128,ka(o,!1),r=a.updateQueue,r!==null&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;n!==null;)o=n,e=r,o.flags&=14680066,a=o.alternate,a===null?(o.childLanes=0,o.lanes=e,o.child=null,o.subtreeFlags=0,o.memoizedProps=null,o.memoizedState=null,o.updateQueue=null,o.dependencies=null,o.stateNode=null):(o.childLanes=a.childLanes,o.lanes=a.lanes,o.child=a.child,o.subtreeFlags=0,o.deletions=null,o.memoizedProps=a.memoizedProps,o.memoizedState=a.memoizedState,o.updateQueue=a.updateQueue,o.type=a.type,e=a.dependencies,o.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return we(Me,Me.current&1|2),t.child}e=e.sibling}o.tail!==null&&Re()>Wo&&(t.flags|=128,r=!0,ka(o,!1),t.lanes=4194304)}else{if(!r)if(e=Vu(a),e!==null){if(t.flags|=128,r=!0,n=e.updateQueue,n!==null&&(t.updateQueue=n,t.flags|=4),ka(o,!0),o.tail===null&&o.tailMode==="hidden"&&!a.alternate&&!_e)return vt(t),null}else 2*Re()-o.renderingStartTime>Wo&&n!==1073741824&&(t.flags|=128,r=!0,ka(o,!1),t.lanes=4194304);o.isBackwards?(a.sibling=t.child,t.child=a):(n=o.last,n!==null?n.sibling=a:t.child=a,o.last=a)}return o.tail!==null?(t=o.tail,o.rendering=t,o.tail=t.sibling,o.renderingStartTime=Re(),t.sibling=null,n=Me.current,we(Me,r?n&1|2:n&1),t):(vt(t),null);case 22:case 23:return ev(),r=t.memoizedState!==null,e!==null&&e.memoizedState!==null!==r&&(t.flags|=8192),r&&t.mode&1?Ut&1073741824&&(vt(t),t.subtreeFlags&6&&(t.flags|=8192)):vt(t),null;case 24:return null;case 25:return null}throw Error(F(156,t.tag))}function GM(e,t){switch(Im(t),t.tag){case 1:return Nt(t.type)&&Du(),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return Ho(),ke(It),ke(bt),Vm(),e=t.flags,e&65536&&!(e&128)?(t.flags=e&-65537|128,t):null;case 5:return Um(t),null;case 13:if(ke(Me),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(F(340));Uo()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return ke(Me),null;case 4:return Ho(),null;case 10:return Lm(t.type._context),null;case 22:case 23:return ev(),null;case 24:return null;default:return null}}var Ml=!1,xt=!1,XM=typeof WeakSet=="function"?WeakSet:Set,W=null;function Eo(e,t){var n=e.ref;if(n!==null)if(typeof n=="function")try{n(null)}catch(r){Ne(e,t,r)}else n.current=null}function Gp(e,t,n){try{n()}catch(r){Ne(e,t,r)}}var p0=!1;function ZM(e,t){if(Tp=Tu,e=uS(),Tm(e)){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{n=(n=e.ownerDocument)&&n.defaultView||window;var r=n.getSelection&&n.getSelection();if(r&&r.rangeCount!==0){n=r.anchorNode;var i=r.anchorOffset,o=r.focusNode;r=r.focusOffset;try{n.nodeType,o.nodeType}catch{n=null;break e}var a=0,s=-1,l=-1,u=0,c=0,f=e,d=null;t:for(;;){for(var p;f!==n||i!==0&&f.nodeType!==3||(s=a+i),f!==o||r!==0&&f.nodeType!==3||(l=a+r),f.nodeType===3&&(a+=f.nodeValue.length),(p=f.firstChild)!==null;)d=f,f=p;for(;;){if(f===e)break t;if(d===n&&++u===i&&(s=a),d===o&&++c===r&&(l=a),(p=f.nextSibling)!==null)break;f=d,d=f.parentNode}f=p}n=s===-1||l===-1?null:{start:s,end:l}}else n=null}n=n||{start:0,end:0}}else n=null;for($p={focusedElem:e,selectionRange:n},Tu=!1,W=t;W!==null;)if(t=W,e=t.child,(t.subtreeFlags&1028)!==0&&e!==null)e.return=t,W=e;else for(;W!==null;){t=W;try{var h=t.alternate;if(t.flags&1024)switch(t.tag){case 0:case 11:case 15:break;case 1:if(h!==null){var v=h.memoizedProps,y=h.memoizedState,g=t.stateNode,x=g.getSnapshotBeforeUpdate(t.elementType===t.type?v:xn(t.type,v),y);g.__reactInternalSnapshotBeforeUpdate=x}break;case 3:var w=t.stateNode.containerInfo;w.nodeType===1?w.textContent="":w.nodeType===9&&w.documentElement&&w.removeChild(w.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(F(163))}}catch(S){Ne(t,t.return,S)}if(e=t.sibling,e!==null){e.return=t.return,W=e;break}W=t.return}return h=p0,p0=!1,h}function Qa(e,t,n){var r=t.updateQueue;if(r=r!==null?r.lastEffect:null,r!==null){var i=r=r.next;do{if((i.tag&e)===e){var o=i.destroy;i.destroy=void 0,o!==void 0&&Gp(t,n,o)}i=i.next}while(i!==r)}}function ef(e,t){if(t=t.updateQueue,t=t!==null?t.lastEffect:null,t!==null){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function Xp(e){var t=e.ref;if(t!==null){var n=e.stateNode;switch(e.tag){case 5:e=n;break;default:e=n}typeof t=="function"?t(e):t.current=e}}function oP(e){var t=e.alternate;t!==null&&(e.alternate=null,oP(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&(delete t[zn],delete t[ds],delete t[Dp],delete t[$M],delete t[IM])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function aP(e){return e.tag===5||e.tag===3||e.tag===4}function h0(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||aP(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function Zp(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.nodeType===8?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(n.nodeType===8?(t=n.parentNode,t.insertBefore(e,n)):(t=n,t.appendChild(e)),n=n._reactRootContainer,n!=null||t.onclick!==null||(t.onclick=Nu));else if(r!==4&&(e=e.child,e!==null))for(Zp(e,t,n),e=e.sibling;e!==null;)Zp(e,t,n),e=e.sibling}function Qp(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(r!==4&&(e=e.child,e!==null))for(Qp(e,t,n),e=e.sibling;e!==null;)Qp(e,t,n),e=e.sibling}var at=null,wn=!1;function Dr(e,t,n){for(n=n.child;n!==null;)sP(e,t,n),n=n.sibling}function sP(e,t,n){if(Un&&typeof Un.onCommitFiberUnmount=="function")try{Un.onCommitFiberUnmount(Wc,n)}catch{}switch(n.tag){case 5:xt||Eo(n,t);case 6:var r=at,i=wn;at=null,Dr(e,t,n),at=r,wn=i,at!==null&&(wn?(e=at,n=n.stateNode,e.nodeType===8?e.parentNode.removeChild(n):e.removeChild(n)):at.removeChild(n.stateNode));break;case 18:at!==null&&(wn?(e=at,n=n.stateNode,e.nodeType===8?Od(e.parentNode,n):e.nodeType===1&&Od(e,n),ss(e)):Od(at,n.stateNode));break;case 4:r=at,i=wn,at=n.stateNode.containerInfo,wn=!0,Dr(e,t,n),at=r,wn=i;break;case 0:case 11:case 14:case 15:if(!xt&&(r=n.updateQueue,r!==null&&(r=r.lastEffect,r!==null))){i=r=r.next;do{var o=i,a=o.destroy;o=o.tag,a!==void 0&&(o&2||o&4)&&Gp(n,t,a),i=i.next}while(i!==r)}Dr(e,t,n);break;case 1:if(!xt&&(Eo(n,t),r=n.stateNode,typeof r.componentWillUnmount=="function"))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(s){Ne(n,t,s)}Dr(e,t,n);break;case 21:Dr(e,t,n);break;case 22:n.mode&1?(xt=(r=xt)||n.memoizedState!==null,Dr(e,t,n),xt=r):Dr(e,t,n);break;default:Dr(e,t,n)}}function m0(e){var t=e.updateQueue;if(t!==null){e.updateQueue=null;var n=e.stateNode;n===null&&(n=e.stateNode=new XM),t.forEach(function(r){var i=aT.bind(null,e,r);n.has(r)||(n.add(r),r.then(i,i))})}}function yn(e,t){var n=t.deletions;if(n!==null)for(var r=0;r<n.length;r++){var i=n[r];try{var o=e,a=t,s=a;e:for(;s!==null;){switch(s.tag){case 5:at=s.stateNode,wn=!1;break e;case 3:at=s.stateNode.containerInfo,wn=!0;break e;case 4:at=s.stateNode.containerInfo,wn=!0;break e}s=s.return}if(at===null)throw Error(F(160));sP(o,a,i),at=null,wn=!1;var l=i.alternate;l!==null&&(l.return=null),i.return=null}catch(u){Ne(i,t,u)}}if(t.subtreeFlags&12854)for(t=t.child;t!==null;)lP(t,e),t=t.sibling}function lP(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(yn(t,e),Nn(e),r&4){try{Qa(3,e,e.return),ef(3,e)}catch(v){Ne(e,e.return,v)}try{Qa(5,e,e.return)}catch(v){Ne(e,e.return,v)}}break;case 1:yn(t,e),Nn(e),r&512&&n!==null&&Eo(n,n.return);break;case 5:if(yn(t,e),Nn(e),r&512&&n!==null&&Eo(n,n.return),e.flags&32){var i=e.stateNode;try{rs(i,"")}catch(v){Ne(e,e.return,v)}}if(r&4&&(i=e.stateNode,i!=null)){var o=e.memoizedProps,a=n!==null?n.memoizedProps:o,s=e.type,l=e.updateQueue;if(e.updateQueue=null,l!==null)try{s==="input"&&o.type==="radio"&&o.name!=null&&jb(i,o),Sp(s,a);var u=Sp(s,o);for(a=0;a<l.length;a+=2){var c=l[a],f=l[a+1];c==="style"?Nb(i,f):c==="dangerouslySetInnerHTML"?$b(i,f):c==="children"?rs(i,f):xm(i,c,f,u)}switch(s){case"input":gp(i,o);break;case"textarea":Mb(i,o);break;case"select":var d=i._wrapperState.wasMultiple;i._wrapperState.wasMultiple=!!o.multiple;var p=o.value;p!=null?jo(i,!!o.multiple,p,!1):d!==!!o.multiple&&(o.defaultValue!=null?jo(i,!!o.multiple,o.defaultValue,!0):jo(i,!!o.multiple,o.multiple?[]:"",!1))}i[ds]=o}catch(v){Ne(e,e.return,v)}}break;case 6:if(yn(t,e),Nn(e),r&4){if(e.stateNode===null)throw Error(F(162));i=e.stateNode,o=e.memoizedProps;try{i.nodeValue=o}catch(v){Ne(e,e.return,v)}}break;case 3:if(yn(t,e),Nn(e),r&4&&n!==null&&n.memoizedState.isDehydrated)try{ss(t.containerInfo)}catch(v){Ne(e,e.return,v)}break;case 4:yn(t,e),Nn(e);break;case 13:yn(t,e),Nn(e),i=e.child,i.flags&8192&&(o=i.memoizedState!==null,i.stateNode.isHidden=o,!o||i.alternate!==null&&i.alternate.memoizedState!==null||(Qm=Re())),r&4&&m0(e);break;case 22:if(c=n!==null&&n.memoizedState!==null,e.mode&1?(xt=(u=xt)||c,yn(t,e),xt=u):yn(t,e),Nn(e),r&8192){if(u=e.memoizedState!==null,(e.stateNode.isHidden=u)&&!c&&e.mode&1)for(W=e,c=e.child;c!==null;){for(f=W=c;W!==null;){switch(d=W,p=d.child,d.tag){case 0:case 11:case 14:case 15:Qa(4,d,d.return);break;case 1:Eo(d,d.return);var h=d.stateNode;if(typeof h.componentWillUnmount=="function"){r=d,n=d.return;try{t=r,h.props=t.memoizedProps,h.state=t.memoizedState,h.componentWillUnmount()}catch(v){Ne(r,n,v)}}break;case 5:Eo(d,d.return);break;case 22:if(d.memoizedState!==null){g0(f);continue}}p!==null?(p.return=d,W=p):g0(f)}c=c.sibling}e:for(c=null,f=e;;){if(f.tag===5){if(c===null){c=f;try{i=f.stateNode,u?(o=i.style,typeof o.setProperty=="function"?o.setProperty("display","none","important"):o.display="none"):(s=f.stateNode,l=f.memoizedProps.style,a=l!=null&&l.hasOwnProperty("display")?l.display:null,s.style.display=Ib("display",a))}catch(v){Ne(e,e.return,v)}}}else if(f.tag===6){if(c===null)try{f.stateNode.nodeValue=u?"":f.memoizedProps}catch(v){Ne(e,e.return,v)}}else if((f.tag!==22&&f.tag!==23||f.memoizedState===null||f===e)&&f.child!==null){f.child.return=f,f=f.child;continue}if(f===e)break e;for(;f.sibling===null;){if(f.return===null||f.return===e)break e;c===f&&(c=null),f=f.return}c===f&&(c=null),f.sibling.return=f.return,f=f.sibling}}break;case 19:yn(t,e),Nn(e),r&4&&m0(e);break;case 21:break;default:yn(t,e),Nn(e)}}function Nn(e){var t=e.flags;if(t&2){try{e:{for(var n=e.return;n!==null;){if(aP(n)){var r=n;break e}n=n.return}throw Error(F(160))}switch(r.tag){case 5:var i=r.stateNode;r.flags&32&&(rs(i,""),r.flags&=-33);var o=h0(e);Qp(e,o,i);break;case 3:case 4:var a=r.stateNode.containerInfo,s=h0(e);Zp(e,s,a);break;default:throw Error(F(161))}}catch(l){Ne(e,e.return,l)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function QM(e,t,n){W=e,uP(e)}function uP(e,t,n){for(var r=(e.mode&1)!==0;W!==null;){var i=W,o=i.child;if(i.tag===22&&r){var a=i.memoizedState!==null||Ml;if(!a){var s=i.alternate,l=s!==null&&s.memoizedState!==null||xt;s=Ml;var u=xt;if(Ml=a,(xt=l)&&!u)for(W=i;W!==null;)a=W,l=a.child,a.tag===22&&a.memoizedState!==null?y0(i):l!==null?(l.return=a,W=l):y0(i);for(;o!==null;)W=o,uP(o),o=o.sibling;W=i,Ml=s,xt=u}v0(e)}else i.subtreeFlags&8772&&o!==null?(o.return=i,W=o):v0(e)}}function v0(e){for(;W!==null;){var t=W;if(t.flags&8772){var n=t.alternate;try{if(t.flags&8772)switch(t.tag){case 0:case 11:case 15:xt||ef(5,t);break;case 1:var r=t.stateNode;if(t.flags&4&&!xt)if(n===null)r.componentDidMount();else{var i=t.elementType===t.type?n.memoizedProps:xn(t.type,n.memoizedProps);r.componentDidUpdate(i,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var o=t.updateQueue;o!==null&&e0(t,o,r);break;case 3:var a=t.updateQueue;if(a!==null){if(n=null,t.child!==null)switch(t.child.tag){case 5:n=t.child.stateNode;break;case 1:n=t.child.stateNode}e0(t,a,n)}break;case 5:var s=t.stateNode;if(n===null&&t.flags&4){n=s;var l=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":l.autoFocus&&n.focus();break;case"img":l.src&&(n.src=l.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(t.memoizedState===null){var u=t.alternate;if(u!==null){var c=u.memoizedState;if(c!==null){var f=c.dehydrated;f!==null&&ss(f)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(F(163))}xt||t.flags&512&&Xp(t)}catch(d){Ne(t,t.return,d)}}if(t===e){W=null;break}if(n=t.sibling,n!==null){n.return=t.return,W=n;break}W=t.return}}function g0(e){for(;W!==null;){var t=W;if(t===e){W=null;break}var n=t.sibling;if(n!==null){n.return=t.return,W=n;break}W=t.return}}function y0(e){for(;W!==null;){var t=W;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{ef(4,t)}catch(l){Ne(t,n,l)}break;case 1:var r=t.stateNode;if(typeof r.componentDidMount=="function"){var i=t.return;try{r.componentDidMount()}catch(l){Ne(t,i,l)}}var o=t.return;try{Xp(t)}catch(l){Ne(t,o,l)}break;case 5:var a=t.return;try{Xp(t)}catch(l){Ne(t,a,l)}}}catch(l){Ne(t,t.return,l)}if(t===e){W=null;break}var s=t.sibling;if(s!==null){s.return=t.return,W=s;break}W=t.return}}var JM=Math.ceil,Wu=Cr.ReactCurrentDispatcher,Xm=Cr.ReactCurrentOwner,fn=Cr.ReactCurrentBatchConfig,ue=0,rt=null,ze=null,ct=0,Ut=0,ko=hi(0),We=0,ys=null,Ui=0,tf=0,Zm=0,Ja=null,Mt=null,Qm=0,Wo=1/0,tr=null,Yu=!1,Jp=null,ei=null,Tl=!1,Yr=null,qu=0,es=0,eh=null,pu=-1,hu=0;function Et(){return ue&6?Re():pu!==-1?pu:pu=Re()}function ti(e){return e.mode&1?ue&2&&ct!==0?ct&-ct:DM.transition!==null?(hu===0&&(hu=Yb()),hu):(e=he,e!==0||(e=window.event,e=e===void 0?16:eS(e.type)),e):1}function Cn(e,t,n,r){if(50<es)throw es=0,eh=null,Error(F(185));Fs(e,n,r),(!(ue&2)||e!==rt)&&(e===rt&&(!(ue&2)&&(tf|=n),We===4&&Hr(e,ct)),Dt(e,r),n===1&&ue===0&&!(t.mode&1)&&(Wo=Re()+500,Zc&&mi()))}function Dt(e,t){var n=e.callbackNode;Dj(e,t);var r=Mu(e,e===rt?ct:0);if(r===0)n!==null&&Cy(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(n!=null&&Cy(n),t===1)e.tag===0?NM(x0.bind(null,e)):xS(x0.bind(null,e)),MM(function(){!(ue&6)&&mi()}),n=null;else{switch(qb(r)){case 1:n=Om;break;case 4:n=Kb;break;case 16:n=ju;break;case 536870912:n=Wb;break;default:n=ju}n=gP(n,cP.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function cP(e,t){if(pu=-1,hu=0,ue&6)throw Error(F(327));var n=e.callbackNode;if(No()&&e.callbackNode!==n)return null;var r=Mu(e,e===rt?ct:0);if(r===0)return null;if(r&30||r&e.expiredLanes||t)t=Gu(e,r);else{t=r;var i=ue;ue|=2;var o=dP();(rt!==e||ct!==t)&&(tr=null,Wo=Re()+500,$i(e,t));do try{nT();break}catch(s){fP(e,s)}while(1);Rm(),Wu.current=o,ue=i,ze!==null?t=0:(rt=null,ct=0,t=We)}if(t!==0){if(t===2&&(i=Cp(e),i!==0&&(r=i,t=th(e,i))),t===1)throw n=ys,$i(e,0),Hr(e,r),Dt(e,Re()),n;if(t===6)Hr(e,r);else{if(i=e.current.alternate,!(r&30)&&!eT(i)&&(t=Gu(e,r),t===2&&(o=Cp(e),o!==0&&(r=o,t=th(e,o))),t===1))throw n=ys,$i(e,0),Hr(e,r),Dt(e,Re()),n;switch(e.finishedWork=i,e.finishedLanes=r,t){case 0:case 1:throw Error(F(345));case 2:Si(e,Mt,tr);break;case 3:if(Hr(e,r),(r&130023424)===r&&(t=Qm+500-Re(),10<t)){if(Mu(e,0)!==0)break;if(i=e.suspendedLanes,(i&r)!==r){Et(),e.pingedLanes|=e.suspendedLanes&i;break}e.timeoutHandle=Np(Si.bind(null,e,Mt,tr),t);break}Si(e,Mt,tr);break;case 4:if(Hr(e,r),(r&4194240)===r)break;for(t=e.eventTimes,i=-1;0<r;){var a=31-kn(r);o=1<<a,a=t[a],a>i&&(i=a),r&=~o}if(r=i,r=Re()-r,r=(120>r?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*JM(r/1960))-r,10<r){e.timeoutHandle=Np(Si.bind(null,e,Mt,tr),r);break}Si(e,Mt,tr);break;case 5:Si(e,Mt,tr);break;default:throw Error(F(329))}}}return Dt(e,Re()),e.callbackNode===n?cP.bind(null,e):null}function th(e,t){var n=Ja;return e.current.memoizedState.isDehydrated&&($i(e,t).flags|=256),e=Gu(e,t),e!==2&&(t=Mt,Mt=n,t!==null&&nh(t)),e}function nh(e){Mt===null?Mt=e:Mt.push.apply(Mt,e)}function eT(e){for(var t=e;;){if(t.flags&16384){var n=t.updateQueue;if(n!==null&&(n=n.stores,n!==null))for(var r=0;r<n.length;r++){var i=n[r],o=i.getSnapshot;i=i.value;try{if(!An(o(),i))return!1}catch{return!1}}}if(n=t.child,t.subtreeFlags&16384&&n!==null)n.return=t,t=n;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function Hr(e,t){for(t&=~Zm,t&=~tf,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-kn(t),r=1<<n;e[n]=-1,t&=~r}}function x0(e){if(ue&6)throw Error(F(327));No();var t=Mu(e,0);if(!(t&1))return Dt(e,Re()),null;var n=Gu(e,t);if(e.tag!==0&&n===2){var r=Cp(e);r!==0&&(t=r,n=th(e,r))}if(n===1)throw n=ys,$i(e,0),Hr(e,t),Dt(e,Re()),n;if(n===6)throw Error(F(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,Si(e,Mt,tr),Dt(e,Re()),null}function Jm(e,t){var n=ue;ue|=1;try{return e(t)}finally{ue=n,ue===0&&(Wo=Re()+500,Zc&&mi())}}function Vi(e){Yr!==null&&Yr.tag===0&&!(ue&6)&&No();var t=ue;ue|=1;var n=fn.transition,r=he;try{if(fn.transition=null,he=1,e)return e()}finally{he=r,fn.transition=n,ue=t,!(ue&6)&&mi()}}function ev(){Ut=ko.current,ke(ko)}function $i(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(n!==-1&&(e.timeoutHandle=-1,jM(n)),ze!==null)for(n=ze.return;n!==null;){var r=n;switch(Im(r),r.tag){case 1:r=r.type.childContextTypes,r!=null&&Du();break;case 3:Ho(),ke(It),ke(bt),Vm();break;case 5:Um(r);break;case 4:Ho();break;case 13:ke(Me);break;case 19:ke(Me);break;case 10:Lm(r.type._context);break;case 22:case 23:ev()}n=n.return}if(rt=e,ze=e=ni(e.current,null),ct=Ut=t,We=0,ys=null,Zm=tf=Ui=0,Mt=Ja=null,Ci!==null){for(t=0;t<Ci.length;t++)if(n=Ci[t],r=n.interleaved,r!==null){n.interleaved=null;var i=r.next,o=n.pending;if(o!==null){var a=o.next;o.next=i,r.next=a}n.pending=r}Ci=null}return e}function fP(e,t){do{var n=ze;try{if(Rm(),cu.current=Ku,Hu){for(var r=Te.memoizedState;r!==null;){var i=r.queue;i!==null&&(i.pending=null),r=r.next}Hu=!1}if(Bi=0,nt=He=Te=null,Za=!1,ms=0,Xm.current=null,n===null||n.return===null){We=1,ys=t,ze=null;break}e:{var o=e,a=n.return,s=n,l=t;if(t=ct,s.flags|=32768,l!==null&&typeof l=="object"&&typeof l.then=="function"){var u=l,c=s,f=c.tag;if(!(c.mode&1)&&(f===0||f===11||f===15)){var d=c.alternate;d?(c.updateQueue=d.updateQueue,c.memoizedState=d.memoizedState,c.lanes=d.lanes):(c.updateQueue=null,c.memoizedState=null)}var p=a0(a);if(p!==null){p.flags&=-257,s0(p,a,s,o,t),p.mode&1&&o0(o,u,t),t=p,l=u;var h=t.updateQueue;if(h===null){var v=new Set;v.add(l),t.updateQueue=v}else h.add(l);break e}else{if(!(t&1)){o0(o,u,t),tv();break e}l=Error(F(426))}}else if(_e&&s.mode&1){var y=a0(a);if(y!==null){!(y.flags&65536)&&(y.flags|=256),s0(y,a,s,o,t),Nm(Ko(l,s));break e}}o=l=Ko(l,s),We!==4&&(We=2),Ja===null?Ja=[o]:Ja.push(o),o=a;do{switch(o.tag){case 3:o.flags|=65536,t&=-t,o.lanes|=t;var g=qS(o,l,t);Jy(o,g);break e;case 1:s=l;var x=o.type,w=o.stateNode;if(!(o.flags&128)&&(typeof x.getDerivedStateFromError=="function"||w!==null&&typeof w.componentDidCatch=="function"&&(ei===null||!ei.has(w)))){o.flags|=65536,t&=-t,o.lanes|=t;var S=GS(o,s,t);Jy(o,S);break e}}o=o.return}while(o!==null)}hP(n)}catch(P){t=P,ze===n&&n!==null&&(ze=n=n.return);continue}break}while(1)}function dP(){var e=Wu.current;return Wu.current=Ku,e===null?Ku:e}function tv(){(We===0||We===3||We===2)&&(We=4),rt===null||!(Ui&268435455)&&!(tf&268435455)||Hr(rt,ct)}function Gu(e,t){var n=ue;ue|=2;var r=dP();(rt!==e||ct!==t)&&(tr=null,$i(e,t));do try{tT();break}catch(i){fP(e,i)}while(1);if(Rm(),ue=n,Wu.current=r,ze!==null)throw Error(F(261));return rt=null,ct=0,We}function tT(){for(;ze!==null;)pP(ze)}function nT(){for(;ze!==null&&!Cj();)pP(ze)}function pP(e){var t=vP(e.alternate,e,Ut);e.memoizedProps=e.pendingProps,t===null?hP(e):ze=t,Xm.current=null}function hP(e){var t=e;do{var n=t.alternate;if(e=t.return,t.flags&32768){if(n=GM(n,t),n!==null){n.flags&=32767,ze=n;return}if(e!==null)e.flags|=32768,e.subtreeFlags=0,e.deletions=null;else{We=6,ze=null;return}}else if(n=qM(n,t,Ut),n!==null){ze=n;return}if(t=t.sibling,t!==null){ze=t;return}ze=t=e}while(t!==null);We===0&&(We=5)}function Si(e,t,n){var r=he,i=fn.transition;try{fn.transition=null,he=1,rT(e,t,n,r)}finally{fn.transition=i,he=r}return null}function rT(e,t,n,r){do No();while(Yr!==null);if(ue&6)throw Error(F(327));n=e.finishedWork;var i=e.finishedLanes;if(n===null)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(F(177));e.callbackNode=null,e.callbackPriority=0;var o=n.lanes|n.childLanes;if(Rj(e,o),e===rt&&(ze=rt=null,ct=0),!(n.subtreeFlags&2064)&&!(n.flags&2064)||Tl||(Tl=!0,gP(ju,function(){return No(),null})),o=(n.flags&15990)!==0,n.subtreeFlags&15990||o){o=fn.transition,fn.transition=null;var a=he;he=1;var s=ue;ue|=4,Xm.current=null,ZM(e,n),lP(n,e),PM($p),Tu=!!Tp,$p=Tp=null,e.current=n,QM(n),_j(),ue=s,he=a,fn.transition=o}else e.current=n;if(Tl&&(Tl=!1,Yr=e,qu=i),o=e.pendingLanes,o===0&&(ei=null),Mj(n.stateNode),Dt(e,Re()),t!==null)for(r=e.onRecoverableError,n=0;n<t.length;n++)i=t[n],r(i.value,{componentStack:i.stack,digest:i.digest});if(Yu)throw Yu=!1,e=Jp,Jp=null,e;return qu&1&&e.tag!==0&&No(),o=e.pendingLanes,o&1?e===eh?es++:(es=0,eh=e):es=0,mi(),null}function No(){if(Yr!==null){var e=qb(qu),t=fn.transition,n=he;try{if(fn.transition=null,he=16>e?16:e,Yr===null)var r=!1;else{if(e=Yr,Yr=null,qu=0,ue&6)throw Error(F(331));var i=ue;for(ue|=4,W=e.current;W!==null;){var o=W,a=o.child;if(W.flags&16){var s=o.deletions;if(s!==null){for(var l=0;l<s.length;l++){var u=s[l];for(W=u;W!==null;){var c=W;switch(c.tag){case 0:case 11:case 15:Qa(8,c,o)}var f=c.child;if(f!==null)f.return=c,W=f;else for(;W!==null;){c=W;var d=c.sibling,p=c.return;if(oP(c),c===u){W=null;break}if(d!==null){d.return=p,W=d;break}W=p}}}var h=o.alternate;if(h!==null){var v=h.child;if(v!==null){h.child=null;do{var y=v.sibling;v.sibling=null,v=y}while(v!==null)}}W=o}}if(o.subtreeFlags&2064&&a!==null)a.return=o,W=a;else e:for(;W!==null;){if(o=W,o.flags&2048)switch(o.tag){case 0:case 11:case 15:Qa(9,o,o.return)}var g=o.sibling;if(g!==null){g.return=o.return,W=g;break e}W=o.return}}var x=e.current;for(W=x;W!==null;){a=W;var w=a.child;if(a.subtreeFlags&2064&&w!==null)w.return=a,W=w;else e:for(a=x;W!==null;){if(s=W,s.flags&2048)try{switch(s.tag){case 0:case 11:case 15:ef(9,s)}}catch(P){Ne(s,s.return,P)}if(s===a){W=null;break e}var S=s.sibling;if(S!==null){S.return=s.return,W=S;break e}W=s.return}}if(ue=i,mi(),Un&&typeof Un.onPostCommitFiberRoot=="function")try{Un.onPostCommitFiberRoot(Wc,e)}catch{}r=!0}return r}finally{he=n,fn.transition=t}}return!1}function w0(e,t,n){t=Ko(n,t),t=qS(e,t,1),e=Jr(e,t,1),t=Et(),e!==null&&(Fs(e,1,t),Dt(e,t))}function Ne(e,t,n){if(e.tag===3)w0(e,e,n);else for(;t!==null;){if(t.tag===3){w0(t,e,n);break}else if(t.tag===1){var r=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof r.componentDidCatch=="function"&&(ei===null||!ei.has(r))){e=Ko(n,e),e=GS(t,e,1),t=Jr(t,e,1),e=Et(),t!==null&&(Fs(t,1,e),Dt(t,e));break}}t=t.return}}function iT(e,t,n){var r=e.pingCache;r!==null&&r.delete(t),t=Et(),e.pingedLanes|=e.suspendedLanes&n,rt===e&&(ct&n)===n&&(We===4||We===3&&(ct&130023424)===ct&&500>Re()-Qm?$i(e,0):Zm|=n),Dt(e,t)}function mP(e,t){t===0&&(e.mode&1?(t=Sl,Sl<<=1,!(Sl&130023424)&&(Sl=4194304)):t=1);var n=Et();e=vr(e,t),e!==null&&(Fs(e,t,n),Dt(e,n))}function oT(e){var t=e.memoizedState,n=0;t!==null&&(n=t.retryLane),mP(e,n)}function aT(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,i=e.memoizedState;i!==null&&(n=i.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(F(314))}r!==null&&r.delete(t),mP(e,n)}var vP;vP=function(e,t,n){if(e!==null)if(e.memoizedProps!==t.pendingProps||It.current)Tt=!0;else{if(!(e.lanes&n)&&!(t.flags&128))return Tt=!1,YM(e,t,n);Tt=!!(e.flags&131072)}else Tt=!1,_e&&t.flags&1048576&&wS(t,zu,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;du(e,t),e=t.pendingProps;var i=Bo(t,bt.current);Io(t,n),i=Km(null,t,r,e,i,n);var o=Wm();return t.flags|=1,typeof i=="object"&&i!==null&&typeof i.render=="function"&&i.$$typeof===void 0?(t.tag=1,t.memoizedState=null,t.updateQueue=null,Nt(r)?(o=!0,Ru(t)):o=!1,t.memoizedState=i.state!==null&&i.state!==void 0?i.state:null,Fm(t),i.updater=Jc,t.stateNode=i,i._reactInternals=t,Up(t,r,e,n),t=Kp(null,t,r,!0,o,n)):(t.tag=0,_e&&o&&$m(t),Pt(null,t,i,n),t=t.child),t;case 16:r=t.elementType;e:{switch(du(e,t),e=t.pendingProps,i=r._init,r=i(r._payload),t.type=r,i=t.tag=lT(r),e=xn(r,e),i){case 0:t=Hp(null,t,r,e,n);break e;case 1:t=c0(null,t,r,e,n);break e;case 11:t=l0(null,t,r,e,n);break e;case 14:t=u0(null,t,r,xn(r.type,e),n);break e}throw Error(F(306,r,""))}return t;case 0:return r=t.type,i=t.pendingProps,i=t.elementType===r?i:xn(r,i),Hp(e,t,r,i,n);case 1:return r=t.type,i=t.pendingProps,i=t.elementType===r?i:xn(r,i),c0(e,t,r,i,n);case 3:e:{if(JS(t),e===null)throw Error(F(387));r=t.pendingProps,o=t.memoizedState,i=o.element,kS(e,t),Uu(t,r,null,n);var a=t.memoizedState;if(r=a.element,o.isDehydrated)if(o={element:r,isDehydrated:!1,cache:a.cache,pendingSuspenseBoundaries:a.pendingSuspenseBoundaries,transitions:a.transitions},t.updateQueue.baseState=o,t.memoizedState=o,t.flags&256){i=Ko(Error(F(423)),t),t=f0(e,t,r,n,i);break e}else if(r!==i){i=Ko(Error(F(424)),t),t=f0(e,t,r,n,i);break e}else for(Wt=Qr(t.stateNode.containerInfo.firstChild),qt=t,_e=!0,Sn=null,n=OS(t,null,r,n),t.child=n;n;)n.flags=n.flags&-3|4096,n=n.sibling;else{if(Uo(),r===i){t=gr(e,t,n);break e}Pt(e,t,r,n)}t=t.child}return t;case 5:return CS(t),e===null&&zp(t),r=t.type,i=t.pendingProps,o=e!==null?e.memoizedProps:null,a=i.children,Ip(r,i)?a=null:o!==null&&Ip(r,o)&&(t.flags|=32),QS(e,t),Pt(e,t,a,n),t.child;case 6:return e===null&&zp(t),null;case 13:return eP(e,t,n);case 4:return Bm(t,t.stateNode.containerInfo),r=t.pendingProps,e===null?t.child=Vo(t,null,r,n):Pt(e,t,r,n),t.child;case 11:return r=t.type,i=t.pendingProps,i=t.elementType===r?i:xn(r,i),l0(e,t,r,i,n);case 7:return Pt(e,t,t.pendingProps,n),t.child;case 8:return Pt(e,t,t.pendingProps.children,n),t.child;case 12:return Pt(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,i=t.pendingProps,o=t.memoizedProps,a=i.value,we(Fu,r._currentValue),r._currentValue=a,o!==null)if(An(o.value,a)){if(o.children===i.children&&!It.current){t=gr(e,t,n);break e}}else for(o=t.child,o!==null&&(o.return=t);o!==null;){var s=o.dependencies;if(s!==null){a=o.child;for(var l=s.firstContext;l!==null;){if(l.context===r){if(o.tag===1){l=fr(-1,n&-n),l.tag=2;var u=o.updateQueue;if(u!==null){u=u.shared;var c=u.pending;c===null?l.next=l:(l.next=c.next,c.next=l),u.pending=l}}o.lanes|=n,l=o.alternate,l!==null&&(l.lanes|=n),Fp(o.return,n,t),s.lanes|=n;break}l=l.next}}else if(o.tag===10)a=o.type===t.type?null:o.child;else if(o.tag===18){if(a=o.return,a===null)throw Error(F(341));a.lanes|=n,s=a.alternate,s!==null&&(s.lanes|=n),Fp(a,n,t),a=o.sibling}else a=o.child;if(a!==null)a.return=o;else for(a=o;a!==null;){if(a===t){a=null;break}if(o=a.sibling,o!==null){o.return=a.return,a=o;break}a=a.return}o=a}Pt(e,t,i.children,n),t=t.child}return t;case 9:return i=t.type,r=t.pendingProps.children,Io(t,n),i=dn(i),r=r(i),t.flags|=1,Pt(e,t,r,n),t.child;case 14:return r=t.type,i=xn(r,t.pendingProps),i=xn(r.type,i),u0(e,t,r,i,n);case 15:return XS(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,i=t.pendingProps,i=t.elementType===r?i:xn(r,i),du(e,t),t.tag=1,Nt(r)?(e=!0,Ru(t)):e=!1,Io(t,n),YS(t,r,i),Up(t,r,i,n),Kp(null,t,r,!0,e,n);case 19:return tP(e,t,n);case 22:return ZS(e,t,n)}throw Error(F(156,t.tag))};function gP(e,t){return Hb(e,t)}function sT(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function ln(e,t,n,r){return new sT(e,t,n,r)}function nv(e){return e=e.prototype,!(!e||!e.isReactComponent)}function lT(e){if(typeof e=="function")return nv(e)?1:0;if(e!=null){if(e=e.$$typeof,e===bm)return 11;if(e===Sm)return 14}return 2}function ni(e,t){var n=e.alternate;return n===null?(n=ln(e.tag,t,e.key,e.mode),n.elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=e.flags&14680064,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function mu(e,t,n,r,i,o){var a=2;if(r=e,typeof e=="function")nv(e)&&(a=1);else if(typeof e=="string")a=5;else e:switch(e){case vo:return Ii(n.children,i,o,t);case wm:a=8,i|=8;break;case dp:return e=ln(12,n,t,i|2),e.elementType=dp,e.lanes=o,e;case pp:return e=ln(13,n,t,i),e.elementType=pp,e.lanes=o,e;case hp:return e=ln(19,n,t,i),e.elementType=hp,e.lanes=o,e;case Cb:return nf(n,i,o,t);default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case Eb:a=10;break e;case kb:a=9;break e;case bm:a=11;break e;case Sm:a=14;break e;case zr:a=16,r=null;break e}throw Error(F(130,e==null?e:typeof e,""))}return t=ln(a,n,t,i),t.elementType=e,t.type=r,t.lanes=o,t}function Ii(e,t,n,r){return e=ln(7,e,r,t),e.lanes=n,e}function nf(e,t,n,r){return e=ln(22,e,r,t),e.elementType=Cb,e.lanes=n,e.stateNode={isHidden:!1},e}function Td(e,t,n){return e=ln(6,e,null,t),e.lanes=n,e}function $d(e,t,n){return t=ln(4,e.children!==null?e.children:[],e.key,t),t.lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function uT(e,t,n,r,i){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=pd(0),this.expirationTimes=pd(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=pd(0),this.identifierPrefix=r,this.onRecoverableError=i,this.mutableSourceEagerHydrationData=null}function rv(e,t,n,r,i,o,a,s,l){return e=new uT(e,t,n,s,l),t===1?(t=1,o===!0&&(t|=8)):t=0,o=ln(3,null,null,t),e.current=o,o.stateNode=e,o.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},Fm(o),e}function cT(e,t,n){var r=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:mo,key:r==null?null:""+r,children:e,containerInfo:t,implementation:n}}function yP(e){if(!e)return ai;e=e._reactInternals;e:{if(Ji(e)!==e||e.tag!==1)throw Error(F(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(Nt(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(t!==null);throw Error(F(171))}if(e.tag===1){var n=e.type;if(Nt(n))return yS(e,n,t)}return t}function xP(e,t,n,r,i,o,a,s,l){return e=rv(n,r,!0,e,i,o,a,s,l),e.context=yP(null),n=e.current,r=Et(),i=ti(n),o=fr(r,i),o.callback=t??null,Jr(n,o,i),e.current.lanes=i,Fs(e,i,r),Dt(e,r),e}function rf(e,t,n,r){var i=t.current,o=Et(),a=ti(i);return n=yP(n),t.context===null?t.context=n:t.pendingContext=n,t=fr(o,a),t.payload={element:e},r=r===void 0?null:r,r!==null&&(t.callback=r),e=Jr(i,t,a),e!==null&&(Cn(e,i,a,o),uu(e,i,a)),a}function Xu(e){if(e=e.current,!e.child)return null;switch(e.child.tag){case 5:return e.child.stateNode;default:return e.child.stateNode}}function b0(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var n=e.retryLane;e.retryLane=n!==0&&n<t?n:t}}function iv(e,t){b0(e,t),(e=e.alternate)&&b0(e,t)}function fT(){return null}var wP=typeof reportError=="function"?reportError:function(e){console.error(e)};function ov(e){this._internalRoot=e}of.prototype.render=ov.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(F(409));rf(e,t,null,null)};of.prototype.unmount=ov.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;Vi(function(){rf(null,e,null,null)}),t[mr]=null}};function of(e){this._internalRoot=e}of.prototype.unstable_scheduleHydration=function(e){if(e){var t=Zb();e={blockedOn:null,target:e,priority:t};for(var n=0;n<Vr.length&&t!==0&&t<Vr[n].priority;n++);Vr.splice(n,0,e),n===0&&Jb(e)}};function av(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function af(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11&&(e.nodeType!==8||e.nodeValue!==" react-mount-point-unstable "))}function S0(){}function dT(e,t,n,r,i){if(i){if(typeof r=="function"){var o=r;r=function(){var u=Xu(a);o.call(u)}}var a=xP(t,r,e,0,null,!1,!1,"",S0);return e._reactRootContainer=a,e[mr]=a.current,cs(e.nodeType===8?e.parentNode:e),Vi(),a}for(;i=e.lastChild;)e.removeChild(i);if(typeof r=="function"){var s=r;r=function(){var u=Xu(l);s.call(u)}}var l=rv(e,0,!1,null,null,!1,!1,"",S0);return e._reactRootContainer=l,e[mr]=l.current,cs(e.nodeType===8?e.parentNode:e),Vi(function(){rf(t,l,n,r)}),l}function sf(e,t,n,r,i){var o=n._reactRootContainer;if(o){var a=o;if(typeof i=="function"){var s=i;i=function(){var l=Xu(a);s.call(l)}}rf(t,a,e,i)}else a=dT(n,t,e,i,r);return Xu(a)}Gb=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=Fa(t.pendingLanes);n!==0&&(Em(t,n|1),Dt(t,Re()),!(ue&6)&&(Wo=Re()+500,mi()))}break;case 13:Vi(function(){var r=vr(e,1);if(r!==null){var i=Et();Cn(r,e,1,i)}}),iv(e,1)}};km=function(e){if(e.tag===13){var t=vr(e,134217728);if(t!==null){var n=Et();Cn(t,e,134217728,n)}iv(e,134217728)}};Xb=function(e){if(e.tag===13){var t=ti(e),n=vr(e,t);if(n!==null){var r=Et();Cn(n,e,t,r)}iv(e,t)}};Zb=function(){return he};Qb=function(e,t){var n=he;try{return he=e,t()}finally{he=n}};Op=function(e,t,n){switch(t){case"input":if(gp(e,n),t=n.name,n.type==="radio"&&t!=null){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var i=Xc(r);if(!i)throw Error(F(90));Ab(r),gp(r,i)}}}break;case"textarea":Mb(e,n);break;case"select":t=n.value,t!=null&&jo(e,!!n.multiple,t,!1)}};Lb=Jm;zb=Vi;var pT={usingClientEntryPoint:!1,Events:[Us,wo,Xc,Db,Rb,Jm]},Ca={findFiberByHostInstance:ki,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},hT={bundleType:Ca.bundleType,version:Ca.version,rendererPackageName:Ca.rendererPackageName,rendererConfig:Ca.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:Cr.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return e=Ub(e),e===null?null:e.stateNode},findFiberByHostInstance:Ca.findFiberByHostInstance||fT,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var $l=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!$l.isDisabled&&$l.supportsFiber)try{Wc=$l.inject(hT),Un=$l}catch{}}en.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=pT;en.createPortal=function(e,t){var n=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!av(t))throw Error(F(200));return cT(e,t,null,n)};en.createRoot=function(e,t){if(!av(e))throw Error(F(299));var n=!1,r="",i=wP;return t!=null&&(t.unstable_strictMode===!0&&(n=!0),t.identifierPrefix!==void 0&&(r=t.identifierPrefix),t.onRecoverableError!==void 0&&(i=t.onRecoverableError)),t=rv(e,1,!1,null,null,n,!1,r,i),e[mr]=t.current,cs(e.nodeType===8?e.parentNode:e),new ov(t)};en.findDOMNode=function(e){if(e==null)return null;if(e.nodeType===1)return e;var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(F(188)):(e=Object.keys(e).join(","),Error(F(268,e)));return e=Ub(t),e=e===null?null:e.stateNode,e};en.flushSync=function(e){return Vi(e)};en.hydrate=function(e,t,n){if(!af(t))throw Error(F(200));return sf(null,e,t,!0,n)};en.hydrateRoot=function(e,t,n){if(!av(e))throw Error(F(405));var r=n!=null&&n.hydratedSources||null,i=!1,o="",a=wP;if(n!=null&&(n.unstable_strictMode===!0&&(i=!0),n.identifierPrefix!==void 0&&(o=n.identifierPrefix),n.onRecoverableError!==void 0&&(a=n.onRecoverableError)),t=xP(t,null,e,1,n??null,i,!1,o,a),e[mr]=t.current,cs(e),r)for(e=0;e<r.length;e++)n=r[e],i=n._getVersion,i=i(n._source),t.mutableSourceEagerHydrationData==null?t.mutableSourceEagerHydrationData=[n,i]:t.mutableSourceEagerHydrationData.push(n,i);return new of(t)};en.render=function(e,t,n){if(!af(t))throw Error(F(200));return sf(null,e,t,!1,n)};en.unmountComponentAtNode=function(e){if(!af(e))throw Error(F(40));return e._reactRootContainer?(Vi(function(){sf(null,null,e,!1,function(){e._reactRootContainer=null,e[mr]=null})}),!0):!1};en.unstable_batchedUpdates=Jm;en.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!af(n))throw Error(F(200));if(e==null||e._reactInternals===void 0)throw Error(F(38));return sf(e,t,n,!1,r)};en.version="18.3.1-next-f1338f8080-20240426";function bP(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(bP)}catch(e){console.error(e)}}bP(),bb.exports=en;var ia=bb.exports;const mT=kr(ia);var P0=ia;cp.createRoot=P0.createRoot,cp.hydrateRoot=P0.hydrateRoot;const vT=({onLoginStart:e,onLoginComplete:t})=>{const[n,r]=m.useState(!1),i=()=>{n||(r(!0),e(),setTimeout(()=>{t()},1500))};return b.jsxs("div",{className:"absolute inset-0 flex items-center justify-center",children:[b.jsx("div",{className:"absolute inset-0",style:{backgroundImage:"url(/load.png)",backgroundSize:"cover",backgroundPosition:"center",backgroundRepeat:"no-repeat"}}),b.jsx("div",{className:"absolute inset-0",style:{backgroundColor:"#0B5B38",opacity:n?.8:0,transition:"opacity 1.5s ease-in-out"}}),b.jsx("button",{onClick:i,disabled:n,className:`relative z-10 flex items-center justify-center ${n?"cursor-default":"cursor-pointer hover:scale-105"}`,style:{backgroundColor:"transparent",border:"none",outline:"none",transition:"transform 0.3s ease-in-out"},children:b.jsx("svg",{width:"247",height:"247",viewBox:"0 0 247 247",fill:"none",xmlns:"http://www.w3.org/2000/svg",style:{width:"96px",height:"96px",transition:"fill 1.5s ease-in-out"},children:b.jsx("path",{d:"M247 179.322C247 81.51 160.056 0 64.714 0C39.026 0 21.242 17.537 21.242 39.767C21.242 62.491 39.52 78.052 63.726 80.275C116.337 85.215 158.08 127.946 158.08 156.845C158.08 166.972 153.387 172.9 144.495 172.9C118.313 172.9 113.373 123.5 61.75 123.5C27.417 123.5 0 150.917 0 185.25C0 220.077 28.158 247 62.491 247C114.114 247 119.301 197.6 144.989 197.6C171.912 197.6 172.159 230.945 206.986 231.439C232.18 231.686 247 213.161 247 179.322Z",fill:n?"#ffffff":"#0B5B38"})})})]})},SP="",PP=e=>{switch(e){case"Stress":return"tense";case"Entertainment":return"joy";case"Calm":return"calm";case"Meditation":return"calm";default:return"calm"}},eo=async()=>{try{const e=await fetch(`${SP}/api/state`,{cache:"no-cache"});return e.ok?await e.json():(console.warn("Backend API not available, using mock data"),null)}catch(e){return console.warn("Failed to fetch backend state:",e),null}},gT=async()=>{const e=await eo();return!e||!e.br||e.br.length===0?[]:e.br.map((t,n)=>({hour:0,minute:0,value:t,time:n.toString().padStart(2,"0"),timestamp:Date.now()-(e.br.length-n)*1e3}))},yT=async()=>{const e=await eo();if(!e||!e.sdnn||e.sdnn.length===0)return{value:50};const t=e.sdnn[e.sdnn.length-1],r=100-Math.min(200,Math.max(0,t))/200*100;return{value:Math.round(r)}},xT=async()=>{const e=await eo();if(!e||e.valence_score===null)return{value:50};const t=(e.valence_score+3)/6;return{value:Math.round(t*100)}},wT=async()=>{const e=await eo();if(!e||!e.lf_hf||e.lf_hf.length===0)return{value:1};const t=e.lf_hf[e.lf_hf.length-1];return{value:Math.round(t*10)/10}},bT=async()=>{const e=await eo();if(!e||e.arousal_score===null)return{value:50};const t=(e.arousal_score+3)/6;return{value:Math.round(t*100)}},ST=async()=>{try{const e=await fetch(`${SP}/api/special_mode`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({command:"enter_special_mode",timestamp:new Date().toISOString()})});return e.ok?await e.json():(console.warn("Failed to send special mode command"),{success:!1,message:"Request failed"})}catch(e){return console.error("Error sending special mode command:",e),{success:!1,message:"Network error"}}},OP={calm:{type:"calm",label:"平静",color:"#32CD32",image:"/calm_bg.png"},joy:{type:"joy",label:"开心",color:"#FFD700",image:"/joy_bg.png"},low:{type:"low",label:"低落",color:"#4169E1",image:"/low_bg.png"},tense:{type:"tense",label:"紧张",color:"#FF4500",image:"/tense_bg.png"}},gt=e=>{const t=new Date;return t.setDate(t.getDate()-e),t.toISOString().split("T")[0]},Il=(e,t=!1)=>{const n=["calm","joy","low","tense"];if(t)return Array.from({length:24},(r,i)=>({date:e,hour:i,emotion:n[Math.floor(Math.random()*n.length)]}));{const r=Math.floor(Math.random()*9)+8,i=new Set;for(;i.size<r;)i.add(Math.floor(Math.random()*24));return Array.from(i).sort((o,a)=>o-a).map(o=>({date:e,hour:o,emotion:n[Math.floor(Math.random()*n.length)]}))}},PT=()=>{const e=new Date;return e.setHours(e.getHours()-2),e.toISOString()},xs={id:"1",name:"Demo User",currentEmotion:"joy",currentEmotionTimestamp:PT(),weeklyEmotions:[{date:gt(6),emotion:"joy"},{date:gt(5),emotion:null},{date:gt(4),emotion:"calm"},{date:gt(3),emotion:null},{date:gt(2),emotion:"tense"},{date:gt(1),emotion:null},{date:gt(0),emotion:"joy"}],hourlyEmotions:{[gt(6)]:Il(gt(6),!1),[gt(4)]:Il(gt(4),!1),[gt(2)]:Il(gt(2),!1),[gt(0)]:Il(gt(0),!1)}},OT=async()=>{try{const e=await eo();if(e&&e.emotion_state)return{emotion:PP(e.emotion_state),timestamp:new Date().toISOString()}}catch(e){console.warn("Backend unavailable, using mock data:",e)}return await new Promise(e=>setTimeout(e,100)),{emotion:xs.currentEmotion,timestamp:xs.currentEmotionTimestamp}},ET=async()=>{await new Promise(e=>setTimeout(e,100));try{const e=await eo();if(e&&e.emotion_state){const t=gt(0),n=PP(e.emotion_state);return xs.weeklyEmotions.map(r=>r.date===t?{...r,emotion:n}:r)}}catch(e){console.warn("Backend unavailable for weekly emotions:",e)}return xs.weeklyEmotions},EP=async e=>(await new Promise(t=>setTimeout(t,100)),xs.hourlyEmotions[e]||[]),kT=()=>{const e=[];for(let t=1;t<=60;t++){const n=t,r=Date.now()-(60-t)*1e3,i=15,o=Math.sin(t*.1)*5+Math.cos(t*.15)*3+Math.random()*2-1,a=Math.max(3,Math.min(28,Math.round((i+o)*10)/10));e.push({hour:0,minute:0,value:a,time:n.toString().padStart(2,"0"),timestamp:r})}return e},CT=async()=>{try{const e=await gT();if(e&&e.length>0)return e}catch(e){console.warn("Backend unavailable for respiration data:",e)}return await new Promise(e=>setTimeout(e,100)),kT()},_T=async()=>{try{const e=await yT();if(e)return e}catch(e){console.warn("Backend unavailable for stress level:",e)}return await new Promise(e=>setTimeout(e,100)),{value:Math.floor(Math.random()*101)}},AT=async()=>{try{const e=await xT();if(e)return e}catch(e){console.warn("Backend unavailable for stress recovery:",e)}return await new Promise(e=>setTimeout(e,100)),{value:Math.floor(Math.random()*101)}},jT=async()=>{try{const e=await wT();if(e)return e}catch(e){console.warn("Backend unavailable for autonomic balance:",e)}return await new Promise(e=>setTimeout(e,100)),{value:Math.round((.1+Math.random()*4.9)*10)/10}},MT=async()=>{try{const e=await bT();if(e)return e}catch(e){console.warn("Backend unavailable for autonomic activity:",e)}return await new Promise(e=>setTimeout(e,100)),{value:Math.floor(Math.random()*101)}},TT=()=>{const e=[],t=new Date;for(let n=0;n<7;n++){const r=new Date(t);r.setDate(r.getDate()-n);const i=Math.floor(Math.random()*3)+1;for(let o=0;o<i;o++){const a=new Date(r);a.setHours(Math.floor(Math.random()*12)+8),a.setMinutes(Math.floor(Math.random()*60)),e.push({id:`${r.toISOString().split("T")[0]}-${o}`,duration:Math.floor(Math.random()*120)+30,score:Math.floor(Math.random()*30)+70,date:r.toISOString().split("T")[0],timestamp:a.toISOString()})}}return e.sort((n,r)=>new Date(r.timestamp).getTime()-new Date(n.timestamp).getTime())},$T=async()=>(await new Promise(e=>setTimeout(e,100)),TT()),IT=({emotion:e,timestamp:t,onDoubleClick:n})=>{const r=OP[e],i=a=>{const s=new Date(a),l=s.getHours().toString().padStart(2,"0"),u=s.getMinutes().toString().padStart(2,"0"),f=["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"][s.getMonth()],d=s.getDate();return`${l}:${u} ${f} ${d}`},o=async()=>{console.log("EmotionSphere double clicked, sending special mode command...");try{const a=await ST();console.log("Special mode command result:",a),n&&n()}catch(a){console.error("Failed to send special mode command:",a)}};return b.jsxs("div",{className:"relative w-full h-full flex items-center justify-center cursor-pointer",onDoubleClick:o,children:[b.jsx("img",{src:r.image,alt:r.label,className:"absolute inset-0 w-full h-full object-cover"}),b.jsxs("div",{className:"relative z-10 flex flex-col items-center justify-center",children:[b.jsx("div",{className:"text-3xl font-bold text-white drop-shadow-2xl mb-2",children:e}),t&&b.jsx("div",{className:"text-sm text-white drop-shadow-lg font-medium",children:i(t)})]})]})},kP=1179,CP=2556,lo=CP/kP,NT=()=>{const[e,t]=m.useState(()=>{const n=window.innerWidth,r=window.innerHeight;let i,o;return n*lo<=r?(i=n,o=i*lo):(o=r,i=o/lo),{width:Math.round(i),height:Math.round(o)}});return m.useEffect(()=>{const n=()=>{const r=window.innerWidth,i=window.innerHeight;let o,a;r*lo<=i?(o=r,a=o*lo):(a=i,o=a/lo),t({width:Math.round(o),height:Math.round(a)})};return n(),window.addEventListener("resize",n),()=>window.removeEventListener("resize",n)},[]),e},E=(e,t)=>e/kP*t,T=(e,t)=>e/CP*t,DT=({weeklyEmotions:e,selectedDate:t,onDateSelect:n,onSelectedPosition:r,onAtlasButtonClick:i,containerWidth:o=1179,containerHeight:a=2556})=>{const s=E(1069,o),l=T(911,a),u=E(55,o),c=E(33,o),f=E(16,o),d=E(5,o),p=E(6,o),h=E(35,o),v=`${d}px ${p}px ${h}px rgba(0, 0, 0, 0.13)`,y=E(236,o),g=T(69,a),x=E(28,o),w=T(27,a),S=E(53,o),P=E(161,o),O=T(47,a),k=E(66,o),j=T(40,a),M=E(36,o),A=T(42,a),C=E(77,o),_=T(43,a),N=E(36,o),L=T(42,a),V="#B5A6B0",B="#82797F",U=E(77,o),$={calm:"#8AD48A",joy:"#FFF2B2",low:"#CEDEF9",tense:"#FFD2D2"},z=T(196,a),K=T(255,a),X=T(341,a),re=E(58,o),Se=s-re*2,le=E(78,o),se=C*6+le,de=(Se-se)/6;let ne=re;const Z=[ne];ne+=C+de,Z.push(ne),ne+=C+de,Z.push(ne),ne+=C+de,Z.push(ne),ne+=le+de,Z.push(ne),ne+=C+de,Z.push(ne),ne+=C+de,Z.push(ne);const D=[C,C,C,E(78,o),C,C,C],H=E(70,o),q=T(34,a),R=E(38,o),G=["日","一","二","三","四","五","六"],ee=m.useRef({}),te=ye=>{const nn=new Date(ye);return G[nn.getDay()]},ce=ye=>new Date(ye).getDate(),ge=T(509,a),je=E(50,o),Ve=E(15,o),Ft=E(33,a),Bt=E(35.9,o),xi=`${Ve}px ${Ft}px ${Bt}px rgba(70, 70, 70, 0.11)`;return b.jsxs("div",{className:"flex flex-col relative",style:{width:`${s}px`,height:`${l}px`,left:`${u}px`,background:"#FBF7F9",borderRadius:`${c}px`,boxShadow:v,padding:`${f}px`,overflow:"hidden"},children:[b.jsx("div",{className:"absolute",style:{width:`${s}px`,height:`${ge}px`,left:`${-f}px`,top:`${-f}px`,background:"rgba(246, 237, 243, 0.47)",borderRadius:`${je}px`,boxShadow:xi,zIndex:1}}),b.jsx("div",{className:"absolute z-10",style:{width:`${y}px`,height:`${g}px`,left:`${x}px`,top:`${w}px`,background:"#DDCFD8",opacity:.8,borderRadius:`${S}px`}}),b.jsx("h2",{className:"absolute font-medium text-center z-10",style:{width:`${P}px`,height:`${O}px`,left:`${k}px`,top:`${j}px`,fontSize:`${M}px`,lineHeight:`${A}px`,color:"#FFFFFF",fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontWeight:500},children:"情绪日历"}),i&&b.jsx("button",{onClick:ye=>{ye.preventDefault(),ye.stopPropagation(),console.log("Atlas button clicked"),i()},className:"absolute cursor-pointer",style:{top:`${q}px`,right:`${R}px`,width:`${H}px`,height:`${H}px`,backgroundImage:"url(/emo_atlas.png)",backgroundSize:"cover",backgroundPosition:"center",backgroundRepeat:"no-repeat",border:"none",outline:"none",zIndex:50,pointerEvents:"auto"},"aria-label":"打开情绪图集"}),b.jsx("div",{className:"relative z-10",style:{width:"100%",height:"100%"},children:e.map((ye,nn)=>{const Ir=ye.emotion?OP[ye.emotion]:null,io=ye.date===t,oo=te(ye.date),ya=ce(ye.date),ao=Z[nn],dl=D[nn],pl=ye.emotion?$[ye.emotion]:void 0;return b.jsxs("div",{className:"absolute",children:[b.jsx("div",{className:"absolute text-center",style:{width:`${dl}px`,height:`${_}px`,left:`${ao}px`,top:`${z}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:500,fontSize:`${N}px`,lineHeight:`${L}px`,color:V},children:oo}),b.jsx("div",{className:"absolute text-center",style:{width:`${dl}px`,height:`${_}px`,left:`${ao}px`,top:`${K}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:500,fontSize:`${N}px`,lineHeight:`${L}px`,color:B},children:ya}),ye.emotion&&pl&&Ir?b.jsx("button",{ref:xa=>{ee.current[ye.date]=xa},onClick:()=>n(ye.date),className:"absolute rounded-full transition-all",style:{width:`${U}px`,height:`${U}px`,left:`${ao}px`,top:`${X}px`,backgroundColor:pl,border:"none",cursor:"pointer",transform:io?"scale(1.1)":"scale(1)",...io&&{boxShadow:"0 0 0 2px #3B82F6, 0 0 0 4px white"}},"aria-label":`${ye.date} - ${Ir.label}`}):b.jsx("div",{className:"absolute rounded-full",style:{width:`${U}px`,height:`${U}px`,left:`${ao}px`,top:`${X}px`,boxSizing:"border-box",opacity:.88,border:`2px dashed ${V}`,backgroundColor:"transparent"}})]},ye.date)})})]})},RT=({hourlyEmotions:e,containerWidth:t=1179,containerHeight:n=2556})=>{const r=E(1069,t),i=T(342,n),o=E(55,t),a=E(16,t),s=E(50,t),l=E(15,t),u=E(33,n),c=E(35.9,t),f=`${l}px ${u}px ${c}px rgba(70, 70, 70, 0.11)`,d="rgba(246, 237, 243, 0.47)",p=E(43,t),v=E(1031,t)-p,y=E(37,t),g=Math.round(y),x=g/2,w={joy:"#FFF2B2",tense:"#FFD2D2",calm:"#8AD48A",low:"#CEDEF9"},S=T(74,n),O=T(165,n)-S,k=g/10,j=g*4,M=k*3,C=(O-j-M)/2,_=g*1.5,N={joy:S+C+_,tense:S+C+_+g+k,calm:S+C+_+g*2+k*2,low:S+C+_+g*3+k*3},L=E(77,t),V=T(43,n),B=E(28,t),U=T(34,n),$="rgba(181, 166, 176, 0.9)",z=T(252,n),K=E(43,t),X=T(249,n),re=E(988,t),Se="#E3D7DF",le=E(2,t),se=E(221,t),de=T(64,n),ne="#E3D7DF",Z=E(2,t),D=new Map;e.forEach(G=>{G.hour!==void 0&&G.hour>=0&&G.hour<=23&&D.set(G.hour,G)});const H=G=>p+G/23*v,q={6:H(6),12:H(12),18:H(18)},R={0:H(0),6:H(6),12:H(12),18:H(18)};return b.jsxs("div",{className:"absolute",style:{width:`${r}px`,height:`${i}px`,left:`${o}px`,top:`${T(2110,n)-T(1541,n)}px`,padding:`${a}px`,background:d,borderRadius:`${s}px`,boxShadow:f,overflow:"visible",zIndex:1},children:[b.jsx("div",{className:"absolute",style:{width:`${re}px`,height:`${le}px`,left:`${K}px`,top:`${X}px`,background:Se}}),[6,12,18].map(G=>b.jsx("div",{className:"absolute",style:{width:`${Z}px`,height:`${se}px`,left:`${q[G]}px`,top:`${de}px`,borderLeft:`${Z}px dashed ${ne}`,background:"transparent"}},`vertical-line-${G}`)),Array.from({length:24},(G,ee)=>{const te=D.get(ee);if(!te||!te.emotion)return null;const ce=H(ee)-x,ge=N[te.emotion]-x,je=w[te.emotion]||"#CEDEF9";return b.jsx("div",{className:"absolute",style:{width:`${g}px`,height:`${g}px`,left:`${ce}px`,top:`${ge}px`,background:je,borderRadius:"50%",boxSizing:"border-box"}},ee)}),[0,6,12,18].map(G=>{const ee=R[G]+Z*4;return b.jsxs("div",{className:"absolute",style:{width:`${L}px`,height:`${V}px`,left:`${ee}px`,top:`${z}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:500,fontSize:`${B}px`,lineHeight:`${U}px`,color:$,whiteSpace:"nowrap",overflow:"visible",textAlign:"left"},children:[G,"时"]},`label-${G}`)})]})},O0=({onIconClick:e,onAvatarClick:t,containerWidth:n=1179,containerHeight:r=2556})=>{const i=E(151,n),o=T(167,r),a=E(64,n),s=E(320,n),l=T(84,r),u=T(213,r),c=E(430,n),f=E(52,n),d=E(151,n),p=T(167,r),h=E(965,n),v=E(56.37,n),y=T(50.82,r),g=E(4,n),x=E(35,n),w=`0px ${g}px ${x}px 0px #0000001F`,S=T(40,r);return b.jsxs("div",{className:"w-full flex items-center justify-between relative z-10",style:{paddingLeft:`${E(16,n)}px`,paddingRight:`${E(16,n)}px`,paddingTop:`${S}px`,paddingBottom:`${T(12,r)}px`},children:[b.jsx("button",{onClick:t,className:"absolute cursor-pointer",style:{background:"transparent",border:"none",outline:"none",width:`${i}px`,height:`${i}px`,top:`${o}px`,left:`${a}px`},children:b.jsx("img",{src:"/usr_photo.png",alt:"用户头像",className:"rounded-full object-cover",style:{width:"100%",height:"100%"}})}),b.jsx("div",{className:"absolute flex items-center justify-center",style:{width:`${s}px`,height:`${l}px`,top:`${u}px`,left:`${c}px`},children:b.jsx("h1",{className:"text-black text-center w-full",style:{fontFamily:'OPPO Sans, -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif',fontWeight:500,fontSize:`${f}px`},children:"我的情绪"})}),b.jsx("button",{onClick:e,className:"absolute cursor-pointer",style:{background:"white",border:"none",outline:"none",width:`${d}px`,height:`${d}px`,top:`${p}px`,left:`${h}px`,borderRadius:"50%",display:"flex",alignItems:"center",justifyContent:"center",boxShadow:w},children:b.jsx("img",{src:"/emo_icon.png",alt:"",className:"object-contain",style:{width:`${v}px`,height:`${y}px`}})})]})};function _P(e){var t,n,r="";if(typeof e=="string"||typeof e=="number")r+=e;else if(typeof e=="object")if(Array.isArray(e)){var i=e.length;for(t=0;t<i;t++)e[t]&&(n=_P(e[t]))&&(r&&(r+=" "),r+=n)}else for(n in e)e[n]&&(r&&(r+=" "),r+=n);return r}function ve(){for(var e,t,n=0,r="",i=arguments.length;n<i;n++)(e=arguments[n])&&(t=_P(e))&&(r&&(r+=" "),r+=t);return r}var LT=["dangerouslySetInnerHTML","onCopy","onCopyCapture","onCut","onCutCapture","onPaste","onPasteCapture","onCompositionEnd","onCompositionEndCapture","onCompositionStart","onCompositionStartCapture","onCompositionUpdate","onCompositionUpdateCapture","onFocus","onFocusCapture","onBlur","onBlurCapture","onChange","onChangeCapture","onBeforeInput","onBeforeInputCapture","onInput","onInputCapture","onReset","onResetCapture","onSubmit","onSubmitCapture","onInvalid","onInvalidCapture","onLoad","onLoadCapture","onError","onErrorCapture","onKeyDown","onKeyDownCapture","onKeyPress","onKeyPressCapture","onKeyUp","onKeyUpCapture","onAbort","onAbortCapture","onCanPlay","onCanPlayCapture","onCanPlayThrough","onCanPlayThroughCapture","onDurationChange","onDurationChangeCapture","onEmptied","onEmptiedCapture","onEncrypted","onEncryptedCapture","onEnded","onEndedCapture","onLoadedData","onLoadedDataCapture","onLoadedMetadata","onLoadedMetadataCapture","onLoadStart","onLoadStartCapture","onPause","onPauseCapture","onPlay","onPlayCapture","onPlaying","onPlayingCapture","onProgress","onProgressCapture","onRateChange","onRateChangeCapture","onSeeked","onSeekedCapture","onSeeking","onSeekingCapture","onStalled","onStalledCapture","onSuspend","onSuspendCapture","onTimeUpdate","onTimeUpdateCapture","onVolumeChange","onVolumeChangeCapture","onWaiting","onWaitingCapture","onAuxClick","onAuxClickCapture","onClick","onClickCapture","onContextMenu","onContextMenuCapture","onDoubleClick","onDoubleClickCapture","onDrag","onDragCapture","onDragEnd","onDragEndCapture","onDragEnter","onDragEnterCapture","onDragExit","onDragExitCapture","onDragLeave","onDragLeaveCapture","onDragOver","onDragOverCapture","onDragStart","onDragStartCapture","onDrop","onDropCapture","onMouseDown","onMouseDownCapture","onMouseEnter","onMouseLeave","onMouseMove","onMouseMoveCapture","onMouseOut","onMouseOutCapture","onMouseOver","onMouseOverCapture","onMouseUp","onMouseUpCapture","onSelect","onSelectCapture","onTouchCancel","onTouchCancelCapture","onTouchEnd","onTouchEndCapture","onTouchMove","onTouchMoveCapture","onTouchStart","onTouchStartCapture","onPointerDown","onPointerDownCapture","onPointerMove","onPointerMoveCapture","onPointerUp","onPointerUpCapture","onPointerCancel","onPointerCancelCapture","onPointerEnter","onPointerEnterCapture","onPointerLeave","onPointerLeaveCapture","onPointerOver","onPointerOverCapture","onPointerOut","onPointerOutCapture","onGotPointerCapture","onGotPointerCaptureCapture","onLostPointerCapture","onLostPointerCaptureCapture","onScroll","onScrollCapture","onWheel","onWheelCapture","onAnimationStart","onAnimationStartCapture","onAnimationEnd","onAnimationEndCapture","onAnimationIteration","onAnimationIterationCapture","onTransitionEnd","onTransitionEndCapture"];function sv(e){if(typeof e!="string")return!1;var t=LT;return t.includes(e)}var zT=["aria-activedescendant","aria-atomic","aria-autocomplete","aria-busy","aria-checked","aria-colcount","aria-colindex","aria-colspan","aria-controls","aria-current","aria-describedby","aria-details","aria-disabled","aria-errormessage","aria-expanded","aria-flowto","aria-haspopup","aria-hidden","aria-invalid","aria-keyshortcuts","aria-label","aria-labelledby","aria-level","aria-live","aria-modal","aria-multiline","aria-multiselectable","aria-orientation","aria-owns","aria-placeholder","aria-posinset","aria-pressed","aria-readonly","aria-relevant","aria-required","aria-roledescription","aria-rowcount","aria-rowindex","aria-rowspan","aria-selected","aria-setsize","aria-sort","aria-valuemax","aria-valuemin","aria-valuenow","aria-valuetext","className","color","height","id","lang","max","media","method","min","name","style","target","width","role","tabIndex","accentHeight","accumulate","additive","alignmentBaseline","allowReorder","alphabetic","amplitude","arabicForm","ascent","attributeName","attributeType","autoReverse","azimuth","baseFrequency","baselineShift","baseProfile","bbox","begin","bias","by","calcMode","capHeight","clip","clipPath","clipPathUnits","clipRule","colorInterpolation","colorInterpolationFilters","colorProfile","colorRendering","contentScriptType","contentStyleType","cursor","cx","cy","d","decelerate","descent","diffuseConstant","direction","display","divisor","dominantBaseline","dur","dx","dy","edgeMode","elevation","enableBackground","end","exponent","externalResourcesRequired","fill","fillOpacity","fillRule","filter","filterRes","filterUnits","floodColor","floodOpacity","focusable","fontFamily","fontSize","fontSizeAdjust","fontStretch","fontStyle","fontVariant","fontWeight","format","from","fx","fy","g1","g2","glyphName","glyphOrientationHorizontal","glyphOrientationVertical","glyphRef","gradientTransform","gradientUnits","hanging","horizAdvX","horizOriginX","href","ideographic","imageRendering","in2","in","intercept","k1","k2","k3","k4","k","kernelMatrix","kernelUnitLength","kerning","keyPoints","keySplines","keyTimes","lengthAdjust","letterSpacing","lightingColor","limitingConeAngle","local","markerEnd","markerHeight","markerMid","markerStart","markerUnits","markerWidth","mask","maskContentUnits","maskUnits","mathematical","mode","numOctaves","offset","opacity","operator","order","orient","orientation","origin","overflow","overlinePosition","overlineThickness","paintOrder","panose1","pathLength","patternContentUnits","patternTransform","patternUnits","pointerEvents","pointsAtX","pointsAtY","pointsAtZ","preserveAlpha","preserveAspectRatio","primitiveUnits","r","radius","refX","refY","renderingIntent","repeatCount","repeatDur","requiredExtensions","requiredFeatures","restart","result","rotate","rx","ry","seed","shapeRendering","slope","spacing","specularConstant","specularExponent","speed","spreadMethod","startOffset","stdDeviation","stemh","stemv","stitchTiles","stopColor","stopOpacity","strikethroughPosition","strikethroughThickness","string","stroke","strokeDasharray","strokeDashoffset","strokeLinecap","strokeLinejoin","strokeMiterlimit","strokeOpacity","strokeWidth","surfaceScale","systemLanguage","tableValues","targetX","targetY","textAnchor","textDecoration","textLength","textRendering","to","transform","u1","u2","underlinePosition","underlineThickness","unicode","unicodeBidi","unicodeRange","unitsPerEm","vAlphabetic","values","vectorEffect","version","vertAdvY","vertOriginX","vertOriginY","vHanging","vIdeographic","viewTarget","visibility","vMathematical","widths","wordSpacing","writingMode","x1","x2","x","xChannelSelector","xHeight","xlinkActuate","xlinkArcrole","xlinkHref","xlinkRole","xlinkShow","xlinkTitle","xlinkType","xmlBase","xmlLang","xmlns","xmlnsXlink","xmlSpace","y1","y2","y","yChannelSelector","z","zoomAndPan","ref","key","angle"],FT=new Set(zT);function AP(e){return typeof e!="string"?!1:FT.has(e)}function jP(e){return typeof e=="string"&&e.startsWith("data-")}function jn(e){if(typeof e!="object"||e===null)return{};var t={};for(var n in e)Object.prototype.hasOwnProperty.call(e,n)&&(AP(n)||jP(n))&&(t[n]=e[n]);return t}function lf(e){if(e==null)return null;if(m.isValidElement(e)&&typeof e.props=="object"&&e.props!==null){var t=e.props;return jn(t)}return typeof e=="object"&&!Array.isArray(e)?jn(e):null}function Rt(e){var t={};for(var n in e)Object.prototype.hasOwnProperty.call(e,n)&&(AP(n)||jP(n)||sv(n))&&(t[n]=e[n]);return t}function BT(e){return e==null?null:m.isValidElement(e)?Rt(e.props):typeof e=="object"&&!Array.isArray(e)?Rt(e):null}var UT=["children","width","height","viewBox","className","style","title","desc"];function rh(){return rh=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},rh.apply(null,arguments)}function VT(e,t){if(e==null)return{};var n,r,i=HT(e,t);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);for(r=0;r<o.length;r++)n=o[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function HT(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var MP=m.forwardRef((e,t)=>{var{children:n,width:r,height:i,viewBox:o,className:a,style:s,title:l,desc:u}=e,c=VT(e,UT),f=o||{width:r,height:i,x:0,y:0},d=ve("recharts-surface",a);return m.createElement("svg",rh({},Rt(c),{className:d,width:r,height:i,style:s,viewBox:"".concat(f.x," ").concat(f.y," ").concat(f.width," ").concat(f.height),ref:t}),m.createElement("title",null,l),m.createElement("desc",null,u),n)}),KT=["children","className"];function ih(){return ih=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},ih.apply(null,arguments)}function WT(e,t){if(e==null)return{};var n,r,i=YT(e,t);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);for(r=0;r<o.length;r++)n=o[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function YT(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var hn=m.forwardRef((e,t)=>{var{children:n,className:r}=e,i=WT(e,KT),o=ve("recharts-layer",r);return m.createElement("g",ih({className:o},Rt(i),{ref:t}),n)}),qT=m.createContext(null);function Ie(e){return function(){return e}}const oh=Math.PI,ah=2*oh,Pi=1e-6,GT=ah-Pi;function TP(e){this._+=e[0];for(let t=1,n=e.length;t<n;++t)this._+=arguments[t]+e[t]}function XT(e){let t=Math.floor(e);if(!(t>=0))throw new Error(`invalid digits: ${e}`);if(t>15)return TP;const n=10**t;return function(r){this._+=r[0];for(let i=1,o=r.length;i<o;++i)this._+=Math.round(arguments[i]*n)/n+r[i]}}class ZT{constructor(t){this._x0=this._y0=this._x1=this._y1=null,this._="",this._append=t==null?TP:XT(t)}moveTo(t,n){this._append`M${this._x0=this._x1=+t},${this._y0=this._y1=+n}`}closePath(){this._x1!==null&&(this._x1=this._x0,this._y1=this._y0,this._append`Z`)}lineTo(t,n){this._append`L${this._x1=+t},${this._y1=+n}`}quadraticCurveTo(t,n,r,i){this._append`Q${+t},${+n},${this._x1=+r},${this._y1=+i}`}bezierCurveTo(t,n,r,i,o,a){this._append`C${+t},${+n},${+r},${+i},${this._x1=+o},${this._y1=+a}`}arcTo(t,n,r,i,o){if(t=+t,n=+n,r=+r,i=+i,o=+o,o<0)throw new Error(`negative radius: ${o}`);let a=this._x1,s=this._y1,l=r-t,u=i-n,c=a-t,f=s-n,d=c*c+f*f;if(this._x1===null)this._append`M${this._x1=t},${this._y1=n}`;else if(d>Pi)if(!(Math.abs(f*l-u*c)>Pi)||!o)this._append`L${this._x1=t},${this._y1=n}`;else{let p=r-a,h=i-s,v=l*l+u*u,y=p*p+h*h,g=Math.sqrt(v),x=Math.sqrt(d),w=o*Math.tan((oh-Math.acos((v+d-y)/(2*g*x)))/2),S=w/x,P=w/g;Math.abs(S-1)>Pi&&this._append`L${t+S*c},${n+S*f}`,this._append`A${o},${o},0,0,${+(f*p>c*h)},${this._x1=t+P*l},${this._y1=n+P*u}`}}arc(t,n,r,i,o,a){if(t=+t,n=+n,r=+r,a=!!a,r<0)throw new Error(`negative radius: ${r}`);let s=r*Math.cos(i),l=r*Math.sin(i),u=t+s,c=n+l,f=1^a,d=a?i-o:o-i;this._x1===null?this._append`M${u},${c}`:(Math.abs(this._x1-u)>Pi||Math.abs(this._y1-c)>Pi)&&this._append`L${u},${c}`,r&&(d<0&&(d=d%ah+ah),d>GT?this._append`A${r},${r},0,1,${f},${t-s},${n-l}A${r},${r},0,1,${f},${this._x1=u},${this._y1=c}`:d>Pi&&this._append`A${r},${r},0,${+(d>=oh)},${f},${this._x1=t+r*Math.cos(o)},${this._y1=n+r*Math.sin(o)}`)}rect(t,n,r,i){this._append`M${this._x0=this._x1=+t},${this._y0=this._y1=+n}h${r=+r}v${+i}h${-r}Z`}toString(){return this._}}function $P(e){let t=3;return e.digits=function(n){if(!arguments.length)return t;if(n==null)t=null;else{const r=Math.floor(n);if(!(r>=0))throw new RangeError(`invalid digits: ${n}`);t=r}return e},()=>new ZT(t)}function lv(e){return typeof e=="object"&&"length"in e?e:Array.from(e)}function IP(e){this._context=e}IP.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._point=0},lineEnd:function(){(this._line||this._line!==0&&this._point===1)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;default:this._context.lineTo(e,t);break}}};function uf(e){return new IP(e)}function NP(e){return e[0]}function DP(e){return e[1]}function RP(e,t){var n=Ie(!0),r=null,i=uf,o=null,a=$P(s);e=typeof e=="function"?e:e===void 0?NP:Ie(e),t=typeof t=="function"?t:t===void 0?DP:Ie(t);function s(l){var u,c=(l=lv(l)).length,f,d=!1,p;for(r==null&&(o=i(p=a())),u=0;u<=c;++u)!(u<c&&n(f=l[u],u,l))===d&&((d=!d)?o.lineStart():o.lineEnd()),d&&o.point(+e(f,u,l),+t(f,u,l));if(p)return o=null,p+""||null}return s.x=function(l){return arguments.length?(e=typeof l=="function"?l:Ie(+l),s):e},s.y=function(l){return arguments.length?(t=typeof l=="function"?l:Ie(+l),s):t},s.defined=function(l){return arguments.length?(n=typeof l=="function"?l:Ie(!!l),s):n},s.curve=function(l){return arguments.length?(i=l,r!=null&&(o=i(r)),s):i},s.context=function(l){return arguments.length?(l==null?r=o=null:o=i(r=l),s):r},s}function Nl(e,t,n){var r=null,i=Ie(!0),o=null,a=uf,s=null,l=$P(u);e=typeof e=="function"?e:e===void 0?NP:Ie(+e),t=typeof t=="function"?t:Ie(t===void 0?0:+t),n=typeof n=="function"?n:n===void 0?DP:Ie(+n);function u(f){var d,p,h,v=(f=lv(f)).length,y,g=!1,x,w=new Array(v),S=new Array(v);for(o==null&&(s=a(x=l())),d=0;d<=v;++d){if(!(d<v&&i(y=f[d],d,f))===g)if(g=!g)p=d,s.areaStart(),s.lineStart();else{for(s.lineEnd(),s.lineStart(),h=d-1;h>=p;--h)s.point(w[h],S[h]);s.lineEnd(),s.areaEnd()}g&&(w[d]=+e(y,d,f),S[d]=+t(y,d,f),s.point(r?+r(y,d,f):w[d],n?+n(y,d,f):S[d]))}if(x)return s=null,x+""||null}function c(){return RP().defined(i).curve(a).context(o)}return u.x=function(f){return arguments.length?(e=typeof f=="function"?f:Ie(+f),r=null,u):e},u.x0=function(f){return arguments.length?(e=typeof f=="function"?f:Ie(+f),u):e},u.x1=function(f){return arguments.length?(r=f==null?null:typeof f=="function"?f:Ie(+f),u):r},u.y=function(f){return arguments.length?(t=typeof f=="function"?f:Ie(+f),n=null,u):t},u.y0=function(f){return arguments.length?(t=typeof f=="function"?f:Ie(+f),u):t},u.y1=function(f){return arguments.length?(n=f==null?null:typeof f=="function"?f:Ie(+f),u):n},u.lineX0=u.lineY0=function(){return c().x(e).y(t)},u.lineY1=function(){return c().x(e).y(n)},u.lineX1=function(){return c().x(r).y(t)},u.defined=function(f){return arguments.length?(i=typeof f=="function"?f:Ie(!!f),u):i},u.curve=function(f){return arguments.length?(a=f,o!=null&&(s=a(o)),u):a},u.context=function(f){return arguments.length?(f==null?o=s=null:s=a(o=f),u):o},u}class LP{constructor(t,n){this._context=t,this._x=n}areaStart(){this._line=0}areaEnd(){this._line=NaN}lineStart(){this._point=0}lineEnd(){(this._line||this._line!==0&&this._point===1)&&this._context.closePath(),this._line=1-this._line}point(t,n){switch(t=+t,n=+n,this._point){case 0:{this._point=1,this._line?this._context.lineTo(t,n):this._context.moveTo(t,n);break}case 1:this._point=2;default:{this._x?this._context.bezierCurveTo(this._x0=(this._x0+t)/2,this._y0,this._x0,n,t,n):this._context.bezierCurveTo(this._x0,this._y0=(this._y0+n)/2,t,this._y0,t,n);break}}this._x0=t,this._y0=n}}function QT(e){return new LP(e,!0)}function JT(e){return new LP(e,!1)}function Zu(){}function Qu(e,t,n){e._context.bezierCurveTo((2*e._x0+e._x1)/3,(2*e._y0+e._y1)/3,(e._x0+2*e._x1)/3,(e._y0+2*e._y1)/3,(e._x0+4*e._x1+t)/6,(e._y0+4*e._y1+n)/6)}function zP(e){this._context=e}zP.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=NaN,this._point=0},lineEnd:function(){switch(this._point){case 3:Qu(this,this._x1,this._y1);case 2:this._context.lineTo(this._x1,this._y1);break}(this._line||this._line!==0&&this._point===1)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;break;case 2:this._point=3,this._context.lineTo((5*this._x0+this._x1)/6,(5*this._y0+this._y1)/6);default:Qu(this,e,t);break}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t}};function e$(e){return new zP(e)}function FP(e){this._context=e}FP.prototype={areaStart:Zu,areaEnd:Zu,lineStart:function(){this._x0=this._x1=this._x2=this._x3=this._x4=this._y0=this._y1=this._y2=this._y3=this._y4=NaN,this._point=0},lineEnd:function(){switch(this._point){case 1:{this._context.moveTo(this._x2,this._y2),this._context.closePath();break}case 2:{this._context.moveTo((this._x2+2*this._x3)/3,(this._y2+2*this._y3)/3),this._context.lineTo((this._x3+2*this._x2)/3,(this._y3+2*this._y2)/3),this._context.closePath();break}case 3:{this.point(this._x2,this._y2),this.point(this._x3,this._y3),this.point(this._x4,this._y4);break}}},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._x2=e,this._y2=t;break;case 1:this._point=2,this._x3=e,this._y3=t;break;case 2:this._point=3,this._x4=e,this._y4=t,this._context.moveTo((this._x0+4*this._x1+e)/6,(this._y0+4*this._y1+t)/6);break;default:Qu(this,e,t);break}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t}};function t$(e){return new FP(e)}function BP(e){this._context=e}BP.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=NaN,this._point=0},lineEnd:function(){(this._line||this._line!==0&&this._point===3)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1;break;case 1:this._point=2;break;case 2:this._point=3;var n=(this._x0+4*this._x1+e)/6,r=(this._y0+4*this._y1+t)/6;this._line?this._context.lineTo(n,r):this._context.moveTo(n,r);break;case 3:this._point=4;default:Qu(this,e,t);break}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t}};function n$(e){return new BP(e)}function UP(e){this._context=e}UP.prototype={areaStart:Zu,areaEnd:Zu,lineStart:function(){this._point=0},lineEnd:function(){this._point&&this._context.closePath()},point:function(e,t){e=+e,t=+t,this._point?this._context.lineTo(e,t):(this._point=1,this._context.moveTo(e,t))}};function r$(e){return new UP(e)}function E0(e){return e<0?-1:1}function k0(e,t,n){var r=e._x1-e._x0,i=t-e._x1,o=(e._y1-e._y0)/(r||i<0&&-0),a=(n-e._y1)/(i||r<0&&-0),s=(o*i+a*r)/(r+i);return(E0(o)+E0(a))*Math.min(Math.abs(o),Math.abs(a),.5*Math.abs(s))||0}function C0(e,t){var n=e._x1-e._x0;return n?(3*(e._y1-e._y0)/n-t)/2:t}function Id(e,t,n){var r=e._x0,i=e._y0,o=e._x1,a=e._y1,s=(o-r)/3;e._context.bezierCurveTo(r+s,i+s*t,o-s,a-s*n,o,a)}function Ju(e){this._context=e}Ju.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=this._t0=NaN,this._point=0},lineEnd:function(){switch(this._point){case 2:this._context.lineTo(this._x1,this._y1);break;case 3:Id(this,this._t0,C0(this,this._t0));break}(this._line||this._line!==0&&this._point===1)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){var n=NaN;if(e=+e,t=+t,!(e===this._x1&&t===this._y1)){switch(this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;break;case 2:this._point=3,Id(this,C0(this,n=k0(this,e,t)),n);break;default:Id(this,this._t0,n=k0(this,e,t));break}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t,this._t0=n}}};function VP(e){this._context=new HP(e)}(VP.prototype=Object.create(Ju.prototype)).point=function(e,t){Ju.prototype.point.call(this,t,e)};function HP(e){this._context=e}HP.prototype={moveTo:function(e,t){this._context.moveTo(t,e)},closePath:function(){this._context.closePath()},lineTo:function(e,t){this._context.lineTo(t,e)},bezierCurveTo:function(e,t,n,r,i,o){this._context.bezierCurveTo(t,e,r,n,o,i)}};function i$(e){return new Ju(e)}function o$(e){return new VP(e)}function KP(e){this._context=e}KP.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x=[],this._y=[]},lineEnd:function(){var e=this._x,t=this._y,n=e.length;if(n)if(this._line?this._context.lineTo(e[0],t[0]):this._context.moveTo(e[0],t[0]),n===2)this._context.lineTo(e[1],t[1]);else for(var r=_0(e),i=_0(t),o=0,a=1;a<n;++o,++a)this._context.bezierCurveTo(r[0][o],i[0][o],r[1][o],i[1][o],e[a],t[a]);(this._line||this._line!==0&&n===1)&&this._context.closePath(),this._line=1-this._line,this._x=this._y=null},point:function(e,t){this._x.push(+e),this._y.push(+t)}};function _0(e){var t,n=e.length-1,r,i=new Array(n),o=new Array(n),a=new Array(n);for(i[0]=0,o[0]=2,a[0]=e[0]+2*e[1],t=1;t<n-1;++t)i[t]=1,o[t]=4,a[t]=4*e[t]+2*e[t+1];for(i[n-1]=2,o[n-1]=7,a[n-1]=8*e[n-1]+e[n],t=1;t<n;++t)r=i[t]/o[t-1],o[t]-=r,a[t]-=r*a[t-1];for(i[n-1]=a[n-1]/o[n-1],t=n-2;t>=0;--t)i[t]=(a[t]-i[t+1])/o[t];for(o[n-1]=(e[n]+i[n-1])/2,t=0;t<n-1;++t)o[t]=2*e[t+1]-i[t+1];return[i,o]}function a$(e){return new KP(e)}function cf(e,t){this._context=e,this._t=t}cf.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x=this._y=NaN,this._point=0},lineEnd:function(){0<this._t&&this._t<1&&this._point===2&&this._context.lineTo(this._x,this._y),(this._line||this._line!==0&&this._point===1)&&this._context.closePath(),this._line>=0&&(this._t=1-this._t,this._line=1-this._line)},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;default:{if(this._t<=0)this._context.lineTo(this._x,t),this._context.lineTo(e,t);else{var n=this._x*(1-this._t)+e*this._t;this._context.lineTo(n,this._y),this._context.lineTo(n,t)}break}}this._x=e,this._y=t}};function s$(e){return new cf(e,.5)}function l$(e){return new cf(e,0)}function u$(e){return new cf(e,1)}function Hi(e,t){if((a=e.length)>1)for(var n=1,r,i,o=e[t[0]],a,s=o.length;n<a;++n)for(i=o,o=e[t[n]],r=0;r<s;++r)o[r][1]+=o[r][0]=isNaN(i[r][1])?i[r][0]:i[r][1]}function sh(e){for(var t=e.length,n=new Array(t);--t>=0;)n[t]=t;return n}function c$(e,t){return e[t]}function f$(e){const t=[];return t.key=e,t}function d$(){var e=Ie([]),t=sh,n=Hi,r=c$;function i(o){var a=Array.from(e.apply(this,arguments),f$),s,l=a.length,u=-1,c;for(const f of o)for(s=0,++u;s<l;++s)(a[s][u]=[0,+r(f,a[s].key,u,o)]).data=f;for(s=0,c=lv(t(a));s<l;++s)a[c[s]].index=s;return n(a,c),a}return i.keys=function(o){return arguments.length?(e=typeof o=="function"?o:Ie(Array.from(o)),i):e},i.value=function(o){return arguments.length?(r=typeof o=="function"?o:Ie(+o),i):r},i.order=function(o){return arguments.length?(t=o==null?sh:typeof o=="function"?o:Ie(Array.from(o)),i):t},i.offset=function(o){return arguments.length?(n=o??Hi,i):n},i}function p$(e,t){if((r=e.length)>0){for(var n,r,i=0,o=e[0].length,a;i<o;++i){for(a=n=0;n<r;++n)a+=e[n][i][1]||0;if(a)for(n=0;n<r;++n)e[n][i][1]/=a}Hi(e,t)}}function h$(e,t){if((i=e.length)>0){for(var n=0,r=e[t[0]],i,o=r.length;n<o;++n){for(var a=0,s=0;a<i;++a)s+=e[a][n][1]||0;r[n][1]+=r[n][0]=-s/2}Hi(e,t)}}function m$(e,t){if(!(!((a=e.length)>0)||!((o=(i=e[t[0]]).length)>0))){for(var n=0,r=1,i,o,a;r<o;++r){for(var s=0,l=0,u=0;s<a;++s){for(var c=e[t[s]],f=c[r][1]||0,d=c[r-1][1]||0,p=(f-d)/2,h=0;h<s;++h){var v=e[t[h]],y=v[r][1]||0,g=v[r-1][1]||0;p+=y-g}l+=f,u+=p*f}i[r-1][1]+=i[r-1][0]=n,l&&(n-=u/l)}i[r-1][1]+=i[r-1][0]=n,Hi(e,t)}}var ff={},WP={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});function t(n){return n==="__proto__"}e.isUnsafeProperty=t})(WP);var uv={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});function t(n){switch(typeof n){case"number":case"symbol":return!1;case"string":return n.includes(".")||n.includes("[")||n.includes("]")}}e.isDeepKey=t})(uv);var df={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});function t(n){var r;return typeof n=="string"||typeof n=="symbol"?n:Object.is((r=n==null?void 0:n.valueOf)==null?void 0:r.call(n),-0)?"-0":String(n)}e.toKey=t})(df);var pf={},YP={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});function t(n){if(n==null)return"";if(typeof n=="string")return n;if(Array.isArray(n))return n.map(t).join(",");const r=String(n);return r==="0"&&Object.is(Number(n),-0)?"-0":r}e.toString=t})(YP);(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=YP,n=df;function r(i){if(Array.isArray(i))return i.map(n.toKey);if(typeof i=="symbol")return[i];i=t.toString(i);const o=[],a=i.length;if(a===0)return o;let s=0,l="",u="",c=!1;for(i.charCodeAt(0)===46&&(o.push(""),s++);s<a;){const f=i[s];u?f==="\\"&&s+1<a?(s++,l+=i[s]):f===u?u="":l+=f:c?f==='"'||f==="'"?u=f:f==="]"?(c=!1,o.push(l),l=""):l+=f:f==="["?(c=!0,l&&(o.push(l),l="")):f==="."?l&&(o.push(l),l=""):l+=f,s++}return l&&o.push(l),o}e.toPath=r})(pf);(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=WP,n=uv,r=df,i=pf;function o(s,l,u){if(s==null)return u;switch(typeof l){case"string":{if(t.isUnsafeProperty(l))return u;const c=s[l];return c===void 0?n.isDeepKey(l)?o(s,i.toPath(l),u):u:c}case"number":case"symbol":{typeof l=="number"&&(l=r.toKey(l));const c=s[l];return c===void 0?u:c}default:{if(Array.isArray(l))return a(s,l,u);if(Object.is(l==null?void 0:l.valueOf(),-0)?l="-0":l=String(l),t.isUnsafeProperty(l))return u;const c=s[l];return c===void 0?u:c}}}function a(s,l,u){if(l.length===0)return u;let c=s;for(let f=0;f<l.length;f++){if(c==null||t.isUnsafeProperty(l[f]))return u;c=c[l[f]]}return c===void 0?u:c}e.get=o})(ff);var v$=ff.get;const hf=kr(v$);var g$=4;function qr(e){var t=arguments.length>1&&arguments[1]!==void 0?arguments[1]:g$,n=10**t,r=Math.round(e*n)/n;return Object.is(r,-0)?0:r}function st(e){for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];return e.reduce((i,o,a)=>{var s=n[a-1];return typeof s=="string"?i+s+o:s!==void 0?i+qr(s)+o:i+o},"")}var un=e=>e===0?0:e>0?1:-1,Qt=e=>typeof e=="number"&&e!=+e,yr=e=>typeof e=="string"&&e.indexOf("%")===e.length-1,Q=e=>(typeof e=="number"||e instanceof Number)&&!Qt(e),Lt=e=>Q(e)||typeof e=="string",y$=0,ws=e=>{var t=++y$;return"".concat(e||"").concat(t)},si=function(t,n){var r=arguments.length>2&&arguments[2]!==void 0?arguments[2]:0,i=arguments.length>3&&arguments[3]!==void 0?arguments[3]:!1;if(!Q(t)&&typeof t!="string")return r;var o;if(yr(t)){if(n==null)return r;var a=t.indexOf("%");o=n*parseFloat(t.slice(0,a))/100}else o=+t;return Qt(o)&&(o=r),i&&n!=null&&o>n&&(o=n),o},qP=e=>{if(!Array.isArray(e))return!1;for(var t=e.length,n={},r=0;r<t;r++)if(!n[String(e[r])])n[String(e[r])]=!0;else return!0;return!1};function Ln(e,t,n){return Q(e)&&Q(t)?qr(e+n*(t-e)):t}function GP(e,t,n){if(!(!e||!e.length))return e.find(r=>r&&(typeof t=="function"?t(r):hf(r,t))===n)}var ft=e=>e===null||typeof e>"u",cv=e=>ft(e)?e:"".concat(e.charAt(0).toUpperCase()).concat(e.slice(1));function x$(e){return e!=null}function Hs(){}var XP=e=>"radius"in e&&"startAngle"in e&&"endAngle"in e,fv=(e,t)=>{if(!e||typeof e=="function"||typeof e=="boolean")return null;var n=e;if(m.isValidElement(e)&&(n=e.props),typeof n!="object"&&typeof n!="function")return null;var r={};return Object.keys(n).forEach(i=>{sv(i)&&(r[i]=t||(o=>n[i](n,o)))}),r},w$=(e,t,n)=>r=>(e(t,n,r),null),b$=(e,t,n)=>{if(e===null||typeof e!="object"&&typeof e!="function")return null;var r=null;return Object.keys(e).forEach(i=>{var o=e[i];sv(i)&&typeof o=="function"&&(r||(r={}),r[i]=w$(o,t,n))}),r};function A0(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function S$(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?A0(Object(n),!0).forEach(function(r){P$(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):A0(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function P$(e,t,n){return(t=O$(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function O$(e){var t=E$(e,"string");return typeof t=="symbol"?t:t+""}function E$(e,t){if(typeof e!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||"default");if(typeof r!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}function At(e,t){var n=S$({},e),r=t,i=Object.keys(t),o=i.reduce((a,s)=>(a[s]===void 0&&r[s]!==void 0&&(a[s]=r[s]),a),n);return o}var ZP={},QP={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});function t(n,r){const i=new Map;for(let o=0;o<n.length;o++){const a=n[o],s=r(a);i.has(s)||i.set(s,a)}return Array.from(i.values())}e.uniqBy=t})(QP);var dv={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});function t(n){return n}e.identity=t})(dv);var JP={},mf={},eO={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});function t(n){return Number.isSafeInteger(n)&&n>=0}e.isLength=t})(eO);(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=eO;function n(r){return r!=null&&typeof r!="function"&&t.isLength(r.length)}e.isArrayLike=n})(mf);var tO={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});function t(n){return typeof n=="object"&&n!==null}e.isObjectLike=t})(tO);(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=mf,n=tO;function r(i){return n.isObjectLike(i)&&t.isArrayLike(i)}e.isArrayLikeObject=r})(JP);var nO={},rO={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=ff;function n(r){return function(i){return t.get(i,r)}}e.property=n})(rO);var iO={},pv={},oO={},hv={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});function t(n){return n!==null&&(typeof n=="object"||typeof n=="function")}e.isObject=t})(hv);var mv={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});function t(n){return n==null||typeof n!="object"&&typeof n!="function"}e.isPrimitive=t})(mv);var vv={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});function t(n,r){return n===r||Number.isNaN(n)&&Number.isNaN(r)}e.eq=t})(vv);(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=hv,n=mv,r=vv;function i(c,f,d){return typeof d!="function"?i(c,f,()=>{}):o(c,f,function p(h,v,y,g,x,w){const S=d(h,v,y,g,x,w);return S!==void 0?!!S:o(h,v,p,w)},new Map)}function o(c,f,d,p){if(f===c)return!0;switch(typeof f){case"object":return a(c,f,d,p);case"function":return Object.keys(f).length>0?o(c,{...f},d,p):r.eq(c,f);default:return t.isObject(c)?typeof f=="string"?f==="":!0:r.eq(c,f)}}function a(c,f,d,p){if(f==null)return!0;if(Array.isArray(f))return l(c,f,d,p);if(f instanceof Map)return s(c,f,d,p);if(f instanceof Set)return u(c,f,d,p);const h=Object.keys(f);if(c==null||n.isPrimitive(c))return h.length===0;if(h.length===0)return!0;if(p!=null&&p.has(f))return p.get(f)===c;p==null||p.set(f,c);try{for(let v=0;v<h.length;v++){const y=h[v];if(!n.isPrimitive(c)&&!(y in c)||f[y]===void 0&&c[y]!==void 0||f[y]===null&&c[y]!==null||!d(c[y],f[y],y,c,f,p))return!1}return!0}finally{p==null||p.delete(f)}}function s(c,f,d,p){if(f.size===0)return!0;if(!(c instanceof Map))return!1;for(const[h,v]of f.entries()){const y=c.get(h);if(d(y,v,h,c,f,p)===!1)return!1}return!0}function l(c,f,d,p){if(f.length===0)return!0;if(!Array.isArray(c))return!1;const h=new Set;for(let v=0;v<f.length;v++){const y=f[v];let g=!1;for(let x=0;x<c.length;x++){if(h.has(x))continue;const w=c[x];let S=!1;if(d(w,y,v,c,f,p)&&(S=!0),S){h.add(x),g=!0;break}}if(!g)return!1}return!0}function u(c,f,d,p){return f.size===0?!0:c instanceof Set?l([...c],[...f],d,p):!1}e.isMatchWith=i,e.isSetMatch=u})(oO);(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=oO;function n(r,i){return t.isMatchWith(r,i,()=>{})}e.isMatch=n})(pv);var aO={},gv={},sO={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});function t(n){return Object.getOwnPropertySymbols(n).filter(r=>Object.prototype.propertyIsEnumerable.call(n,r))}e.getSymbols=t})(sO);var yv={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});function t(n){return n==null?n===void 0?"[object Undefined]":"[object Null]":Object.prototype.toString.call(n)}e.getTag=t})(yv);var xv={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t="[object RegExp]",n="[object String]",r="[object Number]",i="[object Boolean]",o="[object Arguments]",a="[object Symbol]",s="[object Date]",l="[object Map]",u="[object Set]",c="[object Array]",f="[object Function]",d="[object ArrayBuffer]",p="[object Object]",h="[object Error]",v="[object DataView]",y="[object Uint8Array]",g="[object Uint8ClampedArray]",x="[object Uint16Array]",w="[object Uint32Array]",S="[object BigUint64Array]",P="[object Int8Array]",O="[object Int16Array]",k="[object Int32Array]",j="[object BigInt64Array]",M="[object Float32Array]",A="[object Float64Array]";e.argumentsTag=o,e.arrayBufferTag=d,e.arrayTag=c,e.bigInt64ArrayTag=j,e.bigUint64ArrayTag=S,e.booleanTag=i,e.dataViewTag=v,e.dateTag=s,e.errorTag=h,e.float32ArrayTag=M,e.float64ArrayTag=A,e.functionTag=f,e.int16ArrayTag=O,e.int32ArrayTag=k,e.int8ArrayTag=P,e.mapTag=l,e.numberTag=r,e.objectTag=p,e.regexpTag=t,e.setTag=u,e.stringTag=n,e.symbolTag=a,e.uint16ArrayTag=x,e.uint32ArrayTag=w,e.uint8ArrayTag=y,e.uint8ClampedArrayTag=g})(xv);var lO={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});function t(n){return ArrayBuffer.isView(n)&&!(n instanceof DataView)}e.isTypedArray=t})(lO);(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=sO,n=yv,r=xv,i=mv,o=lO;function a(c,f){return s(c,void 0,c,new Map,f)}function s(c,f,d,p=new Map,h=void 0){const v=h==null?void 0:h(c,f,d,p);if(v!==void 0)return v;if(i.isPrimitive(c))return c;if(p.has(c))return p.get(c);if(Array.isArray(c)){const y=new Array(c.length);p.set(c,y);for(let g=0;g<c.length;g++)y[g]=s(c[g],g,d,p,h);return Object.hasOwn(c,"index")&&(y.index=c.index),Object.hasOwn(c,"input")&&(y.input=c.input),y}if(c instanceof Date)return new Date(c.getTime());if(c instanceof RegExp){const y=new RegExp(c.source,c.flags);return y.lastIndex=c.lastIndex,y}if(c instanceof Map){const y=new Map;p.set(c,y);for(const[g,x]of c)y.set(g,s(x,g,d,p,h));return y}if(c instanceof Set){const y=new Set;p.set(c,y);for(const g of c)y.add(s(g,void 0,d,p,h));return y}if(typeof Buffer<"u"&&Buffer.isBuffer(c))return c.subarray();if(o.isTypedArray(c)){const y=new(Object.getPrototypeOf(c)).constructor(c.length);p.set(c,y);for(let g=0;g<c.length;g++)y[g]=s(c[g],g,d,p,h);return y}if(c instanceof ArrayBuffer||typeof SharedArrayBuffer<"u"&&c instanceof SharedArrayBuffer)return c.slice(0);if(c instanceof DataView){const y=new DataView(c.buffer.slice(0),c.byteOffset,c.byteLength);return p.set(c,y),l(y,c,d,p,h),y}if(typeof File<"u"&&c instanceof File){const y=new File([c],c.name,{type:c.type});return p.set(c,y),l(y,c,d,p,h),y}if(typeof Blob<"u"&&c instanceof Blob){const y=new Blob([c],{type:c.type});return p.set(c,y),l(y,c,d,p,h),y}if(c instanceof Error){const y=new c.constructor;return p.set(c,y),y.message=c.message,y.name=c.name,y.stack=c.stack,y.cause=c.cause,l(y,c,d,p,h),y}if(c instanceof Boolean){const y=new Boolean(c.valueOf());return p.set(c,y),l(y,c,d,p,h),y}if(c instanceof Number){const y=new Number(c.valueOf());return p.set(c,y),l(y,c,d,p,h),y}if(c instanceof String){const y=new String(c.valueOf());return p.set(c,y),l(y,c,d,p,h),y}if(typeof c=="object"&&u(c)){const y=Object.create(Object.getPrototypeOf(c));return p.set(c,y),l(y,c,d,p,h),y}return c}function l(c,f,d=c,p,h){const v=[...Object.keys(f),...t.getSymbols(f)];for(let y=0;y<v.length;y++){const g=v[y],x=Object.getOwnPropertyDescriptor(c,g);(x==null||x.writable)&&(c[g]=s(f[g],g,d,p,h))}}function u(c){switch(n.getTag(c)){case r.argumentsTag:case r.arrayTag:case r.arrayBufferTag:case r.dataViewTag:case r.booleanTag:case r.dateTag:case r.float32ArrayTag:case r.float64ArrayTag:case r.int8ArrayTag:case r.int16ArrayTag:case r.int32ArrayTag:case r.mapTag:case r.numberTag:case r.objectTag:case r.regexpTag:case r.setTag:case r.stringTag:case r.symbolTag:case r.uint8ArrayTag:case r.uint8ClampedArrayTag:case r.uint16ArrayTag:case r.uint32ArrayTag:return!0;default:return!1}}e.cloneDeepWith=a,e.cloneDeepWithImpl=s,e.copyProperties=l})(gv);(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=gv;function n(r){return t.cloneDeepWithImpl(r,void 0,r,new Map,void 0)}e.cloneDeep=n})(aO);(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=pv,n=aO;function r(i){return i=n.cloneDeep(i),o=>t.isMatch(o,i)}e.matches=r})(iO);var uO={},cO={},fO={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=gv,n=xv;function r(i,o){return t.cloneDeepWith(i,(a,s,l,u)=>{const c=o==null?void 0:o(a,s,l,u);if(c!==void 0)return c;if(typeof i=="object")switch(Object.prototype.toString.call(i)){case n.numberTag:case n.stringTag:case n.booleanTag:{const f=new i.constructor(i==null?void 0:i.valueOf());return t.copyProperties(f,i),f}case n.argumentsTag:{const f={};return t.copyProperties(f,i),f.length=i.length,f[Symbol.iterator]=i[Symbol.iterator],f}default:return}})}e.cloneDeepWith=r})(fO);(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=fO;function n(r){return t.cloneDeepWith(r)}e.cloneDeep=n})(cO);var dO={},wv={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=/^(?:0|[1-9]\d*)$/;function n(r,i=Number.MAX_SAFE_INTEGER){switch(typeof r){case"number":return Number.isInteger(r)&&r>=0&&r<i;case"symbol":return!1;case"string":return t.test(r)}}e.isIndex=n})(wv);var pO={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=yv;function n(r){return r!==null&&typeof r=="object"&&t.getTag(r)==="[object Arguments]"}e.isArguments=n})(pO);(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=uv,n=wv,r=pO,i=pf;function o(a,s){let l;if(Array.isArray(s)?l=s:typeof s=="string"&&t.isDeepKey(s)&&(a==null?void 0:a[s])==null?l=i.toPath(s):l=[s],l.length===0)return!1;let u=a;for(let c=0;c<l.length;c++){const f=l[c];if((u==null||!Object.hasOwn(u,f))&&!((Array.isArray(u)||r.isArguments(u))&&n.isIndex(f)&&f<u.length))return!1;u=u[f]}return!0}e.has=o})(dO);(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=pv,n=df,r=cO,i=ff,o=dO;function a(s,l){switch(typeof s){case"object":{Object.is(s==null?void 0:s.valueOf(),-0)&&(s="-0");break}case"number":{s=n.toKey(s);break}}return l=r.cloneDeep(l),function(u){const c=i.get(u,s);return c===void 0?o.has(u,s):l===void 0?c===void 0:t.isMatch(c,l)}}e.matchesProperty=a})(uO);(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=dv,n=rO,r=iO,i=uO;function o(a){if(a==null)return t.identity;switch(typeof a){case"function":return a;case"object":return Array.isArray(a)&&a.length===2?i.matchesProperty(a[0],a[1]):r.matches(a);case"string":case"symbol":case"number":return n.property(a)}}e.iteratee=o})(nO);(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=QP,n=dv,r=JP,i=nO;function o(a,s=n.identity){return r.isArrayLikeObject(a)?t.uniqBy(Array.from(a),i.iteratee(s)):[]}e.uniqBy=o})(ZP);var k$=ZP.uniqBy;const j0=kr(k$);function C$(e,t,n){return t===!0?j0(e,n):typeof t=="function"?j0(e,t):e}var hO={exports:{}},mO={},vO={exports:{}},gO={};/**
+`+o.stack}return{value:e,source:t,stack:i,digest:null}}function jd(e,t,n){return{value:e,source:null,stack:n??null,digest:t??null}}function Vp(e,t){try{console.error(t.value)}catch(n){setTimeout(function(){throw n})}}var HM=typeof WeakMap=="function"?WeakMap:Map;function qS(e,t,n){n=fr(-1,n),n.tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){Yu||(Yu=!0,Jp=r),Vp(e,t)},n}function GS(e,t,n){n=fr(-1,n),n.tag=3;var r=e.type.getDerivedStateFromError;if(typeof r=="function"){var i=t.value;n.payload=function(){return r(i)},n.callback=function(){Vp(e,t)}}var o=e.stateNode;return o!==null&&typeof o.componentDidCatch=="function"&&(n.callback=function(){Vp(e,t),typeof r!="function"&&(ei===null?ei=new Set([this]):ei.add(this));var a=t.stack;this.componentDidCatch(t.value,{componentStack:a!==null?a:""})}),n}function o0(e,t,n){var r=e.pingCache;if(r===null){r=e.pingCache=new HM;var i=new Set;r.set(t,i)}else i=r.get(t),i===void 0&&(i=new Set,r.set(t,i));i.has(n)||(i.add(n),e=iT.bind(null,e,t,n),t.then(e,e))}function a0(e){do{var t;if((t=e.tag===13)&&(t=e.memoizedState,t=t!==null?t.dehydrated!==null:!0),t)return e;e=e.return}while(e!==null);return null}function s0(e,t,n,r,i){return e.mode&1?(e.flags|=65536,e.lanes=i,e):(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,n.tag===1&&(n.alternate===null?n.tag=17:(t=fr(-1,1),t.tag=2,Jr(n,t,1))),n.lanes|=1),e)}var KM=Cr.ReactCurrentOwner,Tt=!1;function Pt(e,t,n,r){t.child=e===null?OS(t,null,n,r):Vo(t,e.child,n,r)}function l0(e,t,n,r,i){n=n.render;var o=t.ref;return Io(t,i),r=Km(e,t,n,r,o,i),n=Wm(),e!==null&&!Tt?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~i,gr(e,t,i)):(_e&&n&&$m(t),t.flags|=1,Pt(e,t,r,i),t.child)}function u0(e,t,n,r,i){if(e===null){var o=n.type;return typeof o=="function"&&!nv(o)&&o.defaultProps===void 0&&n.compare===null&&n.defaultProps===void 0?(t.tag=15,t.type=o,XS(e,t,o,r,i)):(e=mu(n.type,null,r,t,t.mode,i),e.ref=t.ref,e.return=t,t.child=e)}if(o=e.child,!(e.lanes&i)){var a=o.memoizedProps;if(n=n.compare,n=n!==null?n:us,n(a,r)&&e.ref===t.ref)return gr(e,t,i)}return t.flags|=1,e=ni(o,r),e.ref=t.ref,e.return=t,t.child=e}function XS(e,t,n,r,i){if(e!==null){var o=e.memoizedProps;if(us(o,r)&&e.ref===t.ref)if(Tt=!1,t.pendingProps=r=o,(e.lanes&i)!==0)e.flags&131072&&(Tt=!0);else return t.lanes=e.lanes,gr(e,t,i)}return Hp(e,t,n,r,i)}function ZS(e,t,n){var r=t.pendingProps,i=r.children,o=e!==null?e.memoizedState:null;if(r.mode==="hidden")if(!(t.mode&1))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},we(ko,Ut),Ut|=n;else{if(!(n&1073741824))return e=o!==null?o.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,we(ko,Ut),Ut|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=o!==null?o.baseLanes:n,we(ko,Ut),Ut|=r}else o!==null?(r=o.baseLanes|n,t.memoizedState=null):r=n,we(ko,Ut),Ut|=r;return Pt(e,t,i,n),t.child}function QS(e,t){var n=t.ref;(e===null&&n!==null||e!==null&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function Hp(e,t,n,r,i){var o=Nt(n)?zi:bt.current;return o=Bo(t,o),Io(t,i),n=Km(e,t,n,r,o,i),r=Wm(),e!==null&&!Tt?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~i,gr(e,t,i)):(_e&&r&&$m(t),t.flags|=1,Pt(e,t,n,i),t.child)}function c0(e,t,n,r,i){if(Nt(n)){var o=!0;Ru(t)}else o=!1;if(Io(t,i),t.stateNode===null)du(e,t),YS(t,n,r),Up(t,n,r,i),r=!0;else if(e===null){var a=t.stateNode,s=t.memoizedProps;a.props=s;var l=a.context,u=n.contextType;typeof u=="object"&&u!==null?u=dn(u):(u=Nt(n)?zi:bt.current,u=Bo(t,u));var c=n.getDerivedStateFromProps,f=typeof c=="function"||typeof a.getSnapshotBeforeUpdate=="function";f||typeof a.UNSAFE_componentWillReceiveProps!="function"&&typeof a.componentWillReceiveProps!="function"||(s!==r||l!==u)&&i0(t,a,r,u),Fr=!1;var d=t.memoizedState;a.state=d,Uu(t,r,a,i),l=t.memoizedState,s!==r||d!==l||It.current||Fr?(typeof c=="function"&&(Bp(t,n,c,r),l=t.memoizedState),(s=Fr||r0(t,n,s,r,d,l,u))?(f||typeof a.UNSAFE_componentWillMount!="function"&&typeof a.componentWillMount!="function"||(typeof a.componentWillMount=="function"&&a.componentWillMount(),typeof a.UNSAFE_componentWillMount=="function"&&a.UNSAFE_componentWillMount()),typeof a.componentDidMount=="function"&&(t.flags|=4194308)):(typeof a.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=l),a.props=r,a.state=l,a.context=u,r=s):(typeof a.componentDidMount=="function"&&(t.flags|=4194308),r=!1)}else{a=t.stateNode,kS(e,t),s=t.memoizedProps,u=t.type===t.elementType?s:xn(t.type,s),a.props=u,f=t.pendingProps,d=a.context,l=n.contextType,typeof l=="object"&&l!==null?l=dn(l):(l=Nt(n)?zi:bt.current,l=Bo(t,l));var p=n.getDerivedStateFromProps;(c=typeof p=="function"||typeof a.getSnapshotBeforeUpdate=="function")||typeof a.UNSAFE_componentWillReceiveProps!="function"&&typeof a.componentWillReceiveProps!="function"||(s!==f||d!==l)&&i0(t,a,r,l),Fr=!1,d=t.memoizedState,a.state=d,Uu(t,r,a,i);var h=t.memoizedState;s!==f||d!==h||It.current||Fr?(typeof p=="function"&&(Bp(t,n,p,r),h=t.memoizedState),(u=Fr||r0(t,n,u,r,d,h,l)||!1)?(c||typeof a.UNSAFE_componentWillUpdate!="function"&&typeof a.componentWillUpdate!="function"||(typeof a.componentWillUpdate=="function"&&a.componentWillUpdate(r,h,l),typeof a.UNSAFE_componentWillUpdate=="function"&&a.UNSAFE_componentWillUpdate(r,h,l)),typeof a.componentDidUpdate=="function"&&(t.flags|=4),typeof a.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof a.componentDidUpdate!="function"||s===e.memoizedProps&&d===e.memoizedState||(t.flags|=4),typeof a.getSnapshotBeforeUpdate!="function"||s===e.memoizedProps&&d===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=h),a.props=r,a.state=h,a.context=l,r=u):(typeof a.componentDidUpdate!="function"||s===e.memoizedProps&&d===e.memoizedState||(t.flags|=4),typeof a.getSnapshotBeforeUpdate!="function"||s===e.memoizedProps&&d===e.memoizedState||(t.flags|=1024),r=!1)}return Kp(e,t,n,r,o,i)}function Kp(e,t,n,r,i,o){QS(e,t);var a=(t.flags&128)!==0;if(!r&&!a)return i&&Gy(t,n,!1),gr(e,t,o);r=t.stateNode,KM.current=t;var s=a&&typeof n.getDerivedStateFromError!="function"?null:r.render();return t.flags|=1,e!==null&&a?(t.child=Vo(t,e.child,null,o),t.child=Vo(t,null,s,o)):Pt(e,t,s,o),t.memoizedState=r.state,i&&Gy(t,n,!0),t.child}function JS(e){var t=e.stateNode;t.pendingContext?qy(e,t.pendingContext,t.pendingContext!==t.context):t.context&&qy(e,t.context,!1),Bm(e,t.containerInfo)}function f0(e,t,n,r,i){return Uo(),Nm(i),t.flags|=256,Pt(e,t,n,r),t.child}var Wp={dehydrated:null,treeContext:null,retryLane:0};function Yp(e){return{baseLanes:e,cachePool:null,transitions:null}}function eP(e,t,n){var r=t.pendingProps,i=Me.current,o=!1,a=(t.flags&128)!==0,s;if((s=a)||(s=e!==null&&e.memoizedState===null?!1:(i&2)!==0),s?(o=!0,t.flags&=-129):(e===null||e.memoizedState!==null)&&(i|=1),we(Me,i&1),e===null)return zp(t),e=t.memoizedState,e!==null&&(e=e.dehydrated,e!==null)?(t.mode&1?e.data==="$!"?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(a=r.children,e=r.fallback,o?(r=t.mode,o=t.child,a={mode:"hidden",children:a},!(r&1)&&o!==null?(o.childLanes=0,o.pendingProps=a):o=nf(a,r,0,null),e=Ii(e,r,n,null),o.return=t,e.return=t,o.sibling=e,t.child=o,t.child.memoizedState=Yp(n),t.memoizedState=Wp,e):Gm(t,a));if(i=e.memoizedState,i!==null&&(s=i.dehydrated,s!==null))return WM(e,t,a,r,s,i,n);if(o){o=r.fallback,a=t.mode,i=e.child,s=i.sibling;var l={mode:"hidden",children:r.children};return!(a&1)&&t.child!==i?(r=t.child,r.childLanes=0,r.pendingProps=l,t.deletions=null):(r=ni(i,l),r.subtreeFlags=i.subtreeFlags&14680064),s!==null?o=ni(s,o):(o=Ii(o,a,n,null),o.flags|=2),o.return=t,r.return=t,r.sibling=o,t.child=r,r=o,o=t.child,a=e.child.memoizedState,a=a===null?Yp(n):{baseLanes:a.baseLanes|n,cachePool:null,transitions:a.transitions},o.memoizedState=a,o.childLanes=e.childLanes&~n,t.memoizedState=Wp,r}return o=e.child,e=o.sibling,r=ni(o,{mode:"visible",children:r.children}),!(t.mode&1)&&(r.lanes=n),r.return=t,r.sibling=null,e!==null&&(n=t.deletions,n===null?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=r,t.memoizedState=null,r}function Gm(e,t){return t=nf({mode:"visible",children:t},e.mode,0,null),t.return=e,e.child=t}function jl(e,t,n,r){return r!==null&&Nm(r),Vo(t,e.child,null,n),e=Gm(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function WM(e,t,n,r,i,o,a){if(n)return t.flags&256?(t.flags&=-257,r=jd(Error(F(422))),jl(e,t,a,r)):t.memoizedState!==null?(t.child=e.child,t.flags|=128,null):(o=r.fallback,i=t.mode,r=nf({mode:"visible",children:r.children},i,0,null),o=Ii(o,i,a,null),o.flags|=2,r.return=t,o.return=t,r.sibling=o,t.child=r,t.mode&1&&Vo(t,e.child,null,a),t.child.memoizedState=Yp(a),t.memoizedState=Wp,o);if(!(t.mode&1))return jl(e,t,a,null);if(i.data==="$!"){if(r=i.nextSibling&&i.nextSibling.dataset,r)var s=r.dgst;return r=s,o=Error(F(419)),r=jd(o,r,void 0),jl(e,t,a,r)}if(s=(a&e.childLanes)!==0,Tt||s){if(r=rt,r!==null){switch(a&-a){case 4:i=2;break;case 16:i=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:i=32;break;case 536870912:i=268435456;break;default:i=0}i=i&(r.suspendedLanes|a)?0:i,i!==0&&i!==o.retryLane&&(o.retryLane=i,vr(e,i),Cn(r,e,i,-1))}return tv(),r=jd(Error(F(421))),jl(e,t,a,r)}return i.data==="$?"?(t.flags|=128,t.child=e.child,t=oT.bind(null,e),i._reactRetry=t,null):(e=o.treeContext,Wt=Qr(i.nextSibling),qt=t,_e=!0,Sn=null,e!==null&&(on[an++]=sr,on[an++]=lr,on[an++]=Fi,sr=e.id,lr=e.overflow,Fi=t),t=Gm(t,r.children),t.flags|=4096,t)}function d0(e,t,n){e.lanes|=t;var r=e.alternate;r!==null&&(r.lanes|=t),Fp(e.return,t,n)}function Md(e,t,n,r,i){var o=e.memoizedState;o===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:i}:(o.isBackwards=t,o.rendering=null,o.renderingStartTime=0,o.last=r,o.tail=n,o.tailMode=i)}function tP(e,t,n){var r=t.pendingProps,i=r.revealOrder,o=r.tail;if(Pt(e,t,r.children,n),r=Me.current,r&2)r=r&1|2,t.flags|=128;else{if(e!==null&&e.flags&128)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&d0(e,n,t);else if(e.tag===19)d0(e,n,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(we(Me,r),!(t.mode&1))t.memoizedState=null;else switch(i){case"forwards":for(n=t.child,i=null;n!==null;)e=n.alternate,e!==null&&Vu(e)===null&&(i=n),n=n.sibling;n=i,n===null?(i=t.child,t.child=null):(i=n.sibling,n.sibling=null),Md(t,!1,i,n,o);break;case"backwards":for(n=null,i=t.child,t.child=null;i!==null;){if(e=i.alternate,e!==null&&Vu(e)===null){t.child=i;break}e=i.sibling,i.sibling=n,n=i,i=e}Md(t,!0,n,null,o);break;case"together":Md(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function du(e,t){!(t.mode&1)&&e!==null&&(e.alternate=null,t.alternate=null,t.flags|=2)}function gr(e,t,n){if(e!==null&&(t.dependencies=e.dependencies),Ui|=t.lanes,!(n&t.childLanes))return null;if(e!==null&&t.child!==e.child)throw Error(F(153));if(t.child!==null){for(e=t.child,n=ni(e,e.pendingProps),t.child=n,n.return=t;e.sibling!==null;)e=e.sibling,n=n.sibling=ni(e,e.pendingProps),n.return=t;n.sibling=null}return t.child}function YM(e,t,n){switch(t.tag){case 3:JS(t),Uo();break;case 5:CS(t);break;case 1:Nt(t.type)&&Ru(t);break;case 4:Bm(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,i=t.memoizedProps.value;we(Fu,r._currentValue),r._currentValue=i;break;case 13:if(r=t.memoizedState,r!==null)return r.dehydrated!==null?(we(Me,Me.current&1),t.flags|=128,null):n&t.child.childLanes?eP(e,t,n):(we(Me,Me.current&1),e=gr(e,t,n),e!==null?e.sibling:null);we(Me,Me.current&1);break;case 19:if(r=(n&t.childLanes)!==0,e.flags&128){if(r)return tP(e,t,n);t.flags|=128}if(i=t.memoizedState,i!==null&&(i.rendering=null,i.tail=null,i.lastEffect=null),we(Me,Me.current),r)break;return null;case 22:case 23:return t.lanes=0,ZS(e,t,n)}return gr(e,t,n)}var nP,qp,rP,iP;nP=function(e,t){for(var n=t.child;n!==null;){if(n.tag===5||n.tag===6)e.appendChild(n.stateNode);else if(n.tag!==4&&n.child!==null){n.child.return=n,n=n.child;continue}if(n===t)break;for(;n.sibling===null;){if(n.return===null||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}};qp=function(){};rP=function(e,t,n,r){var i=e.memoizedProps;if(i!==r){e=t.stateNode,_i(Vn.current);var o=null;switch(n){case"input":i=vp(e,i),r=vp(e,r),o=[];break;case"select":i=$e({},i,{value:void 0}),r=$e({},r,{value:void 0}),o=[];break;case"textarea":i=xp(e,i),r=xp(e,r),o=[];break;default:typeof i.onClick!="function"&&typeof r.onClick=="function"&&(e.onclick=Nu)}bp(n,r);var a;n=null;for(u in i)if(!r.hasOwnProperty(u)&&i.hasOwnProperty(u)&&i[u]!=null)if(u==="style"){var s=i[u];for(a in s)s.hasOwnProperty(a)&&(n||(n={}),n[a]="")}else u!=="dangerouslySetInnerHTML"&&u!=="children"&&u!=="suppressContentEditableWarning"&&u!=="suppressHydrationWarning"&&u!=="autoFocus"&&(ns.hasOwnProperty(u)?o||(o=[]):(o=o||[]).push(u,null));for(u in r){var l=r[u];if(s=i!=null?i[u]:void 0,r.hasOwnProperty(u)&&l!==s&&(l!=null||s!=null))if(u==="style")if(s){for(a in s)!s.hasOwnProperty(a)||l&&l.hasOwnProperty(a)||(n||(n={}),n[a]="");for(a in l)l.hasOwnProperty(a)&&s[a]!==l[a]&&(n||(n={}),n[a]=l[a])}else n||(o||(o=[]),o.push(u,n)),n=l;else u==="dangerouslySetInnerHTML"?(l=l?l.__html:void 0,s=s?s.__html:void 0,l!=null&&s!==l&&(o=o||[]).push(u,l)):u==="children"?typeof l!="string"&&typeof l!="number"||(o=o||[]).push(u,""+l):u!=="suppressContentEditableWarning"&&u!=="suppressHydrationWarning"&&(ns.hasOwnProperty(u)?(l!=null&&u==="onScroll"&&Oe("scroll",e),o||s===l||(o=[])):(o=o||[]).push(u,l))}n&&(o=o||[]).push("style",n);var u=o;(t.updateQueue=u)&&(t.flags|=4)}};iP=function(e,t,n,r){n!==r&&(t.flags|=4)};function ka(e,t){if(!_e)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;t!==null;)t.alternate!==null&&(n=t),t=t.sibling;n===null?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;n!==null;)n.alternate!==null&&(r=n),n=n.sibling;r===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:r.sibling=null}}function vt(e){var t=e.alternate!==null&&e.alternate.child===e.child,n=0,r=0;if(t)for(var i=e.child;i!==null;)n|=i.lanes|i.childLanes,r|=i.subtreeFlags&14680064,r|=i.flags&14680064,i.return=e,i=i.sibling;else for(i=e.child;i!==null;)n|=i.lanes|i.childLanes,r|=i.subtreeFlags,r|=i.flags,i.return=e,i=i.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function qM(e,t,n){var r=t.pendingProps;switch(Im(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return vt(t),null;case 1:return Nt(t.type)&&Du(),vt(t),null;case 3:return r=t.stateNode,Ho(),ke(It),ke(bt),Vm(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),(e===null||e.child===null)&&(_l(t)?t.flags|=4:e===null||e.memoizedState.isDehydrated&&!(t.flags&256)||(t.flags|=1024,Sn!==null&&(nh(Sn),Sn=null))),qp(e,t),vt(t),null;case 5:Um(t);var i=_i(hs.current);if(n=t.type,e!==null&&t.stateNode!=null)rP(e,t,n,r,i),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(t.stateNode===null)throw Error(F(166));return vt(t),null}if(e=_i(Vn.current),_l(t)){r=t.stateNode,n=t.type;var o=t.memoizedProps;switch(r[zn]=t,r[ds]=o,e=(t.mode&1)!==0,n){case"dialog":Oe("cancel",r),Oe("close",r);break;case"iframe":case"object":case"embed":Oe("load",r);break;case"video":case"audio":for(i=0;i<Ba.length;i++)Oe(Ba[i],r);break;case"source":Oe("error",r);break;case"img":case"image":case"link":Oe("error",r),Oe("load",r);break;case"details":Oe("toggle",r);break;case"input":by(r,o),Oe("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!o.multiple},Oe("invalid",r);break;case"textarea":Py(r,o),Oe("invalid",r)}bp(n,o),i=null;for(var a in o)if(o.hasOwnProperty(a)){var s=o[a];a==="children"?typeof s=="string"?r.textContent!==s&&(o.suppressHydrationWarning!==!0&&Cl(r.textContent,s,e),i=["children",s]):typeof s=="number"&&r.textContent!==""+s&&(o.suppressHydrationWarning!==!0&&Cl(r.textContent,s,e),i=["children",""+s]):ns.hasOwnProperty(a)&&s!=null&&a==="onScroll"&&Oe("scroll",r)}switch(n){case"input":xl(r),Sy(r,o,!0);break;case"textarea":xl(r),Oy(r);break;case"select":case"option":break;default:typeof o.onClick=="function"&&(r.onclick=Nu)}r=i,t.updateQueue=r,r!==null&&(t.flags|=4)}else{a=i.nodeType===9?i:i.ownerDocument,e==="http://www.w3.org/1999/xhtml"&&(e=Tb(n)),e==="http://www.w3.org/1999/xhtml"?n==="script"?(e=a.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):typeof r.is=="string"?e=a.createElement(n,{is:r.is}):(e=a.createElement(n),n==="select"&&(a=e,r.multiple?a.multiple=!0:r.size&&(a.size=r.size))):e=a.createElementNS(e,n),e[zn]=t,e[ds]=r,nP(e,t,!1,!1),t.stateNode=e;e:{switch(a=Sp(n,r),n){case"dialog":Oe("cancel",e),Oe("close",e),i=r;break;case"iframe":case"object":case"embed":Oe("load",e),i=r;break;case"video":case"audio":for(i=0;i<Ba.length;i++)Oe(Ba[i],e);i=r;break;case"source":Oe("error",e),i=r;break;case"img":case"image":case"link":Oe("error",e),Oe("load",e),i=r;break;case"details":Oe("toggle",e),i=r;break;case"input":by(e,r),i=vp(e,r),Oe("invalid",e);break;case"option":i=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},i=$e({},r,{value:void 0}),Oe("invalid",e);break;case"textarea":Py(e,r),i=xp(e,r),Oe("invalid",e);break;default:i=r}bp(n,i),s=i;for(o in s)if(s.hasOwnProperty(o)){var l=s[o];o==="style"?Nb(e,l):o==="dangerouslySetInnerHTML"?(l=l?l.__html:void 0,l!=null&&$b(e,l)):o==="children"?typeof l=="string"?(n!=="textarea"||l!=="")&&rs(e,l):typeof l=="number"&&rs(e,""+l):o!=="suppressContentEditableWarning"&&o!=="suppressHydrationWarning"&&o!=="autoFocus"&&(ns.hasOwnProperty(o)?l!=null&&o==="onScroll"&&Oe("scroll",e):l!=null&&xm(e,o,l,a))}switch(n){case"input":xl(e),Sy(e,r,!1);break;case"textarea":xl(e),Oy(e);break;case"option":r.value!=null&&e.setAttribute("value",""+oi(r.value));break;case"select":e.multiple=!!r.multiple,o=r.value,o!=null?jo(e,!!r.multiple,o,!1):r.defaultValue!=null&&jo(e,!!r.multiple,r.defaultValue,!0);break;default:typeof i.onClick=="function"&&(e.onclick=Nu)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}t.ref!==null&&(t.flags|=512,t.flags|=2097152)}return vt(t),null;case 6:if(e&&t.stateNode!=null)iP(e,t,e.memoizedProps,r);else{if(typeof r!="string"&&t.stateNode===null)throw Error(F(166));if(n=_i(hs.current),_i(Vn.current),_l(t)){if(r=t.stateNode,n=t.memoizedProps,r[zn]=t,(o=r.nodeValue!==n)&&(e=qt,e!==null))switch(e.tag){case 3:Cl(r.nodeValue,n,(e.mode&1)!==0);break;case 5:e.memoizedProps.suppressHydrationWarning!==!0&&Cl(r.nodeValue,n,(e.mode&1)!==0)}o&&(t.flags|=4)}else r=(n.nodeType===9?n:n.ownerDocument).createTextNode(r),r[zn]=t,t.stateNode=r}return vt(t),null;case 13:if(ke(Me),r=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if(_e&&Wt!==null&&t.mode&1&&!(t.flags&128))SS(),Uo(),t.flags|=98560,o=!1;else if(o=_l(t),r!==null&&r.dehydrated!==null){if(e===null){if(!o)throw Error(F(318));if(o=t.memoizedState,o=o!==null?o.dehydrated:null,!o)throw Error(F(317));o[zn]=t}else Uo(),!(t.flags&128)&&(t.memoizedState=null),t.flags|=4;vt(t),o=!1}else Sn!==null&&(nh(Sn),Sn=null),o=!0;if(!o)return t.flags&65536?t:null}return t.flags&128?(t.lanes=n,t):(r=r!==null,r!==(e!==null&&e.memoizedState!==null)&&r&&(t.child.flags|=8192,t.mode&1&&(e===null||Me.current&1?We===0&&(We=3):tv())),t.updateQueue!==null&&(t.flags|=4),vt(t),null);case 4:return Ho(),qp(e,t),e===null&&cs(t.stateNode.containerInfo),vt(t),null;case 10:return Lm(t.type._context),vt(t),null;case 17:return Nt(t.type)&&Du(),vt(t),null;case 19:if(ke(Me),o=t.memoizedState,o===null)return vt(t),null;if(r=(t.flags&128)!==0,a=o.rendering,a===null)if(r)ka(o,!1);else{if(We!==0||e!==null&&e.flags&128)for(e=t.child;e!==null;){if(a=Vu(e),a!==null){for(t.flags|=128,ka(o,!1),r=a.updateQueue,r!==null&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;n!==null;)o=n,e=r,o.flags&=14680066,a=o.alternate,a===null?(o.childLanes=0,o.lanes=e,o.child=null,o.subtreeFlags=0,o.memoizedProps=null,o.memoizedState=null,o.updateQueue=null,o.dependencies=null,o.stateNode=null):(o.childLanes=a.childLanes,o.lanes=a.lanes,o.child=a.child,o.subtreeFlags=0,o.deletions=null,o.memoizedProps=a.memoizedProps,o.memoizedState=a.memoizedState,o.updateQueue=a.updateQueue,o.type=a.type,e=a.dependencies,o.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return we(Me,Me.current&1|2),t.child}e=e.sibling}o.tail!==null&&Re()>Wo&&(t.flags|=128,r=!0,ka(o,!1),t.lanes=4194304)}else{if(!r)if(e=Vu(a),e!==null){if(t.flags|=128,r=!0,n=e.updateQueue,n!==null&&(t.updateQueue=n,t.flags|=4),ka(o,!0),o.tail===null&&o.tailMode==="hidden"&&!a.alternate&&!_e)return vt(t),null}else 2*Re()-o.renderingStartTime>Wo&&n!==1073741824&&(t.flags|=128,r=!0,ka(o,!1),t.lanes=4194304);o.isBackwards?(a.sibling=t.child,t.child=a):(n=o.last,n!==null?n.sibling=a:t.child=a,o.last=a)}return o.tail!==null?(t=o.tail,o.rendering=t,o.tail=t.sibling,o.renderingStartTime=Re(),t.sibling=null,n=Me.current,we(Me,r?n&1|2:n&1),t):(vt(t),null);case 22:case 23:return ev(),r=t.memoizedState!==null,e!==null&&e.memoizedState!==null!==r&&(t.flags|=8192),r&&t.mode&1?Ut&1073741824&&(vt(t),t.subtreeFlags&6&&(t.flags|=8192)):vt(t),null;case 24:return null;case 25:return null}throw Error(F(156,t.tag))}function GM(e,t){switch(Im(t),t.tag){case 1:return Nt(t.type)&&Du(),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return Ho(),ke(It),ke(bt),Vm(),e=t.flags,e&65536&&!(e&128)?(t.flags=e&-65537|128,t):null;case 5:return Um(t),null;case 13:if(ke(Me),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(F(340));Uo()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return ke(Me),null;case 4:return Ho(),null;case 10:return Lm(t.type._context),null;case 22:case 23:return ev(),null;case 24:return null;default:return null}}var Ml=!1,xt=!1,XM=typeof WeakSet=="function"?WeakSet:Set,W=null;function Eo(e,t){var n=e.ref;if(n!==null)if(typeof n=="function")try{n(null)}catch(r){Ne(e,t,r)}else n.current=null}function Gp(e,t,n){try{n()}catch(r){Ne(e,t,r)}}var p0=!1;function ZM(e,t){if(Tp=Tu,e=uS(),Tm(e)){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{n=(n=e.ownerDocument)&&n.defaultView||window;var r=n.getSelection&&n.getSelection();if(r&&r.rangeCount!==0){n=r.anchorNode;var i=r.anchorOffset,o=r.focusNode;r=r.focusOffset;try{n.nodeType,o.nodeType}catch{n=null;break e}var a=0,s=-1,l=-1,u=0,c=0,f=e,d=null;t:for(;;){for(var p;f!==n||i!==0&&f.nodeType!==3||(s=a+i),f!==o||r!==0&&f.nodeType!==3||(l=a+r),f.nodeType===3&&(a+=f.nodeValue.length),(p=f.firstChild)!==null;)d=f,f=p;for(;;){if(f===e)break t;if(d===n&&++u===i&&(s=a),d===o&&++c===r&&(l=a),(p=f.nextSibling)!==null)break;f=d,d=f.parentNode}f=p}n=s===-1||l===-1?null:{start:s,end:l}}else n=null}n=n||{start:0,end:0}}else n=null;for($p={focusedElem:e,selectionRange:n},Tu=!1,W=t;W!==null;)if(t=W,e=t.child,(t.subtreeFlags&1028)!==0&&e!==null)e.return=t,W=e;else for(;W!==null;){t=W;try{var h=t.alternate;if(t.flags&1024)switch(t.tag){case 0:case 11:case 15:break;case 1:if(h!==null){var v=h.memoizedProps,y=h.memoizedState,g=t.stateNode,x=g.getSnapshotBeforeUpdate(t.elementType===t.type?v:xn(t.type,v),y);g.__reactInternalSnapshotBeforeUpdate=x}break;case 3:var w=t.stateNode.containerInfo;w.nodeType===1?w.textContent="":w.nodeType===9&&w.documentElement&&w.removeChild(w.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(F(163))}}catch(S){Ne(t,t.return,S)}if(e=t.sibling,e!==null){e.return=t.return,W=e;break}W=t.return}return h=p0,p0=!1,h}function Qa(e,t,n){var r=t.updateQueue;if(r=r!==null?r.lastEffect:null,r!==null){var i=r=r.next;do{if((i.tag&e)===e){var o=i.destroy;i.destroy=void 0,o!==void 0&&Gp(t,n,o)}i=i.next}while(i!==r)}}function ef(e,t){if(t=t.updateQueue,t=t!==null?t.lastEffect:null,t!==null){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function Xp(e){var t=e.ref;if(t!==null){var n=e.stateNode;switch(e.tag){case 5:e=n;break;default:e=n}typeof t=="function"?t(e):t.current=e}}function oP(e){var t=e.alternate;t!==null&&(e.alternate=null,oP(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&(delete t[zn],delete t[ds],delete t[Dp],delete t[$M],delete t[IM])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function aP(e){return e.tag===5||e.tag===3||e.tag===4}function h0(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||aP(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function Zp(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.nodeType===8?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(n.nodeType===8?(t=n.parentNode,t.insertBefore(e,n)):(t=n,t.appendChild(e)),n=n._reactRootContainer,n!=null||t.onclick!==null||(t.onclick=Nu));else if(r!==4&&(e=e.child,e!==null))for(Zp(e,t,n),e=e.sibling;e!==null;)Zp(e,t,n),e=e.sibling}function Qp(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(r!==4&&(e=e.child,e!==null))for(Qp(e,t,n),e=e.sibling;e!==null;)Qp(e,t,n),e=e.sibling}var at=null,wn=!1;function Dr(e,t,n){for(n=n.child;n!==null;)sP(e,t,n),n=n.sibling}function sP(e,t,n){if(Un&&typeof Un.onCommitFiberUnmount=="function")try{Un.onCommitFiberUnmount(Wc,n)}catch{}switch(n.tag){case 5:xt||Eo(n,t);case 6:var r=at,i=wn;at=null,Dr(e,t,n),at=r,wn=i,at!==null&&(wn?(e=at,n=n.stateNode,e.nodeType===8?e.parentNode.removeChild(n):e.removeChild(n)):at.removeChild(n.stateNode));break;case 18:at!==null&&(wn?(e=at,n=n.stateNode,e.nodeType===8?Od(e.parentNode,n):e.nodeType===1&&Od(e,n),ss(e)):Od(at,n.stateNode));break;case 4:r=at,i=wn,at=n.stateNode.containerInfo,wn=!0,Dr(e,t,n),at=r,wn=i;break;case 0:case 11:case 14:case 15:if(!xt&&(r=n.updateQueue,r!==null&&(r=r.lastEffect,r!==null))){i=r=r.next;do{var o=i,a=o.destroy;o=o.tag,a!==void 0&&(o&2||o&4)&&Gp(n,t,a),i=i.next}while(i!==r)}Dr(e,t,n);break;case 1:if(!xt&&(Eo(n,t),r=n.stateNode,typeof r.componentWillUnmount=="function"))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(s){Ne(n,t,s)}Dr(e,t,n);break;case 21:Dr(e,t,n);break;case 22:n.mode&1?(xt=(r=xt)||n.memoizedState!==null,Dr(e,t,n),xt=r):Dr(e,t,n);break;default:Dr(e,t,n)}}function m0(e){var t=e.updateQueue;if(t!==null){e.updateQueue=null;var n=e.stateNode;n===null&&(n=e.stateNode=new XM),t.forEach(function(r){var i=aT.bind(null,e,r);n.has(r)||(n.add(r),r.then(i,i))})}}function yn(e,t){var n=t.deletions;if(n!==null)for(var r=0;r<n.length;r++){var i=n[r];try{var o=e,a=t,s=a;e:for(;s!==null;){switch(s.tag){case 5:at=s.stateNode,wn=!1;break e;case 3:at=s.stateNode.containerInfo,wn=!0;break e;case 4:at=s.stateNode.containerInfo,wn=!0;break e}s=s.return}if(at===null)throw Error(F(160));sP(o,a,i),at=null,wn=!1;var l=i.alternate;l!==null&&(l.return=null),i.return=null}catch(u){Ne(i,t,u)}}if(t.subtreeFlags&12854)for(t=t.child;t!==null;)lP(t,e),t=t.sibling}function lP(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(yn(t,e),Nn(e),r&4){try{Qa(3,e,e.return),ef(3,e)}catch(v){Ne(e,e.return,v)}try{Qa(5,e,e.return)}catch(v){Ne(e,e.return,v)}}break;case 1:yn(t,e),Nn(e),r&512&&n!==null&&Eo(n,n.return);break;case 5:if(yn(t,e),Nn(e),r&512&&n!==null&&Eo(n,n.return),e.flags&32){var i=e.stateNode;try{rs(i,"")}catch(v){Ne(e,e.return,v)}}if(r&4&&(i=e.stateNode,i!=null)){var o=e.memoizedProps,a=n!==null?n.memoizedProps:o,s=e.type,l=e.updateQueue;if(e.updateQueue=null,l!==null)try{s==="input"&&o.type==="radio"&&o.name!=null&&jb(i,o),Sp(s,a);var u=Sp(s,o);for(a=0;a<l.length;a+=2){var c=l[a],f=l[a+1];c==="style"?Nb(i,f):c==="dangerouslySetInnerHTML"?$b(i,f):c==="children"?rs(i,f):xm(i,c,f,u)}switch(s){case"input":gp(i,o);break;case"textarea":Mb(i,o);break;case"select":var d=i._wrapperState.wasMultiple;i._wrapperState.wasMultiple=!!o.multiple;var p=o.value;p!=null?jo(i,!!o.multiple,p,!1):d!==!!o.multiple&&(o.defaultValue!=null?jo(i,!!o.multiple,o.defaultValue,!0):jo(i,!!o.multiple,o.multiple?[]:"",!1))}i[ds]=o}catch(v){Ne(e,e.return,v)}}break;case 6:if(yn(t,e),Nn(e),r&4){if(e.stateNode===null)throw Error(F(162));i=e.stateNode,o=e.memoizedProps;try{i.nodeValue=o}catch(v){Ne(e,e.return,v)}}break;case 3:if(yn(t,e),Nn(e),r&4&&n!==null&&n.memoizedState.isDehydrated)try{ss(t.containerInfo)}catch(v){Ne(e,e.return,v)}break;case 4:yn(t,e),Nn(e);break;case 13:yn(t,e),Nn(e),i=e.child,i.flags&8192&&(o=i.memoizedState!==null,i.stateNode.isHidden=o,!o||i.alternate!==null&&i.alternate.memoizedState!==null||(Qm=Re())),r&4&&m0(e);break;case 22:if(c=n!==null&&n.memoizedState!==null,e.mode&1?(xt=(u=xt)||c,yn(t,e),xt=u):yn(t,e),Nn(e),r&8192){if(u=e.memoizedState!==null,(e.stateNode.isHidden=u)&&!c&&e.mode&1)for(W=e,c=e.child;c!==null;){for(f=W=c;W!==null;){switch(d=W,p=d.child,d.tag){case 0:case 11:case 14:case 15:Qa(4,d,d.return);break;case 1:Eo(d,d.return);var h=d.stateNode;if(typeof h.componentWillUnmount=="function"){r=d,n=d.return;try{t=r,h.props=t.memoizedProps,h.state=t.memoizedState,h.componentWillUnmount()}catch(v){Ne(r,n,v)}}break;case 5:Eo(d,d.return);break;case 22:if(d.memoizedState!==null){g0(f);continue}}p!==null?(p.return=d,W=p):g0(f)}c=c.sibling}e:for(c=null,f=e;;){if(f.tag===5){if(c===null){c=f;try{i=f.stateNode,u?(o=i.style,typeof o.setProperty=="function"?o.setProperty("display","none","important"):o.display="none"):(s=f.stateNode,l=f.memoizedProps.style,a=l!=null&&l.hasOwnProperty("display")?l.display:null,s.style.display=Ib("display",a))}catch(v){Ne(e,e.return,v)}}}else if(f.tag===6){if(c===null)try{f.stateNode.nodeValue=u?"":f.memoizedProps}catch(v){Ne(e,e.return,v)}}else if((f.tag!==22&&f.tag!==23||f.memoizedState===null||f===e)&&f.child!==null){f.child.return=f,f=f.child;continue}if(f===e)break e;for(;f.sibling===null;){if(f.return===null||f.return===e)break e;c===f&&(c=null),f=f.return}c===f&&(c=null),f.sibling.return=f.return,f=f.sibling}}break;case 19:yn(t,e),Nn(e),r&4&&m0(e);break;case 21:break;default:yn(t,e),Nn(e)}}function Nn(e){var t=e.flags;if(t&2){try{e:{for(var n=e.return;n!==null;){if(aP(n)){var r=n;break e}n=n.return}throw Error(F(160))}switch(r.tag){case 5:var i=r.stateNode;r.flags&32&&(rs(i,""),r.flags&=-33);var o=h0(e);Qp(e,o,i);break;case 3:case 4:var a=r.stateNode.containerInfo,s=h0(e);Zp(e,s,a);break;default:throw Error(F(161))}}catch(l){Ne(e,e.return,l)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function QM(e,t,n){W=e,uP(e)}function uP(e,t,n){for(var r=(e.mode&1)!==0;W!==null;){var i=W,o=i.child;if(i.tag===22&&r){var a=i.memoizedState!==null||Ml;if(!a){var s=i.alternate,l=s!==null&&s.memoizedState!==null||xt;s=Ml;var u=xt;if(Ml=a,(xt=l)&&!u)for(W=i;W!==null;)a=W,l=a.child,a.tag===22&&a.memoizedState!==null?y0(i):l!==null?(l.return=a,W=l):y0(i);for(;o!==null;)W=o,uP(o),o=o.sibling;W=i,Ml=s,xt=u}v0(e)}else i.subtreeFlags&8772&&o!==null?(o.return=i,W=o):v0(e)}}function v0(e){for(;W!==null;){var t=W;if(t.flags&8772){var n=t.alternate;try{if(t.flags&8772)switch(t.tag){case 0:case 11:case 15:xt||ef(5,t);break;case 1:var r=t.stateNode;if(t.flags&4&&!xt)if(n===null)r.componentDidMount();else{var i=t.elementType===t.type?n.memoizedProps:xn(t.type,n.memoizedProps);r.componentDidUpdate(i,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var o=t.updateQueue;o!==null&&e0(t,o,r);break;case 3:var a=t.updateQueue;if(a!==null){if(n=null,t.child!==null)switch(t.child.tag){case 5:n=t.child.stateNode;break;case 1:n=t.child.stateNode}e0(t,a,n)}break;case 5:var s=t.stateNode;if(n===null&&t.flags&4){n=s;var l=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":l.autoFocus&&n.focus();break;case"img":l.src&&(n.src=l.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(t.memoizedState===null){var u=t.alternate;if(u!==null){var c=u.memoizedState;if(c!==null){var f=c.dehydrated;f!==null&&ss(f)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(F(163))}xt||t.flags&512&&Xp(t)}catch(d){Ne(t,t.return,d)}}if(t===e){W=null;break}if(n=t.sibling,n!==null){n.return=t.return,W=n;break}W=t.return}}function g0(e){for(;W!==null;){var t=W;if(t===e){W=null;break}var n=t.sibling;if(n!==null){n.return=t.return,W=n;break}W=t.return}}function y0(e){for(;W!==null;){var t=W;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{ef(4,t)}catch(l){Ne(t,n,l)}break;case 1:var r=t.stateNode;if(typeof r.componentDidMount=="function"){var i=t.return;try{r.componentDidMount()}catch(l){Ne(t,i,l)}}var o=t.return;try{Xp(t)}catch(l){Ne(t,o,l)}break;case 5:var a=t.return;try{Xp(t)}catch(l){Ne(t,a,l)}}}catch(l){Ne(t,t.return,l)}if(t===e){W=null;break}var s=t.sibling;if(s!==null){s.return=t.return,W=s;break}W=t.return}}var JM=Math.ceil,Wu=Cr.ReactCurrentDispatcher,Xm=Cr.ReactCurrentOwner,fn=Cr.ReactCurrentBatchConfig,ue=0,rt=null,ze=null,ct=0,Ut=0,ko=hi(0),We=0,ys=null,Ui=0,tf=0,Zm=0,Ja=null,Mt=null,Qm=0,Wo=1/0,tr=null,Yu=!1,Jp=null,ei=null,Tl=!1,Yr=null,qu=0,es=0,eh=null,pu=-1,hu=0;function Et(){return ue&6?Re():pu!==-1?pu:pu=Re()}function ti(e){return e.mode&1?ue&2&&ct!==0?ct&-ct:DM.transition!==null?(hu===0&&(hu=Yb()),hu):(e=he,e!==0||(e=window.event,e=e===void 0?16:eS(e.type)),e):1}function Cn(e,t,n,r){if(50<es)throw es=0,eh=null,Error(F(185));Fs(e,n,r),(!(ue&2)||e!==rt)&&(e===rt&&(!(ue&2)&&(tf|=n),We===4&&Hr(e,ct)),Dt(e,r),n===1&&ue===0&&!(t.mode&1)&&(Wo=Re()+500,Zc&&mi()))}function Dt(e,t){var n=e.callbackNode;Dj(e,t);var r=Mu(e,e===rt?ct:0);if(r===0)n!==null&&Cy(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(n!=null&&Cy(n),t===1)e.tag===0?NM(x0.bind(null,e)):xS(x0.bind(null,e)),MM(function(){!(ue&6)&&mi()}),n=null;else{switch(qb(r)){case 1:n=Om;break;case 4:n=Kb;break;case 16:n=ju;break;case 536870912:n=Wb;break;default:n=ju}n=gP(n,cP.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function cP(e,t){if(pu=-1,hu=0,ue&6)throw Error(F(327));var n=e.callbackNode;if(No()&&e.callbackNode!==n)return null;var r=Mu(e,e===rt?ct:0);if(r===0)return null;if(r&30||r&e.expiredLanes||t)t=Gu(e,r);else{t=r;var i=ue;ue|=2;var o=dP();(rt!==e||ct!==t)&&(tr=null,Wo=Re()+500,$i(e,t));do try{nT();break}catch(s){fP(e,s)}while(1);Rm(),Wu.current=o,ue=i,ze!==null?t=0:(rt=null,ct=0,t=We)}if(t!==0){if(t===2&&(i=Cp(e),i!==0&&(r=i,t=th(e,i))),t===1)throw n=ys,$i(e,0),Hr(e,r),Dt(e,Re()),n;if(t===6)Hr(e,r);else{if(i=e.current.alternate,!(r&30)&&!eT(i)&&(t=Gu(e,r),t===2&&(o=Cp(e),o!==0&&(r=o,t=th(e,o))),t===1))throw n=ys,$i(e,0),Hr(e,r),Dt(e,Re()),n;switch(e.finishedWork=i,e.finishedLanes=r,t){case 0:case 1:throw Error(F(345));case 2:Si(e,Mt,tr);break;case 3:if(Hr(e,r),(r&130023424)===r&&(t=Qm+500-Re(),10<t)){if(Mu(e,0)!==0)break;if(i=e.suspendedLanes,(i&r)!==r){Et(),e.pingedLanes|=e.suspendedLanes&i;break}e.timeoutHandle=Np(Si.bind(null,e,Mt,tr),t);break}Si(e,Mt,tr);break;case 4:if(Hr(e,r),(r&4194240)===r)break;for(t=e.eventTimes,i=-1;0<r;){var a=31-kn(r);o=1<<a,a=t[a],a>i&&(i=a),r&=~o}if(r=i,r=Re()-r,r=(120>r?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*JM(r/1960))-r,10<r){e.timeoutHandle=Np(Si.bind(null,e,Mt,tr),r);break}Si(e,Mt,tr);break;case 5:Si(e,Mt,tr);break;default:throw Error(F(329))}}}return Dt(e,Re()),e.callbackNode===n?cP.bind(null,e):null}function th(e,t){var n=Ja;return e.current.memoizedState.isDehydrated&&($i(e,t).flags|=256),e=Gu(e,t),e!==2&&(t=Mt,Mt=n,t!==null&&nh(t)),e}function nh(e){Mt===null?Mt=e:Mt.push.apply(Mt,e)}function eT(e){for(var t=e;;){if(t.flags&16384){var n=t.updateQueue;if(n!==null&&(n=n.stores,n!==null))for(var r=0;r<n.length;r++){var i=n[r],o=i.getSnapshot;i=i.value;try{if(!An(o(),i))return!1}catch{return!1}}}if(n=t.child,t.subtreeFlags&16384&&n!==null)n.return=t,t=n;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function Hr(e,t){for(t&=~Zm,t&=~tf,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-kn(t),r=1<<n;e[n]=-1,t&=~r}}function x0(e){if(ue&6)throw Error(F(327));No();var t=Mu(e,0);if(!(t&1))return Dt(e,Re()),null;var n=Gu(e,t);if(e.tag!==0&&n===2){var r=Cp(e);r!==0&&(t=r,n=th(e,r))}if(n===1)throw n=ys,$i(e,0),Hr(e,t),Dt(e,Re()),n;if(n===6)throw Error(F(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,Si(e,Mt,tr),Dt(e,Re()),null}function Jm(e,t){var n=ue;ue|=1;try{return e(t)}finally{ue=n,ue===0&&(Wo=Re()+500,Zc&&mi())}}function Vi(e){Yr!==null&&Yr.tag===0&&!(ue&6)&&No();var t=ue;ue|=1;var n=fn.transition,r=he;try{if(fn.transition=null,he=1,e)return e()}finally{he=r,fn.transition=n,ue=t,!(ue&6)&&mi()}}function ev(){Ut=ko.current,ke(ko)}function $i(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(n!==-1&&(e.timeoutHandle=-1,jM(n)),ze!==null)for(n=ze.return;n!==null;){var r=n;switch(Im(r),r.tag){case 1:r=r.type.childContextTypes,r!=null&&Du();break;case 3:Ho(),ke(It),ke(bt),Vm();break;case 5:Um(r);break;case 4:Ho();break;case 13:ke(Me);break;case 19:ke(Me);break;case 10:Lm(r.type._context);break;case 22:case 23:ev()}n=n.return}if(rt=e,ze=e=ni(e.current,null),ct=Ut=t,We=0,ys=null,Zm=tf=Ui=0,Mt=Ja=null,Ci!==null){for(t=0;t<Ci.length;t++)if(n=Ci[t],r=n.interleaved,r!==null){n.interleaved=null;var i=r.next,o=n.pending;if(o!==null){var a=o.next;o.next=i,r.next=a}n.pending=r}Ci=null}return e}function fP(e,t){do{var n=ze;try{if(Rm(),cu.current=Ku,Hu){for(var r=Te.memoizedState;r!==null;){var i=r.queue;i!==null&&(i.pending=null),r=r.next}Hu=!1}if(Bi=0,nt=He=Te=null,Za=!1,ms=0,Xm.current=null,n===null||n.return===null){We=1,ys=t,ze=null;break}e:{var o=e,a=n.return,s=n,l=t;if(t=ct,s.flags|=32768,l!==null&&typeof l=="object"&&typeof l.then=="function"){var u=l,c=s,f=c.tag;if(!(c.mode&1)&&(f===0||f===11||f===15)){var d=c.alternate;d?(c.updateQueue=d.updateQueue,c.memoizedState=d.memoizedState,c.lanes=d.lanes):(c.updateQueue=null,c.memoizedState=null)}var p=a0(a);if(p!==null){p.flags&=-257,s0(p,a,s,o,t),p.mode&1&&o0(o,u,t),t=p,l=u;var h=t.updateQueue;if(h===null){var v=new Set;v.add(l),t.updateQueue=v}else h.add(l);break e}else{if(!(t&1)){o0(o,u,t),tv();break e}l=Error(F(426))}}else if(_e&&s.mode&1){var y=a0(a);if(y!==null){!(y.flags&65536)&&(y.flags|=256),s0(y,a,s,o,t),Nm(Ko(l,s));break e}}o=l=Ko(l,s),We!==4&&(We=2),Ja===null?Ja=[o]:Ja.push(o),o=a;do{switch(o.tag){case 3:o.flags|=65536,t&=-t,o.lanes|=t;var g=qS(o,l,t);Jy(o,g);break e;case 1:s=l;var x=o.type,w=o.stateNode;if(!(o.flags&128)&&(typeof x.getDerivedStateFromError=="function"||w!==null&&typeof w.componentDidCatch=="function"&&(ei===null||!ei.has(w)))){o.flags|=65536,t&=-t,o.lanes|=t;var S=GS(o,s,t);Jy(o,S);break e}}o=o.return}while(o!==null)}hP(n)}catch(P){t=P,ze===n&&n!==null&&(ze=n=n.return);continue}break}while(1)}function dP(){var e=Wu.current;return Wu.current=Ku,e===null?Ku:e}function tv(){(We===0||We===3||We===2)&&(We=4),rt===null||!(Ui&268435455)&&!(tf&268435455)||Hr(rt,ct)}function Gu(e,t){var n=ue;ue|=2;var r=dP();(rt!==e||ct!==t)&&(tr=null,$i(e,t));do try{tT();break}catch(i){fP(e,i)}while(1);if(Rm(),ue=n,Wu.current=r,ze!==null)throw Error(F(261));return rt=null,ct=0,We}function tT(){for(;ze!==null;)pP(ze)}function nT(){for(;ze!==null&&!Cj();)pP(ze)}function pP(e){var t=vP(e.alternate,e,Ut);e.memoizedProps=e.pendingProps,t===null?hP(e):ze=t,Xm.current=null}function hP(e){var t=e;do{var n=t.alternate;if(e=t.return,t.flags&32768){if(n=GM(n,t),n!==null){n.flags&=32767,ze=n;return}if(e!==null)e.flags|=32768,e.subtreeFlags=0,e.deletions=null;else{We=6,ze=null;return}}else if(n=qM(n,t,Ut),n!==null){ze=n;return}if(t=t.sibling,t!==null){ze=t;return}ze=t=e}while(t!==null);We===0&&(We=5)}function Si(e,t,n){var r=he,i=fn.transition;try{fn.transition=null,he=1,rT(e,t,n,r)}finally{fn.transition=i,he=r}return null}function rT(e,t,n,r){do No();while(Yr!==null);if(ue&6)throw Error(F(327));n=e.finishedWork;var i=e.finishedLanes;if(n===null)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(F(177));e.callbackNode=null,e.callbackPriority=0;var o=n.lanes|n.childLanes;if(Rj(e,o),e===rt&&(ze=rt=null,ct=0),!(n.subtreeFlags&2064)&&!(n.flags&2064)||Tl||(Tl=!0,gP(ju,function(){return No(),null})),o=(n.flags&15990)!==0,n.subtreeFlags&15990||o){o=fn.transition,fn.transition=null;var a=he;he=1;var s=ue;ue|=4,Xm.current=null,ZM(e,n),lP(n,e),PM($p),Tu=!!Tp,$p=Tp=null,e.current=n,QM(n),_j(),ue=s,he=a,fn.transition=o}else e.current=n;if(Tl&&(Tl=!1,Yr=e,qu=i),o=e.pendingLanes,o===0&&(ei=null),Mj(n.stateNode),Dt(e,Re()),t!==null)for(r=e.onRecoverableError,n=0;n<t.length;n++)i=t[n],r(i.value,{componentStack:i.stack,digest:i.digest});if(Yu)throw Yu=!1,e=Jp,Jp=null,e;return qu&1&&e.tag!==0&&No(),o=e.pendingLanes,o&1?e===eh?es++:(es=0,eh=e):es=0,mi(),null}function No(){if(Yr!==null){var e=qb(qu),t=fn.transition,n=he;try{if(fn.transition=null,he=16>e?16:e,Yr===null)var r=!1;else{if(e=Yr,Yr=null,qu=0,ue&6)throw Error(F(331));var i=ue;for(ue|=4,W=e.current;W!==null;){var o=W,a=o.child;if(W.flags&16){var s=o.deletions;if(s!==null){for(var l=0;l<s.length;l++){var u=s[l];for(W=u;W!==null;){var c=W;switch(c.tag){case 0:case 11:case 15:Qa(8,c,o)}var f=c.child;if(f!==null)f.return=c,W=f;else for(;W!==null;){c=W;var d=c.sibling,p=c.return;if(oP(c),c===u){W=null;break}if(d!==null){d.return=p,W=d;break}W=p}}}var h=o.alternate;if(h!==null){var v=h.child;if(v!==null){h.child=null;do{var y=v.sibling;v.sibling=null,v=y}while(v!==null)}}W=o}}if(o.subtreeFlags&2064&&a!==null)a.return=o,W=a;else e:for(;W!==null;){if(o=W,o.flags&2048)switch(o.tag){case 0:case 11:case 15:Qa(9,o,o.return)}var g=o.sibling;if(g!==null){g.return=o.return,W=g;break e}W=o.return}}var x=e.current;for(W=x;W!==null;){a=W;var w=a.child;if(a.subtreeFlags&2064&&w!==null)w.return=a,W=w;else e:for(a=x;W!==null;){if(s=W,s.flags&2048)try{switch(s.tag){case 0:case 11:case 15:ef(9,s)}}catch(P){Ne(s,s.return,P)}if(s===a){W=null;break e}var S=s.sibling;if(S!==null){S.return=s.return,W=S;break e}W=s.return}}if(ue=i,mi(),Un&&typeof Un.onPostCommitFiberRoot=="function")try{Un.onPostCommitFiberRoot(Wc,e)}catch{}r=!0}return r}finally{he=n,fn.transition=t}}return!1}function w0(e,t,n){t=Ko(n,t),t=qS(e,t,1),e=Jr(e,t,1),t=Et(),e!==null&&(Fs(e,1,t),Dt(e,t))}function Ne(e,t,n){if(e.tag===3)w0(e,e,n);else for(;t!==null;){if(t.tag===3){w0(t,e,n);break}else if(t.tag===1){var r=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof r.componentDidCatch=="function"&&(ei===null||!ei.has(r))){e=Ko(n,e),e=GS(t,e,1),t=Jr(t,e,1),e=Et(),t!==null&&(Fs(t,1,e),Dt(t,e));break}}t=t.return}}function iT(e,t,n){var r=e.pingCache;r!==null&&r.delete(t),t=Et(),e.pingedLanes|=e.suspendedLanes&n,rt===e&&(ct&n)===n&&(We===4||We===3&&(ct&130023424)===ct&&500>Re()-Qm?$i(e,0):Zm|=n),Dt(e,t)}function mP(e,t){t===0&&(e.mode&1?(t=Sl,Sl<<=1,!(Sl&130023424)&&(Sl=4194304)):t=1);var n=Et();e=vr(e,t),e!==null&&(Fs(e,t,n),Dt(e,n))}function oT(e){var t=e.memoizedState,n=0;t!==null&&(n=t.retryLane),mP(e,n)}function aT(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,i=e.memoizedState;i!==null&&(n=i.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(F(314))}r!==null&&r.delete(t),mP(e,n)}var vP;vP=function(e,t,n){if(e!==null)if(e.memoizedProps!==t.pendingProps||It.current)Tt=!0;else{if(!(e.lanes&n)&&!(t.flags&128))return Tt=!1,YM(e,t,n);Tt=!!(e.flags&131072)}else Tt=!1,_e&&t.flags&1048576&&wS(t,zu,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;du(e,t),e=t.pendingProps;var i=Bo(t,bt.current);Io(t,n),i=Km(null,t,r,e,i,n);var o=Wm();return t.flags|=1,typeof i=="object"&&i!==null&&typeof i.render=="function"&&i.$$typeof===void 0?(t.tag=1,t.memoizedState=null,t.updateQueue=null,Nt(r)?(o=!0,Ru(t)):o=!1,t.memoizedState=i.state!==null&&i.state!==void 0?i.state:null,Fm(t),i.updater=Jc,t.stateNode=i,i._reactInternals=t,Up(t,r,e,n),t=Kp(null,t,r,!0,o,n)):(t.tag=0,_e&&o&&$m(t),Pt(null,t,i,n),t=t.child),t;case 16:r=t.elementType;e:{switch(du(e,t),e=t.pendingProps,i=r._init,r=i(r._payload),t.type=r,i=t.tag=lT(r),e=xn(r,e),i){case 0:t=Hp(null,t,r,e,n);break e;case 1:t=c0(null,t,r,e,n);break e;case 11:t=l0(null,t,r,e,n);break e;case 14:t=u0(null,t,r,xn(r.type,e),n);break e}throw Error(F(306,r,""))}return t;case 0:return r=t.type,i=t.pendingProps,i=t.elementType===r?i:xn(r,i),Hp(e,t,r,i,n);case 1:return r=t.type,i=t.pendingProps,i=t.elementType===r?i:xn(r,i),c0(e,t,r,i,n);case 3:e:{if(JS(t),e===null)throw Error(F(387));r=t.pendingProps,o=t.memoizedState,i=o.element,kS(e,t),Uu(t,r,null,n);var a=t.memoizedState;if(r=a.element,o.isDehydrated)if(o={element:r,isDehydrated:!1,cache:a.cache,pendingSuspenseBoundaries:a.pendingSuspenseBoundaries,transitions:a.transitions},t.updateQueue.baseState=o,t.memoizedState=o,t.flags&256){i=Ko(Error(F(423)),t),t=f0(e,t,r,n,i);break e}else if(r!==i){i=Ko(Error(F(424)),t),t=f0(e,t,r,n,i);break e}else for(Wt=Qr(t.stateNode.containerInfo.firstChild),qt=t,_e=!0,Sn=null,n=OS(t,null,r,n),t.child=n;n;)n.flags=n.flags&-3|4096,n=n.sibling;else{if(Uo(),r===i){t=gr(e,t,n);break e}Pt(e,t,r,n)}t=t.child}return t;case 5:return CS(t),e===null&&zp(t),r=t.type,i=t.pendingProps,o=e!==null?e.memoizedProps:null,a=i.children,Ip(r,i)?a=null:o!==null&&Ip(r,o)&&(t.flags|=32),QS(e,t),Pt(e,t,a,n),t.child;case 6:return e===null&&zp(t),null;case 13:return eP(e,t,n);case 4:return Bm(t,t.stateNode.containerInfo),r=t.pendingProps,e===null?t.child=Vo(t,null,r,n):Pt(e,t,r,n),t.child;case 11:return r=t.type,i=t.pendingProps,i=t.elementType===r?i:xn(r,i),l0(e,t,r,i,n);case 7:return Pt(e,t,t.pendingProps,n),t.child;case 8:return Pt(e,t,t.pendingProps.children,n),t.child;case 12:return Pt(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,i=t.pendingProps,o=t.memoizedProps,a=i.value,we(Fu,r._currentValue),r._currentValue=a,o!==null)if(An(o.value,a)){if(o.children===i.children&&!It.current){t=gr(e,t,n);break e}}else for(o=t.child,o!==null&&(o.return=t);o!==null;){var s=o.dependencies;if(s!==null){a=o.child;for(var l=s.firstContext;l!==null;){if(l.context===r){if(o.tag===1){l=fr(-1,n&-n),l.tag=2;var u=o.updateQueue;if(u!==null){u=u.shared;var c=u.pending;c===null?l.next=l:(l.next=c.next,c.next=l),u.pending=l}}o.lanes|=n,l=o.alternate,l!==null&&(l.lanes|=n),Fp(o.return,n,t),s.lanes|=n;break}l=l.next}}else if(o.tag===10)a=o.type===t.type?null:o.child;else if(o.tag===18){if(a=o.return,a===null)throw Error(F(341));a.lanes|=n,s=a.alternate,s!==null&&(s.lanes|=n),Fp(a,n,t),a=o.sibling}else a=o.child;if(a!==null)a.return=o;else for(a=o;a!==null;){if(a===t){a=null;break}if(o=a.sibling,o!==null){o.return=a.return,a=o;break}a=a.return}o=a}Pt(e,t,i.children,n),t=t.child}return t;case 9:return i=t.type,r=t.pendingProps.children,Io(t,n),i=dn(i),r=r(i),t.flags|=1,Pt(e,t,r,n),t.child;case 14:return r=t.type,i=xn(r,t.pendingProps),i=xn(r.type,i),u0(e,t,r,i,n);case 15:return XS(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,i=t.pendingProps,i=t.elementType===r?i:xn(r,i),du(e,t),t.tag=1,Nt(r)?(e=!0,Ru(t)):e=!1,Io(t,n),YS(t,r,i),Up(t,r,i,n),Kp(null,t,r,!0,e,n);case 19:return tP(e,t,n);case 22:return ZS(e,t,n)}throw Error(F(156,t.tag))};function gP(e,t){return Hb(e,t)}function sT(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function ln(e,t,n,r){return new sT(e,t,n,r)}function nv(e){return e=e.prototype,!(!e||!e.isReactComponent)}function lT(e){if(typeof e=="function")return nv(e)?1:0;if(e!=null){if(e=e.$$typeof,e===bm)return 11;if(e===Sm)return 14}return 2}function ni(e,t){var n=e.alternate;return n===null?(n=ln(e.tag,t,e.key,e.mode),n.elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=e.flags&14680064,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function mu(e,t,n,r,i,o){var a=2;if(r=e,typeof e=="function")nv(e)&&(a=1);else if(typeof e=="string")a=5;else e:switch(e){case vo:return Ii(n.children,i,o,t);case wm:a=8,i|=8;break;case dp:return e=ln(12,n,t,i|2),e.elementType=dp,e.lanes=o,e;case pp:return e=ln(13,n,t,i),e.elementType=pp,e.lanes=o,e;case hp:return e=ln(19,n,t,i),e.elementType=hp,e.lanes=o,e;case Cb:return nf(n,i,o,t);default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case Eb:a=10;break e;case kb:a=9;break e;case bm:a=11;break e;case Sm:a=14;break e;case zr:a=16,r=null;break e}throw Error(F(130,e==null?e:typeof e,""))}return t=ln(a,n,t,i),t.elementType=e,t.type=r,t.lanes=o,t}function Ii(e,t,n,r){return e=ln(7,e,r,t),e.lanes=n,e}function nf(e,t,n,r){return e=ln(22,e,r,t),e.elementType=Cb,e.lanes=n,e.stateNode={isHidden:!1},e}function Td(e,t,n){return e=ln(6,e,null,t),e.lanes=n,e}function $d(e,t,n){return t=ln(4,e.children!==null?e.children:[],e.key,t),t.lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function uT(e,t,n,r,i){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=pd(0),this.expirationTimes=pd(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=pd(0),this.identifierPrefix=r,this.onRecoverableError=i,this.mutableSourceEagerHydrationData=null}function rv(e,t,n,r,i,o,a,s,l){return e=new uT(e,t,n,s,l),t===1?(t=1,o===!0&&(t|=8)):t=0,o=ln(3,null,null,t),e.current=o,o.stateNode=e,o.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},Fm(o),e}function cT(e,t,n){var r=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:mo,key:r==null?null:""+r,children:e,containerInfo:t,implementation:n}}function yP(e){if(!e)return ai;e=e._reactInternals;e:{if(Ji(e)!==e||e.tag!==1)throw Error(F(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(Nt(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(t!==null);throw Error(F(171))}if(e.tag===1){var n=e.type;if(Nt(n))return yS(e,n,t)}return t}function xP(e,t,n,r,i,o,a,s,l){return e=rv(n,r,!0,e,i,o,a,s,l),e.context=yP(null),n=e.current,r=Et(),i=ti(n),o=fr(r,i),o.callback=t??null,Jr(n,o,i),e.current.lanes=i,Fs(e,i,r),Dt(e,r),e}function rf(e,t,n,r){var i=t.current,o=Et(),a=ti(i);return n=yP(n),t.context===null?t.context=n:t.pendingContext=n,t=fr(o,a),t.payload={element:e},r=r===void 0?null:r,r!==null&&(t.callback=r),e=Jr(i,t,a),e!==null&&(Cn(e,i,a,o),uu(e,i,a)),a}function Xu(e){if(e=e.current,!e.child)return null;switch(e.child.tag){case 5:return e.child.stateNode;default:return e.child.stateNode}}function b0(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var n=e.retryLane;e.retryLane=n!==0&&n<t?n:t}}function iv(e,t){b0(e,t),(e=e.alternate)&&b0(e,t)}function fT(){return null}var wP=typeof reportError=="function"?reportError:function(e){console.error(e)};function ov(e){this._internalRoot=e}of.prototype.render=ov.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(F(409));rf(e,t,null,null)};of.prototype.unmount=ov.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;Vi(function(){rf(null,e,null,null)}),t[mr]=null}};function of(e){this._internalRoot=e}of.prototype.unstable_scheduleHydration=function(e){if(e){var t=Zb();e={blockedOn:null,target:e,priority:t};for(var n=0;n<Vr.length&&t!==0&&t<Vr[n].priority;n++);Vr.splice(n,0,e),n===0&&Jb(e)}};function av(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function af(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11&&(e.nodeType!==8||e.nodeValue!==" react-mount-point-unstable "))}function S0(){}function dT(e,t,n,r,i){if(i){if(typeof r=="function"){var o=r;r=function(){var u=Xu(a);o.call(u)}}var a=xP(t,r,e,0,null,!1,!1,"",S0);return e._reactRootContainer=a,e[mr]=a.current,cs(e.nodeType===8?e.parentNode:e),Vi(),a}for(;i=e.lastChild;)e.removeChild(i);if(typeof r=="function"){var s=r;r=function(){var u=Xu(l);s.call(u)}}var l=rv(e,0,!1,null,null,!1,!1,"",S0);return e._reactRootContainer=l,e[mr]=l.current,cs(e.nodeType===8?e.parentNode:e),Vi(function(){rf(t,l,n,r)}),l}function sf(e,t,n,r,i){var o=n._reactRootContainer;if(o){var a=o;if(typeof i=="function"){var s=i;i=function(){var l=Xu(a);s.call(l)}}rf(t,a,e,i)}else a=dT(n,t,e,i,r);return Xu(a)}Gb=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=Fa(t.pendingLanes);n!==0&&(Em(t,n|1),Dt(t,Re()),!(ue&6)&&(Wo=Re()+500,mi()))}break;case 13:Vi(function(){var r=vr(e,1);if(r!==null){var i=Et();Cn(r,e,1,i)}}),iv(e,1)}};km=function(e){if(e.tag===13){var t=vr(e,134217728);if(t!==null){var n=Et();Cn(t,e,134217728,n)}iv(e,134217728)}};Xb=function(e){if(e.tag===13){var t=ti(e),n=vr(e,t);if(n!==null){var r=Et();Cn(n,e,t,r)}iv(e,t)}};Zb=function(){return he};Qb=function(e,t){var n=he;try{return he=e,t()}finally{he=n}};Op=function(e,t,n){switch(t){case"input":if(gp(e,n),t=n.name,n.type==="radio"&&t!=null){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var i=Xc(r);if(!i)throw Error(F(90));Ab(r),gp(r,i)}}}break;case"textarea":Mb(e,n);break;case"select":t=n.value,t!=null&&jo(e,!!n.multiple,t,!1)}};Lb=Jm;zb=Vi;var pT={usingClientEntryPoint:!1,Events:[Us,wo,Xc,Db,Rb,Jm]},Ca={findFiberByHostInstance:ki,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},hT={bundleType:Ca.bundleType,version:Ca.version,rendererPackageName:Ca.rendererPackageName,rendererConfig:Ca.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:Cr.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return e=Ub(e),e===null?null:e.stateNode},findFiberByHostInstance:Ca.findFiberByHostInstance||fT,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var $l=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!$l.isDisabled&&$l.supportsFiber)try{Wc=$l.inject(hT),Un=$l}catch{}}en.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=pT;en.createPortal=function(e,t){var n=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!av(t))throw Error(F(200));return cT(e,t,null,n)};en.createRoot=function(e,t){if(!av(e))throw Error(F(299));var n=!1,r="",i=wP;return t!=null&&(t.unstable_strictMode===!0&&(n=!0),t.identifierPrefix!==void 0&&(r=t.identifierPrefix),t.onRecoverableError!==void 0&&(i=t.onRecoverableError)),t=rv(e,1,!1,null,null,n,!1,r,i),e[mr]=t.current,cs(e.nodeType===8?e.parentNode:e),new ov(t)};en.findDOMNode=function(e){if(e==null)return null;if(e.nodeType===1)return e;var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(F(188)):(e=Object.keys(e).join(","),Error(F(268,e)));return e=Ub(t),e=e===null?null:e.stateNode,e};en.flushSync=function(e){return Vi(e)};en.hydrate=function(e,t,n){if(!af(t))throw Error(F(200));return sf(null,e,t,!0,n)};en.hydrateRoot=function(e,t,n){if(!av(e))throw Error(F(405));var r=n!=null&&n.hydratedSources||null,i=!1,o="",a=wP;if(n!=null&&(n.unstable_strictMode===!0&&(i=!0),n.identifierPrefix!==void 0&&(o=n.identifierPrefix),n.onRecoverableError!==void 0&&(a=n.onRecoverableError)),t=xP(t,null,e,1,n??null,i,!1,o,a),e[mr]=t.current,cs(e),r)for(e=0;e<r.length;e++)n=r[e],i=n._getVersion,i=i(n._source),t.mutableSourceEagerHydrationData==null?t.mutableSourceEagerHydrationData=[n,i]:t.mutableSourceEagerHydrationData.push(n,i);return new of(t)};en.render=function(e,t,n){if(!af(t))throw Error(F(200));return sf(null,e,t,!1,n)};en.unmountComponentAtNode=function(e){if(!af(e))throw Error(F(40));return e._reactRootContainer?(Vi(function(){sf(null,null,e,!1,function(){e._reactRootContainer=null,e[mr]=null})}),!0):!1};en.unstable_batchedUpdates=Jm;en.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!af(n))throw Error(F(200));if(e==null||e._reactInternals===void 0)throw Error(F(38));return sf(e,t,n,!1,r)};en.version="18.3.1-next-f1338f8080-20240426";function bP(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(bP)}catch(e){console.error(e)}}bP(),bb.exports=en;var ia=bb.exports;const mT=kr(ia);var P0=ia;cp.createRoot=P0.createRoot,cp.hydrateRoot=P0.hydrateRoot;const vT=({onLoginStart:e,onLoginComplete:t})=>{const[n,r]=m.useState(!1),i=()=>{n||(r(!0),e(),setTimeout(()=>{t()},1500))};return b.jsxs("div",{className:"absolute inset-0 flex items-center justify-center",children:[b.jsx("div",{className:"absolute inset-0",style:{backgroundImage:"url(/load.png)",backgroundSize:"cover",backgroundPosition:"center",backgroundRepeat:"no-repeat"}}),b.jsx("div",{className:"absolute inset-0",style:{backgroundColor:"#0B5B38",opacity:n?.8:0,transition:"opacity 1.5s ease-in-out"}}),b.jsx("button",{onClick:i,disabled:n,className:`relative z-10 flex items-center justify-center ${n?"cursor-default":"cursor-pointer hover:scale-105"}`,style:{backgroundColor:"transparent",border:"none",outline:"none",transition:"transform 0.3s ease-in-out"},children:b.jsx("svg",{width:"247",height:"247",viewBox:"0 0 247 247",fill:"none",xmlns:"http://www.w3.org/2000/svg",style:{width:"96px",height:"96px",transition:"fill 1.5s ease-in-out"},children:b.jsx("path",{d:"M247 179.322C247 81.51 160.056 0 64.714 0C39.026 0 21.242 17.537 21.242 39.767C21.242 62.491 39.52 78.052 63.726 80.275C116.337 85.215 158.08 127.946 158.08 156.845C158.08 166.972 153.387 172.9 144.495 172.9C118.313 172.9 113.373 123.5 61.75 123.5C27.417 123.5 0 150.917 0 185.25C0 220.077 28.158 247 62.491 247C114.114 247 119.301 197.6 144.989 197.6C171.912 197.6 172.159 230.945 206.986 231.439C232.18 231.686 247 213.161 247 179.322Z",fill:n?"#ffffff":"#0B5B38"})})})]})},SP="",PP=e=>{switch(e){case"Stress":return"tense";case"Entertainment":return"joy";case"Calm":return"calm";case"Meditation":return"calm";default:return"calm"}},eoK=["hr","br","sdnn","lf_hf_ratio","hf","lf","spo2","time"];let eoM=null,eoS=null,eoE=null;const eoJ=e=>{if(!(e.since===void 0||e.reset===!0)){if(!eoM||eoS===null||e.epoch!==eoE||e.since>eoS)return!1;const t=e.seq-eoS;if(t<=0)return!0;var o;const n=(o=e.max_points)!=null?o:Number.MAX_SAFE_INTEGER,r=eoM,i={...e};for(const a of eoK)i[a]=r[a].concat(e[a].slice(-t)).slice(-n);eoM=i}else eoM={...e};return eoM.lf_hf=eoM.lf_hf_ratio,eoS=e.seq,eoE=e.epoch,!0};let eoL=0,eoT=!1;const eoR=()=>{eoT||(eoT=!0,sb.onStateUpdate(()=>eoM&&eoS!==null&&eoE!==null?{since:eoS,epoch:eoE}:{},e=>{if(!eoJ(e)){eoM=null,eoS=null,sb.resubscribeState();return}eoL=Date.now()}))},eo=async()=>{if(eoR(),eoM&&Date.now()-eoL<3e3)return eoM;try{for(let e=0;e<2;e++){const t=eoM&&eoS!==null?`?since=${eoS}`:"",n=await fetch(`${SP}/api/state${t}`,{cache:"no-cache"});if(!n.ok)return console.warn("Backend API not available, using mock data"),null;if(eoJ(await n.json()))return eoM;eoM=null,eoS=null}return eoM}catch(e){return console.warn("Failed to fetch backend state:",e),null}},gT=async()=>{const e=await eo();return!e||!e.br||e.br.length===0?[]:e.br.map((t,n)=>({hour:0,minute:0,value:t,time:n.toString().padStart(2,"0"),timestamp:Date.now()-(e.br.length-n)*1e3}))},yT=async()=>{const e=await eo();if(!e||!e.sdnn||e.sdnn.length===0)return{value:50};const t=e.sdnn[e.sdnn.length-1],r=100-Math.min(200,Math.max(0,t))/200*100;return{value:Math.round(r)}},xT=async()=>{const e=await eo();if(!e||e.valence_score===null)return{value:50};const t=(e.valence_score+3)/6;return{value:Math.round(t*100)}},wT=async()=>{const e=await eo();if(!e||!e.lf_hf||e.lf_hf.length===0)return{value:1};const t=e.lf_hf[e.lf_hf.length-1];return{value:Math.round(t*10)/10}},bT=async()=>{const e=await eo();if(!e||e.arousal_score===null)return{value:50};const t=(e.arousal_score+3)/6;return{value:Math.round(t*100)}},ST=async()=>{try{const e=await fetch(`${SP}/api/special_mode`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({command:"enter_special_mode",timestamp:new Date().toISOString()})});return e.ok?await e.json():(console.warn("Failed to send special mode command"),{success:!1,message:"Request failed"})}catch(e){return console.error("Error sending special mode command:",e),{success:!1,message:"Network error"}}},OP={calm:{type:"calm",label:"平静",color:"#32CD32",image:"/calm_bg.png"},joy:{type:"joy",label:"开心",color:"#FFD700",image:"/joy_bg.png"},low:{type:"low",label:"低落",color:"#4169E1",image:"/low_bg.png"},tense:{type:"tense",label:"紧张",color:"#FF4500",image:"/tense_bg.png"}},gt=e=>{const t=new Date;return t.setDate(t.getDate()-e),t.toISOString().split("T")[0]},Il=(e,t=!1)=>{const n=["calm","joy","low","tense"];if(t)return Array.from({length:24},(r,i)=>({date:e,hour:i,emotion:n[Math.floor(Math.random()*n.length)]}));{const r=Math.floor(Math.random()*9)+8,i=new Set;for(;i.size<r;)i.add(Math.floor(Math.random()*24));return Array.from(i).sort((o,a)=>o-a).map(o=>({date:e,hour:o,emotion:n[Math.floor(Math.random()*n.length)]}))}},PT=()=>{const e=new Date;return e.setHours(e.getHours()-2),e.toISOString()},xs={id:"1",name:"Demo User",currentEmotion:"joy",currentEmotionTimestamp:PT(),weeklyEmotions:[{date:gt(6),emotion:"joy"},{date:gt(5),emotion:null},{date:gt(4),emotion:"calm"},{date:gt(3),emotion:null},{date:gt(2),emotion:"tense"},{date:gt(1),emotion:null},{date:gt(0),emotion:"joy"}],hourlyEmotions:{[gt(6)]:Il(gt(6),!1),[gt(4)]:Il(gt(4),!1),[gt(2)]:Il(gt(2),!1),[gt(0)]:Il(gt(0),!1)}},OT=async()=>{try{const e=await eo();if(e&&e.emotion_state)return{emotion:PP(e.emotion_state),timestamp:new Date().toISOString()}}catch(e){console.warn("Backend unavailable, using mock data:",e)}return await new Promise(e=>setTimeout(e,100)),{emotion:xs.currentEmotion,timestamp:xs.currentEmotionTimestamp}},ET=async()=>{await new Promise(e=>setTimeout(e,100));try{const e=await eo();if(e&&e.emotion_state){const t=gt(0),n=PP(e.emotion_state);return xs.weeklyEmotions.map(r=>r.date===t?{...r,emotion:n}:r)}}catch(e){console.warn("Backend unavailable for weekly emotions:",e)}return xs.weeklyEmotions},EP=async e=>(await new Promise(t=>setTimeout(t,100)),xs.hourlyEmotions[e]||[]),kT=()=>{const e=[];for(let t=1;t<=60;t++){const n=t,r=Date.now()-(60-t)*1e3,i=15,o=Math.sin(t*.1)*5+Math.cos(t*.15)*3+Math.random()*2-1,a=Math.max(3,Math.min(28,Math.round((i+o)*10)/10));e.push({hour:0,minute:0,value:a,time:n.toString().padStart(2,"0"),timestamp:r})}return e},CT=async()=>{try{const e=await gT();if(e&&e.length>0)return e}catch(e){console.warn("Backend unavailable for respiration data:",e)}return await new Promise(e=>setTimeout(e,100)),kT()},_T=async()=>{try{const e=await yT();if(e)return e}catch(e){console.warn("Backend unavailable for stress level:",e)}return await new Promise(e=>setTimeout(e,100)),{value:Math.floor(Math.random()*101)}},AT=async()=>{try{const e=await xT();if(e)return e}catch(e){console.warn("Backend unavailable for stress recovery:",e)}return await new Promise(e=>setTimeout(e,100)),{value:Math.floor(Math.random()*101)}},jT=async()=>{try{const e=await wT();if(e)return e}catch(e){console.warn("Backend unavailable for autonomic balance:",e)}return await new Promise(e=>setTimeout(e,100)),{value:Math.round((.1+Math.random()*4.9)*10)/10}},MT=async()=>{try{const e=await bT();if(e)return e}catch(e){console.warn("Backend unavailable for autonomic activity:",e)}return await new Promise(e=>setTimeout(e,100)),{value:Math.floor(Math.random()*101)}},TT=()=>{const e=[],t=new Date;for(let n=0;n<7;n++){const r=new Date(t);r.setDate(r.getDate()-n);const i=Math.floor(Math.random()*3)+1;for(let o=0;o<i;o++){const a=new Date(r);a.setHours(Math.floor(Math.random()*12)+8),a.setMinutes(Math.floor(Math.random()*60)),e.push({id:`${r.toISOString().split("T")[0]}-${o}`,duration:Math.floor(Math.random()*120)+30,score:Math.floor(Math.random()*30)+70,date:r.toISOString().split("T")[0],timestamp:a.toISOString()})}}return e.sort((n,r)=>new Date(r.timestamp).getTime()-new Date(n.timestamp).getTime())},$T=async()=>(await new Promise(e=>setTimeout(e,100)),TT()),IT=({emotion:e,timestamp:t,onDoubleClick:n})=>{const r=OP[e],i=a=>{const s=new Date(a),l=s.getHours().toString().padStart(2,"0"),u=s.getMinutes().toString().padStart(2,"0"),f=["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"][s.getMonth()],d=s.getDate();return`${l}:${u} ${f} ${d}`},o=async()=>{console.log("EmotionSphere double clicked, sending special mode command...");try{const a=await ST();console.log("Special mode command result:",a),n&&n()}catch(a){console.error("Failed to send special mode command:",a)}};return b.jsxs("div",{className:"relative w-full h-full flex items-center justify-center cursor-pointer",onDoubleClick:o,children:[b.jsx("img",{src:r.image,alt:r.label,className:"absolute inset-0 w-full h-full object-cover"}),b.jsxs("div",{className:"relative z-10 flex flex-col items-center justify-center",children:[b.jsx("div",{className:"text-3xl font-bold text-white drop-shadow-2xl mb-2",children:e}),t&&b.jsx("div",{className:"text-sm text-white drop-shadow-lg font-medium",children:i(t)})]})]})},kP=1179,CP=2556,lo=CP/kP,NT=()=>{const[e,t]=m.useState(()=>{const n=window.innerWidth,r=window.innerHeight;let i,o;return n*lo<=r?(i=n,o=i*lo):(o=r,i=o/lo),{width:Math.round(i),height:Math.round(o)}});return m.useEffect(()=>{const n=()=>{const r=window.innerWidth,i=window.innerHeight;let o,a;r*lo<=i?(o=r,a=o*lo):(a=i,o=a/lo),t({width:Math.round(o),height:Math.round(a)})};return n(),window.addEventListener("resize",n),()=>window.removeEventListener("resize",n)},[]),e},E=(e,t)=>e/kP*t,T=(e,t)=>e/CP*t,DT=({weeklyEmotions:e,selectedDate:t,onDateSelect:n,onSelectedPosition:r,onAtlasButtonClick:i,containerWidth:o=1179,containerHeight:a=2556})=>{const s=E(1069,o),l=T(911,a),u=E(55,o),c=E(33,o),f=E(16,o),d=E(5,o),p=E(6,o),h=E(35,o),v=`${d}px ${p}px ${h}px rgba(0, 0, 0, 0.13)`,y=E(236,o),g=T(69,a),x=E(28,o),w=T(27,a),S=E(53,o),P=E(161,o),O=T(47,a),k=E(66,o),j=T(40,a),M=E(36,o),A=T(42,a),C=E(77,o),_=T(43,a),N=E(36,o),L=T(42,a),V="#B5A6B0",B="#82797F",U=E(77,o),$={calm:"#8AD48A",joy:"#FFF2B2",low:"#CEDEF9",tense:"#FFD2D2"},z=T(196,a),K=T(255,a),X=T(341,a),re=E(58,o),Se=s-re*2,le=E(78,o),se=C*6+le,de=(Se-se)/6;let ne=re;const Z=[ne];ne+=C+de,Z.push(ne),ne+=C+de,Z.push(ne),ne+=C+de,Z.push(ne),ne+=le+de,Z.push(ne),ne+=C+de,Z.push(ne),ne+=C+de,Z.push(ne);const D=[C,C,C,E(78,o),C,C,C],H=E(70,o),q=T(34,a),R=E(38,o),G=["日","一","二","三","四","五","六"],ee=m.useRef({}),te=ye=>{const nn=new Date(ye);return G[nn.getDay()]},ce=ye=>new Date(ye).getDate(),ge=T(509,a),je=E(50,o),Ve=E(15,o),Ft=E(33,a),Bt=E(35.9,o),xi=`${Ve}px ${Ft}px ${Bt}px rgba(70, 70, 70, 0.11)`;return b.jsxs("div",{className:"flex flex-col relative",style:{width:`${s}px`,height:`${l}px`,left:`${u}px`,background:"#FBF7F9",borderRadius:`${c}px`,boxShadow:v,padding:`${f}px`,overflow:"hidden"},children:[b.jsx("div",{className:"absolute",style:{width:`${s}px`,height:`${ge}px`,left:`${-f}px`,top:`${-f}px`,background:"rgba(246, 237, 243, 0.47)",borderRadius:`${je}px`,boxShadow:xi,zIndex:1}}),b.jsx("div",{className:"absolute z-10",style:{width:`${y}px`,height:`${g}px`,left:`${x}px`,top:`${w}px`,background:"#DDCFD8",opacity:.8,borderRadius:`${S}px`}}),b.jsx("h2",{className:"absolute font-medium text-center z-10",style:{width:`${P}px`,height:`${O}px`,left:`${k}px`,top:`${j}px`,fontSize:`${M}px`,lineHeight:`${A}px`,color:"#FFFFFF",fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontWeight:500},children:"情绪日历"}),i&&b.jsx("button",{onClick:ye=>{ye.preventDefault(),ye.stopPropagation(),console.log("Atlas button clicked"),i()},className:"absolute cursor-pointer",style:{top:`${q}px`,right:`${R}px`,width:`${H}px`,height:`${H}px`,backgroundImage:"url(/emo_atlas.png)",backgroundSize:"cover",backgroundPosition:"center",backgroundRepeat:"no-repeat",border:"none",outline:"none",zIndex:50,pointerEvents:"auto"},"aria-label":"打开情绪图集"}),b.jsx("div",{className:"relative z-10",style:{width:"100%",height:"100%"},children:e.map((ye,nn)=>{const Ir=ye.emotion?OP[ye.emotion]:null,io=ye.date===t,oo=te(ye.date),ya=ce(ye.date),ao=Z[nn],dl=D[nn],pl=ye.emotion?$[ye.emotion]:void 0;return b.jsxs("div",{className:"absolute",children:[b.jsx("div",{className:"absolute text-center",style:{width:`${dl}px`,height:`${_}px`,left:`${ao}px`,top:`${z}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:500,fontSize:`${N}px`,lineHeight:`${L}px`,color:V},children:oo}),b.jsx("div",{className:"absolute text-center",style:{width:`${dl}px`,height:`${_}px`,left:`${ao}px`,top:`${K}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:500,fontSize:`${N}px`,lineHeight:`${L}px`,color:B},children:ya}),ye.emotion&&pl&&Ir?b.jsx("button",{ref:xa=>{ee.current[ye.date]=xa},onClick:()=>n(ye.date),className:"absolute rounded-full transition-all",style:{width:`${U}px`,height:`${U}px`,left:`${ao}px`,top:`${X}px`,backgroundColor:pl,border:"none",cursor:"pointer",transform:io?"scale(1.1)":"scale(1)",...io&&{boxShadow:"0 0 0 2px #3B82F6, 0 0 0 4px white"}},"aria-label":`${ye.date} - ${Ir.label}`}):b.jsx("div",{className:"absolute rounded-full",style:{width:`${U}px`,height:`${U}px`,left:`${ao}px`,top:`${X}px`,boxSizing:"border-box",opacity:.88,border:`2px dashed ${V}`,backgroundColor:"transparent"}})]},ye.date)})})]})},RT=({hourlyEmotions:e,containerWidth:t=1179,containerHeight:n=2556})=>{const r=E(1069,t),i=T(342,n),o=E(55,t),a=E(16,t),s=E(50,t),l=E(15,t),u=E(33,n),c=E(35.9,t),f=`${l}px ${u}px ${c}px rgba(70, 70, 70, 0.11)`,d="rgba(246, 237, 243, 0.47)",p=E(43,t),v=E(1031,t)-p,y=E(37,t),g=Math.round(y),x=g/2,w={joy:"#FFF2B2",tense:"#FFD2D2",calm:"#8AD48A",low:"#CEDEF9"},S=T(74,n),O=T(165,n)-S,k=g/10,j=g*4,M=k*3,C=(O-j-M)/2,_=g*1.5,N={joy:S+C+_,tense:S+C+_+g+k,calm:S+C+_+g*2+k*2,low:S+C+_+g*3+k*3},L=E(77,t),V=T(43,n),B=E(28,t),U=T(34,n),$="rgba(181, 166, 176, 0.9)",z=T(252,n),K=E(43,t),X=T(249,n),re=E(988,t),Se="#E3D7DF",le=E(2,t),se=E(221,t),de=T(64,n),ne="#E3D7DF",Z=E(2,t),D=new Map;e.forEach(G=>{G.hour!==void 0&&G.hour>=0&&G.hour<=23&&D.set(G.hour,G)});const H=G=>p+G/23*v,q={6:H(6),12:H(12),18:H(18)},R={0:H(0),6:H(6),12:H(12),18:H(18)};return b.jsxs("div",{className:"absolute",style:{width:`${r}px`,height:`${i}px`,left:`${o}px`,top:`${T(2110,n)-T(1541,n)}px`,padding:`${a}px`,background:d,borderRadius:`${s}px`,boxShadow:f,overflow:"visible",zIndex:1},children:[b.jsx("div",{className:"absolute",style:{width:`${re}px`,height:`${le}px`,left:`${K}px`,top:`${X}px`,background:Se}}),[6,12,18].map(G=>b.jsx("div",{className:"absolute",style:{width:`${Z}px`,height:`${se}px`,left:`${q[G]}px`,top:`${de}px`,borderLeft:`${Z}px dashed ${ne}`,background:"transparent"}},`vertical-line-${G}`)),Array.from({length:24},(G,ee)=>{const te=D.get(ee);if(!te||!te.emotion)return null;const ce=H(ee)-x,ge=N[te.emotion]-x,je=w[te.emotion]||"#CEDEF9";return b.jsx("div",{className:"absolute",style:{width:`${g}px`,height:`${g}px`,left:`${ce}px`,top:`${ge}px`,background:je,borderRadius:"50%",boxSizing:"border-box"}},ee)}),[0,6,12,18].map(G=>{const ee=R[G]+Z*4;return b.jsxs("div",{className:"absolute",style:{width:`${L}px`,height:`${V}px`,left:`${ee}px`,top:`${z}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:500,fontSize:`${B}px`,lineHeight:`${U}px`,color:$,whiteSpace:"nowrap",overflow:"visible",textAlign:"left"},children:[G,"时"]},`label-${G}`)})]})},O0=({onIconClick:e,onAvatarClick:t,containerWidth:n=1179,containerHeight:r=2556})=>{const i=E(151,n),o=T(167,r),a=E(64,n),s=E(320,n),l=T(84,r),u=T(213,r),c=E(430,n),f=E(52,n),d=E(151,n),p=T(167,r),h=E(965,n),v=E(56.37,n),y=T(50.82,r),g=E(4,n),x=E(35,n),w=`0px ${g}px ${x}px 0px #0000001F`,S=T(40,r);return b.jsxs("div",{className:"w-full flex items-center justify-between relative z-10",style:{paddingLeft:`${E(16,n)}px`,paddingRight:`${E(16,n)}px`,paddingTop:`${S}px`,paddingBottom:`${T(12,r)}px`},children:[b.jsx("button",{onClick:t,className:"absolute cursor-pointer",style:{background:"transparent",border:"none",outline:"none",width:`${i}px`,height:`${i}px`,top:`${o}px`,left:`${a}px`},children:b.jsx("img",{src:"/usr_photo.png",alt:"用户头像",className:"rounded-full object-cover",style:{width:"100%",height:"100%"}})}),b.jsx("div",{className:"absolute flex items-center justify-center",style:{width:`${s}px`,height:`${l}px`,top:`${u}px`,left:`${c}px`},children:b.jsx("h1",{className:"text-black text-center w-full",style:{fontFamily:'OPPO Sans, -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif',fontWeight:500,fontSize:`${f}px`},children:"我的情绪"})}),b.jsx("button",{onClick:e,className:"absolute cursor-pointer",style:{background:"white",border:"none",outline:"none",width:`${d}px`,height:`${d}px`,top:`${p}px`,left:`${h}px`,borderRadius:"50%",display:"flex",alignItems:"center",justifyContent:"center",boxShadow:w},children:b.jsx("img",{src:"/emo_icon.png",alt:"",className:"object-contain",style:{width:`${v}px`,height:`${y}px`}})})]})};function _P(e){var t,n,r="";if(typeof e=="string"||typeof e=="number")r+=e;else if(typeof e=="object")if(Array.isArray(e)){var i=e.length;for(t=0;t<i;t++)e[t]&&(n=_P(e[t]))&&(r&&(r+=" "),r+=n)}else for(n in e)e[n]&&(r&&(r+=" "),r+=n);return r}function ve(){for(var e,t,n=0,r="",i=arguments.length;n<i;n++)(e=arguments[n])&&(t=_P(e))&&(r&&(r+=" "),r+=t);return r}var LT=["dangerouslySetInnerHTML","onCopy","onCopyCapture","onCut","onCutCapture","onPaste","onPasteCapture","onCompositionEnd","onCompositionEndCapture","onCompositionStart","onCompositionStartCapture","onCompositionUpdate","onCompositionUpdateCapture","onFocus","onFocusCapture","onBlur","onBlurCapture","onChange","onChangeCapture","onBeforeInput","onBeforeInputCapture","onInput","onInputCapture","onReset","onResetCapture","onSubmit","onSubmitCapture","onInvalid","onInvalidCapture","onLoad","onLoadCapture","onError","onErrorCapture","onKeyDown","onKeyDownCapture","onKeyPress","onKeyPressCapture","onKeyUp","onKeyUpCapture","onAbort","onAbortCapture","onCanPlay","onCanPlayCapture","onCanPlayThrough","onCanPlayThroughCapture","onDurationChange","onDurationChangeCapture","onEmptied","onEmptiedCapture","onEncrypted","onEncryptedCapture","onEnded","onEndedCapture","onLoadedData","onLoadedDataCapture","onLoadedMetadata","onLoadedMetadataCapture","onLoadStart","onLoadStartCapture","onPause","onPauseCapture","onPlay","onPlayCapture","onPlaying","onPlayingCapture","onProgress","onProgressCapture","onRateChange","onRateChangeCapture","onSeeked","onSeekedCapture","onSeeking","onSeekingCapture","onStalled","onStalledCapture","onSuspend","onSuspendCapture","onTimeUpdate","onTimeUpdateCapture","onVolumeChange","onVolumeChangeCapture","onWaiting","onWaitingCapture","onAuxClick","onAuxClickCapture","onClick","onClickCapture","onContextMenu","onContextMenuCapture","onDoubleClick","onDoubleClickCapture","onDrag","onDragCapture","onDragEnd","onDragEndCapture","onDragEnter","onDragEnterCapture","onDragExit","onDragExitCapture","onDragLeave","onDragLeaveCapture","onDragOver","onDragOverCapture","onDragStart","onDragStartCapture","onDrop","onDropCapture","onMouseDown","onMouseDownCapture","onMouseEnter","onMouseLeave","onMouseMove","onMouseMoveCapture","onMouseOut","onMouseOutCapture","onMouseOver","onMouseOverCapture","onMouseUp","onMouseUpCapture","onSelect","onSelectCapture","onTouchCancel","onTouchCancelCapture","onTouchEnd","onTouchEndCapture","onTouchMove","onTouchMoveCapture","onTouchStart","onTouchStartCapture","onPointerDown","onPointerDownCapture","onPointerMove","onPointerMoveCapture","onPointerUp","onPointerUpCapture","onPointerCancel","onPointerCancelCapture","onPointerEnter","onPointerEnterCapture","onPointerLeave","onPointerLeaveCapture","onPointerOver","onPointerOverCapture","onPointerOut","onPointerOutCapture","onGotPointerCapture","onGotPointerCaptureCapture","onLostPointerCapture","onLostPointerCaptureCapture","onScroll","onScrollCapture","onWheel","onWheelCapture","onAnimationStart","onAnimationStartCapture","onAnimationEnd","onAnimationEndCapture","onAnimationIteration","onAnimationIterationCapture","onTransitionEnd","onTransitionEndCapture"];function sv(e){if(typeof e!="string")return!1;var t=LT;return t.includes(e)}var zT=["aria-activedescendant","aria-atomic","aria-autocomplete","aria-busy","aria-checked","aria-colcount","aria-colindex","aria-colspan","aria-controls","aria-current","aria-describedby","aria-details","aria-disabled","aria-errormessage","aria-expanded","aria-flowto","aria-haspopup","aria-hidden","aria-invalid","aria-keyshortcuts","aria-label","aria-labelledby","aria-level","aria-live","aria-modal","aria-multiline","aria-multiselectable","aria-orientation","aria-owns","aria-placeholder","aria-posinset","aria-pressed","aria-readonly","aria-relevant","aria-required","aria-roledescription","aria-rowcount","aria-rowindex","aria-rowspan","aria-selected","aria-setsize","aria-sort","aria-valuemax","aria-valuemin","aria-valuenow","aria-valuetext","className","color","height","id","lang","max","media","method","min","name","style","target","width","role","tabIndex","accentHeight","accumulate","additive","alignmentBaseline","allowReorder","alphabetic","amplitude","arabicForm","ascent","attributeName","attributeType","autoReverse","azimuth","baseFrequency","baselineShift","baseProfile","bbox","begin","bias","by","calcMode","capHeight","clip","clipPath","clipPathUnits","clipRule","colorInterpolation","colorInterpolationFilters","colorProfile","colorRendering","contentScriptType","contentStyleType","cursor","cx","cy","d","decelerate","descent","diffuseConstant","direction","display","divisor","dominantBaseline","dur","dx","dy","edgeMode","elevation","enableBackground","end","exponent","externalResourcesRequired","fill","fillOpacity","fillRule","filter","filterRes","filterUnits","floodColor","floodOpacity","focusable","fontFamily","fontSize","fontSizeAdjust","fontStretch","fontStyle","fontVariant","fontWeight","format","from","fx","fy","g1","g2","glyphName","glyphOrientationHorizontal","glyphOrientationVertical","glyphRef","gradientTransform","gradientUnits","hanging","horizAdvX","horizOriginX","href","ideographic","imageRendering","in2","in","intercept","k1","k2","k3","k4","k","kernelMatrix","kernelUnitLength","kerning","keyPoints","keySplines","keyTimes","lengthAdjust","letterSpacing","lightingColor","limitingConeAngle","local","markerEnd","markerHeight","markerMid","markerStart","markerUnits","markerWidth","mask","maskContentUnits","maskUnits","mathematical","mode","numOctaves","offset","opacity","operator","order","orient","orientation","origin","overflow","overlinePosition","overlineThickness","paintOrder","panose1","pathLength","patternContentUnits","patternTransform","patternUnits","pointerEvents","pointsAtX","pointsAtY","pointsAtZ","preserveAlpha","preserveAspectRatio","primitiveUnits","r","radius","refX","refY","renderingIntent","repeatCount","repeatDur","requiredExtensions","requiredFeatures","restart","result","rotate","rx","ry","seed","shapeRendering","slope","spacing","specularConstant","specularExponent","speed","spreadMethod","startOffset","stdDeviation","stemh","stemv","stitchTiles","stopColor","stopOpacity","strikethroughPosition","strikethroughThickness","string","stroke","strokeDasharray","strokeDashoffset","strokeLinecap","strokeLinejoin","strokeMiterlimit","strokeOpacity","strokeWidth","surfaceScale","systemLanguage","tableValues","targetX","targetY","textAnchor","textDecoration","textLength","textRendering","to","transform","u1","u2","underlinePosition","underlineThickness","unicode","unicodeBidi","unicodeRange","unitsPerEm","vAlphabetic","values","vectorEffect","version","vertAdvY","vertOriginX","vertOriginY","vHanging","vIdeographic","viewTarget","visibility","vMathematical","widths","wordSpacing","writingMode","x1","x2","x","xChannelSelector","xHeight","xlinkActuate","xlinkArcrole","xlinkHref","xlinkRole","xlinkShow","xlinkTitle","xlinkType","xmlBase","xmlLang","xmlns","xmlnsXlink","xmlSpace","y1","y2","y","yChannelSelector","z","zoomAndPan","ref","key","angle"],FT=new Set(zT);function AP(e){return typeof e!="string"?!1:FT.has(e)}function jP(e){return typeof e=="string"&&e.startsWith("data-")}function jn(e){if(typeof e!="object"||e===null)return{};var t={};for(var n in e)Object.prototype.hasOwnProperty.call(e,n)&&(AP(n)||jP(n))&&(t[n]=e[n]);return t}function lf(e){if(e==null)return null;if(m.isValidElement(e)&&typeof e.props=="object"&&e.props!==null){var t=e.props;return jn(t)}return typeof e=="object"&&!Array.isArray(e)?jn(e):null}function Rt(e){var t={};for(var n in e)Object.prototype.hasOwnProperty.call(e,n)&&(AP(n)||jP(n)||sv(n))&&(t[n]=e[n]);return t}function BT(e){return e==null?null:m.isValidElement(e)?Rt(e.props):typeof e=="object"&&!Array.isArray(e)?Rt(e):null}var UT=["children","width","height","viewBox","className","style","title","desc"];function rh(){return rh=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},rh.apply(null,arguments)}function VT(e,t){if(e==null)return{};var n,r,i=HT(e,t);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);for(r=0;r<o.length;r++)n=o[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function HT(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var MP=m.forwardRef((e,t)=>{var{children:n,width:r,height:i,viewBox:o,className:a,style:s,title:l,desc:u}=e,c=VT(e,UT),f=o||{width:r,height:i,x:0,y:0},d=ve("recharts-surface",a);return m.createElement("svg",rh({},Rt(c),{className:d,width:r,height:i,style:s,viewBox:"".concat(f.x," ").concat(f.y," ").concat(f.width," ").concat(f.height),ref:t}),m.createElement("title",null,l),m.createElement("desc",null,u),n)}),KT=["children","className"];function ih(){return ih=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},ih.apply(null,arguments)}function WT(e,t){if(e==null)return{};var n,r,i=YT(e,t);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);for(r=0;r<o.length;r++)n=o[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function YT(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var hn=m.forwardRef((e,t)=>{var{children:n,className:r}=e,i=WT(e,KT),o=ve("recharts-layer",r);return m.createElement("g",ih({className:o},Rt(i),{ref:t}),n)}),qT=m.createContext(null);function Ie(e){return function(){return e}}const oh=Math.PI,ah=2*oh,Pi=1e-6,GT=ah-Pi;function TP(e){this._+=e[0];for(let t=1,n=e.length;t<n;++t)this._+=arguments[t]+e[t]}function XT(e){let t=Math.floor(e);if(!(t>=0))throw new Error(`invalid digits: ${e}`);if(t>15)return TP;const n=10**t;return function(r){this._+=r[0];for(let i=1,o=r.length;i<o;++i)this._+=Math.round(arguments[i]*n)/n+r[i]}}class ZT{constructor(t){this._x0=this._y0=this._x1=this._y1=null,this._="",this._append=t==null?TP:XT(t)}moveTo(t,n){this._append`M${this._x0=this._x1=+t},${this._y0=this._y1=+n}`}closePath(){this._x1!==null&&(this._x1=this._x0,this._y1=this._y0,this._append`Z`)}lineTo(t,n){this._append`L${this._x1=+t},${this._y1=+n}`}quadraticCurveTo(t,n,r,i){this._append`Q${+t},${+n},${this._x1=+r},${this._y1=+i}`}bezierCurveTo(t,n,r,i,o,a){this._append`C${+t},${+n},${+r},${+i},${this._x1=+o},${this._y1=+a}`}arcTo(t,n,r,i,o){if(t=+t,n=+n,r=+r,i=+i,o=+o,o<0)throw new Error(`negative radius: ${o}`);let a=this._x1,s=this._y1,l=r-t,u=i-n,c=a-t,f=s-n,d=c*c+f*f;if(this._x1===null)this._append`M${this._x1=t},${this._y1=n}`;else if(d>Pi)if(!(Math.abs(f*l-u*c)>Pi)||!o)this._append`L${this._x1=t},${this._y1=n}`;else{let p=r-a,h=i-s,v=l*l+u*u,y=p*p+h*h,g=Math.sqrt(v),x=Math.sqrt(d),w=o*Math.tan((oh-Math.acos((v+d-y)/(2*g*x)))/2),S=w/x,P=w/g;Math.abs(S-1)>Pi&&this._append`L${t+S*c},${n+S*f}`,this._append`A${o},${o},0,0,${+(f*p>c*h)},${this._x1=t+P*l},${this._y1=n+P*u}`}}arc(t,n,r,i,o,a){if(t=+t,n=+n,r=+r,a=!!a,r<0)throw new Error(`negative radius: ${r}`);let s=r*Math.cos(i),l=r*Math.sin(i),u=t+s,c=n+l,f=1^a,d=a?i-o:o-i;this._x1===null?this._append`M${u},${c}`:(Math.abs(this._x1-u)>Pi||Math.abs(this._y1-c)>Pi)&&this._append`L${u},${c}`,r&&(d<0&&(d=d%ah+ah),d>GT?this._append`A${r},${r},0,1,${f},${t-s},${n-l}A${r},${r},0,1,${f},${this._x1=u},${this._y1=c}`:d>Pi&&this._append`A${r},${r},0,${+(d>=oh)},${f},${this._x1=t+r*Math.cos(o)},${this._y1=n+r*Math.sin(o)}`)}rect(t,n,r,i){this._append`M${this._x0=this._x1=+t},${this._y0=this._y1=+n}h${r=+r}v${+i}h${-r}Z`}toString(){return this._}}function $P(e){let t=3;return e.digits=function(n){if(!arguments.length)return t;if(n==null)t=null;else{const r=Math.floor(n);if(!(r>=0))throw new RangeError(`invalid digits: ${n}`);t=r}return e},()=>new ZT(t)}function lv(e){return typeof e=="object"&&"length"in e?e:Array.from(e)}function IP(e){this._context=e}IP.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._point=0},lineEnd:function(){(this._line||this._line!==0&&this._point===1)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;default:this._context.lineTo(e,t);break}}};function uf(e){return new IP(e)}function NP(e){return e[0]}function DP(e){return e[1]}function RP(e,t){var n=Ie(!0),r=null,i=uf,o=null,a=$P(s);e=typeof e=="function"?e:e===void 0?NP:Ie(e),t=typeof t=="function"?t:t===void 0?DP:Ie(t);function s(l){var u,c=(l=lv(l)).length,f,d=!1,p;for(r==null&&(o=i(p=a())),u=0;u<=c;++u)!(u<c&&n(f=l[u],u,l))===d&&((d=!d)?o.lineStart():o.lineEnd()),d&&o.point(+e(f,u,l),+t(f,u,l));if(p)return o=null,p+""||null}return s.x=function(l){return arguments.length?(e=typeof l=="function"?l:Ie(+l),s):e},s.y=function(l){return arguments.length?(t=typeof l=="function"?l:Ie(+l),s):t},s.defined=function(l){return arguments.length?(n=typeof l=="function"?l:Ie(!!l),s):n},s.curve=function(l){return arguments.length?(i=l,r!=null&&(o=i(r)),s):i},s.context=function(l){return arguments.length?(l==null?r=o=null:o=i(r=l),s):r},s}function Nl(e,t,n){var r=null,i=Ie(!0),o=null,a=uf,s=null,l=$P(u);e=typeof e=="function"?e:e===void 0?NP:Ie(+e),t=typeof t=="function"?t:Ie(t===void 0?0:+t),n=typeof n=="function"?n:n===void 0?DP:Ie(+n);function u(f){var d,p,h,v=(f=lv(f)).length,y,g=!1,x,w=new Array(v),S=new Array(v);for(o==null&&(s=a(x=l())),d=0;d<=v;++d){if(!(d<v&&i(y=f[d],d,f))===g)if(g=!g)p=d,s.areaStart(),s.lineStart();else{for(s.lineEnd(),s.lineStart(),h=d-1;h>=p;--h)s.point(w[h],S[h]);s.lineEnd(),s.areaEnd()}g&&(w[d]=+e(y,d,f),S[d]=+t(y,d,f),s.point(r?+r(y,d,f):w[d],n?+n(y,d,f):S[d]))}if(x)return s=null,x+""||null}function c(){return RP().defined(i).curve(a).context(o)}return u.x=function(f){return arguments.length?(e=typeof f=="function"?f:Ie(+f),r=null,u):e},u.x0=function(f){return arguments.length?(e=typeof f=="function"?f:Ie(+f),u):e},u.x1=function(f){return arguments.length?(r=f==null?null:typeof f=="function"?f:Ie(+f),u):r},u.y=function(f){return arguments.length?(t=typeof f=="function"?f:Ie(+f),n=null,u):t},u.y0=function(f){return arguments.length?(t=typeof f=="function"?f:Ie(+f),u):t},u.y1=function(f){return arguments.length?(n=f==null?null:typeof f=="function"?f:Ie(+f),u):n},u.lineX0=u.lineY0=function(){return c().x(e).y(t)},u.lineY1=function(){return c().x(e).y(n)},u.lineX1=function(){return c().x(r).y(t)},u.defined=function(f){return arguments.length?(i=typeof f=="function"?f:Ie(!!f),u):i},u.curve=function(f){return arguments.length?(a=f,o!=null&&(s=a(o)),u):a},u.context=function(f){return arguments.length?(f==null?o=s=null:s=a(o=f),u):o},u}class LP{constructor(t,n){this._context=t,this._x=n}areaStart(){this._line=0}areaEnd(){this._line=NaN}lineStart(){this._point=0}lineEnd(){(this._line||this._line!==0&&this._point===1)&&this._context.closePath(),this._line=1-this._line}point(t,n){switch(t=+t,n=+n,this._point){case 0:{this._point=1,this._line?this._context.lineTo(t,n):this._context.moveTo(t,n);break}case 1:this._point=2;default:{this._x?this._context.bezierCurveTo(this._x0=(this._x0+t)/2,this._y0,this._x0,n,t,n):this._context.bezierCurveTo(this._x0,this._y0=(this._y0+n)/2,t,this._y0,t,n);break}}this._x0=t,this._y0=n}}function QT(e){return new LP(e,!0)}function JT(e){return new LP(e,!1)}function Zu(){}function Qu(e,t,n){e._context.bezierCurveTo((2*e._x0+e._x1)/3,(2*e._y0+e._y1)/3,(e._x0+2*e._x1)/3,(e._y0+2*e._y1)/3,(e._x0+4*e._x1+t)/6,(e._y0+4*e._y1+n)/6)}function zP(e){this._context=e}zP.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=NaN,this._point=0},lineEnd:function(){switch(this._point){case 3:Qu(this,this._x1,this._y1);case 2:this._context.lineTo(this._x1,this._y1);break}(this._line||this._line!==0&&this._point===1)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;break;case 2:this._point=3,this._context.lineTo((5*this._x0+this._x1)/6,(5*this._y0+this._y1)/6);default:Qu(this,e,t);break}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t}};function e$(e){return new zP(e)}function FP(e){this._context=e}FP.prototype={areaStart:Zu,areaEnd:Zu,lineStart:function(){this._x0=this._x1=this._x2=this._x3=this._x4=this._y0=this._y1=this._y2=this._y3=this._y4=NaN,this._point=0},lineEnd:function(){switch(this._point){case 1:{this._context.moveTo(this._x2,this._y2),this._context.closePath();break}case 2:{this._context.moveTo((this._x2+2*this._x3)/3,(this._y2+2*this._y3)/3),this._context.lineTo((this._x3+2*this._x2)/3,(this._y3+2*this._y2)/3),this._context.closePath();break}case 3:{this.point(this._x2,this._y2),this.point(this._x3,this._y3),this.point(this._x4,this._y4);break}}},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._x2=e,this._y2=t;break;case 1:this._point=2,this._x3=e,this._y3=t;break;case 2:this._point=3,this._x4=e,this._y4=t,this._context.moveTo((this._x0+4*this._x1+e)/6,(this._y0+4*this._y1+t)/6);break;default:Qu(this,e,t);break}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t}};function t$(e){return new FP(e)}function BP(e){this._context=e}BP.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=NaN,this._point=0},lineEnd:function(){(this._line||this._line!==0&&this._point===3)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1;break;case 1:this._point=2;break;case 2:this._point=3;var n=(this._x0+4*this._x1+e)/6,r=(this._y0+4*this._y1+t)/6;this._line?this._context.lineTo(n,r):this._context.moveTo(n,r);break;case 3:this._point=4;default:Qu(this,e,t);break}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t}};function n$(e){return new BP(e)}function UP(e){this._context=e}UP.prototype={areaStart:Zu,areaEnd:Zu,lineStart:function(){this._point=0},lineEnd:function(){this._point&&this._context.closePath()},point:function(e,t){e=+e,t=+t,this._point?this._context.lineTo(e,t):(this._point=1,this._context.moveTo(e,t))}};function r$(e){return new UP(e)}function E0(e){return e<0?-1:1}function k0(e,t,n){var r=e._x1-e._x0,i=t-e._x1,o=(e._y1-e._y0)/(r||i<0&&-0),a=(n-e._y1)/(i||r<0&&-0),s=(o*i+a*r)/(r+i);return(E0(o)+E0(a))*Math.min(Math.abs(o),Math.abs(a),.5*Math.abs(s))||0}function C0(e,t){var n=e._x1-e._x0;return n?(3*(e._y1-e._y0)/n-t)/2:t}function Id(e,t,n){var r=e._x0,i=e._y0,o=e._x1,a=e._y1,s=(o-r)/3;e._context.bezierCurveTo(r+s,i+s*t,o-s,a-s*n,o,a)}function Ju(e){this._context=e}Ju.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=this._t0=NaN,this._point=0},lineEnd:function(){switch(this._point){case 2:this._context.lineTo(this._x1,this._y1);break;case 3:Id(this,this._t0,C0(this,this._t0));break}(this._line||this._line!==0&&this._point===1)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){var n=NaN;if(e=+e,t=+t,!(e===this._x1&&t===this._y1)){switch(this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;break;case 2:this._point=3,Id(this,C0(this,n=k0(this,e,t)),n);break;default:Id(this,this._t0,n=k0(this,e,t));break}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t,this._t0=n}}};function VP(e){this._context=new HP(e)}(VP.prototype=Object.create(Ju.prototype)).point=function(e,t){Ju.prototype.point.call(this,t,e)};function HP(e){this._context=e}HP.prototype={moveTo:function(e,t){this._context.moveTo(t,e)},closePath:function(){this._context.closePath()},lineTo:function(e,t){this._context.lineTo(t,e)},bezierCurveTo:function(e,t,n,r,i,o){this._context.bezierCurveTo(t,e,r,n,o,i)}};function i$(e){return new Ju(e)}function o$(e){return new VP(e)}function KP(e){this._context=e}KP.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x=[],this._y=[]},lineEnd:function(){var e=this._x,t=this._y,n=e.length;if(n)if(this._line?this._context.lineTo(e[0],t[0]):this._context.moveTo(e[0],t[0]),n===2)this._context.lineTo(e[1],t[1]);else for(var r=_0(e),i=_0(t),o=0,a=1;a<n;++o,++a)this._context.bezierCurveTo(r[0][o],i[0][o],r[1][o],i[1][o],e[a],t[a]);(this._line||this._line!==0&&n===1)&&this._context.closePath(),this._line=1-this._line,this._x=this._y=null},point:function(e,t){this._x.push(+e),this._y.push(+t)}};function _0(e){var t,n=e.length-1,r,i=new Array(n),o=new Array(n),a=new Array(n);for(i[0]=0,o[0]=2,a[0]=e[0]+2*e[1],t=1;t<n-1;++t)i[t]=1,o[t]=4,a[t]=4*e[t]+2*e[t+1];for(i[n-1]=2,o[n-1]=7,a[n-1]=8*e[n-1]+e[n],t=1;t<n;++t)r=i[t]/o[t-1],o[t]-=r,a[t]-=r*a[t-1];for(i[n-1]=a[n-1]/o[n-1],t=n-2;t>=0;--t)i[t]=(a[t]-i[t+1])/o[t];for(o[n-1]=(e[n]+i[n-1])/2,t=0;t<n-1;++t)o[t]=2*e[t+1]-i[t+1];return[i,o]}function a$(e){return new KP(e)}function cf(e,t){this._context=e,this._t=t}cf.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x=this._y=NaN,this._point=0},lineEnd:function(){0<this._t&&this._t<1&&this._point===2&&this._context.lineTo(this._x,this._y),(this._line||this._line!==0&&this._point===1)&&this._context.closePath(),this._line>=0&&(this._t=1-this._t,this._line=1-this._line)},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;default:{if(this._t<=0)this._context.lineTo(this._x,t),this._context.lineTo(e,t);else{var n=this._x*(1-this._t)+e*this._t;this._context.lineTo(n,this._y),this._context.lineTo(n,t)}break}}this._x=e,this._y=t}};function s$(e){return new cf(e,.5)}function l$(e){return new cf(e,0)}function u$(e){return new cf(e,1)}function Hi(e,t){if((a=e.length)>1)for(var n=1,r,i,o=e[t[0]],a,s=o.length;n<a;++n)for(i=o,o=e[t[n]],r=0;r<s;++r)o[r][1]+=o[r][0]=isNaN(i[r][1])?i[r][0]:i[r][1]}function sh(e){for(var t=e.length,n=new Array(t);--t>=0;)n[t]=t;return n}function c$(e,t){return e[t]}function f$(e){const t=[];return t.key=e,t}function d$(){var e=Ie([]),t=sh,n=Hi,r=c$;function i(o){var a=Array.from(e.apply(this,arguments),f$),s,l=a.length,u=-1,c;for(const f of o)for(s=0,++u;s<l;++s)(a[s][u]=[0,+r(f,a[s].key,u,o)]).data=f;for(s=0,c=lv(t(a));s<l;++s)a[c[s]].index=s;return n(a,c),a}return i.keys=function(o){return arguments.length?(e=typeof o=="function"?o:Ie(Array.from(o)),i):e},i.value=function(o){return arguments.length?(r=typeof o=="function"?o:Ie(+o),i):r},i.order=function(o){return arguments.length?(t=o==null?sh:typeof o=="function"?o:Ie(Array.from(o)),i):t},i.offset=function(o){return arguments.length?(n=o??Hi,i):n},i}function p$(e,t){if((r=e.length)>0){for(var n,r,i=0,o=e[0].length,a;i<o;++i){for(a=n=0;n<r;++n)a+=e[n][i][1]||0;if(a)for(n=0;n<r;++n)e[n][i][1]/=a}Hi(e,t)}}function h$(e,t){if((i=e.length)>0){for(var n=0,r=e[t[0]],i,o=r.length;n<o;++n){for(var a=0,s=0;a<i;++a)s+=e[a][n][1]||0;r[n][1]+=r[n][0]=-s/2}Hi(e,t)}}function m$(e,t){if(!(!((a=e.length)>0)||!((o=(i=e[t[0]]).length)>0))){for(var n=0,r=1,i,o,a;r<o;++r){for(var s=0,l=0,u=0;s<a;++s){for(var c=e[t[s]],f=c[r][1]||0,d=c[r-1][1]||0,p=(f-d)/2,h=0;h<s;++h){var v=e[t[h]],y=v[r][1]||0,g=v[r-1][1]||0;p+=y-g}l+=f,u+=p*f}i[r-1][1]+=i[r-1][0]=n,l&&(n-=u/l)}i[r-1][1]+=i[r-1][0]=n,Hi(e,t)}}var ff={},WP={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});function t(n){return n==="__proto__"}e.isUnsafeProperty=t})(WP);var uv={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});function t(n){switch(typeof n){case"number":case"symbol":return!1;case"string":return n.includes(".")||n.includes("[")||n.includes("]")}}e.isDeepKey=t})(uv);var df={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});function t(n){var r;return typeof n=="string"||typeof n=="symbol"?n:Object.is((r=n==null?void 0:n.valueOf)==null?void 0:r.call(n),-0)?"-0":String(n)}e.toKey=t})(df);var pf={},YP={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});function t(n){if(n==null)return"";if(typeof n=="string")return n;if(Array.isArray(n))return n.map(t).join(",");const r=String(n);return r==="0"&&Object.is(Number(n),-0)?"-0":r}e.toString=t})(YP);(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=YP,n=df;function r(i){if(Array.isArray(i))return i.map(n.toKey);if(typeof i=="symbol")return[i];i=t.toString(i);const o=[],a=i.length;if(a===0)return o;let s=0,l="",u="",c=!1;for(i.charCodeAt(0)===46&&(o.push(""),s++);s<a;){const f=i[s];u?f==="\\"&&s+1<a?(s++,l+=i[s]):f===u?u="":l+=f:c?f==='"'||f==="'"?u=f:f==="]"?(c=!1,o.push(l),l=""):l+=f:f==="["?(c=!0,l&&(o.push(l),l="")):f==="."?l&&(o.push(l),l=""):l+=f,s++}return l&&o.push(l),o}e.toPath=r})(pf);(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=WP,n=uv,r=df,i=pf;function o(s,l,u){if(s==null)return u;switch(typeof l){case"string":{if(t.isUnsafeProperty(l))return u;const c=s[l];return c===void 0?n.isDeepKey(l)?o(s,i.toPath(l),u):u:c}case"number":case"symbol":{typeof l=="number"&&(l=r.toKey(l));const c=s[l];return c===void 0?u:c}default:{if(Array.isArray(l))return a(s,l,u);if(Object.is(l==null?void 0:l.valueOf(),-0)?l="-0":l=String(l),t.isUnsafeProperty(l))return u;const c=s[l];return c===void 0?u:c}}}function a(s,l,u){if(l.length===0)return u;let c=s;for(let f=0;f<l.length;f++){if(c==null||t.isUnsafeProperty(l[f]))return u;c=c[l[f]]}return c===void 0?u:c}e.get=o})(ff);var v$=ff.get;const hf=kr(v$);var g$=4;function qr(e){var t=arguments.length>1&&arguments[1]!==void 0?arguments[1]:g$,n=10**t,r=Math.round(e*n)/n;return Object.is(r,-0)?0:r}function st(e){for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];return e.reduce((i,o,a)=>{var s=n[a-1];return typeof s=="string"?i+s+o:s!==void 0?i+qr(s)+o:i+o},"")}var un=e=>e===0?0:e>0?1:-1,Qt=e=>typeof e=="number"&&e!=+e,yr=e=>typeof e=="string"&&e.indexOf("%")===e.length-1,Q=e=>(typeof e=="number"||e instanceof Number)&&!Qt(e),Lt=e=>Q(e)||typeof e=="string",y$=0,ws=e=>{var t=++y$;return"".concat(e||"").concat(t)},si=function(t,n){var r=arguments.length>2&&arguments[2]!==void 0?arguments[2]:0,i=arguments.length>3&&arguments[3]!==void 0?arguments[3]:!1;if(!Q(t)&&typeof t!="string")return r;var o;if(yr(t)){if(n==null)return r;var a=t.indexOf("%");o=n*parseFloat(t.slice(0,a))/100}else o=+t;return Qt(o)&&(o=r),i&&n!=null&&o>n&&(o=n),o},qP=e=>{if(!Array.isArray(e))return!1;for(var t=e.length,n={},r=0;r<t;r++)if(!n[String(e[r])])n[String(e[r])]=!0;else return!0;return!1};function Ln(e,t,n){return Q(e)&&Q(t)?qr(e+n*(t-e)):t}function GP(e,t,n){if(!(!e||!e.length))return e.find(r=>r&&(typeof t=="function"?t(r):hf(r,t))===n)}var ft=e=>e===null||typeof e>"u",cv=e=>ft(e)?e:"".concat(e.charAt(0).toUpperCase()).concat(e.slice(1));function x$(e){return e!=null}function Hs(){}var XP=e=>"radius"in e&&"startAngle"in e&&"endAngle"in e,fv=(e,t)=>{if(!e||typeof e=="function"||typeof e=="boolean")return null;var n=e;if(m.isValidElement(e)&&(n=e.props),typeof n!="object"&&typeof n!="function")return null;var r={};return Object.keys(n).forEach(i=>{sv(i)&&(r[i]=t||(o=>n[i](n,o)))}),r},w$=(e,t,n)=>r=>(e(t,n,r),null),b$=(e,t,n)=>{if(e===null||typeof e!="object"&&typeof e!="function")return null;var r=null;return Object.keys(e).forEach(i=>{var o=e[i];sv(i)&&typeof o=="function"&&(r||(r={}),r[i]=w$(o,t,n))}),r};function A0(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function S$(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?A0(Object(n),!0).forEach(function(r){P$(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):A0(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function P$(e,t,n){return(t=O$(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function O$(e){var t=E$(e,"string");return typeof t=="symbol"?t:t+""}function E$(e,t){if(typeof e!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||"default");if(typeof r!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}function At(e,t){var n=S$({},e),r=t,i=Object.keys(t),o=i.reduce((a,s)=>(a[s]===void 0&&r[s]!==void 0&&(a[s]=r[s]),a),n);return o}var ZP={},QP={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});function t(n,r){const i=new Map;for(let o=0;o<n.length;o++){const a=n[o],s=r(a);i.has(s)||i.set(s,a)}return Array.from(i.values())}e.uniqBy=t})(QP);var dv={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});function t(n){return n}e.identity=t})(dv);var JP={},mf={},eO={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});function t(n){return Number.isSafeInteger(n)&&n>=0}e.isLength=t})(eO);(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=eO;function n(r){return r!=null&&typeof r!="function"&&t.isLength(r.length)}e.isArrayLike=n})(mf);var tO={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});function t(n){return typeof n=="object"&&n!==null}e.isObjectLike=t})(tO);(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=mf,n=tO;function r(i){return n.isObjectLike(i)&&t.isArrayLike(i)}e.isArrayLikeObject=r})(JP);var nO={},rO={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=ff;function n(r){return function(i){return t.get(i,r)}}e.property=n})(rO);var iO={},pv={},oO={},hv={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});function t(n){return n!==null&&(typeof n=="object"||typeof n=="function")}e.isObject=t})(hv);var mv={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});function t(n){return n==null||typeof n!="object"&&typeof n!="function"}e.isPrimitive=t})(mv);var vv={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});function t(n,r){return n===r||Number.isNaN(n)&&Number.isNaN(r)}e.eq=t})(vv);(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=hv,n=mv,r=vv;function i(c,f,d){return typeof d!="function"?i(c,f,()=>{}):o(c,f,function p(h,v,y,g,x,w){const S=d(h,v,y,g,x,w);return S!==void 0?!!S:o(h,v,p,w)},new Map)}function o(c,f,d,p){if(f===c)return!0;switch(typeof f){case"object":return a(c,f,d,p);case"function":return Object.keys(f).length>0?o(c,{...f},d,p):r.eq(c,f);default:return t.isObject(c)?typeof f=="string"?f==="":!0:r.eq(c,f)}}function a(c,f,d,p){if(f==null)return!0;if(Array.isArray(f))return l(c,f,d,p);if(f instanceof Map)return s(c,f,d,p);if(f instanceof Set)return u(c,f,d,p);const h=Object.keys(f);if(c==null||n.isPrimitive(c))return h.length===0;if(h.length===0)return!0;if(p!=null&&p.has(f))return p.get(f)===c;p==null||p.set(f,c);try{for(let v=0;v<h.length;v++){const y=h[v];if(!n.isPrimitive(c)&&!(y in c)||f[y]===void 0&&c[y]!==void 0||f[y]===null&&c[y]!==null||!d(c[y],f[y],y,c,f,p))return!1}return!0}finally{p==null||p.delete(f)}}function s(c,f,d,p){if(f.size===0)return!0;if(!(c instanceof Map))return!1;for(const[h,v]of f.entries()){const y=c.get(h);if(d(y,v,h,c,f,p)===!1)return!1}return!0}function l(c,f,d,p){if(f.length===0)return!0;if(!Array.isArray(c))return!1;const h=new Set;for(let v=0;v<f.length;v++){const y=f[v];let g=!1;for(let x=0;x<c.length;x++){if(h.has(x))continue;const w=c[x];let S=!1;if(d(w,y,v,c,f,p)&&(S=!0),S){h.add(x),g=!0;break}}if(!g)return!1}return!0}function u(c,f,d,p){return f.size===0?!0:c instanceof Set?l([...c],[...f],d,p):!1}e.isMatchWith=i,e.isSetMatch=u})(oO);(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=oO;function n(r,i){return t.isMatchWith(r,i,()=>{})}e.isMatch=n})(pv);var aO={},gv={},sO={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});function t(n){return Object.getOwnPropertySymbols(n).filter(r=>Object.prototype.propertyIsEnumerable.call(n,r))}e.getSymbols=t})(sO);var yv={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});function t(n){return n==null?n===void 0?"[object Undefined]":"[object Null]":Object.prototype.toString.call(n)}e.getTag=t})(yv);var xv={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t="[object RegExp]",n="[object String]",r="[object Number]",i="[object Boolean]",o="[object Arguments]",a="[object Symbol]",s="[object Date]",l="[object Map]",u="[object Set]",c="[object Array]",f="[object Function]",d="[object ArrayBuffer]",p="[object Object]",h="[object Error]",v="[object DataView]",y="[object Uint8Array]",g="[object Uint8ClampedArray]",x="[object Uint16Array]",w="[object Uint32Array]",S="[object BigUint64Array]",P="[object Int8Array]",O="[object Int16Array]",k="[object Int32Array]",j="[object BigInt64Array]",M="[object Float32Array]",A="[object Float64Array]";e.argumentsTag=o,e.arrayBufferTag=d,e.arrayTag=c,e.bigInt64ArrayTag=j,e.bigUint64ArrayTag=S,e.booleanTag=i,e.dataViewTag=v,e.dateTag=s,e.errorTag=h,e.float32ArrayTag=M,e.float64ArrayTag=A,e.functionTag=f,e.int16ArrayTag=O,e.int32ArrayTag=k,e.int8ArrayTag=P,e.mapTag=l,e.numberTag=r,e.objectTag=p,e.regexpTag=t,e.setTag=u,e.stringTag=n,e.symbolTag=a,e.uint16ArrayTag=x,e.uint32ArrayTag=w,e.uint8ArrayTag=y,e.uint8ClampedArrayTag=g})(xv);var lO={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});function t(n){return ArrayBuffer.isView(n)&&!(n instanceof DataView)}e.isTypedArray=t})(lO);(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=sO,n=yv,r=xv,i=mv,o=lO;function a(c,f){return s(c,void 0,c,new Map,f)}function s(c,f,d,p=new Map,h=void 0){const v=h==null?void 0:h(c,f,d,p);if(v!==void 0)return v;if(i.isPrimitive(c))return c;if(p.has(c))return p.get(c);if(Array.isArray(c)){const y=new Array(c.length);p.set(c,y);for(let g=0;g<c.length;g++)y[g]=s(c[g],g,d,p,h);return Object.hasOwn(c,"index")&&(y.index=c.index),Object.hasOwn(c,"input")&&(y.input=c.input),y}if(c instanceof Date)return new Date(c.getTime());if(c instanceof RegExp){const y=new RegExp(c.source,c.flags);return y.lastIndex=c.lastIndex,y}if(c instanceof Map){const y=new Map;p.set(c,y);for(const[g,x]of c)y.set(g,s(x,g,d,p,h));return y}if(c instanceof Set){const y=new Set;p.set(c,y);for(const g of c)y.add(s(g,void 0,d,p,h));return y}if(typeof Buffer<"u"&&Buffer.isBuffer(c))return c.subarray();if(o.isTypedArray(c)){const y=new(Object.getPrototypeOf(c)).constructor(c.length);p.set(c,y);for(let g=0;g<c.length;g++)y[g]=s(c[g],g,d,p,h);return y}if(c instanceof ArrayBuffer||typeof SharedArrayBuffer<"u"&&c instanceof SharedArrayBuffer)return c.slice(0);if(c instanceof DataView){const y=new DataView(c.buffer.slice(0),c.byteOffset,c.byteLength);return p.set(c,y),l(y,c,d,p,h),y}if(typeof File<"u"&&c instanceof File){const y=new File([c],c.name,{type:c.type});return p.set(c,y),l(y,c,d,p,h),y}if(typeof Blob<"u"&&c instanceof Blob){const y=new Blob([c],{type:c.type});return p.set(c,y),l(y,c,d,p,h),y}if(c instanceof Error){const y=new c.constructor;return p.set(c,y),y.message=c.message,y.name=c.name,y.stack=c.stack,y.cause=c.cause,l(y,c,d,p,h),y}if(c instanceof Boolean){const y=new Boolean(c.valueOf());return p.set(c,y),l(y,c,d,p,h),y}if(c instanceof Number){const y=new Number(c.valueOf());return p.set(c,y),l(y,c,d,p,h),y}if(c instanceof String){const y=new String(c.valueOf());return p.set(c,y),l(y,c,d,p,h),y}if(typeof c=="object"&&u(c)){const y=Object.create(Object.getPrototypeOf(c));return p.set(c,y),l(y,c,d,p,h),y}return c}function l(c,f,d=c,p,h){const v=[...Object.keys(f),...t.getSymbols(f)];for(let y=0;y<v.length;y++){const g=v[y],x=Object.getOwnPropertyDescriptor(c,g);(x==null||x.writable)&&(c[g]=s(f[g],g,d,p,h))}}function u(c){switch(n.getTag(c)){case r.argumentsTag:case r.arrayTag:case r.arrayBufferTag:case r.dataViewTag:case r.booleanTag:case r.dateTag:case r.float32ArrayTag:case r.float64ArrayTag:case r.int8ArrayTag:case r.int16ArrayTag:case r.int32ArrayTag:case r.mapTag:case r.numberTag:case r.objectTag:case r.regexpTag:case r.setTag:case r.stringTag:case r.symbolTag:case r.uint8ArrayTag:case r.uint8ClampedArrayTag:case r.uint16ArrayTag:case r.uint32ArrayTag:return!0;default:return!1}}e.cloneDeepWith=a,e.cloneDeepWithImpl=s,e.copyProperties=l})(gv);(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=gv;function n(r){return t.cloneDeepWithImpl(r,void 0,r,new Map,void 0)}e.cloneDeep=n})(aO);(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=pv,n=aO;function r(i){return i=n.cloneDeep(i),o=>t.isMatch(o,i)}e.matches=r})(iO);var uO={},cO={},fO={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=gv,n=xv;function r(i,o){return t.cloneDeepWith(i,(a,s,l,u)=>{const c=o==null?void 0:o(a,s,l,u);if(c!==void 0)return c;if(typeof i=="object")switch(Object.prototype.toString.call(i)){case n.numberTag:case n.stringTag:case n.booleanTag:{const f=new i.constructor(i==null?void 0:i.valueOf());return t.copyProperties(f,i),f}case n.argumentsTag:{const f={};return t.copyProperties(f,i),f.length=i.length,f[Symbol.iterator]=i[Symbol.iterator],f}default:return}})}e.cloneDeepWith=r})(fO);(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=fO;function n(r){return t.cloneDeepWith(r)}e.cloneDeep=n})(cO);var dO={},wv={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=/^(?:0|[1-9]\d*)$/;function n(r,i=Number.MAX_SAFE_INTEGER){switch(typeof r){case"number":return Number.isInteger(r)&&r>=0&&r<i;case"symbol":return!1;case"string":return t.test(r)}}e.isIndex=n})(wv);var pO={};(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=yv;function n(r){return r!==null&&typeof r=="object"&&t.getTag(r)==="[object Arguments]"}e.isArguments=n})(pO);(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=uv,n=wv,r=pO,i=pf;function o(a,s){let l;if(Array.isArray(s)?l=s:typeof s=="string"&&t.isDeepKey(s)&&(a==null?void 0:a[s])==null?l=i.toPath(s):l=[s],l.length===0)return!1;let u=a;for(let c=0;c<l.length;c++){const f=l[c];if((u==null||!Object.hasOwn(u,f))&&!((Array.isArray(u)||r.isArguments(u))&&n.isIndex(f)&&f<u.length))return!1;u=u[f]}return!0}e.has=o})(dO);(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=pv,n=df,r=cO,i=ff,o=dO;function a(s,l){switch(typeof s){case"object":{Object.is(s==null?void 0:s.valueOf(),-0)&&(s="-0");break}case"number":{s=n.toKey(s);break}}return l=r.cloneDeep(l),function(u){const c=i.get(u,s);return c===void 0?o.has(u,s):l===void 0?c===void 0:t.isMatch(c,l)}}e.matchesProperty=a})(uO);(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=dv,n=rO,r=iO,i=uO;function o(a){if(a==null)return t.identity;switch(typeof a){case"function":return a;case"object":return Array.isArray(a)&&a.length===2?i.matchesProperty(a[0],a[1]):r.matches(a);case"string":case"symbol":case"number":return n.property(a)}}e.iteratee=o})(nO);(function(e){Object.defineProperty(e,Symbol.toStringTag,{value:"Module"});const t=QP,n=dv,r=JP,i=nO;function o(a,s=n.identity){return r.isArrayLikeObject(a)?t.uniqBy(Array.from(a),i.iteratee(s)):[]}e.uniqBy=o})(ZP);var k$=ZP.uniqBy;const j0=kr(k$);function C$(e,t,n){return t===!0?j0(e,n):typeof t=="function"?j0(e,t):e}var hO={exports:{}},mO={},vO={exports:{}},gO={};/**
  * @license React
  * use-sync-external-store-shim.production.js
  *
@@ -93,4 +93,4 @@ Error generating stack: `+o.message+`
  *
  * This source code is licensed under the MIT license found in the
  * LICENSE file in the root directory of this source tree.
- */var ul=m;function aB(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var sB=typeof Object.is=="function"?Object.is:aB,lB=ul.useSyncExternalStore,uB=ul.useRef,cB=ul.useEffect,fB=ul.useMemo,dB=ul.useDebugValue;oB.useSyncExternalStoreWithSelector=function(e,t,n,r,i){var o=uB(null);if(o.current===null){var a={hasValue:!1,value:null};o.current=a}else a=o.current;o=fB(function(){function l(p){if(!u){if(u=!0,c=p,p=r(p),i!==void 0&&a.hasValue){var h=a.value;if(i(h,p))return f=h}return f=p}if(h=f,sB(c,p))return h;var v=r(p);return i!==void 0&&i(h,v)?(c=p,h):(c=p,f=v)}var u=!1,c,f,d=n===void 0?null:n;return[function(){return l(t())},d===null?void 0:function(){return l(d())}]},[t,n,r,i]);var s=lB(e,o[0],o[1]);return cB(function(){a.hasValue=!0,a.value=s},[s]),dB(s),s};function pB(e){e()}function hB(){let e=null,t=null;return{clear(){e=null,t=null},notify(){pB(()=>{let n=e;for(;n;)n.callback(),n=n.next})},get(){const n=[];let r=e;for(;r;)n.push(r),r=r.next;return n},subscribe(n){let r=!0;const i=t={callback:n,next:null,prev:t};return i.prev?i.prev.next=i:e=i,function(){!r||e===null||(r=!1,i.next?i.next.prev=i.prev:t=i.prev,i.prev?i.prev.next=i.next:e=i.next)}}}}var Ew={notify(){},get:()=>[]};function mB(e,t){let n,r=Ew,i=0,o=!1;function a(v){c();const y=r.subscribe(v);let g=!1;return()=>{g||(g=!0,y(),f())}}function s(){r.notify()}function l(){h.onStateChange&&h.onStateChange()}function u(){return o}function c(){i++,n||(n=t?t.addNestedSub(l):e.subscribe(l),r=hB())}function f(){i--,n&&i===0&&(n(),n=void 0,r.clear(),r=Ew)}function d(){o||(o=!0,c())}function p(){o&&(o=!1,f())}const h={addNestedSub:a,notifyNestedSubs:s,handleChangeWrapper:l,isSubscribed:u,trySubscribe:d,tryUnsubscribe:p,getListeners:()=>r};return h}var vB=()=>typeof window<"u"&&typeof window.document<"u"&&typeof window.document.createElement<"u",gB=vB(),yB=()=>typeof navigator<"u"&&navigator.product==="ReactNative",xB=yB(),wB=()=>gB||xB?m.useLayoutEffect:m.useEffect,bB=wB();function kw(e,t){return e===t?e!==0||t!==0||1/e===1/t:e!==e&&t!==t}function SB(e,t){if(kw(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;const n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(let i=0;i<n.length;i++)if(!Object.prototype.hasOwnProperty.call(t,n[i])||!kw(e[n[i]],t[n[i]]))return!1;return!0}var tp=Symbol.for("react-redux-context"),np=typeof globalThis<"u"?globalThis:{};function PB(){if(!m.createContext)return{};const e=np[tp]??(np[tp]=new Map);let t=e.get(m.createContext);return t||(t=m.createContext(null),e.set(m.createContext,t)),t}var OB=PB();function EB(e){const{children:t,context:n,serverState:r,store:i}=e,o=m.useMemo(()=>{const l=mB(i);return{store:i,subscription:l,getServerState:r?()=>r:void 0}},[i,r]),a=m.useMemo(()=>i.getState(),[i]);bB(()=>{const{subscription:l}=o;return l.onStateChange=l.notifyNestedSubs,l.trySubscribe(),a!==i.getState()&&l.notifyNestedSubs(),()=>{l.tryUnsubscribe(),l.onStateChange=void 0}},[o,a]);const s=n||OB;return m.createElement(s.Provider,{value:o},t)}var kB=EB,CB=new Set(["axisLine","tickLine","activeBar","activeDot","activeLabel","activeShape","allowEscapeViewBox","background","cursor","dot","label","line","margin","padding","position","shape","style","tick","wrapperStyle","radius"]);function _B(e,t){return e==null&&t==null?!0:typeof e=="number"&&typeof t=="number"?e===t||e!==e&&t!==t:e===t}function zg(e,t){var n=new Set([...Object.keys(e),...Object.keys(t)]);for(var r of n)if(CB.has(r)){if(e[r]==null&&t[r]==null)continue;if(!SB(e[r],t[r]))return!1}else if(!_B(e[r],t[r]))return!1;return!0}function Fg(e,t){var n,r;return(n=(r=e.graphicalItems.cartesianItems.find(i=>i.id===t))===null||r===void 0?void 0:r.xAxisId)!==null&&n!==void 0?n:vC}function Bg(e,t){var n,r;return(n=(r=e.graphicalItems.cartesianItems.find(i=>i.id===t))===null||r===void 0?void 0:r.yAxisId)!==null&&n!==void 0?n:vC}var jC=(e,t,n)=>Sk(e,"xAxis",Fg(e,t),n),MC=(e,t,n)=>bk(e,"xAxis",Fg(e,t),n),TC=(e,t,n)=>Sk(e,"yAxis",Bg(e,t),n),$C=(e,t,n)=>bk(e,"yAxis",Bg(e,t),n),AB=I([be,jC,TC,MC,$C],(e,t,n,r,i)=>_r(e,"xAxis")?cc(t,r,!1):cc(n,i,!1)),jB=(e,t)=>t,IC=I([VE,jB],(e,t)=>e.filter(n=>n.type==="area").find(n=>n.id===t)),NC=e=>{var t=be(e),n=_r(t,"xAxis");return n?"yAxis":"xAxis"},MB=(e,t)=>{var n=NC(e);return n==="yAxis"?Bg(e,t):Fg(e,t)},TB=(e,t,n)=>QE(e,NC(e),MB(e,t),n),$B=I([IC,TB],(e,t)=>{var n;if(!(e==null||t==null)){var{stackId:r}=e,i=cg(e);if(!(r==null||i==null)){var o=(n=t[r])===null||n===void 0?void 0:n.stackedData,a=o==null?void 0:o.find(s=>s.key===i);if(a!=null)return a.map(s=>[s[0],s[1]])}}}),IB=I([be,jC,TC,MC,$C,$B,pR,AB,IC,kR],(e,t,n,r,i,o,a,s,l,u)=>{var{chartData:c,dataStartIndex:f,dataEndIndex:d}=a;if(!(l==null||e!=="horizontal"&&e!=="vertical"||t==null||n==null||r==null||i==null||r.length===0||i.length===0||s==null)){var{data:p}=l,h;if(p&&p.length>0?h=p:h=c==null?void 0:c.slice(f,d+1),h!=null)return JB({layout:e,xAxis:t,yAxis:n,xAxisTicks:r,yAxisTicks:i,dataStartIndex:f,areaSettings:l,stackedData:o,displayedData:h,chartBaseValue:u,bandSize:s})}}),NB=["id"],DB=["activeDot","animationBegin","animationDuration","animationEasing","connectNulls","dot","fill","fillOpacity","hide","isAnimationActive","legendType","stroke","xAxisId","yAxisId"];function Li(){return Li=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Li.apply(null,arguments)}function DC(e,t){if(e==null)return{};var n,r,i=RB(e,t);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);for(r=0;r<o.length;r++)n=o[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function RB(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function Cw(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function Ao(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?Cw(Object(n),!0).forEach(function(r){LB(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Cw(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function LB(e,t,n){return(t=zB(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function zB(e){var t=FB(e,"string");return typeof t=="symbol"?t:t+""}function FB(e,t){if(typeof e!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||"default");if(typeof r!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}function Rc(e,t){return e&&e!=="none"?e:t}var BB=e=>{var{dataKey:t,name:n,stroke:r,fill:i,legendType:o,hide:a}=e;return[{inactive:a,dataKey:t,type:o,color:Rc(r,i),value:r2(n,t),payload:e}]},UB=m.memo(e=>{var{dataKey:t,data:n,stroke:r,strokeWidth:i,fill:o,name:a,hide:s,unit:l,tooltipType:u,id:c}=e,f={dataDefinedOnItem:n,positions:void 0,settings:{stroke:r,strokeWidth:i,fill:o,dataKey:t,nameKey:void 0,name:r2(a,t),hide:s,type:u,color:Rc(r,o),unit:l,graphicalItemId:c}};return m.createElement(Yz,{tooltipEntrySettings:f})});function VB(e){var{clipPathId:t,points:n,props:r}=e,{needClip:i,dot:o,dataKey:a}=r,s=jn(r);return m.createElement(mF,{points:n,dot:o,className:"recharts-area-dots",dotClassName:"recharts-area-dot",dataKey:a,baseProps:s,needClip:i,clipPathId:t})}function HB(e){var{showLabels:t,children:n,points:r}=e,i=r.map(o=>{var a,s,l={x:(a=o.x)!==null&&a!==void 0?a:0,y:(s=o.y)!==null&&s!==void 0?s:0,width:0,lowerWidth:0,upperWidth:0,height:0};return Ao(Ao({},l),{},{value:o.value,payload:o.payload,parentViewBox:void 0,viewBox:l,fill:void 0})});return m.createElement(Bz,{value:t?i:void 0},n)}function _w(e){var{points:t,baseLine:n,needClip:r,clipPathId:i,props:o}=e,{layout:a,type:s,stroke:l,connectNulls:u,isRange:c}=o,{id:f}=o,d=DC(o,NB),p=jn(d),h=Rt(d);return m.createElement(m.Fragment,null,(t==null?void 0:t.length)>1&&m.createElement(hn,{clipPath:r?"url(#clipPath-".concat(i,")"):void 0},m.createElement(xu,Li({},h,{id:f,points:t,connectNulls:u,type:s,baseLine:n,layout:a,stroke:"none",className:"recharts-area-area"})),l!=="none"&&m.createElement(xu,Li({},p,{className:"recharts-area-curve",layout:a,type:s,connectNulls:u,fill:"none",points:t})),l!=="none"&&c&&m.createElement(xu,Li({},p,{className:"recharts-area-curve",layout:a,type:s,connectNulls:u,fill:"none",points:n}))),m.createElement(VB,{points:t,props:d,clipPathId:i}))}function KB(e){var t,n,{alpha:r,baseLine:i,points:o,strokeWidth:a}=e,s=(t=o[0])===null||t===void 0?void 0:t.y,l=(n=o[o.length-1])===null||n===void 0?void 0:n.y;if(!me(s)||!me(l))return null;var u=r*Math.abs(s-l),c=Math.max(...o.map(f=>f.x||0));return Q(i)?c=Math.max(i,c):i&&Array.isArray(i)&&i.length&&(c=Math.max(...i.map(f=>f.x||0),c)),Q(c)?m.createElement("rect",{x:0,y:s<l?s:s-u,width:c+(a?parseInt("".concat(a),10):1),height:Math.floor(u)}):null}function WB(e){var t,n,{alpha:r,baseLine:i,points:o,strokeWidth:a}=e,s=(t=o[0])===null||t===void 0?void 0:t.x,l=(n=o[o.length-1])===null||n===void 0?void 0:n.x;if(!me(s)||!me(l))return null;var u=r*Math.abs(s-l),c=Math.max(...o.map(f=>f.y||0));return Q(i)?c=Math.max(i,c):i&&Array.isArray(i)&&i.length&&(c=Math.max(...i.map(f=>f.y||0),c)),Q(c)?m.createElement("rect",{x:s<l?s:s-u,y:0,width:u,height:Math.floor(c+(a?parseInt("".concat(a),10):1))}):null}function YB(e){var{alpha:t,layout:n,points:r,baseLine:i,strokeWidth:o}=e;return n==="vertical"?m.createElement(KB,{alpha:t,points:r,baseLine:i,strokeWidth:o}):m.createElement(WB,{alpha:t,points:r,baseLine:i,strokeWidth:o})}function qB(e){var{needClip:t,clipPathId:n,props:r,previousPointsRef:i,previousBaselineRef:o}=e,{points:a,baseLine:s,isAnimationActive:l,animationBegin:u,animationDuration:c,animationEasing:f,onAnimationStart:d,onAnimationEnd:p}=r,h=m.useMemo(()=>({points:a,baseLine:s}),[a,s]),v=_2(h,"recharts-area-"),y=JN(),[g,x]=m.useState(!1),w=!g,S=m.useCallback(()=>{typeof p=="function"&&p(),x(!1)},[p]),P=m.useCallback(()=>{typeof d=="function"&&d(),x(!0)},[d]);if(y==null)return null;var O=i.current,k=o.current;return m.createElement(HB,{showLabels:w,points:a},r.children,m.createElement(C2,{animationId:v,begin:u,duration:c,isActive:l,easing:f,onAnimationEnd:S,onAnimationStart:P,key:v},j=>{if(O){var M=O.length/a.length,A=j===1?a:a.map((_,N)=>{var L=Math.floor(N*M);if(O[L]){var V=O[L];return Ao(Ao({},_),{},{x:Ln(V.x,_.x,j),y:Ln(V.y,_.y,j)})}return _}),C;return Q(s)?C=Ln(k,s,j):ft(s)||Qt(s)?C=Ln(k,0,j):C=s.map((_,N)=>{var L=Math.floor(N*M);if(Array.isArray(k)&&k[L]){var V=k[L];return Ao(Ao({},_),{},{x:Ln(V.x,_.x,j),y:Ln(V.y,_.y,j)})}return _}),j>0&&(i.current=A,o.current=C),m.createElement(_w,{points:A,baseLine:C,needClip:t,clipPathId:n,props:r})}return j>0&&(i.current=a,o.current=s),m.createElement(hn,null,l&&m.createElement("defs",null,m.createElement("clipPath",{id:"animationClipPath-".concat(n)},m.createElement(YB,{alpha:j,points:a,baseLine:s,layout:y,strokeWidth:r.strokeWidth}))),m.createElement(hn,{clipPath:"url(#animationClipPath-".concat(n,")")},m.createElement(_w,{points:a,baseLine:s,needClip:t,clipPathId:n,props:r})))}),m.createElement(Hz,{label:r.label}))}function GB(e){var{needClip:t,clipPathId:n,props:r}=e,i=m.useRef(null),o=m.useRef();return m.createElement(qB,{needClip:t,clipPathId:n,props:r,previousPointsRef:i,previousBaselineRef:o})}class XB extends m.PureComponent{render(){var{hide:t,dot:n,points:r,className:i,top:o,left:a,needClip:s,xAxisId:l,yAxisId:u,width:c,height:f,id:d,baseLine:p,zIndex:h}=this.props;if(t)return null;var v=ve("recharts-area",i),y=d,{r:g,strokeWidth:x}=iB(n),w=hC(n),S=g*2+x,P=s?"url(#clipPath-".concat(w?"":"dots-").concat(y,")"):void 0;return m.createElement(In,{zIndex:h},m.createElement(hn,{className:v},s&&m.createElement("defs",null,m.createElement(rB,{clipPathId:y,xAxisId:l,yAxisId:u}),!w&&m.createElement("clipPath",{id:"clipPath-dots-".concat(y)},m.createElement("rect",{x:a-S/2,y:o-S/2,width:c+S,height:f+S}))),m.createElement(GB,{needClip:s,clipPathId:y,props:this.props})),m.createElement(mw,{points:r,mainColor:Rc(this.props.stroke,this.props.fill),itemDataKey:this.props.dataKey,activeDot:this.props.activeDot,clipPath:P}),this.props.isRange&&Array.isArray(p)&&m.createElement(mw,{points:p,mainColor:Rc(this.props.stroke,this.props.fill),itemDataKey:this.props.dataKey,activeDot:this.props.activeDot,clipPath:P}))}}var RC={activeDot:!0,animationBegin:0,animationDuration:1500,animationEasing:"ease",connectNulls:!1,dot:!1,fill:"#3182bd",fillOpacity:.6,hide:!1,isAnimationActive:"auto",legendType:"line",stroke:"#3182bd",strokeWidth:1,type:"linear",label:!1,xAxisId:0,yAxisId:0,zIndex:Ye.area};function ZB(e){var t,n=At(e,RC),{activeDot:r,animationBegin:i,animationDuration:o,animationEasing:a,connectNulls:s,dot:l,fill:u,fillOpacity:c,hide:f,isAnimationActive:d,legendType:p,stroke:h,xAxisId:v,yAxisId:y}=n,g=DC(n,DB),x=oa(),w=Vk(),{needClip:S}=AC(v,y),P=St(),{points:O,isRange:k,baseLine:j}=(t=J(L=>IB(L,e.id,P)))!==null&&t!==void 0?t:{},M=Dg();if(x!=="horizontal"&&x!=="vertical"||M==null||w!=="AreaChart"&&w!=="ComposedChart")return null;var{height:A,width:C,x:_,y:N}=M;return!O||!O.length?null:m.createElement(XB,Li({},g,{activeDot:r,animationBegin:i,animationDuration:o,animationEasing:a,baseLine:j,connectNulls:s,dot:l,fill:u,fillOpacity:c,height:A,hide:f,layout:x,isAnimationActive:d==="auto"?!Xs.isSsr:d,isRange:k,legendType:p,needClip:S,points:O,stroke:h,width:C,left:_,top:N,xAxisId:v,yAxisId:y}))}var QB=(e,t,n,r,i)=>{var o=n??t;if(Q(o))return o;var a=e==="horizontal"?i:r,s=a.scale.domain();if(a.type==="number"){var l=Math.max(s[0],s[1]),u=Math.min(s[0],s[1]);return o==="dataMin"?u:o==="dataMax"||l<0?l:Math.max(Math.min(s[0],s[1]),0)}return o==="dataMin"?s[0]:o==="dataMax"?s[1]:s[0]};function JB(e){var{areaSettings:{connectNulls:t,baseValue:n,dataKey:r},stackedData:i,layout:o,chartBaseValue:a,xAxis:s,yAxis:l,displayedData:u,dataStartIndex:c,xAxisTicks:f,yAxisTicks:d,bandSize:p}=e,h=i&&i.length,v=QB(o,a,n,s,l),y=o==="horizontal",g=!1,x=u.map((S,P)=>{var O,k,j;if(h)j=i[c+P];else{var M=dt(S,r);Array.isArray(M)?(j=M,g=!0):j=[v,M]}var A=(O=(k=j)===null||k===void 0?void 0:k[1])!==null&&O!==void 0?O:null,C=A==null||h&&!t&&dt(S,r)==null;return y?{x:X0({axis:s,ticks:f,bandSize:p,entry:S,index:P}),y:C?null:l.scale(A),value:j,payload:S}:{x:C?null:s.scale(A),y:X0({axis:l,ticks:d,bandSize:p,entry:S,index:P}),value:j,payload:S}}),w;return h||g?w=x.map(S=>{var P=Array.isArray(S.value)?S.value[0]:null;return y?{x:S.x,y:P!=null&&S.y!=null?l.scale(P):null,payload:S.payload}:{x:P!=null?s.scale(P):null,y:S.y,payload:S.payload}}):w=y?l.scale(v):s.scale(v),{points:x,baseLine:w,isRange:g}}function e9(e){var t=At(e,RC),n=St();return m.createElement(Jz,{id:t.id,type:"area"},r=>m.createElement(m.Fragment,null,m.createElement(qz,{legendPayload:BB(t)}),m.createElement(UB,{dataKey:t.dataKey,data:t.data,stroke:t.stroke,strokeWidth:t.strokeWidth,fill:t.fill,name:t.name,hide:t.hide,unit:t.unit,tooltipType:t.tooltipType,id:r}),m.createElement(aF,{type:"area",id:r,data:t.data,dataKey:t.dataKey,xAxisId:t.xAxisId,yAxisId:t.yAxisId,zAxisId:0,stackId:xN(t.stackId),hide:t.hide,barSize:void 0,baseValue:t.baseValue,isPanorama:n,connectNulls:t.connectNulls}),m.createElement(ZB,Li({},t,{id:r}))))}var LC=m.memo(e9,zg);LC.displayName="Area";var t9=["domain","range"],n9=["domain","range"];function Aw(e,t){if(e==null)return{};var n,r,i=r9(e,t);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);for(r=0;r<o.length;r++)n=o[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function r9(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function jw(e,t){return e===t?!0:Array.isArray(e)&&e.length===2&&Array.isArray(t)&&t.length===2?e[0]===t[0]&&e[1]===t[1]:!1}function zC(e,t){if(e===t)return!0;var{domain:n,range:r}=e,i=Aw(e,t9),{domain:o,range:a}=t,s=Aw(t,n9);return!jw(n,o)||!jw(r,a)?!1:zg(i,s)}var i9=["dangerouslySetInnerHTML","ticks","scale"],o9=["id","scale"];function Gh(){return Gh=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Gh.apply(null,arguments)}function Mw(e,t){if(e==null)return{};var n,r,i=a9(e,t);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);for(r=0;r<o.length;r++)n=o[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function a9(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function s9(e){var t=Ue(),n=m.useRef(null);return m.useLayoutEffect(()=>{n.current===null?t(wF(e)):n.current!==e&&t(bF({prev:n.current,next:e})),n.current=e},[e,t]),m.useLayoutEffect(()=>()=>{n.current&&(t(SF(n.current)),n.current=null)},[t]),null}var l9=e=>{var{xAxisId:t,className:n}=e,r=J(o2),i=St(),o="xAxis",a=J(d=>wk(d,o,t,i)),s=J(d=>yL(d,t)),l=J(d=>OL(d,t)),u=J(d=>zE(d,t));if(s==null||l==null||u==null)return null;var c=Mw(e,i9),f=Mw(u,o9);return m.createElement(Lg,Gh({},c,f,{x:l.x,y:l.y,width:s.width,height:s.height,className:ve("recharts-".concat(o," ").concat(o),n),viewBox:r,ticks:a,axisType:o}))},u9={allowDataOverflow:Je.allowDataOverflow,allowDecimals:Je.allowDecimals,allowDuplicatedCategory:Je.allowDuplicatedCategory,angle:Je.angle,axisLine:pr.axisLine,height:Je.height,hide:!1,includeHidden:Je.includeHidden,interval:Je.interval,minTickGap:Je.minTickGap,mirror:Je.mirror,orientation:Je.orientation,padding:Je.padding,reversed:Je.reversed,scale:Je.scale,tick:Je.tick,tickCount:Je.tickCount,tickLine:pr.tickLine,tickSize:pr.tickSize,type:Je.type,xAxisId:0},c9=e=>{var t=At(e,u9);return m.createElement(m.Fragment,null,m.createElement(s9,{allowDataOverflow:t.allowDataOverflow,allowDecimals:t.allowDecimals,allowDuplicatedCategory:t.allowDuplicatedCategory,angle:t.angle,dataKey:t.dataKey,domain:t.domain,height:t.height,hide:t.hide,id:t.xAxisId,includeHidden:t.includeHidden,interval:t.interval,minTickGap:t.minTickGap,mirror:t.mirror,name:t.name,orientation:t.orientation,padding:t.padding,reversed:t.reversed,scale:t.scale,tick:t.tick,tickCount:t.tickCount,tickFormatter:t.tickFormatter,ticks:t.ticks,type:t.type,unit:t.unit}),m.createElement(l9,t))},FC=m.memo(c9,zC);FC.displayName="XAxis";var f9=["dangerouslySetInnerHTML","ticks","scale"],d9=["id","scale"];function Xh(){return Xh=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Xh.apply(null,arguments)}function Tw(e,t){if(e==null)return{};var n,r,i=p9(e,t);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);for(r=0;r<o.length;r++)n=o[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function p9(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function h9(e){var t=Ue(),n=m.useRef(null);return m.useLayoutEffect(()=>{n.current===null?t(PF(e)):n.current!==e&&t(OF({prev:n.current,next:e})),n.current=e},[e,t]),m.useLayoutEffect(()=>()=>{n.current&&(t(EF(n.current)),n.current=null)},[t]),null}var m9=e=>{var{yAxisId:t,className:n,width:r,label:i}=e,o=m.useRef(null),a=m.useRef(null),s=J(o2),l=St(),u=Ue(),c="yAxis",f=J(g=>CL(g,t)),d=J(g=>kL(g,t)),p=J(g=>wk(g,c,t,l)),h=J(g=>FE(g,t));if(m.useLayoutEffect(()=>{if(!(r!=="auto"||!f||$g(i)||m.isValidElement(i)||h==null)){var g=o.current;if(g){var x=g.getCalculatedWidth();Math.round(f.width)!==Math.round(x)&&u(kF({id:t,width:x}))}}},[p,f,u,i,t,r,h]),f==null||d==null||h==null)return null;var v=Tw(e,f9),y=Tw(h,d9);return m.createElement(Lg,Xh({},v,y,{ref:o,labelRef:a,x:d.x,y:d.y,tickTextProps:r==="auto"?{width:void 0}:{width:r},width:f.width,height:f.height,className:ve("recharts-".concat(c," ").concat(c),n),viewBox:s,ticks:p,axisType:c}))},v9={allowDataOverflow:et.allowDataOverflow,allowDecimals:et.allowDecimals,allowDuplicatedCategory:et.allowDuplicatedCategory,angle:et.angle,axisLine:pr.axisLine,hide:!1,includeHidden:et.includeHidden,interval:et.interval,minTickGap:et.minTickGap,mirror:et.mirror,orientation:et.orientation,padding:et.padding,reversed:et.reversed,scale:et.scale,tick:et.tick,tickCount:et.tickCount,tickLine:pr.tickLine,tickSize:pr.tickSize,type:et.type,width:et.width,yAxisId:0},g9=e=>{var t=At(e,v9);return m.createElement(m.Fragment,null,m.createElement(h9,{interval:t.interval,id:t.yAxisId,scale:t.scale,type:t.type,domain:t.domain,allowDataOverflow:t.allowDataOverflow,dataKey:t.dataKey,allowDuplicatedCategory:t.allowDuplicatedCategory,allowDecimals:t.allowDecimals,tickCount:t.tickCount,padding:t.padding,includeHidden:t.includeHidden,reversed:t.reversed,ticks:t.ticks,width:t.width,orientation:t.orientation,mirror:t.mirror,hide:t.hide,unit:t.unit,name:t.name,angle:t.angle,minTickGap:t.minTickGap,tick:t.tick,tickFormatter:t.tickFormatter}),m.createElement(m9,t))},BC=m.memo(g9,zC);BC.displayName="YAxis";var y9=(e,t)=>t,Ug=I([y9,be,RE,Xe,Rk,$r,B6,ht],q6),Vg=e=>{var t=e.currentTarget.getBoundingClientRect(),n=t.width/e.currentTarget.offsetWidth,r=t.height/e.currentTarget.offsetHeight;return{chartX:Math.round((e.clientX-t.left)/n),chartY:Math.round((e.clientY-t.top)/r)}},UC=mn("mouseClick"),VC=Ws();VC.startListening({actionCreator:UC,effect:(e,t)=>{var n=e.payload,r=Ug(t.getState(),Vg(n));(r==null?void 0:r.activeIndex)!=null&&t.dispatch(FL({activeIndex:r.activeIndex,activeDataKey:void 0,activeCoordinate:r.activeCoordinate}))}});var Zh=mn("mouseMove"),HC=Ws(),Zl=null;HC.startListening({actionCreator:Zh,effect:(e,t)=>{var n=e.payload;Zl!==null&&cancelAnimationFrame(Zl);var r=Vg(n);Zl=requestAnimationFrame(()=>{var i=t.getState(),o=bg(i,i.tooltip.settings.shared);if(o==="axis"){var a=Ug(i,r);(a==null?void 0:a.activeIndex)!=null?t.dispatch(Ak({activeIndex:a.activeIndex,activeDataKey:void 0,activeCoordinate:a.activeCoordinate})):t.dispatch(_k())}Zl=null})}});function x9(e,t){return t instanceof HTMLElement?"HTMLElement <".concat(t.tagName,' class="').concat(t.className,'">'):t===window?"global.window":e==="children"&&typeof t=="object"&&t!==null?"<<CHILDREN>>":t}var $w={accessibilityLayer:!0,barCategoryGap:"10%",barGap:4,barSize:void 0,className:void 0,maxBarSize:void 0,stackOffset:"none",syncId:void 0,syncMethod:"index",baseValue:void 0,reverseStackOrder:!1},KC=zt({name:"rootProps",initialState:$w,reducers:{updateOptions:(e,t)=>{var n;e.accessibilityLayer=t.payload.accessibilityLayer,e.barCategoryGap=t.payload.barCategoryGap,e.barGap=(n=t.payload.barGap)!==null&&n!==void 0?n:$w.barGap,e.barSize=t.payload.barSize,e.maxBarSize=t.payload.maxBarSize,e.stackOffset=t.payload.stackOffset,e.syncId=t.payload.syncId,e.syncMethod=t.payload.syncMethod,e.className=t.payload.className,e.baseValue=t.payload.baseValue,e.reverseStackOrder=t.payload.reverseStackOrder}}}),w9=KC.reducer,{updateOptions:b9}=KC.actions,WC=zt({name:"polarOptions",initialState:null,reducers:{updatePolarOptions:(e,t)=>t.payload}});WC.actions;var S9=WC.reducer,YC=mn("keyDown"),qC=mn("focus"),Hg=Ws();Hg.startListening({actionCreator:YC,effect:(e,t)=>{var n=t.getState(),r=n.rootProps.accessibilityLayer!==!1;if(r){var{keyboardInteraction:i}=n.tooltip,o=e.payload;if(!(o!=="ArrowRight"&&o!=="ArrowLeft"&&o!=="Enter")){var a=Sg(i,pa(n),rl(n),sl(n)),s=a==null?-1:Number(a);if(!(!Number.isFinite(s)||s<0)){var l=$r(n);if(o==="Enter"){var u=Tc(n,"axis","hover",String(i.index));t.dispatch(Bh({active:!i.active,activeIndex:i.index,activeCoordinate:u}));return}var c=ML(n),f=c==="left-to-right"?1:-1,d=o==="ArrowRight"?1:-1,p=s+d*f;if(!(l==null||p>=l.length||p<0)){var h=Tc(n,"axis","hover",String(p));t.dispatch(Bh({active:!0,activeIndex:p.toString(),activeCoordinate:h}))}}}}}});Hg.startListening({actionCreator:qC,effect:(e,t)=>{var n=t.getState(),r=n.rootProps.accessibilityLayer!==!1;if(r){var{keyboardInteraction:i}=n.tooltip;if(!i.active&&i.index==null){var o="0",a=Tc(n,"axis","hover",String(o));t.dispatch(Bh({active:!0,activeIndex:o,activeCoordinate:a}))}}}});var rn=mn("externalEvent"),GC=Ws(),rp=new Map;GC.startListening({actionCreator:rn,effect:(e,t)=>{var{handler:n,reactEvent:r}=e.payload;if(n!=null){r.persist();var i=r.type,o=rp.get(i);o!==void 0&&cancelAnimationFrame(o);var a=requestAnimationFrame(()=>{try{var s=t.getState(),l={activeCoordinate:k6(s),activeDataKey:O6(s),activeIndex:$s(s),activeLabel:Fk(s),activeTooltipIndex:$s(s),isTooltipActive:C6(s)};n(l,r)}finally{rp.delete(i)}});rp.set(i,a)}}});var P9=I([fa],e=>e.tooltipItemPayloads),O9=I([P9,al,(e,t)=>t,(e,t,n)=>n],(e,t,n,r)=>{var i=e.find(s=>s.settings.graphicalItemId===r);if(i!=null){var{positions:o}=i;if(o!=null){var a=t(o,n);return a}}}),XC=mn("touchMove"),ZC=Ws();ZC.startListening({actionCreator:XC,effect:(e,t)=>{var n=e.payload;if(!(n.touches==null||n.touches.length===0)){var r=t.getState(),i=bg(r,r.tooltip.settings.shared);if(i==="axis"){var o=n.touches[0];if(o==null)return;var a=Ug(r,Vg({clientX:o.clientX,clientY:o.clientY,currentTarget:n.currentTarget}));(a==null?void 0:a.activeIndex)!=null&&t.dispatch(Ak({activeIndex:a.activeIndex,activeDataKey:void 0,activeCoordinate:a.activeCoordinate}))}else if(i==="item"){var s,l=n.touches[0];if(document.elementFromPoint==null||l==null)return;var u=document.elementFromPoint(l.clientX,l.clientY);if(!u||!u.getAttribute)return;var c=u.getAttribute(kN),f=(s=u.getAttribute(CN))!==null&&s!==void 0?s:void 0,d=da(r).find(v=>v.id===f);if(c==null||d==null||f==null)return;var{dataKey:p}=d,h=O9(r,c,f);t.dispatch(zL({activeDataKey:p,activeIndex:c,activeCoordinate:h,activeGraphicalItemId:f}))}}}});var E9=kO({brush:DF,cartesianAxis:CF,chartData:E8,errorBars:nB,graphicalItems:iF,layout:uN,legend:v4,options:w8,polarAxis:Wz,polarOptions:S9,referenceElements:qF,rootProps:w9,tooltip:BL,zIndex:l8}),k9=function(t){var n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:"Chart";return II({reducer:E9,preloadedState:t,middleware:r=>{var i;return r({serializableCheck:!1,immutableCheck:!["commonjs","es6","production"].includes((i="es6")!==null&&i!==void 0?i:"")}).concat([VC.middleware,HC.middleware,Hg.middleware,GC.middleware,ZC.middleware])},enhancers:r=>{var i=r;return typeof r=="function"&&(i=r()),i.concat(BO({type:"raf"}))},devTools:{serialize:{replacer:x9},name:"recharts-".concat(n)}})};function C9(e){var{preloadedState:t,children:n,reduxStoreName:r}=e,i=St(),o=m.useRef(null);if(i)return n;o.current==null&&(o.current=k9(t,r));var a=bv;return m.createElement(kB,{context:a,store:o.current},n)}function _9(e){var{layout:t,margin:n}=e,r=Ue(),i=St();return m.useEffect(()=>{i||(r(aN(t)),r(oN(n)))},[r,i,t,n]),null}var A9=m.memo(_9,zg);function j9(e){var t=Ue();return m.useEffect(()=>{t(b9(e))},[t,e]),null}function Iw(e){var{zIndex:t,isPanorama:n}=e,r=m.useRef(null),i=Ue();return m.useLayoutEffect(()=>(r.current&&i(a8({zIndex:t,element:r.current,isPanorama:n})),()=>{i(s8({zIndex:t,isPanorama:n}))}),[i,t,n]),m.createElement("g",{tabIndex:-1,ref:r})}function Nw(e){var{children:t,isPanorama:n}=e,r=J(X6);if(!r||r.length===0)return t;var i=r.filter(a=>a<0),o=r.filter(a=>a>0);return m.createElement(m.Fragment,null,i.map(a=>m.createElement(Iw,{key:a,zIndex:a,isPanorama:n})),t,o.map(a=>m.createElement(Iw,{key:a,zIndex:a,isPanorama:n})))}var M9=["children"];function T9(e,t){if(e==null)return{};var n,r,i=$9(e,t);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);for(r=0;r<o.length;r++)n=o[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function $9(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function Lc(){return Lc=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Lc.apply(null,arguments)}var I9={width:"100%",height:"100%",display:"block"},N9=m.forwardRef((e,t)=>{var n=h2(),r=m2(),i=P2();if(!Yn(n)||!Yn(r))return null;var{children:o,otherAttributes:a,title:s,desc:l}=e,u,c;return a!=null&&(typeof a.tabIndex=="number"?u=a.tabIndex:u=i?0:void 0,typeof a.role=="string"?c=a.role:c=i?"application":void 0),m.createElement(MP,Lc({},a,{title:s,desc:l,role:c,tabIndex:u,width:n,height:r,style:I9,ref:t}),o)}),D9=e=>{var{children:t}=e,n=J(jf);if(!n)return null;var{width:r,height:i,y:o,x:a}=n;return m.createElement(MP,{width:r,height:i,x:a,y:o},t)},Dw=m.forwardRef((e,t)=>{var{children:n}=e,r=T9(e,M9),i=St();return i?m.createElement(D9,null,m.createElement(Nw,{isPanorama:!0},n)):m.createElement(N9,Lc({ref:t},r),m.createElement(Nw,{isPanorama:!1},n))});function R9(){var e=Ue(),[t,n]=m.useState(null),r=J(EN);return m.useEffect(()=>{if(t!=null){var i=t.getBoundingClientRect(),o=i.width/t.offsetWidth;me(o)&&o!==r&&e(lN(o))}},[t,e,r]),n}function Rw(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function L9(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?Rw(Object(n),!0).forEach(function(r){z9(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Rw(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function z9(e,t,n){return(t=F9(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function F9(e){var t=B9(e,"string");return typeof t=="symbol"?t:t+""}function B9(e,t){if(typeof e!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||"default");if(typeof r!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}function Xi(){return Xi=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Xi.apply(null,arguments)}var U9=()=>(I8(),null);function zc(e){if(typeof e=="number")return e;if(typeof e=="string"){var t=parseFloat(e);if(!Number.isNaN(t))return t}return 0}var V9=m.forwardRef((e,t)=>{var n,r,i=m.useRef(null),[o,a]=m.useState({containerWidth:zc((n=e.style)===null||n===void 0?void 0:n.width),containerHeight:zc((r=e.style)===null||r===void 0?void 0:r.height)}),s=m.useCallback((u,c)=>{a(f=>{var d=Math.round(u),p=Math.round(c);return f.containerWidth===d&&f.containerHeight===p?f:{containerWidth:d,containerHeight:p}})},[]),l=m.useCallback(u=>{if(typeof t=="function"&&t(u),u!=null&&typeof ResizeObserver<"u"){var{width:c,height:f}=u.getBoundingClientRect();s(c,f);var d=h=>{var{width:v,height:y}=h[0].contentRect;s(v,y)},p=new ResizeObserver(d);p.observe(u),i.current=p}},[t,s]);return m.useEffect(()=>()=>{var u=i.current;u!=null&&u.disconnect()},[s]),m.createElement(m.Fragment,null,m.createElement(Mf,{width:o.containerWidth,height:o.containerHeight}),m.createElement("div",Xi({ref:l},e)))}),H9=m.forwardRef((e,t)=>{var{width:n,height:r}=e,[i,o]=m.useState({containerWidth:zc(n),containerHeight:zc(r)}),a=m.useCallback((l,u)=>{o(c=>{var f=Math.round(l),d=Math.round(u);return c.containerWidth===f&&c.containerHeight===d?c:{containerWidth:f,containerHeight:d}})},[]),s=m.useCallback(l=>{if(typeof t=="function"&&t(l),l!=null){var{width:u,height:c}=l.getBoundingClientRect();a(u,c)}},[t,a]);return m.createElement(m.Fragment,null,m.createElement(Mf,{width:i.containerWidth,height:i.containerHeight}),m.createElement("div",Xi({ref:s},e)))}),K9=m.forwardRef((e,t)=>{var{width:n,height:r}=e;return m.createElement(m.Fragment,null,m.createElement(Mf,{width:n,height:r}),m.createElement("div",Xi({ref:t},e)))}),W9=m.forwardRef((e,t)=>{var{width:n,height:r}=e;return yr(n)||yr(r)?m.createElement(H9,Xi({},e,{ref:t})):m.createElement(K9,Xi({},e,{ref:t}))});function Y9(e){return e===!0?V9:W9}var q9=m.forwardRef((e,t)=>{var{children:n,className:r,height:i,onClick:o,onContextMenu:a,onDoubleClick:s,onMouseDown:l,onMouseEnter:u,onMouseLeave:c,onMouseMove:f,onMouseUp:d,onTouchEnd:p,onTouchMove:h,onTouchStart:v,style:y,width:g,responsive:x,dispatchTouchEvents:w=!0}=e,S=m.useRef(null),P=Ue(),[O,k]=m.useState(null),[j,M]=m.useState(null),A=R9(),C=jv(),_=(C==null?void 0:C.width)>0?C.width:g,N=(C==null?void 0:C.height)>0?C.height:i,L=m.useCallback(D=>{A(D),typeof t=="function"&&t(D),k(D),M(D),D!=null&&(S.current=D)},[A,t,k,M]),V=m.useCallback(D=>{P(UC(D)),P(rn({handler:o,reactEvent:D}))},[P,o]),B=m.useCallback(D=>{P(Zh(D)),P(rn({handler:u,reactEvent:D}))},[P,u]),U=m.useCallback(D=>{P(_k()),P(rn({handler:c,reactEvent:D}))},[P,c]),$=m.useCallback(D=>{P(Zh(D)),P(rn({handler:f,reactEvent:D}))},[P,f]),z=m.useCallback(()=>{P(qC())},[P]),K=m.useCallback(D=>{P(YC(D.key))},[P]),X=m.useCallback(D=>{P(rn({handler:a,reactEvent:D}))},[P,a]),re=m.useCallback(D=>{P(rn({handler:s,reactEvent:D}))},[P,s]),Se=m.useCallback(D=>{P(rn({handler:l,reactEvent:D}))},[P,l]),le=m.useCallback(D=>{P(rn({handler:d,reactEvent:D}))},[P,d]),se=m.useCallback(D=>{P(rn({handler:v,reactEvent:D}))},[P,v]),de=m.useCallback(D=>{w&&P(XC(D)),P(rn({handler:h,reactEvent:D}))},[P,w,h]),ne=m.useCallback(D=>{P(rn({handler:p,reactEvent:D}))},[P,p]),Z=Y9(x);return m.createElement(qk.Provider,{value:O},m.createElement(qT.Provider,{value:j},m.createElement(Z,{width:_??(y==null?void 0:y.width),height:N??(y==null?void 0:y.height),className:ve("recharts-wrapper",r),style:L9({position:"relative",cursor:"default",width:_,height:N},y),onClick:V,onContextMenu:X,onDoubleClick:re,onFocus:z,onKeyDown:K,onMouseDown:Se,onMouseEnter:B,onMouseLeave:U,onMouseMove:$,onMouseUp:le,onTouchEnd:ne,onTouchMove:de,onTouchStart:se,ref:L},m.createElement(U9,null),n)))}),G9=["width","height","responsive","children","className","style","compact","title","desc"];function X9(e,t){if(e==null)return{};var n,r,i=Z9(e,t);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);for(r=0;r<o.length;r++)n=o[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function Z9(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var Q9=m.forwardRef((e,t)=>{var{width:n,height:r,responsive:i,children:o,className:a,style:s,compact:l,title:u,desc:c}=e,f=X9(e,G9),d=jn(f);return l?m.createElement(m.Fragment,null,m.createElement(Mf,{width:n,height:r}),m.createElement(Dw,{otherAttributes:d,title:u,desc:c},o)):m.createElement(q9,{className:a,style:s,width:n,height:r,responsive:i??!1,onClick:e.onClick,onMouseLeave:e.onMouseLeave,onMouseEnter:e.onMouseEnter,onMouseMove:e.onMouseMove,onMouseDown:e.onMouseDown,onMouseUp:e.onMouseUp,onContextMenu:e.onContextMenu,onDoubleClick:e.onDoubleClick,onTouchStart:e.onTouchStart,onTouchMove:e.onTouchMove,onTouchEnd:e.onTouchEnd},m.createElement(Dw,{otherAttributes:d,title:u,desc:c,ref:t},m.createElement(GF,null,o)))});function Qh(){return Qh=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Qh.apply(null,arguments)}var J9={top:5,right:5,bottom:5,left:5},eU={accessibilityLayer:!0,barCategoryGap:"10%",barGap:4,layout:"horizontal",margin:J9,responsive:!1,reverseStackOrder:!1,stackOffset:"none",syncMethod:"index"},tU=m.forwardRef(function(t,n){var r,i=At(t.categoricalChartProps,eU),{chartName:o,defaultTooltipEventType:a,validateTooltipEventTypes:s,tooltipPayloadSearcher:l,categoricalChartProps:u}=t,c={chartName:o,defaultTooltipEventType:a,validateTooltipEventTypes:s,tooltipPayloadSearcher:l,eventEmitter:void 0};return m.createElement(C9,{preloadedState:{options:c},reduxStoreName:(r=u.id)!==null&&r!==void 0?r:o},m.createElement(NF,{chartData:u.data}),m.createElement(A9,{layout:i.layout,margin:i.margin}),m.createElement(j9,{baseValue:i.baseValue,accessibilityLayer:i.accessibilityLayer,barCategoryGap:i.barCategoryGap,maxBarSize:i.maxBarSize,stackOffset:i.stackOffset,barGap:i.barGap,barSize:i.barSize,syncId:i.syncId,syncMethod:i.syncMethod,className:i.className,reverseStackOrder:i.reverseStackOrder}),m.createElement(Q9,Qh({},i,{ref:n})))}),nU=["axis"],rU=m.forwardRef((e,t)=>m.createElement(tU,{chartName:"AreaChart",defaultTooltipEventType:"axis",validateTooltipEventTypes:nU,tooltipPayloadSearcher:y8,categoricalChartProps:e,ref:t}));const iU=({data:e,containerWidth:t=1179,containerHeight:n=2556})=>{const[r,i]=m.useState(e.length>0?e.length-1:0),[o,a]=m.useState(!1),s=m.useRef(null);m.useEffect(()=>{e.length>0&&i(e.length-1)},[e]);const l=e[r]||null,u=m.useCallback(M=>{if(!s.current||e.length===0)return r;const A=s.current.querySelector("svg");if(!A)return r;const C=A.getBoundingClientRect(),_=M-C.left-20,N=C.width-40;if(N<=0)return r;const L=Math.round(_/N*(e.length-1));return Math.max(0,Math.min(e.length-1,L))},[e.length,r]),c=m.useCallback(M=>{if(!o)return;const A=u(M.clientX);A!==r&&i(A)},[o,u,r]),f=m.useCallback(()=>{a(!0)},[]),d=m.useCallback(()=>{a(!1)},[]),p=m.useCallback(()=>{a(!1)},[]),h=24,v=h/4,y=E(36,t),g=E(42,t),x=T(231,n),w=E(42,t)/2,S=E(2,t),P=E(4,t),O=M=>{const{x:A,y:C,payload:_}=M,N=_.value,L=parseInt(N,10);return L!==void 0&&!isNaN(L)&&(L===0||L===15||L===30||L===45)?b.jsx("text",{x:A,y:C+5,textAnchor:"middle",fill:"#6b7280",style:{fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:500,fontSize:`${y}px`,lineHeight:"100%",letterSpacing:"0%",textAlign:"center"},children:N}):null},k=M=>{const{y:A,payload:C}=M,_=C.value;if(_===8||_===16||_===24||_===32){const N=A!==void 0&&!isNaN(A)?A+5:null;if(N!==null)return b.jsx("text",{x:0,y:N,textAnchor:"start",fill:"#6b7280",style:{fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:500,fontSize:`${y}px`,lineHeight:"100%",letterSpacing:"0%",textAlign:"center"},children:_})}return null},j=E(58,t);return b.jsxs("div",{className:"w-full h-full flex flex-col",children:[b.jsxs("div",{className:"flex items-center justify-between",style:{paddingRight:`${j}px`},children:[b.jsx("div",{className:"text-lg font-semibold text-gray-800",children:"呼吸率"}),l&&b.jsxs("div",{className:"flex items-baseline",children:[b.jsx("span",{style:{fontSize:`${h}px`,fontWeight:"bold",color:"#1f2937"},children:l.value}),b.jsx("span",{style:{fontSize:`${v}px`,color:"#6b7280",marginLeft:"4px"},children:"BMP"})]})]}),b.jsx("div",{ref:s,className:"flex-1 flex items-center relative",onMouseMove:c,onMouseDown:f,onMouseUp:d,onMouseLeave:p,style:{cursor:o?"grabbing":"grab"},children:b.jsx(ZN,{width:"100%",height:"100%",children:b.jsxs(rU,{data:e,margin:{top:10,right:0,bottom:0,left:-12},children:[b.jsxs("defs",{children:[b.jsxs("linearGradient",{id:"respirationGradient",x1:"0",y1:"0",x2:"0",y2:"1",children:[b.jsx("stop",{offset:"0%",stopColor:"#FFE4E6"}),b.jsx("stop",{offset:"90.11%",stopColor:"rgba(217, 217, 217, 0)"})]}),b.jsxs("linearGradient",{id:"dotGradient",x1:"0%",y1:"0%",x2:"0%",y2:"100%",gradientUnits:"userSpaceOnUse",children:[b.jsx("stop",{offset:"0%",stopColor:"#F2769E",stopOpacity:"0.6"}),b.jsx("stop",{offset:"50%",stopColor:"#F2769E",stopOpacity:"0.4"}),b.jsx("stop",{offset:"80%",stopColor:"rgba(255, 204, 224, 0.2)",stopOpacity:"0.2"}),b.jsx("stop",{offset:"95%",stopColor:"rgba(255, 204, 224, 0.1)",stopOpacity:"0.1"}),b.jsx("stop",{offset:"100%",stopColor:"rgba(255, 204, 224, 0)",stopOpacity:"0"})]})]}),b.jsx(CC,{strokeDasharray:"3 3",stroke:"#e5e7eb"}),[8,16,24,32].map(M=>b.jsx(OC,{y:M,stroke:"#D8CAD2",strokeWidth:S,strokeDasharray:"4 4"},`grid-line-${M}`)),b.jsx(FC,{dataKey:"time",stroke:"#D8CAD2",tick:O,axisLine:{stroke:"#D8CAD2",strokeWidth:S},tickLine:!1,height:20}),b.jsx(BC,{domain:[0,32],ticks:[8,16,24,32],stroke:"transparent",tick:k,axisLine:!1,tickLine:!1,width:35,orientation:"left",allowDecimals:!1}),b.jsx(U8,{contentStyle:{display:"none"},cursor:!1}),b.jsx(LC,{type:"monotone",dataKey:"value",stroke:"#82797F",strokeWidth:2,fill:"url(#respirationGradient)",activeDot:!1}),l&&b.jsxs(b.Fragment,{children:[b.jsx(qh,{x:l.time,y:l.value,r:0,fill:"none",stroke:"none",shape:M=>{const{cx:A,cy:C}=M,_=A,N=C;if(_===void 0||N===void 0)return b.jsx("g",{});const L=_-g/2,V=N;return b.jsx("g",{style:{pointerEvents:"none"},children:b.jsx("rect",{x:L,y:V,width:g,height:x,fill:"url(#dotGradient)"})})}}),b.jsx(qh,{x:l.time,y:l.value,r:w,fill:"#EFE8EC",stroke:"#82797F",strokeWidth:P})]})]})})})]})},Lw=({title:e="",value:t,unit:n="",valueFontSize:r=24,unitFontSize:i=6,decimalPlaces:o=0,maxValue:a=100,containerWidth:s=617,showOnlySVG:l=!1})=>{const[u,c]=m.useState("");m.useEffect(()=>{fetch("/wave-path.svg").then(d=>d.text()).then(d=>{const v=new DOMParser().parseFromString(d,"image/svg+xml").querySelector("#wave-path");if(v){const y=v.getAttribute("d");y&&c(y)}}).catch(d=>{console.error("Failed to load wave-path.svg:",d),c("M1.70264 23C29.0152 13.1081 73.084 5 136.925 5C200.766 5 255.056 23 339.004 23C417.423 23 458.811 11 469.703 5")})},[]);const f=m.useMemo(()=>{const d=(k,j,M,A,C)=>{const _=1-k;return _*_*_*j+3*_*_*k*M+3*_*k*k*A+k*k*k*C},p=Math.min(Math.max(t/a,0),1),h=469.703-1.70264,v=136.925-1.70264,y=339.004-136.925,g=469.703-339.004,x=v/h,w=y/h,S=g/h;let P=0,O=0;if(p<=x){const k=p/x;P=d(k,1.70264,29.0152,73.084,136.925),O=d(k,23,13.1081,5,5)}else if(p<=x+w){const k=(p-x)/w;P=d(k,136.925,200.766,255.056,339.004),O=d(k,5,5,23,23)}else{const k=(p-x-w)/S;P=d(k,339.004,417.423,458.811,469.703),O=d(k,23,23,11,5)}return{x:P,y:O}},[t,a]);return l?b.jsx("div",{className:"w-full h-full relative",style:{minHeight:0},children:b.jsxs("svg",{width:"100%",height:"100%",viewBox:"0 0 473 28",preserveAspectRatio:"xMidYMid meet",style:{overflow:"visible"},children:[b.jsx("defs",{children:b.jsxs("linearGradient",{id:`waveGradient-${e||"wave"}`,x1:"1.70264",y1:"14",x2:"469.703",y2:"14",gradientUnits:"userSpaceOnUse",children:[b.jsx("stop",{stopColor:"#BBADB7",stopOpacity:"0"}),b.jsx("stop",{offset:"0.307692",stopColor:"#978B94"}),b.jsx("stop",{offset:"0.509615",stopColor:"#6E4764"}),b.jsx("stop",{offset:"0.706731",stopColor:"#746B71"}),b.jsx("stop",{offset:"1",stopColor:"#82797F",stopOpacity:"0"})]})}),u&&b.jsx("path",{d:u,stroke:`url(#waveGradient-${e||"wave"})`,strokeWidth:"10",fill:"none",strokeLinecap:"round",strokeLinejoin:"round"}),b.jsx("circle",{cx:f.x,cy:f.y,r:"12",fill:"#685563",stroke:"#685563",strokeWidth:"2"})]})}):b.jsxs("div",{className:"w-full h-full relative",style:{backgroundColor:"#F6EDF3",borderRadius:`${E(10,s)}px`,padding:`${E(16,s)}px`},children:[e&&b.jsx("div",{className:"absolute font-semibold text-gray-800",style:{top:`${E(4,s)}px`,right:`${E(4,s)}px`,fontSize:`${E(9,s)}px`},children:e}),b.jsxs("div",{className:"absolute flex items-baseline",style:{bottom:`${E(4,s)}px`,left:`${E(4,s)}px`},children:[b.jsx("span",{style:{fontSize:`${r}px`,fontWeight:"bold",color:"#1f2937"},children:o>0?t.toFixed(o):t}),n&&b.jsx("span",{style:{fontSize:`${i}px`,color:"#6b7280",marginLeft:"4px"},children:n})]}),b.jsx("div",{className:"w-full h-full flex items-center justify-center relative",style:{minHeight:0},children:b.jsxs("svg",{width:"100%",height:"100%",viewBox:"0 0 473 28",preserveAspectRatio:"xMidYMid meet",style:{overflow:"visible"},children:[b.jsx("defs",{children:b.jsxs("linearGradient",{id:`waveGradient-${e||"wave"}`,x1:"1.70264",y1:"14",x2:"469.703",y2:"14",gradientUnits:"userSpaceOnUse",children:[b.jsx("stop",{stopColor:"#BBADB7",stopOpacity:"0"}),b.jsx("stop",{offset:"0.307692",stopColor:"#978B94"}),b.jsx("stop",{offset:"0.509615",stopColor:"#6E4764"}),b.jsx("stop",{offset:"0.706731",stopColor:"#746B71"}),b.jsx("stop",{offset:"1",stopColor:"#82797F",stopOpacity:"0"})]})}),u&&b.jsx("path",{d:u,stroke:`url(#waveGradient-${e||"wave"})`,strokeWidth:"10",fill:"none",strokeLinecap:"round",strokeLinejoin:"round"}),b.jsx("circle",{cx:f.x,cy:f.y,r:"12",fill:"#685563",stroke:"#685563",strokeWidth:"2"})]})})]})},zw=({title:e,value:t,unit:n="",valueFontSize:r=24,unitFontSize:i=6,decimalPlaces:o=0,minValue:a=0,maxValue:s=100,containerWidth:l=617,showOnlySVG:u=!1})=>{const[c,f]=m.useState("");m.useEffect(()=>{fetch("/gauge-chart.svg").then(L=>L.text()).then(L=>{const U=new DOMParser().parseFromString(L,"image/svg+xml").querySelector("#gauge-scale-path");if(U){const $=U.getAttribute("d");$&&f($)}}).catch(L=>{console.error("Failed to load gauge-chart.svg:",L),f("M5.03741 42.4815C9.57568 40.1692 15.1297 41.9736 17.4422 46.5117L35.2824 81.5263C37.5946 86.0646 35.7903 91.6179 31.2521 93.9304C26.7137 96.2428 21.1597 94.4385 18.8473 89.9001L1.00714 54.8863C-1.30513 50.3479 0.499079 44.7939 5.03741 42.4815ZM346.53 46.5125C348.842 41.9742 354.396 40.169 358.935 42.4815C363.473 44.7939 365.277 50.348 362.965 54.8863L345.125 89.9001C342.812 94.4385 337.258 96.2427 332.72 93.9304C328.182 91.6179 326.377 86.0647 328.69 81.5263L346.53 46.5125ZM32.2436 29.9121C36.9461 27.9553 42.3444 30.1815 44.3015 34.8838L59.3998 71.1656C61.3565 75.8681 59.1306 81.2665 54.4281 83.2235C49.7255 85.1803 44.3264 82.9544 42.3694 78.2518L27.2728 41.9708C25.3159 37.2682 27.5411 31.8691 32.2436 29.9121ZM318.513 34.4374C320.455 29.7286 325.846 27.4851 330.555 29.4266C335.264 31.3682 337.507 36.7592 335.565 41.468L320.587 77.7983C318.645 82.5074 313.254 84.7507 308.545 82.8092C303.836 80.8676 301.592 75.4766 303.534 70.7677L318.513 34.4374ZM61.5426 19.076C66.3867 17.5021 71.5901 20.1536 73.1642 24.9977L85.3075 62.3712C86.8815 67.2154 84.23 72.4188 79.3858 73.9929C74.5416 75.5666 69.3389 72.9154 67.7649 68.0712L55.6217 30.6977C54.0478 25.8535 56.6984 20.65 61.5426 19.076ZM290.808 24.9977C292.382 20.1536 297.585 17.502 302.43 19.076C307.274 20.6501 309.924 25.8535 308.35 30.6977L296.207 68.0712C294.633 72.9153 289.43 75.5665 284.586 73.9929C279.742 72.4188 277.091 67.2155 278.665 62.3712L290.808 24.9977ZM90.3802 10.9176C95.331 9.72046 100.315 12.7641 101.512 17.7148L110.748 55.9107C111.946 60.8616 108.902 65.8457 103.951 67.0429C99.0004 68.2397 94.0169 65.1964 92.8198 60.2456L83.5837 22.0505C82.3866 17.0997 85.4294 12.1148 90.3802 10.9176ZM261.247 17.4548C262.428 12.5 267.402 9.44055 272.357 10.6215C277.311 11.8026 280.37 16.7764 279.189 21.731L270.079 59.9574C268.898 64.9122 263.923 67.9709 258.968 66.7899C254.014 65.6088 250.955 60.6351 252.136 55.6805L261.247 17.4548ZM121.014 4.79857C126.044 4.00185 130.769 7.43444 131.565 12.4652L137.713 51.2782C138.51 56.3089 135.078 61.033 130.047 61.83C125.016 62.6268 120.292 59.1943 119.495 54.1634L113.347 15.3504C112.55 10.3197 115.983 5.59543 121.014 4.79857ZM232.407 12.4652C233.204 7.4344 237.928 4.00177 242.958 4.79857C247.989 5.59547 251.422 10.3198 250.625 15.3504L244.477 54.1642C243.68 59.1948 238.956 62.6267 233.925 61.83C228.894 61.0331 225.462 56.309 226.259 51.2782L232.407 12.4652ZM150.773 1.25153C155.85 0.84384 160.296 4.62919 160.704 9.706L163.851 48.8777C164.259 53.9547 160.474 58.4005 155.397 58.8085C150.32 59.2163 145.873 55.4312 145.465 50.354L142.319 11.1839C141.911 6.10664 145.696 1.65945 150.773 1.25153ZM202.029 9.63943C202.421 4.56089 206.855 0.760709 211.933 1.15206C217.012 1.54342 220.811 5.97779 220.42 11.0562L217.401 50.2373C217.009 55.3159 212.575 59.1153 207.497 58.7239C202.418 58.3325 198.619 53.8983 199.01 48.8198L202.029 9.63943ZM181.986 0C187.079 7.93579e-05 191.209 4.12933 191.209 9.22277V48.5198C191.209 53.6133 187.08 57.7425 181.986 57.7426C176.892 57.7426 172.763 53.6134 172.763 48.5198V9.22277C172.763 4.12929 176.893 0 181.986 0Z")})},[]);const d=5,p=42,h=182,v=0,y=346,g=46,x=h,w=m.useMemo(()=>{let L=200,V=1/0;for(let B=150;B<=250;B+=1){const U=Math.sqrt((d-x)**2+(p-B)**2),$=Math.sqrt((h-x)**2+(v-B)**2),z=Math.sqrt((y-x)**2+(g-B)**2),K=(U+$+z)/3,X=Math.abs(U-K)+Math.abs($-K)+Math.abs(z-K);X<V&&(V=X,L=B)}return L+80},[x,d,p,h,v,y,g]),S=m.useMemo(()=>{const L=Math.sqrt((d-x)**2+(p-w)**2),V=Math.sqrt((h-x)**2+(v-w)**2),B=Math.sqrt((y-x)**2+(g-w)**2);return(L+V+B)/3},[x,w,d,p,h,v,y,g]),P=Math.atan2(p-w,d-x)*(180/Math.PI),O=Math.atan2(g-w,y-x)*(180/Math.PI),{pointerX:k,pointerY:j,pointerAngle:M}=m.useMemo(()=>{const L=s-a,V=L>0?Math.min(Math.max((t-a)/L,0),1):0,B=P+V*(O-P),U=B*(Math.PI/180),$=x+S*Math.cos(U),z=w+S*Math.sin(U)-30,K=B+180+90;return{pointerX:$,pointerY:z,pointerAngle:K}},[t,s,P,O,S,x,w]),A=41*.5*.5*1.2,C=126*.9,_=A/2,N=C;return u?b.jsx("div",{className:"w-full h-full relative",style:{minHeight:0},children:b.jsxs("svg",{width:"100%",height:"100%",viewBox:"0 0 364 95",preserveAspectRatio:"xMidYMid meet",style:{overflow:"visible"},children:[b.jsx("defs",{children:b.jsxs("linearGradient",{id:`gaugeGradient-${e}`,x1:"-74.8485",y1:"69.9316",x2:"437.878",y2:"69.9316",gradientUnits:"userSpaceOnUse",children:[b.jsx("stop",{offset:"0.0485284",stopColor:"#9CC5B6",stopOpacity:"0"}),b.jsx("stop",{offset:"0.474249",stopColor:"#79A598"}),b.jsx("stop",{offset:"1",stopColor:"#EDFFF9",stopOpacity:"0.57"})]})}),c&&b.jsx("path",{d:c,fill:`url(#gaugeGradient-${e})`}),b.jsx("g",{transform:`translate(${k}, ${j}) rotate(${M}) translate(-${_}, -${N})`,children:b.jsx("rect",{x:"0",y:"0",width:A,height:C,fill:"#685563",stroke:"white",strokeWidth:"4",rx:"4",ry:"4",style:{shapeRendering:"geometricPrecision"}})})]})}):b.jsxs("div",{className:"w-full h-full relative",style:{backgroundColor:"transparent",borderRadius:`${E(60,l)}px`,padding:`${E(16,l)}px`},children:[b.jsx("div",{className:"absolute font-semibold text-gray-800",style:{top:`${E(4,l)}px`,right:`${E(4,l)}px`,fontSize:`${E(9,l)}px`},children:e}),b.jsxs("div",{className:"absolute flex items-baseline",style:{bottom:`${E(4,l)}px`,left:`${E(4,l)}px`},children:[b.jsx("span",{style:{fontSize:`${r}px`,fontWeight:"bold",color:"#1f2937"},children:o>0?t.toFixed(o):t}),n&&b.jsx("span",{style:{fontSize:`${i}px`,color:"#6b7280",marginLeft:"4px"},children:n})]}),b.jsx("div",{className:"w-full h-full flex items-center justify-center relative",style:{minHeight:0},children:b.jsxs("svg",{width:"100%",height:"100%",viewBox:"0 0 364 95",preserveAspectRatio:"xMidYMid meet",style:{overflow:"visible"},children:[b.jsx("defs",{children:b.jsxs("linearGradient",{id:`gaugeGradient-${e}`,x1:"-74.8485",y1:"69.9316",x2:"437.878",y2:"69.9316",gradientUnits:"userSpaceOnUse",children:[b.jsx("stop",{offset:"0.0485284",stopColor:"#9CC5B6",stopOpacity:"0"}),b.jsx("stop",{offset:"0.474249",stopColor:"#79A598"}),b.jsx("stop",{offset:"1",stopColor:"#EDFFF9",stopOpacity:"0.57"})]})}),c&&b.jsx("path",{d:c,fill:`url(#gaugeGradient-${e})`}),b.jsx("g",{transform:`translate(${k}, ${j}) rotate(${M}) translate(-${_}, -${N})`,children:b.jsx("rect",{x:"0",y:"0",width:A,height:C,fill:"#685563",stroke:"white",strokeWidth:"4",rx:"4",ry:"4",style:{shapeRendering:"geometricPrecision"}})})]})})]})};function ir(e,t,{checkForDefaultPrevented:n=!0}={}){return function(i){if(e==null||e(i),n===!1||!i.defaultPrevented)return t==null?void 0:t(i)}}function Fw(e,t){if(typeof e=="function")return e(t);e!=null&&(e.current=t)}function QC(...e){return t=>{let n=!1;const r=e.map(i=>{const o=Fw(i,t);return!n&&typeof o=="function"&&(n=!0),o});if(n)return()=>{for(let i=0;i<r.length;i++){const o=r[i];typeof o=="function"?o():Fw(e[i],null)}}}}function ro(...e){return m.useCallback(QC(...e),e)}function JC(e,t=[]){let n=[];function r(o,a){const s=m.createContext(a),l=n.length;n=[...n,a];const u=f=>{var g;const{scope:d,children:p,...h}=f,v=((g=d==null?void 0:d[e])==null?void 0:g[l])||s,y=m.useMemo(()=>h,Object.values(h));return b.jsx(v.Provider,{value:y,children:p})};u.displayName=o+"Provider";function c(f,d){var v;const p=((v=d==null?void 0:d[e])==null?void 0:v[l])||s,h=m.useContext(p);if(h)return h;if(a!==void 0)return a;throw new Error(`\`${f}\` must be used within \`${o}\``)}return[u,c]}const i=()=>{const o=n.map(a=>m.createContext(a));return function(s){const l=(s==null?void 0:s[e])||o;return m.useMemo(()=>({[`__scope${e}`]:{...s,[e]:l}}),[s,l])}};return i.scopeName=e,[r,oU(i,...t)]}function oU(...e){const t=e[0];if(e.length===1)return t;const n=()=>{const r=e.map(i=>({useScope:i(),scopeName:i.scopeName}));return function(o){const a=r.reduce((s,{useScope:l,scopeName:u})=>{const f=l(o)[`__scope${u}`];return{...s,...f}},{});return m.useMemo(()=>({[`__scope${t.scopeName}`]:a}),[a])}};return n.scopeName=t.scopeName,n}function aU(e){const t=sU(e),n=m.forwardRef((r,i)=>{const{children:o,...a}=r,s=m.Children.toArray(o),l=s.find(uU);if(l){const u=l.props.children,c=s.map(f=>f===l?m.Children.count(u)>1?m.Children.only(null):m.isValidElement(u)?u.props.children:null:f);return b.jsx(t,{...a,ref:i,children:m.isValidElement(u)?m.cloneElement(u,void 0,c):null})}return b.jsx(t,{...a,ref:i,children:o})});return n.displayName=`${e}.Slot`,n}function sU(e){const t=m.forwardRef((n,r)=>{const{children:i,...o}=n;if(m.isValidElement(i)){const a=fU(i),s=cU(o,i.props);return i.type!==m.Fragment&&(s.ref=r?QC(r,a):a),m.cloneElement(i,s)}return m.Children.count(i)>1?m.Children.only(null):null});return t.displayName=`${e}.SlotClone`,t}var e_=Symbol("radix.slottable");function lU(e){const t=({children:n})=>b.jsx(b.Fragment,{children:n});return t.displayName=`${e}.Slottable`,t.__radixId=e_,t}function uU(e){return m.isValidElement(e)&&typeof e.type=="function"&&"__radixId"in e.type&&e.type.__radixId===e_}function cU(e,t){const n={...t};for(const r in t){const i=e[r],o=t[r];/^on[A-Z]/.test(r)?i&&o?n[r]=(...s)=>{const l=o(...s);return i(...s),l}:i&&(n[r]=i):r==="style"?n[r]={...i,...o}:r==="className"&&(n[r]=[i,o].filter(Boolean).join(" "))}return{...e,...n}}function fU(e){var r,i;let t=(r=Object.getOwnPropertyDescriptor(e.props,"ref"))==null?void 0:r.get,n=t&&"isReactWarning"in t&&t.isReactWarning;return n?e.ref:(t=(i=Object.getOwnPropertyDescriptor(e,"ref"))==null?void 0:i.get,n=t&&"isReactWarning"in t&&t.isReactWarning,n?e.props.ref:e.props.ref||e.ref)}var dU=["a","button","div","form","h2","h3","img","input","label","li","nav","ol","p","select","span","svg","ul"],yi=dU.reduce((e,t)=>{const n=aU(`Primitive.${t}`),r=m.forwardRef((i,o)=>{const{asChild:a,...s}=i,l=a?n:t;return typeof window<"u"&&(window[Symbol.for("radix-ui")]=!0),b.jsx(l,{...s,ref:o})});return r.displayName=`Primitive.${t}`,{...e,[t]:r}},{});function pU(e,t){e&&ia.flushSync(()=>e.dispatchEvent(t))}function Zf(e){const t=m.useRef(e);return m.useEffect(()=>{t.current=e}),m.useMemo(()=>(...n)=>{var r;return(r=t.current)==null?void 0:r.call(t,...n)},[])}function hU(e,t=globalThis==null?void 0:globalThis.document){const n=Zf(e);m.useEffect(()=>{const r=i=>{i.key==="Escape"&&n(i)};return t.addEventListener("keydown",r,{capture:!0}),()=>t.removeEventListener("keydown",r,{capture:!0})},[n,t])}var mU="DismissableLayer",Jh="dismissableLayer.update",vU="dismissableLayer.pointerDownOutside",gU="dismissableLayer.focusOutside",Bw,t_=m.createContext({layers:new Set,layersWithOutsidePointerEventsDisabled:new Set,branches:new Set}),n_=m.forwardRef((e,t)=>{const{disableOutsidePointerEvents:n=!1,onEscapeKeyDown:r,onPointerDownOutside:i,onFocusOutside:o,onInteractOutside:a,onDismiss:s,...l}=e,u=m.useContext(t_),[c,f]=m.useState(null),d=(c==null?void 0:c.ownerDocument)??(globalThis==null?void 0:globalThis.document),[,p]=m.useState({}),h=ro(t,k=>f(k)),v=Array.from(u.layers),[y]=[...u.layersWithOutsidePointerEventsDisabled].slice(-1),g=v.indexOf(y),x=c?v.indexOf(c):-1,w=u.layersWithOutsidePointerEventsDisabled.size>0,S=x>=g,P=wU(k=>{const j=k.target,M=[...u.branches].some(A=>A.contains(j));!S||M||(i==null||i(k),a==null||a(k),k.defaultPrevented||s==null||s())},d),O=bU(k=>{const j=k.target;[...u.branches].some(A=>A.contains(j))||(o==null||o(k),a==null||a(k),k.defaultPrevented||s==null||s())},d);return hU(k=>{x===u.layers.size-1&&(r==null||r(k),!k.defaultPrevented&&s&&(k.preventDefault(),s()))},d),m.useEffect(()=>{if(c)return n&&(u.layersWithOutsidePointerEventsDisabled.size===0&&(Bw=d.body.style.pointerEvents,d.body.style.pointerEvents="none"),u.layersWithOutsidePointerEventsDisabled.add(c)),u.layers.add(c),Uw(),()=>{n&&u.layersWithOutsidePointerEventsDisabled.size===1&&(d.body.style.pointerEvents=Bw)}},[c,d,n,u]),m.useEffect(()=>()=>{c&&(u.layers.delete(c),u.layersWithOutsidePointerEventsDisabled.delete(c),Uw())},[c,u]),m.useEffect(()=>{const k=()=>p({});return document.addEventListener(Jh,k),()=>document.removeEventListener(Jh,k)},[]),b.jsx(yi.div,{...l,ref:h,style:{pointerEvents:w?S?"auto":"none":void 0,...e.style},onFocusCapture:ir(e.onFocusCapture,O.onFocusCapture),onBlurCapture:ir(e.onBlurCapture,O.onBlurCapture),onPointerDownCapture:ir(e.onPointerDownCapture,P.onPointerDownCapture)})});n_.displayName=mU;var yU="DismissableLayerBranch",xU=m.forwardRef((e,t)=>{const n=m.useContext(t_),r=m.useRef(null),i=ro(t,r);return m.useEffect(()=>{const o=r.current;if(o)return n.branches.add(o),()=>{n.branches.delete(o)}},[n.branches]),b.jsx(yi.div,{...e,ref:i})});xU.displayName=yU;function wU(e,t=globalThis==null?void 0:globalThis.document){const n=Zf(e),r=m.useRef(!1),i=m.useRef(()=>{});return m.useEffect(()=>{const o=s=>{if(s.target&&!r.current){let l=function(){r_(vU,n,u,{discrete:!0})};const u={originalEvent:s};s.pointerType==="touch"?(t.removeEventListener("click",i.current),i.current=l,t.addEventListener("click",i.current,{once:!0})):l()}else t.removeEventListener("click",i.current);r.current=!1},a=window.setTimeout(()=>{t.addEventListener("pointerdown",o)},0);return()=>{window.clearTimeout(a),t.removeEventListener("pointerdown",o),t.removeEventListener("click",i.current)}},[t,n]),{onPointerDownCapture:()=>r.current=!0}}function bU(e,t=globalThis==null?void 0:globalThis.document){const n=Zf(e),r=m.useRef(!1);return m.useEffect(()=>{const i=o=>{o.target&&!r.current&&r_(gU,n,{originalEvent:o},{discrete:!1})};return t.addEventListener("focusin",i),()=>t.removeEventListener("focusin",i)},[t,n]),{onFocusCapture:()=>r.current=!0,onBlurCapture:()=>r.current=!1}}function Uw(){const e=new CustomEvent(Jh);document.dispatchEvent(e)}function r_(e,t,n,{discrete:r}){const i=n.originalEvent.target,o=new CustomEvent(e,{bubbles:!1,cancelable:!0,detail:n});t&&i.addEventListener(e,t,{once:!0}),r?pU(i,o):i.dispatchEvent(o)}var ci=globalThis!=null&&globalThis.document?m.useLayoutEffect:()=>{},SU=vm[" useId ".trim().toString()]||(()=>{}),PU=0;function OU(e){const[t,n]=m.useState(SU());return ci(()=>{e||n(r=>r??String(PU++))},[e]),e||(t?`radix-${t}`:"")}const EU=["top","right","bottom","left"],fi=Math.min,Ht=Math.max,Fc=Math.round,Ql=Math.floor,Kn=e=>({x:e,y:e}),kU={left:"right",right:"left",bottom:"top",top:"bottom"},CU={start:"end",end:"start"};function em(e,t,n){return Ht(e,fi(t,n))}function Or(e,t){return typeof e=="function"?e(t):e}function Er(e){return e.split("-")[0]}function ha(e){return e.split("-")[1]}function Kg(e){return e==="x"?"y":"x"}function Wg(e){return e==="y"?"height":"width"}const _U=new Set(["top","bottom"]);function Bn(e){return _U.has(Er(e))?"y":"x"}function Yg(e){return Kg(Bn(e))}function AU(e,t,n){n===void 0&&(n=!1);const r=ha(e),i=Yg(e),o=Wg(i);let a=i==="x"?r===(n?"end":"start")?"right":"left":r==="start"?"bottom":"top";return t.reference[o]>t.floating[o]&&(a=Bc(a)),[a,Bc(a)]}function jU(e){const t=Bc(e);return[tm(e),t,tm(t)]}function tm(e){return e.replace(/start|end/g,t=>CU[t])}const Vw=["left","right"],Hw=["right","left"],MU=["top","bottom"],TU=["bottom","top"];function $U(e,t,n){switch(e){case"top":case"bottom":return n?t?Hw:Vw:t?Vw:Hw;case"left":case"right":return t?MU:TU;default:return[]}}function IU(e,t,n,r){const i=ha(e);let o=$U(Er(e),n==="start",r);return i&&(o=o.map(a=>a+"-"+i),t&&(o=o.concat(o.map(tm)))),o}function Bc(e){return e.replace(/left|right|bottom|top/g,t=>kU[t])}function NU(e){return{top:0,right:0,bottom:0,left:0,...e}}function i_(e){return typeof e!="number"?NU(e):{top:e,right:e,bottom:e,left:e}}function Uc(e){const{x:t,y:n,width:r,height:i}=e;return{width:r,height:i,top:n,left:t,right:t+r,bottom:n+i,x:t,y:n}}function Kw(e,t,n){let{reference:r,floating:i}=e;const o=Bn(t),a=Yg(t),s=Wg(a),l=Er(t),u=o==="y",c=r.x+r.width/2-i.width/2,f=r.y+r.height/2-i.height/2,d=r[s]/2-i[s]/2;let p;switch(l){case"top":p={x:c,y:r.y-i.height};break;case"bottom":p={x:c,y:r.y+r.height};break;case"right":p={x:r.x+r.width,y:f};break;case"left":p={x:r.x-i.width,y:f};break;default:p={x:r.x,y:r.y}}switch(ha(t)){case"start":p[a]-=d*(n&&u?-1:1);break;case"end":p[a]+=d*(n&&u?-1:1);break}return p}const DU=async(e,t,n)=>{const{placement:r="bottom",strategy:i="absolute",middleware:o=[],platform:a}=n,s=o.filter(Boolean),l=await(a.isRTL==null?void 0:a.isRTL(t));let u=await a.getElementRects({reference:e,floating:t,strategy:i}),{x:c,y:f}=Kw(u,r,l),d=r,p={},h=0;for(let v=0;v<s.length;v++){const{name:y,fn:g}=s[v],{x,y:w,data:S,reset:P}=await g({x:c,y:f,initialPlacement:r,placement:d,strategy:i,middlewareData:p,rects:u,platform:a,elements:{reference:e,floating:t}});c=x??c,f=w??f,p={...p,[y]:{...p[y],...S}},P&&h<=50&&(h++,typeof P=="object"&&(P.placement&&(d=P.placement),P.rects&&(u=P.rects===!0?await a.getElementRects({reference:e,floating:t,strategy:i}):P.rects),{x:c,y:f}=Kw(u,d,l)),v=-1)}return{x:c,y:f,placement:d,strategy:i,middlewareData:p}};async function Ds(e,t){var n;t===void 0&&(t={});const{x:r,y:i,platform:o,rects:a,elements:s,strategy:l}=e,{boundary:u="clippingAncestors",rootBoundary:c="viewport",elementContext:f="floating",altBoundary:d=!1,padding:p=0}=Or(t,e),h=i_(p),y=s[d?f==="floating"?"reference":"floating":f],g=Uc(await o.getClippingRect({element:(n=await(o.isElement==null?void 0:o.isElement(y)))==null||n?y:y.contextElement||await(o.getDocumentElement==null?void 0:o.getDocumentElement(s.floating)),boundary:u,rootBoundary:c,strategy:l})),x=f==="floating"?{x:r,y:i,width:a.floating.width,height:a.floating.height}:a.reference,w=await(o.getOffsetParent==null?void 0:o.getOffsetParent(s.floating)),S=await(o.isElement==null?void 0:o.isElement(w))?await(o.getScale==null?void 0:o.getScale(w))||{x:1,y:1}:{x:1,y:1},P=Uc(o.convertOffsetParentRelativeRectToViewportRelativeRect?await o.convertOffsetParentRelativeRectToViewportRelativeRect({elements:s,rect:x,offsetParent:w,strategy:l}):x);return{top:(g.top-P.top+h.top)/S.y,bottom:(P.bottom-g.bottom+h.bottom)/S.y,left:(g.left-P.left+h.left)/S.x,right:(P.right-g.right+h.right)/S.x}}const RU=e=>({name:"arrow",options:e,async fn(t){const{x:n,y:r,placement:i,rects:o,platform:a,elements:s,middlewareData:l}=t,{element:u,padding:c=0}=Or(e,t)||{};if(u==null)return{};const f=i_(c),d={x:n,y:r},p=Yg(i),h=Wg(p),v=await a.getDimensions(u),y=p==="y",g=y?"top":"left",x=y?"bottom":"right",w=y?"clientHeight":"clientWidth",S=o.reference[h]+o.reference[p]-d[p]-o.floating[h],P=d[p]-o.reference[p],O=await(a.getOffsetParent==null?void 0:a.getOffsetParent(u));let k=O?O[w]:0;(!k||!await(a.isElement==null?void 0:a.isElement(O)))&&(k=s.floating[w]||o.floating[h]);const j=S/2-P/2,M=k/2-v[h]/2-1,A=fi(f[g],M),C=fi(f[x],M),_=A,N=k-v[h]-C,L=k/2-v[h]/2+j,V=em(_,L,N),B=!l.arrow&&ha(i)!=null&&L!==V&&o.reference[h]/2-(L<_?A:C)-v[h]/2<0,U=B?L<_?L-_:L-N:0;return{[p]:d[p]+U,data:{[p]:V,centerOffset:L-V-U,...B&&{alignmentOffset:U}},reset:B}}}),LU=function(e){return e===void 0&&(e={}),{name:"flip",options:e,async fn(t){var n,r;const{placement:i,middlewareData:o,rects:a,initialPlacement:s,platform:l,elements:u}=t,{mainAxis:c=!0,crossAxis:f=!0,fallbackPlacements:d,fallbackStrategy:p="bestFit",fallbackAxisSideDirection:h="none",flipAlignment:v=!0,...y}=Or(e,t);if((n=o.arrow)!=null&&n.alignmentOffset)return{};const g=Er(i),x=Bn(s),w=Er(s)===s,S=await(l.isRTL==null?void 0:l.isRTL(u.floating)),P=d||(w||!v?[Bc(s)]:jU(s)),O=h!=="none";!d&&O&&P.push(...IU(s,v,h,S));const k=[s,...P],j=await Ds(t,y),M=[];let A=((r=o.flip)==null?void 0:r.overflows)||[];if(c&&M.push(j[g]),f){const L=AU(i,a,S);M.push(j[L[0]],j[L[1]])}if(A=[...A,{placement:i,overflows:M}],!M.every(L=>L<=0)){var C,_;const L=(((C=o.flip)==null?void 0:C.index)||0)+1,V=k[L];if(V&&(!(f==="alignment"?x!==Bn(V):!1)||A.every($=>Bn($.placement)===x?$.overflows[0]>0:!0)))return{data:{index:L,overflows:A},reset:{placement:V}};let B=(_=A.filter(U=>U.overflows[0]<=0).sort((U,$)=>U.overflows[1]-$.overflows[1])[0])==null?void 0:_.placement;if(!B)switch(p){case"bestFit":{var N;const U=(N=A.filter($=>{if(O){const z=Bn($.placement);return z===x||z==="y"}return!0}).map($=>[$.placement,$.overflows.filter(z=>z>0).reduce((z,K)=>z+K,0)]).sort(($,z)=>$[1]-z[1])[0])==null?void 0:N[0];U&&(B=U);break}case"initialPlacement":B=s;break}if(i!==B)return{reset:{placement:B}}}return{}}}};function Ww(e,t){return{top:e.top-t.height,right:e.right-t.width,bottom:e.bottom-t.height,left:e.left-t.width}}function Yw(e){return EU.some(t=>e[t]>=0)}const zU=function(e){return e===void 0&&(e={}),{name:"hide",options:e,async fn(t){const{rects:n}=t,{strategy:r="referenceHidden",...i}=Or(e,t);switch(r){case"referenceHidden":{const o=await Ds(t,{...i,elementContext:"reference"}),a=Ww(o,n.reference);return{data:{referenceHiddenOffsets:a,referenceHidden:Yw(a)}}}case"escaped":{const o=await Ds(t,{...i,altBoundary:!0}),a=Ww(o,n.floating);return{data:{escapedOffsets:a,escaped:Yw(a)}}}default:return{}}}}},o_=new Set(["left","top"]);async function FU(e,t){const{placement:n,platform:r,elements:i}=e,o=await(r.isRTL==null?void 0:r.isRTL(i.floating)),a=Er(n),s=ha(n),l=Bn(n)==="y",u=o_.has(a)?-1:1,c=o&&l?-1:1,f=Or(t,e);let{mainAxis:d,crossAxis:p,alignmentAxis:h}=typeof f=="number"?{mainAxis:f,crossAxis:0,alignmentAxis:null}:{mainAxis:f.mainAxis||0,crossAxis:f.crossAxis||0,alignmentAxis:f.alignmentAxis};return s&&typeof h=="number"&&(p=s==="end"?h*-1:h),l?{x:p*c,y:d*u}:{x:d*u,y:p*c}}const BU=function(e){return e===void 0&&(e=0),{name:"offset",options:e,async fn(t){var n,r;const{x:i,y:o,placement:a,middlewareData:s}=t,l=await FU(t,e);return a===((n=s.offset)==null?void 0:n.placement)&&(r=s.arrow)!=null&&r.alignmentOffset?{}:{x:i+l.x,y:o+l.y,data:{...l,placement:a}}}}},UU=function(e){return e===void 0&&(e={}),{name:"shift",options:e,async fn(t){const{x:n,y:r,placement:i}=t,{mainAxis:o=!0,crossAxis:a=!1,limiter:s={fn:y=>{let{x:g,y:x}=y;return{x:g,y:x}}},...l}=Or(e,t),u={x:n,y:r},c=await Ds(t,l),f=Bn(Er(i)),d=Kg(f);let p=u[d],h=u[f];if(o){const y=d==="y"?"top":"left",g=d==="y"?"bottom":"right",x=p+c[y],w=p-c[g];p=em(x,p,w)}if(a){const y=f==="y"?"top":"left",g=f==="y"?"bottom":"right",x=h+c[y],w=h-c[g];h=em(x,h,w)}const v=s.fn({...t,[d]:p,[f]:h});return{...v,data:{x:v.x-n,y:v.y-r,enabled:{[d]:o,[f]:a}}}}}},VU=function(e){return e===void 0&&(e={}),{options:e,fn(t){const{x:n,y:r,placement:i,rects:o,middlewareData:a}=t,{offset:s=0,mainAxis:l=!0,crossAxis:u=!0}=Or(e,t),c={x:n,y:r},f=Bn(i),d=Kg(f);let p=c[d],h=c[f];const v=Or(s,t),y=typeof v=="number"?{mainAxis:v,crossAxis:0}:{mainAxis:0,crossAxis:0,...v};if(l){const w=d==="y"?"height":"width",S=o.reference[d]-o.floating[w]+y.mainAxis,P=o.reference[d]+o.reference[w]-y.mainAxis;p<S?p=S:p>P&&(p=P)}if(u){var g,x;const w=d==="y"?"width":"height",S=o_.has(Er(i)),P=o.reference[f]-o.floating[w]+(S&&((g=a.offset)==null?void 0:g[f])||0)+(S?0:y.crossAxis),O=o.reference[f]+o.reference[w]+(S?0:((x=a.offset)==null?void 0:x[f])||0)-(S?y.crossAxis:0);h<P?h=P:h>O&&(h=O)}return{[d]:p,[f]:h}}}},HU=function(e){return e===void 0&&(e={}),{name:"size",options:e,async fn(t){var n,r;const{placement:i,rects:o,platform:a,elements:s}=t,{apply:l=()=>{},...u}=Or(e,t),c=await Ds(t,u),f=Er(i),d=ha(i),p=Bn(i)==="y",{width:h,height:v}=o.floating;let y,g;f==="top"||f==="bottom"?(y=f,g=d===(await(a.isRTL==null?void 0:a.isRTL(s.floating))?"start":"end")?"left":"right"):(g=f,y=d==="end"?"top":"bottom");const x=v-c.top-c.bottom,w=h-c.left-c.right,S=fi(v-c[y],x),P=fi(h-c[g],w),O=!t.middlewareData.shift;let k=S,j=P;if((n=t.middlewareData.shift)!=null&&n.enabled.x&&(j=w),(r=t.middlewareData.shift)!=null&&r.enabled.y&&(k=x),O&&!d){const A=Ht(c.left,0),C=Ht(c.right,0),_=Ht(c.top,0),N=Ht(c.bottom,0);p?j=h-2*(A!==0||C!==0?A+C:Ht(c.left,c.right)):k=v-2*(_!==0||N!==0?_+N:Ht(c.top,c.bottom))}await l({...t,availableWidth:j,availableHeight:k});const M=await a.getDimensions(s.floating);return h!==M.width||v!==M.height?{reset:{rects:!0}}:{}}}};function Qf(){return typeof window<"u"}function ma(e){return a_(e)?(e.nodeName||"").toLowerCase():"#document"}function Xt(e){var t;return(e==null||(t=e.ownerDocument)==null?void 0:t.defaultView)||window}function Jn(e){var t;return(t=(a_(e)?e.ownerDocument:e.document)||window.document)==null?void 0:t.documentElement}function a_(e){return Qf()?e instanceof Node||e instanceof Xt(e).Node:!1}function Tn(e){return Qf()?e instanceof Element||e instanceof Xt(e).Element:!1}function Gn(e){return Qf()?e instanceof HTMLElement||e instanceof Xt(e).HTMLElement:!1}function qw(e){return!Qf()||typeof ShadowRoot>"u"?!1:e instanceof ShadowRoot||e instanceof Xt(e).ShadowRoot}const KU=new Set(["inline","contents"]);function cl(e){const{overflow:t,overflowX:n,overflowY:r,display:i}=$n(e);return/auto|scroll|overlay|hidden|clip/.test(t+r+n)&&!KU.has(i)}const WU=new Set(["table","td","th"]);function YU(e){return WU.has(ma(e))}const qU=[":popover-open",":modal"];function Jf(e){return qU.some(t=>{try{return e.matches(t)}catch{return!1}})}const GU=["transform","translate","scale","rotate","perspective"],XU=["transform","translate","scale","rotate","perspective","filter"],ZU=["paint","layout","strict","content"];function qg(e){const t=Gg(),n=Tn(e)?$n(e):e;return GU.some(r=>n[r]?n[r]!=="none":!1)||(n.containerType?n.containerType!=="normal":!1)||!t&&(n.backdropFilter?n.backdropFilter!=="none":!1)||!t&&(n.filter?n.filter!=="none":!1)||XU.some(r=>(n.willChange||"").includes(r))||ZU.some(r=>(n.contain||"").includes(r))}function QU(e){let t=di(e);for(;Gn(t)&&!Jo(t);){if(qg(t))return t;if(Jf(t))return null;t=di(t)}return null}function Gg(){return typeof CSS>"u"||!CSS.supports?!1:CSS.supports("-webkit-backdrop-filter","none")}const JU=new Set(["html","body","#document"]);function Jo(e){return JU.has(ma(e))}function $n(e){return Xt(e).getComputedStyle(e)}function ed(e){return Tn(e)?{scrollLeft:e.scrollLeft,scrollTop:e.scrollTop}:{scrollLeft:e.scrollX,scrollTop:e.scrollY}}function di(e){if(ma(e)==="html")return e;const t=e.assignedSlot||e.parentNode||qw(e)&&e.host||Jn(e);return qw(t)?t.host:t}function s_(e){const t=di(e);return Jo(t)?e.ownerDocument?e.ownerDocument.body:e.body:Gn(t)&&cl(t)?t:s_(t)}function Rs(e,t,n){var r;t===void 0&&(t=[]),n===void 0&&(n=!0);const i=s_(e),o=i===((r=e.ownerDocument)==null?void 0:r.body),a=Xt(i);if(o){const s=nm(a);return t.concat(a,a.visualViewport||[],cl(i)?i:[],s&&n?Rs(s):[])}return t.concat(i,Rs(i,[],n))}function nm(e){return e.parent&&Object.getPrototypeOf(e.parent)?e.frameElement:null}function l_(e){const t=$n(e);let n=parseFloat(t.width)||0,r=parseFloat(t.height)||0;const i=Gn(e),o=i?e.offsetWidth:n,a=i?e.offsetHeight:r,s=Fc(n)!==o||Fc(r)!==a;return s&&(n=o,r=a),{width:n,height:r,$:s}}function Xg(e){return Tn(e)?e:e.contextElement}function Lo(e){const t=Xg(e);if(!Gn(t))return Kn(1);const n=t.getBoundingClientRect(),{width:r,height:i,$:o}=l_(t);let a=(o?Fc(n.width):n.width)/r,s=(o?Fc(n.height):n.height)/i;return(!a||!Number.isFinite(a))&&(a=1),(!s||!Number.isFinite(s))&&(s=1),{x:a,y:s}}const eV=Kn(0);function u_(e){const t=Xt(e);return!Gg()||!t.visualViewport?eV:{x:t.visualViewport.offsetLeft,y:t.visualViewport.offsetTop}}function tV(e,t,n){return t===void 0&&(t=!1),!n||t&&n!==Xt(e)?!1:t}function Zi(e,t,n,r){t===void 0&&(t=!1),n===void 0&&(n=!1);const i=e.getBoundingClientRect(),o=Xg(e);let a=Kn(1);t&&(r?Tn(r)&&(a=Lo(r)):a=Lo(e));const s=tV(o,n,r)?u_(o):Kn(0);let l=(i.left+s.x)/a.x,u=(i.top+s.y)/a.y,c=i.width/a.x,f=i.height/a.y;if(o){const d=Xt(o),p=r&&Tn(r)?Xt(r):r;let h=d,v=nm(h);for(;v&&r&&p!==h;){const y=Lo(v),g=v.getBoundingClientRect(),x=$n(v),w=g.left+(v.clientLeft+parseFloat(x.paddingLeft))*y.x,S=g.top+(v.clientTop+parseFloat(x.paddingTop))*y.y;l*=y.x,u*=y.y,c*=y.x,f*=y.y,l+=w,u+=S,h=Xt(v),v=nm(h)}}return Uc({width:c,height:f,x:l,y:u})}function td(e,t){const n=ed(e).scrollLeft;return t?t.left+n:Zi(Jn(e)).left+n}function c_(e,t){const n=e.getBoundingClientRect(),r=n.left+t.scrollLeft-td(e,n),i=n.top+t.scrollTop;return{x:r,y:i}}function nV(e){let{elements:t,rect:n,offsetParent:r,strategy:i}=e;const o=i==="fixed",a=Jn(r),s=t?Jf(t.floating):!1;if(r===a||s&&o)return n;let l={scrollLeft:0,scrollTop:0},u=Kn(1);const c=Kn(0),f=Gn(r);if((f||!f&&!o)&&((ma(r)!=="body"||cl(a))&&(l=ed(r)),Gn(r))){const p=Zi(r);u=Lo(r),c.x=p.x+r.clientLeft,c.y=p.y+r.clientTop}const d=a&&!f&&!o?c_(a,l):Kn(0);return{width:n.width*u.x,height:n.height*u.y,x:n.x*u.x-l.scrollLeft*u.x+c.x+d.x,y:n.y*u.y-l.scrollTop*u.y+c.y+d.y}}function rV(e){return Array.from(e.getClientRects())}function iV(e){const t=Jn(e),n=ed(e),r=e.ownerDocument.body,i=Ht(t.scrollWidth,t.clientWidth,r.scrollWidth,r.clientWidth),o=Ht(t.scrollHeight,t.clientHeight,r.scrollHeight,r.clientHeight);let a=-n.scrollLeft+td(e);const s=-n.scrollTop;return $n(r).direction==="rtl"&&(a+=Ht(t.clientWidth,r.clientWidth)-i),{width:i,height:o,x:a,y:s}}const Gw=25;function oV(e,t){const n=Xt(e),r=Jn(e),i=n.visualViewport;let o=r.clientWidth,a=r.clientHeight,s=0,l=0;if(i){o=i.width,a=i.height;const c=Gg();(!c||c&&t==="fixed")&&(s=i.offsetLeft,l=i.offsetTop)}const u=td(r);if(u<=0){const c=r.ownerDocument,f=c.body,d=getComputedStyle(f),p=c.compatMode==="CSS1Compat"&&parseFloat(d.marginLeft)+parseFloat(d.marginRight)||0,h=Math.abs(r.clientWidth-f.clientWidth-p);h<=Gw&&(o-=h)}else u<=Gw&&(o+=u);return{width:o,height:a,x:s,y:l}}const aV=new Set(["absolute","fixed"]);function sV(e,t){const n=Zi(e,!0,t==="fixed"),r=n.top+e.clientTop,i=n.left+e.clientLeft,o=Gn(e)?Lo(e):Kn(1),a=e.clientWidth*o.x,s=e.clientHeight*o.y,l=i*o.x,u=r*o.y;return{width:a,height:s,x:l,y:u}}function Xw(e,t,n){let r;if(t==="viewport")r=oV(e,n);else if(t==="document")r=iV(Jn(e));else if(Tn(t))r=sV(t,n);else{const i=u_(e);r={x:t.x-i.x,y:t.y-i.y,width:t.width,height:t.height}}return Uc(r)}function f_(e,t){const n=di(e);return n===t||!Tn(n)||Jo(n)?!1:$n(n).position==="fixed"||f_(n,t)}function lV(e,t){const n=t.get(e);if(n)return n;let r=Rs(e,[],!1).filter(s=>Tn(s)&&ma(s)!=="body"),i=null;const o=$n(e).position==="fixed";let a=o?di(e):e;for(;Tn(a)&&!Jo(a);){const s=$n(a),l=qg(a);!l&&s.position==="fixed"&&(i=null),(o?!l&&!i:!l&&s.position==="static"&&!!i&&aV.has(i.position)||cl(a)&&!l&&f_(e,a))?r=r.filter(c=>c!==a):i=s,a=di(a)}return t.set(e,r),r}function uV(e){let{element:t,boundary:n,rootBoundary:r,strategy:i}=e;const a=[...n==="clippingAncestors"?Jf(t)?[]:lV(t,this._c):[].concat(n),r],s=a[0],l=a.reduce((u,c)=>{const f=Xw(t,c,i);return u.top=Ht(f.top,u.top),u.right=fi(f.right,u.right),u.bottom=fi(f.bottom,u.bottom),u.left=Ht(f.left,u.left),u},Xw(t,s,i));return{width:l.right-l.left,height:l.bottom-l.top,x:l.left,y:l.top}}function cV(e){const{width:t,height:n}=l_(e);return{width:t,height:n}}function fV(e,t,n){const r=Gn(t),i=Jn(t),o=n==="fixed",a=Zi(e,!0,o,t);let s={scrollLeft:0,scrollTop:0};const l=Kn(0);function u(){l.x=td(i)}if(r||!r&&!o)if((ma(t)!=="body"||cl(i))&&(s=ed(t)),r){const p=Zi(t,!0,o,t);l.x=p.x+t.clientLeft,l.y=p.y+t.clientTop}else i&&u();o&&!r&&i&&u();const c=i&&!r&&!o?c_(i,s):Kn(0),f=a.left+s.scrollLeft-l.x-c.x,d=a.top+s.scrollTop-l.y-c.y;return{x:f,y:d,width:a.width,height:a.height}}function ip(e){return $n(e).position==="static"}function Zw(e,t){if(!Gn(e)||$n(e).position==="fixed")return null;if(t)return t(e);let n=e.offsetParent;return Jn(e)===n&&(n=n.ownerDocument.body),n}function d_(e,t){const n=Xt(e);if(Jf(e))return n;if(!Gn(e)){let i=di(e);for(;i&&!Jo(i);){if(Tn(i)&&!ip(i))return i;i=di(i)}return n}let r=Zw(e,t);for(;r&&YU(r)&&ip(r);)r=Zw(r,t);return r&&Jo(r)&&ip(r)&&!qg(r)?n:r||QU(e)||n}const dV=async function(e){const t=this.getOffsetParent||d_,n=this.getDimensions,r=await n(e.floating);return{reference:fV(e.reference,await t(e.floating),e.strategy),floating:{x:0,y:0,width:r.width,height:r.height}}};function pV(e){return $n(e).direction==="rtl"}const hV={convertOffsetParentRelativeRectToViewportRelativeRect:nV,getDocumentElement:Jn,getClippingRect:uV,getOffsetParent:d_,getElementRects:dV,getClientRects:rV,getDimensions:cV,getScale:Lo,isElement:Tn,isRTL:pV};function p_(e,t){return e.x===t.x&&e.y===t.y&&e.width===t.width&&e.height===t.height}function mV(e,t){let n=null,r;const i=Jn(e);function o(){var s;clearTimeout(r),(s=n)==null||s.disconnect(),n=null}function a(s,l){s===void 0&&(s=!1),l===void 0&&(l=1),o();const u=e.getBoundingClientRect(),{left:c,top:f,width:d,height:p}=u;if(s||t(),!d||!p)return;const h=Ql(f),v=Ql(i.clientWidth-(c+d)),y=Ql(i.clientHeight-(f+p)),g=Ql(c),w={rootMargin:-h+"px "+-v+"px "+-y+"px "+-g+"px",threshold:Ht(0,fi(1,l))||1};let S=!0;function P(O){const k=O[0].intersectionRatio;if(k!==l){if(!S)return a();k?a(!1,k):r=setTimeout(()=>{a(!1,1e-7)},1e3)}k===1&&!p_(u,e.getBoundingClientRect())&&a(),S=!1}try{n=new IntersectionObserver(P,{...w,root:i.ownerDocument})}catch{n=new IntersectionObserver(P,w)}n.observe(e)}return a(!0),o}function vV(e,t,n,r){r===void 0&&(r={});const{ancestorScroll:i=!0,ancestorResize:o=!0,elementResize:a=typeof ResizeObserver=="function",layoutShift:s=typeof IntersectionObserver=="function",animationFrame:l=!1}=r,u=Xg(e),c=i||o?[...u?Rs(u):[],...Rs(t)]:[];c.forEach(g=>{i&&g.addEventListener("scroll",n,{passive:!0}),o&&g.addEventListener("resize",n)});const f=u&&s?mV(u,n):null;let d=-1,p=null;a&&(p=new ResizeObserver(g=>{let[x]=g;x&&x.target===u&&p&&(p.unobserve(t),cancelAnimationFrame(d),d=requestAnimationFrame(()=>{var w;(w=p)==null||w.observe(t)})),n()}),u&&!l&&p.observe(u),p.observe(t));let h,v=l?Zi(e):null;l&&y();function y(){const g=Zi(e);v&&!p_(v,g)&&n(),v=g,h=requestAnimationFrame(y)}return n(),()=>{var g;c.forEach(x=>{i&&x.removeEventListener("scroll",n),o&&x.removeEventListener("resize",n)}),f==null||f(),(g=p)==null||g.disconnect(),p=null,l&&cancelAnimationFrame(h)}}const gV=BU,yV=UU,xV=LU,wV=HU,bV=zU,Qw=RU,SV=VU,PV=(e,t,n)=>{const r=new Map,i={platform:hV,...n},o={...i.platform,_c:r};return DU(e,t,{...i,platform:o})};var OV=typeof document<"u",EV=function(){},Su=OV?m.useLayoutEffect:EV;function Vc(e,t){if(e===t)return!0;if(typeof e!=typeof t)return!1;if(typeof e=="function"&&e.toString()===t.toString())return!0;let n,r,i;if(e&&t&&typeof e=="object"){if(Array.isArray(e)){if(n=e.length,n!==t.length)return!1;for(r=n;r--!==0;)if(!Vc(e[r],t[r]))return!1;return!0}if(i=Object.keys(e),n=i.length,n!==Object.keys(t).length)return!1;for(r=n;r--!==0;)if(!{}.hasOwnProperty.call(t,i[r]))return!1;for(r=n;r--!==0;){const o=i[r];if(!(o==="_owner"&&e.$$typeof)&&!Vc(e[o],t[o]))return!1}return!0}return e!==e&&t!==t}function h_(e){return typeof window>"u"?1:(e.ownerDocument.defaultView||window).devicePixelRatio||1}function Jw(e,t){const n=h_(e);return Math.round(t*n)/n}function op(e){const t=m.useRef(e);return Su(()=>{t.current=e}),t}function kV(e){e===void 0&&(e={});const{placement:t="bottom",strategy:n="absolute",middleware:r=[],platform:i,elements:{reference:o,floating:a}={},transform:s=!0,whileElementsMounted:l,open:u}=e,[c,f]=m.useState({x:0,y:0,strategy:n,placement:t,middlewareData:{},isPositioned:!1}),[d,p]=m.useState(r);Vc(d,r)||p(r);const[h,v]=m.useState(null),[y,g]=m.useState(null),x=m.useCallback($=>{$!==O.current&&(O.current=$,v($))},[]),w=m.useCallback($=>{$!==k.current&&(k.current=$,g($))},[]),S=o||h,P=a||y,O=m.useRef(null),k=m.useRef(null),j=m.useRef(c),M=l!=null,A=op(l),C=op(i),_=op(u),N=m.useCallback(()=>{if(!O.current||!k.current)return;const $={placement:t,strategy:n,middleware:d};C.current&&($.platform=C.current),PV(O.current,k.current,$).then(z=>{const K={...z,isPositioned:_.current!==!1};L.current&&!Vc(j.current,K)&&(j.current=K,ia.flushSync(()=>{f(K)}))})},[d,t,n,C,_]);Su(()=>{u===!1&&j.current.isPositioned&&(j.current.isPositioned=!1,f($=>({...$,isPositioned:!1})))},[u]);const L=m.useRef(!1);Su(()=>(L.current=!0,()=>{L.current=!1}),[]),Su(()=>{if(S&&(O.current=S),P&&(k.current=P),S&&P){if(A.current)return A.current(S,P,N);N()}},[S,P,N,A,M]);const V=m.useMemo(()=>({reference:O,floating:k,setReference:x,setFloating:w}),[x,w]),B=m.useMemo(()=>({reference:S,floating:P}),[S,P]),U=m.useMemo(()=>{const $={position:n,left:0,top:0};if(!B.floating)return $;const z=Jw(B.floating,c.x),K=Jw(B.floating,c.y);return s?{...$,transform:"translate("+z+"px, "+K+"px)",...h_(B.floating)>=1.5&&{willChange:"transform"}}:{position:n,left:z,top:K}},[n,s,B.floating,c.x,c.y]);return m.useMemo(()=>({...c,update:N,refs:V,elements:B,floatingStyles:U}),[c,N,V,B,U])}const CV=e=>{function t(n){return{}.hasOwnProperty.call(n,"current")}return{name:"arrow",options:e,fn(n){const{element:r,padding:i}=typeof e=="function"?e(n):e;return r&&t(r)?r.current!=null?Qw({element:r.current,padding:i}).fn(n):{}:r?Qw({element:r,padding:i}).fn(n):{}}}},_V=(e,t)=>({...gV(e),options:[e,t]}),AV=(e,t)=>({...yV(e),options:[e,t]}),jV=(e,t)=>({...SV(e),options:[e,t]}),MV=(e,t)=>({...xV(e),options:[e,t]}),TV=(e,t)=>({...wV(e),options:[e,t]}),$V=(e,t)=>({...bV(e),options:[e,t]}),IV=(e,t)=>({...CV(e),options:[e,t]});var NV="Arrow",m_=m.forwardRef((e,t)=>{const{children:n,width:r=10,height:i=5,...o}=e;return b.jsx(yi.svg,{...o,ref:t,width:r,height:i,viewBox:"0 0 30 10",preserveAspectRatio:"none",children:e.asChild?n:b.jsx("polygon",{points:"0,0 30,0 15,10"})})});m_.displayName=NV;var DV=m_;function RV(e){const[t,n]=m.useState(void 0);return ci(()=>{if(e){n({width:e.offsetWidth,height:e.offsetHeight});const r=new ResizeObserver(i=>{if(!Array.isArray(i)||!i.length)return;const o=i[0];let a,s;if("borderBoxSize"in o){const l=o.borderBoxSize,u=Array.isArray(l)?l[0]:l;a=u.inlineSize,s=u.blockSize}else a=e.offsetWidth,s=e.offsetHeight;n({width:a,height:s})});return r.observe(e,{box:"border-box"}),()=>r.unobserve(e)}else n(void 0)},[e]),t}var Zg="Popper",[v_,g_]=JC(Zg),[LV,y_]=v_(Zg),x_=e=>{const{__scopePopper:t,children:n}=e,[r,i]=m.useState(null);return b.jsx(LV,{scope:t,anchor:r,onAnchorChange:i,children:n})};x_.displayName=Zg;var w_="PopperAnchor",b_=m.forwardRef((e,t)=>{const{__scopePopper:n,virtualRef:r,...i}=e,o=y_(w_,n),a=m.useRef(null),s=ro(t,a),l=m.useRef(null);return m.useEffect(()=>{const u=l.current;l.current=(r==null?void 0:r.current)||a.current,u!==l.current&&o.onAnchorChange(l.current)}),r?null:b.jsx(yi.div,{...i,ref:s})});b_.displayName=w_;var Qg="PopperContent",[zV,FV]=v_(Qg),S_=m.forwardRef((e,t)=>{var ne,Z,D,H,q,R;const{__scopePopper:n,side:r="bottom",sideOffset:i=0,align:o="center",alignOffset:a=0,arrowPadding:s=0,avoidCollisions:l=!0,collisionBoundary:u=[],collisionPadding:c=0,sticky:f="partial",hideWhenDetached:d=!1,updatePositionStrategy:p="optimized",onPlaced:h,...v}=e,y=y_(Qg,n),[g,x]=m.useState(null),w=ro(t,G=>x(G)),[S,P]=m.useState(null),O=RV(S),k=(O==null?void 0:O.width)??0,j=(O==null?void 0:O.height)??0,M=r+(o!=="center"?"-"+o:""),A=typeof c=="number"?c:{top:0,right:0,bottom:0,left:0,...c},C=Array.isArray(u)?u:[u],_=C.length>0,N={padding:A,boundary:C.filter(UV),altBoundary:_},{refs:L,floatingStyles:V,placement:B,isPositioned:U,middlewareData:$}=kV({strategy:"fixed",placement:M,whileElementsMounted:(...G)=>vV(...G,{animationFrame:p==="always"}),elements:{reference:y.anchor},middleware:[_V({mainAxis:i+j,alignmentAxis:a}),l&&AV({mainAxis:!0,crossAxis:!1,limiter:f==="partial"?jV():void 0,...N}),l&&MV({...N}),TV({...N,apply:({elements:G,rects:ee,availableWidth:te,availableHeight:ce})=>{const{width:ge,height:je}=ee.reference,Ve=G.floating.style;Ve.setProperty("--radix-popper-available-width",`${te}px`),Ve.setProperty("--radix-popper-available-height",`${ce}px`),Ve.setProperty("--radix-popper-anchor-width",`${ge}px`),Ve.setProperty("--radix-popper-anchor-height",`${je}px`)}}),S&&IV({element:S,padding:s}),VV({arrowWidth:k,arrowHeight:j}),d&&$V({strategy:"referenceHidden",...N})]}),[z,K]=E_(B),X=Zf(h);ci(()=>{U&&(X==null||X())},[U,X]);const re=(ne=$.arrow)==null?void 0:ne.x,Se=(Z=$.arrow)==null?void 0:Z.y,le=((D=$.arrow)==null?void 0:D.centerOffset)!==0,[se,de]=m.useState();return ci(()=>{g&&de(window.getComputedStyle(g).zIndex)},[g]),b.jsx("div",{ref:L.setFloating,"data-radix-popper-content-wrapper":"",style:{...V,transform:U?V.transform:"translate(0, -200%)",minWidth:"max-content",zIndex:se,"--radix-popper-transform-origin":[(H=$.transformOrigin)==null?void 0:H.x,(q=$.transformOrigin)==null?void 0:q.y].join(" "),...((R=$.hide)==null?void 0:R.referenceHidden)&&{visibility:"hidden",pointerEvents:"none"}},dir:e.dir,children:b.jsx(zV,{scope:n,placedSide:z,onArrowChange:P,arrowX:re,arrowY:Se,shouldHideArrow:le,children:b.jsx(yi.div,{"data-side":z,"data-align":K,...v,ref:w,style:{...v.style,animation:U?void 0:"none"}})})})});S_.displayName=Qg;var P_="PopperArrow",BV={top:"bottom",right:"left",bottom:"top",left:"right"},O_=m.forwardRef(function(t,n){const{__scopePopper:r,...i}=t,o=FV(P_,r),a=BV[o.placedSide];return b.jsx("span",{ref:o.onArrowChange,style:{position:"absolute",left:o.arrowX,top:o.arrowY,[a]:0,transformOrigin:{top:"",right:"0 0",bottom:"center 0",left:"100% 0"}[o.placedSide],transform:{top:"translateY(100%)",right:"translateY(50%) rotate(90deg) translateX(-50%)",bottom:"rotate(180deg)",left:"translateY(50%) rotate(-90deg) translateX(50%)"}[o.placedSide],visibility:o.shouldHideArrow?"hidden":void 0},children:b.jsx(DV,{...i,ref:n,style:{...i.style,display:"block"}})})});O_.displayName=P_;function UV(e){return e!==null}var VV=e=>({name:"transformOrigin",options:e,fn(t){var y,g,x;const{placement:n,rects:r,middlewareData:i}=t,a=((y=i.arrow)==null?void 0:y.centerOffset)!==0,s=a?0:e.arrowWidth,l=a?0:e.arrowHeight,[u,c]=E_(n),f={start:"0%",center:"50%",end:"100%"}[c],d=(((g=i.arrow)==null?void 0:g.x)??0)+s/2,p=(((x=i.arrow)==null?void 0:x.y)??0)+l/2;let h="",v="";return u==="bottom"?(h=a?f:`${d}px`,v=`${-l}px`):u==="top"?(h=a?f:`${d}px`,v=`${r.floating.height+l}px`):u==="right"?(h=`${-l}px`,v=a?f:`${p}px`):u==="left"&&(h=`${r.floating.width+l}px`,v=a?f:`${p}px`),{data:{x:h,y:v}}}});function E_(e){const[t,n="center"]=e.split("-");return[t,n]}var HV=x_,KV=b_,WV=S_,YV=O_,qV="Portal",k_=m.forwardRef((e,t)=>{var s;const{container:n,...r}=e,[i,o]=m.useState(!1);ci(()=>o(!0),[]);const a=n||i&&((s=globalThis==null?void 0:globalThis.document)==null?void 0:s.body);return a?mT.createPortal(b.jsx(yi.div,{...r,ref:t}),a):null});k_.displayName=qV;function GV(e,t){return m.useReducer((n,r)=>t[n][r]??n,e)}var Jg=e=>{const{present:t,children:n}=e,r=XV(t),i=typeof n=="function"?n({present:r.isPresent}):m.Children.only(n),o=ro(r.ref,ZV(i));return typeof n=="function"||r.isPresent?m.cloneElement(i,{ref:o}):null};Jg.displayName="Presence";function XV(e){const[t,n]=m.useState(),r=m.useRef(null),i=m.useRef(e),o=m.useRef("none"),a=e?"mounted":"unmounted",[s,l]=GV(a,{mounted:{UNMOUNT:"unmounted",ANIMATION_OUT:"unmountSuspended"},unmountSuspended:{MOUNT:"mounted",ANIMATION_END:"unmounted"},unmounted:{MOUNT:"mounted"}});return m.useEffect(()=>{const u=Jl(r.current);o.current=s==="mounted"?u:"none"},[s]),ci(()=>{const u=r.current,c=i.current;if(c!==e){const d=o.current,p=Jl(u);e?l("MOUNT"):p==="none"||(u==null?void 0:u.display)==="none"?l("UNMOUNT"):l(c&&d!==p?"ANIMATION_OUT":"UNMOUNT"),i.current=e}},[e,l]),ci(()=>{if(t){let u;const c=t.ownerDocument.defaultView??window,f=p=>{const v=Jl(r.current).includes(CSS.escape(p.animationName));if(p.target===t&&v&&(l("ANIMATION_END"),!i.current)){const y=t.style.animationFillMode;t.style.animationFillMode="forwards",u=c.setTimeout(()=>{t.style.animationFillMode==="forwards"&&(t.style.animationFillMode=y)})}},d=p=>{p.target===t&&(o.current=Jl(r.current))};return t.addEventListener("animationstart",d),t.addEventListener("animationcancel",f),t.addEventListener("animationend",f),()=>{c.clearTimeout(u),t.removeEventListener("animationstart",d),t.removeEventListener("animationcancel",f),t.removeEventListener("animationend",f)}}else l("ANIMATION_END")},[t,l]),{isPresent:["mounted","unmountSuspended"].includes(s),ref:m.useCallback(u=>{r.current=u?getComputedStyle(u):null,n(u)},[])}}function Jl(e){return(e==null?void 0:e.animationName)||"none"}function ZV(e){var r,i;let t=(r=Object.getOwnPropertyDescriptor(e.props,"ref"))==null?void 0:r.get,n=t&&"isReactWarning"in t&&t.isReactWarning;return n?e.ref:(t=(i=Object.getOwnPropertyDescriptor(e,"ref"))==null?void 0:i.get,n=t&&"isReactWarning"in t&&t.isReactWarning,n?e.props.ref:e.props.ref||e.ref)}var QV=vm[" useInsertionEffect ".trim().toString()]||ci;function JV({prop:e,defaultProp:t,onChange:n=()=>{},caller:r}){const[i,o,a]=eH({defaultProp:t,onChange:n}),s=e!==void 0,l=s?e:i;{const c=m.useRef(e!==void 0);m.useEffect(()=>{const f=c.current;f!==s&&console.warn(`${r} is changing from ${f?"controlled":"uncontrolled"} to ${s?"controlled":"uncontrolled"}. Components should not switch from controlled to uncontrolled (or vice versa). Decide between using a controlled or uncontrolled value for the lifetime of the component.`),c.current=s},[s,r])}const u=m.useCallback(c=>{var f;if(s){const d=tH(c)?c(e):c;d!==e&&((f=a.current)==null||f.call(a,d))}else o(c)},[s,e,o,a]);return[l,u]}function eH({defaultProp:e,onChange:t}){const[n,r]=m.useState(e),i=m.useRef(n),o=m.useRef(t);return QV(()=>{o.current=t},[t]),m.useEffect(()=>{var a;i.current!==n&&((a=o.current)==null||a.call(o,n),i.current=n)},[n,i]),[n,r,o]}function tH(e){return typeof e=="function"}var nH=Object.freeze({position:"absolute",border:0,width:1,height:1,padding:0,margin:-1,overflow:"hidden",clip:"rect(0, 0, 0, 0)",whiteSpace:"nowrap",wordWrap:"normal"}),rH="VisuallyHidden",C_=m.forwardRef((e,t)=>b.jsx(yi.span,{...e,ref:t,style:{...nH,...e.style}}));C_.displayName=rH;var iH=C_,[nd,_W]=JC("Tooltip",[g_]),rd=g_(),__="TooltipProvider",oH=700,rm="tooltip.open",[aH,ey]=nd(__),A_=e=>{const{__scopeTooltip:t,delayDuration:n=oH,skipDelayDuration:r=300,disableHoverableContent:i=!1,children:o}=e,a=m.useRef(!0),s=m.useRef(!1),l=m.useRef(0);return m.useEffect(()=>{const u=l.current;return()=>window.clearTimeout(u)},[]),b.jsx(aH,{scope:t,isOpenDelayedRef:a,delayDuration:n,onOpen:m.useCallback(()=>{window.clearTimeout(l.current),a.current=!1},[]),onClose:m.useCallback(()=>{window.clearTimeout(l.current),l.current=window.setTimeout(()=>a.current=!0,r)},[r]),isPointerInTransitRef:s,onPointerInTransitChange:m.useCallback(u=>{s.current=u},[]),disableHoverableContent:i,children:o})};A_.displayName=__;var Ls="Tooltip",[sH,fl]=nd(Ls),j_=e=>{const{__scopeTooltip:t,children:n,open:r,defaultOpen:i,onOpenChange:o,disableHoverableContent:a,delayDuration:s}=e,l=ey(Ls,e.__scopeTooltip),u=rd(t),[c,f]=m.useState(null),d=OU(),p=m.useRef(0),h=a??l.disableHoverableContent,v=s??l.delayDuration,y=m.useRef(!1),[g,x]=JV({prop:r,defaultProp:i??!1,onChange:k=>{k?(l.onOpen(),document.dispatchEvent(new CustomEvent(rm))):l.onClose(),o==null||o(k)},caller:Ls}),w=m.useMemo(()=>g?y.current?"delayed-open":"instant-open":"closed",[g]),S=m.useCallback(()=>{window.clearTimeout(p.current),p.current=0,y.current=!1,x(!0)},[x]),P=m.useCallback(()=>{window.clearTimeout(p.current),p.current=0,x(!1)},[x]),O=m.useCallback(()=>{window.clearTimeout(p.current),p.current=window.setTimeout(()=>{y.current=!0,x(!0),p.current=0},v)},[v,x]);return m.useEffect(()=>()=>{p.current&&(window.clearTimeout(p.current),p.current=0)},[]),b.jsx(HV,{...u,children:b.jsx(sH,{scope:t,contentId:d,open:g,stateAttribute:w,trigger:c,onTriggerChange:f,onTriggerEnter:m.useCallback(()=>{l.isOpenDelayedRef.current?O():S()},[l.isOpenDelayedRef,O,S]),onTriggerLeave:m.useCallback(()=>{h?P():(window.clearTimeout(p.current),p.current=0)},[P,h]),onOpen:S,onClose:P,disableHoverableContent:h,children:n})})};j_.displayName=Ls;var im="TooltipTrigger",M_=m.forwardRef((e,t)=>{const{__scopeTooltip:n,...r}=e,i=fl(im,n),o=ey(im,n),a=rd(n),s=m.useRef(null),l=ro(t,s,i.onTriggerChange),u=m.useRef(!1),c=m.useRef(!1),f=m.useCallback(()=>u.current=!1,[]);return m.useEffect(()=>()=>document.removeEventListener("pointerup",f),[f]),b.jsx(KV,{asChild:!0,...a,children:b.jsx(yi.button,{"aria-describedby":i.open?i.contentId:void 0,"data-state":i.stateAttribute,...r,ref:l,onPointerMove:ir(e.onPointerMove,d=>{d.pointerType!=="touch"&&!c.current&&!o.isPointerInTransitRef.current&&(i.onTriggerEnter(),c.current=!0)}),onPointerLeave:ir(e.onPointerLeave,()=>{i.onTriggerLeave(),c.current=!1}),onPointerDown:ir(e.onPointerDown,()=>{i.open&&i.onClose(),u.current=!0,document.addEventListener("pointerup",f,{once:!0})}),onFocus:ir(e.onFocus,()=>{u.current||i.onOpen()}),onBlur:ir(e.onBlur,i.onClose),onClick:ir(e.onClick,i.onClose)})})});M_.displayName=im;var ty="TooltipPortal",[lH,uH]=nd(ty,{forceMount:void 0}),T_=e=>{const{__scopeTooltip:t,forceMount:n,children:r,container:i}=e,o=fl(ty,t);return b.jsx(lH,{scope:t,forceMount:n,children:b.jsx(Jg,{present:n||o.open,children:b.jsx(k_,{asChild:!0,container:i,children:r})})})};T_.displayName=ty;var ea="TooltipContent",$_=m.forwardRef((e,t)=>{const n=uH(ea,e.__scopeTooltip),{forceMount:r=n.forceMount,side:i="top",...o}=e,a=fl(ea,e.__scopeTooltip);return b.jsx(Jg,{present:r||a.open,children:a.disableHoverableContent?b.jsx(I_,{side:i,...o,ref:t}):b.jsx(cH,{side:i,...o,ref:t})})}),cH=m.forwardRef((e,t)=>{const n=fl(ea,e.__scopeTooltip),r=ey(ea,e.__scopeTooltip),i=m.useRef(null),o=ro(t,i),[a,s]=m.useState(null),{trigger:l,onClose:u}=n,c=i.current,{onPointerInTransitChange:f}=r,d=m.useCallback(()=>{s(null),f(!1)},[f]),p=m.useCallback((h,v)=>{const y=h.currentTarget,g={x:h.clientX,y:h.clientY},x=hH(g,y.getBoundingClientRect()),w=mH(g,x),S=vH(v.getBoundingClientRect()),P=yH([...w,...S]);s(P),f(!0)},[f]);return m.useEffect(()=>()=>d(),[d]),m.useEffect(()=>{if(l&&c){const h=y=>p(y,c),v=y=>p(y,l);return l.addEventListener("pointerleave",h),c.addEventListener("pointerleave",v),()=>{l.removeEventListener("pointerleave",h),c.removeEventListener("pointerleave",v)}}},[l,c,p,d]),m.useEffect(()=>{if(a){const h=v=>{const y=v.target,g={x:v.clientX,y:v.clientY},x=(l==null?void 0:l.contains(y))||(c==null?void 0:c.contains(y)),w=!gH(g,a);x?d():w&&(d(),u())};return document.addEventListener("pointermove",h),()=>document.removeEventListener("pointermove",h)}},[l,c,a,u,d]),b.jsx(I_,{...e,ref:o})}),[fH,dH]=nd(Ls,{isInside:!1}),pH=lU("TooltipContent"),I_=m.forwardRef((e,t)=>{const{__scopeTooltip:n,children:r,"aria-label":i,onEscapeKeyDown:o,onPointerDownOutside:a,...s}=e,l=fl(ea,n),u=rd(n),{onClose:c}=l;return m.useEffect(()=>(document.addEventListener(rm,c),()=>document.removeEventListener(rm,c)),[c]),m.useEffect(()=>{if(l.trigger){const f=d=>{const p=d.target;p!=null&&p.contains(l.trigger)&&c()};return window.addEventListener("scroll",f,{capture:!0}),()=>window.removeEventListener("scroll",f,{capture:!0})}},[l.trigger,c]),b.jsx(n_,{asChild:!0,disableOutsidePointerEvents:!1,onEscapeKeyDown:o,onPointerDownOutside:a,onFocusOutside:f=>f.preventDefault(),onDismiss:c,children:b.jsxs(WV,{"data-state":l.stateAttribute,...u,...s,ref:t,style:{...s.style,"--radix-tooltip-content-transform-origin":"var(--radix-popper-transform-origin)","--radix-tooltip-content-available-width":"var(--radix-popper-available-width)","--radix-tooltip-content-available-height":"var(--radix-popper-available-height)","--radix-tooltip-trigger-width":"var(--radix-popper-anchor-width)","--radix-tooltip-trigger-height":"var(--radix-popper-anchor-height)"},children:[b.jsx(pH,{children:r}),b.jsx(fH,{scope:n,isInside:!0,children:b.jsx(iH,{id:l.contentId,role:"tooltip",children:i||r})})]})})});$_.displayName=ea;var N_="TooltipArrow",D_=m.forwardRef((e,t)=>{const{__scopeTooltip:n,...r}=e,i=rd(n);return dH(N_,n).isInside?null:b.jsx(YV,{...i,...r,ref:t})});D_.displayName=N_;function hH(e,t){const n=Math.abs(t.top-e.y),r=Math.abs(t.bottom-e.y),i=Math.abs(t.right-e.x),o=Math.abs(t.left-e.x);switch(Math.min(n,r,i,o)){case o:return"left";case i:return"right";case n:return"top";case r:return"bottom";default:throw new Error("unreachable")}}function mH(e,t,n=5){const r=[];switch(t){case"top":r.push({x:e.x-n,y:e.y+n},{x:e.x+n,y:e.y+n});break;case"bottom":r.push({x:e.x-n,y:e.y-n},{x:e.x+n,y:e.y-n});break;case"left":r.push({x:e.x+n,y:e.y-n},{x:e.x+n,y:e.y+n});break;case"right":r.push({x:e.x-n,y:e.y-n},{x:e.x-n,y:e.y+n});break}return r}function vH(e){const{top:t,right:n,bottom:r,left:i}=e;return[{x:i,y:t},{x:n,y:t},{x:n,y:r},{x:i,y:r}]}function gH(e,t){const{x:n,y:r}=e;let i=!1;for(let o=0,a=t.length-1;o<t.length;a=o++){const s=t[o],l=t[a],u=s.x,c=s.y,f=l.x,d=l.y;c>r!=d>r&&n<(f-u)*(r-c)/(d-c)+u&&(i=!i)}return i}function yH(e){const t=e.slice();return t.sort((n,r)=>n.x<r.x?-1:n.x>r.x?1:n.y<r.y?-1:n.y>r.y?1:0),xH(t)}function xH(e){if(e.length<=1)return e.slice();const t=[];for(let r=0;r<e.length;r++){const i=e[r];for(;t.length>=2;){const o=t[t.length-1],a=t[t.length-2];if((o.x-a.x)*(i.y-a.y)>=(o.y-a.y)*(i.x-a.x))t.pop();else break}t.push(i)}t.pop();const n=[];for(let r=e.length-1;r>=0;r--){const i=e[r];for(;n.length>=2;){const o=n[n.length-1],a=n[n.length-2];if((o.x-a.x)*(i.y-a.y)>=(o.y-a.y)*(i.x-a.x))n.pop();else break}n.push(i)}return n.pop(),t.length===1&&n.length===1&&t[0].x===n[0].x&&t[0].y===n[0].y?t:t.concat(n)}var wH=A_,bH=j_,SH=M_,PH=T_,R_=$_,OH=D_;const ny="-",EH=e=>{const t=CH(e),{conflictingClassGroups:n,conflictingClassGroupModifiers:r}=e;return{getClassGroupId:a=>{const s=a.split(ny);return s[0]===""&&s.length!==1&&s.shift(),L_(s,t)||kH(a)},getConflictingClassGroupIds:(a,s)=>{const l=n[a]||[];return s&&r[a]?[...l,...r[a]]:l}}},L_=(e,t)=>{var a;if(e.length===0)return t.classGroupId;const n=e[0],r=t.nextPart.get(n),i=r?L_(e.slice(1),r):void 0;if(i)return i;if(t.validators.length===0)return;const o=e.join(ny);return(a=t.validators.find(({validator:s})=>s(o)))==null?void 0:a.classGroupId},eb=/^\[(.+)\]$/,kH=e=>{if(eb.test(e)){const t=eb.exec(e)[1],n=t==null?void 0:t.substring(0,t.indexOf(":"));if(n)return"arbitrary.."+n}},CH=e=>{const{theme:t,prefix:n}=e,r={nextPart:new Map,validators:[]};return AH(Object.entries(e.classGroups),n).forEach(([o,a])=>{om(a,r,o,t)}),r},om=(e,t,n,r)=>{e.forEach(i=>{if(typeof i=="string"){const o=i===""?t:tb(t,i);o.classGroupId=n;return}if(typeof i=="function"){if(_H(i)){om(i(r),t,n,r);return}t.validators.push({validator:i,classGroupId:n});return}Object.entries(i).forEach(([o,a])=>{om(a,tb(t,o),n,r)})})},tb=(e,t)=>{let n=e;return t.split(ny).forEach(r=>{n.nextPart.has(r)||n.nextPart.set(r,{nextPart:new Map,validators:[]}),n=n.nextPart.get(r)}),n},_H=e=>e.isThemeGetter,AH=(e,t)=>t?e.map(([n,r])=>{const i=r.map(o=>typeof o=="string"?t+o:typeof o=="object"?Object.fromEntries(Object.entries(o).map(([a,s])=>[t+a,s])):o);return[n,i]}):e,jH=e=>{if(e<1)return{get:()=>{},set:()=>{}};let t=0,n=new Map,r=new Map;const i=(o,a)=>{n.set(o,a),t++,t>e&&(t=0,r=n,n=new Map)};return{get(o){let a=n.get(o);if(a!==void 0)return a;if((a=r.get(o))!==void 0)return i(o,a),a},set(o,a){n.has(o)?n.set(o,a):i(o,a)}}},z_="!",MH=e=>{const{separator:t,experimentalParseClassName:n}=e,r=t.length===1,i=t[0],o=t.length,a=s=>{const l=[];let u=0,c=0,f;for(let y=0;y<s.length;y++){let g=s[y];if(u===0){if(g===i&&(r||s.slice(y,y+o)===t)){l.push(s.slice(c,y)),c=y+o;continue}if(g==="/"){f=y;continue}}g==="["?u++:g==="]"&&u--}const d=l.length===0?s:s.substring(c),p=d.startsWith(z_),h=p?d.substring(1):d,v=f&&f>c?f-c:void 0;return{modifiers:l,hasImportantModifier:p,baseClassName:h,maybePostfixModifierPosition:v}};return n?s=>n({className:s,parseClassName:a}):a},TH=e=>{if(e.length<=1)return e;const t=[];let n=[];return e.forEach(r=>{r[0]==="["?(t.push(...n.sort(),r),n=[]):n.push(r)}),t.push(...n.sort()),t},$H=e=>({cache:jH(e.cacheSize),parseClassName:MH(e),...EH(e)}),IH=/\s+/,NH=(e,t)=>{const{parseClassName:n,getClassGroupId:r,getConflictingClassGroupIds:i}=t,o=[],a=e.trim().split(IH);let s="";for(let l=a.length-1;l>=0;l-=1){const u=a[l],{modifiers:c,hasImportantModifier:f,baseClassName:d,maybePostfixModifierPosition:p}=n(u);let h=!!p,v=r(h?d.substring(0,p):d);if(!v){if(!h){s=u+(s.length>0?" "+s:s);continue}if(v=r(d),!v){s=u+(s.length>0?" "+s:s);continue}h=!1}const y=TH(c).join(":"),g=f?y+z_:y,x=g+v;if(o.includes(x))continue;o.push(x);const w=i(v,h);for(let S=0;S<w.length;++S){const P=w[S];o.push(g+P)}s=u+(s.length>0?" "+s:s)}return s};function DH(){let e=0,t,n,r="";for(;e<arguments.length;)(t=arguments[e++])&&(n=F_(t))&&(r&&(r+=" "),r+=n);return r}const F_=e=>{if(typeof e=="string")return e;let t,n="";for(let r=0;r<e.length;r++)e[r]&&(t=F_(e[r]))&&(n&&(n+=" "),n+=t);return n};function RH(e,...t){let n,r,i,o=a;function a(l){const u=t.reduce((c,f)=>f(c),e());return n=$H(u),r=n.cache.get,i=n.cache.set,o=s,s(l)}function s(l){const u=r(l);if(u)return u;const c=NH(l,n);return i(l,c),c}return function(){return o(DH.apply(null,arguments))}}const Pe=e=>{const t=n=>n[e]||[];return t.isThemeGetter=!0,t},B_=/^\[(?:([a-z-]+):)?(.+)\]$/i,LH=/^\d+\/\d+$/,zH=new Set(["px","full","screen"]),FH=/^(\d+(\.\d+)?)?(xs|sm|md|lg|xl)$/,BH=/\d+(%|px|r?em|[sdl]?v([hwib]|min|max)|pt|pc|in|cm|mm|cap|ch|ex|r?lh|cq(w|h|i|b|min|max))|\b(calc|min|max|clamp)\(.+\)|^0$/,UH=/^(rgba?|hsla?|hwb|(ok)?(lab|lch))\(.+\)$/,VH=/^(inset_)?-?((\d+)?\.?(\d+)[a-z]+|0)_-?((\d+)?\.?(\d+)[a-z]+|0)/,HH=/^(url|image|image-set|cross-fade|element|(repeating-)?(linear|radial|conic)-gradient)\(.+\)$/,er=e=>zo(e)||zH.has(e)||LH.test(e),Rr=e=>va(e,"length",QH),zo=e=>!!e&&!Number.isNaN(Number(e)),ap=e=>va(e,"number",zo),Na=e=>!!e&&Number.isInteger(Number(e)),KH=e=>e.endsWith("%")&&zo(e.slice(0,-1)),ie=e=>B_.test(e),Lr=e=>FH.test(e),WH=new Set(["length","size","percentage"]),YH=e=>va(e,WH,U_),qH=e=>va(e,"position",U_),GH=new Set(["image","url"]),XH=e=>va(e,GH,eK),ZH=e=>va(e,"",JH),Da=()=>!0,va=(e,t,n)=>{const r=B_.exec(e);return r?r[1]?typeof t=="string"?r[1]===t:t.has(r[1]):n(r[2]):!1},QH=e=>BH.test(e)&&!UH.test(e),U_=()=>!1,JH=e=>VH.test(e),eK=e=>HH.test(e),tK=()=>{const e=Pe("colors"),t=Pe("spacing"),n=Pe("blur"),r=Pe("brightness"),i=Pe("borderColor"),o=Pe("borderRadius"),a=Pe("borderSpacing"),s=Pe("borderWidth"),l=Pe("contrast"),u=Pe("grayscale"),c=Pe("hueRotate"),f=Pe("invert"),d=Pe("gap"),p=Pe("gradientColorStops"),h=Pe("gradientColorStopPositions"),v=Pe("inset"),y=Pe("margin"),g=Pe("opacity"),x=Pe("padding"),w=Pe("saturate"),S=Pe("scale"),P=Pe("sepia"),O=Pe("skew"),k=Pe("space"),j=Pe("translate"),M=()=>["auto","contain","none"],A=()=>["auto","hidden","clip","visible","scroll"],C=()=>["auto",ie,t],_=()=>[ie,t],N=()=>["",er,Rr],L=()=>["auto",zo,ie],V=()=>["bottom","center","left","left-bottom","left-top","right","right-bottom","right-top","top"],B=()=>["solid","dashed","dotted","double","none"],U=()=>["normal","multiply","screen","overlay","darken","lighten","color-dodge","color-burn","hard-light","soft-light","difference","exclusion","hue","saturation","color","luminosity"],$=()=>["start","end","center","between","around","evenly","stretch"],z=()=>["","0",ie],K=()=>["auto","avoid","all","avoid-page","page","left","right","column"],X=()=>[zo,ie];return{cacheSize:500,separator:":",theme:{colors:[Da],spacing:[er,Rr],blur:["none","",Lr,ie],brightness:X(),borderColor:[e],borderRadius:["none","","full",Lr,ie],borderSpacing:_(),borderWidth:N(),contrast:X(),grayscale:z(),hueRotate:X(),invert:z(),gap:_(),gradientColorStops:[e],gradientColorStopPositions:[KH,Rr],inset:C(),margin:C(),opacity:X(),padding:_(),saturate:X(),scale:X(),sepia:z(),skew:X(),space:_(),translate:_()},classGroups:{aspect:[{aspect:["auto","square","video",ie]}],container:["container"],columns:[{columns:[Lr]}],"break-after":[{"break-after":K()}],"break-before":[{"break-before":K()}],"break-inside":[{"break-inside":["auto","avoid","avoid-page","avoid-column"]}],"box-decoration":[{"box-decoration":["slice","clone"]}],box:[{box:["border","content"]}],display:["block","inline-block","inline","flex","inline-flex","table","inline-table","table-caption","table-cell","table-column","table-column-group","table-footer-group","table-header-group","table-row-group","table-row","flow-root","grid","inline-grid","contents","list-item","hidden"],float:[{float:["right","left","none","start","end"]}],clear:[{clear:["left","right","both","none","start","end"]}],isolation:["isolate","isolation-auto"],"object-fit":[{object:["contain","cover","fill","none","scale-down"]}],"object-position":[{object:[...V(),ie]}],overflow:[{overflow:A()}],"overflow-x":[{"overflow-x":A()}],"overflow-y":[{"overflow-y":A()}],overscroll:[{overscroll:M()}],"overscroll-x":[{"overscroll-x":M()}],"overscroll-y":[{"overscroll-y":M()}],position:["static","fixed","absolute","relative","sticky"],inset:[{inset:[v]}],"inset-x":[{"inset-x":[v]}],"inset-y":[{"inset-y":[v]}],start:[{start:[v]}],end:[{end:[v]}],top:[{top:[v]}],right:[{right:[v]}],bottom:[{bottom:[v]}],left:[{left:[v]}],visibility:["visible","invisible","collapse"],z:[{z:["auto",Na,ie]}],basis:[{basis:C()}],"flex-direction":[{flex:["row","row-reverse","col","col-reverse"]}],"flex-wrap":[{flex:["wrap","wrap-reverse","nowrap"]}],flex:[{flex:["1","auto","initial","none",ie]}],grow:[{grow:z()}],shrink:[{shrink:z()}],order:[{order:["first","last","none",Na,ie]}],"grid-cols":[{"grid-cols":[Da]}],"col-start-end":[{col:["auto",{span:["full",Na,ie]},ie]}],"col-start":[{"col-start":L()}],"col-end":[{"col-end":L()}],"grid-rows":[{"grid-rows":[Da]}],"row-start-end":[{row:["auto",{span:[Na,ie]},ie]}],"row-start":[{"row-start":L()}],"row-end":[{"row-end":L()}],"grid-flow":[{"grid-flow":["row","col","dense","row-dense","col-dense"]}],"auto-cols":[{"auto-cols":["auto","min","max","fr",ie]}],"auto-rows":[{"auto-rows":["auto","min","max","fr",ie]}],gap:[{gap:[d]}],"gap-x":[{"gap-x":[d]}],"gap-y":[{"gap-y":[d]}],"justify-content":[{justify:["normal",...$()]}],"justify-items":[{"justify-items":["start","end","center","stretch"]}],"justify-self":[{"justify-self":["auto","start","end","center","stretch"]}],"align-content":[{content:["normal",...$(),"baseline"]}],"align-items":[{items:["start","end","center","baseline","stretch"]}],"align-self":[{self:["auto","start","end","center","stretch","baseline"]}],"place-content":[{"place-content":[...$(),"baseline"]}],"place-items":[{"place-items":["start","end","center","baseline","stretch"]}],"place-self":[{"place-self":["auto","start","end","center","stretch"]}],p:[{p:[x]}],px:[{px:[x]}],py:[{py:[x]}],ps:[{ps:[x]}],pe:[{pe:[x]}],pt:[{pt:[x]}],pr:[{pr:[x]}],pb:[{pb:[x]}],pl:[{pl:[x]}],m:[{m:[y]}],mx:[{mx:[y]}],my:[{my:[y]}],ms:[{ms:[y]}],me:[{me:[y]}],mt:[{mt:[y]}],mr:[{mr:[y]}],mb:[{mb:[y]}],ml:[{ml:[y]}],"space-x":[{"space-x":[k]}],"space-x-reverse":["space-x-reverse"],"space-y":[{"space-y":[k]}],"space-y-reverse":["space-y-reverse"],w:[{w:["auto","min","max","fit","svw","lvw","dvw",ie,t]}],"min-w":[{"min-w":[ie,t,"min","max","fit"]}],"max-w":[{"max-w":[ie,t,"none","full","min","max","fit","prose",{screen:[Lr]},Lr]}],h:[{h:[ie,t,"auto","min","max","fit","svh","lvh","dvh"]}],"min-h":[{"min-h":[ie,t,"min","max","fit","svh","lvh","dvh"]}],"max-h":[{"max-h":[ie,t,"min","max","fit","svh","lvh","dvh"]}],size:[{size:[ie,t,"auto","min","max","fit"]}],"font-size":[{text:["base",Lr,Rr]}],"font-smoothing":["antialiased","subpixel-antialiased"],"font-style":["italic","not-italic"],"font-weight":[{font:["thin","extralight","light","normal","medium","semibold","bold","extrabold","black",ap]}],"font-family":[{font:[Da]}],"fvn-normal":["normal-nums"],"fvn-ordinal":["ordinal"],"fvn-slashed-zero":["slashed-zero"],"fvn-figure":["lining-nums","oldstyle-nums"],"fvn-spacing":["proportional-nums","tabular-nums"],"fvn-fraction":["diagonal-fractions","stacked-fractions"],tracking:[{tracking:["tighter","tight","normal","wide","wider","widest",ie]}],"line-clamp":[{"line-clamp":["none",zo,ap]}],leading:[{leading:["none","tight","snug","normal","relaxed","loose",er,ie]}],"list-image":[{"list-image":["none",ie]}],"list-style-type":[{list:["none","disc","decimal",ie]}],"list-style-position":[{list:["inside","outside"]}],"placeholder-color":[{placeholder:[e]}],"placeholder-opacity":[{"placeholder-opacity":[g]}],"text-alignment":[{text:["left","center","right","justify","start","end"]}],"text-color":[{text:[e]}],"text-opacity":[{"text-opacity":[g]}],"text-decoration":["underline","overline","line-through","no-underline"],"text-decoration-style":[{decoration:[...B(),"wavy"]}],"text-decoration-thickness":[{decoration:["auto","from-font",er,Rr]}],"underline-offset":[{"underline-offset":["auto",er,ie]}],"text-decoration-color":[{decoration:[e]}],"text-transform":["uppercase","lowercase","capitalize","normal-case"],"text-overflow":["truncate","text-ellipsis","text-clip"],"text-wrap":[{text:["wrap","nowrap","balance","pretty"]}],indent:[{indent:_()}],"vertical-align":[{align:["baseline","top","middle","bottom","text-top","text-bottom","sub","super",ie]}],whitespace:[{whitespace:["normal","nowrap","pre","pre-line","pre-wrap","break-spaces"]}],break:[{break:["normal","words","all","keep"]}],hyphens:[{hyphens:["none","manual","auto"]}],content:[{content:["none",ie]}],"bg-attachment":[{bg:["fixed","local","scroll"]}],"bg-clip":[{"bg-clip":["border","padding","content","text"]}],"bg-opacity":[{"bg-opacity":[g]}],"bg-origin":[{"bg-origin":["border","padding","content"]}],"bg-position":[{bg:[...V(),qH]}],"bg-repeat":[{bg:["no-repeat",{repeat:["","x","y","round","space"]}]}],"bg-size":[{bg:["auto","cover","contain",YH]}],"bg-image":[{bg:["none",{"gradient-to":["t","tr","r","br","b","bl","l","tl"]},XH]}],"bg-color":[{bg:[e]}],"gradient-from-pos":[{from:[h]}],"gradient-via-pos":[{via:[h]}],"gradient-to-pos":[{to:[h]}],"gradient-from":[{from:[p]}],"gradient-via":[{via:[p]}],"gradient-to":[{to:[p]}],rounded:[{rounded:[o]}],"rounded-s":[{"rounded-s":[o]}],"rounded-e":[{"rounded-e":[o]}],"rounded-t":[{"rounded-t":[o]}],"rounded-r":[{"rounded-r":[o]}],"rounded-b":[{"rounded-b":[o]}],"rounded-l":[{"rounded-l":[o]}],"rounded-ss":[{"rounded-ss":[o]}],"rounded-se":[{"rounded-se":[o]}],"rounded-ee":[{"rounded-ee":[o]}],"rounded-es":[{"rounded-es":[o]}],"rounded-tl":[{"rounded-tl":[o]}],"rounded-tr":[{"rounded-tr":[o]}],"rounded-br":[{"rounded-br":[o]}],"rounded-bl":[{"rounded-bl":[o]}],"border-w":[{border:[s]}],"border-w-x":[{"border-x":[s]}],"border-w-y":[{"border-y":[s]}],"border-w-s":[{"border-s":[s]}],"border-w-e":[{"border-e":[s]}],"border-w-t":[{"border-t":[s]}],"border-w-r":[{"border-r":[s]}],"border-w-b":[{"border-b":[s]}],"border-w-l":[{"border-l":[s]}],"border-opacity":[{"border-opacity":[g]}],"border-style":[{border:[...B(),"hidden"]}],"divide-x":[{"divide-x":[s]}],"divide-x-reverse":["divide-x-reverse"],"divide-y":[{"divide-y":[s]}],"divide-y-reverse":["divide-y-reverse"],"divide-opacity":[{"divide-opacity":[g]}],"divide-style":[{divide:B()}],"border-color":[{border:[i]}],"border-color-x":[{"border-x":[i]}],"border-color-y":[{"border-y":[i]}],"border-color-s":[{"border-s":[i]}],"border-color-e":[{"border-e":[i]}],"border-color-t":[{"border-t":[i]}],"border-color-r":[{"border-r":[i]}],"border-color-b":[{"border-b":[i]}],"border-color-l":[{"border-l":[i]}],"divide-color":[{divide:[i]}],"outline-style":[{outline:["",...B()]}],"outline-offset":[{"outline-offset":[er,ie]}],"outline-w":[{outline:[er,Rr]}],"outline-color":[{outline:[e]}],"ring-w":[{ring:N()}],"ring-w-inset":["ring-inset"],"ring-color":[{ring:[e]}],"ring-opacity":[{"ring-opacity":[g]}],"ring-offset-w":[{"ring-offset":[er,Rr]}],"ring-offset-color":[{"ring-offset":[e]}],shadow:[{shadow:["","inner","none",Lr,ZH]}],"shadow-color":[{shadow:[Da]}],opacity:[{opacity:[g]}],"mix-blend":[{"mix-blend":[...U(),"plus-lighter","plus-darker"]}],"bg-blend":[{"bg-blend":U()}],filter:[{filter:["","none"]}],blur:[{blur:[n]}],brightness:[{brightness:[r]}],contrast:[{contrast:[l]}],"drop-shadow":[{"drop-shadow":["","none",Lr,ie]}],grayscale:[{grayscale:[u]}],"hue-rotate":[{"hue-rotate":[c]}],invert:[{invert:[f]}],saturate:[{saturate:[w]}],sepia:[{sepia:[P]}],"backdrop-filter":[{"backdrop-filter":["","none"]}],"backdrop-blur":[{"backdrop-blur":[n]}],"backdrop-brightness":[{"backdrop-brightness":[r]}],"backdrop-contrast":[{"backdrop-contrast":[l]}],"backdrop-grayscale":[{"backdrop-grayscale":[u]}],"backdrop-hue-rotate":[{"backdrop-hue-rotate":[c]}],"backdrop-invert":[{"backdrop-invert":[f]}],"backdrop-opacity":[{"backdrop-opacity":[g]}],"backdrop-saturate":[{"backdrop-saturate":[w]}],"backdrop-sepia":[{"backdrop-sepia":[P]}],"border-collapse":[{border:["collapse","separate"]}],"border-spacing":[{"border-spacing":[a]}],"border-spacing-x":[{"border-spacing-x":[a]}],"border-spacing-y":[{"border-spacing-y":[a]}],"table-layout":[{table:["auto","fixed"]}],caption:[{caption:["top","bottom"]}],transition:[{transition:["none","all","","colors","opacity","shadow","transform",ie]}],duration:[{duration:X()}],ease:[{ease:["linear","in","out","in-out",ie]}],delay:[{delay:X()}],animate:[{animate:["none","spin","ping","pulse","bounce",ie]}],transform:[{transform:["","gpu","none"]}],scale:[{scale:[S]}],"scale-x":[{"scale-x":[S]}],"scale-y":[{"scale-y":[S]}],rotate:[{rotate:[Na,ie]}],"translate-x":[{"translate-x":[j]}],"translate-y":[{"translate-y":[j]}],"skew-x":[{"skew-x":[O]}],"skew-y":[{"skew-y":[O]}],"transform-origin":[{origin:["center","top","top-right","right","bottom-right","bottom","bottom-left","left","top-left",ie]}],accent:[{accent:["auto",e]}],appearance:[{appearance:["none","auto"]}],cursor:[{cursor:["auto","default","pointer","wait","text","move","help","not-allowed","none","context-menu","progress","cell","crosshair","vertical-text","alias","copy","no-drop","grab","grabbing","all-scroll","col-resize","row-resize","n-resize","e-resize","s-resize","w-resize","ne-resize","nw-resize","se-resize","sw-resize","ew-resize","ns-resize","nesw-resize","nwse-resize","zoom-in","zoom-out",ie]}],"caret-color":[{caret:[e]}],"pointer-events":[{"pointer-events":["none","auto"]}],resize:[{resize:["none","y","x",""]}],"scroll-behavior":[{scroll:["auto","smooth"]}],"scroll-m":[{"scroll-m":_()}],"scroll-mx":[{"scroll-mx":_()}],"scroll-my":[{"scroll-my":_()}],"scroll-ms":[{"scroll-ms":_()}],"scroll-me":[{"scroll-me":_()}],"scroll-mt":[{"scroll-mt":_()}],"scroll-mr":[{"scroll-mr":_()}],"scroll-mb":[{"scroll-mb":_()}],"scroll-ml":[{"scroll-ml":_()}],"scroll-p":[{"scroll-p":_()}],"scroll-px":[{"scroll-px":_()}],"scroll-py":[{"scroll-py":_()}],"scroll-ps":[{"scroll-ps":_()}],"scroll-pe":[{"scroll-pe":_()}],"scroll-pt":[{"scroll-pt":_()}],"scroll-pr":[{"scroll-pr":_()}],"scroll-pb":[{"scroll-pb":_()}],"scroll-pl":[{"scroll-pl":_()}],"snap-align":[{snap:["start","end","center","align-none"]}],"snap-stop":[{snap:["normal","always"]}],"snap-type":[{snap:["none","x","y","both"]}],"snap-strictness":[{snap:["mandatory","proximity"]}],touch:[{touch:["auto","none","manipulation"]}],"touch-x":[{"touch-pan":["x","left","right"]}],"touch-y":[{"touch-pan":["y","up","down"]}],"touch-pz":["touch-pinch-zoom"],select:[{select:["none","text","all","auto"]}],"will-change":[{"will-change":["auto","scroll","contents","transform",ie]}],fill:[{fill:[e,"none"]}],"stroke-w":[{stroke:[er,Rr,ap]}],stroke:[{stroke:[e,"none"]}],sr:["sr-only","not-sr-only"],"forced-color-adjust":[{"forced-color-adjust":["auto","none"]}]},conflictingClassGroups:{overflow:["overflow-x","overflow-y"],overscroll:["overscroll-x","overscroll-y"],inset:["inset-x","inset-y","start","end","top","right","bottom","left"],"inset-x":["right","left"],"inset-y":["top","bottom"],flex:["basis","grow","shrink"],gap:["gap-x","gap-y"],p:["px","py","ps","pe","pt","pr","pb","pl"],px:["pr","pl"],py:["pt","pb"],m:["mx","my","ms","me","mt","mr","mb","ml"],mx:["mr","ml"],my:["mt","mb"],size:["w","h"],"font-size":["leading"],"fvn-normal":["fvn-ordinal","fvn-slashed-zero","fvn-figure","fvn-spacing","fvn-fraction"],"fvn-ordinal":["fvn-normal"],"fvn-slashed-zero":["fvn-normal"],"fvn-figure":["fvn-normal"],"fvn-spacing":["fvn-normal"],"fvn-fraction":["fvn-normal"],"line-clamp":["display","overflow"],rounded:["rounded-s","rounded-e","rounded-t","rounded-r","rounded-b","rounded-l","rounded-ss","rounded-se","rounded-ee","rounded-es","rounded-tl","rounded-tr","rounded-br","rounded-bl"],"rounded-s":["rounded-ss","rounded-es"],"rounded-e":["rounded-se","rounded-ee"],"rounded-t":["rounded-tl","rounded-tr"],"rounded-r":["rounded-tr","rounded-br"],"rounded-b":["rounded-br","rounded-bl"],"rounded-l":["rounded-tl","rounded-bl"],"border-spacing":["border-spacing-x","border-spacing-y"],"border-w":["border-w-s","border-w-e","border-w-t","border-w-r","border-w-b","border-w-l"],"border-w-x":["border-w-r","border-w-l"],"border-w-y":["border-w-t","border-w-b"],"border-color":["border-color-s","border-color-e","border-color-t","border-color-r","border-color-b","border-color-l"],"border-color-x":["border-color-r","border-color-l"],"border-color-y":["border-color-t","border-color-b"],"scroll-m":["scroll-mx","scroll-my","scroll-ms","scroll-me","scroll-mt","scroll-mr","scroll-mb","scroll-ml"],"scroll-mx":["scroll-mr","scroll-ml"],"scroll-my":["scroll-mt","scroll-mb"],"scroll-p":["scroll-px","scroll-py","scroll-ps","scroll-pe","scroll-pt","scroll-pr","scroll-pb","scroll-pl"],"scroll-px":["scroll-pr","scroll-pl"],"scroll-py":["scroll-pt","scroll-pb"],touch:["touch-x","touch-y","touch-pz"],"touch-x":["touch"],"touch-y":["touch"],"touch-pz":["touch"]},conflictingClassGroupModifiers:{"font-size":["leading"]}}},nK=RH(tK);function rK(...e){return nK(ve(e))}const iK=wH,eu=bH,tu=SH,Ha=m.forwardRef(({className:e,sideOffset:t=2,side:n="bottom",borderRadius:r=30,align:i="center",containerWidth:o,...a},s)=>{const l=o?E(28,o):28,u=o?E(1069/2,o):534.5;return b.jsx(PH,{children:b.jsxs(R_,{ref:s,side:n,sideOffset:t,align:i,collisionPadding:16,sticky:"always",arrowPadding:8,className:rK("overflow-visible px-3 py-1.5 shadow-lg",e),style:{maxWidth:`${u}px`,borderRadius:`${r}px`,backgroundColor:"#F5F5F5",zIndex:9999,...a.style},...a,children:[b.jsx("div",{style:{fontFamily:"OPPO Sans 4.0",fontWeight:500,fontStyle:"normal",fontSize:`${l}px`,lineHeight:"100%",letterSpacing:"0%",wordWrap:"break-word",overflowWrap:"break-word",color:"#60585E"},children:a.children}),b.jsx(OH,{width:12,height:6,style:{fill:"#F5F5F5",filter:"drop-shadow(0 1px 1px rgba(0, 0, 0, 0.1))",position:"relative"}})]})})});Ha.displayName=R_.displayName;const Xn=Object.create(null);Xn.open="0";Xn.close="1";Xn.ping="2";Xn.pong="3";Xn.message="4";Xn.upgrade="5";Xn.noop="6";const Pu=Object.create(null);Object.keys(Xn).forEach(e=>{Pu[Xn[e]]=e});const am={type:"error",data:"parser error"},V_=typeof Blob=="function"||typeof Blob<"u"&&Object.prototype.toString.call(Blob)==="[object BlobConstructor]",H_=typeof ArrayBuffer=="function",K_=e=>typeof ArrayBuffer.isView=="function"?ArrayBuffer.isView(e):e&&e.buffer instanceof ArrayBuffer,ry=({type:e,data:t},n,r)=>V_&&t instanceof Blob?n?r(t):nb(t,r):H_&&(t instanceof ArrayBuffer||K_(t))?n?r(t):nb(new Blob([t]),r):r(Xn[e]+(t||"")),nb=(e,t)=>{const n=new FileReader;return n.onload=function(){const r=n.result.split(",")[1];t("b"+(r||""))},n.readAsDataURL(e)};function rb(e){return e instanceof Uint8Array?e:e instanceof ArrayBuffer?new Uint8Array(e):new Uint8Array(e.buffer,e.byteOffset,e.byteLength)}let sp;function oK(e,t){if(V_&&e.data instanceof Blob)return e.data.arrayBuffer().then(rb).then(t);if(H_&&(e.data instanceof ArrayBuffer||K_(e.data)))return t(rb(e.data));ry(e,!1,n=>{sp||(sp=new TextEncoder),t(sp.encode(n))})}const ib="ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/",Ka=typeof Uint8Array>"u"?[]:new Uint8Array(256);for(let e=0;e<ib.length;e++)Ka[ib.charCodeAt(e)]=e;const aK=e=>{let t=e.length*.75,n=e.length,r,i=0,o,a,s,l;e[e.length-1]==="="&&(t--,e[e.length-2]==="="&&t--);const u=new ArrayBuffer(t),c=new Uint8Array(u);for(r=0;r<n;r+=4)o=Ka[e.charCodeAt(r)],a=Ka[e.charCodeAt(r+1)],s=Ka[e.charCodeAt(r+2)],l=Ka[e.charCodeAt(r+3)],c[i++]=o<<2|a>>4,c[i++]=(a&15)<<4|s>>2,c[i++]=(s&3)<<6|l&63;return u},sK=typeof ArrayBuffer=="function",iy=(e,t)=>{if(typeof e!="string")return{type:"message",data:W_(e,t)};const n=e.charAt(0);return n==="b"?{type:"message",data:lK(e.substring(1),t)}:Pu[n]?e.length>1?{type:Pu[n],data:e.substring(1)}:{type:Pu[n]}:am},lK=(e,t)=>{if(sK){const n=aK(e);return W_(n,t)}else return{base64:!0,data:e}},W_=(e,t)=>{switch(t){case"blob":return e instanceof Blob?e:new Blob([e]);case"arraybuffer":default:return e instanceof ArrayBuffer?e:e.buffer}},Y_=String.fromCharCode(30),uK=(e,t)=>{const n=e.length,r=new Array(n);let i=0;e.forEach((o,a)=>{ry(o,!1,s=>{r[a]=s,++i===n&&t(r.join(Y_))})})},cK=(e,t)=>{const n=e.split(Y_),r=[];for(let i=0;i<n.length;i++){const o=iy(n[i],t);if(r.push(o),o.type==="error")break}return r};function fK(){return new TransformStream({transform(e,t){oK(e,n=>{const r=n.length;let i;if(r<126)i=new Uint8Array(1),new DataView(i.buffer).setUint8(0,r);else if(r<65536){i=new Uint8Array(3);const o=new DataView(i.buffer);o.setUint8(0,126),o.setUint16(1,r)}else{i=new Uint8Array(9);const o=new DataView(i.buffer);o.setUint8(0,127),o.setBigUint64(1,BigInt(r))}e.data&&typeof e.data!="string"&&(i[0]|=128),t.enqueue(i),t.enqueue(n)})}})}let lp;function nu(e){return e.reduce((t,n)=>t+n.length,0)}function ru(e,t){if(e[0].length===t)return e.shift();const n=new Uint8Array(t);let r=0;for(let i=0;i<t;i++)n[i]=e[0][r++],r===e[0].length&&(e.shift(),r=0);return e.length&&r<e[0].length&&(e[0]=e[0].slice(r)),n}function dK(e,t){lp||(lp=new TextDecoder);const n=[];let r=0,i=-1,o=!1;return new TransformStream({transform(a,s){for(n.push(a);;){if(r===0){if(nu(n)<1)break;const l=ru(n,1);o=(l[0]&128)===128,i=l[0]&127,i<126?r=3:i===126?r=1:r=2}else if(r===1){if(nu(n)<2)break;const l=ru(n,2);i=new DataView(l.buffer,l.byteOffset,l.length).getUint16(0),r=3}else if(r===2){if(nu(n)<8)break;const l=ru(n,8),u=new DataView(l.buffer,l.byteOffset,l.length),c=u.getUint32(0);if(c>Math.pow(2,53-32)-1){s.enqueue(am);break}i=c*Math.pow(2,32)+u.getUint32(4),r=3}else{if(nu(n)<i)break;const l=ru(n,i);s.enqueue(iy(o?l:lp.decode(l),t)),r=0}if(i===0||i>e){s.enqueue(am);break}}}})}const q_=4;function Fe(e){if(e)return pK(e)}function pK(e){for(var t in Fe.prototype)e[t]=Fe.prototype[t];return e}Fe.prototype.on=Fe.prototype.addEventListener=function(e,t){return this._callbacks=this._callbacks||{},(this._callbacks["$"+e]=this._callbacks["$"+e]||[]).push(t),this};Fe.prototype.once=function(e,t){function n(){this.off(e,n),t.apply(this,arguments)}return n.fn=t,this.on(e,n),this};Fe.prototype.off=Fe.prototype.removeListener=Fe.prototype.removeAllListeners=Fe.prototype.removeEventListener=function(e,t){if(this._callbacks=this._callbacks||{},arguments.length==0)return this._callbacks={},this;var n=this._callbacks["$"+e];if(!n)return this;if(arguments.length==1)return delete this._callbacks["$"+e],this;for(var r,i=0;i<n.length;i++)if(r=n[i],r===t||r.fn===t){n.splice(i,1);break}return n.length===0&&delete this._callbacks["$"+e],this};Fe.prototype.emit=function(e){this._callbacks=this._callbacks||{};for(var t=new Array(arguments.length-1),n=this._callbacks["$"+e],r=1;r<arguments.length;r++)t[r-1]=arguments[r];if(n){n=n.slice(0);for(var r=0,i=n.length;r<i;++r)n[r].apply(this,t)}return this};Fe.prototype.emitReserved=Fe.prototype.emit;Fe.prototype.listeners=function(e){return this._callbacks=this._callbacks||{},this._callbacks["$"+e]||[]};Fe.prototype.hasListeners=function(e){return!!this.listeners(e).length};const id=(()=>typeof Promise=="function"&&typeof Promise.resolve=="function"?t=>Promise.resolve().then(t):(t,n)=>n(t,0))(),sn=(()=>typeof self<"u"?self:typeof window<"u"?window:Function("return this")())(),hK="arraybuffer";function G_(e,...t){return t.reduce((n,r)=>(e.hasOwnProperty(r)&&(n[r]=e[r]),n),{})}const mK=sn.setTimeout,vK=sn.clearTimeout;function od(e,t){t.useNativeTimers?(e.setTimeoutFn=mK.bind(sn),e.clearTimeoutFn=vK.bind(sn)):(e.setTimeoutFn=sn.setTimeout.bind(sn),e.clearTimeoutFn=sn.clearTimeout.bind(sn))}const gK=1.33;function yK(e){return typeof e=="string"?xK(e):Math.ceil((e.byteLength||e.size)*gK)}function xK(e){let t=0,n=0;for(let r=0,i=e.length;r<i;r++)t=e.charCodeAt(r),t<128?n+=1:t<2048?n+=2:t<55296||t>=57344?n+=3:(r++,n+=4);return n}function X_(){return Date.now().toString(36).substring(3)+Math.random().toString(36).substring(2,5)}function wK(e){let t="";for(let n in e)e.hasOwnProperty(n)&&(t.length&&(t+="&"),t+=encodeURIComponent(n)+"="+encodeURIComponent(e[n]));return t}function bK(e){let t={},n=e.split("&");for(let r=0,i=n.length;r<i;r++){let o=n[r].split("=");t[decodeURIComponent(o[0])]=decodeURIComponent(o[1])}return t}class SK extends Error{constructor(t,n,r){super(t),this.description=n,this.context=r,this.type="TransportError"}}class oy extends Fe{constructor(t){super(),this.writable=!1,od(this,t),this.opts=t,this.query=t.query,this.socket=t.socket,this.supportsBinary=!t.forceBase64}onError(t,n,r){return super.emitReserved("error",new SK(t,n,r)),this}open(){return this.readyState="opening",this.doOpen(),this}close(){return(this.readyState==="opening"||this.readyState==="open")&&(this.doClose(),this.onClose()),this}send(t){this.readyState==="open"&&this.write(t)}onOpen(){this.readyState="open",this.writable=!0,super.emitReserved("open")}onData(t){const n=iy(t,this.socket.binaryType);this.onPacket(n)}onPacket(t){super.emitReserved("packet",t)}onClose(t){this.readyState="closed",super.emitReserved("close",t)}pause(t){}createUri(t,n={}){return t+"://"+this._hostname()+this._port()+this.opts.path+this._query(n)}_hostname(){const t=this.opts.hostname;return t.indexOf(":")===-1?t:"["+t+"]"}_port(){return this.opts.port&&(this.opts.secure&&Number(this.opts.port)!==443||!this.opts.secure&&Number(this.opts.port)!==80)?":"+this.opts.port:""}_query(t){const n=wK(t);return n.length?"?"+n:""}}class PK extends oy{constructor(){super(...arguments),this._polling=!1}get name(){return"polling"}doOpen(){this._poll()}pause(t){this.readyState="pausing";const n=()=>{this.readyState="paused",t()};if(this._polling||!this.writable){let r=0;this._polling&&(r++,this.once("pollComplete",function(){--r||n()})),this.writable||(r++,this.once("drain",function(){--r||n()}))}else n()}_poll(){this._polling=!0,this.doPoll(),this.emitReserved("poll")}onData(t){const n=r=>{if(this.readyState==="opening"&&r.type==="open"&&this.onOpen(),r.type==="close")return this.onClose({description:"transport closed by the server"}),!1;this.onPacket(r)};cK(t,this.socket.binaryType).forEach(n),this.readyState!=="closed"&&(this._polling=!1,this.emitReserved("pollComplete"),this.readyState==="open"&&this._poll())}doClose(){const t=()=>{this.write([{type:"close"}])};this.readyState==="open"?t():this.once("open",t)}write(t){this.writable=!1,uK(t,n=>{this.doWrite(n,()=>{this.writable=!0,this.emitReserved("drain")})})}uri(){const t=this.opts.secure?"https":"http",n=this.query||{};return this.opts.timestampRequests!==!1&&(n[this.opts.timestampParam]=X_()),!this.supportsBinary&&!n.sid&&(n.b64=1),this.createUri(t,n)}}let Z_=!1;try{Z_=typeof XMLHttpRequest<"u"&&"withCredentials"in new XMLHttpRequest}catch{}const OK=Z_;function EK(){}class kK extends PK{constructor(t){if(super(t),typeof location<"u"){const n=location.protocol==="https:";let r=location.port;r||(r=n?"443":"80"),this.xd=typeof location<"u"&&t.hostname!==location.hostname||r!==t.port}}doWrite(t,n){const r=this.request({method:"POST",data:t});r.on("success",n),r.on("error",(i,o)=>{this.onError("xhr post error",i,o)})}doPoll(){const t=this.request();t.on("data",this.onData.bind(this)),t.on("error",(n,r)=>{this.onError("xhr poll error",n,r)}),this.pollXhr=t}}class Wn extends Fe{constructor(t,n,r){super(),this.createRequest=t,od(this,r),this._opts=r,this._method=r.method||"GET",this._uri=n,this._data=r.data!==void 0?r.data:null,this._create()}_create(){var t;const n=G_(this._opts,"agent","pfx","key","passphrase","cert","ca","ciphers","rejectUnauthorized","autoUnref");n.xdomain=!!this._opts.xd;const r=this._xhr=this.createRequest(n);try{r.open(this._method,this._uri,!0);try{if(this._opts.extraHeaders){r.setDisableHeaderCheck&&r.setDisableHeaderCheck(!0);for(let i in this._opts.extraHeaders)this._opts.extraHeaders.hasOwnProperty(i)&&r.setRequestHeader(i,this._opts.extraHeaders[i])}}catch{}if(this._method==="POST")try{r.setRequestHeader("Content-type","text/plain;charset=UTF-8")}catch{}try{r.setRequestHeader("Accept","*/*")}catch{}(t=this._opts.cookieJar)===null||t===void 0||t.addCookies(r),"withCredentials"in r&&(r.withCredentials=this._opts.withCredentials),this._opts.requestTimeout&&(r.timeout=this._opts.requestTimeout),r.onreadystatechange=()=>{var i;r.readyState===3&&((i=this._opts.cookieJar)===null||i===void 0||i.parseCookies(r.getResponseHeader("set-cookie"))),r.readyState===4&&(r.status===200||r.status===1223?this._onLoad():this.setTimeoutFn(()=>{this._onError(typeof r.status=="number"?r.status:0)},0))},r.send(this._data)}catch(i){this.setTimeoutFn(()=>{this._onError(i)},0);return}typeof document<"u"&&(this._index=Wn.requestsCount++,Wn.requests[this._index]=this)}_onError(t){this.emitReserved("error",t,this._xhr),this._cleanup(!0)}_cleanup(t){if(!(typeof this._xhr>"u"||this._xhr===null)){if(this._xhr.onreadystatechange=EK,t)try{this._xhr.abort()}catch{}typeof document<"u"&&delete Wn.requests[this._index],this._xhr=null}}_onLoad(){const t=this._xhr.responseText;t!==null&&(this.emitReserved("data",t),this.emitReserved("success"),this._cleanup())}abort(){this._cleanup()}}Wn.requestsCount=0;Wn.requests={};if(typeof document<"u"){if(typeof attachEvent=="function")attachEvent("onunload",ob);else if(typeof addEventListener=="function"){const e="onpagehide"in sn?"pagehide":"unload";addEventListener(e,ob,!1)}}function ob(){for(let e in Wn.requests)Wn.requests.hasOwnProperty(e)&&Wn.requests[e].abort()}const CK=function(){const e=Q_({xdomain:!1});return e&&e.responseType!==null}();class _K extends kK{constructor(t){super(t);const n=t&&t.forceBase64;this.supportsBinary=CK&&!n}request(t={}){return Object.assign(t,{xd:this.xd},this.opts),new Wn(Q_,this.uri(),t)}}function Q_(e){const t=e.xdomain;try{if(typeof XMLHttpRequest<"u"&&(!t||OK))return new XMLHttpRequest}catch{}if(!t)try{return new sn[["Active"].concat("Object").join("X")]("Microsoft.XMLHTTP")}catch{}}const J_=typeof navigator<"u"&&typeof navigator.product=="string"&&navigator.product.toLowerCase()==="reactnative";class AK extends oy{get name(){return"websocket"}doOpen(){const t=this.uri(),n=this.opts.protocols,r=J_?{}:G_(this.opts,"agent","perMessageDeflate","pfx","key","passphrase","cert","ca","ciphers","rejectUnauthorized","localAddress","protocolVersion","origin","maxPayload","family","checkServerIdentity");this.opts.extraHeaders&&(r.headers=this.opts.extraHeaders);try{this.ws=this.createSocket(t,n,r)}catch(i){return this.emitReserved("error",i)}this.ws.binaryType=this.socket.binaryType,this.addEventListeners()}addEventListeners(){this.ws.onopen=()=>{this.opts.autoUnref&&this.ws._socket.unref(),this.onOpen()},this.ws.onclose=t=>this.onClose({description:"websocket connection closed",context:t}),this.ws.onmessage=t=>this.onData(t.data),this.ws.onerror=t=>this.onError("websocket error",t)}write(t){this.writable=!1;for(let n=0;n<t.length;n++){const r=t[n],i=n===t.length-1;ry(r,this.supportsBinary,o=>{try{this.doWrite(r,o)}catch{}i&&id(()=>{this.writable=!0,this.emitReserved("drain")},this.setTimeoutFn)})}}doClose(){typeof this.ws<"u"&&(this.ws.onerror=()=>{},this.ws.close(),this.ws=null)}uri(){const t=this.opts.secure?"wss":"ws",n=this.query||{};return this.opts.timestampRequests&&(n[this.opts.timestampParam]=X_()),this.supportsBinary||(n.b64=1),this.createUri(t,n)}}const up=sn.WebSocket||sn.MozWebSocket;class jK extends AK{createSocket(t,n,r){return J_?new up(t,n,r):n?new up(t,n):new up(t)}doWrite(t,n){this.ws.send(n)}}class MK extends oy{get name(){return"webtransport"}doOpen(){try{this._transport=new WebTransport(this.createUri("https"),this.opts.transportOptions[this.name])}catch(t){return this.emitReserved("error",t)}this._transport.closed.then(()=>{this.onClose()}).catch(t=>{this.onError("webtransport error",t)}),this._transport.ready.then(()=>{this._transport.createBidirectionalStream().then(t=>{const n=dK(Number.MAX_SAFE_INTEGER,this.socket.binaryType),r=t.readable.pipeThrough(n).getReader(),i=fK();i.readable.pipeTo(t.writable),this._writer=i.writable.getWriter();const o=()=>{r.read().then(({done:s,value:l})=>{s||(this.onPacket(l),o())}).catch(s=>{})};o();const a={type:"open"};this.query.sid&&(a.data=`{"sid":"${this.query.sid}"}`),this._writer.write(a).then(()=>this.onOpen())})})}write(t){this.writable=!1;for(let n=0;n<t.length;n++){const r=t[n],i=n===t.length-1;this._writer.write(r).then(()=>{i&&id(()=>{this.writable=!0,this.emitReserved("drain")},this.setTimeoutFn)})}}doClose(){var t;(t=this._transport)===null||t===void 0||t.close()}}const TK={websocket:jK,webtransport:MK,polling:_K},$K=/^(?:(?![^:@\/?#]+:[^:@\/]*@)(http|https|ws|wss):\/\/)?((?:(([^:@\/?#]*)(?::([^:@\/?#]*))?)?@)?((?:[a-f0-9]{0,4}:){2,7}[a-f0-9]{0,4}|[^:\/?#]*)(?::(\d*))?)(((\/(?:[^?#](?![^?#\/]*\.[^?#\/.]+(?:[?#]|$)))*\/?)?([^?#\/]*))(?:\?([^#]*))?(?:#(.*))?)/,IK=["source","protocol","authority","userInfo","user","password","host","port","relative","path","directory","file","query","anchor"];function sm(e){if(e.length>8e3)throw"URI too long";const t=e,n=e.indexOf("["),r=e.indexOf("]");n!=-1&&r!=-1&&(e=e.substring(0,n)+e.substring(n,r).replace(/:/g,";")+e.substring(r,e.length));let i=$K.exec(e||""),o={},a=14;for(;a--;)o[IK[a]]=i[a]||"";return n!=-1&&r!=-1&&(o.source=t,o.host=o.host.substring(1,o.host.length-1).replace(/;/g,":"),o.authority=o.authority.replace("[","").replace("]","").replace(/;/g,":"),o.ipv6uri=!0),o.pathNames=NK(o,o.path),o.queryKey=DK(o,o.query),o}function NK(e,t){const n=/\/{2,9}/g,r=t.replace(n,"/").split("/");return(t.slice(0,1)=="/"||t.length===0)&&r.splice(0,1),t.slice(-1)=="/"&&r.splice(r.length-1,1),r}function DK(e,t){const n={};return t.replace(/(?:^|&)([^&=]*)=?([^&]*)/g,function(r,i,o){i&&(n[i]=o)}),n}const lm=typeof addEventListener=="function"&&typeof removeEventListener=="function",Ou=[];lm&&addEventListener("offline",()=>{Ou.forEach(e=>e())},!1);class ii extends Fe{constructor(t,n){if(super(),this.binaryType=hK,this.writeBuffer=[],this._prevBufferLen=0,this._pingInterval=-1,this._pingTimeout=-1,this._maxPayload=-1,this._pingTimeoutTime=1/0,t&&typeof t=="object"&&(n=t,t=null),t){const r=sm(t);n.hostname=r.host,n.secure=r.protocol==="https"||r.protocol==="wss",n.port=r.port,r.query&&(n.query=r.query)}else n.host&&(n.hostname=sm(n.host).host);od(this,n),this.secure=n.secure!=null?n.secure:typeof location<"u"&&location.protocol==="https:",n.hostname&&!n.port&&(n.port=this.secure?"443":"80"),this.hostname=n.hostname||(typeof location<"u"?location.hostname:"localhost"),this.port=n.port||(typeof location<"u"&&location.port?location.port:this.secure?"443":"80"),this.transports=[],this._transportsByName={},n.transports.forEach(r=>{const i=r.prototype.name;this.transports.push(i),this._transportsByName[i]=r}),this.opts=Object.assign({path:"/engine.io",agent:!1,withCredentials:!1,upgrade:!0,timestampParam:"t",rememberUpgrade:!1,addTrailingSlash:!0,rejectUnauthorized:!0,perMessageDeflate:{threshold:1024},transportOptions:{},closeOnBeforeunload:!1},n),this.opts.path=this.opts.path.replace(/\/$/,"")+(this.opts.addTrailingSlash?"/":""),typeof this.opts.query=="string"&&(this.opts.query=bK(this.opts.query)),lm&&(this.opts.closeOnBeforeunload&&(this._beforeunloadEventListener=()=>{this.transport&&(this.transport.removeAllListeners(),this.transport.close())},addEventListener("beforeunload",this._beforeunloadEventListener,!1)),this.hostname!=="localhost"&&(this._offlineEventListener=()=>{this._onClose("transport close",{description:"network connection lost"})},Ou.push(this._offlineEventListener))),this.opts.withCredentials&&(this._cookieJar=void 0),this._open()}createTransport(t){const n=Object.assign({},this.opts.query);n.EIO=q_,n.transport=t,this.id&&(n.sid=this.id);const r=Object.assign({},this.opts,{query:n,socket:this,hostname:this.hostname,secure:this.secure,port:this.port},this.opts.transportOptions[t]);return new this._transportsByName[t](r)}_open(){if(this.transports.length===0){this.setTimeoutFn(()=>{this.emitReserved("error","No transports available")},0);return}const t=this.opts.rememberUpgrade&&ii.priorWebsocketSuccess&&this.transports.indexOf("websocket")!==-1?"websocket":this.transports[0];this.readyState="opening";const n=this.createTransport(t);n.open(),this.setTransport(n)}setTransport(t){this.transport&&this.transport.removeAllListeners(),this.transport=t,t.on("drain",this._onDrain.bind(this)).on("packet",this._onPacket.bind(this)).on("error",this._onError.bind(this)).on("close",n=>this._onClose("transport close",n))}onOpen(){this.readyState="open",ii.priorWebsocketSuccess=this.transport.name==="websocket",this.emitReserved("open"),this.flush()}_onPacket(t){if(this.readyState==="opening"||this.readyState==="open"||this.readyState==="closing")switch(this.emitReserved("packet",t),this.emitReserved("heartbeat"),t.type){case"open":this.onHandshake(JSON.parse(t.data));break;case"ping":this._sendPacket("pong"),this.emitReserved("ping"),this.emitReserved("pong"),this._resetPingTimeout();break;case"error":const n=new Error("server error");n.code=t.data,this._onError(n);break;case"message":this.emitReserved("data",t.data),this.emitReserved("message",t.data);break}}onHandshake(t){this.emitReserved("handshake",t),this.id=t.sid,this.transport.query.sid=t.sid,this._pingInterval=t.pingInterval,this._pingTimeout=t.pingTimeout,this._maxPayload=t.maxPayload,this.onOpen(),this.readyState!=="closed"&&this._resetPingTimeout()}_resetPingTimeout(){this.clearTimeoutFn(this._pingTimeoutTimer);const t=this._pingInterval+this._pingTimeout;this._pingTimeoutTime=Date.now()+t,this._pingTimeoutTimer=this.setTimeoutFn(()=>{this._onClose("ping timeout")},t),this.opts.autoUnref&&this._pingTimeoutTimer.unref()}_onDrain(){this.writeBuffer.splice(0,this._prevBufferLen),this._prevBufferLen=0,this.writeBuffer.length===0?this.emitReserved("drain"):this.flush()}flush(){if(this.readyState!=="closed"&&this.transport.writable&&!this.upgrading&&this.writeBuffer.length){const t=this._getWritablePackets();this.transport.send(t),this._prevBufferLen=t.length,this.emitReserved("flush")}}_getWritablePackets(){if(!(this._maxPayload&&this.transport.name==="polling"&&this.writeBuffer.length>1))return this.writeBuffer;let n=1;for(let r=0;r<this.writeBuffer.length;r++){const i=this.writeBuffer[r].data;if(i&&(n+=yK(i)),r>0&&n>this._maxPayload)return this.writeBuffer.slice(0,r);n+=2}return this.writeBuffer}_hasPingExpired(){if(!this._pingTimeoutTime)return!0;const t=Date.now()>this._pingTimeoutTime;return t&&(this._pingTimeoutTime=0,id(()=>{this._onClose("ping timeout")},this.setTimeoutFn)),t}write(t,n,r){return this._sendPacket("message",t,n,r),this}send(t,n,r){return this._sendPacket("message",t,n,r),this}_sendPacket(t,n,r,i){if(typeof n=="function"&&(i=n,n=void 0),typeof r=="function"&&(i=r,r=null),this.readyState==="closing"||this.readyState==="closed")return;r=r||{},r.compress=r.compress!==!1;const o={type:t,data:n,options:r};this.emitReserved("packetCreate",o),this.writeBuffer.push(o),i&&this.once("flush",i),this.flush()}close(){const t=()=>{this._onClose("forced close"),this.transport.close()},n=()=>{this.off("upgrade",n),this.off("upgradeError",n),t()},r=()=>{this.once("upgrade",n),this.once("upgradeError",n)};return(this.readyState==="opening"||this.readyState==="open")&&(this.readyState="closing",this.writeBuffer.length?this.once("drain",()=>{this.upgrading?r():t()}):this.upgrading?r():t()),this}_onError(t){if(ii.priorWebsocketSuccess=!1,this.opts.tryAllTransports&&this.transports.length>1&&this.readyState==="opening")return this.transports.shift(),this._open();this.emitReserved("error",t),this._onClose("transport error",t)}_onClose(t,n){if(this.readyState==="opening"||this.readyState==="open"||this.readyState==="closing"){if(this.clearTimeoutFn(this._pingTimeoutTimer),this.transport.removeAllListeners("close"),this.transport.close(),this.transport.removeAllListeners(),lm&&(this._beforeunloadEventListener&&removeEventListener("beforeunload",this._beforeunloadEventListener,!1),this._offlineEventListener)){const r=Ou.indexOf(this._offlineEventListener);r!==-1&&Ou.splice(r,1)}this.readyState="closed",this.id=null,this.emitReserved("close",t,n),this.writeBuffer=[],this._prevBufferLen=0}}}ii.protocol=q_;class RK extends ii{constructor(){super(...arguments),this._upgrades=[]}onOpen(){if(super.onOpen(),this.readyState==="open"&&this.opts.upgrade)for(let t=0;t<this._upgrades.length;t++)this._probe(this._upgrades[t])}_probe(t){let n=this.createTransport(t),r=!1;ii.priorWebsocketSuccess=!1;const i=()=>{r||(n.send([{type:"ping",data:"probe"}]),n.once("packet",f=>{if(!r)if(f.type==="pong"&&f.data==="probe"){if(this.upgrading=!0,this.emitReserved("upgrading",n),!n)return;ii.priorWebsocketSuccess=n.name==="websocket",this.transport.pause(()=>{r||this.readyState!=="closed"&&(c(),this.setTransport(n),n.send([{type:"upgrade"}]),this.emitReserved("upgrade",n),n=null,this.upgrading=!1,this.flush())})}else{const d=new Error("probe error");d.transport=n.name,this.emitReserved("upgradeError",d)}}))};function o(){r||(r=!0,c(),n.close(),n=null)}const a=f=>{const d=new Error("probe error: "+f);d.transport=n.name,o(),this.emitReserved("upgradeError",d)};function s(){a("transport closed")}function l(){a("socket closed")}function u(f){n&&f.name!==n.name&&o()}const c=()=>{n.removeListener("open",i),n.removeListener("error",a),n.removeListener("close",s),this.off("close",l),this.off("upgrading",u)};n.once("open",i),n.once("error",a),n.once("close",s),this.once("close",l),this.once("upgrading",u),this._upgrades.indexOf("webtransport")!==-1&&t!=="webtransport"?this.setTimeoutFn(()=>{r||n.open()},200):n.open()}onHandshake(t){this._upgrades=this._filterUpgrades(t.upgrades),super.onHandshake(t)}_filterUpgrades(t){const n=[];for(let r=0;r<t.length;r++)~this.transports.indexOf(t[r])&&n.push(t[r]);return n}}let LK=class extends RK{constructor(t,n={}){const r=typeof t=="object"?t:n;(!r.transports||r.transports&&typeof r.transports[0]=="string")&&(r.transports=(r.transports||["polling","websocket","webtransport"]).map(i=>TK[i]).filter(i=>!!i)),super(t,r)}};function zK(e,t="",n){let r=e;n=n||typeof location<"u"&&location,e==null&&(e=n.protocol+"//"+n.host),typeof e=="string"&&(e.charAt(0)==="/"&&(e.charAt(1)==="/"?e=n.protocol+e:e=n.host+e),/^(https?|wss?):\/\//.test(e)||(typeof n<"u"?e=n.protocol+"//"+e:e="https://"+e),r=sm(e)),r.port||(/^(http|ws)$/.test(r.protocol)?r.port="80":/^(http|ws)s$/.test(r.protocol)&&(r.port="443")),r.path=r.path||"/";const o=r.host.indexOf(":")!==-1?"["+r.host+"]":r.host;return r.id=r.protocol+"://"+o+":"+r.port+t,r.href=r.protocol+"://"+o+(n&&n.port===r.port?"":":"+r.port),r}const FK=typeof ArrayBuffer=="function",BK=e=>typeof ArrayBuffer.isView=="function"?ArrayBuffer.isView(e):e.buffer instanceof ArrayBuffer,eA=Object.prototype.toString,UK=typeof Blob=="function"||typeof Blob<"u"&&eA.call(Blob)==="[object BlobConstructor]",VK=typeof File=="function"||typeof File<"u"&&eA.call(File)==="[object FileConstructor]";function ay(e){return FK&&(e instanceof ArrayBuffer||BK(e))||UK&&e instanceof Blob||VK&&e instanceof File}function Eu(e,t){if(!e||typeof e!="object")return!1;if(Array.isArray(e)){for(let n=0,r=e.length;n<r;n++)if(Eu(e[n]))return!0;return!1}if(ay(e))return!0;if(e.toJSON&&typeof e.toJSON=="function"&&arguments.length===1)return Eu(e.toJSON(),!0);for(const n in e)if(Object.prototype.hasOwnProperty.call(e,n)&&Eu(e[n]))return!0;return!1}function HK(e){const t=[],n=e.data,r=e;return r.data=um(n,t),r.attachments=t.length,{packet:r,buffers:t}}function um(e,t){if(!e)return e;if(ay(e)){const n={_placeholder:!0,num:t.length};return t.push(e),n}else if(Array.isArray(e)){const n=new Array(e.length);for(let r=0;r<e.length;r++)n[r]=um(e[r],t);return n}else if(typeof e=="object"&&!(e instanceof Date)){const n={};for(const r in e)Object.prototype.hasOwnProperty.call(e,r)&&(n[r]=um(e[r],t));return n}return e}function KK(e,t){return e.data=cm(e.data,t),delete e.attachments,e}function cm(e,t){if(!e)return e;if(e&&e._placeholder===!0){if(typeof e.num=="number"&&e.num>=0&&e.num<t.length)return t[e.num];throw new Error("illegal attachments")}else if(Array.isArray(e))for(let n=0;n<e.length;n++)e[n]=cm(e[n],t);else if(typeof e=="object")for(const n in e)Object.prototype.hasOwnProperty.call(e,n)&&(e[n]=cm(e[n],t));return e}const tA=["connect","connect_error","disconnect","disconnecting","newListener","removeListener"],WK=5;var oe;(function(e){e[e.CONNECT=0]="CONNECT",e[e.DISCONNECT=1]="DISCONNECT",e[e.EVENT=2]="EVENT",e[e.ACK=3]="ACK",e[e.CONNECT_ERROR=4]="CONNECT_ERROR",e[e.BINARY_EVENT=5]="BINARY_EVENT",e[e.BINARY_ACK=6]="BINARY_ACK"})(oe||(oe={}));class YK{constructor(t){this.replacer=t}encode(t){return(t.type===oe.EVENT||t.type===oe.ACK)&&Eu(t)?this.encodeAsBinary({type:t.type===oe.EVENT?oe.BINARY_EVENT:oe.BINARY_ACK,nsp:t.nsp,data:t.data,id:t.id}):[this.encodeAsString(t)]}encodeAsString(t){let n=""+t.type;return(t.type===oe.BINARY_EVENT||t.type===oe.BINARY_ACK)&&(n+=t.attachments+"-"),t.nsp&&t.nsp!=="/"&&(n+=t.nsp+","),t.id!=null&&(n+=t.id),t.data!=null&&(n+=JSON.stringify(t.data,this.replacer)),n}encodeAsBinary(t){const n=HK(t),r=this.encodeAsString(n.packet),i=n.buffers;return i.unshift(r),i}}class sy extends Fe{constructor(t){super(),this.reviver=t}add(t){let n;if(typeof t=="string"){if(this.reconstructor)throw new Error("got plaintext data when reconstructing a packet");n=this.decodeString(t);const r=n.type===oe.BINARY_EVENT;r||n.type===oe.BINARY_ACK?(n.type=r?oe.EVENT:oe.ACK,this.reconstructor=new qK(n),n.attachments===0&&super.emitReserved("decoded",n)):super.emitReserved("decoded",n)}else if(ay(t)||t.base64)if(this.reconstructor)n=this.reconstructor.takeBinaryData(t),n&&(this.reconstructor=null,super.emitReserved("decoded",n));else throw new Error("got binary data when not reconstructing a packet");else throw new Error("Unknown type: "+t)}decodeString(t){let n=0;const r={type:Number(t.charAt(0))};if(oe[r.type]===void 0)throw new Error("unknown packet type "+r.type);if(r.type===oe.BINARY_EVENT||r.type===oe.BINARY_ACK){const o=n+1;for(;t.charAt(++n)!=="-"&&n!=t.length;);const a=t.substring(o,n);if(a!=Number(a)||t.charAt(n)!=="-")throw new Error("Illegal attachments");r.attachments=Number(a)}if(t.charAt(n+1)==="/"){const o=n+1;for(;++n&&!(t.charAt(n)===","||n===t.length););r.nsp=t.substring(o,n)}else r.nsp="/";const i=t.charAt(n+1);if(i!==""&&Number(i)==i){const o=n+1;for(;++n;){const a=t.charAt(n);if(a==null||Number(a)!=a){--n;break}if(n===t.length)break}r.id=Number(t.substring(o,n+1))}if(t.charAt(++n)){const o=this.tryParse(t.substr(n));if(sy.isPayloadValid(r.type,o))r.data=o;else throw new Error("invalid payload")}return r}tryParse(t){try{return JSON.parse(t,this.reviver)}catch{return!1}}static isPayloadValid(t,n){switch(t){case oe.CONNECT:return Hc(n);case oe.DISCONNECT:return n===void 0;case oe.CONNECT_ERROR:return typeof n=="string"||Hc(n);case oe.EVENT:case oe.BINARY_EVENT:return Array.isArray(n)&&(typeof n[0]=="number"||typeof n[0]=="string"&&tA.indexOf(n[0])===-1);case oe.ACK:case oe.BINARY_ACK:return Array.isArray(n)}}destroy(){this.reconstructor&&(this.reconstructor.finishedReconstruction(),this.reconstructor=null)}}class qK{constructor(t){this.packet=t,this.buffers=[],this.reconPack=t}takeBinaryData(t){if(this.buffers.push(t),this.buffers.length===this.reconPack.attachments){const n=KK(this.reconPack,this.buffers);return this.finishedReconstruction(),n}return null}finishedReconstruction(){this.reconPack=null,this.buffers=[]}}function GK(e){return typeof e=="string"}const XK=Number.isInteger||function(e){return typeof e=="number"&&isFinite(e)&&Math.floor(e)===e};function ZK(e){return e===void 0||XK(e)}function Hc(e){return Object.prototype.toString.call(e)==="[object Object]"}function QK(e,t){switch(e){case oe.CONNECT:return t===void 0||Hc(t);case oe.DISCONNECT:return t===void 0;case oe.EVENT:return Array.isArray(t)&&(typeof t[0]=="number"||typeof t[0]=="string"&&tA.indexOf(t[0])===-1);case oe.ACK:return Array.isArray(t);case oe.CONNECT_ERROR:return typeof t=="string"||Hc(t);default:return!1}}function JK(e){return GK(e.nsp)&&ZK(e.id)&&QK(e.type,e.data)}const eW=Object.freeze(Object.defineProperty({__proto__:null,Decoder:sy,Encoder:YK,get PacketType(){return oe},isPacketValid:JK,protocol:WK},Symbol.toStringTag,{value:"Module"}));function bn(e,t,n){return e.on(t,n),function(){e.off(t,n)}}const tW=Object.freeze({connect:1,connect_error:1,disconnect:1,disconnecting:1,newListener:1,removeListener:1});class nA extends Fe{constructor(t,n,r){super(),this.connected=!1,this.recovered=!1,this.receiveBuffer=[],this.sendBuffer=[],this._queue=[],this._queueSeq=0,this.ids=0,this.acks={},this.flags={},this.io=t,this.nsp=n,r&&r.auth&&(this.auth=r.auth),this._opts=Object.assign({},r),this.io._autoConnect&&this.open()}get disconnected(){return!this.connected}subEvents(){if(this.subs)return;const t=this.io;this.subs=[bn(t,"open",this.onopen.bind(this)),bn(t,"packet",this.onpacket.bind(this)),bn(t,"error",this.onerror.bind(this)),bn(t,"close",this.onclose.bind(this))]}get active(){return!!this.subs}connect(){return this.connected?this:(this.subEvents(),this.io._reconnecting||this.io.open(),this.io._readyState==="open"&&this.onopen(),this)}open(){return this.connect()}send(...t){return t.unshift("message"),this.emit.apply(this,t),this}emit(t,...n){var r,i,o;if(tW.hasOwnProperty(t))throw new Error('"'+t.toString()+'" is a reserved event name');if(n.unshift(t),this._opts.retries&&!this.flags.fromQueue&&!this.flags.volatile)return this._addToQueue(n),this;const a={type:oe.EVENT,data:n};if(a.options={},a.options.compress=this.flags.compress!==!1,typeof n[n.length-1]=="function"){const c=this.ids++,f=n.pop();this._registerAckCallback(c,f),a.id=c}const s=(i=(r=this.io.engine)===null||r===void 0?void 0:r.transport)===null||i===void 0?void 0:i.writable,l=this.connected&&!(!((o=this.io.engine)===null||o===void 0)&&o._hasPingExpired());return this.flags.volatile&&!s||(l?(this.notifyOutgoingListeners(a),this.packet(a)):this.sendBuffer.push(a)),this.flags={},this}_registerAckCallback(t,n){var r;const i=(r=this.flags.timeout)!==null&&r!==void 0?r:this._opts.ackTimeout;if(i===void 0){this.acks[t]=n;return}const o=this.io.setTimeoutFn(()=>{delete this.acks[t];for(let s=0;s<this.sendBuffer.length;s++)this.sendBuffer[s].id===t&&this.sendBuffer.splice(s,1);n.call(this,new Error("operation has timed out"))},i),a=(...s)=>{this.io.clearTimeoutFn(o),n.apply(this,s)};a.withError=!0,this.acks[t]=a}emitWithAck(t,...n){return new Promise((r,i)=>{const o=(a,s)=>a?i(a):r(s);o.withError=!0,n.push(o),this.emit(t,...n)})}_addToQueue(t){let n;typeof t[t.length-1]=="function"&&(n=t.pop());const r={id:this._queueSeq++,tryCount:0,pending:!1,args:t,flags:Object.assign({fromQueue:!0},this.flags)};t.push((i,...o)=>(this._queue[0],i!==null?r.tryCount>this._opts.retries&&(this._queue.shift(),n&&n(i)):(this._queue.shift(),n&&n(null,...o)),r.pending=!1,this._drainQueue())),this._queue.push(r),this._drainQueue()}_drainQueue(t=!1){if(!this.connected||this._queue.length===0)return;const n=this._queue[0];n.pending&&!t||(n.pending=!0,n.tryCount++,this.flags=n.flags,this.emit.apply(this,n.args))}packet(t){t.nsp=this.nsp,this.io._packet(t)}onopen(){typeof this.auth=="function"?this.auth(t=>{this._sendConnectPacket(t)}):this._sendConnectPacket(this.auth)}_sendConnectPacket(t){this.packet({type:oe.CONNECT,data:this._pid?Object.assign({pid:this._pid,offset:this._lastOffset},t):t})}onerror(t){this.connected||this.emitReserved("connect_error",t)}onclose(t,n){this.connected=!1,delete this.id,this.emitReserved("disconnect",t,n),this._clearAcks()}_clearAcks(){Object.keys(this.acks).forEach(t=>{if(!this.sendBuffer.some(r=>String(r.id)===t)){const r=this.acks[t];delete this.acks[t],r.withError&&r.call(this,new Error("socket has been disconnected"))}})}onpacket(t){if(t.nsp===this.nsp)switch(t.type){case oe.CONNECT:t.data&&t.data.sid?this.onconnect(t.data.sid,t.data.pid):this.emitReserved("connect_error",new Error("It seems you are trying to reach a Socket.IO server in v2.x with a v3.x client, but they are not compatible (more information here: https://socket.io/docs/v3/migrating-from-2-x-to-3-0/)"));break;case oe.EVENT:case oe.BINARY_EVENT:this.onevent(t);break;case oe.ACK:case oe.BINARY_ACK:this.onack(t);break;case oe.DISCONNECT:this.ondisconnect();break;case oe.CONNECT_ERROR:this.destroy();const r=new Error(t.data.message);r.data=t.data.data,this.emitReserved("connect_error",r);break}}onevent(t){const n=t.data||[];t.id!=null&&n.push(this.ack(t.id)),this.connected?this.emitEvent(n):this.receiveBuffer.push(Object.freeze(n))}emitEvent(t){if(this._anyListeners&&this._anyListeners.length){const n=this._anyListeners.slice();for(const r of n)r.apply(this,t)}super.emit.apply(this,t),this._pid&&t.length&&typeof t[t.length-1]=="string"&&(this._lastOffset=t[t.length-1])}ack(t){const n=this;let r=!1;return function(...i){r||(r=!0,n.packet({type:oe.ACK,id:t,data:i}))}}onack(t){const n=this.acks[t.id];typeof n=="function"&&(delete this.acks[t.id],n.withError&&t.data.unshift(null),n.apply(this,t.data))}onconnect(t,n){this.id=t,this.recovered=n&&this._pid===n,this._pid=n,this.connected=!0,this.emitBuffered(),this._drainQueue(!0),this.emitReserved("connect")}emitBuffered(){this.receiveBuffer.forEach(t=>this.emitEvent(t)),this.receiveBuffer=[],this.sendBuffer.forEach(t=>{this.notifyOutgoingListeners(t),this.packet(t)}),this.sendBuffer=[]}ondisconnect(){this.destroy(),this.onclose("io server disconnect")}destroy(){this.subs&&(this.subs.forEach(t=>t()),this.subs=void 0),this.io._destroy(this)}disconnect(){return this.connected&&this.packet({type:oe.DISCONNECT}),this.destroy(),this.connected&&this.onclose("io client disconnect"),this}close(){return this.disconnect()}compress(t){return this.flags.compress=t,this}get volatile(){return this.flags.volatile=!0,this}timeout(t){return this.flags.timeout=t,this}onAny(t){return this._anyListeners=this._anyListeners||[],this._anyListeners.push(t),this}prependAny(t){return this._anyListeners=this._anyListeners||[],this._anyListeners.unshift(t),this}offAny(t){if(!this._anyListeners)return this;if(t){const n=this._anyListeners;for(let r=0;r<n.length;r++)if(t===n[r])return n.splice(r,1),this}else this._anyListeners=[];return this}listenersAny(){return this._anyListeners||[]}onAnyOutgoing(t){return this._anyOutgoingListeners=this._anyOutgoingListeners||[],this._anyOutgoingListeners.push(t),this}prependAnyOutgoing(t){return this._anyOutgoingListeners=this._anyOutgoingListeners||[],this._anyOutgoingListeners.unshift(t),this}offAnyOutgoing(t){if(!this._anyOutgoingListeners)return this;if(t){const n=this._anyOutgoingListeners;for(let r=0;r<n.length;r++)if(t===n[r])return n.splice(r,1),this}else this._anyOutgoingListeners=[];return this}listenersAnyOutgoing(){return this._anyOutgoingListeners||[]}notifyOutgoingListeners(t){if(this._anyOutgoingListeners&&this._anyOutgoingListeners.length){const n=this._anyOutgoingListeners.slice();for(const r of n)r.apply(this,t.data)}}}function ga(e){e=e||{},this.ms=e.min||100,this.max=e.max||1e4,this.factor=e.factor||2,this.jitter=e.jitter>0&&e.jitter<=1?e.jitter:0,this.attempts=0}ga.prototype.duration=function(){var e=this.ms*Math.pow(this.factor,this.attempts++);if(this.jitter){var t=Math.random(),n=Math.floor(t*this.jitter*e);e=Math.floor(t*10)&1?e+n:e-n}return Math.min(e,this.max)|0};ga.prototype.reset=function(){this.attempts=0};ga.prototype.setMin=function(e){this.ms=e};ga.prototype.setMax=function(e){this.max=e};ga.prototype.setJitter=function(e){this.jitter=e};class fm extends Fe{constructor(t,n){var r;super(),this.nsps={},this.subs=[],t&&typeof t=="object"&&(n=t,t=void 0),n=n||{},n.path=n.path||"/socket.io",this.opts=n,od(this,n),this.reconnection(n.reconnection!==!1),this.reconnectionAttempts(n.reconnectionAttempts||1/0),this.reconnectionDelay(n.reconnectionDelay||1e3),this.reconnectionDelayMax(n.reconnectionDelayMax||5e3),this.randomizationFactor((r=n.randomizationFactor)!==null&&r!==void 0?r:.5),this.backoff=new ga({min:this.reconnectionDelay(),max:this.reconnectionDelayMax(),jitter:this.randomizationFactor()}),this.timeout(n.timeout==null?2e4:n.timeout),this._readyState="closed",this.uri=t;const i=n.parser||eW;this.encoder=new i.Encoder,this.decoder=new i.Decoder,this._autoConnect=n.autoConnect!==!1,this._autoConnect&&this.open()}reconnection(t){return arguments.length?(this._reconnection=!!t,t||(this.skipReconnect=!0),this):this._reconnection}reconnectionAttempts(t){return t===void 0?this._reconnectionAttempts:(this._reconnectionAttempts=t,this)}reconnectionDelay(t){var n;return t===void 0?this._reconnectionDelay:(this._reconnectionDelay=t,(n=this.backoff)===null||n===void 0||n.setMin(t),this)}randomizationFactor(t){var n;return t===void 0?this._randomizationFactor:(this._randomizationFactor=t,(n=this.backoff)===null||n===void 0||n.setJitter(t),this)}reconnectionDelayMax(t){var n;return t===void 0?this._reconnectionDelayMax:(this._reconnectionDelayMax=t,(n=this.backoff)===null||n===void 0||n.setMax(t),this)}timeout(t){return arguments.length?(this._timeout=t,this):this._timeout}maybeReconnectOnOpen(){!this._reconnecting&&this._reconnection&&this.backoff.attempts===0&&this.reconnect()}open(t){if(~this._readyState.indexOf("open"))return this;this.engine=new LK(this.uri,this.opts);const n=this.engine,r=this;this._readyState="opening",this.skipReconnect=!1;const i=bn(n,"open",function(){r.onopen(),t&&t()}),o=s=>{this.cleanup(),this._readyState="closed",this.emitReserved("error",s),t?t(s):this.maybeReconnectOnOpen()},a=bn(n,"error",o);if(this._timeout!==!1){const s=this._timeout,l=this.setTimeoutFn(()=>{i(),o(new Error("timeout")),n.close()},s);this.opts.autoUnref&&l.unref(),this.subs.push(()=>{this.clearTimeoutFn(l)})}return this.subs.push(i),this.subs.push(a),this}connect(t){return this.open(t)}onopen(){this.cleanup(),this._readyState="open",this.emitReserved("open");const t=this.engine;this.subs.push(bn(t,"ping",this.onping.bind(this)),bn(t,"data",this.ondata.bind(this)),bn(t,"error",this.onerror.bind(this)),bn(t,"close",this.onclose.bind(this)),bn(this.decoder,"decoded",this.ondecoded.bind(this)))}onping(){this.emitReserved("ping")}ondata(t){try{this.decoder.add(t)}catch(n){this.onclose("parse error",n)}}ondecoded(t){id(()=>{this.emitReserved("packet",t)},this.setTimeoutFn)}onerror(t){this.emitReserved("error",t)}socket(t,n){let r=this.nsps[t];return r?this._autoConnect&&!r.active&&r.connect():(r=new nA(this,t,n),this.nsps[t]=r),r}_destroy(t){const n=Object.keys(this.nsps);for(const r of n)if(this.nsps[r].active)return;this._close()}_packet(t){const n=this.encoder.encode(t);for(let r=0;r<n.length;r++)this.engine.write(n[r],t.options)}cleanup(){this.subs.forEach(t=>t()),this.subs.length=0,this.decoder.destroy()}_close(){this.skipReconnect=!0,this._reconnecting=!1,this.onclose("forced close")}disconnect(){return this._close()}onclose(t,n){var r;this.cleanup(),(r=this.engine)===null||r===void 0||r.close(),this.backoff.reset(),this._readyState="closed",this.emitReserved("close",t,n),this._reconnection&&!this.skipReconnect&&this.reconnect()}reconnect(){if(this._reconnecting||this.skipReconnect)return this;const t=this;if(this.backoff.attempts>=this._reconnectionAttempts)this.backoff.reset(),this.emitReserved("reconnect_failed"),this._reconnecting=!1;else{const n=this.backoff.duration();this._reconnecting=!0;const r=this.setTimeoutFn(()=>{t.skipReconnect||(this.emitReserved("reconnect_attempt",t.backoff.attempts),!t.skipReconnect&&t.open(i=>{i?(t._reconnecting=!1,t.reconnect(),this.emitReserved("reconnect_error",i)):t.onreconnect()}))},n);this.opts.autoUnref&&r.unref(),this.subs.push(()=>{this.clearTimeoutFn(r)})}}onreconnect(){const t=this.backoff.attempts;this._reconnecting=!1,this.backoff.reset(),this.emitReserved("reconnect",t)}}const Ra={};function ku(e,t){typeof e=="object"&&(t=e,e=void 0),t=t||{};const n=zK(e,t.path||"/socket.io"),r=n.source,i=n.id,o=n.path,a=Ra[i]&&o in Ra[i].nsps,s=t.forceNew||t["force new connection"]||t.multiplex===!1||a;let l;return s?l=new fm(r,t):(Ra[i]||(Ra[i]=new fm(r,t)),l=Ra[i]),n.query&&!t.query&&(t.query=n.queryKey),l.socket(n.path,t)}Object.assign(ku,{Manager:fm,Socket:nA,io:ku,connect:ku});const ab=window.location.origin;class nW{constructor(){wi(this,"socket",null);wi(this,"breathingRateCallbacks",[]);wi(this,"connected",!1)}connect(){var t;if((t=this.socket)!=null&&t.connected){console.log("[SocketService] Already connected");return}console.log("[SocketService] Connecting to",ab),this.socket=ku(ab,{transports:["websocket","polling"],reconnection:!0,reconnectionAttempts:5,reconnectionDelay:1e3}),this.socket.on("connect",()=>{console.log("[SocketService] Connected"),this.connected=!0}),this.socket.on("disconnect",()=>{console.log("[SocketService] Disconnected"),this.connected=!1}),this.socket.on("connected",n=>{console.log("[SocketService] Server acknowledged connection:",n)}),this.socket.on("breathing_rate_update",n=>{console.log("[SocketService] Breathing rate update:",n),this.breathingRateCallbacks.forEach(r=>r(n))}),this.socket.on("connect_error",n=>{console.error("[SocketService] Connection error:",n)})}disconnect(){this.socket&&(this.socket.disconnect(),this.socket=null,this.connected=!1,console.log("[SocketService] Disconnected"))}isConnected(){return this.connected}onBreathingRateUpdate(t){return this.breathingRateCallbacks.push(t),()=>{this.breathingRateCallbacks=this.breathingRateCallbacks.filter(n=>n!==t)}}}const sb=new nW,rW=({isOpen:e,onClose:t,topBarHeight:n,sphereWidth:r,containerWidth:i,containerHeight:o})=>{const[a,s]=m.useState([]),[l,u]=m.useState(null),[c,f]=m.useState(null),[d,p]=m.useState(null),[h,v]=m.useState(null),y=m.useRef(0);if(m.useEffect(()=>{e&&Promise.all([CT(),_T(),AT(),jT(),MT()]).then(([N,L,V,B,U])=>{s(N),y.current=N.length,u(L),f(V),p(B),v(U)})},[e]),m.useEffect(()=>{if(!e)return;sb.connect();const N=sb.onBreathingRateUpdate(L=>{s(V=>{const B={hour:0,minute:0,value:L.br,time:y.current.toString().padStart(2,"0"),timestamp:L.timestamp*1e3};y.current+=1;const U=[...V,B];return U.length>50?U.slice(-50):U})});return()=>{N()}},[e]),!e)return null;const g=E(1069,i),x=T(1759,o),w=E(57,i),S=T(400,o),P=E(100,i),O=E(12.5,i),k=E(104,i),j=E(4,i),M=E(9.37,i),A=E(54.11,i),C=T(2294-2159,o),_=E(587-591.5,i);return b.jsxs(iK,{delayDuration:200,children:[b.jsx("div",{className:"absolute inset-0 z-50",style:{backgroundColor:"rgba(0, 0, 0, 0.5)"},onClick:N=>{N.stopPropagation()}}),b.jsxs("div",{className:"absolute z-50 flex flex-col items-center",style:{left:`${w}px`,top:`${S}px`,width:`${g}px`},children:[b.jsxs("div",{className:"w-full flex flex-col relative",style:{borderRadius:`${P}px`,height:`${x}px`,background:"linear-gradient(330.9deg, rgba(255, 255, 255, 0.86) 67.56%, rgba(246, 237, 243, 0.86) 94.65%)",backdropFilter:`blur(${O}px)`,WebkitBackdropFilter:`blur(${O}px)`,overflow:"visible",position:"relative"},children:[b.jsx("div",{className:"flex-1",style:{height:"50%",paddingLeft:"16px",paddingTop:"16px",paddingBottom:"16px",paddingRight:0},children:a.length>0&&b.jsx(iU,{data:a,containerWidth:i,containerHeight:o})}),b.jsxs("div",{className:"flex-1 p-4",style:{height:"50%"},children:[b.jsxs("div",{className:"w-full h-full grid grid-cols-2 grid-rows-2 gap-4",children:[b.jsx("div",{className:"w-full h-full",style:{visibility:"hidden"}}),b.jsx("div",{className:"w-full h-full",style:{visibility:"hidden"}}),b.jsx("div",{className:"w-full h-full",style:{visibility:"hidden"}}),b.jsx("div",{className:"w-full h-full",style:{visibility:"hidden"}})]}),b.jsxs("div",{style:{position:"absolute",width:`${E(468,i)}px`,height:`${T(404,o)}px`,left:`${E(117-57,i)}px`,top:`${T(1275-400,o)}px`,background:"#F6EDF3",borderRadius:`${E(60,i)}px`,padding:`${E(16,i)}px`,display:"flex",flexDirection:"column"},children:[b.jsx("div",{style:{position:"absolute",width:`${E(106,i)}px`,height:`${T(106,o)}px`,left:`${E(36,i)}px`,top:`${T(36,o)}px`,display:"flex",alignItems:"center",justifyContent:"center",zIndex:1},children:b.jsx("img",{src:"/stress-level-icon.svg",alt:"压力水平图标",width:E(106,i),height:T(106,o),style:{objectFit:"contain"}})}),b.jsxs("div",{style:{position:"absolute",right:`${E(16,i)}px`,top:`${T(36+106/2,o)}px`,transform:"translateY(-50%)",display:"flex",alignItems:"center",gap:`${E(8,i)}px`,zIndex:1},children:[b.jsx("span",{style:{fontFamily:"OPPO Sans 4.0",fontWeight:500,fontStyle:"normal",fontSize:`${E(40,i)}px`,lineHeight:"100%",letterSpacing:"0%",textAlign:"right",color:"#262024"},children:"压力水平"}),b.jsxs(eu,{children:[b.jsx(tu,{asChild:!0,children:b.jsx("button",{style:{width:`${E(48,i)}px`,height:`${E(48,i)}px`,background:"transparent",border:"none",cursor:"pointer",padding:0,display:"flex",alignItems:"center",justifyContent:"center"},children:b.jsxs("svg",{width:E(48,i),height:E(48,i),viewBox:"0 0 24 24",fill:"none",xmlns:"http://www.w3.org/2000/svg",children:[b.jsx("circle",{cx:"12",cy:"12",r:"10",stroke:"#B5A6B0",strokeWidth:"2",fill:"none"}),b.jsx("path",{d:"M12 16V12M12 8H12.01",stroke:"#B5A6B0",strokeWidth:"2",strokeLinecap:"round"})]})})}),b.jsx(Ha,{side:"bottom",borderRadius:E(30,i),containerWidth:i,children:"压力指数是累积的压力指数，用于衡量生活中处理各种事情引起的心理压力，以及身体长期暴露在负面因素中造成的生理压力。压力指数偏高代表压力水平上升，压力指数偏低代表压力水平下降，压力指数过低也代表交感神经活性减弱。"})]})]}),l&&b.jsx("div",{style:{position:"absolute",left:`${E(16,i)}px`,right:`${E(16,i)}px`,top:`${T(162,o)}px`,bottom:`${T(62+96,o)}px`,display:"flex",alignItems:"center",justifyContent:"center",zIndex:0},children:b.jsx(Lw,{value:l.value,containerWidth:i,showOnlySVG:!0})}),l&&b.jsx("div",{style:{position:"absolute",left:`${E(48,i)}px`,bottom:`${T(48,o)}px`},children:b.jsx("span",{style:{fontFamily:"OPPO Sans 4.0",fontWeight:500,fontStyle:"normal",fontSize:`${E(96,i)}px`,lineHeight:"100%",letterSpacing:"0%",color:"#262024"},children:l.value})})]}),b.jsxs("div",{style:{position:"absolute",width:`${E(468,i)}px`,height:`${T(404,o)}px`,left:`${E(117-57+468+16,i)}px`,top:`${T(1275-400,o)}px`,background:"#F7F3F6",borderRadius:`${E(60,i)}px`,padding:`${E(16,i)}px`,display:"flex",flexDirection:"column"},children:[b.jsx("div",{style:{position:"absolute",width:`${E(74,i)}px`,height:`${T(74,o)}px`,left:`${E(36,i)}px`,top:`${T(36+106/2-74/2,o)}px`,display:"flex",alignItems:"center",justifyContent:"center",zIndex:1},children:b.jsx("img",{src:"/stress-recovery-icon.svg",alt:"压力调节恢复能力图标",width:E(74,i),height:T(74,o),style:{objectFit:"contain"}})}),b.jsxs("div",{style:{position:"absolute",right:`${E(16,i)}px`,top:`${T(36+106/2,o)}px`,transform:"translateY(-50%)",display:"flex",alignItems:"center",gap:`${E(8,i)}px`,zIndex:1},children:[b.jsxs("div",{style:{display:"flex",flexDirection:"column",alignItems:"flex-end",lineHeight:"100%"},children:[b.jsx("span",{style:{fontFamily:"OPPO Sans 4.0",fontWeight:500,fontStyle:"normal",fontSize:`${E(40,i)}px`,lineHeight:"100%",letterSpacing:"0%",textAlign:"right",color:"#262024"},children:"压力调节"}),b.jsx("span",{style:{fontFamily:"OPPO Sans 4.0",fontWeight:500,fontStyle:"normal",fontSize:`${E(40,i)}px`,lineHeight:"100%",letterSpacing:"0%",textAlign:"right",color:"#262024"},children:"恢复能力"})]}),b.jsxs(eu,{children:[b.jsx(tu,{asChild:!0,children:b.jsx("button",{style:{width:`${E(48,i)}px`,height:`${E(48,i)}px`,background:"transparent",border:"none",cursor:"pointer",padding:0,display:"flex",alignItems:"center",justifyContent:"center"},children:b.jsxs("svg",{width:E(48,i),height:E(48,i),viewBox:"0 0 24 24",fill:"none",xmlns:"http://www.w3.org/2000/svg",children:[b.jsx("circle",{cx:"12",cy:"12",r:"10",stroke:"#B5A6B0",strokeWidth:"2",fill:"none"}),b.jsx("path",{d:"M12 16V12M12 8H12.01",stroke:"#B5A6B0",strokeWidth:"2",strokeLinecap:"round"})]})})}),b.jsx(Ha,{side:"bottom",align:"end",borderRadius:E(30,i),containerWidth:i,children:"压力调节恢复能力提示信息"})]})]}),c&&b.jsx("div",{style:{position:"absolute",left:`${E(16,i)}px`,right:`${E(16,i)}px`,top:`${T(146,o)}px`,bottom:`${T(62+96,o)}px`,display:"flex",alignItems:"center",justifyContent:"center",zIndex:0},children:b.jsx(Lw,{value:c.value,containerWidth:i,showOnlySVG:!0})}),c&&b.jsx("div",{style:{position:"absolute",left:`${E(48,i)}px`,bottom:`${T(48,o)}px`},children:b.jsx("span",{style:{fontFamily:"OPPO Sans 4.0",fontWeight:500,fontStyle:"normal",fontSize:`${E(96,i)}px`,lineHeight:"100%",letterSpacing:"0%",color:"#262024"},children:c.value})})]}),b.jsxs("div",{style:{position:"absolute",width:`${E(468,i)}px`,height:`${T(404,o)}px`,left:`${E(117-57,i)}px`,top:`${T(1275-400+404+16,o)}px`,background:"#F7F3F6",borderRadius:`${E(60,i)}px`,padding:`${E(16,i)}px`,display:"flex",flexDirection:"column"},children:[b.jsx("div",{style:{position:"absolute",width:`${E(74,i)}px`,height:`${T(74,o)}px`,left:`${E(36,i)}px`,top:`${T(36,o)}px`,display:"flex",alignItems:"center",justifyContent:"center",zIndex:2},children:b.jsx("img",{src:"/automatic-balance-icon.svg",alt:"自主神经平衡图标",width:E(74,i),height:T(74,o),style:{objectFit:"contain"}})}),b.jsxs("div",{style:{position:"absolute",right:`${E(16,i)}px`,top:`${T(36+74/2,o)}px`,transform:"translateY(-50%)",display:"flex",alignItems:"center",gap:`${E(8,i)}px`,zIndex:1},children:[b.jsx("span",{style:{fontFamily:"OPPO Sans 4.0",fontWeight:500,fontStyle:"normal",fontSize:`${E(40,i)}px`,lineHeight:"100%",letterSpacing:"0%",textAlign:"right",color:"#262024"},children:"自主神经平衡"}),b.jsxs(eu,{children:[b.jsx(tu,{asChild:!0,children:b.jsx("button",{style:{width:`${E(48,i)}px`,height:`${E(48,i)}px`,background:"transparent",border:"none",cursor:"pointer",padding:0,display:"flex",alignItems:"center",justifyContent:"center"},children:b.jsxs("svg",{width:E(48,i),height:E(48,i),viewBox:"0 0 24 24",fill:"none",xmlns:"http://www.w3.org/2000/svg",children:[b.jsx("circle",{cx:"12",cy:"12",r:"10",stroke:"#B5A6B0",strokeWidth:"2",fill:"none"}),b.jsx("path",{d:"M12 16V12M12 8H12.01",stroke:"#B5A6B0",strokeWidth:"2",strokeLinecap:"round"})]})})}),b.jsx(Ha,{side:"bottom",borderRadius:E(30,i),containerWidth:i,children:"自主神经平衡提示信息"})]})]}),d&&b.jsx("div",{style:{position:"absolute",left:`${E(16,i)}px`,right:`${E(16,i)}px`,top:"50%",transform:`translateY(calc(-50% - ${T(10,o)}px))`,height:`${T(95,o)}px`,display:"flex",alignItems:"center",justifyContent:"center",zIndex:1},children:b.jsx("div",{style:{width:"100%",height:"100%",position:"relative"},children:b.jsx(zw,{title:"",value:d.value,decimalPlaces:1,minValue:.1,maxValue:5,valueFontSize:E(24,i),unitFontSize:E(6,i),containerWidth:i,showOnlySVG:!0})})}),d&&b.jsx("div",{style:{position:"absolute",left:`${E(48,i)}px`,bottom:`${T(48,o)}px`,zIndex:2},children:b.jsx("span",{style:{fontFamily:"OPPO Sans 4.0",fontWeight:500,fontStyle:"normal",fontSize:`${E(96,i)}px`,lineHeight:"100%",letterSpacing:"0%",color:"#262024"},children:d.value.toFixed(1)})})]}),b.jsxs("div",{style:{position:"absolute",width:`${E(468,i)}px`,height:`${T(404,o)}px`,left:`${E(117-57+468+16,i)}px`,top:`${T(1275-400+404+16,o)}px`,background:"#F6EDF3",borderRadius:`${E(60,i)}px`,padding:`${E(16,i)}px`,display:"flex",flexDirection:"column"},children:[b.jsx("div",{style:{position:"absolute",width:`${E(74,i)}px`,height:`${T(74,o)}px`,left:`${E(36,i)}px`,top:`${T(36,o)}px`,display:"flex",alignItems:"center",justifyContent:"center",zIndex:2},children:b.jsx("img",{src:"/automatic-neural-activity.svg",alt:"自主神经活性图标",width:E(74,i),height:T(74,o),style:{objectFit:"contain"}})}),b.jsxs("div",{style:{position:"absolute",right:`${E(16,i)}px`,top:`${T(36+74/2,o)}px`,transform:"translateY(-50%)",display:"flex",alignItems:"center",gap:`${E(8,i)}px`,zIndex:2},children:[b.jsx("span",{style:{fontFamily:"OPPO Sans 4.0",fontWeight:500,fontStyle:"normal",fontSize:`${E(40,i)}px`,lineHeight:"100%",letterSpacing:"0%",textAlign:"right",color:"#262024"},children:"自主神经活性"}),b.jsxs(eu,{children:[b.jsx(tu,{asChild:!0,children:b.jsx("button",{style:{width:`${E(48,i)}px`,height:`${E(48,i)}px`,background:"transparent",border:"none",cursor:"pointer",padding:0,display:"flex",alignItems:"center",justifyContent:"center"},children:b.jsxs("svg",{width:E(48,i),height:E(48,i),viewBox:"0 0 24 24",fill:"none",xmlns:"http://www.w3.org/2000/svg",children:[b.jsx("circle",{cx:"12",cy:"12",r:"10",stroke:"#B5A6B0",strokeWidth:"2",fill:"none"}),b.jsx("path",{d:"M12 16V12M12 8H12.01",stroke:"#B5A6B0",strokeWidth:"2",strokeLinecap:"round"})]})})}),b.jsx(Ha,{side:"bottom",align:"end",borderRadius:E(30,i),containerWidth:i,children:"自主神经活性提示信息"})]})]}),h&&b.jsx("div",{style:{position:"absolute",left:`${E(16,i)}px`,right:`${E(16,i)}px`,top:"50%",transform:`translateY(calc(-50% - ${T(10,o)}px))`,height:`${T(95,o)}px`,display:"flex",alignItems:"center",justifyContent:"center",zIndex:1},children:b.jsx("div",{style:{width:"100%",height:"100%",position:"relative"},children:b.jsx(zw,{title:"",value:h.value,valueFontSize:E(24,i),unitFontSize:E(6,i),containerWidth:i,showOnlySVG:!0})})}),h&&b.jsx("div",{style:{position:"absolute",left:`${E(48,i)}px`,bottom:`${T(48,o)}px`,zIndex:2},children:b.jsx("span",{style:{fontFamily:"OPPO Sans 4.0",fontWeight:500,fontStyle:"normal",fontSize:`${E(96,i)}px`,lineHeight:"100%",letterSpacing:"0%",color:"#262024"},children:h.value})})]})]})]}),b.jsxs("button",{onClick:t,className:"absolute cursor-pointer",style:{left:`calc(50% + ${_}px)`,bottom:`-${C}px`,width:`${k}px`,height:`${k}px`,background:"transparent",border:"none",outline:"none",transform:"translateX(-50%)"},children:[b.jsx("div",{className:"absolute rounded-full",style:{width:`${k}px`,height:`${k}px`,left:"50%",top:"50%",transform:"translate(-50%, -50%)",border:`${j}px solid #FBF7F9`,boxSizing:"border-box"}}),b.jsx("div",{className:"absolute",style:{width:`${M}px`,height:`${A}px`,left:"50%",top:"50%",transform:"translate(-50%, -50%) rotate(45deg)",transformOrigin:"center",background:"#D8CAD3"}}),b.jsx("div",{className:"absolute",style:{width:`${M}px`,height:`${A}px`,left:"50%",top:"50%",transform:"translate(-50%, -50%) rotate(-45deg)",transformOrigin:"center",background:"#D8CAD3"}})]})]})]})},iW=({weeklyEmotions:e,selectedDate:t,onDateSelect:n,containerWidth:r,containerHeight:i=2556})=>{const o=["日","一","二","三","四","五","六"],a=O=>{const k=new Date(O);return o[k.getDay()]},s=O=>new Date(O).getDate(),l=E(77,r),u=T(43,i),c=E(36,r),f=T(42,i),d="#B5A6B0",p="#82797F",h=E(954,r),v=T(93,i),y=-u,g=0,x=T(50,i),w=E(130,r),S=[E(0,r),E(146,r),E(292,r),E(438,r),E(585,r),E(731,r),E(877,r)],P=[l,l,l,E(78,r),l,l,l];return b.jsx("div",{className:"relative",style:{width:`${h}px`,height:`${v}px`,left:"50%",transform:"translateX(-50%)",marginTop:`${y}px`},children:e.map((O,k)=>{const j=O.date===t,M=a(O.date),A=s(O.date),C=S[k],_=P[k];return b.jsxs("button",{onClick:()=>n(O.date),className:"absolute cursor-pointer",style:{left:`${C}px`,top:0,width:`${_}px`,height:`${v}px`,background:"transparent",border:"none",outline:"none"},children:[j&&b.jsx("div",{className:"absolute rounded-full",style:{width:`${w}px`,height:`${w}px`,left:`calc(50% - ${w/2}px)`,top:`${(g+x)/2-w/2+T(20,i)}px`,background:"#CEDEF9",zIndex:0}}),b.jsx("div",{className:"absolute text-center",style:{width:`${_}px`,height:`${u}px`,left:0,top:`${g}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:500,fontSize:`${c}px`,lineHeight:`${f}px`,color:d,zIndex:10},children:M}),b.jsx("div",{className:"absolute text-center",style:{width:`${_}px`,height:`${u}px`,left:0,top:`${x}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:500,fontSize:`${c}px`,lineHeight:`${f}px`,color:p,zIndex:10},children:A}),j&&b.jsx("div",{className:"absolute rounded-full",style:{width:`${w}px`,height:`${w}px`,left:`calc(50% - ${w/2}px)`,top:`${(g+x)/2-w/2+T(20,i)}px`,background:"#CEDEF9",zIndex:0}})]},O.date)})})},oW=e=>{const t=parseInt(e.slice(1,3),16)/255,n=parseInt(e.slice(3,5),16)/255,r=parseInt(e.slice(5,7),16)/255,i=Math.max(t,n,r),o=Math.min(t,n,r),a=i-o;let s=0;return a!==0&&(i===t?s=(n-r)/a%6:i===n?s=(r-t)/a+2:s=(t-n)/a+4),s=Math.round(s*60),s<0&&(s+=360),s};class aW{constructor(t){wi(this,"seed");this.seed=t}hash(t,n){const r=Math.sin(t*12.9898+n*78.233+this.seed)*43758.5453;return r-Math.floor(r)}lerp(t,n,r){return t+r*(n-t)}smoothstep(t){return t*t*(3-2*t)}noise(t,n){const r=Math.floor(t),i=Math.floor(n),o=t-r,a=n-i,s=this.hash(r,i),l=this.hash(r+1,i),u=this.hash(r,i+1),c=this.hash(r+1,i+1),f=this.smoothstep(o),d=this.smoothstep(a);return this.lerp(this.lerp(s,l,f),this.lerp(u,c,f),d)}octaveNoise(t,n,r=4){let i=0,o=1,a=.02,s=0;for(let l=0;l<r;l++)i+=this.noise(t*a,n*a)*o,s+=o,o*=.5,a*=2;return i/s}}const sW=({emotion:e})=>{if(!e)return null;const t=m.useRef(null),n=m.useRef(),r=m.useRef(0),o={calm:"#8AD48A",joy:"#FFF2B2",low:"#CEDEF9",tense:"#FFD2D2"}[e],a=m.useMemo(()=>oW(o),[o]),s=m.useMemo(()=>{const u={calm:.5,joy:.7,low:.4,tense:.8}[e]||.6,c=Math.floor(Math.random()*1e3);return{intensity:u,seed:c}},[e]);return m.useEffect(()=>{const l=t.current;if(!l)return;const u=l.getContext("2d");if(!u)return;const c=()=>{const A=l.getBoundingClientRect();l.width=A.width*window.devicePixelRatio,l.height=A.height*window.devicePixelRatio,u.scale(window.devicePixelRatio,window.devicePixelRatio)};c(),window.addEventListener("resize",c);const f=new aW(s.seed),d=l.width/window.devicePixelRatio,p=l.height/window.devicePixelRatio,h=[{x:d*.3,y:p*.4,radius:d*.25,speed:.3},{x:d*.7,y:p*.6,radius:d*.3,speed:.4},{x:d*.5,y:p*.3,radius:d*.2,speed:.25},{x:d*.4,y:p*.7,radius:d*.22,speed:.35}],v=A=>{const C=Math.cos(A),_=Math.sin(A);return[[1,0,0],[0,C,-_],[0,_,C]]},y=A=>{const C=Math.cos(A),_=Math.sin(A);return[[C,0,_],[0,1,0],[-_,0,C]]},g=A=>{const C=Math.cos(A),_=Math.sin(A);return[[C,-_,0],[_,C,0],[0,0,1]]},x=(A,C)=>{const _=[[0,0,0],[0,0,0],[0,0,0]];for(let N=0;N<3;N++)for(let L=0;L<3;L++)for(let V=0;V<3;V++)_[N][L]+=A[N][V]*C[V][L];return _},w=(A,C)=>[C[0][0]*A[0]+C[0][1]*A[1]+C[0][2]*A[2],C[1][0]*A[0]+C[1][1]*A[1]+C[1][2]*A[2],C[2][0]*A[0]+C[2][1]*A[1]+C[2][2]*A[2]],S=(A,C=500)=>{const _=C/(C+A[2]);return[A[0]*_+d/2,A[1]*_+p/2]},P=()=>{const A=[],C=Math.min(d,p)*.3,_=10,N=Math.PI*(3-Math.sqrt(5));for(let L=0;L<_;L++){const V=1-L/(_-1)*2,B=Math.sqrt(1-V*V),U=N*L,$=f.octaveNoise(Math.cos(U)*.5,Math.sin(U)*.5,2),z=C*(.7+$*.6);A.push([z*Math.cos(U)*B,z*V,z*Math.sin(U)*B])}return A},O=A=>{const C=[],_=[0,0,0];A.forEach(N=>{_[0]+=N[0],_[1]+=N[1],_[2]+=N[2]}),_[0]/=A.length,_[1]/=A.length,_[2]/=A.length;for(let N=0;N<A.length;N++){const L=(N+1)%A.length,V=(N+2)%A.length;C.push([N,L,V])}for(let N=0;N<A.length;N+=2){const L=(N+3)%A.length;L!==N&&C.push([N,(N+1)%A.length,L])}return C},k=P(),j=O(k),M=A=>{r.current=A*.001,u.clearRect(0,0,d,p),u.save(),u.beginPath();const C=d/2,_=p/2,N=Math.min(d,p)/2,L=64,V=.02,B=N*.08;for(let Z=0;Z<=L;Z++){const D=Z/L*Math.PI*2,H=f.octaveNoise(Math.cos(D)*V+r.current*.2,Math.sin(D)*V+r.current*.2,3),q=N+(H-.5)*B,R=C+Math.cos(D)*q,G=_+Math.sin(D)*q;Z===0?u.moveTo(R,G):u.lineTo(R,G)}u.closePath(),u.clip();const U=r.current*.6,$=r.current*.7,z=r.current*.5;let K=x(v(U),y($));K=x(K,g(z));const re=k.map(Z=>w(Z,K)).map(Z=>({vec3:Z,screen:S(Z),z:Z[2]})),Se=j.map(Z=>({face:Z,avgZ:(re[Z[0]].z+re[Z[1]].z+re[Z[2]].z)/3})).sort((Z,D)=>Z.avgZ-D.avgZ),le=document.createElement("canvas");le.width=d,le.height=p;const se=le.getContext("2d");if(!se)return;Se.forEach(({face:Z,avgZ:D})=>{const H=re[Z[0]],q=re[Z[1]],R=re[Z[2]],G=[(q.vec3[1]-H.vec3[1])*(R.vec3[2]-H.vec3[2])-(q.vec3[2]-H.vec3[2])*(R.vec3[1]-H.vec3[1]),(q.vec3[2]-H.vec3[2])*(R.vec3[0]-H.vec3[0])-(q.vec3[0]-H.vec3[0])*(R.vec3[2]-H.vec3[2]),(q.vec3[0]-H.vec3[0])*(R.vec3[1]-H.vec3[1])-(q.vec3[1]-H.vec3[1])*(R.vec3[0]-H.vec3[0])],ee=Math.sqrt(G[0]**2+G[1]**2+G[2]**2);ee>0&&(G[0]/=ee,G[1]/=ee,G[2]/=ee);const te=[.3,.5,.8],ce=Math.sqrt(te[0]**2+te[1]**2+te[2]**2),ge=(G[0]*te[0]+G[1]*te[1]+G[2]*te[2])/ce,je=Math.max(.3,Math.min(1,.5+ge*.5));se.beginPath(),se.moveTo(H.screen[0],H.screen[1]),se.lineTo(q.screen[0],q.screen[1]),se.lineTo(R.screen[0],R.screen[1]),se.closePath();const Ve=(H.screen[0]+q.screen[0]+R.screen[0])/3,Ft=(H.screen[1]+q.screen[1]+R.screen[1])/3,Bt=se.createRadialGradient(Ve,Ft,0,Ve,Ft,Math.max(d,p)*.5);Bt.addColorStop(0,`hsla(${a}, 85%, 55%, ${.4*je})`),Bt.addColorStop(.5,`hsla(${a+10}, 85%, 55%, ${.25*je})`),Bt.addColorStop(1,`hsla(${a-10}, 85%, 55%, 0)`),se.fillStyle=Bt,se.fill()}),h.forEach((Z,D)=>{const H=Math.sin(r.current*Z.speed*1.5+D)*45,q=Math.cos(r.current*Z.speed*1.8+D)*45,R=Z.x+H,G=Z.y+q,ee=Z.radius+Math.sin(r.current*1+D)*30,te=se.createRadialGradient(R,G,0,R,G,ee);te.addColorStop(0,`hsla(${a}, 85%, 55%, 0.3)`),te.addColorStop(.5,`hsla(${a+10}, 85%, 55%, 0.2)`),te.addColorStop(1,`hsla(${a-10}, 85%, 55%, 0)`),se.fillStyle=te,se.beginPath(),se.arc(R,G,ee,0,Math.PI*2),se.fill()});const de=se.getImageData(0,0,d,p),ne=de.data;for(let Z=0;Z<p;Z++)for(let D=0;D<d;D++){const H=(Z*d+D)*4;if(ne[H+3]>0){const q=f.octaveNoise(D*.015+r.current*.6,Z*.015+r.current*.6,4);ne[H+3]=Math.min(255,ne[H+3]*(.6+q*.4))}}se.putImageData(de,0,0),u.filter="blur(20px)",u.drawImage(le,0,0),u.filter="blur(35px)",u.globalCompositeOperation="screen",h.forEach((Z,D)=>{const H=Math.sin(r.current*Z.speed*1+D)*50,q=Math.cos(r.current*Z.speed*1.2+D)*50,R=Z.x+H,G=Z.y+q,ee=u.createRadialGradient(R,G,0,R,G,Z.radius*1.8);ee.addColorStop(0,`hsla(${a}, 90%, 55%, 0.15)`),ee.addColorStop(1,`hsla(${a}, 90%, 55%, 0)`),u.fillStyle=ee,u.beginPath(),u.arc(R,G,Z.radius*1.8,0,Math.PI*2),u.fill()}),u.globalCompositeOperation="source-over",u.filter="none",u.restore(),n.current=requestAnimationFrame(M)};return n.current=requestAnimationFrame(M),()=>{window.removeEventListener("resize",c),n.current&&cancelAnimationFrame(n.current)}},[e,a,s]),b.jsx("div",{className:"w-full h-full relative flex items-center justify-center",style:{backgroundColor:"transparent",borderRadius:"50%",overflow:"hidden",aspectRatio:"1 / 1",maxWidth:"100%",maxHeight:"100%"},children:b.jsx("canvas",{ref:t,className:"absolute inset-0 w-full h-full",style:{borderRadius:"50%"}})})},lW=({isOpen:e,onClose:t,topBarHeight:n,sphereWidth:r,containerWidth:i,containerHeight:o,weeklyEmotions:a=[]})=>{const[s,l]=m.useState(a.length>0?a[a.length-1].date:"");if(m.useEffect(()=>{a.length>0&&!s&&l(a[a.length-1].date)},[a,s]),!e)return null;const u=E(1069,i),c=T(1759,o),f=E(57,i),d=T(400,o),p=E(100,i),h=E(12.5,i),v=E(104,i),y=E(4,i),g=E(9.37,i),x=E(54.11,i),w=T(2294-2159,o),S=E(587-591.5,i),P=a.find(k=>k.date===s),O=(P==null?void 0:P.emotion)||null;return b.jsxs(b.Fragment,{children:[b.jsx("div",{className:"absolute inset-0 z-50",style:{backgroundColor:"rgba(0, 0, 0, 0.5)"},onClick:k=>{k.stopPropagation()}}),b.jsxs("div",{className:"absolute z-50 flex flex-col items-center",style:{left:`${f}px`,top:`${d}px`,width:`${u}px`},children:[b.jsxs("div",{className:"w-full flex flex-col",style:{borderRadius:`${p}px`,height:`${c}px`,background:"linear-gradient(330.9deg, rgba(255, 255, 255, 0.86) 67.56%, rgba(246, 237, 243, 0.86) 94.65%)",backdropFilter:`blur(${h}px)`,WebkitBackdropFilter:`blur(${h}px)`},children:[b.jsx("div",{className:"flex-shrink-0 flex items-center justify-center",style:{position:"absolute",width:`${E(320,i)}px`,height:`${T(84,o)}px`,left:"50%",top:`${T(482-400,o)}px`,transform:"translateX(-50%)"},children:b.jsx("h2",{className:"text-center",style:{fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:500,fontSize:`${E(52,i)}px`,lineHeight:`${T(61,o)}px`,color:"#262024"},children:"我的情绪图谱"})}),b.jsx("div",{className:"flex-1 flex items-center justify-center p-4",style:{minHeight:0},children:b.jsx("div",{className:"w-full h-full max-w-full max-h-full",children:O?b.jsx(sW,{emotion:O}):b.jsx("div",{className:"w-full h-full flex items-center justify-center",style:{fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:400,fontSize:`${E(40,i)}px`,lineHeight:`${T(47,o)}px`,textAlign:"center",color:"#262024"},children:"当天暂无情绪图谱"})})}),b.jsx("div",{className:"flex-shrink-0",style:{position:"absolute",bottom:`${T(72,o)}px`,left:0,right:0},children:b.jsx(iW,{weeklyEmotions:a,selectedDate:s,onDateSelect:l,containerWidth:u,containerHeight:o})})]}),b.jsxs("button",{onClick:t,className:"absolute cursor-pointer",style:{left:`calc(50% + ${S}px)`,bottom:`-${w}px`,width:`${v}px`,height:`${v}px`,background:"transparent",border:"none",outline:"none",transform:"translateX(-50%)"},children:[b.jsx("div",{className:"absolute rounded-full",style:{width:`${v}px`,height:`${v}px`,left:"50%",top:"50%",transform:"translate(-50%, -50%)",border:`${y}px solid #FBF7F9`,boxSizing:"border-box"}}),b.jsx("div",{className:"absolute",style:{width:`${g}px`,height:`${x}px`,left:"50%",top:"50%",transform:"translate(-50%, -50%) rotate(45deg)",transformOrigin:"center",background:"#D8CAD3"}}),b.jsx("div",{className:"absolute",style:{width:`${g}px`,height:`${x}px`,left:"50%",top:"50%",transform:"translate(-50%, -50%) rotate(-45deg)",transformOrigin:"center",background:"#D8CAD3"}})]})]})]})},uW=({isOpen:e,onClose:t,topBarHeight:n,sphereWidth:r,containerWidth:i,containerHeight:o,onRecordClick:a})=>{const[s,l]=m.useState([]),[u,c]=m.useState(!1),[f,d]=m.useState(null);if(m.useEffect(()=>{e&&(c(!0),$T().then(Qe=>{l(Qe),c(!1)}))},[e]),m.useEffect(()=>{f&&fetch("http://127.0.0.1:7242/ingest/ac308b02-c703-4480-bd86-07d8769e1b61",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({sessionId:"debug-session",runId:"post-fix",hypothesisId:"breathing-detail-open",location:"ProfileModal.tsx:useEffect:selectedRecord",message:"Breathing record detail view opened",data:{id:f.id,duration:f.duration,score:f.score},timestamp:Date.now()})}).catch(()=>{})},[f]),!e)return null;const p=E(1069,i),h=T(1759,o),v=E(57,i),y=T(400,o),g=E(300,i),x=E(100,i),w=`${g}px ${x}px ${x}px ${x}px`,S=E(12.5,i),P=E(399,i),O=E(170-57,i),k=T(503-400,o),j=E(399.08,i),M=T(401.57,o),A=E(4,i),C=E(19,i),_=E(58.8,i),N=E(4,i),L=E(35,i),V=E(252,i),B=T(105,o),U=E(630-57,i),$=T(670-400,o),z=E(80,i),K="100%",X=E(630-57,i),re=T(766-400,o),Se=E(30,i),le=T(35,o),se=E(280,i),de=T(51,o),ne=E(630-57,i),Z=T(838-400,o),D=E(36,i),H=T(42,o),q=E(38,i),R=E(943-57,i),G=T(839-400,o),ee=E(37,i),te=U+V+E(10,i),ce=$,ge=E(956,i),je=T(1151,o),Ve=E(114-57,i),Ft=T(952-400,o),Bt=E(60,i),xi=E(6,i),ye=E(12,i),nn=E(27.8,i),Ir=E(322,i),io=T(105,o),oo=E(173-114,i),ya=T(1004-952,o),ao=E(48,i),dl=T(56,o),pl=E(900,i),xa=T(245,o),rA=T(122.5,o),iA=E(6,i),oA=E(12,i),aA=E(27.8,i),ly=E(141,i),sA=E(196-146,i),lA=T(1143-1091,o),uA=E(364-146,i),cA=T(1157-1091,o),fA=E(56,i),dA=T(66,o),pA=E(518-146,i),hA=T(1176-1091,o),ad=E(32,i),sd=T(38,o),mA=E(364-146,i),vA=T(1254-1091,o),hl=E(655-146,i),ml=T(1107-1091,o),gA=E(375,i),yA=T(214,o),xA=T(107,o),wA=E(758-146,i),bA=T(1141-1091,o),SA=E(128,i),PA=T(150,o),OA=E(917-146,i),EA=T(1228-1091,o),kA=E(922-146,i),CA=T(1144-1091,o),_A=E(30.26,i),AA=T(32.5,o),jA=E(146-114,i),uy=T(1091-952,o),MA=E(900,i),cy=T(20,o),fy=T(174,o),vl=E(104,i),TA=E(4,i),dy=E(9.37,i),py=E(54.11,i),$A=T(2294-2159,o),IA=E(587-591.5,i),NA=Qe=>{const Nr=Math.floor(Qe/60),hy=Qe%60;return`${Nr},${hy.toString().padStart(2,"0")}s`},DA=Qe=>{const Nr=new Date(Qe),RA=["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"][Nr.getMonth()],LA=Nr.getDate(),zA=Nr.getHours(),FA=Nr.getMinutes().toString().padStart(2,"0");return`${RA} ${LA}, ${zA}:${FA}`};return b.jsxs(b.Fragment,{children:[b.jsx("div",{className:"absolute inset-0 z-50",style:{backgroundColor:"rgba(0, 0, 0, 0.5)"},onClick:Qe=>{Qe.stopPropagation()}}),b.jsxs("div",{className:"absolute z-50 flex flex-col items-center",style:{left:`${v}px`,top:`${y}px`,width:`${p}px`},children:[b.jsxs("div",{className:"w-full flex flex-col overflow-hidden",style:{position:"relative",borderRadius:w,height:`${h}px`,background:"linear-gradient(330.9deg, rgba(255, 255, 255, 0.86) 67.56%, rgba(246, 237, 243, 0.86) 94.65%)",backdropFilter:`blur(${S}px)`,WebkitBackdropFilter:`blur(${S}px)`},children:[b.jsxs("div",{style:{position:"absolute",width:`${P}px`,height:`${P}px`,left:`${O}px`,top:`${k}px`,filter:`drop-shadow(${A}px ${C}px ${_}px rgba(57, 34, 35, 0.19))`},children:[b.jsx("div",{style:{position:"absolute",width:`${P}px`,height:`${P}px`,left:0,top:0,background:"#FFFFFF",borderRadius:"50%",boxShadow:`0px ${N}px ${L}px rgba(0, 0, 0, 0.12)`}}),b.jsx("img",{src:"/usr_photo.png",alt:"用户头像",style:{position:"absolute",width:`${j}px`,height:`${M}px`,left:0,top:0,borderRadius:"50%",objectFit:"cover"}})]}),b.jsx("h2",{style:{position:"absolute",width:`${V}px`,height:`${B}px`,left:`${U}px`,top:`${$}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:500,fontSize:`${z}px`,lineHeight:K,letterSpacing:"0%",color:"#262024",margin:0,padding:0},children:"小情绪"}),b.jsx("div",{style:{position:"absolute",width:`${ee}px`,height:`${ee}px`,left:`${te}px`,top:`${ce}px`},children:b.jsx("img",{src:"/gender-icon.svg",alt:"性别",style:{width:"100%",height:"100%",objectFit:"contain"}})}),b.jsx("div",{style:{position:"absolute",left:`${X}px`,top:`${re}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:400,fontSize:`${Se}px`,lineHeight:`${le}px`,color:"#82797F",whiteSpace:"nowrap"},children:"ID：8888888888"}),b.jsx("div",{style:{position:"absolute",width:`${se}px`,height:`${de}px`,left:`${ne}px`,top:`${Z}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:400,fontSize:`${D}px`,lineHeight:`${H}px`,color:"#262024"},children:"还什么都没写……"}),b.jsx("div",{style:{position:"absolute",width:`${q}px`,height:`${q}px`,left:`${R}px`,top:`${G}px`,cursor:"pointer"},children:b.jsx("img",{src:"/edit-icon.svg",alt:"编辑",style:{width:"100%",height:"100%",objectFit:"contain"}})}),b.jsxs("div",{className:"flex flex-col overflow-hidden",style:{position:"absolute",width:`${ge}px`,height:`${je}px`,left:`${Ve}px`,top:`${Ft}px`,background:"#F6EDF3",boxShadow:`${xi}px ${ye}px ${nn}px rgba(0, 0, 0, 0.1)`,borderRadius:`${Bt}px`},children:[b.jsx("h3",{style:{position:"absolute",width:`${Ir}px`,height:`${io}px`,left:`${oo}px`,top:`${ya}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:500,fontSize:`${ao}px`,lineHeight:`${dl}px`,color:"#82797F"},children:"呼吸训练日志"}),b.jsxs("div",{style:{position:"absolute",left:`${jA}px`,top:`${uy}px`,width:`${MA}px`,height:`calc(100% - ${uy+T(20,o)}px)`,overflowY:"auto",overflowX:"hidden"},children:[u?b.jsx("div",{className:"flex items-center justify-center py-8 text-gray-400",children:"加载中..."}):s.length===0?b.jsx("div",{className:"flex items-center justify-center py-8 text-gray-400",children:"暂无记录"}):b.jsxs("div",{style:{position:"relative",width:"100%"},children:[s.map((Qe,Nr)=>b.jsxs("div",{style:{position:"absolute",width:`${pl}px`,height:`${xa}px`,left:0,top:`${Nr*(xa+cy)}px`,background:"#F7F3F6",boxShadow:`${iA}px ${oA}px ${aA}px rgba(0, 0, 0, 0.06)`,borderRadius:`${rA}px`,cursor:"pointer"},onClick:()=>{fetch("http://127.0.0.1:7242/ingest/ac308b02-c703-4480-bd86-07d8769e1b61",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({sessionId:"debug-session",runId:"pre-fix",hypothesisId:"breathing-item-click",location:"ProfileModal.tsx:recordItem:onClick",message:"Breathing record item clicked",data:{id:Qe.id,duration:Qe.duration,score:Qe.score},timestamp:Date.now()})}).catch(()=>{}),d(Qe),a&&a(Qe)},children:[b.jsx("div",{style:{position:"absolute",width:`${ly}px`,height:`${ly}px`,left:`${sA}px`,top:`${lA}px`,display:"flex",alignItems:"center",justifyContent:"center"},children:b.jsx("img",{src:"/breathing-icon.svg",alt:"呼吸训练图标",style:{width:"100%",height:"100%",objectFit:"contain"}})}),b.jsx("div",{style:{position:"absolute",left:`${uA}px`,top:`${cA}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:400,fontSize:`${fA}px`,lineHeight:`${dA}px`,color:"#82797F"},children:NA(Qe.duration)}),b.jsx("div",{style:{position:"absolute",left:`${pA}px`,top:`${hA}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:400,fontSize:`${ad}px`,lineHeight:`${sd}px`,color:"#B5A6B0"},children:"时长"}),b.jsx("div",{style:{position:"absolute",left:`${mA}px`,top:`${vA}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:400,fontSize:`${ad}px`,lineHeight:`${sd}px`,color:"#B5A6B0"},children:DA(Qe.timestamp)}),b.jsxs("div",{style:{position:"absolute",width:`${gA}px`,height:`${yA}px`,left:`${hl}px`,top:`${ml}px`,background:"#FFFFFF",borderRadius:`${xA}px`},children:[b.jsx("div",{style:{position:"absolute",left:`${wA-hl}px`,top:`${bA-ml}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:300,fontSize:`${SA}px`,lineHeight:`${PA}px`,color:"#82797F"},children:Qe.score}),b.jsx("div",{style:{position:"absolute",left:`${OA-hl}px`,top:`${EA-ml}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:400,fontSize:`${ad}px`,lineHeight:`${sd}px`,color:"#82797F"},children:"分"}),b.jsx("div",{style:{position:"absolute",width:`${_A}px`,height:`${AA}px`,left:`${kA-hl}px`,top:`${CA-ml}px`,transform:"rotate(-12.69deg)"},children:b.jsx("svg",{width:"100%",height:"100%",viewBox:"0 0 30 33",fill:"none",xmlns:"http://www.w3.org/2000/svg",children:b.jsx("path",{d:"M15 2L28 17H19V31H11V17H2L15 2Z",fill:"#56CD6E",stroke:"#56CD6E",strokeWidth:"2"})})})]})]},Qe.id)),b.jsx("div",{style:{height:`${s.length*(xa+cy)}px`}})]}),b.jsx("div",{style:{position:"sticky",bottom:0,left:0,width:"100%",height:`${fy}px`,background:"linear-gradient(180deg, rgba(246, 237, 243, 0) 0%, #F6EDF3 74.04%)",pointerEvents:"none",zIndex:10,marginTop:`-${fy}px`}})]}),s.length>3&&b.jsx("div",{className:"relative -mb-4 h-8 pointer-events-none",style:{background:"linear-gradient(to top, rgba(255, 255, 255, 0.6) 0%, transparent 100%)",marginTop:"-32px"}})]})]}),b.jsxs("button",{onClick:t,className:"absolute cursor-pointer",style:{left:`calc(50% + ${IA}px)`,bottom:`-${$A}px`,width:`${vl}px`,height:`${vl}px`,background:"transparent",border:"none",outline:"none",transform:"translateX(-50%)"},children:[b.jsx("div",{className:"absolute rounded-full",style:{width:`${vl}px`,height:`${vl}px`,left:"50%",top:"50%",transform:"translate(-50%, -50%)",border:`${TA}px solid #FBF7F9`,boxSizing:"border-box"}}),b.jsx("div",{className:"absolute",style:{width:`${dy}px`,height:`${py}px`,left:"50%",top:"50%",transform:"translate(-50%, -50%) rotate(45deg)",transformOrigin:"center",background:"#D8CAD3"}}),b.jsx("div",{className:"absolute",style:{width:`${dy}px`,height:`${py}px`,left:"50%",top:"50%",transform:"translate(-50%, -50%) rotate(-45deg)",transformOrigin:"center",background:"#D8CAD3"}})]})]})]})},po=["呼吸率","压力水平","自主神经活性","自主神经平衡","压力调节恢复能力"],cW=e=>{const t=e/100,n=r=>Math.max(.25,Math.min(1,r));return[n(t+.1),n(t-.05),n(t+.05),n(t),n(t+.02)]},lb=(e,t,n,r)=>{const i=Math.PI*2/e.length;let o="";return e.forEach((a,s)=>{const l=-Math.PI/2+s*i,u=t*a,c=n+u*Math.cos(l),f=r+u*Math.sin(l);o+=`${s===0?"M":"L"} ${c} ${f} `}),o+="Z",o},fW=({isOpen:e,onClose:t,record:n,topBarHeight:r,sphereWidth:i,containerWidth:o,containerHeight:a})=>{if(!e||!n)return null;const s=E(1069,o),l=T(1759,a),u=E(57,o),c=T(400,a),f=E(300,o),d=E(100,o),p=`${f}px ${d}px ${d}px ${d}px`,h=E(12.5,o),v=E(151,o),y=E(172-57,o),g=T(509-400,a),x=E(4,o),w=E(35,o),S=E(320,o),P=T(84,a),O=E(430-57,o),k=T(555-400,a),j=E(52,o),M=T(61,a),A=E(187,o),C=T(173,a),_=E(496-57,o),N=T(745-400,a),L=E(140,o),V=T(164,a),B=E(56,o),U=T(42,a),$=E(683-57,o),z=T(844-400,a),K=E(32,o),X=T(38,a),re=E(700,o),Se=T(76,a),le=E(240-57,o),se=T(923-400,a),de=E(40,o),ne=T(47,a),Z=T(1206-400-100,a),D=E(104,o),H=E(4,o),q=E(9.37,o),R=E(54.11,o),G=T(2294-2159,a),ee=E(587-591.5,o);return m.useEffect(()=>{fetch("http://127.0.0.1:7242/ingest/ac308b02-c703-4480-bd86-07d8769e1b61",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({sessionId:"debug-session",runId:"post-fix",hypothesisId:"breathing-report-open",location:"BreathingReportModal.tsx:useEffect:open",message:"Breathing report modal opened",data:{id:n.id,score:n.score,duration:n.duration},timestamp:Date.now()})}).catch(()=>{})},[n]),b.jsxs(b.Fragment,{children:[b.jsx("div",{className:"absolute inset-0 z-50",style:{backgroundColor:"rgba(0, 0, 0, 0.5)"},onClick:te=>{te.stopPropagation()}}),b.jsxs("div",{className:"absolute z-50 flex flex-col items-center",style:{left:`${u}px`,top:`${c}px`,width:`${s}px`},children:[b.jsxs("div",{className:"w-full flex flex-col overflow-hidden",style:{borderRadius:p,height:`${l}px`,background:"rgba(246, 237, 243, 0.86)",backdropFilter:`blur(${h}px)`,WebkitBackdropFilter:`blur(${h}px)`},children:[b.jsx("button",{onClick:t,style:{position:"absolute",width:`${v}px`,height:`${v}px`,left:`${y}px`,top:`${g}px`,background:"#FFFFFF",boxShadow:`0px ${x}px ${w}px rgba(0, 0, 0, 0.12)`,borderRadius:"50%",border:"none",cursor:"pointer",display:"flex",alignItems:"center",justifyContent:"center",zIndex:10},children:b.jsx("svg",{width:"60%",height:"60%",viewBox:"0 0 24 24",fill:"none",xmlns:"http://www.w3.org/2000/svg",children:b.jsx("path",{d:"M15 18L9 12L15 6",stroke:"#262024",strokeWidth:"2.5",strokeLinecap:"round",strokeLinejoin:"round"})})}),b.jsx("div",{style:{position:"absolute",width:`${S}px`,height:`${P}px`,left:`${O}px`,top:`${k}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:500,fontSize:`${j}px`,lineHeight:`${M}px`,textAlign:"center",color:"#262024"},children:"呼吸训练报告"}),b.jsx("div",{style:{position:"absolute",width:`${A}px`,height:`${C}px`,left:`${_}px`,top:`${N}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:300,fontSize:`${L}px`,lineHeight:`${V}px`,textAlign:"center",color:"#262024"},children:n.score}),b.jsx("div",{style:{position:"absolute",width:`${B}px`,height:`${U}px`,left:`${$}px`,top:`${z}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:400,fontSize:`${K}px`,lineHeight:`${X}px`,color:"#82797F"},children:"分"}),b.jsx("div",{style:{position:"absolute",width:`${re}px`,height:`${Se}px`,left:`${le}px`,top:`${se}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:400,fontSize:`${de}px`,lineHeight:`${ne}px`,textAlign:"center",color:"#262024"},children:"你的状态很好，继续保持吧～"}),b.jsx("div",{style:{position:"absolute",left:"50%",top:`${Z}px`,transform:"translateX(-50%)",width:"100%",maxWidth:"320px",paddingLeft:`${E(40,o)}px`,paddingRight:`${E(40,o)}px`},children:b.jsxs("svg",{viewBox:"0 0 200 200",className:"w-full",children:[b.jsx("defs",{}),[.25,.5,.75,1].map((te,ce)=>b.jsx("path",{d:lb(new Array(po.length).fill(te),70,100,100),fill:"none",stroke:"rgba(209, 213, 219, 0.7)",strokeWidth:ce===3?1.2:.6},te)),po.map((te,ce)=>{const ge=-Math.PI/2+ce*(Math.PI*2/po.length),je=100+70*Math.cos(ge),Ve=100+70*Math.sin(ge);return b.jsx("line",{x1:"100",y1:"100",x2:je,y2:Ve,stroke:"rgba(209, 213, 219, 0.7)",strokeWidth:"0.8"},ce)}),po.map((te,ce)=>{const ge=-Math.PI/2+ce*(Math.PI*2/po.length);let je=86,Ve=100+je*Math.cos(ge),Ft=100+je*Math.sin(ge);const Bt=te==="压力调节恢复能力",xi=te==="压力水平",ye=T(42,a);(Bt||xi)&&(je=86,Ve=100+je*Math.cos(ge),Ft=100+je*Math.sin(ge),Ft+=ye*2);const nn=te==="压力调节恢复能力",Ir=nn?["压力调节","恢复能力"]:[te];return b.jsx("g",{children:Ir.map((io,oo)=>{const ya=nn?(oo-.5)*ye:0;return b.jsx("text",{x:Ve,y:Ft+ya,textAnchor:"middle",dominantBaseline:"middle",fill:"#82797F",style:{fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontWeight:500,fontStyle:"normal",fontSize:`${E(36,o)}px`,lineHeight:`${ye}px`,textAlign:"center"},children:io},oo)})},te)}),(()=>{const te=cW(n.score),ce=lb(te,70,100,100),ge=Math.PI*2/po.length;return b.jsxs(b.Fragment,{children:[b.jsx("path",{d:ce,fill:"rgba(194, 227, 255, 0.61)",stroke:"#60A5FA",strokeWidth:"2",strokeLinejoin:"round"}),te.map((je,Ve)=>{const Ft=-Math.PI/2+Ve*ge,Bt=70*je,xi=100+Bt*Math.cos(Ft),ye=100+Bt*Math.sin(Ft),nn=E(22.92,o),Ir=E(4,o);return b.jsx("circle",{cx:xi,cy:ye,r:nn/2,fill:"#F6EDF3",stroke:"#6CAADF",strokeWidth:Ir},Ve)})]})})()]})})]}),b.jsxs("button",{onClick:t,className:"absolute cursor-pointer",style:{left:`calc(50% + ${ee}px)`,bottom:`-${G}px`,width:`${D}px`,height:`${D}px`,background:"transparent",border:"none",outline:"none",transform:"translateX(-50%)"},children:[b.jsx("div",{className:"absolute rounded-full",style:{width:`${D}px`,height:`${D}px`,left:"50%",top:"50%",transform:"translate(-50%, -50%)",border:`${H}px solid #FBF7F9`,boxSizing:"border-box"}}),b.jsx("div",{className:"absolute",style:{width:`${q}px`,height:`${R}px`,left:"50%",top:"50%",transform:"translate(-50%, -50%) rotate(45deg)",transformOrigin:"center",background:"#D8CAD3"}}),b.jsx("div",{className:"absolute",style:{width:`${q}px`,height:`${R}px`,left:"50%",top:"50%",transform:"translate(-50%, -50%) rotate(-45deg)",transformOrigin:"center",background:"#D8CAD3"}})]})]})]})},dW=({preloadedData:e,containerWidth:t,containerHeight:n})=>{const[r,i]=m.useState((e==null?void 0:e.currentEmotionData)||{emotion:"calm",timestamp:new Date().toISOString()}),[o,a]=m.useState((e==null?void 0:e.weeklyEmotions)||[]),[s,l]=m.useState((e==null?void 0:e.selectedDate)||""),[u,c]=m.useState((e==null?void 0:e.hourlyEmotions)||[]),[f,d]=m.useState(!e),[p,h]=m.useState(!1),[v,y]=m.useState(!1),[g,x]=m.useState(!1),[w,S]=m.useState(!1),[P,O]=m.useState(null),[k,j]=m.useState(300),M=m.useRef(null),A=m.useRef(null),C=m.useRef(null);m.useEffect(()=>{e?(i(e.currentEmotionData),a(e.weeklyEmotions),l(e.selectedDate),c(e.hourlyEmotions),d(!1),fetch("http://127.0.0.1:7242/ingest/ac308b02-c703-4480-bd86-07d8769e1b61",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({sessionId:"debug-session",runId:"pre-fix",hypothesisId:"preloaded-data",location:"MainPage.tsx:useEffect:initFromPreloaded",message:"Initialized MainPage from preloadedData",data:{hasPreloaded:!!e,weeklyCount:e.weeklyEmotions.length,selectedDate:e.selectedDate,hourlyCount:e.hourlyEmotions.length},timestamp:Date.now()})}).catch(()=>{})):(d(!0),d(!1))},[e]),m.useEffect(()=>{s&&!f&&EP(s).then(c)},[s,f]),m.useEffect(()=>{C.current&&j(C.current.offsetWidth)},[o,r,t]);const _=N=>{l(N)};return b.jsxs("div",{className:"absolute inset-0 overflow-hidden flex flex-col",children:[b.jsx("div",{className:"absolute inset-0",style:{backgroundImage:"url(/load.png)",backgroundSize:"cover",backgroundPosition:"center",backgroundRepeat:"no-repeat"}}),f?b.jsx("div",{className:"relative z-0 min-h-full pb-8",children:b.jsx(O0,{})}):b.jsxs(b.Fragment,{children:[b.jsxs("div",{className:"relative z-0 flex flex-col",style:{background:"linear-gradient(to bottom, transparent 0%, white 50%)",height:`${T(1541,n)}px`},children:[b.jsx("div",{className:"relative",style:{width:"100%",height:"100%"},children:b.jsx(O0,{onIconClick:()=>h(!0),onAvatarClick:()=>x(!0),containerWidth:t,containerHeight:n})}),b.jsx("div",{className:"absolute left-1/2 -translate-x-1/2 flex items-center justify-center",style:{width:`${E(836,t)}px`,height:`${E(836,t)}px`,top:`${T(475,n)}px`},children:b.jsx("div",{ref:C,className:"w-full h-full flex items-center justify-center",children:b.jsx(IT,{emotion:r.emotion,timestamp:r.timestamp})})}),b.jsx("div",{className:"absolute left-1/2 -translate-x-1/2 flex items-center justify-center",style:{width:`${E(700,t)}px`,height:`${T(156,n)}px`,top:`${T(1375,n)}px`},children:b.jsx("div",{className:"text-center",style:{fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:400,fontSize:`${E(40,t)}px`,lineHeight:`${T(47,n)}px`,textAlign:"center",color:"#262024"},children:"深呼吸，把这一刻收藏起来。"})})]}),b.jsxs("div",{className:"absolute left-0 right-0 flex flex-col pb-4 gap-4",style:{top:`${T(1541,n)}px`,overflow:"visible",backgroundColor:"#FFFFFF"},children:[o.length>0&&b.jsx("div",{ref:M,className:"flex-shrink-0",children:b.jsx(DT,{weeklyEmotions:o,selectedDate:s,onDateSelect:_,onAtlasButtonClick:()=>{console.log("Atlas button clicked in MainPage"),y(!0)},containerWidth:t,containerHeight:n})}),s&&b.jsx("div",{ref:A,className:"flex-shrink-0",children:b.jsx(RT,{hourlyEmotions:u,selectedDate:s,containerWidth:t,containerHeight:n})})]})]}),b.jsx(rW,{isOpen:p,onClose:()=>h(!1),topBarHeight:T(80,n),sphereWidth:k,containerWidth:t,containerHeight:n}),b.jsx(lW,{isOpen:v,onClose:()=>y(!1),topBarHeight:T(80,n),sphereWidth:k,containerWidth:t,containerHeight:n,weeklyEmotions:o}),b.jsx(uW,{isOpen:g,onClose:()=>x(!1),topBarHeight:T(80,n),sphereWidth:k,containerWidth:t,containerHeight:n,onRecordClick:N=>{O(N),S(!0)}}),b.jsx(fW,{isOpen:w&&!!P,onClose:()=>S(!1),topBarHeight:T(80,n),sphereWidth:k,containerWidth:t,containerHeight:n,record:P})]})};function pW(){const e=NT(),[t,n]=m.useState(!1),[r,i]=m.useState(null),o=async()=>{fetch("http://127.0.0.1:7242/ingest/ac308b02-c703-4480-bd86-07d8769e1b61",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({sessionId:"debug-session",runId:"pre-fix",hypothesisId:"login-flow",location:"App.tsx:handleLoginStart:beforeFetch",message:"Starting login prefetch",data:{},timestamp:Date.now()})}).catch(()=>{});const[a,s]=await Promise.all([OT(),ET()]),l=new Date().toISOString().split("T")[0],c=s.find(d=>d.date===l)?l:s.length>0?s[s.length-1].date:"";let f=[];c&&(f=await EP(c)),i({currentEmotionData:a,weeklyEmotions:s,selectedDate:c,hourlyEmotions:f}),fetch("http://127.0.0.1:7242/ingest/ac308b02-c703-4480-bd86-07d8769e1b61",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({sessionId:"debug-session",runId:"pre-fix",hypothesisId:"login-flow",location:"App.tsx:handleLoginStart:afterPrefetch",message:"Finished login prefetch",data:{hasCurrentEmotion:!!a,weeklyCount:s.length,defaultDate:c,hasHourly:f.length>0},timestamp:Date.now()})}).catch(()=>{})};return b.jsx("div",{className:"fixed inset-0 bg-gray-200",style:{display:"flex",alignItems:"center",justifyContent:"center"},children:b.jsx("div",{className:"relative overflow-hidden",style:{width:`${e.width}px`,height:`${e.height}px`,backgroundColor:"#fff",maxWidth:"100vw",maxHeight:"100vh",flexShrink:0},children:b.jsx("div",{className:"w-full h-full relative overflow-hidden",children:t?b.jsx(dW,{preloadedData:r,containerWidth:e.width,containerHeight:e.height}):b.jsx(vT,{onLoginStart:o,onLoginComplete:()=>n(!0)})})})})}cp.createRoot(document.getElementById("root")).render(b.jsx(xb.StrictMode,{children:b.jsx(pW,{})}));
+ */var ul=m;function aB(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var sB=typeof Object.is=="function"?Object.is:aB,lB=ul.useSyncExternalStore,uB=ul.useRef,cB=ul.useEffect,fB=ul.useMemo,dB=ul.useDebugValue;oB.useSyncExternalStoreWithSelector=function(e,t,n,r,i){var o=uB(null);if(o.current===null){var a={hasValue:!1,value:null};o.current=a}else a=o.current;o=fB(function(){function l(p){if(!u){if(u=!0,c=p,p=r(p),i!==void 0&&a.hasValue){var h=a.value;if(i(h,p))return f=h}return f=p}if(h=f,sB(c,p))return h;var v=r(p);return i!==void 0&&i(h,v)?(c=p,h):(c=p,f=v)}var u=!1,c,f,d=n===void 0?null:n;return[function(){return l(t())},d===null?void 0:function(){return l(d())}]},[t,n,r,i]);var s=lB(e,o[0],o[1]);return cB(function(){a.hasValue=!0,a.value=s},[s]),dB(s),s};function pB(e){e()}function hB(){let e=null,t=null;return{clear(){e=null,t=null},notify(){pB(()=>{let n=e;for(;n;)n.callback(),n=n.next})},get(){const n=[];let r=e;for(;r;)n.push(r),r=r.next;return n},subscribe(n){let r=!0;const i=t={callback:n,next:null,prev:t};return i.prev?i.prev.next=i:e=i,function(){!r||e===null||(r=!1,i.next?i.next.prev=i.prev:t=i.prev,i.prev?i.prev.next=i.next:e=i.next)}}}}var Ew={notify(){},get:()=>[]};function mB(e,t){let n,r=Ew,i=0,o=!1;function a(v){c();const y=r.subscribe(v);let g=!1;return()=>{g||(g=!0,y(),f())}}function s(){r.notify()}function l(){h.onStateChange&&h.onStateChange()}function u(){return o}function c(){i++,n||(n=t?t.addNestedSub(l):e.subscribe(l),r=hB())}function f(){i--,n&&i===0&&(n(),n=void 0,r.clear(),r=Ew)}function d(){o||(o=!0,c())}function p(){o&&(o=!1,f())}const h={addNestedSub:a,notifyNestedSubs:s,handleChangeWrapper:l,isSubscribed:u,trySubscribe:d,tryUnsubscribe:p,getListeners:()=>r};return h}var vB=()=>typeof window<"u"&&typeof window.document<"u"&&typeof window.document.createElement<"u",gB=vB(),yB=()=>typeof navigator<"u"&&navigator.product==="ReactNative",xB=yB(),wB=()=>gB||xB?m.useLayoutEffect:m.useEffect,bB=wB();function kw(e,t){return e===t?e!==0||t!==0||1/e===1/t:e!==e&&t!==t}function SB(e,t){if(kw(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;const n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(let i=0;i<n.length;i++)if(!Object.prototype.hasOwnProperty.call(t,n[i])||!kw(e[n[i]],t[n[i]]))return!1;return!0}var tp=Symbol.for("react-redux-context"),np=typeof globalThis<"u"?globalThis:{};function PB(){if(!m.createContext)return{};const e=np[tp]??(np[tp]=new Map);let t=e.get(m.createContext);return t||(t=m.createContext(null),e.set(m.createContext,t)),t}var OB=PB();function EB(e){const{children:t,context:n,serverState:r,store:i}=e,o=m.useMemo(()=>{const l=mB(i);return{store:i,subscription:l,getServerState:r?()=>r:void 0}},[i,r]),a=m.useMemo(()=>i.getState(),[i]);bB(()=>{const{subscription:l}=o;return l.onStateChange=l.notifyNestedSubs,l.trySubscribe(),a!==i.getState()&&l.notifyNestedSubs(),()=>{l.tryUnsubscribe(),l.onStateChange=void 0}},[o,a]);const s=n||OB;return m.createElement(s.Provider,{value:o},t)}var kB=EB,CB=new Set(["axisLine","tickLine","activeBar","activeDot","activeLabel","activeShape","allowEscapeViewBox","background","cursor","dot","label","line","margin","padding","position","shape","style","tick","wrapperStyle","radius"]);function _B(e,t){return e==null&&t==null?!0:typeof e=="number"&&typeof t=="number"?e===t||e!==e&&t!==t:e===t}function zg(e,t){var n=new Set([...Object.keys(e),...Object.keys(t)]);for(var r of n)if(CB.has(r)){if(e[r]==null&&t[r]==null)continue;if(!SB(e[r],t[r]))return!1}else if(!_B(e[r],t[r]))return!1;return!0}function Fg(e,t){var n,r;return(n=(r=e.graphicalItems.cartesianItems.find(i=>i.id===t))===null||r===void 0?void 0:r.xAxisId)!==null&&n!==void 0?n:vC}function Bg(e,t){var n,r;return(n=(r=e.graphicalItems.cartesianItems.find(i=>i.id===t))===null||r===void 0?void 0:r.yAxisId)!==null&&n!==void 0?n:vC}var jC=(e,t,n)=>Sk(e,"xAxis",Fg(e,t),n),MC=(e,t,n)=>bk(e,"xAxis",Fg(e,t),n),TC=(e,t,n)=>Sk(e,"yAxis",Bg(e,t),n),$C=(e,t,n)=>bk(e,"yAxis",Bg(e,t),n),AB=I([be,jC,TC,MC,$C],(e,t,n,r,i)=>_r(e,"xAxis")?cc(t,r,!1):cc(n,i,!1)),jB=(e,t)=>t,IC=I([VE,jB],(e,t)=>e.filter(n=>n.type==="area").find(n=>n.id===t)),NC=e=>{var t=be(e),n=_r(t,"xAxis");return n?"yAxis":"xAxis"},MB=(e,t)=>{var n=NC(e);return n==="yAxis"?Bg(e,t):Fg(e,t)},TB=(e,t,n)=>QE(e,NC(e),MB(e,t),n),$B=I([IC,TB],(e,t)=>{var n;if(!(e==null||t==null)){var{stackId:r}=e,i=cg(e);if(!(r==null||i==null)){var o=(n=t[r])===null||n===void 0?void 0:n.stackedData,a=o==null?void 0:o.find(s=>s.key===i);if(a!=null)return a.map(s=>[s[0],s[1]])}}}),IB=I([be,jC,TC,MC,$C,$B,pR,AB,IC,kR],(e,t,n,r,i,o,a,s,l,u)=>{var{chartData:c,dataStartIndex:f,dataEndIndex:d}=a;if(!(l==null||e!=="horizontal"&&e!=="vertical"||t==null||n==null||r==null||i==null||r.length===0||i.length===0||s==null)){var{data:p}=l,h;if(p&&p.length>0?h=p:h=c==null?void 0:c.slice(f,d+1),h!=null)return JB({layout:e,xAxis:t,yAxis:n,xAxisTicks:r,yAxisTicks:i,dataStartIndex:f,areaSettings:l,stackedData:o,displayedData:h,chartBaseValue:u,bandSize:s})}}),NB=["id"],DB=["activeDot","animationBegin","animationDuration","animationEasing","connectNulls","dot","fill","fillOpacity","hide","isAnimationActive","legendType","stroke","xAxisId","yAxisId"];function Li(){return Li=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Li.apply(null,arguments)}function DC(e,t){if(e==null)return{};var n,r,i=RB(e,t);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);for(r=0;r<o.length;r++)n=o[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function RB(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function Cw(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function Ao(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?Cw(Object(n),!0).forEach(function(r){LB(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Cw(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function LB(e,t,n){return(t=zB(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function zB(e){var t=FB(e,"string");return typeof t=="symbol"?t:t+""}function FB(e,t){if(typeof e!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||"default");if(typeof r!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}function Rc(e,t){return e&&e!=="none"?e:t}var BB=e=>{var{dataKey:t,name:n,stroke:r,fill:i,legendType:o,hide:a}=e;return[{inactive:a,dataKey:t,type:o,color:Rc(r,i),value:r2(n,t),payload:e}]},UB=m.memo(e=>{var{dataKey:t,data:n,stroke:r,strokeWidth:i,fill:o,name:a,hide:s,unit:l,tooltipType:u,id:c}=e,f={dataDefinedOnItem:n,positions:void 0,settings:{stroke:r,strokeWidth:i,fill:o,dataKey:t,nameKey:void 0,name:r2(a,t),hide:s,type:u,color:Rc(r,o),unit:l,graphicalItemId:c}};return m.createElement(Yz,{tooltipEntrySettings:f})});function VB(e){var{clipPathId:t,points:n,props:r}=e,{needClip:i,dot:o,dataKey:a}=r,s=jn(r);return m.createElement(mF,{points:n,dot:o,className:"recharts-area-dots",dotClassName:"recharts-area-dot",dataKey:a,baseProps:s,needClip:i,clipPathId:t})}function HB(e){var{showLabels:t,children:n,points:r}=e,i=r.map(o=>{var a,s,l={x:(a=o.x)!==null&&a!==void 0?a:0,y:(s=o.y)!==null&&s!==void 0?s:0,width:0,lowerWidth:0,upperWidth:0,height:0};return Ao(Ao({},l),{},{value:o.value,payload:o.payload,parentViewBox:void 0,viewBox:l,fill:void 0})});return m.createElement(Bz,{value:t?i:void 0},n)}function _w(e){var{points:t,baseLine:n,needClip:r,clipPathId:i,props:o}=e,{layout:a,type:s,stroke:l,connectNulls:u,isRange:c}=o,{id:f}=o,d=DC(o,NB),p=jn(d),h=Rt(d);return m.createElement(m.Fragment,null,(t==null?void 0:t.length)>1&&m.createElement(hn,{clipPath:r?"url(#clipPath-".concat(i,")"):void 0},m.createElement(xu,Li({},h,{id:f,points:t,connectNulls:u,type:s,baseLine:n,layout:a,stroke:"none",className:"recharts-area-area"})),l!=="none"&&m.createElement(xu,Li({},p,{className:"recharts-area-curve",layout:a,type:s,connectNulls:u,fill:"none",points:t})),l!=="none"&&c&&m.createElement(xu,Li({},p,{className:"recharts-area-curve",layout:a,type:s,connectNulls:u,fill:"none",points:n}))),m.createElement(VB,{points:t,props:d,clipPathId:i}))}function KB(e){var t,n,{alpha:r,baseLine:i,points:o,strokeWidth:a}=e,s=(t=o[0])===null||t===void 0?void 0:t.y,l=(n=o[o.length-1])===null||n===void 0?void 0:n.y;if(!me(s)||!me(l))return null;var u=r*Math.abs(s-l),c=Math.max(...o.map(f=>f.x||0));return Q(i)?c=Math.max(i,c):i&&Array.isArray(i)&&i.length&&(c=Math.max(...i.map(f=>f.x||0),c)),Q(c)?m.createElement("rect",{x:0,y:s<l?s:s-u,width:c+(a?parseInt("".concat(a),10):1),height:Math.floor(u)}):null}function WB(e){var t,n,{alpha:r,baseLine:i,points:o,strokeWidth:a}=e,s=(t=o[0])===null||t===void 0?void 0:t.x,l=(n=o[o.length-1])===null||n===void 0?void 0:n.x;if(!me(s)||!me(l))return null;var u=r*Math.abs(s-l),c=Math.max(...o.map(f=>f.y||0));return Q(i)?c=Math.max(i,c):i&&Array.isArray(i)&&i.length&&(c=Math.max(...i.map(f=>f.y||0),c)),Q(c)?m.createElement("rect",{x:s<l?s:s-u,y:0,width:u,height:Math.floor(c+(a?parseInt("".concat(a),10):1))}):null}function YB(e){var{alpha:t,layout:n,points:r,baseLine:i,strokeWidth:o}=e;return n==="vertical"?m.createElement(KB,{alpha:t,points:r,baseLine:i,strokeWidth:o}):m.createElement(WB,{alpha:t,points:r,baseLine:i,strokeWidth:o})}function qB(e){var{needClip:t,clipPathId:n,props:r,previousPointsRef:i,previousBaselineRef:o}=e,{points:a,baseLine:s,isAnimationActive:l,animationBegin:u,animationDuration:c,animationEasing:f,onAnimationStart:d,onAnimationEnd:p}=r,h=m.useMemo(()=>({points:a,baseLine:s}),[a,s]),v=_2(h,"recharts-area-"),y=JN(),[g,x]=m.useState(!1),w=!g,S=m.useCallback(()=>{typeof p=="function"&&p(),x(!1)},[p]),P=m.useCallback(()=>{typeof d=="function"&&d(),x(!0)},[d]);if(y==null)return null;var O=i.current,k=o.current;return m.createElement(HB,{showLabels:w,points:a},r.children,m.createElement(C2,{animationId:v,begin:u,duration:c,isActive:l,easing:f,onAnimationEnd:S,onAnimationStart:P,key:v},j=>{if(O){var M=O.length/a.length,A=j===1?a:a.map((_,N)=>{var L=Math.floor(N*M);if(O[L]){var V=O[L];return Ao(Ao({},_),{},{x:Ln(V.x,_.x,j),y:Ln(V.y,_.y,j)})}return _}),C;return Q(s)?C=Ln(k,s,j):ft(s)||Qt(s)?C=Ln(k,0,j):C=s.map((_,N)=>{var L=Math.floor(N*M);if(Array.isArray(k)&&k[L]){var V=k[L];return Ao(Ao({},_),{},{x:Ln(V.x,_.x,j),y:Ln(V.y,_.y,j)})}return _}),j>0&&(i.current=A,o.current=C),m.createElement(_w,{points:A,baseLine:C,needClip:t,clipPathId:n,props:r})}return j>0&&(i.current=a,o.current=s),m.createElement(hn,null,l&&m.createElement("defs",null,m.createElement("clipPath",{id:"animationClipPath-".concat(n)},m.createElement(YB,{alpha:j,points:a,baseLine:s,layout:y,strokeWidth:r.strokeWidth}))),m.createElement(hn,{clipPath:"url(#animationClipPath-".concat(n,")")},m.createElement(_w,{points:a,baseLine:s,needClip:t,clipPathId:n,props:r})))}),m.createElement(Hz,{label:r.label}))}function GB(e){var{needClip:t,clipPathId:n,props:r}=e,i=m.useRef(null),o=m.useRef();return m.createElement(qB,{needClip:t,clipPathId:n,props:r,previousPointsRef:i,previousBaselineRef:o})}class XB extends m.PureComponent{render(){var{hide:t,dot:n,points:r,className:i,top:o,left:a,needClip:s,xAxisId:l,yAxisId:u,width:c,height:f,id:d,baseLine:p,zIndex:h}=this.props;if(t)return null;var v=ve("recharts-area",i),y=d,{r:g,strokeWidth:x}=iB(n),w=hC(n),S=g*2+x,P=s?"url(#clipPath-".concat(w?"":"dots-").concat(y,")"):void 0;return m.createElement(In,{zIndex:h},m.createElement(hn,{className:v},s&&m.createElement("defs",null,m.createElement(rB,{clipPathId:y,xAxisId:l,yAxisId:u}),!w&&m.createElement("clipPath",{id:"clipPath-dots-".concat(y)},m.createElement("rect",{x:a-S/2,y:o-S/2,width:c+S,height:f+S}))),m.createElement(GB,{needClip:s,clipPathId:y,props:this.props})),m.createElement(mw,{points:r,mainColor:Rc(this.props.stroke,this.props.fill),itemDataKey:this.props.dataKey,activeDot:this.props.activeDot,clipPath:P}),this.props.isRange&&Array.isArray(p)&&m.createElement(mw,{points:p,mainColor:Rc(this.props.stroke,this.props.fill),itemDataKey:this.props.dataKey,activeDot:this.props.activeDot,clipPath:P}))}}var RC={activeDot:!0,animationBegin:0,animationDuration:1500,animationEasing:"ease",connectNulls:!1,dot:!1,fill:"#3182bd",fillOpacity:.6,hide:!1,isAnimationActive:"auto",legendType:"line",stroke:"#3182bd",strokeWidth:1,type:"linear",label:!1,xAxisId:0,yAxisId:0,zIndex:Ye.area};function ZB(e){var t,n=At(e,RC),{activeDot:r,animationBegin:i,animationDuration:o,animationEasing:a,connectNulls:s,dot:l,fill:u,fillOpacity:c,hide:f,isAnimationActive:d,legendType:p,stroke:h,xAxisId:v,yAxisId:y}=n,g=DC(n,DB),x=oa(),w=Vk(),{needClip:S}=AC(v,y),P=St(),{points:O,isRange:k,baseLine:j}=(t=J(L=>IB(L,e.id,P)))!==null&&t!==void 0?t:{},M=Dg();if(x!=="horizontal"&&x!=="vertical"||M==null||w!=="AreaChart"&&w!=="ComposedChart")return null;var{height:A,width:C,x:_,y:N}=M;return!O||!O.length?null:m.createElement(XB,Li({},g,{activeDot:r,animationBegin:i,animationDuration:o,animationEasing:a,baseLine:j,connectNulls:s,dot:l,fill:u,fillOpacity:c,height:A,hide:f,layout:x,isAnimationActive:d==="auto"?!Xs.isSsr:d,isRange:k,legendType:p,needClip:S,points:O,stroke:h,width:C,left:_,top:N,xAxisId:v,yAxisId:y}))}var QB=(e,t,n,r,i)=>{var o=n??t;if(Q(o))return o;var a=e==="horizontal"?i:r,s=a.scale.domain();if(a.type==="number"){var l=Math.max(s[0],s[1]),u=Math.min(s[0],s[1]);return o==="dataMin"?u:o==="dataMax"||l<0?l:Math.max(Math.min(s[0],s[1]),0)}return o==="dataMin"?s[0]:o==="dataMax"?s[1]:s[0]};function JB(e){var{areaSettings:{connectNulls:t,baseValue:n,dataKey:r},stackedData:i,layout:o,chartBaseValue:a,xAxis:s,yAxis:l,displayedData:u,dataStartIndex:c,xAxisTicks:f,yAxisTicks:d,bandSize:p}=e,h=i&&i.length,v=QB(o,a,n,s,l),y=o==="horizontal",g=!1,x=u.map((S,P)=>{var O,k,j;if(h)j=i[c+P];else{var M=dt(S,r);Array.isArray(M)?(j=M,g=!0):j=[v,M]}var A=(O=(k=j)===null||k===void 0?void 0:k[1])!==null&&O!==void 0?O:null,C=A==null||h&&!t&&dt(S,r)==null;return y?{x:X0({axis:s,ticks:f,bandSize:p,entry:S,index:P}),y:C?null:l.scale(A),value:j,payload:S}:{x:C?null:s.scale(A),y:X0({axis:l,ticks:d,bandSize:p,entry:S,index:P}),value:j,payload:S}}),w;return h||g?w=x.map(S=>{var P=Array.isArray(S.value)?S.value[0]:null;return y?{x:S.x,y:P!=null&&S.y!=null?l.scale(P):null,payload:S.payload}:{x:P!=null?s.scale(P):null,y:S.y,payload:S.payload}}):w=y?l.scale(v):s.scale(v),{points:x,baseLine:w,isRange:g}}function e9(e){var t=At(e,RC),n=St();return m.createElement(Jz,{id:t.id,type:"area"},r=>m.createElement(m.Fragment,null,m.createElement(qz,{legendPayload:BB(t)}),m.createElement(UB,{dataKey:t.dataKey,data:t.data,stroke:t.stroke,strokeWidth:t.strokeWidth,fill:t.fill,name:t.name,hide:t.hide,unit:t.unit,tooltipType:t.tooltipType,id:r}),m.createElement(aF,{type:"area",id:r,data:t.data,dataKey:t.dataKey,xAxisId:t.xAxisId,yAxisId:t.yAxisId,zAxisId:0,stackId:xN(t.stackId),hide:t.hide,barSize:void 0,baseValue:t.baseValue,isPanorama:n,connectNulls:t.connectNulls}),m.createElement(ZB,Li({},t,{id:r}))))}var LC=m.memo(e9,zg);LC.displayName="Area";var t9=["domain","range"],n9=["domain","range"];function Aw(e,t){if(e==null)return{};var n,r,i=r9(e,t);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);for(r=0;r<o.length;r++)n=o[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function r9(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function jw(e,t){return e===t?!0:Array.isArray(e)&&e.length===2&&Array.isArray(t)&&t.length===2?e[0]===t[0]&&e[1]===t[1]:!1}function zC(e,t){if(e===t)return!0;var{domain:n,range:r}=e,i=Aw(e,t9),{domain:o,range:a}=t,s=Aw(t,n9);return!jw(n,o)||!jw(r,a)?!1:zg(i,s)}var i9=["dangerouslySetInnerHTML","ticks","scale"],o9=["id","scale"];function Gh(){return Gh=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Gh.apply(null,arguments)}function Mw(e,t){if(e==null)return{};var n,r,i=a9(e,t);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);for(r=0;r<o.length;r++)n=o[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function a9(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function s9(e){var t=Ue(),n=m.useRef(null);return m.useLayoutEffect(()=>{n.current===null?t(wF(e)):n.current!==e&&t(bF({prev:n.current,next:e})),n.current=e},[e,t]),m.useLayoutEffect(()=>()=>{n.current&&(t(SF(n.current)),n.current=null)},[t]),null}var l9=e=>{var{xAxisId:t,className:n}=e,r=J(o2),i=St(),o="xAxis",a=J(d=>wk(d,o,t,i)),s=J(d=>yL(d,t)),l=J(d=>OL(d,t)),u=J(d=>zE(d,t));if(s==null||l==null||u==null)return null;var c=Mw(e,i9),f=Mw(u,o9);return m.createElement(Lg,Gh({},c,f,{x:l.x,y:l.y,width:s.width,height:s.height,className:ve("recharts-".concat(o," ").concat(o),n),viewBox:r,ticks:a,axisType:o}))},u9={allowDataOverflow:Je.allowDataOverflow,allowDecimals:Je.allowDecimals,allowDuplicatedCategory:Je.allowDuplicatedCategory,angle:Je.angle,axisLine:pr.axisLine,height:Je.height,hide:!1,includeHidden:Je.includeHidden,interval:Je.interval,minTickGap:Je.minTickGap,mirror:Je.mirror,orientation:Je.orientation,padding:Je.padding,reversed:Je.reversed,scale:Je.scale,tick:Je.tick,tickCount:Je.tickCount,tickLine:pr.tickLine,tickSize:pr.tickSize,type:Je.type,xAxisId:0},c9=e=>{var t=At(e,u9);return m.createElement(m.Fragment,null,m.createElement(s9,{allowDataOverflow:t.allowDataOverflow,allowDecimals:t.allowDecimals,allowDuplicatedCategory:t.allowDuplicatedCategory,angle:t.angle,dataKey:t.dataKey,domain:t.domain,height:t.height,hide:t.hide,id:t.xAxisId,includeHidden:t.includeHidden,interval:t.interval,minTickGap:t.minTickGap,mirror:t.mirror,name:t.name,orientation:t.orientation,padding:t.padding,reversed:t.reversed,scale:t.scale,tick:t.tick,tickCount:t.tickCount,tickFormatter:t.tickFormatter,ticks:t.ticks,type:t.type,unit:t.unit}),m.createElement(l9,t))},FC=m.memo(c9,zC);FC.displayName="XAxis";var f9=["dangerouslySetInnerHTML","ticks","scale"],d9=["id","scale"];function Xh(){return Xh=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Xh.apply(null,arguments)}function Tw(e,t){if(e==null)return{};var n,r,i=p9(e,t);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);for(r=0;r<o.length;r++)n=o[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function p9(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function h9(e){var t=Ue(),n=m.useRef(null);return m.useLayoutEffect(()=>{n.current===null?t(PF(e)):n.current!==e&&t(OF({prev:n.current,next:e})),n.current=e},[e,t]),m.useLayoutEffect(()=>()=>{n.current&&(t(EF(n.current)),n.current=null)},[t]),null}var m9=e=>{var{yAxisId:t,className:n,width:r,label:i}=e,o=m.useRef(null),a=m.useRef(null),s=J(o2),l=St(),u=Ue(),c="yAxis",f=J(g=>CL(g,t)),d=J(g=>kL(g,t)),p=J(g=>wk(g,c,t,l)),h=J(g=>FE(g,t));if(m.useLayoutEffect(()=>{if(!(r!=="auto"||!f||$g(i)||m.isValidElement(i)||h==null)){var g=o.current;if(g){var x=g.getCalculatedWidth();Math.round(f.width)!==Math.round(x)&&u(kF({id:t,width:x}))}}},[p,f,u,i,t,r,h]),f==null||d==null||h==null)return null;var v=Tw(e,f9),y=Tw(h,d9);return m.createElement(Lg,Xh({},v,y,{ref:o,labelRef:a,x:d.x,y:d.y,tickTextProps:r==="auto"?{width:void 0}:{width:r},width:f.width,height:f.height,className:ve("recharts-".concat(c," ").concat(c),n),viewBox:s,ticks:p,axisType:c}))},v9={allowDataOverflow:et.allowDataOverflow,allowDecimals:et.allowDecimals,allowDuplicatedCategory:et.allowDuplicatedCategory,angle:et.angle,axisLine:pr.axisLine,hide:!1,includeHidden:et.includeHidden,interval:et.interval,minTickGap:et.minTickGap,mirror:et.mirror,orientation:et.orientation,padding:et.padding,reversed:et.reversed,scale:et.scale,tick:et.tick,tickCount:et.tickCount,tickLine:pr.tickLine,tickSize:pr.tickSize,type:et.type,width:et.width,yAxisId:0},g9=e=>{var t=At(e,v9);return m.createElement(m.Fragment,null,m.createElement(h9,{interval:t.interval,id:t.yAxisId,scale:t.scale,type:t.type,domain:t.domain,allowDataOverflow:t.allowDataOverflow,dataKey:t.dataKey,allowDuplicatedCategory:t.allowDuplicatedCategory,allowDecimals:t.allowDecimals,tickCount:t.tickCount,padding:t.padding,includeHidden:t.includeHidden,reversed:t.reversed,ticks:t.ticks,width:t.width,orientation:t.orientation,mirror:t.mirror,hide:t.hide,unit:t.unit,name:t.name,angle:t.angle,minTickGap:t.minTickGap,tick:t.tick,tickFormatter:t.tickFormatter}),m.createElement(m9,t))},BC=m.memo(g9,zC);BC.displayName="YAxis";var y9=(e,t)=>t,Ug=I([y9,be,RE,Xe,Rk,$r,B6,ht],q6),Vg=e=>{var t=e.currentTarget.getBoundingClientRect(),n=t.width/e.currentTarget.offsetWidth,r=t.height/e.currentTarget.offsetHeight;return{chartX:Math.round((e.clientX-t.left)/n),chartY:Math.round((e.clientY-t.top)/r)}},UC=mn("mouseClick"),VC=Ws();VC.startListening({actionCreator:UC,effect:(e,t)=>{var n=e.payload,r=Ug(t.getState(),Vg(n));(r==null?void 0:r.activeIndex)!=null&&t.dispatch(FL({activeIndex:r.activeIndex,activeDataKey:void 0,activeCoordinate:r.activeCoordinate}))}});var Zh=mn("mouseMove"),HC=Ws(),Zl=null;HC.startListening({actionCreator:Zh,effect:(e,t)=>{var n=e.payload;Zl!==null&&cancelAnimationFrame(Zl);var r=Vg(n);Zl=requestAnimationFrame(()=>{var i=t.getState(),o=bg(i,i.tooltip.settings.shared);if(o==="axis"){var a=Ug(i,r);(a==null?void 0:a.activeIndex)!=null?t.dispatch(Ak({activeIndex:a.activeIndex,activeDataKey:void 0,activeCoordinate:a.activeCoordinate})):t.dispatch(_k())}Zl=null})}});function x9(e,t){return t instanceof HTMLElement?"HTMLElement <".concat(t.tagName,' class="').concat(t.className,'">'):t===window?"global.window":e==="children"&&typeof t=="object"&&t!==null?"<<CHILDREN>>":t}var $w={accessibilityLayer:!0,barCategoryGap:"10%",barGap:4,barSize:void 0,className:void 0,maxBarSize:void 0,stackOffset:"none",syncId:void 0,syncMethod:"index",baseValue:void 0,reverseStackOrder:!1},KC=zt({name:"rootProps",initialState:$w,reducers:{updateOptions:(e,t)=>{var n;e.accessibilityLayer=t.payload.accessibilityLayer,e.barCategoryGap=t.payload.barCategoryGap,e.barGap=(n=t.payload.barGap)!==null&&n!==void 0?n:$w.barGap,e.barSize=t.payload.barSize,e.maxBarSize=t.payload.maxBarSize,e.stackOffset=t.payload.stackOffset,e.syncId=t.payload.syncId,e.syncMethod=t.payload.syncMethod,e.className=t.payload.className,e.baseValue=t.payload.baseValue,e.reverseStackOrder=t.payload.reverseStackOrder}}}),w9=KC.reducer,{updateOptions:b9}=KC.actions,WC=zt({name:"polarOptions",initialState:null,reducers:{updatePolarOptions:(e,t)=>t.payload}});WC.actions;var S9=WC.reducer,YC=mn("keyDown"),qC=mn("focus"),Hg=Ws();Hg.startListening({actionCreator:YC,effect:(e,t)=>{var n=t.getState(),r=n.rootProps.accessibilityLayer!==!1;if(r){var{keyboardInteraction:i}=n.tooltip,o=e.payload;if(!(o!=="ArrowRight"&&o!=="ArrowLeft"&&o!=="Enter")){var a=Sg(i,pa(n),rl(n),sl(n)),s=a==null?-1:Number(a);if(!(!Number.isFinite(s)||s<0)){var l=$r(n);if(o==="Enter"){var u=Tc(n,"axis","hover",String(i.index));t.dispatch(Bh({active:!i.active,activeIndex:i.index,activeCoordinate:u}));return}var c=ML(n),f=c==="left-to-right"?1:-1,d=o==="ArrowRight"?1:-1,p=s+d*f;if(!(l==null||p>=l.length||p<0)){var h=Tc(n,"axis","hover",String(p));t.dispatch(Bh({active:!0,activeIndex:p.toString(),activeCoordinate:h}))}}}}}});Hg.startListening({actionCreator:qC,effect:(e,t)=>{var n=t.getState(),r=n.rootProps.accessibilityLayer!==!1;if(r){var{keyboardInteraction:i}=n.tooltip;if(!i.active&&i.index==null){var o="0",a=Tc(n,"axis","hover",String(o));t.dispatch(Bh({active:!0,activeIndex:o,activeCoordinate:a}))}}}});var rn=mn("externalEvent"),GC=Ws(),rp=new Map;GC.startListening({actionCreator:rn,effect:(e,t)=>{var{handler:n,reactEvent:r}=e.payload;if(n!=null){r.persist();var i=r.type,o=rp.get(i);o!==void 0&&cancelAnimationFrame(o);var a=requestAnimationFrame(()=>{try{var s=t.getState(),l={activeCoordinate:k6(s),activeDataKey:O6(s),activeIndex:$s(s),activeLabel:Fk(s),activeTooltipIndex:$s(s),isTooltipActive:C6(s)};n(l,r)}finally{rp.delete(i)}});rp.set(i,a)}}});var P9=I([fa],e=>e.tooltipItemPayloads),O9=I([P9,al,(e,t)=>t,(e,t,n)=>n],(e,t,n,r)=>{var i=e.find(s=>s.settings.graphicalItemId===r);if(i!=null){var{positions:o}=i;if(o!=null){var a=t(o,n);return a}}}),XC=mn("touchMove"),ZC=Ws();ZC.startListening({actionCreator:XC,effect:(e,t)=>{var n=e.payload;if(!(n.touches==null||n.touches.length===0)){var r=t.getState(),i=bg(r,r.tooltip.settings.shared);if(i==="axis"){var o=n.touches[0];if(o==null)return;var a=Ug(r,Vg({clientX:o.clientX,clientY:o.clientY,currentTarget:n.currentTarget}));(a==null?void 0:a.activeIndex)!=null&&t.dispatch(Ak({activeIndex:a.activeIndex,activeDataKey:void 0,activeCoordinate:a.activeCoordinate}))}else if(i==="item"){var s,l=n.touches[0];if(document.elementFromPoint==null||l==null)return;var u=document.elementFromPoint(l.clientX,l.clientY);if(!u||!u.getAttribute)return;var c=u.getAttribute(kN),f=(s=u.getAttribute(CN))!==null&&s!==void 0?s:void 0,d=da(r).find(v=>v.id===f);if(c==null||d==null||f==null)return;var{dataKey:p}=d,h=O9(r,c,f);t.dispatch(zL({activeDataKey:p,activeIndex:c,activeCoordinate:h,activeGraphicalItemId:f}))}}}});var E9=kO({brush:DF,cartesianAxis:CF,chartData:E8,errorBars:nB,graphicalItems:iF,layout:uN,legend:v4,options:w8,polarAxis:Wz,polarOptions:S9,referenceElements:qF,rootProps:w9,tooltip:BL,zIndex:l8}),k9=function(t){var n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:"Chart";return II({reducer:E9,preloadedState:t,middleware:r=>{var i;return r({serializableCheck:!1,immutableCheck:!["commonjs","es6","production"].includes((i="es6")!==null&&i!==void 0?i:"")}).concat([VC.middleware,HC.middleware,Hg.middleware,GC.middleware,ZC.middleware])},enhancers:r=>{var i=r;return typeof r=="function"&&(i=r()),i.concat(BO({type:"raf"}))},devTools:{serialize:{replacer:x9},name:"recharts-".concat(n)}})};function C9(e){var{preloadedState:t,children:n,reduxStoreName:r}=e,i=St(),o=m.useRef(null);if(i)return n;o.current==null&&(o.current=k9(t,r));var a=bv;return m.createElement(kB,{context:a,store:o.current},n)}function _9(e){var{layout:t,margin:n}=e,r=Ue(),i=St();return m.useEffect(()=>{i||(r(aN(t)),r(oN(n)))},[r,i,t,n]),null}var A9=m.memo(_9,zg);function j9(e){var t=Ue();return m.useEffect(()=>{t(b9(e))},[t,e]),null}function Iw(e){var{zIndex:t,isPanorama:n}=e,r=m.useRef(null),i=Ue();return m.useLayoutEffect(()=>(r.current&&i(a8({zIndex:t,element:r.current,isPanorama:n})),()=>{i(s8({zIndex:t,isPanorama:n}))}),[i,t,n]),m.createElement("g",{tabIndex:-1,ref:r})}function Nw(e){var{children:t,isPanorama:n}=e,r=J(X6);if(!r||r.length===0)return t;var i=r.filter(a=>a<0),o=r.filter(a=>a>0);return m.createElement(m.Fragment,null,i.map(a=>m.createElement(Iw,{key:a,zIndex:a,isPanorama:n})),t,o.map(a=>m.createElement(Iw,{key:a,zIndex:a,isPanorama:n})))}var M9=["children"];function T9(e,t){if(e==null)return{};var n,r,i=$9(e,t);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);for(r=0;r<o.length;r++)n=o[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function $9(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function Lc(){return Lc=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Lc.apply(null,arguments)}var I9={width:"100%",height:"100%",display:"block"},N9=m.forwardRef((e,t)=>{var n=h2(),r=m2(),i=P2();if(!Yn(n)||!Yn(r))return null;var{children:o,otherAttributes:a,title:s,desc:l}=e,u,c;return a!=null&&(typeof a.tabIndex=="number"?u=a.tabIndex:u=i?0:void 0,typeof a.role=="string"?c=a.role:c=i?"application":void 0),m.createElement(MP,Lc({},a,{title:s,desc:l,role:c,tabIndex:u,width:n,height:r,style:I9,ref:t}),o)}),D9=e=>{var{children:t}=e,n=J(jf);if(!n)return null;var{width:r,height:i,y:o,x:a}=n;return m.createElement(MP,{width:r,height:i,x:a,y:o},t)},Dw=m.forwardRef((e,t)=>{var{children:n}=e,r=T9(e,M9),i=St();return i?m.createElement(D9,null,m.createElement(Nw,{isPanorama:!0},n)):m.createElement(N9,Lc({ref:t},r),m.createElement(Nw,{isPanorama:!1},n))});function R9(){var e=Ue(),[t,n]=m.useState(null),r=J(EN);return m.useEffect(()=>{if(t!=null){var i=t.getBoundingClientRect(),o=i.width/t.offsetWidth;me(o)&&o!==r&&e(lN(o))}},[t,e,r]),n}function Rw(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function L9(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?Rw(Object(n),!0).forEach(function(r){z9(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Rw(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function z9(e,t,n){return(t=F9(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function F9(e){var t=B9(e,"string");return typeof t=="symbol"?t:t+""}function B9(e,t){if(typeof e!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||"default");if(typeof r!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}function Xi(){return Xi=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Xi.apply(null,arguments)}var U9=()=>(I8(),null);function zc(e){if(typeof e=="number")return e;if(typeof e=="string"){var t=parseFloat(e);if(!Number.isNaN(t))return t}return 0}var V9=m.forwardRef((e,t)=>{var n,r,i=m.useRef(null),[o,a]=m.useState({containerWidth:zc((n=e.style)===null||n===void 0?void 0:n.width),containerHeight:zc((r=e.style)===null||r===void 0?void 0:r.height)}),s=m.useCallback((u,c)=>{a(f=>{var d=Math.round(u),p=Math.round(c);return f.containerWidth===d&&f.containerHeight===p?f:{containerWidth:d,containerHeight:p}})},[]),l=m.useCallback(u=>{if(typeof t=="function"&&t(u),u!=null&&typeof ResizeObserver<"u"){var{width:c,height:f}=u.getBoundingClientRect();s(c,f);var d=h=>{var{width:v,height:y}=h[0].contentRect;s(v,y)},p=new ResizeObserver(d);p.observe(u),i.current=p}},[t,s]);return m.useEffect(()=>()=>{var u=i.current;u!=null&&u.disconnect()},[s]),m.createElement(m.Fragment,null,m.createElement(Mf,{width:o.containerWidth,height:o.containerHeight}),m.createElement("div",Xi({ref:l},e)))}),H9=m.forwardRef((e,t)=>{var{width:n,height:r}=e,[i,o]=m.useState({containerWidth:zc(n),containerHeight:zc(r)}),a=m.useCallback((l,u)=>{o(c=>{var f=Math.round(l),d=Math.round(u);return c.containerWidth===f&&c.containerHeight===d?c:{containerWidth:f,containerHeight:d}})},[]),s=m.useCallback(l=>{if(typeof t=="function"&&t(l),l!=null){var{width:u,height:c}=l.getBoundingClientRect();a(u,c)}},[t,a]);return m.createElement(m.Fragment,null,m.createElement(Mf,{width:i.containerWidth,height:i.containerHeight}),m.createElement("div",Xi({ref:s},e)))}),K9=m.forwardRef((e,t)=>{var{width:n,height:r}=e;return m.createElement(m.Fragment,null,m.createElement(Mf,{width:n,height:r}),m.createElement("div",Xi({ref:t},e)))}),W9=m.forwardRef((e,t)=>{var{width:n,height:r}=e;return yr(n)||yr(r)?m.createElement(H9,Xi({},e,{ref:t})):m.createElement(K9,Xi({},e,{ref:t}))});function Y9(e){return e===!0?V9:W9}var q9=m.forwardRef((e,t)=>{var{children:n,className:r,height:i,onClick:o,onContextMenu:a,onDoubleClick:s,onMouseDown:l,onMouseEnter:u,onMouseLeave:c,onMouseMove:f,onMouseUp:d,onTouchEnd:p,onTouchMove:h,onTouchStart:v,style:y,width:g,responsive:x,dispatchTouchEvents:w=!0}=e,S=m.useRef(null),P=Ue(),[O,k]=m.useState(null),[j,M]=m.useState(null),A=R9(),C=jv(),_=(C==null?void 0:C.width)>0?C.width:g,N=(C==null?void 0:C.height)>0?C.height:i,L=m.useCallback(D=>{A(D),typeof t=="function"&&t(D),k(D),M(D),D!=null&&(S.current=D)},[A,t,k,M]),V=m.useCallback(D=>{P(UC(D)),P(rn({handler:o,reactEvent:D}))},[P,o]),B=m.useCallback(D=>{P(Zh(D)),P(rn({handler:u,reactEvent:D}))},[P,u]),U=m.useCallback(D=>{P(_k()),P(rn({handler:c,reactEvent:D}))},[P,c]),$=m.useCallback(D=>{P(Zh(D)),P(rn({handler:f,reactEvent:D}))},[P,f]),z=m.useCallback(()=>{P(qC())},[P]),K=m.useCallback(D=>{P(YC(D.key))},[P]),X=m.useCallback(D=>{P(rn({handler:a,reactEvent:D}))},[P,a]),re=m.useCallback(D=>{P(rn({handler:s,reactEvent:D}))},[P,s]),Se=m.useCallback(D=>{P(rn({handler:l,reactEvent:D}))},[P,l]),le=m.useCallback(D=>{P(rn({handler:d,reactEvent:D}))},[P,d]),se=m.useCallback(D=>{P(rn({handler:v,reactEvent:D}))},[P,v]),de=m.useCallback(D=>{w&&P(XC(D)),P(rn({handler:h,reactEvent:D}))},[P,w,h]),ne=m.useCallback(D=>{P(rn({handler:p,reactEvent:D}))},[P,p]),Z=Y9(x);return m.createElement(qk.Provider,{value:O},m.createElement(qT.Provider,{value:j},m.createElement(Z,{width:_??(y==null?void 0:y.width),height:N??(y==null?void 0:y.height),className:ve("recharts-wrapper",r),style:L9({position:"relative",cursor:"default",width:_,height:N},y),onClick:V,onContextMenu:X,onDoubleClick:re,onFocus:z,onKeyDown:K,onMouseDown:Se,onMouseEnter:B,onMouseLeave:U,onMouseMove:$,onMouseUp:le,onTouchEnd:ne,onTouchMove:de,onTouchStart:se,ref:L},m.createElement(U9,null),n)))}),G9=["width","height","responsive","children","className","style","compact","title","desc"];function X9(e,t){if(e==null)return{};var n,r,i=Z9(e,t);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(e);for(r=0;r<o.length;r++)n=o[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function Z9(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var Q9=m.forwardRef((e,t)=>{var{width:n,height:r,responsive:i,children:o,className:a,style:s,compact:l,title:u,desc:c}=e,f=X9(e,G9),d=jn(f);return l?m.createElement(m.Fragment,null,m.createElement(Mf,{width:n,height:r}),m.createElement(Dw,{otherAttributes:d,title:u,desc:c},o)):m.createElement(q9,{className:a,style:s,width:n,height:r,responsive:i??!1,onClick:e.onClick,onMouseLeave:e.onMouseLeave,onMouseEnter:e.onMouseEnter,onMouseMove:e.onMouseMove,onMouseDown:e.onMouseDown,onMouseUp:e.onMouseUp,onContextMenu:e.onContextMenu,onDoubleClick:e.onDoubleClick,onTouchStart:e.onTouchStart,onTouchMove:e.onTouchMove,onTouchEnd:e.onTouchEnd},m.createElement(Dw,{otherAttributes:d,title:u,desc:c,ref:t},m.createElement(GF,null,o)))});function Qh(){return Qh=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Qh.apply(null,arguments)}var J9={top:5,right:5,bottom:5,left:5},eU={accessibilityLayer:!0,barCategoryGap:"10%",barGap:4,layout:"horizontal",margin:J9,responsive:!1,reverseStackOrder:!1,stackOffset:"none",syncMethod:"index"},tU=m.forwardRef(function(t,n){var r,i=At(t.categoricalChartProps,eU),{chartName:o,defaultTooltipEventType:a,validateTooltipEventTypes:s,tooltipPayloadSearcher:l,categoricalChartProps:u}=t,c={chartName:o,defaultTooltipEventType:a,validateTooltipEventTypes:s,tooltipPayloadSearcher:l,eventEmitter:void 0};return m.createElement(C9,{preloadedState:{options:c},reduxStoreName:(r=u.id)!==null&&r!==void 0?r:o},m.createElement(NF,{chartData:u.data}),m.createElement(A9,{layout:i.layout,margin:i.margin}),m.createElement(j9,{baseValue:i.baseValue,accessibilityLayer:i.accessibilityLayer,barCategoryGap:i.barCategoryGap,maxBarSize:i.maxBarSize,stackOffset:i.stackOffset,barGap:i.barGap,barSize:i.barSize,syncId:i.syncId,syncMethod:i.syncMethod,className:i.className,reverseStackOrder:i.reverseStackOrder}),m.createElement(Q9,Qh({},i,{ref:n})))}),nU=["axis"],rU=m.forwardRef((e,t)=>m.createElement(tU,{chartName:"AreaChart",defaultTooltipEventType:"axis",validateTooltipEventTypes:nU,tooltipPayloadSearcher:y8,categoricalChartProps:e,ref:t}));const iU=({data:e,containerWidth:t=1179,containerHeight:n=2556})=>{const[r,i]=m.useState(e.length>0?e.length-1:0),[o,a]=m.useState(!1),s=m.useRef(null);m.useEffect(()=>{e.length>0&&i(e.length-1)},[e]);const l=e[r]||null,u=m.useCallback(M=>{if(!s.current||e.length===0)return r;const A=s.current.querySelector("svg");if(!A)return r;const C=A.getBoundingClientRect(),_=M-C.left-20,N=C.width-40;if(N<=0)return r;const L=Math.round(_/N*(e.length-1));return Math.max(0,Math.min(e.length-1,L))},[e.length,r]),c=m.useCallback(M=>{if(!o)return;const A=u(M.clientX);A!==r&&i(A)},[o,u,r]),f=m.useCallback(()=>{a(!0)},[]),d=m.useCallback(()=>{a(!1)},[]),p=m.useCallback(()=>{a(!1)},[]),h=24,v=h/4,y=E(36,t),g=E(42,t),x=T(231,n),w=E(42,t)/2,S=E(2,t),P=E(4,t),O=M=>{const{x:A,y:C,payload:_}=M,N=_.value,L=parseInt(N,10);return L!==void 0&&!isNaN(L)&&(L===0||L===15||L===30||L===45)?b.jsx("text",{x:A,y:C+5,textAnchor:"middle",fill:"#6b7280",style:{fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:500,fontSize:`${y}px`,lineHeight:"100%",letterSpacing:"0%",textAlign:"center"},children:N}):null},k=M=>{const{y:A,payload:C}=M,_=C.value;if(_===8||_===16||_===24||_===32){const N=A!==void 0&&!isNaN(A)?A+5:null;if(N!==null)return b.jsx("text",{x:0,y:N,textAnchor:"start",fill:"#6b7280",style:{fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:500,fontSize:`${y}px`,lineHeight:"100%",letterSpacing:"0%",textAlign:"center"},children:_})}return null},j=E(58,t);return b.jsxs("div",{className:"w-full h-full flex flex-col",children:[b.jsxs("div",{className:"flex items-center justify-between",style:{paddingRight:`${j}px`},children:[b.jsx("div",{className:"text-lg font-semibold text-gray-800",children:"呼吸率"}),l&&b.jsxs("div",{className:"flex items-baseline",children:[b.jsx("span",{style:{fontSize:`${h}px`,fontWeight:"bold",color:"#1f2937"},children:l.value}),b.jsx("span",{style:{fontSize:`${v}px`,color:"#6b7280",marginLeft:"4px"},children:"BMP"})]})]}),b.jsx("div",{ref:s,className:"flex-1 flex items-center relative",onMouseMove:c,onMouseDown:f,onMouseUp:d,onMouseLeave:p,style:{cursor:o?"grabbing":"grab"},children:b.jsx(ZN,{width:"100%",height:"100%",children:b.jsxs(rU,{data:e,margin:{top:10,right:0,bottom:0,left:-12},children:[b.jsxs("defs",{children:[b.jsxs("linearGradient",{id:"respirationGradient",x1:"0",y1:"0",x2:"0",y2:"1",children:[b.jsx("stop",{offset:"0%",stopColor:"#FFE4E6"}),b.jsx("stop",{offset:"90.11%",stopColor:"rgba(217, 217, 217, 0)"})]}),b.jsxs("linearGradient",{id:"dotGradient",x1:"0%",y1:"0%",x2:"0%",y2:"100%",gradientUnits:"userSpaceOnUse",children:[b.jsx("stop",{offset:"0%",stopColor:"#F2769E",stopOpacity:"0.6"}),b.jsx("stop",{offset:"50%",stopColor:"#F2769E",stopOpacity:"0.4"}),b.jsx("stop",{offset:"80%",stopColor:"rgba(255, 204, 224, 0.2)",stopOpacity:"0.2"}),b.jsx("stop",{offset:"95%",stopColor:"rgba(255, 204, 224, 0.1)",stopOpacity:"0.1"}),b.jsx("stop",{offset:"100%",stopColor:"rgba(255, 204, 224, 0)",stopOpacity:"0"})]})]}),b.jsx(CC,{strokeDasharray:"3 3",stroke:"#e5e7eb"}),[8,16,24,32].map(M=>b.jsx(OC,{y:M,stroke:"#D8CAD2",strokeWidth:S,strokeDasharray:"4 4"},`grid-line-${M}`)),b.jsx(FC,{dataKey:"time",stroke:"#D8CAD2",tick:O,axisLine:{stroke:"#D8CAD2",strokeWidth:S},tickLine:!1,height:20}),b.jsx(BC,{domain:[0,32],ticks:[8,16,24,32],stroke:"transparent",tick:k,axisLine:!1,tickLine:!1,width:35,orientation:"left",allowDecimals:!1}),b.jsx(U8,{contentStyle:{display:"none"},cursor:!1}),b.jsx(LC,{type:"monotone",dataKey:"value",stroke:"#82797F",strokeWidth:2,fill:"url(#respirationGradient)",activeDot:!1}),l&&b.jsxs(b.Fragment,{children:[b.jsx(qh,{x:l.time,y:l.value,r:0,fill:"none",stroke:"none",shape:M=>{const{cx:A,cy:C}=M,_=A,N=C;if(_===void 0||N===void 0)return b.jsx("g",{});const L=_-g/2,V=N;return b.jsx("g",{style:{pointerEvents:"none"},children:b.jsx("rect",{x:L,y:V,width:g,height:x,fill:"url(#dotGradient)"})})}}),b.jsx(qh,{x:l.time,y:l.value,r:w,fill:"#EFE8EC",stroke:"#82797F",strokeWidth:P})]})]})})})]})},Lw=({title:e="",value:t,unit:n="",valueFontSize:r=24,unitFontSize:i=6,decimalPlaces:o=0,maxValue:a=100,containerWidth:s=617,showOnlySVG:l=!1})=>{const[u,c]=m.useState("");m.useEffect(()=>{fetch("/wave-path.svg").then(d=>d.text()).then(d=>{const v=new DOMParser().parseFromString(d,"image/svg+xml").querySelector("#wave-path");if(v){const y=v.getAttribute("d");y&&c(y)}}).catch(d=>{console.error("Failed to load wave-path.svg:",d),c("M1.70264 23C29.0152 13.1081 73.084 5 136.925 5C200.766 5 255.056 23 339.004 23C417.423 23 458.811 11 469.703 5")})},[]);const f=m.useMemo(()=>{const d=(k,j,M,A,C)=>{const _=1-k;return _*_*_*j+3*_*_*k*M+3*_*k*k*A+k*k*k*C},p=Math.min(Math.max(t/a,0),1),h=469.703-1.70264,v=136.925-1.70264,y=339.004-136.925,g=469.703-339.004,x=v/h,w=y/h,S=g/h;let P=0,O=0;if(p<=x){const k=p/x;P=d(k,1.70264,29.0152,73.084,136.925),O=d(k,23,13.1081,5,5)}else if(p<=x+w){const k=(p-x)/w;P=d(k,136.925,200.766,255.056,339.004),O=d(k,5,5,23,23)}else{const k=(p-x-w)/S;P=d(k,339.004,417.423,458.811,469.703),O=d(k,23,23,11,5)}return{x:P,y:O}},[t,a]);return l?b.jsx("div",{className:"w-full h-full relative",style:{minHeight:0},children:b.jsxs("svg",{width:"100%",height:"100%",viewBox:"0 0 473 28",preserveAspectRatio:"xMidYMid meet",style:{overflow:"visible"},children:[b.jsx("defs",{children:b.jsxs("linearGradient",{id:`waveGradient-${e||"wave"}`,x1:"1.70264",y1:"14",x2:"469.703",y2:"14",gradientUnits:"userSpaceOnUse",children:[b.jsx("stop",{stopColor:"#BBADB7",stopOpacity:"0"}),b.jsx("stop",{offset:"0.307692",stopColor:"#978B94"}),b.jsx("stop",{offset:"0.509615",stopColor:"#6E4764"}),b.jsx("stop",{offset:"0.706731",stopColor:"#746B71"}),b.jsx("stop",{offset:"1",stopColor:"#82797F",stopOpacity:"0"})]})}),u&&b.jsx("path",{d:u,stroke:`url(#waveGradient-${e||"wave"})`,strokeWidth:"10",fill:"none",strokeLinecap:"round",strokeLinejoin:"round"}),b.jsx("circle",{cx:f.x,cy:f.y,r:"12",fill:"#685563",stroke:"#685563",strokeWidth:"2"})]})}):b.jsxs("div",{className:"w-full h-full relative",style:{backgroundColor:"#F6EDF3",borderRadius:`${E(10,s)}px`,padding:`${E(16,s)}px`},children:[e&&b.jsx("div",{className:"absolute font-semibold text-gray-800",style:{top:`${E(4,s)}px`,right:`${E(4,s)}px`,fontSize:`${E(9,s)}px`},children:e}),b.jsxs("div",{className:"absolute flex items-baseline",style:{bottom:`${E(4,s)}px`,left:`${E(4,s)}px`},children:[b.jsx("span",{style:{fontSize:`${r}px`,fontWeight:"bold",color:"#1f2937"},children:o>0?t.toFixed(o):t}),n&&b.jsx("span",{style:{fontSize:`${i}px`,color:"#6b7280",marginLeft:"4px"},children:n})]}),b.jsx("div",{className:"w-full h-full flex items-center justify-center relative",style:{minHeight:0},children:b.jsxs("svg",{width:"100%",height:"100%",viewBox:"0 0 473 28",preserveAspectRatio:"xMidYMid meet",style:{overflow:"visible"},children:[b.jsx("defs",{children:b.jsxs("linearGradient",{id:`waveGradient-${e||"wave"}`,x1:"1.70264",y1:"14",x2:"469.703",y2:"14",gradientUnits:"userSpaceOnUse",children:[b.jsx("stop",{stopColor:"#BBADB7",stopOpacity:"0"}),b.jsx("stop",{offset:"0.307692",stopColor:"#978B94"}),b.jsx("stop",{offset:"0.509615",stopColor:"#6E4764"}),b.jsx("stop",{offset:"0.706731",stopColor:"#746B71"}),b.jsx("stop",{offset:"1",stopColor:"#82797F",stopOpacity:"0"})]})}),u&&b.jsx("path",{d:u,stroke:`url(#waveGradient-${e||"wave"})`,strokeWidth:"10",fill:"none",strokeLinecap:"round",strokeLinejoin:"round"}),b.jsx("circle",{cx:f.x,cy:f.y,r:"12",fill:"#685563",stroke:"#685563",strokeWidth:"2"})]})})]})},zw=({title:e,value:t,unit:n="",valueFontSize:r=24,unitFontSize:i=6,decimalPlaces:o=0,minValue:a=0,maxValue:s=100,containerWidth:l=617,showOnlySVG:u=!1})=>{const[c,f]=m.useState("");m.useEffect(()=>{fetch("/gauge-chart.svg").then(L=>L.text()).then(L=>{const U=new DOMParser().parseFromString(L,"image/svg+xml").querySelector("#gauge-scale-path");if(U){const $=U.getAttribute("d");$&&f($)}}).catch(L=>{console.error("Failed to load gauge-chart.svg:",L),f("M5.03741 42.4815C9.57568 40.1692 15.1297 41.9736 17.4422 46.5117L35.2824 81.5263C37.5946 86.0646 35.7903 91.6179 31.2521 93.9304C26.7137 96.2428 21.1597 94.4385 18.8473 89.9001L1.00714 54.8863C-1.30513 50.3479 0.499079 44.7939 5.03741 42.4815ZM346.53 46.5125C348.842 41.9742 354.396 40.169 358.935 42.4815C363.473 44.7939 365.277 50.348 362.965 54.8863L345.125 89.9001C342.812 94.4385 337.258 96.2427 332.72 93.9304C328.182 91.6179 326.377 86.0647 328.69 81.5263L346.53 46.5125ZM32.2436 29.9121C36.9461 27.9553 42.3444 30.1815 44.3015 34.8838L59.3998 71.1656C61.3565 75.8681 59.1306 81.2665 54.4281 83.2235C49.7255 85.1803 44.3264 82.9544 42.3694 78.2518L27.2728 41.9708C25.3159 37.2682 27.5411 31.8691 32.2436 29.9121ZM318.513 34.4374C320.455 29.7286 325.846 27.4851 330.555 29.4266C335.264 31.3682 337.507 36.7592 335.565 41.468L320.587 77.7983C318.645 82.5074 313.254 84.7507 308.545 82.8092C303.836 80.8676 301.592 75.4766 303.534 70.7677L318.513 34.4374ZM61.5426 19.076C66.3867 17.5021 71.5901 20.1536 73.1642 24.9977L85.3075 62.3712C86.8815 67.2154 84.23 72.4188 79.3858 73.9929C74.5416 75.5666 69.3389 72.9154 67.7649 68.0712L55.6217 30.6977C54.0478 25.8535 56.6984 20.65 61.5426 19.076ZM290.808 24.9977C292.382 20.1536 297.585 17.502 302.43 19.076C307.274 20.6501 309.924 25.8535 308.35 30.6977L296.207 68.0712C294.633 72.9153 289.43 75.5665 284.586 73.9929C279.742 72.4188 277.091 67.2155 278.665 62.3712L290.808 24.9977ZM90.3802 10.9176C95.331 9.72046 100.315 12.7641 101.512 17.7148L110.748 55.9107C111.946 60.8616 108.902 65.8457 103.951 67.0429C99.0004 68.2397 94.0169 65.1964 92.8198 60.2456L83.5837 22.0505C82.3866 17.0997 85.4294 12.1148 90.3802 10.9176ZM261.247 17.4548C262.428 12.5 267.402 9.44055 272.357 10.6215C277.311 11.8026 280.37 16.7764 279.189 21.731L270.079 59.9574C268.898 64.9122 263.923 67.9709 258.968 66.7899C254.014 65.6088 250.955 60.6351 252.136 55.6805L261.247 17.4548ZM121.014 4.79857C126.044 4.00185 130.769 7.43444 131.565 12.4652L137.713 51.2782C138.51 56.3089 135.078 61.033 130.047 61.83C125.016 62.6268 120.292 59.1943 119.495 54.1634L113.347 15.3504C112.55 10.3197 115.983 5.59543 121.014 4.79857ZM232.407 12.4652C233.204 7.4344 237.928 4.00177 242.958 4.79857C247.989 5.59547 251.422 10.3198 250.625 15.3504L244.477 54.1642C243.68 59.1948 238.956 62.6267 233.925 61.83C228.894 61.0331 225.462 56.309 226.259 51.2782L232.407 12.4652ZM150.773 1.25153C155.85 0.84384 160.296 4.62919 160.704 9.706L163.851 48.8777C164.259 53.9547 160.474 58.4005 155.397 58.8085C150.32 59.2163 145.873 55.4312 145.465 50.354L142.319 11.1839C141.911 6.10664 145.696 1.65945 150.773 1.25153ZM202.029 9.63943C202.421 4.56089 206.855 0.760709 211.933 1.15206C217.012 1.54342 220.811 5.97779 220.42 11.0562L217.401 50.2373C217.009 55.3159 212.575 59.1153 207.497 58.7239C202.418 58.3325 198.619 53.8983 199.01 48.8198L202.029 9.63943ZM181.986 0C187.079 7.93579e-05 191.209 4.12933 191.209 9.22277V48.5198C191.209 53.6133 187.08 57.7425 181.986 57.7426C176.892 57.7426 172.763 53.6134 172.763 48.5198V9.22277C172.763 4.12929 176.893 0 181.986 0Z")})},[]);const d=5,p=42,h=182,v=0,y=346,g=46,x=h,w=m.useMemo(()=>{let L=200,V=1/0;for(let B=150;B<=250;B+=1){const U=Math.sqrt((d-x)**2+(p-B)**2),$=Math.sqrt((h-x)**2+(v-B)**2),z=Math.sqrt((y-x)**2+(g-B)**2),K=(U+$+z)/3,X=Math.abs(U-K)+Math.abs($-K)+Math.abs(z-K);X<V&&(V=X,L=B)}return L+80},[x,d,p,h,v,y,g]),S=m.useMemo(()=>{const L=Math.sqrt((d-x)**2+(p-w)**2),V=Math.sqrt((h-x)**2+(v-w)**2),B=Math.sqrt((y-x)**2+(g-w)**2);return(L+V+B)/3},[x,w,d,p,h,v,y,g]),P=Math.atan2(p-w,d-x)*(180/Math.PI),O=Math.atan2(g-w,y-x)*(180/Math.PI),{pointerX:k,pointerY:j,pointerAngle:M}=m.useMemo(()=>{const L=s-a,V=L>0?Math.min(Math.max((t-a)/L,0),1):0,B=P+V*(O-P),U=B*(Math.PI/180),$=x+S*Math.cos(U),z=w+S*Math.sin(U)-30,K=B+180+90;return{pointerX:$,pointerY:z,pointerAngle:K}},[t,s,P,O,S,x,w]),A=41*.5*.5*1.2,C=126*.9,_=A/2,N=C;return u?b.jsx("div",{className:"w-full h-full relative",style:{minHeight:0},children:b.jsxs("svg",{width:"100%",height:"100%",viewBox:"0 0 364 95",preserveAspectRatio:"xMidYMid meet",style:{overflow:"visible"},children:[b.jsx("defs",{children:b.jsxs("linearGradient",{id:`gaugeGradient-${e}`,x1:"-74.8485",y1:"69.9316",x2:"437.878",y2:"69.9316",gradientUnits:"userSpaceOnUse",children:[b.jsx("stop",{offset:"0.0485284",stopColor:"#9CC5B6",stopOpacity:"0"}),b.jsx("stop",{offset:"0.474249",stopColor:"#79A598"}),b.jsx("stop",{offset:"1",stopColor:"#EDFFF9",stopOpacity:"0.57"})]})}),c&&b.jsx("path",{d:c,fill:`url(#gaugeGradient-${e})`}),b.jsx("g",{transform:`translate(${k}, ${j}) rotate(${M}) translate(-${_}, -${N})`,children:b.jsx("rect",{x:"0",y:"0",width:A,height:C,fill:"#685563",stroke:"white",strokeWidth:"4",rx:"4",ry:"4",style:{shapeRendering:"geometricPrecision"}})})]})}):b.jsxs("div",{className:"w-full h-full relative",style:{backgroundColor:"transparent",borderRadius:`${E(60,l)}px`,padding:`${E(16,l)}px`},children:[b.jsx("div",{className:"absolute font-semibold text-gray-800",style:{top:`${E(4,l)}px`,right:`${E(4,l)}px`,fontSize:`${E(9,l)}px`},children:e}),b.jsxs("div",{className:"absolute flex items-baseline",style:{bottom:`${E(4,l)}px`,left:`${E(4,l)}px`},children:[b.jsx("span",{style:{fontSize:`${r}px`,fontWeight:"bold",color:"#1f2937"},children:o>0?t.toFixed(o):t}),n&&b.jsx("span",{style:{fontSize:`${i}px`,color:"#6b7280",marginLeft:"4px"},children:n})]}),b.jsx("div",{className:"w-full h-full flex items-center justify-center relative",style:{minHeight:0},children:b.jsxs("svg",{width:"100%",height:"100%",viewBox:"0 0 364 95",preserveAspectRatio:"xMidYMid meet",style:{overflow:"visible"},children:[b.jsx("defs",{children:b.jsxs("linearGradient",{id:`gaugeGradient-${e}`,x1:"-74.8485",y1:"69.9316",x2:"437.878",y2:"69.9316",gradientUnits:"userSpaceOnUse",children:[b.jsx("stop",{offset:"0.0485284",stopColor:"#9CC5B6",stopOpacity:"0"}),b.jsx("stop",{offset:"0.474249",stopColor:"#79A598"}),b.jsx("stop",{offset:"1",stopColor:"#EDFFF9",stopOpacity:"0.57"})]})}),c&&b.jsx("path",{d:c,fill:`url(#gaugeGradient-${e})`}),b.jsx("g",{transform:`translate(${k}, ${j}) rotate(${M}) translate(-${_}, -${N})`,children:b.jsx("rect",{x:"0",y:"0",width:A,height:C,fill:"#685563",stroke:"white",strokeWidth:"4",rx:"4",ry:"4",style:{shapeRendering:"geometricPrecision"}})})]})})]})};function ir(e,t,{checkForDefaultPrevented:n=!0}={}){return function(i){if(e==null||e(i),n===!1||!i.defaultPrevented)return t==null?void 0:t(i)}}function Fw(e,t){if(typeof e=="function")return e(t);e!=null&&(e.current=t)}function QC(...e){return t=>{let n=!1;const r=e.map(i=>{const o=Fw(i,t);return!n&&typeof o=="function"&&(n=!0),o});if(n)return()=>{for(let i=0;i<r.length;i++){const o=r[i];typeof o=="function"?o():Fw(e[i],null)}}}}function ro(...e){return m.useCallback(QC(...e),e)}function JC(e,t=[]){let n=[];function r(o,a){const s=m.createContext(a),l=n.length;n=[...n,a];const u=f=>{var g;const{scope:d,children:p,...h}=f,v=((g=d==null?void 0:d[e])==null?void 0:g[l])||s,y=m.useMemo(()=>h,Object.values(h));return b.jsx(v.Provider,{value:y,children:p})};u.displayName=o+"Provider";function c(f,d){var v;const p=((v=d==null?void 0:d[e])==null?void 0:v[l])||s,h=m.useContext(p);if(h)return h;if(a!==void 0)return a;throw new Error(`\`${f}\` must be used within \`${o}\``)}return[u,c]}const i=()=>{const o=n.map(a=>m.createContext(a));return function(s){const l=(s==null?void 0:s[e])||o;return m.useMemo(()=>({[`__scope${e}`]:{...s,[e]:l}}),[s,l])}};return i.scopeName=e,[r,oU(i,...t)]}function oU(...e){const t=e[0];if(e.length===1)return t;const n=()=>{const r=e.map(i=>({useScope:i(),scopeName:i.scopeName}));return function(o){const a=r.reduce((s,{useScope:l,scopeName:u})=>{const f=l(o)[`__scope${u}`];return{...s,...f}},{});return m.useMemo(()=>({[`__scope${t.scopeName}`]:a}),[a])}};return n.scopeName=t.scopeName,n}function aU(e){const t=sU(e),n=m.forwardRef((r,i)=>{const{children:o,...a}=r,s=m.Children.toArray(o),l=s.find(uU);if(l){const u=l.props.children,c=s.map(f=>f===l?m.Children.count(u)>1?m.Children.only(null):m.isValidElement(u)?u.props.children:null:f);return b.jsx(t,{...a,ref:i,children:m.isValidElement(u)?m.cloneElement(u,void 0,c):null})}return b.jsx(t,{...a,ref:i,children:o})});return n.displayName=`${e}.Slot`,n}function sU(e){const t=m.forwardRef((n,r)=>{const{children:i,...o}=n;if(m.isValidElement(i)){const a=fU(i),s=cU(o,i.props);return i.type!==m.Fragment&&(s.ref=r?QC(r,a):a),m.cloneElement(i,s)}return m.Children.count(i)>1?m.Children.only(null):null});return t.displayName=`${e}.SlotClone`,t}var e_=Symbol("radix.slottable");function lU(e){const t=({children:n})=>b.jsx(b.Fragment,{children:n});return t.displayName=`${e}.Slottable`,t.__radixId=e_,t}function uU(e){return m.isValidElement(e)&&typeof e.type=="function"&&"__radixId"in e.type&&e.type.__radixId===e_}function cU(e,t){const n={...t};for(const r in t){const i=e[r],o=t[r];/^on[A-Z]/.test(r)?i&&o?n[r]=(...s)=>{const l=o(...s);return i(...s),l}:i&&(n[r]=i):r==="style"?n[r]={...i,...o}:r==="className"&&(n[r]=[i,o].filter(Boolean).join(" "))}return{...e,...n}}function fU(e){var r,i;let t=(r=Object.getOwnPropertyDescriptor(e.props,"ref"))==null?void 0:r.get,n=t&&"isReactWarning"in t&&t.isReactWarning;return n?e.ref:(t=(i=Object.getOwnPropertyDescriptor(e,"ref"))==null?void 0:i.get,n=t&&"isReactWarning"in t&&t.isReactWarning,n?e.props.ref:e.props.ref||e.ref)}var dU=["a","button","div","form","h2","h3","img","input","label","li","nav","ol","p","select","span","svg","ul"],yi=dU.reduce((e,t)=>{const n=aU(`Primitive.${t}`),r=m.forwardRef((i,o)=>{const{asChild:a,...s}=i,l=a?n:t;return typeof window<"u"&&(window[Symbol.for("radix-ui")]=!0),b.jsx(l,{...s,ref:o})});return r.displayName=`Primitive.${t}`,{...e,[t]:r}},{});function pU(e,t){e&&ia.flushSync(()=>e.dispatchEvent(t))}function Zf(e){const t=m.useRef(e);return m.useEffect(()=>{t.current=e}),m.useMemo(()=>(...n)=>{var r;return(r=t.current)==null?void 0:r.call(t,...n)},[])}function hU(e,t=globalThis==null?void 0:globalThis.document){const n=Zf(e);m.useEffect(()=>{const r=i=>{i.key==="Escape"&&n(i)};return t.addEventListener("keydown",r,{capture:!0}),()=>t.removeEventListener("keydown",r,{capture:!0})},[n,t])}var mU="DismissableLayer",Jh="dismissableLayer.update",vU="dismissableLayer.pointerDownOutside",gU="dismissableLayer.focusOutside",Bw,t_=m.createContext({layers:new Set,layersWithOutsidePointerEventsDisabled:new Set,branches:new Set}),n_=m.forwardRef((e,t)=>{const{disableOutsidePointerEvents:n=!1,onEscapeKeyDown:r,onPointerDownOutside:i,onFocusOutside:o,onInteractOutside:a,onDismiss:s,...l}=e,u=m.useContext(t_),[c,f]=m.useState(null),d=(c==null?void 0:c.ownerDocument)??(globalThis==null?void 0:globalThis.document),[,p]=m.useState({}),h=ro(t,k=>f(k)),v=Array.from(u.layers),[y]=[...u.layersWithOutsidePointerEventsDisabled].slice(-1),g=v.indexOf(y),x=c?v.indexOf(c):-1,w=u.layersWithOutsidePointerEventsDisabled.size>0,S=x>=g,P=wU(k=>{const j=k.target,M=[...u.branches].some(A=>A.contains(j));!S||M||(i==null||i(k),a==null||a(k),k.defaultPrevented||s==null||s())},d),O=bU(k=>{const j=k.target;[...u.branches].some(A=>A.contains(j))||(o==null||o(k),a==null||a(k),k.defaultPrevented||s==null||s())},d);return hU(k=>{x===u.layers.size-1&&(r==null||r(k),!k.defaultPrevented&&s&&(k.preventDefault(),s()))},d),m.useEffect(()=>{if(c)return n&&(u.layersWithOutsidePointerEventsDisabled.size===0&&(Bw=d.body.style.pointerEvents,d.body.style.pointerEvents="none"),u.layersWithOutsidePointerEventsDisabled.add(c)),u.layers.add(c),Uw(),()=>{n&&u.layersWithOutsidePointerEventsDisabled.size===1&&(d.body.style.pointerEvents=Bw)}},[c,d,n,u]),m.useEffect(()=>()=>{c&&(u.layers.delete(c),u.layersWithOutsidePointerEventsDisabled.delete(c),Uw())},[c,u]),m.useEffect(()=>{const k=()=>p({});return document.addEventListener(Jh,k),()=>document.removeEventListener(Jh,k)},[]),b.jsx(yi.div,{...l,ref:h,style:{pointerEvents:w?S?"auto":"none":void 0,...e.style},onFocusCapture:ir(e.onFocusCapture,O.onFocusCapture),onBlurCapture:ir(e.onBlurCapture,O.onBlurCapture),onPointerDownCapture:ir(e.onPointerDownCapture,P.onPointerDownCapture)})});n_.displayName=mU;var yU="DismissableLayerBranch",xU=m.forwardRef((e,t)=>{const n=m.useContext(t_),r=m.useRef(null),i=ro(t,r);return m.useEffect(()=>{const o=r.current;if(o)return n.branches.add(o),()=>{n.branches.delete(o)}},[n.branches]),b.jsx(yi.div,{...e,ref:i})});xU.displayName=yU;function wU(e,t=globalThis==null?void 0:globalThis.document){const n=Zf(e),r=m.useRef(!1),i=m.useRef(()=>{});return m.useEffect(()=>{const o=s=>{if(s.target&&!r.current){let l=function(){r_(vU,n,u,{discrete:!0})};const u={originalEvent:s};s.pointerType==="touch"?(t.removeEventListener("click",i.current),i.current=l,t.addEventListener("click",i.current,{once:!0})):l()}else t.removeEventListener("click",i.current);r.current=!1},a=window.setTimeout(()=>{t.addEventListener("pointerdown",o)},0);return()=>{window.clearTimeout(a),t.removeEventListener("pointerdown",o),t.removeEventListener("click",i.current)}},[t,n]),{onPointerDownCapture:()=>r.current=!0}}function bU(e,t=globalThis==null?void 0:globalThis.document){const n=Zf(e),r=m.useRef(!1);return m.useEffect(()=>{const i=o=>{o.target&&!r.current&&r_(gU,n,{originalEvent:o},{discrete:!1})};return t.addEventListener("focusin",i),()=>t.removeEventListener("focusin",i)},[t,n]),{onFocusCapture:()=>r.current=!0,onBlurCapture:()=>r.current=!1}}function Uw(){const e=new CustomEvent(Jh);document.dispatchEvent(e)}function r_(e,t,n,{discrete:r}){const i=n.originalEvent.target,o=new CustomEvent(e,{bubbles:!1,cancelable:!0,detail:n});t&&i.addEventListener(e,t,{once:!0}),r?pU(i,o):i.dispatchEvent(o)}var ci=globalThis!=null&&globalThis.document?m.useLayoutEffect:()=>{},SU=vm[" useId ".trim().toString()]||(()=>{}),PU=0;function OU(e){const[t,n]=m.useState(SU());return ci(()=>{e||n(r=>r??String(PU++))},[e]),e||(t?`radix-${t}`:"")}const EU=["top","right","bottom","left"],fi=Math.min,Ht=Math.max,Fc=Math.round,Ql=Math.floor,Kn=e=>({x:e,y:e}),kU={left:"right",right:"left",bottom:"top",top:"bottom"},CU={start:"end",end:"start"};function em(e,t,n){return Ht(e,fi(t,n))}function Or(e,t){return typeof e=="function"?e(t):e}function Er(e){return e.split("-")[0]}function ha(e){return e.split("-")[1]}function Kg(e){return e==="x"?"y":"x"}function Wg(e){return e==="y"?"height":"width"}const _U=new Set(["top","bottom"]);function Bn(e){return _U.has(Er(e))?"y":"x"}function Yg(e){return Kg(Bn(e))}function AU(e,t,n){n===void 0&&(n=!1);const r=ha(e),i=Yg(e),o=Wg(i);let a=i==="x"?r===(n?"end":"start")?"right":"left":r==="start"?"bottom":"top";return t.reference[o]>t.floating[o]&&(a=Bc(a)),[a,Bc(a)]}function jU(e){const t=Bc(e);return[tm(e),t,tm(t)]}function tm(e){return e.replace(/start|end/g,t=>CU[t])}const Vw=["left","right"],Hw=["right","left"],MU=["top","bottom"],TU=["bottom","top"];function $U(e,t,n){switch(e){case"top":case"bottom":return n?t?Hw:Vw:t?Vw:Hw;case"left":case"right":return t?MU:TU;default:return[]}}function IU(e,t,n,r){const i=ha(e);let o=$U(Er(e),n==="start",r);return i&&(o=o.map(a=>a+"-"+i),t&&(o=o.concat(o.map(tm)))),o}function Bc(e){return e.replace(/left|right|bottom|top/g,t=>kU[t])}function NU(e){return{top:0,right:0,bottom:0,left:0,...e}}function i_(e){return typeof e!="number"?NU(e):{top:e,right:e,bottom:e,left:e}}function Uc(e){const{x:t,y:n,width:r,height:i}=e;return{width:r,height:i,top:n,left:t,right:t+r,bottom:n+i,x:t,y:n}}function Kw(e,t,n){let{reference:r,floating:i}=e;const o=Bn(t),a=Yg(t),s=Wg(a),l=Er(t),u=o==="y",c=r.x+r.width/2-i.width/2,f=r.y+r.height/2-i.height/2,d=r[s]/2-i[s]/2;let p;switch(l){case"top":p={x:c,y:r.y-i.height};break;case"bottom":p={x:c,y:r.y+r.height};break;case"right":p={x:r.x+r.width,y:f};break;case"left":p={x:r.x-i.width,y:f};break;default:p={x:r.x,y:r.y}}switch(ha(t)){case"start":p[a]-=d*(n&&u?-1:1);break;case"end":p[a]+=d*(n&&u?-1:1);break}return p}const DU=async(e,t,n)=>{const{placement:r="bottom",strategy:i="absolute",middleware:o=[],platform:a}=n,s=o.filter(Boolean),l=await(a.isRTL==null?void 0:a.isRTL(t));let u=await a.getElementRects({reference:e,floating:t,strategy:i}),{x:c,y:f}=Kw(u,r,l),d=r,p={},h=0;for(let v=0;v<s.length;v++){const{name:y,fn:g}=s[v],{x,y:w,data:S,reset:P}=await g({x:c,y:f,initialPlacement:r,placement:d,strategy:i,middlewareData:p,rects:u,platform:a,elements:{reference:e,floating:t}});c=x??c,f=w??f,p={...p,[y]:{...p[y],...S}},P&&h<=50&&(h++,typeof P=="object"&&(P.placement&&(d=P.placement),P.rects&&(u=P.rects===!0?await a.getElementRects({reference:e,floating:t,strategy:i}):P.rects),{x:c,y:f}=Kw(u,d,l)),v=-1)}return{x:c,y:f,placement:d,strategy:i,middlewareData:p}};async function Ds(e,t){var n;t===void 0&&(t={});const{x:r,y:i,platform:o,rects:a,elements:s,strategy:l}=e,{boundary:u="clippingAncestors",rootBoundary:c="viewport",elementContext:f="floating",altBoundary:d=!1,padding:p=0}=Or(t,e),h=i_(p),y=s[d?f==="floating"?"reference":"floating":f],g=Uc(await o.getClippingRect({element:(n=await(o.isElement==null?void 0:o.isElement(y)))==null||n?y:y.contextElement||await(o.getDocumentElement==null?void 0:o.getDocumentElement(s.floating)),boundary:u,rootBoundary:c,strategy:l})),x=f==="floating"?{x:r,y:i,width:a.floating.width,height:a.floating.height}:a.reference,w=await(o.getOffsetParent==null?void 0:o.getOffsetParent(s.floating)),S=await(o.isElement==null?void 0:o.isElement(w))?await(o.getScale==null?void 0:o.getScale(w))||{x:1,y:1}:{x:1,y:1},P=Uc(o.convertOffsetParentRelativeRectToViewportRelativeRect?await o.convertOffsetParentRelativeRectToViewportRelativeRect({elements:s,rect:x,offsetParent:w,strategy:l}):x);return{top:(g.top-P.top+h.top)/S.y,bottom:(P.bottom-g.bottom+h.bottom)/S.y,left:(g.left-P.left+h.left)/S.x,right:(P.right-g.right+h.right)/S.x}}const RU=e=>({name:"arrow",options:e,async fn(t){const{x:n,y:r,placement:i,rects:o,platform:a,elements:s,middlewareData:l}=t,{element:u,padding:c=0}=Or(e,t)||{};if(u==null)return{};const f=i_(c),d={x:n,y:r},p=Yg(i),h=Wg(p),v=await a.getDimensions(u),y=p==="y",g=y?"top":"left",x=y?"bottom":"right",w=y?"clientHeight":"clientWidth",S=o.reference[h]+o.reference[p]-d[p]-o.floating[h],P=d[p]-o.reference[p],O=await(a.getOffsetParent==null?void 0:a.getOffsetParent(u));let k=O?O[w]:0;(!k||!await(a.isElement==null?void 0:a.isElement(O)))&&(k=s.floating[w]||o.floating[h]);const j=S/2-P/2,M=k/2-v[h]/2-1,A=fi(f[g],M),C=fi(f[x],M),_=A,N=k-v[h]-C,L=k/2-v[h]/2+j,V=em(_,L,N),B=!l.arrow&&ha(i)!=null&&L!==V&&o.reference[h]/2-(L<_?A:C)-v[h]/2<0,U=B?L<_?L-_:L-N:0;return{[p]:d[p]+U,data:{[p]:V,centerOffset:L-V-U,...B&&{alignmentOffset:U}},reset:B}}}),LU=function(e){return e===void 0&&(e={}),{name:"flip",options:e,async fn(t){var n,r;const{placement:i,middlewareData:o,rects:a,initialPlacement:s,platform:l,elements:u}=t,{mainAxis:c=!0,crossAxis:f=!0,fallbackPlacements:d,fallbackStrategy:p="bestFit",fallbackAxisSideDirection:h="none",flipAlignment:v=!0,...y}=Or(e,t);if((n=o.arrow)!=null&&n.alignmentOffset)return{};const g=Er(i),x=Bn(s),w=Er(s)===s,S=await(l.isRTL==null?void 0:l.isRTL(u.floating)),P=d||(w||!v?[Bc(s)]:jU(s)),O=h!=="none";!d&&O&&P.push(...IU(s,v,h,S));const k=[s,...P],j=await Ds(t,y),M=[];let A=((r=o.flip)==null?void 0:r.overflows)||[];if(c&&M.push(j[g]),f){const L=AU(i,a,S);M.push(j[L[0]],j[L[1]])}if(A=[...A,{placement:i,overflows:M}],!M.every(L=>L<=0)){var C,_;const L=(((C=o.flip)==null?void 0:C.index)||0)+1,V=k[L];if(V&&(!(f==="alignment"?x!==Bn(V):!1)||A.every($=>Bn($.placement)===x?$.overflows[0]>0:!0)))return{data:{index:L,overflows:A},reset:{placement:V}};let B=(_=A.filter(U=>U.overflows[0]<=0).sort((U,$)=>U.overflows[1]-$.overflows[1])[0])==null?void 0:_.placement;if(!B)switch(p){case"bestFit":{var N;const U=(N=A.filter($=>{if(O){const z=Bn($.placement);return z===x||z==="y"}return!0}).map($=>[$.placement,$.overflows.filter(z=>z>0).reduce((z,K)=>z+K,0)]).sort(($,z)=>$[1]-z[1])[0])==null?void 0:N[0];U&&(B=U);break}case"initialPlacement":B=s;break}if(i!==B)return{reset:{placement:B}}}return{}}}};function Ww(e,t){return{top:e.top-t.height,right:e.right-t.width,bottom:e.bottom-t.height,left:e.left-t.width}}function Yw(e){return EU.some(t=>e[t]>=0)}const zU=function(e){return e===void 0&&(e={}),{name:"hide",options:e,async fn(t){const{rects:n}=t,{strategy:r="referenceHidden",...i}=Or(e,t);switch(r){case"referenceHidden":{const o=await Ds(t,{...i,elementContext:"reference"}),a=Ww(o,n.reference);return{data:{referenceHiddenOffsets:a,referenceHidden:Yw(a)}}}case"escaped":{const o=await Ds(t,{...i,altBoundary:!0}),a=Ww(o,n.floating);return{data:{escapedOffsets:a,escaped:Yw(a)}}}default:return{}}}}},o_=new Set(["left","top"]);async function FU(e,t){const{placement:n,platform:r,elements:i}=e,o=await(r.isRTL==null?void 0:r.isRTL(i.floating)),a=Er(n),s=ha(n),l=Bn(n)==="y",u=o_.has(a)?-1:1,c=o&&l?-1:1,f=Or(t,e);let{mainAxis:d,crossAxis:p,alignmentAxis:h}=typeof f=="number"?{mainAxis:f,crossAxis:0,alignmentAxis:null}:{mainAxis:f.mainAxis||0,crossAxis:f.crossAxis||0,alignmentAxis:f.alignmentAxis};return s&&typeof h=="number"&&(p=s==="end"?h*-1:h),l?{x:p*c,y:d*u}:{x:d*u,y:p*c}}const BU=function(e){return e===void 0&&(e=0),{name:"offset",options:e,async fn(t){var n,r;const{x:i,y:o,placement:a,middlewareData:s}=t,l=await FU(t,e);return a===((n=s.offset)==null?void 0:n.placement)&&(r=s.arrow)!=null&&r.alignmentOffset?{}:{x:i+l.x,y:o+l.y,data:{...l,placement:a}}}}},UU=function(e){return e===void 0&&(e={}),{name:"shift",options:e,async fn(t){const{x:n,y:r,placement:i}=t,{mainAxis:o=!0,crossAxis:a=!1,limiter:s={fn:y=>{let{x:g,y:x}=y;return{x:g,y:x}}},...l}=Or(e,t),u={x:n,y:r},c=await Ds(t,l),f=Bn(Er(i)),d=Kg(f);let p=u[d],h=u[f];if(o){const y=d==="y"?"top":"left",g=d==="y"?"bottom":"right",x=p+c[y],w=p-c[g];p=em(x,p,w)}if(a){const y=f==="y"?"top":"left",g=f==="y"?"bottom":"right",x=h+c[y],w=h-c[g];h=em(x,h,w)}const v=s.fn({...t,[d]:p,[f]:h});return{...v,data:{x:v.x-n,y:v.y-r,enabled:{[d]:o,[f]:a}}}}}},VU=function(e){return e===void 0&&(e={}),{options:e,fn(t){const{x:n,y:r,placement:i,rects:o,middlewareData:a}=t,{offset:s=0,mainAxis:l=!0,crossAxis:u=!0}=Or(e,t),c={x:n,y:r},f=Bn(i),d=Kg(f);let p=c[d],h=c[f];const v=Or(s,t),y=typeof v=="number"?{mainAxis:v,crossAxis:0}:{mainAxis:0,crossAxis:0,...v};if(l){const w=d==="y"?"height":"width",S=o.reference[d]-o.floating[w]+y.mainAxis,P=o.reference[d]+o.reference[w]-y.mainAxis;p<S?p=S:p>P&&(p=P)}if(u){var g,x;const w=d==="y"?"width":"height",S=o_.has(Er(i)),P=o.reference[f]-o.floating[w]+(S&&((g=a.offset)==null?void 0:g[f])||0)+(S?0:y.crossAxis),O=o.reference[f]+o.reference[w]+(S?0:((x=a.offset)==null?void 0:x[f])||0)-(S?y.crossAxis:0);h<P?h=P:h>O&&(h=O)}return{[d]:p,[f]:h}}}},HU=function(e){return e===void 0&&(e={}),{name:"size",options:e,async fn(t){var n,r;const{placement:i,rects:o,platform:a,elements:s}=t,{apply:l=()=>{},...u}=Or(e,t),c=await Ds(t,u),f=Er(i),d=ha(i),p=Bn(i)==="y",{width:h,height:v}=o.floating;let y,g;f==="top"||f==="bottom"?(y=f,g=d===(await(a.isRTL==null?void 0:a.isRTL(s.floating))?"start":"end")?"left":"right"):(g=f,y=d==="end"?"top":"bottom");const x=v-c.top-c.bottom,w=h-c.left-c.right,S=fi(v-c[y],x),P=fi(h-c[g],w),O=!t.middlewareData.shift;let k=S,j=P;if((n=t.middlewareData.shift)!=null&&n.enabled.x&&(j=w),(r=t.middlewareData.shift)!=null&&r.enabled.y&&(k=x),O&&!d){const A=Ht(c.left,0),C=Ht(c.right,0),_=Ht(c.top,0),N=Ht(c.bottom,0);p?j=h-2*(A!==0||C!==0?A+C:Ht(c.left,c.right)):k=v-2*(_!==0||N!==0?_+N:Ht(c.top,c.bottom))}await l({...t,availableWidth:j,availableHeight:k});const M=await a.getDimensions(s.floating);return h!==M.width||v!==M.height?{reset:{rects:!0}}:{}}}};function Qf(){return typeof window<"u"}function ma(e){return a_(e)?(e.nodeName||"").toLowerCase():"#document"}function Xt(e){var t;return(e==null||(t=e.ownerDocument)==null?void 0:t.defaultView)||window}function Jn(e){var t;return(t=(a_(e)?e.ownerDocument:e.document)||window.document)==null?void 0:t.documentElement}function a_(e){return Qf()?e instanceof Node||e instanceof Xt(e).Node:!1}function Tn(e){return Qf()?e instanceof Element||e instanceof Xt(e).Element:!1}function Gn(e){return Qf()?e instanceof HTMLElement||e instanceof Xt(e).HTMLElement:!1}function qw(e){return!Qf()||typeof ShadowRoot>"u"?!1:e instanceof ShadowRoot||e instanceof Xt(e).ShadowRoot}const KU=new Set(["inline","contents"]);function cl(e){const{overflow:t,overflowX:n,overflowY:r,display:i}=$n(e);return/auto|scroll|overlay|hidden|clip/.test(t+r+n)&&!KU.has(i)}const WU=new Set(["table","td","th"]);function YU(e){return WU.has(ma(e))}const qU=[":popover-open",":modal"];function Jf(e){return qU.some(t=>{try{return e.matches(t)}catch{return!1}})}const GU=["transform","translate","scale","rotate","perspective"],XU=["transform","translate","scale","rotate","perspective","filter"],ZU=["paint","layout","strict","content"];function qg(e){const t=Gg(),n=Tn(e)?$n(e):e;return GU.some(r=>n[r]?n[r]!=="none":!1)||(n.containerType?n.containerType!=="normal":!1)||!t&&(n.backdropFilter?n.backdropFilter!=="none":!1)||!t&&(n.filter?n.filter!=="none":!1)||XU.some(r=>(n.willChange||"").includes(r))||ZU.some(r=>(n.contain||"").includes(r))}function QU(e){let t=di(e);for(;Gn(t)&&!Jo(t);){if(qg(t))return t;if(Jf(t))return null;t=di(t)}return null}function Gg(){return typeof CSS>"u"||!CSS.supports?!1:CSS.supports("-webkit-backdrop-filter","none")}const JU=new Set(["html","body","#document"]);function Jo(e){return JU.has(ma(e))}function $n(e){return Xt(e).getComputedStyle(e)}function ed(e){return Tn(e)?{scrollLeft:e.scrollLeft,scrollTop:e.scrollTop}:{scrollLeft:e.scrollX,scrollTop:e.scrollY}}function di(e){if(ma(e)==="html")return e;const t=e.assignedSlot||e.parentNode||qw(e)&&e.host||Jn(e);return qw(t)?t.host:t}function s_(e){const t=di(e);return Jo(t)?e.ownerDocument?e.ownerDocument.body:e.body:Gn(t)&&cl(t)?t:s_(t)}function Rs(e,t,n){var r;t===void 0&&(t=[]),n===void 0&&(n=!0);const i=s_(e),o=i===((r=e.ownerDocument)==null?void 0:r.body),a=Xt(i);if(o){const s=nm(a);return t.concat(a,a.visualViewport||[],cl(i)?i:[],s&&n?Rs(s):[])}return t.concat(i,Rs(i,[],n))}function nm(e){return e.parent&&Object.getPrototypeOf(e.parent)?e.frameElement:null}function l_(e){const t=$n(e);let n=parseFloat(t.width)||0,r=parseFloat(t.height)||0;const i=Gn(e),o=i?e.offsetWidth:n,a=i?e.offsetHeight:r,s=Fc(n)!==o||Fc(r)!==a;return s&&(n=o,r=a),{width:n,height:r,$:s}}function Xg(e){return Tn(e)?e:e.contextElement}function Lo(e){const t=Xg(e);if(!Gn(t))return Kn(1);const n=t.getBoundingClientRect(),{width:r,height:i,$:o}=l_(t);let a=(o?Fc(n.width):n.width)/r,s=(o?Fc(n.height):n.height)/i;return(!a||!Number.isFinite(a))&&(a=1),(!s||!Number.isFinite(s))&&(s=1),{x:a,y:s}}const eV=Kn(0);function u_(e){const t=Xt(e);return!Gg()||!t.visualViewport?eV:{x:t.visualViewport.offsetLeft,y:t.visualViewport.offsetTop}}function tV(e,t,n){return t===void 0&&(t=!1),!n||t&&n!==Xt(e)?!1:t}function Zi(e,t,n,r){t===void 0&&(t=!1),n===void 0&&(n=!1);const i=e.getBoundingClientRect(),o=Xg(e);let a=Kn(1);t&&(r?Tn(r)&&(a=Lo(r)):a=Lo(e));const s=tV(o,n,r)?u_(o):Kn(0);let l=(i.left+s.x)/a.x,u=(i.top+s.y)/a.y,c=i.width/a.x,f=i.height/a.y;if(o){const d=Xt(o),p=r&&Tn(r)?Xt(r):r;let h=d,v=nm(h);for(;v&&r&&p!==h;){const y=Lo(v),g=v.getBoundingClientRect(),x=$n(v),w=g.left+(v.clientLeft+parseFloat(x.paddingLeft))*y.x,S=g.top+(v.clientTop+parseFloat(x.paddingTop))*y.y;l*=y.x,u*=y.y,c*=y.x,f*=y.y,l+=w,u+=S,h=Xt(v),v=nm(h)}}return Uc({width:c,height:f,x:l,y:u})}function td(e,t){const n=ed(e).scrollLeft;return t?t.left+n:Zi(Jn(e)).left+n}function c_(e,t){const n=e.getBoundingClientRect(),r=n.left+t.scrollLeft-td(e,n),i=n.top+t.scrollTop;return{x:r,y:i}}function nV(e){let{elements:t,rect:n,offsetParent:r,strategy:i}=e;const o=i==="fixed",a=Jn(r),s=t?Jf(t.floating):!1;if(r===a||s&&o)return n;let l={scrollLeft:0,scrollTop:0},u=Kn(1);const c=Kn(0),f=Gn(r);if((f||!f&&!o)&&((ma(r)!=="body"||cl(a))&&(l=ed(r)),Gn(r))){const p=Zi(r);u=Lo(r),c.x=p.x+r.clientLeft,c.y=p.y+r.clientTop}const d=a&&!f&&!o?c_(a,l):Kn(0);return{width:n.width*u.x,height:n.height*u.y,x:n.x*u.x-l.scrollLeft*u.x+c.x+d.x,y:n.y*u.y-l.scrollTop*u.y+c.y+d.y}}function rV(e){return Array.from(e.getClientRects())}function iV(e){const t=Jn(e),n=ed(e),r=e.ownerDocument.body,i=Ht(t.scrollWidth,t.clientWidth,r.scrollWidth,r.clientWidth),o=Ht(t.scrollHeight,t.clientHeight,r.scrollHeight,r.clientHeight);let a=-n.scrollLeft+td(e);const s=-n.scrollTop;return $n(r).direction==="rtl"&&(a+=Ht(t.clientWidth,r.clientWidth)-i),{width:i,height:o,x:a,y:s}}const Gw=25;function oV(e,t){const n=Xt(e),r=Jn(e),i=n.visualViewport;let o=r.clientWidth,a=r.clientHeight,s=0,l=0;if(i){o=i.width,a=i.height;const c=Gg();(!c||c&&t==="fixed")&&(s=i.offsetLeft,l=i.offsetTop)}const u=td(r);if(u<=0){const c=r.ownerDocument,f=c.body,d=getComputedStyle(f),p=c.compatMode==="CSS1Compat"&&parseFloat(d.marginLeft)+parseFloat(d.marginRight)||0,h=Math.abs(r.clientWidth-f.clientWidth-p);h<=Gw&&(o-=h)}else u<=Gw&&(o+=u);return{width:o,height:a,x:s,y:l}}const aV=new Set(["absolute","fixed"]);function sV(e,t){const n=Zi(e,!0,t==="fixed"),r=n.top+e.clientTop,i=n.left+e.clientLeft,o=Gn(e)?Lo(e):Kn(1),a=e.clientWidth*o.x,s=e.clientHeight*o.y,l=i*o.x,u=r*o.y;return{width:a,height:s,x:l,y:u}}function Xw(e,t,n){let r;if(t==="viewport")r=oV(e,n);else if(t==="document")r=iV(Jn(e));else if(Tn(t))r=sV(t,n);else{const i=u_(e);r={x:t.x-i.x,y:t.y-i.y,width:t.width,height:t.height}}return Uc(r)}function f_(e,t){const n=di(e);return n===t||!Tn(n)||Jo(n)?!1:$n(n).position==="fixed"||f_(n,t)}function lV(e,t){const n=t.get(e);if(n)return n;let r=Rs(e,[],!1).filter(s=>Tn(s)&&ma(s)!=="body"),i=null;const o=$n(e).position==="fixed";let a=o?di(e):e;for(;Tn(a)&&!Jo(a);){const s=$n(a),l=qg(a);!l&&s.position==="fixed"&&(i=null),(o?!l&&!i:!l&&s.position==="static"&&!!i&&aV.has(i.position)||cl(a)&&!l&&f_(e,a))?r=r.filter(c=>c!==a):i=s,a=di(a)}return t.set(e,r),r}function uV(e){let{element:t,boundary:n,rootBoundary:r,strategy:i}=e;const a=[...n==="clippingAncestors"?Jf(t)?[]:lV(t,this._c):[].concat(n),r],s=a[0],l=a.reduce((u,c)=>{const f=Xw(t,c,i);return u.top=Ht(f.top,u.top),u.right=fi(f.right,u.right),u.bottom=fi(f.bottom,u.bottom),u.left=Ht(f.left,u.left),u},Xw(t,s,i));return{width:l.right-l.left,height:l.bottom-l.top,x:l.left,y:l.top}}function cV(e){const{width:t,height:n}=l_(e);return{width:t,height:n}}function fV(e,t,n){const r=Gn(t),i=Jn(t),o=n==="fixed",a=Zi(e,!0,o,t);let s={scrollLeft:0,scrollTop:0};const l=Kn(0);function u(){l.x=td(i)}if(r||!r&&!o)if((ma(t)!=="body"||cl(i))&&(s=ed(t)),r){const p=Zi(t,!0,o,t);l.x=p.x+t.clientLeft,l.y=p.y+t.clientTop}else i&&u();o&&!r&&i&&u();const c=i&&!r&&!o?c_(i,s):Kn(0),f=a.left+s.scrollLeft-l.x-c.x,d=a.top+s.scrollTop-l.y-c.y;return{x:f,y:d,width:a.width,height:a.height}}function ip(e){return $n(e).position==="static"}function Zw(e,t){if(!Gn(e)||$n(e).position==="fixed")return null;if(t)return t(e);let n=e.offsetParent;return Jn(e)===n&&(n=n.ownerDocument.body),n}function d_(e,t){const n=Xt(e);if(Jf(e))return n;if(!Gn(e)){let i=di(e);for(;i&&!Jo(i);){if(Tn(i)&&!ip(i))return i;i=di(i)}return n}let r=Zw(e,t);for(;r&&YU(r)&&ip(r);)r=Zw(r,t);return r&&Jo(r)&&ip(r)&&!qg(r)?n:r||QU(e)||n}const dV=async function(e){const t=this.getOffsetParent||d_,n=this.getDimensions,r=await n(e.floating);return{reference:fV(e.reference,await t(e.floating),e.strategy),floating:{x:0,y:0,width:r.width,height:r.height}}};function pV(e){return $n(e).direction==="rtl"}const hV={convertOffsetParentRelativeRectToViewportRelativeRect:nV,getDocumentElement:Jn,getClippingRect:uV,getOffsetParent:d_,getElementRects:dV,getClientRects:rV,getDimensions:cV,getScale:Lo,isElement:Tn,isRTL:pV};function p_(e,t){return e.x===t.x&&e.y===t.y&&e.width===t.width&&e.height===t.height}function mV(e,t){let n=null,r;const i=Jn(e);function o(){var s;clearTimeout(r),(s=n)==null||s.disconnect(),n=null}function a(s,l){s===void 0&&(s=!1),l===void 0&&(l=1),o();const u=e.getBoundingClientRect(),{left:c,top:f,width:d,height:p}=u;if(s||t(),!d||!p)return;const h=Ql(f),v=Ql(i.clientWidth-(c+d)),y=Ql(i.clientHeight-(f+p)),g=Ql(c),w={rootMargin:-h+"px "+-v+"px "+-y+"px "+-g+"px",threshold:Ht(0,fi(1,l))||1};let S=!0;function P(O){const k=O[0].intersectionRatio;if(k!==l){if(!S)return a();k?a(!1,k):r=setTimeout(()=>{a(!1,1e-7)},1e3)}k===1&&!p_(u,e.getBoundingClientRect())&&a(),S=!1}try{n=new IntersectionObserver(P,{...w,root:i.ownerDocument})}catch{n=new IntersectionObserver(P,w)}n.observe(e)}return a(!0),o}function vV(e,t,n,r){r===void 0&&(r={});const{ancestorScroll:i=!0,ancestorResize:o=!0,elementResize:a=typeof ResizeObserver=="function",layoutShift:s=typeof IntersectionObserver=="function",animationFrame:l=!1}=r,u=Xg(e),c=i||o?[...u?Rs(u):[],...Rs(t)]:[];c.forEach(g=>{i&&g.addEventListener("scroll",n,{passive:!0}),o&&g.addEventListener("resize",n)});const f=u&&s?mV(u,n):null;let d=-1,p=null;a&&(p=new ResizeObserver(g=>{let[x]=g;x&&x.target===u&&p&&(p.unobserve(t),cancelAnimationFrame(d),d=requestAnimationFrame(()=>{var w;(w=p)==null||w.observe(t)})),n()}),u&&!l&&p.observe(u),p.observe(t));let h,v=l?Zi(e):null;l&&y();function y(){const g=Zi(e);v&&!p_(v,g)&&n(),v=g,h=requestAnimationFrame(y)}return n(),()=>{var g;c.forEach(x=>{i&&x.removeEventListener("scroll",n),o&&x.removeEventListener("resize",n)}),f==null||f(),(g=p)==null||g.disconnect(),p=null,l&&cancelAnimationFrame(h)}}const gV=BU,yV=UU,xV=LU,wV=HU,bV=zU,Qw=RU,SV=VU,PV=(e,t,n)=>{const r=new Map,i={platform:hV,...n},o={...i.platform,_c:r};return DU(e,t,{...i,platform:o})};var OV=typeof document<"u",EV=function(){},Su=OV?m.useLayoutEffect:EV;function Vc(e,t){if(e===t)return!0;if(typeof e!=typeof t)return!1;if(typeof e=="function"&&e.toString()===t.toString())return!0;let n,r,i;if(e&&t&&typeof e=="object"){if(Array.isArray(e)){if(n=e.length,n!==t.length)return!1;for(r=n;r--!==0;)if(!Vc(e[r],t[r]))return!1;return!0}if(i=Object.keys(e),n=i.length,n!==Object.keys(t).length)return!1;for(r=n;r--!==0;)if(!{}.hasOwnProperty.call(t,i[r]))return!1;for(r=n;r--!==0;){const o=i[r];if(!(o==="_owner"&&e.$$typeof)&&!Vc(e[o],t[o]))return!1}return!0}return e!==e&&t!==t}function h_(e){return typeof window>"u"?1:(e.ownerDocument.defaultView||window).devicePixelRatio||1}function Jw(e,t){const n=h_(e);return Math.round(t*n)/n}function op(e){const t=m.useRef(e);return Su(()=>{t.current=e}),t}function kV(e){e===void 0&&(e={});const{placement:t="bottom",strategy:n="absolute",middleware:r=[],platform:i,elements:{reference:o,floating:a}={},transform:s=!0,whileElementsMounted:l,open:u}=e,[c,f]=m.useState({x:0,y:0,strategy:n,placement:t,middlewareData:{},isPositioned:!1}),[d,p]=m.useState(r);Vc(d,r)||p(r);const[h,v]=m.useState(null),[y,g]=m.useState(null),x=m.useCallback($=>{$!==O.current&&(O.current=$,v($))},[]),w=m.useCallback($=>{$!==k.current&&(k.current=$,g($))},[]),S=o||h,P=a||y,O=m.useRef(null),k=m.useRef(null),j=m.useRef(c),M=l!=null,A=op(l),C=op(i),_=op(u),N=m.useCallback(()=>{if(!O.current||!k.current)return;const $={placement:t,strategy:n,middleware:d};C.current&&($.platform=C.current),PV(O.current,k.current,$).then(z=>{const K={...z,isPositioned:_.current!==!1};L.current&&!Vc(j.current,K)&&(j.current=K,ia.flushSync(()=>{f(K)}))})},[d,t,n,C,_]);Su(()=>{u===!1&&j.current.isPositioned&&(j.current.isPositioned=!1,f($=>({...$,isPositioned:!1})))},[u]);const L=m.useRef(!1);Su(()=>(L.current=!0,()=>{L.current=!1}),[]),Su(()=>{if(S&&(O.current=S),P&&(k.current=P),S&&P){if(A.current)return A.current(S,P,N);N()}},[S,P,N,A,M]);const V=m.useMemo(()=>({reference:O,floating:k,setReference:x,setFloating:w}),[x,w]),B=m.useMemo(()=>({reference:S,floating:P}),[S,P]),U=m.useMemo(()=>{const $={position:n,left:0,top:0};if(!B.floating)return $;const z=Jw(B.floating,c.x),K=Jw(B.floating,c.y);return s?{...$,transform:"translate("+z+"px, "+K+"px)",...h_(B.floating)>=1.5&&{willChange:"transform"}}:{position:n,left:z,top:K}},[n,s,B.floating,c.x,c.y]);return m.useMemo(()=>({...c,update:N,refs:V,elements:B,floatingStyles:U}),[c,N,V,B,U])}const CV=e=>{function t(n){return{}.hasOwnProperty.call(n,"current")}return{name:"arrow",options:e,fn(n){const{element:r,padding:i}=typeof e=="function"?e(n):e;return r&&t(r)?r.current!=null?Qw({element:r.current,padding:i}).fn(n):{}:r?Qw({element:r,padding:i}).fn(n):{}}}},_V=(e,t)=>({...gV(e),options:[e,t]}),AV=(e,t)=>({...yV(e),options:[e,t]}),jV=(e,t)=>({...SV(e),options:[e,t]}),MV=(e,t)=>({...xV(e),options:[e,t]}),TV=(e,t)=>({...wV(e),options:[e,t]}),$V=(e,t)=>({...bV(e),options:[e,t]}),IV=(e,t)=>({...CV(e),options:[e,t]});var NV="Arrow",m_=m.forwardRef((e,t)=>{const{children:n,width:r=10,height:i=5,...o}=e;return b.jsx(yi.svg,{...o,ref:t,width:r,height:i,viewBox:"0 0 30 10",preserveAspectRatio:"none",children:e.asChild?n:b.jsx("polygon",{points:"0,0 30,0 15,10"})})});m_.displayName=NV;var DV=m_;function RV(e){const[t,n]=m.useState(void 0);return ci(()=>{if(e){n({width:e.offsetWidth,height:e.offsetHeight});const r=new ResizeObserver(i=>{if(!Array.isArray(i)||!i.length)return;const o=i[0];let a,s;if("borderBoxSize"in o){const l=o.borderBoxSize,u=Array.isArray(l)?l[0]:l;a=u.inlineSize,s=u.blockSize}else a=e.offsetWidth,s=e.offsetHeight;n({width:a,height:s})});return r.observe(e,{box:"border-box"}),()=>r.unobserve(e)}else n(void 0)},[e]),t}var Zg="Popper",[v_,g_]=JC(Zg),[LV,y_]=v_(Zg),x_=e=>{const{__scopePopper:t,children:n}=e,[r,i]=m.useState(null);return b.jsx(LV,{scope:t,anchor:r,onAnchorChange:i,children:n})};x_.displayName=Zg;var w_="PopperAnchor",b_=m.forwardRef((e,t)=>{const{__scopePopper:n,virtualRef:r,...i}=e,o=y_(w_,n),a=m.useRef(null),s=ro(t,a),l=m.useRef(null);return m.useEffect(()=>{const u=l.current;l.current=(r==null?void 0:r.current)||a.current,u!==l.current&&o.onAnchorChange(l.current)}),r?null:b.jsx(yi.div,{...i,ref:s})});b_.displayName=w_;var Qg="PopperContent",[zV,FV]=v_(Qg),S_=m.forwardRef((e,t)=>{var ne,Z,D,H,q,R;const{__scopePopper:n,side:r="bottom",sideOffset:i=0,align:o="center",alignOffset:a=0,arrowPadding:s=0,avoidCollisions:l=!0,collisionBoundary:u=[],collisionPadding:c=0,sticky:f="partial",hideWhenDetached:d=!1,updatePositionStrategy:p="optimized",onPlaced:h,...v}=e,y=y_(Qg,n),[g,x]=m.useState(null),w=ro(t,G=>x(G)),[S,P]=m.useState(null),O=RV(S),k=(O==null?void 0:O.width)??0,j=(O==null?void 0:O.height)??0,M=r+(o!=="center"?"-"+o:""),A=typeof c=="number"?c:{top:0,right:0,bottom:0,left:0,...c},C=Array.isArray(u)?u:[u],_=C.length>0,N={padding:A,boundary:C.filter(UV),altBoundary:_},{refs:L,floatingStyles:V,placement:B,isPositioned:U,middlewareData:$}=kV({strategy:"fixed",placement:M,whileElementsMounted:(...G)=>vV(...G,{animationFrame:p==="always"}),elements:{reference:y.anchor},middleware:[_V({mainAxis:i+j,alignmentAxis:a}),l&&AV({mainAxis:!0,crossAxis:!1,limiter:f==="partial"?jV():void 0,...N}),l&&MV({...N}),TV({...N,apply:({elements:G,rects:ee,availableWidth:te,availableHeight:ce})=>{const{width:ge,height:je}=ee.reference,Ve=G.floating.style;Ve.setProperty("--radix-popper-available-width",`${te}px`),Ve.setProperty("--radix-popper-available-height",`${ce}px`),Ve.setProperty("--radix-popper-anchor-width",`${ge}px`),Ve.setProperty("--radix-popper-anchor-height",`${je}px`)}}),S&&IV({element:S,padding:s}),VV({arrowWidth:k,arrowHeight:j}),d&&$V({strategy:"referenceHidden",...N})]}),[z,K]=E_(B),X=Zf(h);ci(()=>{U&&(X==null||X())},[U,X]);const re=(ne=$.arrow)==null?void 0:ne.x,Se=(Z=$.arrow)==null?void 0:Z.y,le=((D=$.arrow)==null?void 0:D.centerOffset)!==0,[se,de]=m.useState();return ci(()=>{g&&de(window.getComputedStyle(g).zIndex)},[g]),b.jsx("div",{ref:L.setFloating,"data-radix-popper-content-wrapper":"",style:{...V,transform:U?V.transform:"translate(0, -200%)",minWidth:"max-content",zIndex:se,"--radix-popper-transform-origin":[(H=$.transformOrigin)==null?void 0:H.x,(q=$.transformOrigin)==null?void 0:q.y].join(" "),...((R=$.hide)==null?void 0:R.referenceHidden)&&{visibility:"hidden",pointerEvents:"none"}},dir:e.dir,children:b.jsx(zV,{scope:n,placedSide:z,onArrowChange:P,arrowX:re,arrowY:Se,shouldHideArrow:le,children:b.jsx(yi.div,{"data-side":z,"data-align":K,...v,ref:w,style:{...v.style,animation:U?void 0:"none"}})})})});S_.displayName=Qg;var P_="PopperArrow",BV={top:"bottom",right:"left",bottom:"top",left:"right"},O_=m.forwardRef(function(t,n){const{__scopePopper:r,...i}=t,o=FV(P_,r),a=BV[o.placedSide];return b.jsx("span",{ref:o.onArrowChange,style:{position:"absolute",left:o.arrowX,top:o.arrowY,[a]:0,transformOrigin:{top:"",right:"0 0",bottom:"center 0",left:"100% 0"}[o.placedSide],transform:{top:"translateY(100%)",right:"translateY(50%) rotate(90deg) translateX(-50%)",bottom:"rotate(180deg)",left:"translateY(50%) rotate(-90deg) translateX(50%)"}[o.placedSide],visibility:o.shouldHideArrow?"hidden":void 0},children:b.jsx(DV,{...i,ref:n,style:{...i.style,display:"block"}})})});O_.displayName=P_;function UV(e){return e!==null}var VV=e=>({name:"transformOrigin",options:e,fn(t){var y,g,x;const{placement:n,rects:r,middlewareData:i}=t,a=((y=i.arrow)==null?void 0:y.centerOffset)!==0,s=a?0:e.arrowWidth,l=a?0:e.arrowHeight,[u,c]=E_(n),f={start:"0%",center:"50%",end:"100%"}[c],d=(((g=i.arrow)==null?void 0:g.x)??0)+s/2,p=(((x=i.arrow)==null?void 0:x.y)??0)+l/2;let h="",v="";return u==="bottom"?(h=a?f:`${d}px`,v=`${-l}px`):u==="top"?(h=a?f:`${d}px`,v=`${r.floating.height+l}px`):u==="right"?(h=`${-l}px`,v=a?f:`${p}px`):u==="left"&&(h=`${r.floating.width+l}px`,v=a?f:`${p}px`),{data:{x:h,y:v}}}});function E_(e){const[t,n="center"]=e.split("-");return[t,n]}var HV=x_,KV=b_,WV=S_,YV=O_,qV="Portal",k_=m.forwardRef((e,t)=>{var s;const{container:n,...r}=e,[i,o]=m.useState(!1);ci(()=>o(!0),[]);const a=n||i&&((s=globalThis==null?void 0:globalThis.document)==null?void 0:s.body);return a?mT.createPortal(b.jsx(yi.div,{...r,ref:t}),a):null});k_.displayName=qV;function GV(e,t){return m.useReducer((n,r)=>t[n][r]??n,e)}var Jg=e=>{const{present:t,children:n}=e,r=XV(t),i=typeof n=="function"?n({present:r.isPresent}):m.Children.only(n),o=ro(r.ref,ZV(i));return typeof n=="function"||r.isPresent?m.cloneElement(i,{ref:o}):null};Jg.displayName="Presence";function XV(e){const[t,n]=m.useState(),r=m.useRef(null),i=m.useRef(e),o=m.useRef("none"),a=e?"mounted":"unmounted",[s,l]=GV(a,{mounted:{UNMOUNT:"unmounted",ANIMATION_OUT:"unmountSuspended"},unmountSuspended:{MOUNT:"mounted",ANIMATION_END:"unmounted"},unmounted:{MOUNT:"mounted"}});return m.useEffect(()=>{const u=Jl(r.current);o.current=s==="mounted"?u:"none"},[s]),ci(()=>{const u=r.current,c=i.current;if(c!==e){const d=o.current,p=Jl(u);e?l("MOUNT"):p==="none"||(u==null?void 0:u.display)==="none"?l("UNMOUNT"):l(c&&d!==p?"ANIMATION_OUT":"UNMOUNT"),i.current=e}},[e,l]),ci(()=>{if(t){let u;const c=t.ownerDocument.defaultView??window,f=p=>{const v=Jl(r.current).includes(CSS.escape(p.animationName));if(p.target===t&&v&&(l("ANIMATION_END"),!i.current)){const y=t.style.animationFillMode;t.style.animationFillMode="forwards",u=c.setTimeout(()=>{t.style.animationFillMode==="forwards"&&(t.style.animationFillMode=y)})}},d=p=>{p.target===t&&(o.current=Jl(r.current))};return t.addEventListener("animationstart",d),t.addEventListener("animationcancel",f),t.addEventListener("animationend",f),()=>{c.clearTimeout(u),t.removeEventListener("animationstart",d),t.removeEventListener("animationcancel",f),t.removeEventListener("animationend",f)}}else l("ANIMATION_END")},[t,l]),{isPresent:["mounted","unmountSuspended"].includes(s),ref:m.useCallback(u=>{r.current=u?getComputedStyle(u):null,n(u)},[])}}function Jl(e){return(e==null?void 0:e.animationName)||"none"}function ZV(e){var r,i;let t=(r=Object.getOwnPropertyDescriptor(e.props,"ref"))==null?void 0:r.get,n=t&&"isReactWarning"in t&&t.isReactWarning;return n?e.ref:(t=(i=Object.getOwnPropertyDescriptor(e,"ref"))==null?void 0:i.get,n=t&&"isReactWarning"in t&&t.isReactWarning,n?e.props.ref:e.props.ref||e.ref)}var QV=vm[" useInsertionEffect ".trim().toString()]||ci;function JV({prop:e,defaultProp:t,onChange:n=()=>{},caller:r}){const[i,o,a]=eH({defaultProp:t,onChange:n}),s=e!==void 0,l=s?e:i;{const c=m.useRef(e!==void 0);m.useEffect(()=>{const f=c.current;f!==s&&console.warn(`${r} is changing from ${f?"controlled":"uncontrolled"} to ${s?"controlled":"uncontrolled"}. Components should not switch from controlled to uncontrolled (or vice versa). Decide between using a controlled or uncontrolled value for the lifetime of the component.`),c.current=s},[s,r])}const u=m.useCallback(c=>{var f;if(s){const d=tH(c)?c(e):c;d!==e&&((f=a.current)==null||f.call(a,d))}else o(c)},[s,e,o,a]);return[l,u]}function eH({defaultProp:e,onChange:t}){const[n,r]=m.useState(e),i=m.useRef(n),o=m.useRef(t);return QV(()=>{o.current=t},[t]),m.useEffect(()=>{var a;i.current!==n&&((a=o.current)==null||a.call(o,n),i.current=n)},[n,i]),[n,r,o]}function tH(e){return typeof e=="function"}var nH=Object.freeze({position:"absolute",border:0,width:1,height:1,padding:0,margin:-1,overflow:"hidden",clip:"rect(0, 0, 0, 0)",whiteSpace:"nowrap",wordWrap:"normal"}),rH="VisuallyHidden",C_=m.forwardRef((e,t)=>b.jsx(yi.span,{...e,ref:t,style:{...nH,...e.style}}));C_.displayName=rH;var iH=C_,[nd,_W]=JC("Tooltip",[g_]),rd=g_(),__="TooltipProvider",oH=700,rm="tooltip.open",[aH,ey]=nd(__),A_=e=>{const{__scopeTooltip:t,delayDuration:n=oH,skipDelayDuration:r=300,disableHoverableContent:i=!1,children:o}=e,a=m.useRef(!0),s=m.useRef(!1),l=m.useRef(0);return m.useEffect(()=>{const u=l.current;return()=>window.clearTimeout(u)},[]),b.jsx(aH,{scope:t,isOpenDelayedRef:a,delayDuration:n,onOpen:m.useCallback(()=>{window.clearTimeout(l.current),a.current=!1},[]),onClose:m.useCallback(()=>{window.clearTimeout(l.current),l.current=window.setTimeout(()=>a.current=!0,r)},[r]),isPointerInTransitRef:s,onPointerInTransitChange:m.useCallback(u=>{s.current=u},[]),disableHoverableContent:i,children:o})};A_.displayName=__;var Ls="Tooltip",[sH,fl]=nd(Ls),j_=e=>{const{__scopeTooltip:t,children:n,open:r,defaultOpen:i,onOpenChange:o,disableHoverableContent:a,delayDuration:s}=e,l=ey(Ls,e.__scopeTooltip),u=rd(t),[c,f]=m.useState(null),d=OU(),p=m.useRef(0),h=a??l.disableHoverableContent,v=s??l.delayDuration,y=m.useRef(!1),[g,x]=JV({prop:r,defaultProp:i??!1,onChange:k=>{k?(l.onOpen(),document.dispatchEvent(new CustomEvent(rm))):l.onClose(),o==null||o(k)},caller:Ls}),w=m.useMemo(()=>g?y.current?"delayed-open":"instant-open":"closed",[g]),S=m.useCallback(()=>{window.clearTimeout(p.current),p.current=0,y.current=!1,x(!0)},[x]),P=m.useCallback(()=>{window.clearTimeout(p.current),p.current=0,x(!1)},[x]),O=m.useCallback(()=>{window.clearTimeout(p.current),p.current=window.setTimeout(()=>{y.current=!0,x(!0),p.current=0},v)},[v,x]);return m.useEffect(()=>()=>{p.current&&(window.clearTimeout(p.current),p.current=0)},[]),b.jsx(HV,{...u,children:b.jsx(sH,{scope:t,contentId:d,open:g,stateAttribute:w,trigger:c,onTriggerChange:f,onTriggerEnter:m.useCallback(()=>{l.isOpenDelayedRef.current?O():S()},[l.isOpenDelayedRef,O,S]),onTriggerLeave:m.useCallback(()=>{h?P():(window.clearTimeout(p.current),p.current=0)},[P,h]),onOpen:S,onClose:P,disableHoverableContent:h,children:n})})};j_.displayName=Ls;var im="TooltipTrigger",M_=m.forwardRef((e,t)=>{const{__scopeTooltip:n,...r}=e,i=fl(im,n),o=ey(im,n),a=rd(n),s=m.useRef(null),l=ro(t,s,i.onTriggerChange),u=m.useRef(!1),c=m.useRef(!1),f=m.useCallback(()=>u.current=!1,[]);return m.useEffect(()=>()=>document.removeEventListener("pointerup",f),[f]),b.jsx(KV,{asChild:!0,...a,children:b.jsx(yi.button,{"aria-describedby":i.open?i.contentId:void 0,"data-state":i.stateAttribute,...r,ref:l,onPointerMove:ir(e.onPointerMove,d=>{d.pointerType!=="touch"&&!c.current&&!o.isPointerInTransitRef.current&&(i.onTriggerEnter(),c.current=!0)}),onPointerLeave:ir(e.onPointerLeave,()=>{i.onTriggerLeave(),c.current=!1}),onPointerDown:ir(e.onPointerDown,()=>{i.open&&i.onClose(),u.current=!0,document.addEventListener("pointerup",f,{once:!0})}),onFocus:ir(e.onFocus,()=>{u.current||i.onOpen()}),onBlur:ir(e.onBlur,i.onClose),onClick:ir(e.onClick,i.onClose)})})});M_.displayName=im;var ty="TooltipPortal",[lH,uH]=nd(ty,{forceMount:void 0}),T_=e=>{const{__scopeTooltip:t,forceMount:n,children:r,container:i}=e,o=fl(ty,t);return b.jsx(lH,{scope:t,forceMount:n,children:b.jsx(Jg,{present:n||o.open,children:b.jsx(k_,{asChild:!0,container:i,children:r})})})};T_.displayName=ty;var ea="TooltipContent",$_=m.forwardRef((e,t)=>{const n=uH(ea,e.__scopeTooltip),{forceMount:r=n.forceMount,side:i="top",...o}=e,a=fl(ea,e.__scopeTooltip);return b.jsx(Jg,{present:r||a.open,children:a.disableHoverableContent?b.jsx(I_,{side:i,...o,ref:t}):b.jsx(cH,{side:i,...o,ref:t})})}),cH=m.forwardRef((e,t)=>{const n=fl(ea,e.__scopeTooltip),r=ey(ea,e.__scopeTooltip),i=m.useRef(null),o=ro(t,i),[a,s]=m.useState(null),{trigger:l,onClose:u}=n,c=i.current,{onPointerInTransitChange:f}=r,d=m.useCallback(()=>{s(null),f(!1)},[f]),p=m.useCallback((h,v)=>{const y=h.currentTarget,g={x:h.clientX,y:h.clientY},x=hH(g,y.getBoundingClientRect()),w=mH(g,x),S=vH(v.getBoundingClientRect()),P=yH([...w,...S]);s(P),f(!0)},[f]);return m.useEffect(()=>()=>d(),[d]),m.useEffect(()=>{if(l&&c){const h=y=>p(y,c),v=y=>p(y,l);return l.addEventListener("pointerleave",h),c.addEventListener("pointerleave",v),()=>{l.removeEventListener("pointerleave",h),c.removeEventListener("pointerleave",v)}}},[l,c,p,d]),m.useEffect(()=>{if(a){const h=v=>{const y=v.target,g={x:v.clientX,y:v.clientY},x=(l==null?void 0:l.contains(y))||(c==null?void 0:c.contains(y)),w=!gH(g,a);x?d():w&&(d(),u())};return document.addEventListener("pointermove",h),()=>document.removeEventListener("pointermove",h)}},[l,c,a,u,d]),b.jsx(I_,{...e,ref:o})}),[fH,dH]=nd(Ls,{isInside:!1}),pH=lU("TooltipContent"),I_=m.forwardRef((e,t)=>{const{__scopeTooltip:n,children:r,"aria-label":i,onEscapeKeyDown:o,onPointerDownOutside:a,...s}=e,l=fl(ea,n),u=rd(n),{onClose:c}=l;return m.useEffect(()=>(document.addEventListener(rm,c),()=>document.removeEventListener(rm,c)),[c]),m.useEffect(()=>{if(l.trigger){const f=d=>{const p=d.target;p!=null&&p.contains(l.trigger)&&c()};return window.addEventListener("scroll",f,{capture:!0}),()=>window.removeEventListener("scroll",f,{capture:!0})}},[l.trigger,c]),b.jsx(n_,{asChild:!0,disableOutsidePointerEvents:!1,onEscapeKeyDown:o,onPointerDownOutside:a,onFocusOutside:f=>f.preventDefault(),onDismiss:c,children:b.jsxs(WV,{"data-state":l.stateAttribute,...u,...s,ref:t,style:{...s.style,"--radix-tooltip-content-transform-origin":"var(--radix-popper-transform-origin)","--radix-tooltip-content-available-width":"var(--radix-popper-available-width)","--radix-tooltip-content-available-height":"var(--radix-popper-available-height)","--radix-tooltip-trigger-width":"var(--radix-popper-anchor-width)","--radix-tooltip-trigger-height":"var(--radix-popper-anchor-height)"},children:[b.jsx(pH,{children:r}),b.jsx(fH,{scope:n,isInside:!0,children:b.jsx(iH,{id:l.contentId,role:"tooltip",children:i||r})})]})})});$_.displayName=ea;var N_="TooltipArrow",D_=m.forwardRef((e,t)=>{const{__scopeTooltip:n,...r}=e,i=rd(n);return dH(N_,n).isInside?null:b.jsx(YV,{...i,...r,ref:t})});D_.displayName=N_;function hH(e,t){const n=Math.abs(t.top-e.y),r=Math.abs(t.bottom-e.y),i=Math.abs(t.right-e.x),o=Math.abs(t.left-e.x);switch(Math.min(n,r,i,o)){case o:return"left";case i:return"right";case n:return"top";case r:return"bottom";default:throw new Error("unreachable")}}function mH(e,t,n=5){const r=[];switch(t){case"top":r.push({x:e.x-n,y:e.y+n},{x:e.x+n,y:e.y+n});break;case"bottom":r.push({x:e.x-n,y:e.y-n},{x:e.x+n,y:e.y-n});break;case"left":r.push({x:e.x+n,y:e.y-n},{x:e.x+n,y:e.y+n});break;case"right":r.push({x:e.x-n,y:e.y-n},{x:e.x-n,y:e.y+n});break}return r}function vH(e){const{top:t,right:n,bottom:r,left:i}=e;return[{x:i,y:t},{x:n,y:t},{x:n,y:r},{x:i,y:r}]}function gH(e,t){const{x:n,y:r}=e;let i=!1;for(let o=0,a=t.length-1;o<t.length;a=o++){const s=t[o],l=t[a],u=s.x,c=s.y,f=l.x,d=l.y;c>r!=d>r&&n<(f-u)*(r-c)/(d-c)+u&&(i=!i)}return i}function yH(e){const t=e.slice();return t.sort((n,r)=>n.x<r.x?-1:n.x>r.x?1:n.y<r.y?-1:n.y>r.y?1:0),xH(t)}function xH(e){if(e.length<=1)return e.slice();const t=[];for(let r=0;r<e.length;r++){const i=e[r];for(;t.length>=2;){const o=t[t.length-1],a=t[t.length-2];if((o.x-a.x)*(i.y-a.y)>=(o.y-a.y)*(i.x-a.x))t.pop();else break}t.push(i)}t.pop();const n=[];for(let r=e.length-1;r>=0;r--){const i=e[r];for(;n.length>=2;){const o=n[n.length-1],a=n[n.length-2];if((o.x-a.x)*(i.y-a.y)>=(o.y-a.y)*(i.x-a.x))n.pop();else break}n.push(i)}return n.pop(),t.length===1&&n.length===1&&t[0].x===n[0].x&&t[0].y===n[0].y?t:t.concat(n)}var wH=A_,bH=j_,SH=M_,PH=T_,R_=$_,OH=D_;const ny="-",EH=e=>{const t=CH(e),{conflictingClassGroups:n,conflictingClassGroupModifiers:r}=e;return{getClassGroupId:a=>{const s=a.split(ny);return s[0]===""&&s.length!==1&&s.shift(),L_(s,t)||kH(a)},getConflictingClassGroupIds:(a,s)=>{const l=n[a]||[];return s&&r[a]?[...l,...r[a]]:l}}},L_=(e,t)=>{var a;if(e.length===0)return t.classGroupId;const n=e[0],r=t.nextPart.get(n),i=r?L_(e.slice(1),r):void 0;if(i)return i;if(t.validators.length===0)return;const o=e.join(ny);return(a=t.validators.find(({validator:s})=>s(o)))==null?void 0:a.classGroupId},eb=/^\[(.+)\]$/,kH=e=>{if(eb.test(e)){const t=eb.exec(e)[1],n=t==null?void 0:t.substring(0,t.indexOf(":"));if(n)return"arbitrary.."+n}},CH=e=>{const{theme:t,prefix:n}=e,r={nextPart:new Map,validators:[]};return AH(Object.entries(e.classGroups),n).forEach(([o,a])=>{om(a,r,o,t)}),r},om=(e,t,n,r)=>{e.forEach(i=>{if(typeof i=="string"){const o=i===""?t:tb(t,i);o.classGroupId=n;return}if(typeof i=="function"){if(_H(i)){om(i(r),t,n,r);return}t.validators.push({validator:i,classGroupId:n});return}Object.entries(i).forEach(([o,a])=>{om(a,tb(t,o),n,r)})})},tb=(e,t)=>{let n=e;return t.split(ny).forEach(r=>{n.nextPart.has(r)||n.nextPart.set(r,{nextPart:new Map,validators:[]}),n=n.nextPart.get(r)}),n},_H=e=>e.isThemeGetter,AH=(e,t)=>t?e.map(([n,r])=>{const i=r.map(o=>typeof o=="string"?t+o:typeof o=="object"?Object.fromEntries(Object.entries(o).map(([a,s])=>[t+a,s])):o);return[n,i]}):e,jH=e=>{if(e<1)return{get:()=>{},set:()=>{}};let t=0,n=new Map,r=new Map;const i=(o,a)=>{n.set(o,a),t++,t>e&&(t=0,r=n,n=new Map)};return{get(o){let a=n.get(o);if(a!==void 0)return a;if((a=r.get(o))!==void 0)return i(o,a),a},set(o,a){n.has(o)?n.set(o,a):i(o,a)}}},z_="!",MH=e=>{const{separator:t,experimentalParseClassName:n}=e,r=t.length===1,i=t[0],o=t.length,a=s=>{const l=[];let u=0,c=0,f;for(let y=0;y<s.length;y++){let g=s[y];if(u===0){if(g===i&&(r||s.slice(y,y+o)===t)){l.push(s.slice(c,y)),c=y+o;continue}if(g==="/"){f=y;continue}}g==="["?u++:g==="]"&&u--}const d=l.length===0?s:s.substring(c),p=d.startsWith(z_),h=p?d.substring(1):d,v=f&&f>c?f-c:void 0;return{modifiers:l,hasImportantModifier:p,baseClassName:h,maybePostfixModifierPosition:v}};return n?s=>n({className:s,parseClassName:a}):a},TH=e=>{if(e.length<=1)return e;const t=[];let n=[];return e.forEach(r=>{r[0]==="["?(t.push(...n.sort(),r),n=[]):n.push(r)}),t.push(...n.sort()),t},$H=e=>({cache:jH(e.cacheSize),parseClassName:MH(e),...EH(e)}),IH=/\s+/,NH=(e,t)=>{const{parseClassName:n,getClassGroupId:r,getConflictingClassGroupIds:i}=t,o=[],a=e.trim().split(IH);let s="";for(let l=a.length-1;l>=0;l-=1){const u=a[l],{modifiers:c,hasImportantModifier:f,baseClassName:d,maybePostfixModifierPosition:p}=n(u);let h=!!p,v=r(h?d.substring(0,p):d);if(!v){if(!h){s=u+(s.length>0?" "+s:s);continue}if(v=r(d),!v){s=u+(s.length>0?" "+s:s);continue}h=!1}const y=TH(c).join(":"),g=f?y+z_:y,x=g+v;if(o.includes(x))continue;o.push(x);const w=i(v,h);for(let S=0;S<w.length;++S){const P=w[S];o.push(g+P)}s=u+(s.length>0?" "+s:s)}return s};function DH(){let e=0,t,n,r="";for(;e<arguments.length;)(t=arguments[e++])&&(n=F_(t))&&(r&&(r+=" "),r+=n);return r}const F_=e=>{if(typeof e=="string")return e;let t,n="";for(let r=0;r<e.length;r++)e[r]&&(t=F_(e[r]))&&(n&&(n+=" "),n+=t);return n};function RH(e,...t){let n,r,i,o=a;function a(l){const u=t.reduce((c,f)=>f(c),e());return n=$H(u),r=n.cache.get,i=n.cache.set,o=s,s(l)}function s(l){const u=r(l);if(u)return u;const c=NH(l,n);return i(l,c),c}return function(){return o(DH.apply(null,arguments))}}const Pe=e=>{const t=n=>n[e]||[];return t.isThemeGetter=!0,t},B_=/^\[(?:([a-z-]+):)?(.+)\]$/i,LH=/^\d+\/\d+$/,zH=new Set(["px","full","screen"]),FH=/^(\d+(\.\d+)?)?(xs|sm|md|lg|xl)$/,BH=/\d+(%|px|r?em|[sdl]?v([hwib]|min|max)|pt|pc|in|cm|mm|cap|ch|ex|r?lh|cq(w|h|i|b|min|max))|\b(calc|min|max|clamp)\(.+\)|^0$/,UH=/^(rgba?|hsla?|hwb|(ok)?(lab|lch))\(.+\)$/,VH=/^(inset_)?-?((\d+)?\.?(\d+)[a-z]+|0)_-?((\d+)?\.?(\d+)[a-z]+|0)/,HH=/^(url|image|image-set|cross-fade|element|(repeating-)?(linear|radial|conic)-gradient)\(.+\)$/,er=e=>zo(e)||zH.has(e)||LH.test(e),Rr=e=>va(e,"length",QH),zo=e=>!!e&&!Number.isNaN(Number(e)),ap=e=>va(e,"number",zo),Na=e=>!!e&&Number.isInteger(Number(e)),KH=e=>e.endsWith("%")&&zo(e.slice(0,-1)),ie=e=>B_.test(e),Lr=e=>FH.test(e),WH=new Set(["length","size","percentage"]),YH=e=>va(e,WH,U_),qH=e=>va(e,"position",U_),GH=new Set(["image","url"]),XH=e=>va(e,GH,eK),ZH=e=>va(e,"",JH),Da=()=>!0,va=(e,t,n)=>{const r=B_.exec(e);return r?r[1]?typeof t=="string"?r[1]===t:t.has(r[1]):n(r[2]):!1},QH=e=>BH.test(e)&&!UH.test(e),U_=()=>!1,JH=e=>VH.test(e),eK=e=>HH.test(e),tK=()=>{const e=Pe("colors"),t=Pe("spacing"),n=Pe("blur"),r=Pe("brightness"),i=Pe("borderColor"),o=Pe("borderRadius"),a=Pe("borderSpacing"),s=Pe("borderWidth"),l=Pe("contrast"),u=Pe("grayscale"),c=Pe("hueRotate"),f=Pe("invert"),d=Pe("gap"),p=Pe("gradientColorStops"),h=Pe("gradientColorStopPositions"),v=Pe("inset"),y=Pe("margin"),g=Pe("opacity"),x=Pe("padding"),w=Pe("saturate"),S=Pe("scale"),P=Pe("sepia"),O=Pe("skew"),k=Pe("space"),j=Pe("translate"),M=()=>["auto","contain","none"],A=()=>["auto","hidden","clip","visible","scroll"],C=()=>["auto",ie,t],_=()=>[ie,t],N=()=>["",er,Rr],L=()=>["auto",zo,ie],V=()=>["bottom","center","left","left-bottom","left-top","right","right-bottom","right-top","top"],B=()=>["solid","dashed","dotted","double","none"],U=()=>["normal","multiply","screen","overlay","darken","lighten","color-dodge","color-burn","hard-light","soft-light","difference","exclusion","hue","saturation","color","luminosity"],$=()=>["start","end","center","between","around","evenly","stretch"],z=()=>["","0",ie],K=()=>["auto","avoid","all","avoid-page","page","left","right","column"],X=()=>[zo,ie];return{cacheSize:500,separator:":",theme:{colors:[Da],spacing:[er,Rr],blur:["none","",Lr,ie],brightness:X(),borderColor:[e],borderRadius:["none","","full",Lr,ie],borderSpacing:_(),borderWidth:N(),contrast:X(),grayscale:z(),hueRotate:X(),invert:z(),gap:_(),gradientColorStops:[e],gradientColorStopPositions:[KH,Rr],inset:C(),margin:C(),opacity:X(),padding:_(),saturate:X(),scale:X(),sepia:z(),skew:X(),space:_(),translate:_()},classGroups:{aspect:[{aspect:["auto","square","video",ie]}],container:["container"],columns:[{columns:[Lr]}],"break-after":[{"break-after":K()}],"break-before":[{"break-before":K()}],"break-inside":[{"break-inside":["auto","avoid","avoid-page","avoid-column"]}],"box-decoration":[{"box-decoration":["slice","clone"]}],box:[{box:["border","content"]}],display:["block","inline-block","inline","flex","inline-flex","table","inline-table","table-caption","table-cell","table-column","table-column-group","table-footer-group","table-header-group","table-row-group","table-row","flow-root","grid","inline-grid","contents","list-item","hidden"],float:[{float:["right","left","none","start","end"]}],clear:[{clear:["left","right","both","none","start","end"]}],isolation:["isolate","isolation-auto"],"object-fit":[{object:["contain","cover","fill","none","scale-down"]}],"object-position":[{object:[...V(),ie]}],overflow:[{overflow:A()}],"overflow-x":[{"overflow-x":A()}],"overflow-y":[{"overflow-y":A()}],overscroll:[{overscroll:M()}],"overscroll-x":[{"overscroll-x":M()}],"overscroll-y":[{"overscroll-y":M()}],position:["static","fixed","absolute","relative","sticky"],inset:[{inset:[v]}],"inset-x":[{"inset-x":[v]}],"inset-y":[{"inset-y":[v]}],start:[{start:[v]}],end:[{end:[v]}],top:[{top:[v]}],right:[{right:[v]}],bottom:[{bottom:[v]}],left:[{left:[v]}],visibility:["visible","invisible","collapse"],z:[{z:["auto",Na,ie]}],basis:[{basis:C()}],"flex-direction":[{flex:["row","row-reverse","col","col-reverse"]}],"flex-wrap":[{flex:["wrap","wrap-reverse","nowrap"]}],flex:[{flex:["1","auto","initial","none",ie]}],grow:[{grow:z()}],shrink:[{shrink:z()}],order:[{order:["first","last","none",Na,ie]}],"grid-cols":[{"grid-cols":[Da]}],"col-start-end":[{col:["auto",{span:["full",Na,ie]},ie]}],"col-start":[{"col-start":L()}],"col-end":[{"col-end":L()}],"grid-rows":[{"grid-rows":[Da]}],"row-start-end":[{row:["auto",{span:[Na,ie]},ie]}],"row-start":[{"row-start":L()}],"row-end":[{"row-end":L()}],"grid-flow":[{"grid-flow":["row","col","dense","row-dense","col-dense"]}],"auto-cols":[{"auto-cols":["auto","min","max","fr",ie]}],"auto-rows":[{"auto-rows":["auto","min","max","fr",ie]}],gap:[{gap:[d]}],"gap-x":[{"gap-x":[d]}],"gap-y":[{"gap-y":[d]}],"justify-content":[{justify:["normal",...$()]}],"justify-items":[{"justify-items":["start","end","center","stretch"]}],"justify-self":[{"justify-self":["auto","start","end","center","stretch"]}],"align-content":[{content:["normal",...$(),"baseline"]}],"align-items":[{items:["start","end","center","baseline","stretch"]}],"align-self":[{self:["auto","start","end","center","stretch","baseline"]}],"place-content":[{"place-content":[...$(),"baseline"]}],"place-items":[{"place-items":["start","end","center","baseline","stretch"]}],"place-self":[{"place-self":["auto","start","end","center","stretch"]}],p:[{p:[x]}],px:[{px:[x]}],py:[{py:[x]}],ps:[{ps:[x]}],pe:[{pe:[x]}],pt:[{pt:[x]}],pr:[{pr:[x]}],pb:[{pb:[x]}],pl:[{pl:[x]}],m:[{m:[y]}],mx:[{mx:[y]}],my:[{my:[y]}],ms:[{ms:[y]}],me:[{me:[y]}],mt:[{mt:[y]}],mr:[{mr:[y]}],mb:[{mb:[y]}],ml:[{ml:[y]}],"space-x":[{"space-x":[k]}],"space-x-reverse":["space-x-reverse"],"space-y":[{"space-y":[k]}],"space-y-reverse":["space-y-reverse"],w:[{w:["auto","min","max","fit","svw","lvw","dvw",ie,t]}],"min-w":[{"min-w":[ie,t,"min","max","fit"]}],"max-w":[{"max-w":[ie,t,"none","full","min","max","fit","prose",{screen:[Lr]},Lr]}],h:[{h:[ie,t,"auto","min","max","fit","svh","lvh","dvh"]}],"min-h":[{"min-h":[ie,t,"min","max","fit","svh","lvh","dvh"]}],"max-h":[{"max-h":[ie,t,"min","max","fit","svh","lvh","dvh"]}],size:[{size:[ie,t,"auto","min","max","fit"]}],"font-size":[{text:["base",Lr,Rr]}],"font-smoothing":["antialiased","subpixel-antialiased"],"font-style":["italic","not-italic"],"font-weight":[{font:["thin","extralight","light","normal","medium","semibold","bold","extrabold","black",ap]}],"font-family":[{font:[Da]}],"fvn-normal":["normal-nums"],"fvn-ordinal":["ordinal"],"fvn-slashed-zero":["slashed-zero"],"fvn-figure":["lining-nums","oldstyle-nums"],"fvn-spacing":["proportional-nums","tabular-nums"],"fvn-fraction":["diagonal-fractions","stacked-fractions"],tracking:[{tracking:["tighter","tight","normal","wide","wider","widest",ie]}],"line-clamp":[{"line-clamp":["none",zo,ap]}],leading:[{leading:["none","tight","snug","normal","relaxed","loose",er,ie]}],"list-image":[{"list-image":["none",ie]}],"list-style-type":[{list:["none","disc","decimal",ie]}],"list-style-position":[{list:["inside","outside"]}],"placeholder-color":[{placeholder:[e]}],"placeholder-opacity":[{"placeholder-opacity":[g]}],"text-alignment":[{text:["left","center","right","justify","start","end"]}],"text-color":[{text:[e]}],"text-opacity":[{"text-opacity":[g]}],"text-decoration":["underline","overline","line-through","no-underline"],"text-decoration-style":[{decoration:[...B(),"wavy"]}],"text-decoration-thickness":[{decoration:["auto","from-font",er,Rr]}],"underline-offset":[{"underline-offset":["auto",er,ie]}],"text-decoration-color":[{decoration:[e]}],"text-transform":["uppercase","lowercase","capitalize","normal-case"],"text-overflow":["truncate","text-ellipsis","text-clip"],"text-wrap":[{text:["wrap","nowrap","balance","pretty"]}],indent:[{indent:_()}],"vertical-align":[{align:["baseline","top","middle","bottom","text-top","text-bottom","sub","super",ie]}],whitespace:[{whitespace:["normal","nowrap","pre","pre-line","pre-wrap","break-spaces"]}],break:[{break:["normal","words","all","keep"]}],hyphens:[{hyphens:["none","manual","auto"]}],content:[{content:["none",ie]}],"bg-attachment":[{bg:["fixed","local","scroll"]}],"bg-clip":[{"bg-clip":["border","padding","content","text"]}],"bg-opacity":[{"bg-opacity":[g]}],"bg-origin":[{"bg-origin":["border","padding","content"]}],"bg-position":[{bg:[...V(),qH]}],"bg-repeat":[{bg:["no-repeat",{repeat:["","x","y","round","space"]}]}],"bg-size":[{bg:["auto","cover","contain",YH]}],"bg-image":[{bg:["none",{"gradient-to":["t","tr","r","br","b","bl","l","tl"]},XH]}],"bg-color":[{bg:[e]}],"gradient-from-pos":[{from:[h]}],"gradient-via-pos":[{via:[h]}],"gradient-to-pos":[{to:[h]}],"gradient-from":[{from:[p]}],"gradient-via":[{via:[p]}],"gradient-to":[{to:[p]}],rounded:[{rounded:[o]}],"rounded-s":[{"rounded-s":[o]}],"rounded-e":[{"rounded-e":[o]}],"rounded-t":[{"rounded-t":[o]}],"rounded-r":[{"rounded-r":[o]}],"rounded-b":[{"rounded-b":[o]}],"rounded-l":[{"rounded-l":[o]}],"rounded-ss":[{"rounded-ss":[o]}],"rounded-se":[{"rounded-se":[o]}],"rounded-ee":[{"rounded-ee":[o]}],"rounded-es":[{"rounded-es":[o]}],"rounded-tl":[{"rounded-tl":[o]}],"rounded-tr":[{"rounded-tr":[o]}],"rounded-br":[{"rounded-br":[o]}],"rounded-bl":[{"rounded-bl":[o]}],"border-w":[{border:[s]}],"border-w-x":[{"border-x":[s]}],"border-w-y":[{"border-y":[s]}],"border-w-s":[{"border-s":[s]}],"border-w-e":[{"border-e":[s]}],"border-w-t":[{"border-t":[s]}],"border-w-r":[{"border-r":[s]}],"border-w-b":[{"border-b":[s]}],"border-w-l":[{"border-l":[s]}],"border-opacity":[{"border-opacity":[g]}],"border-style":[{border:[...B(),"hidden"]}],"divide-x":[{"divide-x":[s]}],"divide-x-reverse":["divide-x-reverse"],"divide-y":[{"divide-y":[s]}],"divide-y-reverse":["divide-y-reverse"],"divide-opacity":[{"divide-opacity":[g]}],"divide-style":[{divide:B()}],"border-color":[{border:[i]}],"border-color-x":[{"border-x":[i]}],"border-color-y":[{"border-y":[i]}],"border-color-s":[{"border-s":[i]}],"border-color-e":[{"border-e":[i]}],"border-color-t":[{"border-t":[i]}],"border-color-r":[{"border-r":[i]}],"border-color-b":[{"border-b":[i]}],"border-color-l":[{"border-l":[i]}],"divide-color":[{divide:[i]}],"outline-style":[{outline:["",...B()]}],"outline-offset":[{"outline-offset":[er,ie]}],"outline-w":[{outline:[er,Rr]}],"outline-color":[{outline:[e]}],"ring-w":[{ring:N()}],"ring-w-inset":["ring-inset"],"ring-color":[{ring:[e]}],"ring-opacity":[{"ring-opacity":[g]}],"ring-offset-w":[{"ring-offset":[er,Rr]}],"ring-offset-color":[{"ring-offset":[e]}],shadow:[{shadow:["","inner","none",Lr,ZH]}],"shadow-color":[{shadow:[Da]}],opacity:[{opacity:[g]}],"mix-blend":[{"mix-blend":[...U(),"plus-lighter","plus-darker"]}],"bg-blend":[{"bg-blend":U()}],filter:[{filter:["","none"]}],blur:[{blur:[n]}],brightness:[{brightness:[r]}],contrast:[{contrast:[l]}],"drop-shadow":[{"drop-shadow":["","none",Lr,ie]}],grayscale:[{grayscale:[u]}],"hue-rotate":[{"hue-rotate":[c]}],invert:[{invert:[f]}],saturate:[{saturate:[w]}],sepia:[{sepia:[P]}],"backdrop-filter":[{"backdrop-filter":["","none"]}],"backdrop-blur":[{"backdrop-blur":[n]}],"backdrop-brightness":[{"backdrop-brightness":[r]}],"backdrop-contrast":[{"backdrop-contrast":[l]}],"backdrop-grayscale":[{"backdrop-grayscale":[u]}],"backdrop-hue-rotate":[{"backdrop-hue-rotate":[c]}],"backdrop-invert":[{"backdrop-invert":[f]}],"backdrop-opacity":[{"backdrop-opacity":[g]}],"backdrop-saturate":[{"backdrop-saturate":[w]}],"backdrop-sepia":[{"backdrop-sepia":[P]}],"border-collapse":[{border:["collapse","separate"]}],"border-spacing":[{"border-spacing":[a]}],"border-spacing-x":[{"border-spacing-x":[a]}],"border-spacing-y":[{"border-spacing-y":[a]}],"table-layout":[{table:["auto","fixed"]}],caption:[{caption:["top","bottom"]}],transition:[{transition:["none","all","","colors","opacity","shadow","transform",ie]}],duration:[{duration:X()}],ease:[{ease:["linear","in","out","in-out",ie]}],delay:[{delay:X()}],animate:[{animate:["none","spin","ping","pulse","bounce",ie]}],transform:[{transform:["","gpu","none"]}],scale:[{scale:[S]}],"scale-x":[{"scale-x":[S]}],"scale-y":[{"scale-y":[S]}],rotate:[{rotate:[Na,ie]}],"translate-x":[{"translate-x":[j]}],"translate-y":[{"translate-y":[j]}],"skew-x":[{"skew-x":[O]}],"skew-y":[{"skew-y":[O]}],"transform-origin":[{origin:["center","top","top-right","right","bottom-right","bottom","bottom-left","left","top-left",ie]}],accent:[{accent:["auto",e]}],appearance:[{appearance:["none","auto"]}],cursor:[{cursor:["auto","default","pointer","wait","text","move","help","not-allowed","none","context-menu","progress","cell","crosshair","vertical-text","alias","copy","no-drop","grab","grabbing","all-scroll","col-resize","row-resize","n-resize","e-resize","s-resize","w-resize","ne-resize","nw-resize","se-resize","sw-resize","ew-resize","ns-resize","nesw-resize","nwse-resize","zoom-in","zoom-out",ie]}],"caret-color":[{caret:[e]}],"pointer-events":[{"pointer-events":["none","auto"]}],resize:[{resize:["none","y","x",""]}],"scroll-behavior":[{scroll:["auto","smooth"]}],"scroll-m":[{"scroll-m":_()}],"scroll-mx":[{"scroll-mx":_()}],"scroll-my":[{"scroll-my":_()}],"scroll-ms":[{"scroll-ms":_()}],"scroll-me":[{"scroll-me":_()}],"scroll-mt":[{"scroll-mt":_()}],"scroll-mr":[{"scroll-mr":_()}],"scroll-mb":[{"scroll-mb":_()}],"scroll-ml":[{"scroll-ml":_()}],"scroll-p":[{"scroll-p":_()}],"scroll-px":[{"scroll-px":_()}],"scroll-py":[{"scroll-py":_()}],"scroll-ps":[{"scroll-ps":_()}],"scroll-pe":[{"scroll-pe":_()}],"scroll-pt":[{"scroll-pt":_()}],"scroll-pr":[{"scroll-pr":_()}],"scroll-pb":[{"scroll-pb":_()}],"scroll-pl":[{"scroll-pl":_()}],"snap-align":[{snap:["start","end","center","align-none"]}],"snap-stop":[{snap:["normal","always"]}],"snap-type":[{snap:["none","x","y","both"]}],"snap-strictness":[{snap:["mandatory","proximity"]}],touch:[{touch:["auto","none","manipulation"]}],"touch-x":[{"touch-pan":["x","left","right"]}],"touch-y":[{"touch-pan":["y","up","down"]}],"touch-pz":["touch-pinch-zoom"],select:[{select:["none","text","all","auto"]}],"will-change":[{"will-change":["auto","scroll","contents","transform",ie]}],fill:[{fill:[e,"none"]}],"stroke-w":[{stroke:[er,Rr,ap]}],stroke:[{stroke:[e,"none"]}],sr:["sr-only","not-sr-only"],"forced-color-adjust":[{"forced-color-adjust":["auto","none"]}]},conflictingClassGroups:{overflow:["overflow-x","overflow-y"],overscroll:["overscroll-x","overscroll-y"],inset:["inset-x","inset-y","start","end","top","right","bottom","left"],"inset-x":["right","left"],"inset-y":["top","bottom"],flex:["basis","grow","shrink"],gap:["gap-x","gap-y"],p:["px","py","ps","pe","pt","pr","pb","pl"],px:["pr","pl"],py:["pt","pb"],m:["mx","my","ms","me","mt","mr","mb","ml"],mx:["mr","ml"],my:["mt","mb"],size:["w","h"],"font-size":["leading"],"fvn-normal":["fvn-ordinal","fvn-slashed-zero","fvn-figure","fvn-spacing","fvn-fraction"],"fvn-ordinal":["fvn-normal"],"fvn-slashed-zero":["fvn-normal"],"fvn-figure":["fvn-normal"],"fvn-spacing":["fvn-normal"],"fvn-fraction":["fvn-normal"],"line-clamp":["display","overflow"],rounded:["rounded-s","rounded-e","rounded-t","rounded-r","rounded-b","rounded-l","rounded-ss","rounded-se","rounded-ee","rounded-es","rounded-tl","rounded-tr","rounded-br","rounded-bl"],"rounded-s":["rounded-ss","rounded-es"],"rounded-e":["rounded-se","rounded-ee"],"rounded-t":["rounded-tl","rounded-tr"],"rounded-r":["rounded-tr","rounded-br"],"rounded-b":["rounded-br","rounded-bl"],"rounded-l":["rounded-tl","rounded-bl"],"border-spacing":["border-spacing-x","border-spacing-y"],"border-w":["border-w-s","border-w-e","border-w-t","border-w-r","border-w-b","border-w-l"],"border-w-x":["border-w-r","border-w-l"],"border-w-y":["border-w-t","border-w-b"],"border-color":["border-color-s","border-color-e","border-color-t","border-color-r","border-color-b","border-color-l"],"border-color-x":["border-color-r","border-color-l"],"border-color-y":["border-color-t","border-color-b"],"scroll-m":["scroll-mx","scroll-my","scroll-ms","scroll-me","scroll-mt","scroll-mr","scroll-mb","scroll-ml"],"scroll-mx":["scroll-mr","scroll-ml"],"scroll-my":["scroll-mt","scroll-mb"],"scroll-p":["scroll-px","scroll-py","scroll-ps","scroll-pe","scroll-pt","scroll-pr","scroll-pb","scroll-pl"],"scroll-px":["scroll-pr","scroll-pl"],"scroll-py":["scroll-pt","scroll-pb"],touch:["touch-x","touch-y","touch-pz"],"touch-x":["touch"],"touch-y":["touch"],"touch-pz":["touch"]},conflictingClassGroupModifiers:{"font-size":["leading"]}}},nK=RH(tK);function rK(...e){return nK(ve(e))}const iK=wH,eu=bH,tu=SH,Ha=m.forwardRef(({className:e,sideOffset:t=2,side:n="bottom",borderRadius:r=30,align:i="center",containerWidth:o,...a},s)=>{const l=o?E(28,o):28,u=o?E(1069/2,o):534.5;return b.jsx(PH,{children:b.jsxs(R_,{ref:s,side:n,sideOffset:t,align:i,collisionPadding:16,sticky:"always",arrowPadding:8,className:rK("overflow-visible px-3 py-1.5 shadow-lg",e),style:{maxWidth:`${u}px`,borderRadius:`${r}px`,backgroundColor:"#F5F5F5",zIndex:9999,...a.style},...a,children:[b.jsx("div",{style:{fontFamily:"OPPO Sans 4.0",fontWeight:500,fontStyle:"normal",fontSize:`${l}px`,lineHeight:"100%",letterSpacing:"0%",wordWrap:"break-word",overflowWrap:"break-word",color:"#60585E"},children:a.children}),b.jsx(OH,{width:12,height:6,style:{fill:"#F5F5F5",filter:"drop-shadow(0 1px 1px rgba(0, 0, 0, 0.1))",position:"relative"}})]})})});Ha.displayName=R_.displayName;const Xn=Object.create(null);Xn.open="0";Xn.close="1";Xn.ping="2";Xn.pong="3";Xn.message="4";Xn.upgrade="5";Xn.noop="6";const Pu=Object.create(null);Object.keys(Xn).forEach(e=>{Pu[Xn[e]]=e});const am={type:"error",data:"parser error"},V_=typeof Blob=="function"||typeof Blob<"u"&&Object.prototype.toString.call(Blob)==="[object BlobConstructor]",H_=typeof ArrayBuffer=="function",K_=e=>typeof ArrayBuffer.isView=="function"?ArrayBuffer.isView(e):e&&e.buffer instanceof ArrayBuffer,ry=({type:e,data:t},n,r)=>V_&&t instanceof Blob?n?r(t):nb(t,r):H_&&(t instanceof ArrayBuffer||K_(t))?n?r(t):nb(new Blob([t]),r):r(Xn[e]+(t||"")),nb=(e,t)=>{const n=new FileReader;return n.onload=function(){const r=n.result.split(",")[1];t("b"+(r||""))},n.readAsDataURL(e)};function rb(e){return e instanceof Uint8Array?e:e instanceof ArrayBuffer?new Uint8Array(e):new Uint8Array(e.buffer,e.byteOffset,e.byteLength)}let sp;function oK(e,t){if(V_&&e.data instanceof Blob)return e.data.arrayBuffer().then(rb).then(t);if(H_&&(e.data instanceof ArrayBuffer||K_(e.data)))return t(rb(e.data));ry(e,!1,n=>{sp||(sp=new TextEncoder),t(sp.encode(n))})}const ib="ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/",Ka=typeof Uint8Array>"u"?[]:new Uint8Array(256);for(let e=0;e<ib.length;e++)Ka[ib.charCodeAt(e)]=e;const aK=e=>{let t=e.length*.75,n=e.length,r,i=0,o,a,s,l;e[e.length-1]==="="&&(t--,e[e.length-2]==="="&&t--);const u=new ArrayBuffer(t),c=new Uint8Array(u);for(r=0;r<n;r+=4)o=Ka[e.charCodeAt(r)],a=Ka[e.charCodeAt(r+1)],s=Ka[e.charCodeAt(r+2)],l=Ka[e.charCodeAt(r+3)],c[i++]=o<<2|a>>4,c[i++]=(a&15)<<4|s>>2,c[i++]=(s&3)<<6|l&63;return u},sK=typeof ArrayBuffer=="function",iy=(e,t)=>{if(typeof e!="string")return{type:"message",data:W_(e,t)};const n=e.charAt(0);return n==="b"?{type:"message",data:lK(e.substring(1),t)}:Pu[n]?e.length>1?{type:Pu[n],data:e.substring(1)}:{type:Pu[n]}:am},lK=(e,t)=>{if(sK){const n=aK(e);return W_(n,t)}else return{base64:!0,data:e}},W_=(e,t)=>{switch(t){case"blob":return e instanceof Blob?e:new Blob([e]);case"arraybuffer":default:return e instanceof ArrayBuffer?e:e.buffer}},Y_=String.fromCharCode(30),uK=(e,t)=>{const n=e.length,r=new Array(n);let i=0;e.forEach((o,a)=>{ry(o,!1,s=>{r[a]=s,++i===n&&t(r.join(Y_))})})},cK=(e,t)=>{const n=e.split(Y_),r=[];for(let i=0;i<n.length;i++){const o=iy(n[i],t);if(r.push(o),o.type==="error")break}return r};function fK(){return new TransformStream({transform(e,t){oK(e,n=>{const r=n.length;let i;if(r<126)i=new Uint8Array(1),new DataView(i.buffer).setUint8(0,r);else if(r<65536){i=new Uint8Array(3);const o=new DataView(i.buffer);o.setUint8(0,126),o.setUint16(1,r)}else{i=new Uint8Array(9);const o=new DataView(i.buffer);o.setUint8(0,127),o.setBigUint64(1,BigInt(r))}e.data&&typeof e.data!="string"&&(i[0]|=128),t.enqueue(i),t.enqueue(n)})}})}let lp;function nu(e){return e.reduce((t,n)=>t+n.length,0)}function ru(e,t){if(e[0].length===t)return e.shift();const n=new Uint8Array(t);let r=0;for(let i=0;i<t;i++)n[i]=e[0][r++],r===e[0].length&&(e.shift(),r=0);return e.length&&r<e[0].length&&(e[0]=e[0].slice(r)),n}function dK(e,t){lp||(lp=new TextDecoder);const n=[];let r=0,i=-1,o=!1;return new TransformStream({transform(a,s){for(n.push(a);;){if(r===0){if(nu(n)<1)break;const l=ru(n,1);o=(l[0]&128)===128,i=l[0]&127,i<126?r=3:i===126?r=1:r=2}else if(r===1){if(nu(n)<2)break;const l=ru(n,2);i=new DataView(l.buffer,l.byteOffset,l.length).getUint16(0),r=3}else if(r===2){if(nu(n)<8)break;const l=ru(n,8),u=new DataView(l.buffer,l.byteOffset,l.length),c=u.getUint32(0);if(c>Math.pow(2,53-32)-1){s.enqueue(am);break}i=c*Math.pow(2,32)+u.getUint32(4),r=3}else{if(nu(n)<i)break;const l=ru(n,i);s.enqueue(iy(o?l:lp.decode(l),t)),r=0}if(i===0||i>e){s.enqueue(am);break}}}})}const q_=4;function Fe(e){if(e)return pK(e)}function pK(e){for(var t in Fe.prototype)e[t]=Fe.prototype[t];return e}Fe.prototype.on=Fe.prototype.addEventListener=function(e,t){return this._callbacks=this._callbacks||{},(this._callbacks["$"+e]=this._callbacks["$"+e]||[]).push(t),this};Fe.prototype.once=function(e,t){function n(){this.off(e,n),t.apply(this,arguments)}return n.fn=t,this.on(e,n),this};Fe.prototype.off=Fe.prototype.removeListener=Fe.prototype.removeAllListeners=Fe.prototype.removeEventListener=function(e,t){if(this._callbacks=this._callbacks||{},arguments.length==0)return this._callbacks={},this;var n=this._callbacks["$"+e];if(!n)return this;if(arguments.length==1)return delete this._callbacks["$"+e],this;for(var r,i=0;i<n.length;i++)if(r=n[i],r===t||r.fn===t){n.splice(i,1);break}return n.length===0&&delete this._callbacks["$"+e],this};Fe.prototype.emit=function(e){this._callbacks=this._callbacks||{};for(var t=new Array(arguments.length-1),n=this._callbacks["$"+e],r=1;r<arguments.length;r++)t[r-1]=arguments[r];if(n){n=n.slice(0);for(var r=0,i=n.length;r<i;++r)n[r].apply(this,t)}return this};Fe.prototype.emitReserved=Fe.prototype.emit;Fe.prototype.listeners=function(e){return this._callbacks=this._callbacks||{},this._callbacks["$"+e]||[]};Fe.prototype.hasListeners=function(e){return!!this.listeners(e).length};const id=(()=>typeof Promise=="function"&&typeof Promise.resolve=="function"?t=>Promise.resolve().then(t):(t,n)=>n(t,0))(),sn=(()=>typeof self<"u"?self:typeof window<"u"?window:Function("return this")())(),hK="arraybuffer";function G_(e,...t){return t.reduce((n,r)=>(e.hasOwnProperty(r)&&(n[r]=e[r]),n),{})}const mK=sn.setTimeout,vK=sn.clearTimeout;function od(e,t){t.useNativeTimers?(e.setTimeoutFn=mK.bind(sn),e.clearTimeoutFn=vK.bind(sn)):(e.setTimeoutFn=sn.setTimeout.bind(sn),e.clearTimeoutFn=sn.clearTimeout.bind(sn))}const gK=1.33;function yK(e){return typeof e=="string"?xK(e):Math.ceil((e.byteLength||e.size)*gK)}function xK(e){let t=0,n=0;for(let r=0,i=e.length;r<i;r++)t=e.charCodeAt(r),t<128?n+=1:t<2048?n+=2:t<55296||t>=57344?n+=3:(r++,n+=4);return n}function X_(){return Date.now().toString(36).substring(3)+Math.random().toString(36).substring(2,5)}function wK(e){let t="";for(let n in e)e.hasOwnProperty(n)&&(t.length&&(t+="&"),t+=encodeURIComponent(n)+"="+encodeURIComponent(e[n]));return t}function bK(e){let t={},n=e.split("&");for(let r=0,i=n.length;r<i;r++){let o=n[r].split("=");t[decodeURIComponent(o[0])]=decodeURIComponent(o[1])}return t}class SK extends Error{constructor(t,n,r){super(t),this.description=n,this.context=r,this.type="TransportError"}}class oy extends Fe{constructor(t){super(),this.writable=!1,od(this,t),this.opts=t,this.query=t.query,this.socket=t.socket,this.supportsBinary=!t.forceBase64}onError(t,n,r){return super.emitReserved("error",new SK(t,n,r)),this}open(){return this.readyState="opening",this.doOpen(),this}close(){return(this.readyState==="opening"||this.readyState==="open")&&(this.doClose(),this.onClose()),this}send(t){this.readyState==="open"&&this.write(t)}onOpen(){this.readyState="open",this.writable=!0,super.emitReserved("open")}onData(t){const n=iy(t,this.socket.binaryType);this.onPacket(n)}onPacket(t){super.emitReserved("packet",t)}onClose(t){this.readyState="closed",super.emitReserved("close",t)}pause(t){}createUri(t,n={}){return t+"://"+this._hostname()+this._port()+this.opts.path+this._query(n)}_hostname(){const t=this.opts.hostname;return t.indexOf(":")===-1?t:"["+t+"]"}_port(){return this.opts.port&&(this.opts.secure&&Number(this.opts.port)!==443||!this.opts.secure&&Number(this.opts.port)!==80)?":"+this.opts.port:""}_query(t){const n=wK(t);return n.length?"?"+n:""}}class PK extends oy{constructor(){super(...arguments),this._polling=!1}get name(){return"polling"}doOpen(){this._poll()}pause(t){this.readyState="pausing";const n=()=>{this.readyState="paused",t()};if(this._polling||!this.writable){let r=0;this._polling&&(r++,this.once("pollComplete",function(){--r||n()})),this.writable||(r++,this.once("drain",function(){--r||n()}))}else n()}_poll(){this._polling=!0,this.doPoll(),this.emitReserved("poll")}onData(t){const n=r=>{if(this.readyState==="opening"&&r.type==="open"&&this.onOpen(),r.type==="close")return this.onClose({description:"transport closed by the server"}),!1;this.onPacket(r)};cK(t,this.socket.binaryType).forEach(n),this.readyState!=="closed"&&(this._polling=!1,this.emitReserved("pollComplete"),this.readyState==="open"&&this._poll())}doClose(){const t=()=>{this.write([{type:"close"}])};this.readyState==="open"?t():this.once("open",t)}write(t){this.writable=!1,uK(t,n=>{this.doWrite(n,()=>{this.writable=!0,this.emitReserved("drain")})})}uri(){const t=this.opts.secure?"https":"http",n=this.query||{};return this.opts.timestampRequests!==!1&&(n[this.opts.timestampParam]=X_()),!this.supportsBinary&&!n.sid&&(n.b64=1),this.createUri(t,n)}}let Z_=!1;try{Z_=typeof XMLHttpRequest<"u"&&"withCredentials"in new XMLHttpRequest}catch{}const OK=Z_;function EK(){}class kK extends PK{constructor(t){if(super(t),typeof location<"u"){const n=location.protocol==="https:";let r=location.port;r||(r=n?"443":"80"),this.xd=typeof location<"u"&&t.hostname!==location.hostname||r!==t.port}}doWrite(t,n){const r=this.request({method:"POST",data:t});r.on("success",n),r.on("error",(i,o)=>{this.onError("xhr post error",i,o)})}doPoll(){const t=this.request();t.on("data",this.onData.bind(this)),t.on("error",(n,r)=>{this.onError("xhr poll error",n,r)}),this.pollXhr=t}}class Wn extends Fe{constructor(t,n,r){super(),this.createRequest=t,od(this,r),this._opts=r,this._method=r.method||"GET",this._uri=n,this._data=r.data!==void 0?r.data:null,this._create()}_create(){var t;const n=G_(this._opts,"agent","pfx","key","passphrase","cert","ca","ciphers","rejectUnauthorized","autoUnref");n.xdomain=!!this._opts.xd;const r=this._xhr=this.createRequest(n);try{r.open(this._method,this._uri,!0);try{if(this._opts.extraHeaders){r.setDisableHeaderCheck&&r.setDisableHeaderCheck(!0);for(let i in this._opts.extraHeaders)this._opts.extraHeaders.hasOwnProperty(i)&&r.setRequestHeader(i,this._opts.extraHeaders[i])}}catch{}if(this._method==="POST")try{r.setRequestHeader("Content-type","text/plain;charset=UTF-8")}catch{}try{r.setRequestHeader("Accept","*/*")}catch{}(t=this._opts.cookieJar)===null||t===void 0||t.addCookies(r),"withCredentials"in r&&(r.withCredentials=this._opts.withCredentials),this._opts.requestTimeout&&(r.timeout=this._opts.requestTimeout),r.onreadystatechange=()=>{var i;r.readyState===3&&((i=this._opts.cookieJar)===null||i===void 0||i.parseCookies(r.getResponseHeader("set-cookie"))),r.readyState===4&&(r.status===200||r.status===1223?this._onLoad():this.setTimeoutFn(()=>{this._onError(typeof r.status=="number"?r.status:0)},0))},r.send(this._data)}catch(i){this.setTimeoutFn(()=>{this._onError(i)},0);return}typeof document<"u"&&(this._index=Wn.requestsCount++,Wn.requests[this._index]=this)}_onError(t){this.emitReserved("error",t,this._xhr),this._cleanup(!0)}_cleanup(t){if(!(typeof this._xhr>"u"||this._xhr===null)){if(this._xhr.onreadystatechange=EK,t)try{this._xhr.abort()}catch{}typeof document<"u"&&delete Wn.requests[this._index],this._xhr=null}}_onLoad(){const t=this._xhr.responseText;t!==null&&(this.emitReserved("data",t),this.emitReserved("success"),this._cleanup())}abort(){this._cleanup()}}Wn.requestsCount=0;Wn.requests={};if(typeof document<"u"){if(typeof attachEvent=="function")attachEvent("onunload",ob);else if(typeof addEventListener=="function"){const e="onpagehide"in sn?"pagehide":"unload";addEventListener(e,ob,!1)}}function ob(){for(let e in Wn.requests)Wn.requests.hasOwnProperty(e)&&Wn.requests[e].abort()}const CK=function(){const e=Q_({xdomain:!1});return e&&e.responseType!==null}();class _K extends kK{constructor(t){super(t);const n=t&&t.forceBase64;this.supportsBinary=CK&&!n}request(t={}){return Object.assign(t,{xd:this.xd},this.opts),new Wn(Q_,this.uri(),t)}}function Q_(e){const t=e.xdomain;try{if(typeof XMLHttpRequest<"u"&&(!t||OK))return new XMLHttpRequest}catch{}if(!t)try{return new sn[["Active"].concat("Object").join("X")]("Microsoft.XMLHTTP")}catch{}}const J_=typeof navigator<"u"&&typeof navigator.product=="string"&&navigator.product.toLowerCase()==="reactnative";class AK extends oy{get name(){return"websocket"}doOpen(){const t=this.uri(),n=this.opts.protocols,r=J_?{}:G_(this.opts,"agent","perMessageDeflate","pfx","key","passphrase","cert","ca","ciphers","rejectUnauthorized","localAddress","protocolVersion","origin","maxPayload","family","checkServerIdentity");this.opts.extraHeaders&&(r.headers=this.opts.extraHeaders);try{this.ws=this.createSocket(t,n,r)}catch(i){return this.emitReserved("error",i)}this.ws.binaryType=this.socket.binaryType,this.addEventListeners()}addEventListeners(){this.ws.onopen=()=>{this.opts.autoUnref&&this.ws._socket.unref(),this.onOpen()},this.ws.onclose=t=>this.onClose({description:"websocket connection closed",context:t}),this.ws.onmessage=t=>this.onData(t.data),this.ws.onerror=t=>this.onError("websocket error",t)}write(t){this.writable=!1;for(let n=0;n<t.length;n++){const r=t[n],i=n===t.length-1;ry(r,this.supportsBinary,o=>{try{this.doWrite(r,o)}catch{}i&&id(()=>{this.writable=!0,this.emitReserved("drain")},this.setTimeoutFn)})}}doClose(){typeof this.ws<"u"&&(this.ws.onerror=()=>{},this.ws.close(),this.ws=null)}uri(){const t=this.opts.secure?"wss":"ws",n=this.query||{};return this.opts.timestampRequests&&(n[this.opts.timestampParam]=X_()),this.supportsBinary||(n.b64=1),this.createUri(t,n)}}const up=sn.WebSocket||sn.MozWebSocket;class jK extends AK{createSocket(t,n,r){return J_?new up(t,n,r):n?new up(t,n):new up(t)}doWrite(t,n){this.ws.send(n)}}class MK extends oy{get name(){return"webtransport"}doOpen(){try{this._transport=new WebTransport(this.createUri("https"),this.opts.transportOptions[this.name])}catch(t){return this.emitReserved("error",t)}this._transport.closed.then(()=>{this.onClose()}).catch(t=>{this.onError("webtransport error",t)}),this._transport.ready.then(()=>{this._transport.createBidirectionalStream().then(t=>{const n=dK(Number.MAX_SAFE_INTEGER,this.socket.binaryType),r=t.readable.pipeThrough(n).getReader(),i=fK();i.readable.pipeTo(t.writable),this._writer=i.writable.getWriter();const o=()=>{r.read().then(({done:s,value:l})=>{s||(this.onPacket(l),o())}).catch(s=>{})};o();const a={type:"open"};this.query.sid&&(a.data=`{"sid":"${this.query.sid}"}`),this._writer.write(a).then(()=>this.onOpen())})})}write(t){this.writable=!1;for(let n=0;n<t.length;n++){const r=t[n],i=n===t.length-1;this._writer.write(r).then(()=>{i&&id(()=>{this.writable=!0,this.emitReserved("drain")},this.setTimeoutFn)})}}doClose(){var t;(t=this._transport)===null||t===void 0||t.close()}}const TK={websocket:jK,webtransport:MK,polling:_K},$K=/^(?:(?![^:@\/?#]+:[^:@\/]*@)(http|https|ws|wss):\/\/)?((?:(([^:@\/?#]*)(?::([^:@\/?#]*))?)?@)?((?:[a-f0-9]{0,4}:){2,7}[a-f0-9]{0,4}|[^:\/?#]*)(?::(\d*))?)(((\/(?:[^?#](?![^?#\/]*\.[^?#\/.]+(?:[?#]|$)))*\/?)?([^?#\/]*))(?:\?([^#]*))?(?:#(.*))?)/,IK=["source","protocol","authority","userInfo","user","password","host","port","relative","path","directory","file","query","anchor"];function sm(e){if(e.length>8e3)throw"URI too long";const t=e,n=e.indexOf("["),r=e.indexOf("]");n!=-1&&r!=-1&&(e=e.substring(0,n)+e.substring(n,r).replace(/:/g,";")+e.substring(r,e.length));let i=$K.exec(e||""),o={},a=14;for(;a--;)o[IK[a]]=i[a]||"";return n!=-1&&r!=-1&&(o.source=t,o.host=o.host.substring(1,o.host.length-1).replace(/;/g,":"),o.authority=o.authority.replace("[","").replace("]","").replace(/;/g,":"),o.ipv6uri=!0),o.pathNames=NK(o,o.path),o.queryKey=DK(o,o.query),o}function NK(e,t){const n=/\/{2,9}/g,r=t.replace(n,"/").split("/");return(t.slice(0,1)=="/"||t.length===0)&&r.splice(0,1),t.slice(-1)=="/"&&r.splice(r.length-1,1),r}function DK(e,t){const n={};return t.replace(/(?:^|&)([^&=]*)=?([^&]*)/g,function(r,i,o){i&&(n[i]=o)}),n}const lm=typeof addEventListener=="function"&&typeof removeEventListener=="function",Ou=[];lm&&addEventListener("offline",()=>{Ou.forEach(e=>e())},!1);class ii extends Fe{constructor(t,n){if(super(),this.binaryType=hK,this.writeBuffer=[],this._prevBufferLen=0,this._pingInterval=-1,this._pingTimeout=-1,this._maxPayload=-1,this._pingTimeoutTime=1/0,t&&typeof t=="object"&&(n=t,t=null),t){const r=sm(t);n.hostname=r.host,n.secure=r.protocol==="https"||r.protocol==="wss",n.port=r.port,r.query&&(n.query=r.query)}else n.host&&(n.hostname=sm(n.host).host);od(this,n),this.secure=n.secure!=null?n.secure:typeof location<"u"&&location.protocol==="https:",n.hostname&&!n.port&&(n.port=this.secure?"443":"80"),this.hostname=n.hostname||(typeof location<"u"?location.hostname:"localhost"),this.port=n.port||(typeof location<"u"&&location.port?location.port:this.secure?"443":"80"),this.transports=[],this._transportsByName={},n.transports.forEach(r=>{const i=r.prototype.name;this.transports.push(i),this._transportsByName[i]=r}),this.opts=Object.assign({path:"/engine.io",agent:!1,withCredentials:!1,upgrade:!0,timestampParam:"t",rememberUpgrade:!1,addTrailingSlash:!0,rejectUnauthorized:!0,perMessageDeflate:{threshold:1024},transportOptions:{},closeOnBeforeunload:!1},n),this.opts.path=this.opts.path.replace(/\/$/,"")+(this.opts.addTrailingSlash?"/":""),typeof this.opts.query=="string"&&(this.opts.query=bK(this.opts.query)),lm&&(this.opts.closeOnBeforeunload&&(this._beforeunloadEventListener=()=>{this.transport&&(this.transport.removeAllListeners(),this.transport.close())},addEventListener("beforeunload",this._beforeunloadEventListener,!1)),this.hostname!=="localhost"&&(this._offlineEventListener=()=>{this._onClose("transport close",{description:"network connection lost"})},Ou.push(this._offlineEventListener))),this.opts.withCredentials&&(this._cookieJar=void 0),this._open()}createTransport(t){const n=Object.assign({},this.opts.query);n.EIO=q_,n.transport=t,this.id&&(n.sid=this.id);const r=Object.assign({},this.opts,{query:n,socket:this,hostname:this.hostname,secure:this.secure,port:this.port},this.opts.transportOptions[t]);return new this._transportsByName[t](r)}_open(){if(this.transports.length===0){this.setTimeoutFn(()=>{this.emitReserved("error","No transports available")},0);return}const t=this.opts.rememberUpgrade&&ii.priorWebsocketSuccess&&this.transports.indexOf("websocket")!==-1?"websocket":this.transports[0];this.readyState="opening";const n=this.createTransport(t);n.open(),this.setTransport(n)}setTransport(t){this.transport&&this.transport.removeAllListeners(),this.transport=t,t.on("drain",this._onDrain.bind(this)).on("packet",this._onPacket.bind(this)).on("error",this._onError.bind(this)).on("close",n=>this._onClose("transport close",n))}onOpen(){this.readyState="open",ii.priorWebsocketSuccess=this.transport.name==="websocket",this.emitReserved("open"),this.flush()}_onPacket(t){if(this.readyState==="opening"||this.readyState==="open"||this.readyState==="closing")switch(this.emitReserved("packet",t),this.emitReserved("heartbeat"),t.type){case"open":this.onHandshake(JSON.parse(t.data));break;case"ping":this._sendPacket("pong"),this.emitReserved("ping"),this.emitReserved("pong"),this._resetPingTimeout();break;case"error":const n=new Error("server error");n.code=t.data,this._onError(n);break;case"message":this.emitReserved("data",t.data),this.emitReserved("message",t.data);break}}onHandshake(t){this.emitReserved("handshake",t),this.id=t.sid,this.transport.query.sid=t.sid,this._pingInterval=t.pingInterval,this._pingTimeout=t.pingTimeout,this._maxPayload=t.maxPayload,this.onOpen(),this.readyState!=="closed"&&this._resetPingTimeout()}_resetPingTimeout(){this.clearTimeoutFn(this._pingTimeoutTimer);const t=this._pingInterval+this._pingTimeout;this._pingTimeoutTime=Date.now()+t,this._pingTimeoutTimer=this.setTimeoutFn(()=>{this._onClose("ping timeout")},t),this.opts.autoUnref&&this._pingTimeoutTimer.unref()}_onDrain(){this.writeBuffer.splice(0,this._prevBufferLen),this._prevBufferLen=0,this.writeBuffer.length===0?this.emitReserved("drain"):this.flush()}flush(){if(this.readyState!=="closed"&&this.transport.writable&&!this.upgrading&&this.writeBuffer.length){const t=this._getWritablePackets();this.transport.send(t),this._prevBufferLen=t.length,this.emitReserved("flush")}}_getWritablePackets(){if(!(this._maxPayload&&this.transport.name==="polling"&&this.writeBuffer.length>1))return this.writeBuffer;let n=1;for(let r=0;r<this.writeBuffer.length;r++){const i=this.writeBuffer[r].data;if(i&&(n+=yK(i)),r>0&&n>this._maxPayload)return this.writeBuffer.slice(0,r);n+=2}return this.writeBuffer}_hasPingExpired(){if(!this._pingTimeoutTime)return!0;const t=Date.now()>this._pingTimeoutTime;return t&&(this._pingTimeoutTime=0,id(()=>{this._onClose("ping timeout")},this.setTimeoutFn)),t}write(t,n,r){return this._sendPacket("message",t,n,r),this}send(t,n,r){return this._sendPacket("message",t,n,r),this}_sendPacket(t,n,r,i){if(typeof n=="function"&&(i=n,n=void 0),typeof r=="function"&&(i=r,r=null),this.readyState==="closing"||this.readyState==="closed")return;r=r||{},r.compress=r.compress!==!1;const o={type:t,data:n,options:r};this.emitReserved("packetCreate",o),this.writeBuffer.push(o),i&&this.once("flush",i),this.flush()}close(){const t=()=>{this._onClose("forced close"),this.transport.close()},n=()=>{this.off("upgrade",n),this.off("upgradeError",n),t()},r=()=>{this.once("upgrade",n),this.once("upgradeError",n)};return(this.readyState==="opening"||this.readyState==="open")&&(this.readyState="closing",this.writeBuffer.length?this.once("drain",()=>{this.upgrading?r():t()}):this.upgrading?r():t()),this}_onError(t){if(ii.priorWebsocketSuccess=!1,this.opts.tryAllTransports&&this.transports.length>1&&this.readyState==="opening")return this.transports.shift(),this._open();this.emitReserved("error",t),this._onClose("transport error",t)}_onClose(t,n){if(this.readyState==="opening"||this.readyState==="open"||this.readyState==="closing"){if(this.clearTimeoutFn(this._pingTimeoutTimer),this.transport.removeAllListeners("close"),this.transport.close(),this.transport.removeAllListeners(),lm&&(this._beforeunloadEventListener&&removeEventListener("beforeunload",this._beforeunloadEventListener,!1),this._offlineEventListener)){const r=Ou.indexOf(this._offlineEventListener);r!==-1&&Ou.splice(r,1)}this.readyState="closed",this.id=null,this.emitReserved("close",t,n),this.writeBuffer=[],this._prevBufferLen=0}}}ii.protocol=q_;class RK extends ii{constructor(){super(...arguments),this._upgrades=[]}onOpen(){if(super.onOpen(),this.readyState==="open"&&this.opts.upgrade)for(let t=0;t<this._upgrades.length;t++)this._probe(this._upgrades[t])}_probe(t){let n=this.createTransport(t),r=!1;ii.priorWebsocketSuccess=!1;const i=()=>{r||(n.send([{type:"ping",data:"probe"}]),n.once("packet",f=>{if(!r)if(f.type==="pong"&&f.data==="probe"){if(this.upgrading=!0,this.emitReserved("upgrading",n),!n)return;ii.priorWebsocketSuccess=n.name==="websocket",this.transport.pause(()=>{r||this.readyState!=="closed"&&(c(),this.setTransport(n),n.send([{type:"upgrade"}]),this.emitReserved("upgrade",n),n=null,this.upgrading=!1,this.flush())})}else{const d=new Error("probe error");d.transport=n.name,this.emitReserved("upgradeError",d)}}))};function o(){r||(r=!0,c(),n.close(),n=null)}const a=f=>{const d=new Error("probe error: "+f);d.transport=n.name,o(),this.emitReserved("upgradeError",d)};function s(){a("transport closed")}function l(){a("socket closed")}function u(f){n&&f.name!==n.name&&o()}const c=()=>{n.removeListener("open",i),n.removeListener("error",a),n.removeListener("close",s),this.off("close",l),this.off("upgrading",u)};n.once("open",i),n.once("error",a),n.once("close",s),this.once("close",l),this.once("upgrading",u),this._upgrades.indexOf("webtransport")!==-1&&t!=="webtransport"?this.setTimeoutFn(()=>{r||n.open()},200):n.open()}onHandshake(t){this._upgrades=this._filterUpgrades(t.upgrades),super.onHandshake(t)}_filterUpgrades(t){const n=[];for(let r=0;r<t.length;r++)~this.transports.indexOf(t[r])&&n.push(t[r]);return n}}let LK=class extends RK{constructor(t,n={}){const r=typeof t=="object"?t:n;(!r.transports||r.transports&&typeof r.transports[0]=="string")&&(r.transports=(r.transports||["polling","websocket","webtransport"]).map(i=>TK[i]).filter(i=>!!i)),super(t,r)}};function zK(e,t="",n){let r=e;n=n||typeof location<"u"&&location,e==null&&(e=n.protocol+"//"+n.host),typeof e=="string"&&(e.charAt(0)==="/"&&(e.charAt(1)==="/"?e=n.protocol+e:e=n.host+e),/^(https?|wss?):\/\//.test(e)||(typeof n<"u"?e=n.protocol+"//"+e:e="https://"+e),r=sm(e)),r.port||(/^(http|ws)$/.test(r.protocol)?r.port="80":/^(http|ws)s$/.test(r.protocol)&&(r.port="443")),r.path=r.path||"/";const o=r.host.indexOf(":")!==-1?"["+r.host+"]":r.host;return r.id=r.protocol+"://"+o+":"+r.port+t,r.href=r.protocol+"://"+o+(n&&n.port===r.port?"":":"+r.port),r}const FK=typeof ArrayBuffer=="function",BK=e=>typeof ArrayBuffer.isView=="function"?ArrayBuffer.isView(e):e.buffer instanceof ArrayBuffer,eA=Object.prototype.toString,UK=typeof Blob=="function"||typeof Blob<"u"&&eA.call(Blob)==="[object BlobConstructor]",VK=typeof File=="function"||typeof File<"u"&&eA.call(File)==="[object FileConstructor]";function ay(e){return FK&&(e instanceof ArrayBuffer||BK(e))||UK&&e instanceof Blob||VK&&e instanceof File}function Eu(e,t){if(!e||typeof e!="object")return!1;if(Array.isArray(e)){for(let n=0,r=e.length;n<r;n++)if(Eu(e[n]))return!0;return!1}if(ay(e))return!0;if(e.toJSON&&typeof e.toJSON=="function"&&arguments.length===1)return Eu(e.toJSON(),!0);for(const n in e)if(Object.prototype.hasOwnProperty.call(e,n)&&Eu(e[n]))return!0;return!1}function HK(e){const t=[],n=e.data,r=e;return r.data=um(n,t),r.attachments=t.length,{packet:r,buffers:t}}function um(e,t){if(!e)return e;if(ay(e)){const n={_placeholder:!0,num:t.length};return t.push(e),n}else if(Array.isArray(e)){const n=new Array(e.length);for(let r=0;r<e.length;r++)n[r]=um(e[r],t);return n}else if(typeof e=="object"&&!(e instanceof Date)){const n={};for(const r in e)Object.prototype.hasOwnProperty.call(e,r)&&(n[r]=um(e[r],t));return n}return e}function KK(e,t){return e.data=cm(e.data,t),delete e.attachments,e}function cm(e,t){if(!e)return e;if(e&&e._placeholder===!0){if(typeof e.num=="number"&&e.num>=0&&e.num<t.length)return t[e.num];throw new Error("illegal attachments")}else if(Array.isArray(e))for(let n=0;n<e.length;n++)e[n]=cm(e[n],t);else if(typeof e=="object")for(const n in e)Object.prototype.hasOwnProperty.call(e,n)&&(e[n]=cm(e[n],t));return e}const tA=["connect","connect_error","disconnect","disconnecting","newListener","removeListener"],WK=5;var oe;(function(e){e[e.CONNECT=0]="CONNECT",e[e.DISCONNECT=1]="DISCONNECT",e[e.EVENT=2]="EVENT",e[e.ACK=3]="ACK",e[e.CONNECT_ERROR=4]="CONNECT_ERROR",e[e.BINARY_EVENT=5]="BINARY_EVENT",e[e.BINARY_ACK=6]="BINARY_ACK"})(oe||(oe={}));class YK{constructor(t){this.replacer=t}encode(t){return(t.type===oe.EVENT||t.type===oe.ACK)&&Eu(t)?this.encodeAsBinary({type:t.type===oe.EVENT?oe.BINARY_EVENT:oe.BINARY_ACK,nsp:t.nsp,data:t.data,id:t.id}):[this.encodeAsString(t)]}encodeAsString(t){let n=""+t.type;return(t.type===oe.BINARY_EVENT||t.type===oe.BINARY_ACK)&&(n+=t.attachments+"-"),t.nsp&&t.nsp!=="/"&&(n+=t.nsp+","),t.id!=null&&(n+=t.id),t.data!=null&&(n+=JSON.stringify(t.data,this.replacer)),n}encodeAsBinary(t){const n=HK(t),r=this.encodeAsString(n.packet),i=n.buffers;return i.unshift(r),i}}class sy extends Fe{constructor(t){super(),this.reviver=t}add(t){let n;if(typeof t=="string"){if(this.reconstructor)throw new Error("got plaintext data when reconstructing a packet");n=this.decodeString(t);const r=n.type===oe.BINARY_EVENT;r||n.type===oe.BINARY_ACK?(n.type=r?oe.EVENT:oe.ACK,this.reconstructor=new qK(n),n.attachments===0&&super.emitReserved("decoded",n)):super.emitReserved("decoded",n)}else if(ay(t)||t.base64)if(this.reconstructor)n=this.reconstructor.takeBinaryData(t),n&&(this.reconstructor=null,super.emitReserved("decoded",n));else throw new Error("got binary data when not reconstructing a packet");else throw new Error("Unknown type: "+t)}decodeString(t){let n=0;const r={type:Number(t.charAt(0))};if(oe[r.type]===void 0)throw new Error("unknown packet type "+r.type);if(r.type===oe.BINARY_EVENT||r.type===oe.BINARY_ACK){const o=n+1;for(;t.charAt(++n)!=="-"&&n!=t.length;);const a=t.substring(o,n);if(a!=Number(a)||t.charAt(n)!=="-")throw new Error("Illegal attachments");r.attachments=Number(a)}if(t.charAt(n+1)==="/"){const o=n+1;for(;++n&&!(t.charAt(n)===","||n===t.length););r.nsp=t.substring(o,n)}else r.nsp="/";const i=t.charAt(n+1);if(i!==""&&Number(i)==i){const o=n+1;for(;++n;){const a=t.charAt(n);if(a==null||Number(a)!=a){--n;break}if(n===t.length)break}r.id=Number(t.substring(o,n+1))}if(t.charAt(++n)){const o=this.tryParse(t.substr(n));if(sy.isPayloadValid(r.type,o))r.data=o;else throw new Error("invalid payload")}return r}tryParse(t){try{return JSON.parse(t,this.reviver)}catch{return!1}}static isPayloadValid(t,n){switch(t){case oe.CONNECT:return Hc(n);case oe.DISCONNECT:return n===void 0;case oe.CONNECT_ERROR:return typeof n=="string"||Hc(n);case oe.EVENT:case oe.BINARY_EVENT:return Array.isArray(n)&&(typeof n[0]=="number"||typeof n[0]=="string"&&tA.indexOf(n[0])===-1);case oe.ACK:case oe.BINARY_ACK:return Array.isArray(n)}}destroy(){this.reconstructor&&(this.reconstructor.finishedReconstruction(),this.reconstructor=null)}}class qK{constructor(t){this.packet=t,this.buffers=[],this.reconPack=t}takeBinaryData(t){if(this.buffers.push(t),this.buffers.length===this.reconPack.attachments){const n=KK(this.reconPack,this.buffers);return this.finishedReconstruction(),n}return null}finishedReconstruction(){this.reconPack=null,this.buffers=[]}}function GK(e){return typeof e=="string"}const XK=Number.isInteger||function(e){return typeof e=="number"&&isFinite(e)&&Math.floor(e)===e};function ZK(e){return e===void 0||XK(e)}function Hc(e){return Object.prototype.toString.call(e)==="[object Object]"}function QK(e,t){switch(e){case oe.CONNECT:return t===void 0||Hc(t);case oe.DISCONNECT:return t===void 0;case oe.EVENT:return Array.isArray(t)&&(typeof t[0]=="number"||typeof t[0]=="string"&&tA.indexOf(t[0])===-1);case oe.ACK:return Array.isArray(t);case oe.CONNECT_ERROR:return typeof t=="string"||Hc(t);default:return!1}}function JK(e){return GK(e.nsp)&&ZK(e.id)&&QK(e.type,e.data)}const eW=Object.freeze(Object.defineProperty({__proto__:null,Decoder:sy,Encoder:YK,get PacketType(){return oe},isPacketValid:JK,protocol:WK},Symbol.toStringTag,{value:"Module"}));function bn(e,t,n){return e.on(t,n),function(){e.off(t,n)}}const tW=Object.freeze({connect:1,connect_error:1,disconnect:1,disconnecting:1,newListener:1,removeListener:1});class nA extends Fe{constructor(t,n,r){super(),this.connected=!1,this.recovered=!1,this.receiveBuffer=[],this.sendBuffer=[],this._queue=[],this._queueSeq=0,this.ids=0,this.acks={},this.flags={},this.io=t,this.nsp=n,r&&r.auth&&(this.auth=r.auth),this._opts=Object.assign({},r),this.io._autoConnect&&this.open()}get disconnected(){return!this.connected}subEvents(){if(this.subs)return;const t=this.io;this.subs=[bn(t,"open",this.onopen.bind(this)),bn(t,"packet",this.onpacket.bind(this)),bn(t,"error",this.onerror.bind(this)),bn(t,"close",this.onclose.bind(this))]}get active(){return!!this.subs}connect(){return this.connected?this:(this.subEvents(),this.io._reconnecting||this.io.open(),this.io._readyState==="open"&&this.onopen(),this)}open(){return this.connect()}send(...t){return t.unshift("message"),this.emit.apply(this,t),this}emit(t,...n){var r,i,o;if(tW.hasOwnProperty(t))throw new Error('"'+t.toString()+'" is a reserved event name');if(n.unshift(t),this._opts.retries&&!this.flags.fromQueue&&!this.flags.volatile)return this._addToQueue(n),this;const a={type:oe.EVENT,data:n};if(a.options={},a.options.compress=this.flags.compress!==!1,typeof n[n.length-1]=="function"){const c=this.ids++,f=n.pop();this._registerAckCallback(c,f),a.id=c}const s=(i=(r=this.io.engine)===null||r===void 0?void 0:r.transport)===null||i===void 0?void 0:i.writable,l=this.connected&&!(!((o=this.io.engine)===null||o===void 0)&&o._hasPingExpired());return this.flags.volatile&&!s||(l?(this.notifyOutgoingListeners(a),this.packet(a)):this.sendBuffer.push(a)),this.flags={},this}_registerAckCallback(t,n){var r;const i=(r=this.flags.timeout)!==null&&r!==void 0?r:this._opts.ackTimeout;if(i===void 0){this.acks[t]=n;return}const o=this.io.setTimeoutFn(()=>{delete this.acks[t];for(let s=0;s<this.sendBuffer.length;s++)this.sendBuffer[s].id===t&&this.sendBuffer.splice(s,1);n.call(this,new Error("operation has timed out"))},i),a=(...s)=>{this.io.clearTimeoutFn(o),n.apply(this,s)};a.withError=!0,this.acks[t]=a}emitWithAck(t,...n){return new Promise((r,i)=>{const o=(a,s)=>a?i(a):r(s);o.withError=!0,n.push(o),this.emit(t,...n)})}_addToQueue(t){let n;typeof t[t.length-1]=="function"&&(n=t.pop());const r={id:this._queueSeq++,tryCount:0,pending:!1,args:t,flags:Object.assign({fromQueue:!0},this.flags)};t.push((i,...o)=>(this._queue[0],i!==null?r.tryCount>this._opts.retries&&(this._queue.shift(),n&&n(i)):(this._queue.shift(),n&&n(null,...o)),r.pending=!1,this._drainQueue())),this._queue.push(r),this._drainQueue()}_drainQueue(t=!1){if(!this.connected||this._queue.length===0)return;const n=this._queue[0];n.pending&&!t||(n.pending=!0,n.tryCount++,this.flags=n.flags,this.emit.apply(this,n.args))}packet(t){t.nsp=this.nsp,this.io._packet(t)}onopen(){typeof this.auth=="function"?this.auth(t=>{this._sendConnectPacket(t)}):this._sendConnectPacket(this.auth)}_sendConnectPacket(t){this.packet({type:oe.CONNECT,data:this._pid?Object.assign({pid:this._pid,offset:this._lastOffset},t):t})}onerror(t){this.connected||this.emitReserved("connect_error",t)}onclose(t,n){this.connected=!1,delete this.id,this.emitReserved("disconnect",t,n),this._clearAcks()}_clearAcks(){Object.keys(this.acks).forEach(t=>{if(!this.sendBuffer.some(r=>String(r.id)===t)){const r=this.acks[t];delete this.acks[t],r.withError&&r.call(this,new Error("socket has been disconnected"))}})}onpacket(t){if(t.nsp===this.nsp)switch(t.type){case oe.CONNECT:t.data&&t.data.sid?this.onconnect(t.data.sid,t.data.pid):this.emitReserved("connect_error",new Error("It seems you are trying to reach a Socket.IO server in v2.x with a v3.x client, but they are not compatible (more information here: https://socket.io/docs/v3/migrating-from-2-x-to-3-0/)"));break;case oe.EVENT:case oe.BINARY_EVENT:this.onevent(t);break;case oe.ACK:case oe.BINARY_ACK:this.onack(t);break;case oe.DISCONNECT:this.ondisconnect();break;case oe.CONNECT_ERROR:this.destroy();const r=new Error(t.data.message);r.data=t.data.data,this.emitReserved("connect_error",r);break}}onevent(t){const n=t.data||[];t.id!=null&&n.push(this.ack(t.id)),this.connected?this.emitEvent(n):this.receiveBuffer.push(Object.freeze(n))}emitEvent(t){if(this._anyListeners&&this._anyListeners.length){const n=this._anyListeners.slice();for(const r of n)r.apply(this,t)}super.emit.apply(this,t),this._pid&&t.length&&typeof t[t.length-1]=="string"&&(this._lastOffset=t[t.length-1])}ack(t){const n=this;let r=!1;return function(...i){r||(r=!0,n.packet({type:oe.ACK,id:t,data:i}))}}onack(t){const n=this.acks[t.id];typeof n=="function"&&(delete this.acks[t.id],n.withError&&t.data.unshift(null),n.apply(this,t.data))}onconnect(t,n){this.id=t,this.recovered=n&&this._pid===n,this._pid=n,this.connected=!0,this.emitBuffered(),this._drainQueue(!0),this.emitReserved("connect")}emitBuffered(){this.receiveBuffer.forEach(t=>this.emitEvent(t)),this.receiveBuffer=[],this.sendBuffer.forEach(t=>{this.notifyOutgoingListeners(t),this.packet(t)}),this.sendBuffer=[]}ondisconnect(){this.destroy(),this.onclose("io server disconnect")}destroy(){this.subs&&(this.subs.forEach(t=>t()),this.subs=void 0),this.io._destroy(this)}disconnect(){return this.connected&&this.packet({type:oe.DISCONNECT}),this.destroy(),this.connected&&this.onclose("io client disconnect"),this}close(){return this.disconnect()}compress(t){return this.flags.compress=t,this}get volatile(){return this.flags.volatile=!0,this}timeout(t){return this.flags.timeout=t,this}onAny(t){return this._anyListeners=this._anyListeners||[],this._anyListeners.push(t),this}prependAny(t){return this._anyListeners=this._anyListeners||[],this._anyListeners.unshift(t),this}offAny(t){if(!this._anyListeners)return this;if(t){const n=this._anyListeners;for(let r=0;r<n.length;r++)if(t===n[r])return n.splice(r,1),this}else this._anyListeners=[];return this}listenersAny(){return this._anyListeners||[]}onAnyOutgoing(t){return this._anyOutgoingListeners=this._anyOutgoingListeners||[],this._anyOutgoingListeners.push(t),this}prependAnyOutgoing(t){return this._anyOutgoingListeners=this._anyOutgoingListeners||[],this._anyOutgoingListeners.unshift(t),this}offAnyOutgoing(t){if(!this._anyOutgoingListeners)return this;if(t){const n=this._anyOutgoingListeners;for(let r=0;r<n.length;r++)if(t===n[r])return n.splice(r,1),this}else this._anyOutgoingListeners=[];return this}listenersAnyOutgoing(){return this._anyOutgoingListeners||[]}notifyOutgoingListeners(t){if(this._anyOutgoingListeners&&this._anyOutgoingListeners.length){const n=this._anyOutgoingListeners.slice();for(const r of n)r.apply(this,t.data)}}}function ga(e){e=e||{},this.ms=e.min||100,this.max=e.max||1e4,this.factor=e.factor||2,this.jitter=e.jitter>0&&e.jitter<=1?e.jitter:0,this.attempts=0}ga.prototype.duration=function(){var e=this.ms*Math.pow(this.factor,this.attempts++);if(this.jitter){var t=Math.random(),n=Math.floor(t*this.jitter*e);e=Math.floor(t*10)&1?e+n:e-n}return Math.min(e,this.max)|0};ga.prototype.reset=function(){this.attempts=0};ga.prototype.setMin=function(e){this.ms=e};ga.prototype.setMax=function(e){this.max=e};ga.prototype.setJitter=function(e){this.jitter=e};class fm extends Fe{constructor(t,n){var r;super(),this.nsps={},this.subs=[],t&&typeof t=="object"&&(n=t,t=void 0),n=n||{},n.path=n.path||"/socket.io",this.opts=n,od(this,n),this.reconnection(n.reconnection!==!1),this.reconnectionAttempts(n.reconnectionAttempts||1/0),this.reconnectionDelay(n.reconnectionDelay||1e3),this.reconnectionDelayMax(n.reconnectionDelayMax||5e3),this.randomizationFactor((r=n.randomizationFactor)!==null&&r!==void 0?r:.5),this.backoff=new ga({min:this.reconnectionDelay(),max:this.reconnectionDelayMax(),jitter:this.randomizationFactor()}),this.timeout(n.timeout==null?2e4:n.timeout),this._readyState="closed",this.uri=t;const i=n.parser||eW;this.encoder=new i.Encoder,this.decoder=new i.Decoder,this._autoConnect=n.autoConnect!==!1,this._autoConnect&&this.open()}reconnection(t){return arguments.length?(this._reconnection=!!t,t||(this.skipReconnect=!0),this):this._reconnection}reconnectionAttempts(t){return t===void 0?this._reconnectionAttempts:(this._reconnectionAttempts=t,this)}reconnectionDelay(t){var n;return t===void 0?this._reconnectionDelay:(this._reconnectionDelay=t,(n=this.backoff)===null||n===void 0||n.setMin(t),this)}randomizationFactor(t){var n;return t===void 0?this._randomizationFactor:(this._randomizationFactor=t,(n=this.backoff)===null||n===void 0||n.setJitter(t),this)}reconnectionDelayMax(t){var n;return t===void 0?this._reconnectionDelayMax:(this._reconnectionDelayMax=t,(n=this.backoff)===null||n===void 0||n.setMax(t),this)}timeout(t){return arguments.length?(this._timeout=t,this):this._timeout}maybeReconnectOnOpen(){!this._reconnecting&&this._reconnection&&this.backoff.attempts===0&&this.reconnect()}open(t){if(~this._readyState.indexOf("open"))return this;this.engine=new LK(this.uri,this.opts);const n=this.engine,r=this;this._readyState="opening",this.skipReconnect=!1;const i=bn(n,"open",function(){r.onopen(),t&&t()}),o=s=>{this.cleanup(),this._readyState="closed",this.emitReserved("error",s),t?t(s):this.maybeReconnectOnOpen()},a=bn(n,"error",o);if(this._timeout!==!1){const s=this._timeout,l=this.setTimeoutFn(()=>{i(),o(new Error("timeout")),n.close()},s);this.opts.autoUnref&&l.unref(),this.subs.push(()=>{this.clearTimeoutFn(l)})}return this.subs.push(i),this.subs.push(a),this}connect(t){return this.open(t)}onopen(){this.cleanup(),this._readyState="open",this.emitReserved("open");const t=this.engine;this.subs.push(bn(t,"ping",this.onping.bind(this)),bn(t,"data",this.ondata.bind(this)),bn(t,"error",this.onerror.bind(this)),bn(t,"close",this.onclose.bind(this)),bn(this.decoder,"decoded",this.ondecoded.bind(this)))}onping(){this.emitReserved("ping")}ondata(t){try{this.decoder.add(t)}catch(n){this.onclose("parse error",n)}}ondecoded(t){id(()=>{this.emitReserved("packet",t)},this.setTimeoutFn)}onerror(t){this.emitReserved("error",t)}socket(t,n){let r=this.nsps[t];return r?this._autoConnect&&!r.active&&r.connect():(r=new nA(this,t,n),this.nsps[t]=r),r}_destroy(t){const n=Object.keys(this.nsps);for(const r of n)if(this.nsps[r].active)return;this._close()}_packet(t){const n=this.encoder.encode(t);for(let r=0;r<n.length;r++)this.engine.write(n[r],t.options)}cleanup(){this.subs.forEach(t=>t()),this.subs.length=0,this.decoder.destroy()}_close(){this.skipReconnect=!0,this._reconnecting=!1,this.onclose("forced close")}disconnect(){return this._close()}onclose(t,n){var r;this.cleanup(),(r=this.engine)===null||r===void 0||r.close(),this.backoff.reset(),this._readyState="closed",this.emitReserved("close",t,n),this._reconnection&&!this.skipReconnect&&this.reconnect()}reconnect(){if(this._reconnecting||this.skipReconnect)return this;const t=this;if(this.backoff.attempts>=this._reconnectionAttempts)this.backoff.reset(),this.emitReserved("reconnect_failed"),this._reconnecting=!1;else{const n=this.backoff.duration();this._reconnecting=!0;const r=this.setTimeoutFn(()=>{t.skipReconnect||(this.emitReserved("reconnect_attempt",t.backoff.attempts),!t.skipReconnect&&t.open(i=>{i?(t._reconnecting=!1,t.reconnect(),this.emitReserved("reconnect_error",i)):t.onreconnect()}))},n);this.opts.autoUnref&&r.unref(),this.subs.push(()=>{this.clearTimeoutFn(r)})}}onreconnect(){const t=this.backoff.attempts;this._reconnecting=!1,this.backoff.reset(),this.emitReserved("reconnect",t)}}const Ra={};function ku(e,t){typeof e=="object"&&(t=e,e=void 0),t=t||{};const n=zK(e,t.path||"/socket.io"),r=n.source,i=n.id,o=n.path,a=Ra[i]&&o in Ra[i].nsps,s=t.forceNew||t["force new connection"]||t.multiplex===!1||a;let l;return s?l=new fm(r,t):(Ra[i]||(Ra[i]=new fm(r,t)),l=Ra[i]),n.query&&!t.query&&(t.query=n.queryKey),l.socket(n.path,t)}Object.assign(ku,{Manager:fm,Socket:nA,io:ku,connect:ku});const ab=window.location.origin;class nW{constructor(){wi(this,"socket",null);wi(this,"breathingRateCallbacks",[]);wi(this,"stateUpdateCallbacks",[]);wi(this,"stateCursor",null);wi(this,"connected",!1)}connect(){var t;if((t=this.socket)!=null&&t.connected){console.log("[SocketService] Already connected");return}console.log("[SocketService] Connecting to",ab),this.socket=ku(ab,{transports:["websocket","polling"],reconnection:!0,reconnectionAttempts:5,reconnectionDelay:1e3}),this.socket.on("connect",()=>{console.log("[SocketService] Connected"),this.connected=!0,this.stateUpdateCallbacks.length>0&&this.resubscribeState()}),this.socket.on("disconnect",()=>{console.log("[SocketService] Disconnected"),this.connected=!1}),this.socket.on("connected",n=>{console.log("[SocketService] Server acknowledged connection:",n)}),this.socket.on("breathing_rate_update",n=>{console.log("[SocketService] Breathing rate update:",n),this.breathingRateCallbacks.forEach(r=>r(n))}),this.socket.on("state_update",(n,r)=>{r==null||r(),this.stateUpdateCallbacks.forEach(i=>i(n))}),this.socket.on("connect_error",n=>{console.error("[SocketService] Connection error:",n)})}disconnect(){this.socket&&(this.socket.disconnect(),this.socket=null,this.connected=!1,console.log("[SocketService] Disconnected"))}isConnected(){return this.connected}onBreathingRateUpdate(t){return this.breathingRateCallbacks.push(t),()=>{this.breathingRateCallbacks=this.breathingRateCallbacks.filter(n=>n!==t)}}onStateUpdate(t,n){return this.stateCursor=t,this.stateUpdateCallbacks.push(n),this.connect(),this.connected&&this.resubscribeState(),()=>{this.stateUpdateCallbacks=this.stateUpdateCallbacks.filter(r=>r!==n)}}resubscribeState(){var t;(t=this.socket)==null||t.emit("subscribe_state",this.stateCursor?this.stateCursor():{})}}const sb=new nW,rW=({isOpen:e,onClose:t,topBarHeight:n,sphereWidth:r,containerWidth:i,containerHeight:o})=>{const[a,s]=m.useState([]),[l,u]=m.useState(null),[c,f]=m.useState(null),[d,p]=m.useState(null),[h,v]=m.useState(null),y=m.useRef(0);if(m.useEffect(()=>{e&&Promise.all([CT(),_T(),AT(),jT(),MT()]).then(([N,L,V,B,U])=>{s(N),y.current=N.length,u(L),f(V),p(B),v(U)})},[e]),m.useEffect(()=>{if(!e)return;sb.connect();const N=sb.onBreathingRateUpdate(L=>{s(V=>{const B={hour:0,minute:0,value:L.br,time:y.current.toString().padStart(2,"0"),timestamp:L.timestamp*1e3};y.current+=1;const U=[...V,B];return U.length>50?U.slice(-50):U})});return()=>{N()}},[e]),!e)return null;const g=E(1069,i),x=T(1759,o),w=E(57,i),S=T(400,o),P=E(100,i),O=E(12.5,i),k=E(104,i),j=E(4,i),M=E(9.37,i),A=E(54.11,i),C=T(2294-2159,o),_=E(587-591.5,i);return b.jsxs(iK,{delayDuration:200,children:[b.jsx("div",{className:"absolute inset-0 z-50",style:{backgroundColor:"rgba(0, 0, 0, 0.5)"},onClick:N=>{N.stopPropagation()}}),b.jsxs("div",{className:"absolute z-50 flex flex-col items-center",style:{left:`${w}px`,top:`${S}px`,width:`${g}px`},children:[b.jsxs("div",{className:"w-full flex flex-col relative",style:{borderRadius:`${P}px`,height:`${x}px`,background:"linear-gradient(330.9deg, rgba(255, 255, 255, 0.86) 67.56%, rgba(246, 237, 243, 0.86) 94.65%)",backdropFilter:`blur(${O}px)`,WebkitBackdropFilter:`blur(${O}px)`,overflow:"visible",position:"relative"},children:[b.jsx("div",{className:"flex-1",style:{height:"50%",paddingLeft:"16px",paddingTop:"16px",paddingBottom:"16px",paddingRight:0},children:a.length>0&&b.jsx(iU,{data:a,containerWidth:i,containerHeight:o})}),b.jsxs("div",{className:"flex-1 p-4",style:{height:"50%"},children:[b.jsxs("div",{className:"w-full h-full grid grid-cols-2 grid-rows-2 gap-4",children:[b.jsx("div",{className:"w-full h-full",style:{visibility:"hidden"}}),b.jsx("div",{className:"w-full h-full",style:{visibility:"hidden"}}),b.jsx("div",{className:"w-full h-full",style:{visibility:"hidden"}}),b.jsx("div",{className:"w-full h-full",style:{visibility:"hidden"}})]}),b.jsxs("div",{style:{position:"absolute",width:`${E(468,i)}px`,height:`${T(404,o)}px`,left:`${E(117-57,i)}px`,top:`${T(1275-400,o)}px`,background:"#F6EDF3",borderRadius:`${E(60,i)}px`,padding:`${E(16,i)}px`,display:"flex",flexDirection:"column"},children:[b.jsx("div",{style:{position:"absolute",width:`${E(106,i)}px`,height:`${T(106,o)}px`,left:`${E(36,i)}px`,top:`${T(36,o)}px`,display:"flex",alignItems:"center",justifyContent:"center",zIndex:1},children:b.jsx("img",{src:"/stress-level-icon.svg",alt:"压力水平图标",width:E(106,i),height:T(106,o),style:{objectFit:"contain"}})}),b.jsxs("div",{style:{position:"absolute",right:`${E(16,i)}px`,top:`${T(36+106/2,o)}px`,transform:"translateY(-50%)",display:"flex",alignItems:"center",gap:`${E(8,i)}px`,zIndex:1},children:[b.jsx("span",{style:{fontFamily:"OPPO Sans 4.0",fontWeight:500,fontStyle:"normal",fontSize:`${E(40,i)}px`,lineHeight:"100%",letterSpacing:"0%",textAlign:"right",color:"#262024"},children:"压力水平"}),b.jsxs(eu,{children:[b.jsx(tu,{asChild:!0,children:b.jsx("button",{style:{width:`${E(48,i)}px`,height:`${E(48,i)}px`,background:"transparent",border:"none",cursor:"pointer",padding:0,display:"flex",alignItems:"center",justifyContent:"center"},children:b.jsxs("svg",{width:E(48,i),height:E(48,i),viewBox:"0 0 24 24",fill:"none",xmlns:"http://www.w3.org/2000/svg",children:[b.jsx("circle",{cx:"12",cy:"12",r:"10",stroke:"#B5A6B0",strokeWidth:"2",fill:"none"}),b.jsx("path",{d:"M12 16V12M12 8H12.01",stroke:"#B5A6B0",strokeWidth:"2",strokeLinecap:"round"})]})})}),b.jsx(Ha,{side:"bottom",borderRadius:E(30,i),containerWidth:i,children:"压力指数是累积的压力指数，用于衡量生活中处理各种事情引起的心理压力，以及身体长期暴露在负面因素中造成的生理压力。压力指数偏高代表压力水平上升，压力指数偏低代表压力水平下降，压力指数过低也代表交感神经活性减弱。"})]})]}),l&&b.jsx("div",{style:{position:"absolute",left:`${E(16,i)}px`,right:`${E(16,i)}px`,top:`${T(162,o)}px`,bottom:`${T(62+96,o)}px`,display:"flex",alignItems:"center",justifyContent:"center",zIndex:0},children:b.jsx(Lw,{value:l.value,containerWidth:i,showOnlySVG:!0})}),l&&b.jsx("div",{style:{position:"absolute",left:`${E(48,i)}px`,bottom:`${T(48,o)}px`},children:b.jsx("span",{style:{fontFamily:"OPPO Sans 4.0",fontWeight:500,fontStyle:"normal",fontSize:`${E(96,i)}px`,lineHeight:"100%",letterSpacing:"0%",color:"#262024"},children:l.value})})]}),b.jsxs("div",{style:{position:"absolute",width:`${E(468,i)}px`,height:`${T(404,o)}px`,left:`${E(117-57+468+16,i)}px`,top:`${T(1275-400,o)}px`,background:"#F7F3F6",borderRadius:`${E(60,i)}px`,padding:`${E(16,i)}px`,display:"flex",flexDirection:"column"},children:[b.jsx("div",{style:{position:"absolute",width:`${E(74,i)}px`,height:`${T(74,o)}px`,left:`${E(36,i)}px`,top:`${T(36+106/2-74/2,o)}px`,display:"flex",alignItems:"center",justifyContent:"center",zIndex:1},children:b.jsx("img",{src:"/stress-recovery-icon.svg",alt:"压力调节恢复能力图标",width:E(74,i),height:T(74,o),style:{objectFit:"contain"}})}),b.jsxs("div",{style:{position:"absolute",right:`${E(16,i)}px`,top:`${T(36+106/2,o)}px`,transform:"translateY(-50%)",display:"flex",alignItems:"center",gap:`${E(8,i)}px`,zIndex:1},children:[b.jsxs("div",{style:{display:"flex",flexDirection:"column",alignItems:"flex-end",lineHeight:"100%"},children:[b.jsx("span",{style:{fontFamily:"OPPO Sans 4.0",fontWeight:500,fontStyle:"normal",fontSize:`${E(40,i)}px`,lineHeight:"100%",letterSpacing:"0%",textAlign:"right",color:"#262024"},children:"压力调节"}),b.jsx("span",{style:{fontFamily:"OPPO Sans 4.0",fontWeight:500,fontStyle:"normal",fontSize:`${E(40,i)}px`,lineHeight:"100%",letterSpacing:"0%",textAlign:"right",color:"#262024"},children:"恢复能力"})]}),b.jsxs(eu,{children:[b.jsx(tu,{asChild:!0,children:b.jsx("button",{style:{width:`${E(48,i)}px`,height:`${E(48,i)}px`,background:"transparent",border:"none",cursor:"pointer",padding:0,display:"flex",alignItems:"center",justifyContent:"center"},children:b.jsxs("svg",{width:E(48,i),height:E(48,i),viewBox:"0 0 24 24",fill:"none",xmlns:"http://www.w3.org/2000/svg",children:[b.jsx("circle",{cx:"12",cy:"12",r:"10",stroke:"#B5A6B0",strokeWidth:"2",fill:"none"}),b.jsx("path",{d:"M12 16V12M12 8H12.01",stroke:"#B5A6B0",strokeWidth:"2",strokeLinecap:"round"})]})})}),b.jsx(Ha,{side:"bottom",align:"end",borderRadius:E(30,i),containerWidth:i,children:"压力调节恢复能力提示信息"})]})]}),c&&b.jsx("div",{style:{position:"absolute",left:`${E(16,i)}px`,right:`${E(16,i)}px`,top:`${T(146,o)}px`,bottom:`${T(62+96,o)}px`,display:"flex",alignItems:"center",justifyContent:"center",zIndex:0},children:b.jsx(Lw,{value:c.value,containerWidth:i,showOnlySVG:!0})}),c&&b.jsx("div",{style:{position:"absolute",left:`${E(48,i)}px`,bottom:`${T(48,o)}px`},children:b.jsx("span",{style:{fontFamily:"OPPO Sans 4.0",fontWeight:500,fontStyle:"normal",fontSize:`${E(96,i)}px`,lineHeight:"100%",letterSpacing:"0%",color:"#262024"},children:c.value})})]}),b.jsxs("div",{style:{position:"absolute",width:`${E(468,i)}px`,height:`${T(404,o)}px`,left:`${E(117-57,i)}px`,top:`${T(1275-400+404+16,o)}px`,background:"#F7F3F6",borderRadius:`${E(60,i)}px`,padding:`${E(16,i)}px`,display:"flex",flexDirection:"column"},children:[b.jsx("div",{style:{position:"absolute",width:`${E(74,i)}px`,height:`${T(74,o)}px`,left:`${E(36,i)}px`,top:`${T(36,o)}px`,display:"flex",alignItems:"center",justifyContent:"center",zIndex:2},children:b.jsx("img",{src:"/automatic-balance-icon.svg",alt:"自主神经平衡图标",width:E(74,i),height:T(74,o),style:{objectFit:"contain"}})}),b.jsxs("div",{style:{position:"absolute",right:`${E(16,i)}px`,top:`${T(36+74/2,o)}px`,transform:"translateY(-50%)",display:"flex",alignItems:"center",gap:`${E(8,i)}px`,zIndex:1},children:[b.jsx("span",{style:{fontFamily:"OPPO Sans 4.0",fontWeight:500,fontStyle:"normal",fontSize:`${E(40,i)}px`,lineHeight:"100%",letterSpacing:"0%",textAlign:"right",color:"#262024"},children:"自主神经平衡"}),b.jsxs(eu,{children:[b.jsx(tu,{asChild:!0,children:b.jsx("button",{style:{width:`${E(48,i)}px`,height:`${E(48,i)}px`,background:"transparent",border:"none",cursor:"pointer",padding:0,display:"flex",alignItems:"center",justifyContent:"center"},children:b.jsxs("svg",{width:E(48,i),height:E(48,i),viewBox:"0 0 24 24",fill:"none",xmlns:"http://www.w3.org/2000/svg",children:[b.jsx("circle",{cx:"12",cy:"12",r:"10",stroke:"#B5A6B0",strokeWidth:"2",fill:"none"}),b.jsx("path",{d:"M12 16V12M12 8H12.01",stroke:"#B5A6B0",strokeWidth:"2",strokeLinecap:"round"})]})})}),b.jsx(Ha,{side:"bottom",borderRadius:E(30,i),containerWidth:i,children:"自主神经平衡提示信息"})]})]}),d&&b.jsx("div",{style:{position:"absolute",left:`${E(16,i)}px`,right:`${E(16,i)}px`,top:"50%",transform:`translateY(calc(-50% - ${T(10,o)}px))`,height:`${T(95,o)}px`,display:"flex",alignItems:"center",justifyContent:"center",zIndex:1},children:b.jsx("div",{style:{width:"100%",height:"100%",position:"relative"},children:b.jsx(zw,{title:"",value:d.value,decimalPlaces:1,minValue:.1,maxValue:5,valueFontSize:E(24,i),unitFontSize:E(6,i),containerWidth:i,showOnlySVG:!0})})}),d&&b.jsx("div",{style:{position:"absolute",left:`${E(48,i)}px`,bottom:`${T(48,o)}px`,zIndex:2},children:b.jsx("span",{style:{fontFamily:"OPPO Sans 4.0",fontWeight:500,fontStyle:"normal",fontSize:`${E(96,i)}px`,lineHeight:"100%",letterSpacing:"0%",color:"#262024"},children:d.value.toFixed(1)})})]}),b.jsxs("div",{style:{position:"absolute",width:`${E(468,i)}px`,height:`${T(404,o)}px`,left:`${E(117-57+468+16,i)}px`,top:`${T(1275-400+404+16,o)}px`,background:"#F6EDF3",borderRadius:`${E(60,i)}px`,padding:`${E(16,i)}px`,display:"flex",flexDirection:"column"},children:[b.jsx("div",{style:{position:"absolute",width:`${E(74,i)}px`,height:`${T(74,o)}px`,left:`${E(36,i)}px`,top:`${T(36,o)}px`,display:"flex",alignItems:"center",justifyContent:"center",zIndex:2},children:b.jsx("img",{src:"/automatic-neural-activity.svg",alt:"自主神经活性图标",width:E(74,i),height:T(74,o),style:{objectFit:"contain"}})}),b.jsxs("div",{style:{position:"absolute",right:`${E(16,i)}px`,top:`${T(36+74/2,o)}px`,transform:"translateY(-50%)",display:"flex",alignItems:"center",gap:`${E(8,i)}px`,zIndex:2},children:[b.jsx("span",{style:{fontFamily:"OPPO Sans 4.0",fontWeight:500,fontStyle:"normal",fontSize:`${E(40,i)}px`,lineHeight:"100%",letterSpacing:"0%",textAlign:"right",color:"#262024"},children:"自主神经活性"}),b.jsxs(eu,{children:[b.jsx(tu,{asChild:!0,children:b.jsx("button",{style:{width:`${E(48,i)}px`,height:`${E(48,i)}px`,background:"transparent",border:"none",cursor:"pointer",padding:0,display:"flex",alignItems:"center",justifyContent:"center"},children:b.jsxs("svg",{width:E(48,i),height:E(48,i),viewBox:"0 0 24 24",fill:"none",xmlns:"http://www.w3.org/2000/svg",children:[b.jsx("circle",{cx:"12",cy:"12",r:"10",stroke:"#B5A6B0",strokeWidth:"2",fill:"none"}),b.jsx("path",{d:"M12 16V12M12 8H12.01",stroke:"#B5A6B0",strokeWidth:"2",strokeLinecap:"round"})]})})}),b.jsx(Ha,{side:"bottom",align:"end",borderRadius:E(30,i),containerWidth:i,children:"自主神经活性提示信息"})]})]}),h&&b.jsx("div",{style:{position:"absolute",left:`${E(16,i)}px`,right:`${E(16,i)}px`,top:"50%",transform:`translateY(calc(-50% - ${T(10,o)}px))`,height:`${T(95,o)}px`,display:"flex",alignItems:"center",justifyContent:"center",zIndex:1},children:b.jsx("div",{style:{width:"100%",height:"100%",position:"relative"},children:b.jsx(zw,{title:"",value:h.value,valueFontSize:E(24,i),unitFontSize:E(6,i),containerWidth:i,showOnlySVG:!0})})}),h&&b.jsx("div",{style:{position:"absolute",left:`${E(48,i)}px`,bottom:`${T(48,o)}px`,zIndex:2},children:b.jsx("span",{style:{fontFamily:"OPPO Sans 4.0",fontWeight:500,fontStyle:"normal",fontSize:`${E(96,i)}px`,lineHeight:"100%",letterSpacing:"0%",color:"#262024"},children:h.value})})]})]})]}),b.jsxs("button",{onClick:t,className:"absolute cursor-pointer",style:{left:`calc(50% + ${_}px)`,bottom:`-${C}px`,width:`${k}px`,height:`${k}px`,background:"transparent",border:"none",outline:"none",transform:"translateX(-50%)"},children:[b.jsx("div",{className:"absolute rounded-full",style:{width:`${k}px`,height:`${k}px`,left:"50%",top:"50%",transform:"translate(-50%, -50%)",border:`${j}px solid #FBF7F9`,boxSizing:"border-box"}}),b.jsx("div",{className:"absolute",style:{width:`${M}px`,height:`${A}px`,left:"50%",top:"50%",transform:"translate(-50%, -50%) rotate(45deg)",transformOrigin:"center",background:"#D8CAD3"}}),b.jsx("div",{className:"absolute",style:{width:`${M}px`,height:`${A}px`,left:"50%",top:"50%",transform:"translate(-50%, -50%) rotate(-45deg)",transformOrigin:"center",background:"#D8CAD3"}})]})]})]})},iW=({weeklyEmotions:e,selectedDate:t,onDateSelect:n,containerWidth:r,containerHeight:i=2556})=>{const o=["日","一","二","三","四","五","六"],a=O=>{const k=new Date(O);return o[k.getDay()]},s=O=>new Date(O).getDate(),l=E(77,r),u=T(43,i),c=E(36,r),f=T(42,i),d="#B5A6B0",p="#82797F",h=E(954,r),v=T(93,i),y=-u,g=0,x=T(50,i),w=E(130,r),S=[E(0,r),E(146,r),E(292,r),E(438,r),E(585,r),E(731,r),E(877,r)],P=[l,l,l,E(78,r),l,l,l];return b.jsx("div",{className:"relative",style:{width:`${h}px`,height:`${v}px`,left:"50%",transform:"translateX(-50%)",marginTop:`${y}px`},children:e.map((O,k)=>{const j=O.date===t,M=a(O.date),A=s(O.date),C=S[k],_=P[k];return b.jsxs("button",{onClick:()=>n(O.date),className:"absolute cursor-pointer",style:{left:`${C}px`,top:0,width:`${_}px`,height:`${v}px`,background:"transparent",border:"none",outline:"none"},children:[j&&b.jsx("div",{className:"absolute rounded-full",style:{width:`${w}px`,height:`${w}px`,left:`calc(50% - ${w/2}px)`,top:`${(g+x)/2-w/2+T(20,i)}px`,background:"#CEDEF9",zIndex:0}}),b.jsx("div",{className:"absolute text-center",style:{width:`${_}px`,height:`${u}px`,left:0,top:`${g}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:500,fontSize:`${c}px`,lineHeight:`${f}px`,color:d,zIndex:10},children:M}),b.jsx("div",{className:"absolute text-center",style:{width:`${_}px`,height:`${u}px`,left:0,top:`${x}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:500,fontSize:`${c}px`,lineHeight:`${f}px`,color:p,zIndex:10},children:A}),j&&b.jsx("div",{className:"absolute rounded-full",style:{width:`${w}px`,height:`${w}px`,left:`calc(50% - ${w/2}px)`,top:`${(g+x)/2-w/2+T(20,i)}px`,background:"#CEDEF9",zIndex:0}})]},O.date)})})},oW=e=>{const t=parseInt(e.slice(1,3),16)/255,n=parseInt(e.slice(3,5),16)/255,r=parseInt(e.slice(5,7),16)/255,i=Math.max(t,n,r),o=Math.min(t,n,r),a=i-o;let s=0;return a!==0&&(i===t?s=(n-r)/a%6:i===n?s=(r-t)/a+2:s=(t-n)/a+4),s=Math.round(s*60),s<0&&(s+=360),s};class aW{constructor(t){wi(this,"seed");this.seed=t}hash(t,n){const r=Math.sin(t*12.9898+n*78.233+this.seed)*43758.5453;return r-Math.floor(r)}lerp(t,n,r){return t+r*(n-t)}smoothstep(t){return t*t*(3-2*t)}noise(t,n){const r=Math.floor(t),i=Math.floor(n),o=t-r,a=n-i,s=this.hash(r,i),l=this.hash(r+1,i),u=this.hash(r,i+1),c=this.hash(r+1,i+1),f=this.smoothstep(o),d=this.smoothstep(a);return this.lerp(this.lerp(s,l,f),this.lerp(u,c,f),d)}octaveNoise(t,n,r=4){let i=0,o=1,a=.02,s=0;for(let l=0;l<r;l++)i+=this.noise(t*a,n*a)*o,s+=o,o*=.5,a*=2;return i/s}}const sW=({emotion:e})=>{if(!e)return null;const t=m.useRef(null),n=m.useRef(),r=m.useRef(0),o={calm:"#8AD48A",joy:"#FFF2B2",low:"#CEDEF9",tense:"#FFD2D2"}[e],a=m.useMemo(()=>oW(o),[o]),s=m.useMemo(()=>{const u={calm:.5,joy:.7,low:.4,tense:.8}[e]||.6,c=Math.floor(Math.random()*1e3);return{intensity:u,seed:c}},[e]);return m.useEffect(()=>{const l=t.current;if(!l)return;const u=l.getContext("2d");if(!u)return;const c=()=>{const A=l.getBoundingClientRect();l.width=A.width*window.devicePixelRatio,l.height=A.height*window.devicePixelRatio,u.scale(window.devicePixelRatio,window.devicePixelRatio)};c(),window.addEventListener("resize",c);const f=new aW(s.seed),d=l.width/window.devicePixelRatio,p=l.height/window.devicePixelRatio,h=[{x:d*.3,y:p*.4,radius:d*.25,speed:.3},{x:d*.7,y:p*.6,radius:d*.3,speed:.4},{x:d*.5,y:p*.3,radius:d*.2,speed:.25},{x:d*.4,y:p*.7,radius:d*.22,speed:.35}],v=A=>{const C=Math.cos(A),_=Math.sin(A);return[[1,0,0],[0,C,-_],[0,_,C]]},y=A=>{const C=Math.cos(A),_=Math.sin(A);return[[C,0,_],[0,1,0],[-_,0,C]]},g=A=>{const C=Math.cos(A),_=Math.sin(A);return[[C,-_,0],[_,C,0],[0,0,1]]},x=(A,C)=>{const _=[[0,0,0],[0,0,0],[0,0,0]];for(let N=0;N<3;N++)for(let L=0;L<3;L++)for(let V=0;V<3;V++)_[N][L]+=A[N][V]*C[V][L];return _},w=(A,C)=>[C[0][0]*A[0]+C[0][1]*A[1]+C[0][2]*A[2],C[1][0]*A[0]+C[1][1]*A[1]+C[1][2]*A[2],C[2][0]*A[0]+C[2][1]*A[1]+C[2][2]*A[2]],S=(A,C=500)=>{const _=C/(C+A[2]);return[A[0]*_+d/2,A[1]*_+p/2]},P=()=>{const A=[],C=Math.min(d,p)*.3,_=10,N=Math.PI*(3-Math.sqrt(5));for(let L=0;L<_;L++){const V=1-L/(_-1)*2,B=Math.sqrt(1-V*V),U=N*L,$=f.octaveNoise(Math.cos(U)*.5,Math.sin(U)*.5,2),z=C*(.7+$*.6);A.push([z*Math.cos(U)*B,z*V,z*Math.sin(U)*B])}return A},O=A=>{const C=[],_=[0,0,0];A.forEach(N=>{_[0]+=N[0],_[1]+=N[1],_[2]+=N[2]}),_[0]/=A.length,_[1]/=A.length,_[2]/=A.length;for(let N=0;N<A.length;N++){const L=(N+1)%A.length,V=(N+2)%A.length;C.push([N,L,V])}for(let N=0;N<A.length;N+=2){const L=(N+3)%A.length;L!==N&&C.push([N,(N+1)%A.length,L])}return C},k=P(),j=O(k),M=A=>{r.current=A*.001,u.clearRect(0,0,d,p),u.save(),u.beginPath();const C=d/2,_=p/2,N=Math.min(d,p)/2,L=64,V=.02,B=N*.08;for(let Z=0;Z<=L;Z++){const D=Z/L*Math.PI*2,H=f.octaveNoise(Math.cos(D)*V+r.current*.2,Math.sin(D)*V+r.current*.2,3),q=N+(H-.5)*B,R=C+Math.cos(D)*q,G=_+Math.sin(D)*q;Z===0?u.moveTo(R,G):u.lineTo(R,G)}u.closePath(),u.clip();const U=r.current*.6,$=r.current*.7,z=r.current*.5;let K=x(v(U),y($));K=x(K,g(z));const re=k.map(Z=>w(Z,K)).map(Z=>({vec3:Z,screen:S(Z),z:Z[2]})),Se=j.map(Z=>({face:Z,avgZ:(re[Z[0]].z+re[Z[1]].z+re[Z[2]].z)/3})).sort((Z,D)=>Z.avgZ-D.avgZ),le=document.createElement("canvas");le.width=d,le.height=p;const se=le.getContext("2d");if(!se)return;Se.forEach(({face:Z,avgZ:D})=>{const H=re[Z[0]],q=re[Z[1]],R=re[Z[2]],G=[(q.vec3[1]-H.vec3[1])*(R.vec3[2]-H.vec3[2])-(q.vec3[2]-H.vec3[2])*(R.vec3[1]-H.vec3[1]),(q.vec3[2]-H.vec3[2])*(R.vec3[0]-H.vec3[0])-(q.vec3[0]-H.vec3[0])*(R.vec3[2]-H.vec3[2]),(q.vec3[0]-H.vec3[0])*(R.vec3[1]-H.vec3[1])-(q.vec3[1]-H.vec3[1])*(R.vec3[0]-H.vec3[0])],ee=Math.sqrt(G[0]**2+G[1]**2+G[2]**2);ee>0&&(G[0]/=ee,G[1]/=ee,G[2]/=ee);const te=[.3,.5,.8],ce=Math.sqrt(te[0]**2+te[1]**2+te[2]**2),ge=(G[0]*te[0]+G[1]*te[1]+G[2]*te[2])/ce,je=Math.max(.3,Math.min(1,.5+ge*.5));se.beginPath(),se.moveTo(H.screen[0],H.screen[1]),se.lineTo(q.screen[0],q.screen[1]),se.lineTo(R.screen[0],R.screen[1]),se.closePath();const Ve=(H.screen[0]+q.screen[0]+R.screen[0])/3,Ft=(H.screen[1]+q.screen[1]+R.screen[1])/3,Bt=se.createRadialGradient(Ve,Ft,0,Ve,Ft,Math.max(d,p)*.5);Bt.addColorStop(0,`hsla(${a}, 85%, 55%, ${.4*je})`),Bt.addColorStop(.5,`hsla(${a+10}, 85%, 55%, ${.25*je})`),Bt.addColorStop(1,`hsla(${a-10}, 85%, 55%, 0)`),se.fillStyle=Bt,se.fill()}),h.forEach((Z,D)=>{const H=Math.sin(r.current*Z.speed*1.5+D)*45,q=Math.cos(r.current*Z.speed*1.8+D)*45,R=Z.x+H,G=Z.y+q,ee=Z.radius+Math.sin(r.current*1+D)*30,te=se.createRadialGradient(R,G,0,R,G,ee);te.addColorStop(0,`hsla(${a}, 85%, 55%, 0.3)`),te.addColorStop(.5,`hsla(${a+10}, 85%, 55%, 0.2)`),te.addColorStop(1,`hsla(${a-10}, 85%, 55%, 0)`),se.fillStyle=te,se.beginPath(),se.arc(R,G,ee,0,Math.PI*2),se.fill()});const de=se.getImageData(0,0,d,p),ne=de.data;for(let Z=0;Z<p;Z++)for(let D=0;D<d;D++){const H=(Z*d+D)*4;if(ne[H+3]>0){const q=f.octaveNoise(D*.015+r.current*.6,Z*.015+r.current*.6,4);ne[H+3]=Math.min(255,ne[H+3]*(.6+q*.4))}}se.putImageData(de,0,0),u.filter="blur(20px)",u.drawImage(le,0,0),u.filter="blur(35px)",u.globalCompositeOperation="screen",h.forEach((Z,D)=>{const H=Math.sin(r.current*Z.speed*1+D)*50,q=Math.cos(r.current*Z.speed*1.2+D)*50,R=Z.x+H,G=Z.y+q,ee=u.createRadialGradient(R,G,0,R,G,Z.radius*1.8);ee.addColorStop(0,`hsla(${a}, 90%, 55%, 0.15)`),ee.addColorStop(1,`hsla(${a}, 90%, 55%, 0)`),u.fillStyle=ee,u.beginPath(),u.arc(R,G,Z.radius*1.8,0,Math.PI*2),u.fill()}),u.globalCompositeOperation="source-over",u.filter="none",u.restore(),n.current=requestAnimationFrame(M)};return n.current=requestAnimationFrame(M),()=>{window.removeEventListener("resize",c),n.current&&cancelAnimationFrame(n.current)}},[e,a,s]),b.jsx("div",{className:"w-full h-full relative flex items-center justify-center",style:{backgroundColor:"transparent",borderRadius:"50%",overflow:"hidden",aspectRatio:"1 / 1",maxWidth:"100%",maxHeight:"100%"},children:b.jsx("canvas",{ref:t,className:"absolute inset-0 w-full h-full",style:{borderRadius:"50%"}})})},lW=({isOpen:e,onClose:t,topBarHeight:n,sphereWidth:r,containerWidth:i,containerHeight:o,weeklyEmotions:a=[]})=>{const[s,l]=m.useState(a.length>0?a[a.length-1].date:"");if(m.useEffect(()=>{a.length>0&&!s&&l(a[a.length-1].date)},[a,s]),!e)return null;const u=E(1069,i),c=T(1759,o),f=E(57,i),d=T(400,o),p=E(100,i),h=E(12.5,i),v=E(104,i),y=E(4,i),g=E(9.37,i),x=E(54.11,i),w=T(2294-2159,o),S=E(587-591.5,i),P=a.find(k=>k.date===s),O=(P==null?void 0:P.emotion)||null;return b.jsxs(b.Fragment,{children:[b.jsx("div",{className:"absolute inset-0 z-50",style:{backgroundColor:"rgba(0, 0, 0, 0.5)"},onClick:k=>{k.stopPropagation()}}),b.jsxs("div",{className:"absolute z-50 flex flex-col items-center",style:{left:`${f}px`,top:`${d}px`,width:`${u}px`},children:[b.jsxs("div",{className:"w-full flex flex-col",style:{borderRadius:`${p}px`,height:`${c}px`,background:"linear-gradient(330.9deg, rgba(255, 255, 255, 0.86) 67.56%, rgba(246, 237, 243, 0.86) 94.65%)",backdropFilter:`blur(${h}px)`,WebkitBackdropFilter:`blur(${h}px)`},children:[b.jsx("div",{className:"flex-shrink-0 flex items-center justify-center",style:{position:"absolute",width:`${E(320,i)}px`,height:`${T(84,o)}px`,left:"50%",top:`${T(482-400,o)}px`,transform:"translateX(-50%)"},children:b.jsx("h2",{className:"text-center",style:{fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:500,fontSize:`${E(52,i)}px`,lineHeight:`${T(61,o)}px`,color:"#262024"},children:"我的情绪图谱"})}),b.jsx("div",{className:"flex-1 flex items-center justify-center p-4",style:{minHeight:0},children:b.jsx("div",{className:"w-full h-full max-w-full max-h-full",children:O?b.jsx(sW,{emotion:O}):b.jsx("div",{className:"w-full h-full flex items-center justify-center",style:{fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:400,fontSize:`${E(40,i)}px`,lineHeight:`${T(47,o)}px`,textAlign:"center",color:"#262024"},children:"当天暂无情绪图谱"})})}),b.jsx("div",{className:"flex-shrink-0",style:{position:"absolute",bottom:`${T(72,o)}px`,left:0,right:0},children:b.jsx(iW,{weeklyEmotions:a,selectedDate:s,onDateSelect:l,containerWidth:u,containerHeight:o})})]}),b.jsxs("button",{onClick:t,className:"absolute cursor-pointer",style:{left:`calc(50% + ${S}px)`,bottom:`-${w}px`,width:`${v}px`,height:`${v}px`,background:"transparent",border:"none",outline:"none",transform:"translateX(-50%)"},children:[b.jsx("div",{className:"absolute rounded-full",style:{width:`${v}px`,height:`${v}px`,left:"50%",top:"50%",transform:"translate(-50%, -50%)",border:`${y}px solid #FBF7F9`,boxSizing:"border-box"}}),b.jsx("div",{className:"absolute",style:{width:`${g}px`,height:`${x}px`,left:"50%",top:"50%",transform:"translate(-50%, -50%) rotate(45deg)",transformOrigin:"center",background:"#D8CAD3"}}),b.jsx("div",{className:"absolute",style:{width:`${g}px`,height:`${x}px`,left:"50%",top:"50%",transform:"translate(-50%, -50%) rotate(-45deg)",transformOrigin:"center",background:"#D8CAD3"}})]})]})]})},uW=({isOpen:e,onClose:t,topBarHeight:n,sphereWidth:r,containerWidth:i,containerHeight:o,onRecordClick:a})=>{const[s,l]=m.useState([]),[u,c]=m.useState(!1),[f,d]=m.useState(null);if(m.useEffect(()=>{e&&(c(!0),$T().then(Qe=>{l(Qe),c(!1)}))},[e]),m.useEffect(()=>{f&&fetch("http://127.0.0.1:7242/ingest/ac308b02-c703-4480-bd86-07d8769e1b61",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({sessionId:"debug-session",runId:"post-fix",hypothesisId:"breathing-detail-open",location:"ProfileModal.tsx:useEffect:selectedRecord",message:"Breathing record detail view opened",data:{id:f.id,duration:f.duration,score:f.score},timestamp:Date.now()})}).catch(()=>{})},[f]),!e)return null;const p=E(1069,i),h=T(1759,o),v=E(57,i),y=T(400,o),g=E(300,i),x=E(100,i),w=`${g}px ${x}px ${x}px ${x}px`,S=E(12.5,i),P=E(399,i),O=E(170-57,i),k=T(503-400,o),j=E(399.08,i),M=T(401.57,o),A=E(4,i),C=E(19,i),_=E(58.8,i),N=E(4,i),L=E(35,i),V=E(252,i),B=T(105,o),U=E(630-57,i),$=T(670-400,o),z=E(80,i),K="100%",X=E(630-57,i),re=T(766-400,o),Se=E(30,i),le=T(35,o),se=E(280,i),de=T(51,o),ne=E(630-57,i),Z=T(838-400,o),D=E(36,i),H=T(42,o),q=E(38,i),R=E(943-57,i),G=T(839-400,o),ee=E(37,i),te=U+V+E(10,i),ce=$,ge=E(956,i),je=T(1151,o),Ve=E(114-57,i),Ft=T(952-400,o),Bt=E(60,i),xi=E(6,i),ye=E(12,i),nn=E(27.8,i),Ir=E(322,i),io=T(105,o),oo=E(173-114,i),ya=T(1004-952,o),ao=E(48,i),dl=T(56,o),pl=E(900,i),xa=T(245,o),rA=T(122.5,o),iA=E(6,i),oA=E(12,i),aA=E(27.8,i),ly=E(141,i),sA=E(196-146,i),lA=T(1143-1091,o),uA=E(364-146,i),cA=T(1157-1091,o),fA=E(56,i),dA=T(66,o),pA=E(518-146,i),hA=T(1176-1091,o),ad=E(32,i),sd=T(38,o),mA=E(364-146,i),vA=T(1254-1091,o),hl=E(655-146,i),ml=T(1107-1091,o),gA=E(375,i),yA=T(214,o),xA=T(107,o),wA=E(758-146,i),bA=T(1141-1091,o),SA=E(128,i),PA=T(150,o),OA=E(917-146,i),EA=T(1228-1091,o),kA=E(922-146,i),CA=T(1144-1091,o),_A=E(30.26,i),AA=T(32.5,o),jA=E(146-114,i),uy=T(1091-952,o),MA=E(900,i),cy=T(20,o),fy=T(174,o),vl=E(104,i),TA=E(4,i),dy=E(9.37,i),py=E(54.11,i),$A=T(2294-2159,o),IA=E(587-591.5,i),NA=Qe=>{const Nr=Math.floor(Qe/60),hy=Qe%60;return`${Nr},${hy.toString().padStart(2,"0")}s`},DA=Qe=>{const Nr=new Date(Qe),RA=["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"][Nr.getMonth()],LA=Nr.getDate(),zA=Nr.getHours(),FA=Nr.getMinutes().toString().padStart(2,"0");return`${RA} ${LA}, ${zA}:${FA}`};return b.jsxs(b.Fragment,{children:[b.jsx("div",{className:"absolute inset-0 z-50",style:{backgroundColor:"rgba(0, 0, 0, 0.5)"},onClick:Qe=>{Qe.stopPropagation()}}),b.jsxs("div",{className:"absolute z-50 flex flex-col items-center",style:{left:`${v}px`,top:`${y}px`,width:`${p}px`},children:[b.jsxs("div",{className:"w-full flex flex-col overflow-hidden",style:{position:"relative",borderRadius:w,height:`${h}px`,background:"linear-gradient(330.9deg, rgba(255, 255, 255, 0.86) 67.56%, rgba(246, 237, 243, 0.86) 94.65%)",backdropFilter:`blur(${S}px)`,WebkitBackdropFilter:`blur(${S}px)`},children:[b.jsxs("div",{style:{position:"absolute",width:`${P}px`,height:`${P}px`,left:`${O}px`,top:`${k}px`,filter:`drop-shadow(${A}px ${C}px ${_}px rgba(57, 34, 35, 0.19))`},children:[b.jsx("div",{style:{position:"absolute",width:`${P}px`,height:`${P}px`,left:0,top:0,background:"#FFFFFF",borderRadius:"50%",boxShadow:`0px ${N}px ${L}px rgba(0, 0, 0, 0.12)`}}),b.jsx("img",{src:"/usr_photo.png",alt:"用户头像",style:{position:"absolute",width:`${j}px`,height:`${M}px`,left:0,top:0,borderRadius:"50%",objectFit:"cover"}})]}),b.jsx("h2",{style:{position:"absolute",width:`${V}px`,height:`${B}px`,left:`${U}px`,top:`${$}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:500,fontSize:`${z}px`,lineHeight:K,letterSpacing:"0%",color:"#262024",margin:0,padding:0},children:"小情绪"}),b.jsx("div",{style:{position:"absolute",width:`${ee}px`,height:`${ee}px`,left:`${te}px`,top:`${ce}px`},children:b.jsx("img",{src:"/gender-icon.svg",alt:"性别",style:{width:"100%",height:"100%",objectFit:"contain"}})}),b.jsx("div",{style:{position:"absolute",left:`${X}px`,top:`${re}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:400,fontSize:`${Se}px`,lineHeight:`${le}px`,color:"#82797F",whiteSpace:"nowrap"},children:"ID：8888888888"}),b.jsx("div",{style:{position:"absolute",width:`${se}px`,height:`${de}px`,left:`${ne}px`,top:`${Z}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:400,fontSize:`${D}px`,lineHeight:`${H}px`,color:"#262024"},children:"还什么都没写……"}),b.jsx("div",{style:{position:"absolute",width:`${q}px`,height:`${q}px`,left:`${R}px`,top:`${G}px`,cursor:"pointer"},children:b.jsx("img",{src:"/edit-icon.svg",alt:"编辑",style:{width:"100%",height:"100%",objectFit:"contain"}})}),b.jsxs("div",{className:"flex flex-col overflow-hidden",style:{position:"absolute",width:`${ge}px`,height:`${je}px`,left:`${Ve}px`,top:`${Ft}px`,background:"#F6EDF3",boxShadow:`${xi}px ${ye}px ${nn}px rgba(0, 0, 0, 0.1)`,borderRadius:`${Bt}px`},children:[b.jsx("h3",{style:{position:"absolute",width:`${Ir}px`,height:`${io}px`,left:`${oo}px`,top:`${ya}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:500,fontSize:`${ao}px`,lineHeight:`${dl}px`,color:"#82797F"},children:"呼吸训练日志"}),b.jsxs("div",{style:{position:"absolute",left:`${jA}px`,top:`${uy}px`,width:`${MA}px`,height:`calc(100% - ${uy+T(20,o)}px)`,overflowY:"auto",overflowX:"hidden"},children:[u?b.jsx("div",{className:"flex items-center justify-center py-8 text-gray-400",children:"加载中..."}):s.length===0?b.jsx("div",{className:"flex items-center justify-center py-8 text-gray-400",children:"暂无记录"}):b.jsxs("div",{style:{position:"relative",width:"100%"},children:[s.map((Qe,Nr)=>b.jsxs("div",{style:{position:"absolute",width:`${pl}px`,height:`${xa}px`,left:0,top:`${Nr*(xa+cy)}px`,background:"#F7F3F6",boxShadow:`${iA}px ${oA}px ${aA}px rgba(0, 0, 0, 0.06)`,borderRadius:`${rA}px`,cursor:"pointer"},onClick:()=>{fetch("http://127.0.0.1:7242/ingest/ac308b02-c703-4480-bd86-07d8769e1b61",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({sessionId:"debug-session",runId:"pre-fix",hypothesisId:"breathing-item-click",location:"ProfileModal.tsx:recordItem:onClick",message:"Breathing record item clicked",data:{id:Qe.id,duration:Qe.duration,score:Qe.score},timestamp:Date.now()})}).catch(()=>{}),d(Qe),a&&a(Qe)},children:[b.jsx("div",{style:{position:"absolute",width:`${ly}px`,height:`${ly}px`,left:`${sA}px`,top:`${lA}px`,display:"flex",alignItems:"center",justifyContent:"center"},children:b.jsx("img",{src:"/breathing-icon.svg",alt:"呼吸训练图标",style:{width:"100%",height:"100%",objectFit:"contain"}})}),b.jsx("div",{style:{position:"absolute",left:`${uA}px`,top:`${cA}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:400,fontSize:`${fA}px`,lineHeight:`${dA}px`,color:"#82797F"},children:NA(Qe.duration)}),b.jsx("div",{style:{position:"absolute",left:`${pA}px`,top:`${hA}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:400,fontSize:`${ad}px`,lineHeight:`${sd}px`,color:"#B5A6B0"},children:"时长"}),b.jsx("div",{style:{position:"absolute",left:`${mA}px`,top:`${vA}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:400,fontSize:`${ad}px`,lineHeight:`${sd}px`,color:"#B5A6B0"},children:DA(Qe.timestamp)}),b.jsxs("div",{style:{position:"absolute",width:`${gA}px`,height:`${yA}px`,left:`${hl}px`,top:`${ml}px`,background:"#FFFFFF",borderRadius:`${xA}px`},children:[b.jsx("div",{style:{position:"absolute",left:`${wA-hl}px`,top:`${bA-ml}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:300,fontSize:`${SA}px`,lineHeight:`${PA}px`,color:"#82797F"},children:Qe.score}),b.jsx("div",{style:{position:"absolute",left:`${OA-hl}px`,top:`${EA-ml}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:400,fontSize:`${ad}px`,lineHeight:`${sd}px`,color:"#82797F"},children:"分"}),b.jsx("div",{style:{position:"absolute",width:`${_A}px`,height:`${AA}px`,left:`${kA-hl}px`,top:`${CA-ml}px`,transform:"rotate(-12.69deg)"},children:b.jsx("svg",{width:"100%",height:"100%",viewBox:"0 0 30 33",fill:"none",xmlns:"http://www.w3.org/2000/svg",children:b.jsx("path",{d:"M15 2L28 17H19V31H11V17H2L15 2Z",fill:"#56CD6E",stroke:"#56CD6E",strokeWidth:"2"})})})]})]},Qe.id)),b.jsx("div",{style:{height:`${s.length*(xa+cy)}px`}})]}),b.jsx("div",{style:{position:"sticky",bottom:0,left:0,width:"100%",height:`${fy}px`,background:"linear-gradient(180deg, rgba(246, 237, 243, 0) 0%, #F6EDF3 74.04%)",pointerEvents:"none",zIndex:10,marginTop:`-${fy}px`}})]}),s.length>3&&b.jsx("div",{className:"relative -mb-4 h-8 pointer-events-none",style:{background:"linear-gradient(to top, rgba(255, 255, 255, 0.6) 0%, transparent 100%)",marginTop:"-32px"}})]})]}),b.jsxs("button",{onClick:t,className:"absolute cursor-pointer",style:{left:`calc(50% + ${IA}px)`,bottom:`-${$A}px`,width:`${vl}px`,height:`${vl}px`,background:"transparent",border:"none",outline:"none",transform:"translateX(-50%)"},children:[b.jsx("div",{className:"absolute rounded-full",style:{width:`${vl}px`,height:`${vl}px`,left:"50%",top:"50%",transform:"translate(-50%, -50%)",border:`${TA}px solid #FBF7F9`,boxSizing:"border-box"}}),b.jsx("div",{className:"absolute",style:{width:`${dy}px`,height:`${py}px`,left:"50%",top:"50%",transform:"translate(-50%, -50%) rotate(45deg)",transformOrigin:"center",background:"#D8CAD3"}}),b.jsx("div",{className:"absolute",style:{width:`${dy}px`,height:`${py}px`,left:"50%",top:"50%",transform:"translate(-50%, -50%) rotate(-45deg)",transformOrigin:"center",background:"#D8CAD3"}})]})]})]})},po=["呼吸率","压力水平","自主神经活性","自主神经平衡","压力调节恢复能力"],cW=e=>{const t=e/100,n=r=>Math.max(.25,Math.min(1,r));return[n(t+.1),n(t-.05),n(t+.05),n(t),n(t+.02)]},lb=(e,t,n,r)=>{const i=Math.PI*2/e.length;let o="";return e.forEach((a,s)=>{const l=-Math.PI/2+s*i,u=t*a,c=n+u*Math.cos(l),f=r+u*Math.sin(l);o+=`${s===0?"M":"L"} ${c} ${f} `}),o+="Z",o},fW=({isOpen:e,onClose:t,record:n,topBarHeight:r,sphereWidth:i,containerWidth:o,containerHeight:a})=>{if(!e||!n)return null;const s=E(1069,o),l=T(1759,a),u=E(57,o),c=T(400,a),f=E(300,o),d=E(100,o),p=`${f}px ${d}px ${d}px ${d}px`,h=E(12.5,o),v=E(151,o),y=E(172-57,o),g=T(509-400,a),x=E(4,o),w=E(35,o),S=E(320,o),P=T(84,a),O=E(430-57,o),k=T(555-400,a),j=E(52,o),M=T(61,a),A=E(187,o),C=T(173,a),_=E(496-57,o),N=T(745-400,a),L=E(140,o),V=T(164,a),B=E(56,o),U=T(42,a),$=E(683-57,o),z=T(844-400,a),K=E(32,o),X=T(38,a),re=E(700,o),Se=T(76,a),le=E(240-57,o),se=T(923-400,a),de=E(40,o),ne=T(47,a),Z=T(1206-400-100,a),D=E(104,o),H=E(4,o),q=E(9.37,o),R=E(54.11,o),G=T(2294-2159,a),ee=E(587-591.5,o);return m.useEffect(()=>{fetch("http://127.0.0.1:7242/ingest/ac308b02-c703-4480-bd86-07d8769e1b61",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({sessionId:"debug-session",runId:"post-fix",hypothesisId:"breathing-report-open",location:"BreathingReportModal.tsx:useEffect:open",message:"Breathing report modal opened",data:{id:n.id,score:n.score,duration:n.duration},timestamp:Date.now()})}).catch(()=>{})},[n]),b.jsxs(b.Fragment,{children:[b.jsx("div",{className:"absolute inset-0 z-50",style:{backgroundColor:"rgba(0, 0, 0, 0.5)"},onClick:te=>{te.stopPropagation()}}),b.jsxs("div",{className:"absolute z-50 flex flex-col items-center",style:{left:`${u}px`,top:`${c}px`,width:`${s}px`},children:[b.jsxs("div",{className:"w-full flex flex-col overflow-hidden",style:{borderRadius:p,height:`${l}px`,background:"rgba(246, 237, 243, 0.86)",backdropFilter:`blur(${h}px)`,WebkitBackdropFilter:`blur(${h}px)`},children:[b.jsx("button",{onClick:t,style:{position:"absolute",width:`${v}px`,height:`${v}px`,left:`${y}px`,top:`${g}px`,background:"#FFFFFF",boxShadow:`0px ${x}px ${w}px rgba(0, 0, 0, 0.12)`,borderRadius:"50%",border:"none",cursor:"pointer",display:"flex",alignItems:"center",justifyContent:"center",zIndex:10},children:b.jsx("svg",{width:"60%",height:"60%",viewBox:"0 0 24 24",fill:"none",xmlns:"http://www.w3.org/2000/svg",children:b.jsx("path",{d:"M15 18L9 12L15 6",stroke:"#262024",strokeWidth:"2.5",strokeLinecap:"round",strokeLinejoin:"round"})})}),b.jsx("div",{style:{position:"absolute",width:`${S}px`,height:`${P}px`,left:`${O}px`,top:`${k}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:500,fontSize:`${j}px`,lineHeight:`${M}px`,textAlign:"center",color:"#262024"},children:"呼吸训练报告"}),b.jsx("div",{style:{position:"absolute",width:`${A}px`,height:`${C}px`,left:`${_}px`,top:`${N}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:300,fontSize:`${L}px`,lineHeight:`${V}px`,textAlign:"center",color:"#262024"},children:n.score}),b.jsx("div",{style:{position:"absolute",width:`${B}px`,height:`${U}px`,left:`${$}px`,top:`${z}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:400,fontSize:`${K}px`,lineHeight:`${X}px`,color:"#82797F"},children:"分"}),b.jsx("div",{style:{position:"absolute",width:`${re}px`,height:`${Se}px`,left:`${le}px`,top:`${se}px`,fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:400,fontSize:`${de}px`,lineHeight:`${ne}px`,textAlign:"center",color:"#262024"},children:"你的状态很好，继续保持吧～"}),b.jsx("div",{style:{position:"absolute",left:"50%",top:`${Z}px`,transform:"translateX(-50%)",width:"100%",maxWidth:"320px",paddingLeft:`${E(40,o)}px`,paddingRight:`${E(40,o)}px`},children:b.jsxs("svg",{viewBox:"0 0 200 200",className:"w-full",children:[b.jsx("defs",{}),[.25,.5,.75,1].map((te,ce)=>b.jsx("path",{d:lb(new Array(po.length).fill(te),70,100,100),fill:"none",stroke:"rgba(209, 213, 219, 0.7)",strokeWidth:ce===3?1.2:.6},te)),po.map((te,ce)=>{const ge=-Math.PI/2+ce*(Math.PI*2/po.length),je=100+70*Math.cos(ge),Ve=100+70*Math.sin(ge);return b.jsx("line",{x1:"100",y1:"100",x2:je,y2:Ve,stroke:"rgba(209, 213, 219, 0.7)",strokeWidth:"0.8"},ce)}),po.map((te,ce)=>{const ge=-Math.PI/2+ce*(Math.PI*2/po.length);let je=86,Ve=100+je*Math.cos(ge),Ft=100+je*Math.sin(ge);const Bt=te==="压力调节恢复能力",xi=te==="压力水平",ye=T(42,a);(Bt||xi)&&(je=86,Ve=100+je*Math.cos(ge),Ft=100+je*Math.sin(ge),Ft+=ye*2);const nn=te==="压力调节恢复能力",Ir=nn?["压力调节","恢复能力"]:[te];return b.jsx("g",{children:Ir.map((io,oo)=>{const ya=nn?(oo-.5)*ye:0;return b.jsx("text",{x:Ve,y:Ft+ya,textAnchor:"middle",dominantBaseline:"middle",fill:"#82797F",style:{fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontWeight:500,fontStyle:"normal",fontSize:`${E(36,o)}px`,lineHeight:`${ye}px`,textAlign:"center"},children:io},oo)})},te)}),(()=>{const te=cW(n.score),ce=lb(te,70,100,100),ge=Math.PI*2/po.length;return b.jsxs(b.Fragment,{children:[b.jsx("path",{d:ce,fill:"rgba(194, 227, 255, 0.61)",stroke:"#60A5FA",strokeWidth:"2",strokeLinejoin:"round"}),te.map((je,Ve)=>{const Ft=-Math.PI/2+Ve*ge,Bt=70*je,xi=100+Bt*Math.cos(Ft),ye=100+Bt*Math.sin(Ft),nn=E(22.92,o),Ir=E(4,o);return b.jsx("circle",{cx:xi,cy:ye,r:nn/2,fill:"#F6EDF3",stroke:"#6CAADF",strokeWidth:Ir},Ve)})]})})()]})})]}),b.jsxs("button",{onClick:t,className:"absolute cursor-pointer",style:{left:`calc(50% + ${ee}px)`,bottom:`-${G}px`,width:`${D}px`,height:`${D}px`,background:"transparent",border:"none",outline:"none",transform:"translateX(-50%)"},children:[b.jsx("div",{className:"absolute rounded-full",style:{width:`${D}px`,height:`${D}px`,left:"50%",top:"50%",transform:"translate(-50%, -50%)",border:`${H}px solid #FBF7F9`,boxSizing:"border-box"}}),b.jsx("div",{className:"absolute",style:{width:`${q}px`,height:`${R}px`,left:"50%",top:"50%",transform:"translate(-50%, -50%) rotate(45deg)",transformOrigin:"center",background:"#D8CAD3"}}),b.jsx("div",{className:"absolute",style:{width:`${q}px`,height:`${R}px`,left:"50%",top:"50%",transform:"translate(-50%, -50%) rotate(-45deg)",transformOrigin:"center",background:"#D8CAD3"}})]})]})]})},dW=({preloadedData:e,containerWidth:t,containerHeight:n})=>{const[r,i]=m.useState((e==null?void 0:e.currentEmotionData)||{emotion:"calm",timestamp:new Date().toISOString()}),[o,a]=m.useState((e==null?void 0:e.weeklyEmotions)||[]),[s,l]=m.useState((e==null?void 0:e.selectedDate)||""),[u,c]=m.useState((e==null?void 0:e.hourlyEmotions)||[]),[f,d]=m.useState(!e),[p,h]=m.useState(!1),[v,y]=m.useState(!1),[g,x]=m.useState(!1),[w,S]=m.useState(!1),[P,O]=m.useState(null),[k,j]=m.useState(300),M=m.useRef(null),A=m.useRef(null),C=m.useRef(null);m.useEffect(()=>{e?(i(e.currentEmotionData),a(e.weeklyEmotions),l(e.selectedDate),c(e.hourlyEmotions),d(!1),fetch("http://127.0.0.1:7242/ingest/ac308b02-c703-4480-bd86-07d8769e1b61",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({sessionId:"debug-session",runId:"pre-fix",hypothesisId:"preloaded-data",location:"MainPage.tsx:useEffect:initFromPreloaded",message:"Initialized MainPage from preloadedData",data:{hasPreloaded:!!e,weeklyCount:e.weeklyEmotions.length,selectedDate:e.selectedDate,hourlyCount:e.hourlyEmotions.length},timestamp:Date.now()})}).catch(()=>{})):(d(!0),d(!1))},[e]),m.useEffect(()=>{s&&!f&&EP(s).then(c)},[s,f]),m.useEffect(()=>{C.current&&j(C.current.offsetWidth)},[o,r,t]);const _=N=>{l(N)};return b.jsxs("div",{className:"absolute inset-0 overflow-hidden flex flex-col",children:[b.jsx("div",{className:"absolute inset-0",style:{backgroundImage:"url(/load.png)",backgroundSize:"cover",backgroundPosition:"center",backgroundRepeat:"no-repeat"}}),f?b.jsx("div",{className:"relative z-0 min-h-full pb-8",children:b.jsx(O0,{})}):b.jsxs(b.Fragment,{children:[b.jsxs("div",{className:"relative z-0 flex flex-col",style:{background:"linear-gradient(to bottom, transparent 0%, white 50%)",height:`${T(1541,n)}px`},children:[b.jsx("div",{className:"relative",style:{width:"100%",height:"100%"},children:b.jsx(O0,{onIconClick:()=>h(!0),onAvatarClick:()=>x(!0),containerWidth:t,containerHeight:n})}),b.jsx("div",{className:"absolute left-1/2 -translate-x-1/2 flex items-center justify-center",style:{width:`${E(836,t)}px`,height:`${E(836,t)}px`,top:`${T(475,n)}px`},children:b.jsx("div",{ref:C,className:"w-full h-full flex items-center justify-center",children:b.jsx(IT,{emotion:r.emotion,timestamp:r.timestamp})})}),b.jsx("div",{className:"absolute left-1/2 -translate-x-1/2 flex items-center justify-center",style:{width:`${E(700,t)}px`,height:`${T(156,n)}px`,top:`${T(1375,n)}px`},children:b.jsx("div",{className:"text-center",style:{fontFamily:"'OPPO Sans 4.0', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif",fontStyle:"normal",fontWeight:400,fontSize:`${E(40,t)}px`,lineHeight:`${T(47,n)}px`,textAlign:"center",color:"#262024"},children:"深呼吸，把这一刻收藏起来。"})})]}),b.jsxs("div",{className:"absolute left-0 right-0 flex flex-col pb-4 gap-4",style:{top:`${T(1541,n)}px`,overflow:"visible",backgroundColor:"#FFFFFF"},children:[o.length>0&&b.jsx("div",{ref:M,className:"flex-shrink-0",children:b.jsx(DT,{weeklyEmotions:o,selectedDate:s,onDateSelect:_,onAtlasButtonClick:()=>{console.log("Atlas button clicked in MainPage"),y(!0)},containerWidth:t,containerHeight:n})}),s&&b.jsx("div",{ref:A,className:"flex-shrink-0",children:b.jsx(RT,{hourlyEmotions:u,selectedDate:s,containerWidth:t,containerHeight:n})})]})]}),b.jsx(rW,{isOpen:p,onClose:()=>h(!1),topBarHeight:T(80,n),sphereWidth:k,containerWidth:t,containerHeight:n}),b.jsx(lW,{isOpen:v,onClose:()=>y(!1),topBarHeight:T(80,n),sphereWidth:k,containerWidth:t,containerHeight:n,weeklyEmotions:o}),b.jsx(uW,{isOpen:g,onClose:()=>x(!1),topBarHeight:T(80,n),sphereWidth:k,containerWidth:t,containerHeight:n,onRecordClick:N=>{O(N),S(!0)}}),b.jsx(fW,{isOpen:w&&!!P,onClose:()=>S(!1),topBarHeight:T(80,n),sphereWidth:k,containerWidth:t,containerHeight:n,record:P})]})};function pW(){const e=NT(),[t,n]=m.useState(!1),[r,i]=m.useState(null),o=async()=>{fetch("http://127.0.0.1:7242/ingest/ac308b02-c703-4480-bd86-07d8769e1b61",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({sessionId:"debug-session",runId:"pre-fix",hypothesisId:"login-flow",location:"App.tsx:handleLoginStart:beforeFetch",message:"Starting login prefetch",data:{},timestamp:Date.now()})}).catch(()=>{});const[a,s]=await Promise.all([OT(),ET()]),l=new Date().toISOString().split("T")[0],c=s.find(d=>d.date===l)?l:s.length>0?s[s.length-1].date:"";let f=[];c&&(f=await EP(c)),i({currentEmotionData:a,weeklyEmotions:s,selectedDate:c,hourlyEmotions:f}),fetch("http://127.0.0.1:7242/ingest/ac308b02-c703-4480-bd86-07d8769e1b61",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({sessionId:"debug-session",runId:"pre-fix",hypothesisId:"login-flow",location:"App.tsx:handleLoginStart:afterPrefetch",message:"Finished login prefetch",data:{hasCurrentEmotion:!!a,weeklyCount:s.length,defaultDate:c,hasHourly:f.length>0},timestamp:Date.now()})}).catch(()=>{})};return b.jsx("div",{className:"fixed inset-0 bg-gray-200",style:{display:"flex",alignItems:"center",justifyContent:"center"},children:b.jsx("div",{className:"relative overflow-hidden",style:{width:`${e.width}px`,height:`${e.height}px`,backgroundColor:"#fff",maxWidth:"100vw",maxHeight:"100vh",flexShrink:0},children:b.jsx("div",{className:"w-full h-full relative overflow-hidden",children:t?b.jsx(dW,{preloadedData:r,containerWidth:e.width,containerHeight:e.height}):b.jsx(vT,{onLoginStart:o,onLoginComplete:()=>n(!0)})})})})}cp.createRoot(document.getElementById("root")).render(b.jsx(xb.StrictMode,{children:b.jsx(pW,{})}));
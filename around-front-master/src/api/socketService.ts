@@ -9,9 +9,17 @@ const WS_URL = window.location.origin
 // 呼吸频率更新回调类型
 type BreathingRateCallback = (data: { br: number; time: number; timestamp: number }) => void
 
+// 多指标状态推送（state_update，格式同 /api/state?since=）回调类型
+type StateUpdateCallback = (data: unknown) => void
+
+// 订阅时携带的游标，用于断线重连后从上次的位置续传
+type StateCursor = () => { since?: number; epoch?: number }
+
 class SocketService {
   private socket: Socket | null = null
   private breathingRateCallbacks: BreathingRateCallback[] = []
+  private stateUpdateCallbacks: StateUpdateCallback[] = []
+  private stateCursor: StateCursor | null = null
   private connected = false
 
   /**
@@ -34,6 +42,10 @@ class SocketService {
     this.socket.on('connect', () => {
       console.log('[SocketService] Connected')
       this.connected = true
+      // （重新）连接后恢复状态流订阅
+      if (this.stateUpdateCallbacks.length > 0) {
+        this.resubscribeState()
+      }
     })
 
     this.socket.on('disconnect', () => {
@@ -51,6 +63,12 @@ class SocketService {
       this.breathingRateCallbacks.forEach((callback) => callback(data))
     })
 
+    // 多指标状态推送：先确认收到（服务端在确认前不会再发下一条），再分发
+    this.socket.on('state_update', (data: unknown, ack?: () => void) => {
+      ack?.()
+      this.stateUpdateCallbacks.forEach((callback) => callback(data))
+    })
+
     this.socket.on('connect_error', (error) => {
       console.error('[SocketService] Connection error:', error)
     })
@@ -85,6 +103,29 @@ class SocketService {
       this.breathingRateCallbacks = this.breathingRateCallbacks.filter((cb) => cb !== callback)
     }
   }
+
+  /**
+   * 订阅多指标状态推送
+   * cursor 返回本地已有数据的游标（seq/epoch），重连时用来续传
+   */
+  onStateUpdate(cursor: StateCursor, callback: StateUpdateCallback) {
+    this.stateCursor = cursor
+    this.stateUpdateCallbacks.push(callback)
+    this.connect()
+    if (this.connected) {
+      this.resubscribeState()
+    }
+    return () => {
+      this.stateUpdateCallbacks = this.stateUpdateCallbacks.filter((cb) => cb !== callback)
+    }
+  }
+
+  /**
+   * 按当前游标重新订阅（本地状态被重置后调用，服务端会从全量开始推送）
+   */
+  resubscribeState() {
+    this.socket?.emit('subscribe_state', this.stateCursor ? this.stateCursor() : {})
+  }
 }
 
 // 导出单例
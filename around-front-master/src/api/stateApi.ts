@@ -3,6 +3,7 @@
  */
 
 import { EmotionType, EmotionData, CurrentEmotionData } from '../types'
+import { socketService } from './socketService'
 
 // 后端返回的数据结构
 export interface BackendState {
@@ -44,19 +45,108 @@ export const mapEmotionState = (emotionState: string | null): EmotionType => {
   }
 }
 
+// 增量查询返回的附加字段（/api/state?since=<seq>）
+interface BackendStateDelta extends BackendState {
+  seq: number
+  epoch: number
+  since?: number
+  reset?: boolean
+  max_points?: number
+}
+
+// 时间序列字段：增量响应中只包含 since 之后新增的样本
+const SERIES_KEYS = ['hr', 'br', 'sdnn', 'lf_hf_ratio', 'hf', 'lf', 'spo2', 'time'] as const
+
+// 本地合并后的完整状态，以及对应的后端游标
+let mergedState: BackendState | null = null
+let lastSeq: number | null = null
+let lastEpoch: number | null = null
+
+/**
+ * 把后端响应（HTTP 轮询或 state_update 推送）合并到本地状态
+ * 返回 false 表示响应与本地游标不匹配（例如后端重启），需要重新取全量
+ */
+const mergeBackendState = (payload: BackendStateDelta): boolean => {
+  const isFull = payload.since === undefined || payload.reset === true
+  if (!isFull) {
+    if (!mergedState || lastSeq === null || payload.epoch !== lastEpoch || payload.since! > lastSeq) {
+      return false
+    }
+    // 轮询和推送可能有重叠，只追加本地还没有的样本
+    const fresh = payload.seq - lastSeq
+    if (fresh <= 0) {
+      return true
+    }
+    const maxPoints = payload.max_points ?? Number.MAX_SAFE_INTEGER
+    const previous = mergedState
+    const next: BackendState = { ...payload }
+    for (const key of SERIES_KEYS) {
+      next[key] = previous[key].concat(payload[key].slice(-fresh)).slice(-maxPoints)
+    }
+    mergedState = next
+  } else {
+    mergedState = { ...payload }
+  }
+  mergedState.lf_hf = mergedState.lf_hf_ratio
+  lastSeq = payload.seq
+  lastEpoch = payload.epoch
+  return true
+}
+
+// 最近一次收到 state_update 推送的时间；推送活跃时不再发 HTTP 请求
+let lastStreamUpdate = 0
+let streamStarted = false
+const STREAM_FRESH_MS = 3000
+
+/**
+ * 订阅后端 state_update 推送，收到后合并到本地状态
+ */
+const startStateStream = () => {
+  if (streamStarted) return
+  streamStarted = true
+  socketService.onStateUpdate(
+    () => (mergedState && lastSeq !== null && lastEpoch !== null ? { since: lastSeq, epoch: lastEpoch } : {}),
+    (data) => {
+      if (!mergeBackendState(data as BackendStateDelta)) {
+        // 游标不匹配：丢弃本地状态，让服务端从全量开始推送
+        mergedState = null
+        lastSeq = null
+        socketService.resubscribeState()
+        return
+      }
+      lastStreamUpdate = Date.now()
+    },
+  )
+}
+
 /**
  * 获取后端实时状态
+ * 优先使用 state_update 推送合并出的本地状态；推送不活跃时退回 HTTP：
+ * 首次请求取全量，之后用 ?since=<seq> 只取新增样本并在本地合并
  */
 export const fetchBackendState = async (): Promise<BackendState | null> => {
+  startStateStream()
+  if (mergedState && Date.now() - lastStreamUpdate < STREAM_FRESH_MS) {
+    return mergedState
+  }
   try {
-    const response = await fetch(`${API_BASE_URL}/api/state`, {
-      cache: 'no-cache',
-    })
-    if (!response.ok) {
-      console.warn('Backend API not available, using mock data')
-      return null
+    for (let attempt = 0; attempt < 2; attempt++) {
+      const query = mergedState && lastSeq !== null ? `?since=${lastSeq}` : ''
+      const response = await fetch(`${API_BASE_URL}/api/state${query}`, {
+        cache: 'no-cache',
+      })
+      if (!response.ok) {
+        console.warn('Backend API not available, using mock data')
+        return null
+      }
+      if (mergeBackendState(await response.json())) {
+        return mergedState
+      }
+      // 后端已重启：丢弃本地状态重新取全量
+      mergedState = null
+      lastSeq = null
     }
-    return await response.json()
+    return mergedState
   } catch (error) {
     console.warn('Failed to fetch backend state:', error)
     return null
@@ -0,0 +1,71 @@
+"""
+PPG 样本传输格式基准：单帧通知（v1）vs 批量包（v2，B=N）
+
+用 benchmarks/ble_device_sim.py 的模拟设备生成 --samples 个样本的通知（可按 --loss 概率丢弃通知），
+对每种格式报告：
+- 空口：每个样本占用的 LL 包数和空口时间，以及连接间隔 --conn-interval、每个连接事件最多 --per-event 个 LL 包时
+  每秒最多能送达的样本数（LinkModel 估算）
+- 主机：回放给 BLE._notification_handler 的解析速度（样本/秒），统计到的丢包率与注入的是否一致，
+  以及收到的样本与设备发出的是否一致
+
+用法（在仓库根目录）：
+    python -m benchmarks.bench_ble_batch --samples 100000 --mtu 247 --loss 0.01
+"""
+import argparse
+import contextlib
+import io
+import time
+
+from ble import BLE
+from benchmarks.ble_device_sim import LinkModel, SimulatedWearable
+
+
+def replay(batch_size, args):
+    device = SimulatedWearable(mtu=args.mtu, loss=args.loss, seed=1)
+    host = BLE('sim', max_buffer_size=args.samples, reset_adapter=False, address_cache=None)
+    if batch_size > 1:
+        device.handle_command(f'B={batch_size}\n'.encode('ascii'))
+    device.handle_command(b'p=1\n')
+    notifications, samples = device.notifications(args.samples)
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for data in notifications:
+            host._notification_handler(None, bytearray(data))
+    elapsed = time.perf_counter() - t0
+    received = len(host.sdnn)
+    # 没有丢包时核对收到的样本与设备发出的完全一致
+    same = args.loss > 0 or (list(host.sdnn) == samples['sdnn'].tolist()
+                             and list(host.rri) == samples['rri'].ravel().tolist())
+    return device, notifications, received, elapsed, host.packet_loss_rate, same
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--samples', type=int, default=100000)
+    ap.add_argument('--mtu', type=int, default=247)
+    ap.add_argument('--loss', type=float, default=0.01, help='设备端丢弃通知的概率')
+    ap.add_argument('--conn-interval', type=float, default=30, help='连接间隔（毫秒）')
+    ap.add_argument('--per-event', type=int, default=4, help='每个连接事件最多发送的 LL 包数')
+    ap.add_argument('--ll-payload', type=int, default=27, help='LL 载荷上限（27 = 未启用 DLE，251 = DLE）')
+    ap.add_argument('--batches', default='1,4,8,16,26', help='批量大小列表，1 表示单帧格式')
+    args = ap.parse_args()
+    link = LinkModel(args.conn_interval / 1000, args.per_event, args.ll_payload)
+
+    print(f"samples={args.samples} mtu={args.mtu} injected loss={args.loss:g} "
+          f"conn interval={args.conn_interval:g} ms per-event={args.per_event} ll payload={args.ll_payload}")
+    print(f"{'format':<12}{'bytes/notify':>13}{'LL pkts/sample':>15}{'air µs/sample':>14}"
+          f"{'link max samples/s':>19}{'host decode samples/s':>22}{'loss rate':>10}  identical")
+    for batch_size in (int(b) for b in args.batches.split(',')):
+        device, notifications, received, elapsed, loss_rate, same = replay(batch_size, args)
+        per_notify = device.batch_size if device.batch_size > 1 else 1
+        notify_len = len(notifications[0])
+        name = 'v1 frame' if per_notify == 1 else f'v2 B={per_notify}'
+        loss = 'n/a' if loss_rate is None else f'{loss_rate:.4f}'
+        print(f"{name:<12}{notify_len:13d}{link.ll_packets(notify_len) / per_notify:15.3f}"
+              f"{link.airtime(notify_len) / per_notify * 1e6:14.1f}"
+              f"{link.max_samples_per_second(notify_len, per_notify):19,.0f}"
+              f"{received / elapsed:22,.0f}{loss:>10}  {same}")
+
+
+if __name__ == '__main__':
+    main()
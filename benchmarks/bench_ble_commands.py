@@ -0,0 +1,108 @@
+"""
+BLE 控制指令基准：阻塞式 *_sync + 手调 sleep vs BLECommandQueue
+
+用模拟的 GATT 客户端（每次写入耗时 --latency 毫秒）回放 demo.py 中的几段指令序列，以及一段快速连续的颜色渐变：
+- 改动前：每条指令 run_coroutine_threadsafe 后阻塞等待结果，指令之间按原代码 sleep
+- 改动后：全部 submit 到 BLECommandQueue（间隔 --interval 秒由队列保证），调用方不等待
+报告调用线程被阻塞的时间、实际写入次数、最后一条指令写完的时间，并核对设备上各类指令的最终值一致。
+
+用法（在仓库根目录）：
+    python -m benchmarks.bench_ble_commands --latency 30 --interval 0.5
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import threading
+import time
+
+from ble import BLECommandQueue, command_key
+
+# (指令, 原代码中该指令之后的 sleep 秒数)
+SEQUENCES = {
+    'mode1 entry': [('s=0', 0.5), ('m=7\n', 0.5), ('v=2\n', 0)],
+    'stop_interaction': [('m=3\n', 0.5), ('v=0\n', 0.5), ('l=0\n', 0.5), ('s=1', 0)],
+    'engaged entry': [('c=78,58,158\n', 0.5), ('s=0', 0)],
+    'color fade x50': [(f'c={i},{i},{i}\n', 0) for i in range(0, 250, 5)],
+}
+
+
+class FakeClient:
+    """模拟 BleakClient.write_gatt_char：记录写入内容和时间"""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.is_connected = True
+        self.writes = []
+
+    async def write_gatt_char(self, uuid, data):
+        await asyncio.sleep(self.latency)
+        self.writes.append((time.perf_counter(), data))
+
+
+def final_state(writes):
+    state = {}
+    for _, data in writes:
+        state[command_key(data)] = data
+    return state
+
+
+def start_loop():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    return loop, thread
+
+
+def run_legacy(sequence, latency):
+    loop, thread = start_loop()
+    client = FakeClient(latency)
+    t0 = time.perf_counter()
+    for command, pause in sequence:
+        future = asyncio.run_coroutine_threadsafe(client.write_gatt_char(None, command.encode('ascii')), loop)
+        future.result(timeout=5.0)
+        time.sleep(pause)
+    blocked = time.perf_counter() - t0
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    return blocked, client.writes[-1][0] - t0, client.writes
+
+
+def run_queue(sequence, latency, interval):
+    loop, thread = start_loop()
+    client = FakeClient(latency)
+    queue = BLECommandQueue(lambda data: client.write_gatt_char(None, data), lambda: client.is_connected,
+                            min_interval=interval)
+    loop.call_soon_threadsafe(queue.attach, loop)
+    time.sleep(0.05)
+    t0 = time.perf_counter()
+    handles = [queue.submit(command) for command, _ in sequence]
+    blocked = time.perf_counter() - t0
+    for handle in handles:
+        handle.wait(timeout=30)
+    asyncio.run_coroutine_threadsafe(queue.stop(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    return blocked, client.writes[-1][0] - t0, client.writes
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--latency', type=float, default=30, help='单次写入耗时（毫秒）')
+    ap.add_argument('--interval', type=float, default=0.5, help='BLECommandQueue 最小指令间隔（秒）')
+    args = ap.parse_args()
+    latency = args.latency / 1000
+
+    print(f"write latency={args.latency:g} ms  queue interval={args.interval:g} s")
+    print(f"{'sequence':<18} {'mode':<8} {'caller blocked':>15} {'last write':>11} {'writes':>7}  same final state")
+    for name, sequence in SEQUENCES.items():
+        with contextlib.redirect_stdout(io.StringIO()):
+            legacy = run_legacy(sequence, latency)
+            queued = run_queue(sequence, latency, args.interval)
+        same = final_state(legacy[2]) == final_state(queued[2])
+        for mode, (blocked, last, writes) in (('legacy', legacy), ('queue', queued)):
+            print(f"{name:<18} {mode:<8} {blocked * 1e3:12.2f} ms {last:9.2f} s {len(writes):7d}  {same}")
+
+
+if __name__ == '__main__':
+    main()
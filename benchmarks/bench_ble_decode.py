@@ -0,0 +1,130 @@
+"""
+BLE 通知解析基准：逐帧切片 + 列表 + 打印 vs decode_frames 一次解析整段通知
+
+构造 --frames 帧随机数据（心率含超出 50~190 的值，数据字节中也会出现 0xFF），按每次通知 --frames-per-notify 帧、
+并在其中穿插随机长度的垃圾字节和跨通知截断的帧，分别回放给改动前的 _notification_handler（打印重定向到内存）
+和当前实现（不打印 / 打印），报告每秒处理的帧数，并核对各缓冲区、rri_total 和剩余缓冲区完全一致。
+
+用法（在仓库根目录）：
+    python -m benchmarks.bench_ble_decode --frames 200000 --frames-per-notify 24
+"""
+import argparse
+import contextlib
+import io
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from ble import BLE, FRAME_HEADER, FRAME_SIZE
+
+
+class LegacyDecoder:
+    """改动前 BLE._notification_handler 的写法（只保留解析相关属性）"""
+
+    def __init__(self, max_buffer_size):
+        self.hr = deque(maxlen=max_buffer_size)
+        self.blood_oxygen = deque(maxlen=max_buffer_size)
+        self.sdnn = deque(maxlen=max_buffer_size)
+        self.rri = deque(maxlen=max_buffer_size * 4)
+        self.rri_total = 0
+        self.frame_event = threading.Event()
+        self.data_valid = False
+        self.receive_buffer = bytearray()
+        self.gyroscope = deque(maxlen=max_buffer_size)
+        self.frame_size = 10
+        self.header_byte = 0xFF
+
+    def _notification_handler(self, sender, data: bytearray):
+        self.receive_buffer.extend(data)
+        while len(self.receive_buffer) >= self.frame_size:
+            header_index = self.receive_buffer.find(self.header_byte)
+            if header_index == -1:
+                self.receive_buffer.clear()
+                break
+            if header_index > 0:
+                self.receive_buffer = self.receive_buffer[header_index:]
+            if len(self.receive_buffer) >= self.frame_size:
+                frame = self.receive_buffer[:self.frame_size]
+                if frame[0] == self.header_byte:
+                    valid_data = [int(b) for b in frame[1:10]]
+                    if valid_data[0] < 50 or valid_data[0] > 190:
+                        self.hr.append(0)
+                    else:
+                        self.hr.append(valid_data[0])
+                    self.blood_oxygen.append(valid_data[1])
+                    self.sdnn.append(valid_data[2])
+                    self.rri.extend(valid_data[3:6])
+                    self.rri_total += 3
+                    self.gyroscope.append(valid_data[6])
+                    self.data_valid = True
+                    self.frame_event.set()
+                    print(f"收到数据帧: HR={valid_data[0]}, SpO2={valid_data[1]}, SDNN={valid_data[2]}, "\
+                          f"RRI={valid_data[3:6]},gyro={valid_data[6]}")
+                self.receive_buffer = self.receive_buffer[self.frame_size:]
+            else:
+                break
+
+
+def new_decoder(max_buffer_size, log_frames):
+    """不重置适配器、不读写地址缓存的 BLE 实例（只用来回放通知）"""
+    return BLE('bench', max_buffer_size=max_buffer_size, log_frames=log_frames,
+               reset_adapter=False, address_cache=None)
+
+
+def synthesize(n_frames, per_notify, seed):
+    """生成通知序列：每 20 次通知有一次带垃圾字节，每次通知的切分点随机偏移（帧跨通知）"""
+    rng = np.random.default_rng(seed)
+    frames = rng.integers(0, 256, size=(n_frames, FRAME_SIZE), dtype=np.uint8)
+    frames[:, 0] = FRAME_HEADER
+    frames[:, 1] = rng.integers(30, 210, n_frames)
+    notifications = []
+    for i in range(0, n_frames, per_notify):
+        chunk = frames[i:i + per_notify].tobytes()
+        if (i // per_notify) % 20 == 7:
+            garbage = rng.integers(0, 255, rng.integers(1, 15), dtype=np.uint8).tobytes()  # 不含 0xFF
+            chunk = garbage + chunk
+        notifications.append(chunk)
+    stream = b''.join(notifications)
+    cuts = np.cumsum([len(c) for c in notifications])[:-1] + rng.integers(-7, 8, len(notifications) - 1)
+    cuts = np.clip(cuts, 0, len(stream))
+    return [stream[a:b] for a, b in zip(np.r_[0, cuts], np.r_[cuts, len(stream)])]
+
+
+def replay(decoder, notifications):
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for chunk in notifications:
+            decoder._notification_handler(None, bytearray(chunk))
+    return time.perf_counter() - t0
+
+
+def state(decoder):
+    return (list(decoder.hr), list(decoder.blood_oxygen), list(decoder.sdnn), list(decoder.rri),
+            list(decoder.gyroscope), decoder.rri_total, bytes(decoder.receive_buffer))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--frames', type=int, default=200000)
+    ap.add_argument('--frames-per-notify', type=int, default=24)
+    ap.add_argument('--buffer', type=int, default=120, help='BLE max_buffer_size')
+    args = ap.parse_args()
+
+    notifications = synthesize(args.frames, args.frames_per_notify, seed=0)
+    legacy = LegacyDecoder(args.buffer)
+    legacy_t = replay(legacy, notifications)
+    rows = [('per-frame loop + print', legacy_t, legacy.rri_total // 3, True)]
+    for name, log_frames in (('decode_frames', False), ('decode_frames + print', True)):
+        ble = new_decoder(args.buffer, log_frames)
+        rows.append((name, replay(ble, notifications), ble.rri_total // 3, state(ble) == state(legacy)))
+
+    print(f"notifications={len(notifications)} frames/notify={args.frames_per_notify}")
+    for name, elapsed, frames, same in rows:
+        print(f"{name:<24}: {frames / elapsed:12,.0f} frames/s  ({legacy_t / elapsed:5.1f}x)  "
+              f"frames={frames} identical={same}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,291 @@
+"""
+BLE 首帧耗时基准：启动后 / 断线后多久收到第一个数据帧
+
+用本地替身代替真实硬件，不需要蓝牙适配器：
+- 私有 dbus-daemon 上注册一个 org.bluez 替身，/org/bluez/hci0 的 Adapter1.Powered 在被设置 --power-latency 毫秒后
+  才改变并发出 PropertiesChanged（reset_bluetooth_async 走真实的 D-Bus 调用）
+- 替身 BLE 外设：每 --adv-interval 秒广播一次，扫描和建立连接都要等到下一次广播；收到 p=1 后每 --frame-period 秒
+  发一帧；--drop-after 秒后模拟一次断线（外设随即继续广播）
+分别测改动前（__init__ 中阻塞重置、固定 sleep、每次都按名称扫描、1 秒轮询断线、断线后再等 2 秒）和当前实现
+（地址缓存为空 / 已有缓存两种启动情况）。
+
+用法（在仓库根目录）：
+    python -m benchmarks.bench_ble_reconnect --adv-interval 1.0 --power-latency 200
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import subprocess
+import tempfile
+import threading
+import time
+
+import ble
+
+ADDRESS = 'AA:BB:CC:DD:EE:01'
+
+
+class StandInAdapter:
+    """私有 D-Bus 上的 org.bluez 替身（只实现 Adapter1.Powered）"""
+
+    def __init__(self, power_latency):
+        self.power_latency = power_latency
+        self.daemon = subprocess.Popen(['dbus-daemon', '--session', '--nofork', '--print-address'],
+                                       stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        self.address = self.daemon.stdout.readline().strip()
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(self._export(), self.loop).result(timeout=5)
+
+    async def _export(self):
+        from dbus_fast.aio import MessageBus
+        from dbus_fast.service import PropertyAccess, ServiceInterface, dbus_property
+
+        latency = self.power_latency
+
+        class Adapter(ServiceInterface):
+            def __init__(self):
+                super().__init__(ble.ADAPTER_INTERFACE)
+                self._powered = True
+
+            @dbus_property(access=PropertyAccess.READWRITE)
+            def Powered(self) -> 'b':
+                return self._powered
+
+            @Powered.setter
+            def Powered(self, value: 'b'):
+                def apply():
+                    self._powered = value
+                    self.emit_properties_changed({'Powered': value})
+                asyncio.get_running_loop().call_later(latency, apply)
+
+        self.bus = await MessageBus(bus_address=self.address).connect()
+        self.bus.export(ble.ADAPTER_PATH, Adapter())
+        await self.bus.request_name('org.bluez')
+
+    def close(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.daemon.terminate()
+        self.daemon.wait()
+
+
+class StandInPeer:
+    """替身 BLE 外设"""
+
+    def __init__(self, adv_interval, frame_period):
+        self.adv_interval = adv_interval
+        self.frame_period = frame_period
+        self.client = None
+
+    async def next_advertisement(self):
+        await asyncio.sleep(self.adv_interval)
+
+    def drop(self):
+        client = self.client
+        if client is not None and client.is_connected:
+            client.loop.call_soon_threadsafe(client.lose_link)
+
+
+class StandInDevice:
+    def __init__(self, name, address):
+        self.name = name
+        self.address = address
+
+
+def stand_in_bleak(peer):
+    """返回替换 ble.BleakScanner / ble.BleakClient 的类"""
+
+    class Scanner:
+        @staticmethod
+        async def find_device_by_name(name, timeout=10.0):
+            await peer.next_advertisement()
+            return StandInDevice(name, ADDRESS)
+
+    class Client:
+        def __init__(self, target, disconnected_callback=None, timeout=10.0, **kwargs):
+            self.target = target
+            self.address = getattr(target, 'address', target)
+            self.disconnected_callback = disconnected_callback
+            self.is_connected = False
+            self.loop = None
+            self._stream = None
+            self._found = not isinstance(target, str)
+
+        async def connect(self, **kwargs):
+            self.loop = asyncio.get_running_loop()
+            if not self._found:
+                await peer.next_advertisement()  # 只给了地址：bleak 先按地址扫描到设备（之后重连同一 client 不再扫描）
+                self._found = True
+            await peer.next_advertisement()  # 等外设广播时发起连接
+            self.is_connected = True
+            peer.client = self
+            return True
+
+        async def start_notify(self, uuid, callback):
+            self._callback = callback
+
+        async def stop_notify(self, uuid):
+            pass
+
+        async def write_gatt_char(self, uuid, data):
+            if data == b'p=1\n' and (self._stream is None or self._stream.done()):
+                self._stream = asyncio.ensure_future(self._send_frames())
+
+        async def _send_frames(self):
+            frame = bytearray([0xFF, 72, 98, 40, 80, 82, 81, 0, 0, 0])
+            while self.is_connected:
+                await asyncio.sleep(peer.frame_period)
+                if self.is_connected:
+                    self._callback(None, frame)
+
+        def lose_link(self):
+            self.is_connected = False
+            if self._stream is not None:
+                self._stream.cancel()
+            if self.disconnected_callback is not None:
+                self.disconnected_callback(self)
+
+        async def disconnect(self):
+            self.is_connected = False
+            if self._stream is not None:
+                self._stream.cancel()
+                await asyncio.gather(self._stream, return_exceptions=True)
+
+    return Scanner, Client
+
+
+def legacy_reset_bluetooth(power_latency):
+    """改动前 reset_bluetooth() 的耗时结构：bluetoothctl power off，sleep(2)，power on，sleep(3)"""
+    time.sleep(power_latency)
+    time.sleep(2)
+    time.sleep(power_latency)
+    time.sleep(3)
+
+
+class LegacyBLE(ble.BLE):
+    """改动前的连接流程：__init__ 阻塞重置、每次按名称扫描、1 秒轮询断线、断线后再等 2 秒"""
+
+    power_latency = 0.2
+
+    def __init__(self, device_name):
+        legacy_reset_bluetooth(self.power_latency)
+        super().__init__(device_name, reset_adapter=False, address_cache=None)
+
+    async def connect(self):
+        while self.is_running:
+            device = await ble.BleakScanner.find_device_by_name(self.device_name, timeout=10.0)
+            if device is None:
+                await asyncio.sleep(5)
+                continue
+            self.client = ble.BleakClient(device)
+            await self.client.connect()
+            if self.client.is_connected:
+                self.is_connected = True
+                return True
+            await asyncio.sleep(5)
+        return False
+
+    async def start_reading(self):
+        await self.client.start_notify(self.notify_characteristic_uuid, self._notification_handler)
+        await self.client.write_gatt_char(self.write_characteristic_uuid, b"p=1\n")
+        while self.is_running:
+            await asyncio.sleep(1.0)
+            if not self.client.is_connected:
+                self.is_connected = False
+                break
+
+    def start_continuous_reading(self):
+        self.is_running = True
+
+        def async_thread():
+            self.loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self.loop)
+            self.commands.attach(self.loop)
+            while self.is_running:
+                self.loop.run_until_complete(self.connect())
+                if self.is_connected:
+                    self.loop.run_until_complete(self.start_reading())
+                    if self.is_running:
+                        time.sleep(2)
+                    else:
+                        break
+                else:
+                    time.sleep(2)
+            self.loop.run_until_complete(self.commands.stop())
+            if self.client and self.client.is_connected:
+                self.loop.run_until_complete(self.disconnect())
+            self.loop.close()
+
+        self.thread = threading.Thread(target=async_thread, daemon=True)
+        self.thread.start()
+
+
+def wait_frame(device, timeout=30):
+    device.frame_event.clear()
+    if not device.frame_event.wait(timeout):
+        raise RuntimeError('no frame received')
+
+
+def measure(make, peer, drop_after):
+    """返回 (启动到首帧, 断线到首帧, 两次连接方式)"""
+    t0 = time.perf_counter()
+    device = make()
+    device.frame_event.clear()
+    device.start_continuous_reading()
+    wait_frame(device)
+    boot = time.perf_counter() - t0
+    boot_path = device.connect_path
+    time.sleep(drop_after)
+    device.frame_event.clear()
+    t0 = time.perf_counter()
+    peer.drop()
+    wait_frame(device)
+    reconnect = time.perf_counter() - t0
+    device.stop_continuous_reading()
+    device.thread.join()
+    return boot, reconnect, (boot_path, device.connect_path)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--adv-interval', type=float, default=1.0, help='外设广播间隔（秒）')
+    ap.add_argument('--frame-period', type=float, default=1.0, help='外设发送数据帧的间隔（秒）')
+    ap.add_argument('--power-latency', type=float, default=200, help='适配器开关一次的耗时（毫秒）')
+    ap.add_argument('--drop-after', type=float, default=1.5, help='连上后多久模拟断线（秒）')
+    args = ap.parse_args()
+
+    peer = StandInPeer(args.adv_interval, args.frame_period)
+    ble.BleakScanner, ble.BleakClient = stand_in_bleak(peer)
+    LegacyBLE.power_latency = args.power_latency / 1000
+    adapter = StandInAdapter(args.power_latency / 1000)
+    os.environ['DBUS_SYSTEM_BUS_ADDRESS'] = adapter.address
+    ble.check_dbus_available = lambda: True
+
+    results = []
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = os.path.join(tmp, 'ble_devices.json')
+            runs = [
+                ('legacy', lambda: LegacyBLE('demo')),
+                ('new, empty cache', lambda: ble.BLE('demo', address_cache=cache)),
+                ('new, cached address', lambda: ble.BLE('demo', address_cache=cache)),
+            ]
+            for name, make in runs:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    results.append((name,) + measure(make, peer, args.drop_after))
+    finally:
+        adapter.close()
+
+    print(f"adv interval={args.adv_interval:g} s  frame period={args.frame_period:g} s  "
+          f"adapter power toggle={args.power_latency:g} ms")
+    print(f"{'':<22}{'boot -> 1st frame':>18}{'drop -> 1st frame':>19}   connect path (boot / reconnect)")
+    for name, boot, reconnect, paths in results:
+        print(f"{name:<22}{boot:16.2f} s{reconnect:17.2f} s   {paths[0] or 'scan'} / {paths[1] or 'scan'}")
+
+
+if __name__ == '__main__':
+    main()
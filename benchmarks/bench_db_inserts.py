@@ -0,0 +1,105 @@
+"""
+加密数据库写入基准：每次操作新建 SQLCipher 连接 + PRAGMA key vs DBManager 每线程长连接（WAL）vs WriteBehindQueue
+
+在临时目录新建加密库，分别用改动前的 DBManager 和当前 DBManager 调用 AyuanRepo.add_breathing_log /
+record_emotion 各 --inserts 次，统计 inserts/sec；再用 --threads 个线程并发写入验证长连接的线程安全；
+最后经 WriteBehindQueue 写入，统计调用方看到的速率和实际提交（fsync）次数。
+
+用法（在仓库根目录，需要 pysqlcipher3）：
+    python -m benchmarks.bench_db_inserts --inserts 200
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'database'))
+
+from pysqlcipher3 import dbapi2 as sqlite3  # noqa: E402
+
+from db_manager import DBManager  # noqa: E402
+from repo import AyuanRepo  # noqa: E402
+from schema import init_tables  # noqa: E402
+from write_behind import WriteBehindQueue  # noqa: E402
+
+KEY = 'bench-device-key'
+
+
+class LegacyDBManager:
+    """改动前的 DBManager：每次 get_connection 都新建连接并重新派生密钥"""
+
+    def __init__(self, db_path, password):
+        self.db_path = db_path
+        self.password = password
+
+    def get_connection(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(f"PRAGMA key = '{self.password}';")
+        conn.execute("PRAGMA cipher_compatibility = 3;")
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def close_connection(self, conn):
+        if conn:
+            conn.close()
+
+
+def run(manager, inserts, threads=1, queued=False):
+    repo = AyuanRepo(manager)
+    if queued:
+        repo = WriteBehindQueue(repo)
+
+    def worker(n):
+        for i in range(n):
+            repo.add_breathing_log(duration=100 + i % 20, score=80 + i % 20, details={'hrv': 50})
+            repo.record_emotion('Calm')
+
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        workers = [threading.Thread(target=worker, args=(inserts // threads,)) for _ in range(threads)]
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+    elapsed = time.perf_counter() - t0
+    commits = 2 * (inserts // threads) * threads
+    if queued:
+        repo.close()
+        commits = repo.flushes
+    return 2 * (inserts // threads) * threads / elapsed, commits
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--inserts', type=int, default=200)
+    ap.add_argument('--threads', type=int, default=4)
+    args = ap.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, factory, threads, queued in (('per-call connection', LegacyDBManager, 1, False),
+                                               ('per-thread connection', DBManager, 1, False),
+                                               (f'per-thread, {args.threads} threads', DBManager, args.threads, False),
+                                               ('write-behind queue', DBManager, 1, True)):
+            db_path = os.path.join(tmp, f'{len(results)}.db')
+            manager = factory(db_path, KEY)
+            conn = manager.get_connection()
+            init_tables(conn)
+            manager.close_connection(conn)
+            rate, commits = run(manager, args.inserts, threads, queued)
+            count = manager.get_connection().execute('SELECT COUNT(*) FROM emotion_history').fetchone()[0]
+            if isinstance(manager, DBManager):
+                manager.close_all()
+            results.append((name, rate, commits, count))
+
+    print(f"inserts={args.inserts} per table")
+    for name, rate, commits, count in results:
+        print(f"{name:<28}: {rate:9.0f} inserts/sec  {commits:5d} commits  (emotion_history rows: {count})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+情绪模型推断基准：逐窗口 predict_from_signals（DataFrame + linregress + 两次 predict）vs predict_batch
+
+模拟回放一段 --minutes 分钟的 1Hz 心率/呼吸率会话，按 60 秒窗口、10 秒步长切窗，
+比较改动前的逐窗口写法与 sliding_windows + predict_batch 的总耗时，并核对两者的预测结果一致。
+
+用法（在仓库根目录，需要 stress_detection_model_arousal.pkl / _valence.pkl）：
+    python -m benchmarks.bench_emotion_predict --minutes 60
+"""
+import argparse
+import contextlib
+import io
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+from scipy.stats import linregress
+
+from emotion_dete import EmotionDetector, sliding_windows
+
+
+def legacy_predict(detector, hr_array, rr_array):
+    """改动前 EmotionDetector.predict_from_signals 的写法"""
+    feat = {}
+    feat['HR_mean'] = hr_array.mean()
+    feat['HR_std'] = hr_array.std()
+    feat['HR_range'] = hr_array.max() - hr_array.min()
+    feat['RR_mean'] = rr_array.mean()
+    feat['RR_std'] = rr_array.std()
+    slope, _, _, _, _ = linregress(np.arange(60), hr_array)
+    feat['HR_slope'] = slope
+    feat['PRQ'] = feat['HR_mean'] / (feat['RR_mean'] + 1e-5)
+    X_new = pd.DataFrame([feat])
+    return int(detector.arousal_model.predict(X_new)[0]), int(detector.valence_model.predict(X_new)[0])
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--minutes', type=float, default=60)
+    args = ap.parse_args()
+
+    warnings.simplefilter('ignore')  # 模型由其他 sklearn 版本保存时的版本警告
+    with contextlib.redirect_stdout(io.StringIO()):
+        detector = EmotionDetector()
+
+    rng = np.random.default_rng(0)
+    n = int(args.minutes * 60)
+    t = np.arange(n)
+    hr = 70 + 8 * np.sin(t / 300) + rng.normal(0, 2, n)
+    rr = 15 + 3 * np.sin(t / 500) + rng.normal(0, 1, n)
+
+    t0 = time.perf_counter()
+    hr_windows, rr_windows = sliding_windows(hr), sliding_windows(rr)
+    batch = detector.predict_batch(hr_windows, rr_windows)
+    batch_t = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    legacy = [legacy_predict(detector, h, r) for h, r in zip(hr_windows, rr_windows)]
+    legacy_t = time.perf_counter() - t0
+
+    mismatches = sum((a, v) != (int(ba), int(bv)) for (a, v), ba, bv in zip(legacy, batch['arousal'], batch['valence']))
+    print(f"session={args.minutes:g} min  windows={len(hr_windows)}")
+    print(f"per-window predict_from_signals : {legacy_t * 1e3:9.1f} ms")
+    print(f"sliding_windows + predict_batch : {batch_t * 1e3:9.1f} ms  ({legacy_t / batch_t:.0f}x)")
+    print(f"prediction mismatches           : {mismatches}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+训练特征提取基准：逐窗口 iloc + mode + linregress vs 向量化的 extract_features_dual_label
+
+构造 --subjects 名受试者、每人 --minutes 分钟的 1Hz（已标准化）HR / RR 和分段标签（含 WESAD 中不用的 0/5/6/7），
+比较改动前的逐窗口写法与当前实现的耗时，并核对特征（浮点容差内）和标签完全一致。
+
+用法（在仓库根目录）：
+    python -m benchmarks.bench_extract_features --subjects 15 --minutes 100
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from scipy.stats import linregress
+
+from emotion_dete import FEATURE_COLUMNS, extract_features_dual_label
+
+
+def legacy_extract_features_dual_label(df_1hz):
+    """改动前 extract_features_dual_label 的写法"""
+    X_features, y_arousal, y_valence = [], [], []
+    valid_labels = [1, 2, 3, 4]
+    map_arousal = {1: 0, 4: 0, 2: 1, 3: 1}
+    map_valence = {1: 0, 2: 0, 3: 1, 4: 1}
+    for i in range(0, len(df_1hz) - 60, 10):
+        window = df_1hz.iloc[i : i + 60]
+        label = window['Label'].mode()[0]
+        if label not in valid_labels:
+            continue
+        feat = {}
+        feat['HR_mean'] = window['HR'].mean()
+        feat['HR_std'] = window['HR'].std()
+        feat['HR_range'] = window['HR'].max() - window['HR'].min()
+        feat['RR_mean'] = window['RR'].mean()
+        feat['RR_std'] = window['RR'].std()
+        slope, _, _, _, _ = linregress(np.arange(len(window)), window['HR'].values)
+        feat['HR_slope'] = slope
+        feat['PRQ'] = feat['HR_mean'] / (feat['RR_mean'] + 1e-5)
+        X_features.append(feat)
+        y_arousal.append(map_arousal[label])
+        y_valence.append(map_valence[label])
+    return pd.DataFrame(X_features), np.array(y_arousal), np.array(y_valence)
+
+
+def synthesize(minutes, seed):
+    rng = np.random.default_rng(seed)
+    n = int(minutes * 60) + seed  # 长度不总是步长的整数倍
+    t = np.arange(n)
+    hr = np.sin(t / 200) + rng.normal(0, 0.3, n)
+    rr = np.cos(t / 300) + rng.normal(0, 0.3, n)
+    labels = np.repeat(rng.choice([0, 1, 2, 3, 4, 6, 7], size=n // 90 + 1), 90)[:n]
+    return pd.DataFrame({'HR': (hr - hr.mean()) / hr.std(), 'RR': (rr - rr.mean()) / rr.std(), 'Label': labels})
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--subjects', type=int, default=15)
+    ap.add_argument('--minutes', type=float, default=100)
+    args = ap.parse_args()
+
+    subjects = [synthesize(args.minutes, seed) for seed in range(args.subjects)]
+    legacy_t = new_t = 0.0
+    max_err, labels_equal, windows = 0.0, True, 0
+    for df_1hz in subjects:
+        t0 = time.perf_counter()
+        old = legacy_extract_features_dual_label(df_1hz)
+        t1 = time.perf_counter()
+        new = extract_features_dual_label(df_1hz)
+        t2 = time.perf_counter()
+        legacy_t += t1 - t0
+        new_t += t2 - t1
+        windows += len(new[0])
+        labels_equal &= np.array_equal(old[1], new[1]) and np.array_equal(old[2], new[2])
+        if len(old[0]):
+            assert list(old[0].columns) == FEATURE_COLUMNS
+            max_err = max(max_err, float(np.max(np.abs(old[0].to_numpy() - new[0].to_numpy()))))
+
+    print(f"subjects={args.subjects} minutes={args.minutes:g} windows={windows}")
+    print(f"per-window loop : {legacy_t * 1e3:9.1f} ms")
+    print(f"vectorized      : {new_t * 1e3:9.1f} ms  ({legacy_t / new_t:.0f}x)")
+    print(f"max abs feature difference: {max_err:.2e}  labels identical: {labels_equal}")
+
+
+if __name__ == '__main__':
+    main()
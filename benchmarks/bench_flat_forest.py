@@ -0,0 +1,76 @@
+"""
+情绪模型加载与推断基准：sklearn 随机森林 .pkl（joblib.load）vs 扁平数组模型 .npz（FlatForest）
+
+每种方式在独立子进程中测量：导入 + 加载两个模型的耗时、加载后的进程峰值 RSS、
+单窗口 predict 的延迟（中位数），以及一次预测 --batch 个窗口的耗时，并核对两者预测一致。
+
+用法（在仓库根目录，需要先 python emotion_dete.py --export-flat）：
+    python -m benchmarks.bench_flat_forest
+"""
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+import warnings
+
+import numpy as np
+
+MODELS = ('stress_detection_model_arousal', 'stress_detection_model_valence')
+
+
+def child(mode, batch, repeats):
+    warnings.simplefilter('ignore')
+    t0 = time.perf_counter()
+    if mode == 'sklearn':
+        import joblib
+        models = [joblib.load(f'{name}.pkl') for name in MODELS]
+    else:
+        from flat_forest import FlatForest
+        models = [FlatForest.load(f'{name}.npz') for name in MODELS]
+    load_t = time.perf_counter() - t0
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    rng = np.random.default_rng(0)
+    X = rng.normal(0, 1, (batch, 7))
+    single = []
+    for i in range(repeats):
+        t0 = time.perf_counter()
+        for model in models:
+            model.predict(X[i % batch:i % batch + 1])
+        single.append(time.perf_counter() - t0)
+    t0 = time.perf_counter()
+    predictions = [model.predict(X).tolist() for model in models]
+    batch_t = time.perf_counter() - t0
+    print(json.dumps({'load': load_t, 'rss': rss, 'single': float(np.median(single)), 'batch': batch_t,
+                      'predictions': predictions}))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--batch', type=int, default=1000)
+    ap.add_argument('--repeats', type=int, default=50)
+    ap.add_argument('--child', help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.child:
+        child(args.child, args.batch, args.repeats)
+        return
+
+    results = {}
+    for mode in ('sklearn', 'flat'):
+        out = subprocess.run([sys.executable, '-m', 'benchmarks.bench_flat_forest', '--child', mode,
+                              '--batch', str(args.batch), '--repeats', str(args.repeats)],
+                             capture_output=True, text=True, check=True).stdout
+        results[mode] = json.loads(out.strip().splitlines()[-1])
+
+    print(f"batch={args.batch} repeats={args.repeats}")
+    for mode, r in results.items():
+        print(f"{mode:<7}: import+load {r['load'] * 1e3:7.1f} ms  peak RSS {r['rss']:6.1f} MiB  "
+              f"single window {r['single'] * 1e3:6.2f} ms  batch {r['batch'] * 1e3:7.1f} ms")
+    print(f"prediction mismatches: {int(np.sum(np.array(results['sklearn']['predictions']) != np.array(results['flat']['predictions'])))}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+HRV 频域后端基准：pyhrv welch_psd vs 原生 welch_band_powers
+
+对同一批 NN 间期窗口分别用两种后端计算 (VLF, LF, HF)，比较单次耗时和结果差异。
+窗口来自雷达录制的原始串口字节流（取其中的心率帧），未指定时使用合成心率。
+
+用法（在仓库根目录）：
+    python -m benchmarks.bench_hrv_backend                      # 合成心率
+    python -m benchmarks.bench_hrv_backend --input dump.bin     # 串口录制的原始字节流
+    python -m benchmarks.bench_hrv_backend --window 180         # compute_freq_rri 的窗口长度
+"""
+import argparse
+import time
+import warnings
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+
+from HRVcalculate import welch_band_powers
+from radar_parser import RadarFrameParser
+
+
+def hr_from_dump(paths):
+    """从原始字节流中取出所有非零心率帧"""
+    parser = RadarFrameParser()
+    hrs = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            for ctrl, cmd, payload in parser.feed(f.read()):
+                if (ctrl, cmd) == (0x85, 0x02) and len(payload) and payload[0]:
+                    hrs.append(payload[0])
+    return np.array(hrs, dtype=float)
+
+
+def synthetic_hr(n, seed=0):
+    rng = np.random.default_rng(seed)
+    k = np.arange(n)
+    return 70 + 4 * np.sin(2 * np.pi * 0.085 * k) + 2 * np.sin(2 * np.pi * 0.21 * k) + rng.normal(0, 1.5, n)
+
+
+def pyhrv_powers(nni, with_plot):
+    import pyhrv.frequency_domain as fd
+    if with_plot:
+        result = fd.welch_psd(nni=nni, nfft=128, detrend=True, window='hamming', show=False)
+        plt.close('all')
+    else:
+        result = fd.welch_psd(nni=nni, nfft=128, detrend=True, window='hamming', show=False, mode='dev')[0]
+    return tuple(float(p) for p in result['fft_abs'])
+
+
+def timed(fn, windows):
+    times, out = [], []
+    for nni in windows:
+        t0 = time.perf_counter()
+        out.append(fn(nni))
+        times.append(time.perf_counter() - t0)
+    return np.median(times), np.array(out)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--input', action='append', help='雷达串口录制的原始字节流文件，可重复指定')
+    ap.add_argument('--window', type=int, default=40, help='每个窗口的 NN 间期个数')
+    ap.add_argument('--windows', type=int, default=300, help='最多比较的窗口数')
+    ap.add_argument('--with-plot', action='store_true', help='pyhrv 使用默认 mode（与旧代码一致，会顺带画图）')
+    args = ap.parse_args()
+
+    hrs = hr_from_dump(args.input) if args.input else synthetic_hr(args.window + args.windows)
+    rri = 60000.0 / hrs
+    windows = [rri[i:i + args.window] for i in range(0, len(rri) - args.window + 1)][:args.windows]
+    if not windows:
+        print(f"not enough heart rate samples: {len(hrs)} < window {args.window}")
+        return
+    print(f"{len(windows)} windows x {args.window} NN intervals")
+
+    with warnings.catch_warnings():
+        # 短窗口时 scipy 会提示 nperseg 被缩短
+        warnings.simplefilter('ignore', UserWarning)
+        pyhrv_t, ref = timed(lambda nni: pyhrv_powers(nni, args.with_plot), windows)
+    native_t, got = timed(welch_band_powers, windows)
+
+    rel = np.abs(got - ref) / np.abs(ref)
+    print(f"pyhrv  : {pyhrv_t * 1e6:9.1f} us/window")
+    print(f"native : {native_t * 1e6:9.1f} us/window")
+    print(f"speedup: {pyhrv_t / native_t:.1f}x")
+    print(f"max rel diff (VLF, LF, HF): {rel.max(axis=0)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+HRV 计算基准：每次整窗重算（pyhrv welch_psd）vs IncrementalHRV 增量更新
+
+按雷达节奏逐个推入心率，每推入一个样本都查询一次时域 + 频域指标，统计单次更新耗时，
+并与整窗 pyhrv 结果比较 LF/HF 的相对误差（SDNN/RMSSD 应与 numpy 整窗结果一致到 1e-6）。
+
+用法（在仓库根目录）：
+    python -m benchmarks.bench_hrv_incremental --beats 600 --window 40
+    python -m benchmarks.bench_hrv_incremental --with-plot   # 旧路径含 pyhrv 默认绘图
+"""
+import argparse
+import time
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pyhrv.frequency_domain as fd
+
+from HRVcalculate import IncrementalHRV
+
+
+def synthetic_hr(n, seed=0):
+    """带 LF（约 0.1Hz）和 HF（约 0.25Hz）调制的心率序列"""
+    rng = np.random.default_rng(seed)
+    k = np.arange(n)
+    return 70 + 4 * np.sin(2 * np.pi * 0.085 * k) + 2 * np.sin(2 * np.pi * 0.21 * k) + rng.normal(0, 1.5, n)
+
+
+def full_window(hr_window, with_plot=False):
+    """
+    旧路径：HRVcalculate.compute_time + compute_freq 的整窗计算
+    with_plot=True 时与旧代码完全相同（pyhrv 默认 mode 会顺带画一张 PSD 图），否则只算谱
+    """
+    rri = 60000 / np.asarray(hr_window, dtype=float)
+    rmssd = np.sqrt(np.mean(np.diff(rri) ** 2))
+    sdnn = np.std(rri)
+    if with_plot:
+        result = fd.welch_psd(nni=rri, nfft=128, detrend=True, window='hamming', show=False)
+        plt.close('all')
+    else:
+        result = fd.welch_psd(nni=rri, nfft=128, detrend=True, window='hamming', show=False, mode='dev')[0]
+    lf, hf = float(result['fft_abs'][1]), float(result['fft_abs'][2])
+    return rmssd, sdnn, lf / hf, lf, hf
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--beats', type=int, default=600)
+    ap.add_argument('--window', type=int, default=40)
+    ap.add_argument('--seed', type=int, default=0)
+    ap.add_argument('--with-plot', action='store_true', help='旧路径包含 pyhrv 默认绘图（与线上代码一致）')
+    args = ap.parse_args()
+
+    hrs = synthetic_hr(args.beats, args.seed)
+    engine = IncrementalHRV(args.window)
+    full_t, inc_t = [], []
+    lf_err, hf_err, td_err = [], [], []
+
+    for i, hr in enumerate(hrs):
+        t0 = time.perf_counter()
+        engine.push_hr(hr)
+        td = engine.time_domain()
+        fq = engine.freq_domain()
+        inc_t.append(time.perf_counter() - t0)
+        if td is None or fq is None:
+            continue
+
+        t0 = time.perf_counter()
+        rmssd, sdnn, _, lf, hf = full_window(hrs[i - args.window + 1:i + 1], args.with_plot)
+        full_t.append(time.perf_counter() - t0)
+
+        td_err.append(max(abs(td[0] - rmssd), abs(td[1] - sdnn)))
+        lf_err.append(abs(fq[1] - lf) / lf)
+        hf_err.append(abs(fq[2] - hf) / hf)
+
+    print(f"window={args.window} beats={args.beats} compared={len(full_t)}")
+    # 取中位数，避免偶发调度抖动影响结果
+    full_us, inc_us = np.median(full_t) * 1e6, np.median(inc_t) * 1e6
+    print(f"full window  : {full_us:9.1f} us/update")
+    print(f"incremental  : {inc_us:9.1f} us/update")
+    print(f"speedup      : {full_us / inc_us:.1f}x")
+    print(f"time domain  : max abs err {max(td_err):.2e} ms")
+    print(f"LF rel err   : median {np.median(lf_err):.4f}  p95 {np.percentile(lf_err, 95):.4f}  max {max(lf_err):.4f}")
+    print(f"HF rel err   : median {np.median(hf_err):.4f}  p95 {np.percentile(hf_err, 95):.4f}  max {max(hf_err):.4f}")
+
+
+if __name__ == '__main__':
+    main()
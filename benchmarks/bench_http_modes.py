@@ -0,0 +1,165 @@
+"""
+可视化 Web 服务吞吐基准：threading（Werkzeug 开发服务器）vs gevent（pywsgi）
+
+每种模式在子进程里启动一个 DataVisualizer（与 demo.py 一样不做 monkey patch），
+后台每秒 update_data 一次；--clients 个 HTTP/1.1 keep-alive 客户端并发请求
+/api/state 和前端打包产物（around-front-master/dist/assets 下最大的 js），
+分别统计不压缩 / Accept-Encoding: br, gzip 时的 requests/sec、p50 延迟和单次响应字节数。
+最后在 --plot-clients 个客户端持续拉取 /api/emotion_plot（每秒有新评分，请求会等待后台渲染）的同时
+测 /api/state 的 p50 / p99 延迟：等待渲染不应拖慢其他请求（gevent 模式下尤其如此）。
+
+用法（在仓库根目录）：
+    python -m benchmarks.bench_http_modes --clients 16 --seconds 5
+"""
+import argparse
+import glob
+import http.client
+import os
+import subprocess
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from data_visualizer import NEW_FRONTEND_DIR
+
+
+def serve(mode, port):
+    """子进程入口：启动可视化服务并持续喂数据"""
+    import logging
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    from data_visualizer import DataVisualizer
+
+    from quadrant_plot import QuadrantRenderer
+
+    viz = DataVisualizer(port=port, server_mode=mode)
+    renderer = QuadrantRenderer()
+    viz.fsm_instance = SimpleNamespace(arousal_score=None, valence_score=None,
+                                       recorder=SimpleNamespace(renderer=renderer))
+    for i in range(viz.max_data_points):
+        viz.update_data({'hr': 60 + i % 20, 'br': 15, 'LF': 1.2, 'HF': 0.8, 'SDNN': 45, 'spo2': 98})
+    viz.start_server()
+    i = 0
+    while True:
+        time.sleep(1)
+        i += 1
+        viz.update_data({'hr': 60 + i % 20, 'br': 15, 'LF': 1.2, 'HF': 0.8, 'SDNN': 45, 'spo2': 98})
+        renderer.submit(i % 5 - 2, 2 - i % 5, [], (15, 45, 70, 1.5))
+
+
+def wait_ready(port, timeout=20):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=1)
+            conn.request('GET', '/api/state')
+            conn.getresponse().read()
+            conn.close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f'server on port {port} did not start')
+
+
+def load(port, path, clients, seconds, headers, percentile=None):
+    """clients 个线程各用一条 keep-alive 连接循环请求 path；给出 percentile 时额外返回该分位延迟"""
+    latencies, sizes = [], []
+    lock = threading.Lock()
+    stop = time.perf_counter() + seconds
+
+    def worker():
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+        local_lat, local_size = [], []
+        while time.perf_counter() < stop:
+            t0 = time.perf_counter()
+            conn.request('GET', path, headers=headers)
+            resp = conn.getresponse()
+            body = resp.read()
+            local_lat.append(time.perf_counter() - t0)
+            local_size.append(len(body))
+            if resp.will_close:
+                conn.close()
+                conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+        conn.close()
+        with lock:
+            latencies.extend(local_lat)
+            sizes.extend(local_size)
+
+    threads = [threading.Thread(target=worker) for _ in range(clients)]
+    t0 = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - t0
+    if percentile is not None:
+        return len(latencies) / elapsed, np.median(latencies), np.percentile(latencies, percentile)
+    return len(latencies) / elapsed, np.median(latencies), np.median(sizes)
+
+
+def load_during_plot_polls(port, clients, plot_clients, seconds):
+    """plot_clients 个线程循环请求 /api/emotion_plot 时，测 /api/state 的吞吐、p50 和 p99"""
+    stop = threading.Event()
+
+    def poller():
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+        while not stop.is_set():
+            conn.request('GET', '/api/emotion_plot')
+            conn.getresponse().read()
+        conn.close()
+
+    pollers = [threading.Thread(target=poller) for _ in range(plot_clients)]
+    for t in pollers:
+        t.start()
+    try:
+        return load(port, '/api/state', clients, seconds, {}, percentile=99)
+    finally:
+        stop.set()
+        for t in pollers:
+            t.join()
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--clients', type=int, default=16)
+    ap.add_argument('--seconds', type=float, default=5)
+    ap.add_argument('--port', type=int, default=5099)
+    ap.add_argument('--plot-clients', type=int, default=2)
+    ap.add_argument('--modes', nargs='+', default=['threading', 'gevent'])
+    ap.add_argument('--serve', help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.serve:
+        serve(args.serve, args.port)
+        return
+
+    assets = sorted(glob.glob(os.path.join(NEW_FRONTEND_DIR, 'assets', '*.js')), key=os.path.getsize)
+    paths = ['/api/state'] + (['/assets/' + os.path.basename(assets[-1])] if assets else [])
+    encodings = {'identity': {}, 'br,gzip': {'Accept-Encoding': 'br, gzip'}}
+
+    print(f"clients={args.clients} seconds={args.seconds}")
+    for mode in args.modes:
+        proc = subprocess.Popen([sys.executable, '-m', 'benchmarks.bench_http_modes',
+                                 '--serve', mode, '--port', str(args.port)],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            wait_ready(args.port)
+            for path in paths:
+                for name, headers in encodings.items():
+                    rps, p50, size = load(args.port, path, args.clients, args.seconds, headers)
+                    print(f"{mode:<9} {path[:32]:<32} {name:<8}: {rps:8.0f} req/s  "
+                          f"p50 {p50 * 1e3:7.2f} ms  {size:9.0f} bytes")
+            if args.plot_clients:
+                rps, p50, p99 = load_during_plot_polls(args.port, args.clients, args.plot_clients, args.seconds)
+                label = f'/api/state +{args.plot_clients} plot polls'
+                print(f"{mode:<9} {label:<41}: {rps:8.0f} req/s  "
+                      f"p50 {p50 * 1e3:7.2f} ms  p99 {p99 * 1e3:7.2f} ms")
+        finally:
+            proc.terminate()
+            proc.wait()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+FSM.data 读取基准：deque(maxlen=240) + list 快照 + statistics vs MetricStore 视图
+
+按 DataRecorder 每次 record() 的读取方式测量：7 个指标各做一次全窗 mean/std/min/max，
+再对 br/sdnn/hr/lf_hf 取最近 30 个样本的均值（旧代码在评分和画图时各做一遍）。
+
+用法（在仓库根目录）：
+    python -m benchmarks.bench_metric_store --repeat 2000
+"""
+import argparse
+import random
+import statistics
+import time
+from collections import deque
+
+from fsm import FSM_METRICS
+from metric_store import MetricStore
+
+
+def legacy_read(data):
+    record = {}
+    for metric in FSM_METRICS:
+        values = [x for x in list(data[metric]) if x is not None and isinstance(x, (int, float))]
+        if values:
+            record[metric] = (statistics.mean(values), statistics.stdev(values), min(values), max(values))
+    for _ in range(2):
+        means = [statistics.mean(list(data[m])[-30:]) for m in ('br', 'sdnn', 'hr', 'lf_hf')]
+    return record, means
+
+
+def store_read(store):
+    record = {metric: store.stats(metric) for metric in FSM_METRICS}
+    for _ in range(2):
+        means = [store.mean(m, 30) for m in ('br', 'sdnn', 'hr', 'lf_hf')]
+    return record, means
+
+
+def bench(fn, arg, repeat):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn(arg)
+    return (time.perf_counter() - t0) / repeat
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--repeat', type=int, default=2000)
+    ap.add_argument('--capacity', type=int, default=240)
+    args = ap.parse_args()
+
+    rng = random.Random(0)
+    data = {m: deque(maxlen=args.capacity) for m in FSM_METRICS}
+    store = MetricStore(FSM_METRICS, capacity=args.capacity)
+    for i in range(args.capacity * 2):
+        for m in FSM_METRICS:
+            v = rng.uniform(40, 90)
+            data[m].append(v)
+            store.append(m, v, ts=i)
+
+    legacy_rec, legacy_means = legacy_read(data)
+    store_rec, store_means = store_read(store)
+    err = max(abs(a - b) for a, b in zip(legacy_means, store_means))
+    err = max([err] + [abs(legacy_rec[m][1] - store_rec[m]['std']) for m in FSM_METRICS])
+
+    legacy_us = bench(legacy_read, data, args.repeat) * 1e6
+    store_us = bench(store_read, store, args.repeat) * 1e6
+    print(f"capacity={args.capacity} metrics={len(FSM_METRICS)}")
+    print(f"deque + statistics : {legacy_us:9.1f} us/record")
+    print(f"MetricStore        : {store_us:9.1f} us/record")
+    print(f"speedup            : {legacy_us / store_us:.1f}x")
+    print(f"max abs diff       : {err:.2e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+PPG 频域 HRV 基准：每秒整段 interp1d 重拟合（改动前的 PPG.HRV）vs 流式重采样
+
+模拟 BLE 每秒送来 3 个 RRI、rri 窗口为 480 个（BLE 默认 max_buffer_size=120），
+每秒分别按旧路径和 PPG 新路径计算一次频域指标，统计每秒 CPU 时间和 LF/HF 差异。
+
+用法（在仓库根目录）：
+    python -m benchmarks.bench_ppg_hrv --seconds 600
+"""
+import argparse
+import contextlib
+import io
+import time
+from collections import deque
+from types import SimpleNamespace
+
+import numpy as np
+from scipy.interpolate import interp1d
+from scipy.signal import welch
+
+from ppg import PPG
+
+
+def legacy_hrv_frequency(rr_intervals):
+    """
+    改动前 PPG.HRV 的频域计算：每次对整段 RRI 重新构造 interp1d 三次插值，
+    现算 Welch 参数，用梯形积分求频带功率
+    """
+    rr_s = np.diff(np.cumsum(rr_intervals)) / 1000
+    rr_time_s = np.cumsum(rr_s) - rr_s[0]
+    interp_func = interp1d(rr_time_s, rr_s, kind='cubic', fill_value='extrapolate')
+    resampled_rr = interp_func(np.arange(rr_time_s[0], rr_time_s[-1], 1 / 4.0))
+    nperseg = min(256, max(8, len(resampled_rr) // 4))
+    noverlap = min(128, nperseg // 2)
+    freqs, psd = welch(x=resampled_rr, fs=4.0, nperseg=nperseg, noverlap=noverlap)
+
+    def band_power(band):
+        idx = np.where((freqs >= band[0]) & (freqs < band[1]))[0]
+        if len(idx) < 2:
+            return 0
+        p, f = psd[idx], freqs[idx]
+        return float(np.sum((p[1:] + p[:-1]) * np.diff(f)) / 2)
+
+    return {'HRV_LF': band_power((0.04, 0.15)), 'HRV_HF': band_power((0.15, 0.4))}
+
+
+def synthetic_rri(n, seed=0):
+    """带 LF/HF 调制的 RRI 序列 (ms)"""
+    rng = np.random.default_rng(seed)
+    k = np.arange(n)
+    return 850 + 40 * np.sin(2 * np.pi * 0.085 * k) + 20 * np.sin(2 * np.pi * 0.21 * k) + rng.normal(0, 10, n)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--seconds', type=int, default=600)
+    ap.add_argument('--buffer', type=int, default=480, help='rri 窗口长度')
+    args = ap.parse_args()
+
+    rri = synthetic_rri(args.seconds * 3)
+    # 只需要 rri 队列和累计计数，不连接真实设备
+    ble = SimpleNamespace(rri=deque(maxlen=args.buffer), rri_total=0)
+    ble.snapshot_rri = lambda: (list(ble.rri), ble.rri_total)
+    ppg = PPG(ble)
+
+    old_t, new_t = [], []
+    lf_err, hf_err = [], []
+    for sec in range(args.seconds):
+        ble.rri.extend(rri[sec * 3:sec * 3 + 3])
+        ble.rri_total += 3
+        if len(ble.rri) < 10:
+            continue
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            t0 = time.thread_time()
+            old = legacy_hrv_frequency(np.array(ble.rri, dtype=float))
+            t1 = time.thread_time()
+            rr_intervals, total = ppg._snapshot_rri()
+            ppg._feed_resampler(rr_intervals, total)
+            new = ppg._hrv_frequency_streaming(rr_intervals)
+            t2 = time.thread_time()
+        old_t.append(t1 - t0)
+        new_t.append(t2 - t1)
+        if old['HRV_LF'] > 0 and old['HRV_HF'] > 0:
+            lf_err.append(abs(new['HRV_LF'] - old['HRV_LF']) / old['HRV_LF'])
+            hf_err.append(abs(new['HRV_HF'] - old['HRV_HF']) / old['HRV_HF'])
+
+    # 只统计窗口填满之后的稳定阶段
+    full = max(0, args.buffer // 3 - 3)
+    old_us, new_us = np.mean(old_t[full:]) * 1e6, np.mean(new_t[full:]) * 1e6
+    print(f"seconds={args.seconds} buffer={args.buffer}")
+    print(f"interp1d full refit : {old_us:9.1f} us CPU/s")
+    print(f"streaming resampler : {new_us:9.1f} us CPU/s")
+    print(f"speedup             : {old_us / new_us:.1f}x")
+    print(f"LF rel err: median {np.median(lf_err):.4f}  p95 {np.percentile(lf_err, 95):.4f}  max {max(lf_err):.4f}")
+    print(f"HF rel err: median {np.median(hf_err):.4f}  p95 {np.percentile(hf_err, 95):.4f}  max {max(hf_err):.4f}")
+
+
+if __name__ == '__main__':
+    main()
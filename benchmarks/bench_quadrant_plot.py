@@ -0,0 +1,63 @@
+"""
+情绪象限图渲染基准：每次新建 Figure 整图绘制 vs 复用 Figure + blit 背景
+
+同时给出评分线程在 DataRecorder._plot_deviation 中实际花费的时间（只提交快照，不等渲染）。
+
+用法（在仓库根目录）：
+    python -m benchmarks.bench_quadrant_plot --frames 20
+"""
+import argparse
+import random
+import time
+
+import numpy as np
+
+from quadrant_plot import QuadrantRenderer
+
+
+def frames(n, seed=0):
+    rng = random.Random(seed)
+    history = []
+    for _ in range(n):
+        point = (rng.uniform(-2.5, 2.5), rng.uniform(-2.5, 2.5))
+        history = (history + [point])[-10:]
+        yield point[0], point[1], list(history), (rng.uniform(12, 20), rng.uniform(30, 60),
+                                                  rng.uniform(60, 80), rng.uniform(1, 4))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--frames', type=int, default=20)
+    args = ap.parse_args()
+
+    full_t = []
+    for valence, arousal, history, means in frames(args.frames):
+        t0 = time.perf_counter()
+        QuadrantRenderer()._render(valence, arousal, history, means, None)
+        full_t.append(time.perf_counter() - t0)
+
+    renderer = QuadrantRenderer()
+    renderer._render(0, 0, [], (0, 0, 0, 0), None)  # 预热：建图并缓存背景
+    blit_t = []
+    for valence, arousal, history, means in frames(args.frames):
+        t0 = time.perf_counter()
+        renderer._render(valence, arousal, history, means, None)
+        blit_t.append(time.perf_counter() - t0)
+
+    async_renderer = QuadrantRenderer(always=True)
+    submit_t = []
+    for valence, arousal, history, means in frames(args.frames):
+        t0 = time.perf_counter()
+        async_renderer.submit(valence, arousal, history, means)
+        submit_t.append(time.perf_counter() - t0)
+    async_renderer.latest_png(timeout=30)
+
+    full_ms, blit_ms = np.median(full_t) * 1e3, np.median(blit_t) * 1e3
+    print(f"frames={args.frames}")
+    print(f"new Figure per frame : {full_ms:8.1f} ms")
+    print(f"reused Figure + blit : {blit_ms:8.1f} ms  ({full_ms / blit_ms:.1f}x)")
+    print(f"scoring thread submit: {np.median(submit_t) * 1e6:8.1f} us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+"""
+雷达帧解析微基准：旧的 bytearray 切片解析 vs RadarFrameParser
+
+用法（在仓库根目录）：
+    python -m benchmarks.bench_radar_parser                   # 使用合成字节流
+    python -m benchmarks.bench_radar_parser --input dump.bin  # 使用串口录制的原始字节流
+
+原始字节流可以直接把 ser.read() 的返回值追加写入文件得到。
+"""
+import argparse
+import random
+import struct
+import time
+
+from radar_parser import RadarFrameParser, build_frame, calc_checksum
+
+
+def legacy_parse(chunks):
+    """
+    旧版 MicRadar.read_line 的解析逻辑：每处理一帧都对剩余缓冲区做一次切片拷贝，
+    并且每次都从缓冲区开头重新查找帧头。这里一直解析到需要等待新数据为止，
+    保证两种实现处理的帧数一致，只比较解析本身的开销。
+    """
+    buffer = bytearray()
+    frames = 0
+    for chunk in chunks:
+        buffer.extend(chunk)
+        while True:
+            idx = buffer.find(b'\x53\x59')
+            if idx < 0 or len(buffer) < idx + 8:
+                break
+            ctrl, cmd, length = struct.unpack_from('>BBH', buffer, idx + 2)
+            total_len = 2 + 1 + 1 + 2 + length + 1 + 2
+            if len(buffer) < idx + total_len:
+                break
+            frame = buffer[idx:idx + total_len]
+            if frame[-2:] != b'\x54\x43':
+                buffer = buffer[idx + 1:]
+                continue
+            core = frame[: 2 + 1 + 1 + 2 + length]
+            if calc_checksum(core) != frame[2 + 1 + 1 + 2 + length]:
+                buffer = buffer[idx + 1:]
+                continue
+            payload = frame[2 + 1 + 1 + 2: 2 + 1 + 1 + 2 + length]
+            _ = payload[0] if length else None
+            frames += 1
+            buffer = buffer[idx + total_len:]
+    return frames
+
+
+def ring_parse(chunks):
+    parser = RadarFrameParser()
+    frames = 0
+    for chunk in chunks:
+        for ctrl, cmd, payload in parser.feed(chunk):
+            _ = payload[0] if len(payload) else None
+            frames += 1
+    return frames
+
+
+def synthetic_stream(n_frames, noise=0.05, seed=0):
+    """按雷达实际输出比例合成 HR/BR/体动/心率波形帧，并随机插入噪声字节"""
+    rng = random.Random(seed)
+    kinds = [
+        (0x85, 0x02, 1),  # 心率
+        (0x81, 0x02, 1),  # 呼吸率
+        (0x80, 0x03, 1),  # 体动
+        (0x85, 0x05, 5),  # 心率波形
+    ]
+    out = bytearray()
+    for _ in range(n_frames):
+        ctrl, cmd, n = rng.choice(kinds)
+        out += build_frame(ctrl, cmd, bytes(rng.randrange(256) for _ in range(n)))
+        if rng.random() < noise:
+            out += bytes(rng.randrange(256) for _ in range(rng.randint(1, 6)))
+    return bytes(out)
+
+
+def split_chunks(data, max_chunk, seed=0):
+    """模拟 ser.read(in_waiting) 每次读到的长度不一"""
+    rng = random.Random(seed)
+    chunks = []
+    i = 0
+    while i < len(data):
+        n = rng.randint(1, max_chunk)
+        chunks.append(data[i:i + n])
+        i += n
+    return chunks
+
+
+def run(name, fn, chunks, repeat):
+    best = None
+    frames = 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        frames = fn(chunks)
+        dt = time.perf_counter() - t0
+        best = dt if best is None else min(best, dt)
+    print(f"{name:<8} frames={frames:<8} time={best * 1000:8.2f} ms  {frames / best:12.0f} frames/s")
+    return frames, best
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--input', action='append', help='串口录制的原始字节流文件，可重复指定')
+    ap.add_argument('--frames', type=int, default=50000, help='合成帧数（未指定 --input 时）')
+    ap.add_argument('--chunk', type=int, default=256, help='单次读取的最大字节数')
+    ap.add_argument('--repeat', type=int, default=5)
+    args = ap.parse_args()
+
+    if args.input:
+        data = b''.join(open(path, 'rb').read() for path in args.input)
+    else:
+        data = synthetic_stream(args.frames)
+    chunks = split_chunks(data, args.chunk)
+    print(f"stream: {len(data)} bytes in {len(chunks)} chunks (max {args.chunk} B)")
+
+    legacy_frames, legacy_t = run('legacy', legacy_parse, chunks, args.repeat)
+    ring_frames, ring_t = run('ring', ring_parse, chunks, args.repeat)
+    if legacy_frames != ring_frames:
+        print(f"[WARNING] frame count mismatch: legacy={legacy_frames}, ring={ring_frames}")
+    print(f"speedup: {legacy_t / ring_t:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
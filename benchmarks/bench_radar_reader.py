@@ -0,0 +1,77 @@
+"""
+雷达读线程基准：legacy（0.1s 超时轮询）vs event（select 阻塞）
+
+用伪终端（pty）模拟雷达串口，按固定帧率写入 HR/BR/体动帧，统计两种读模式下
+读线程每秒唤醒次数和每帧 CPU 时间。仅支持 Linux/macOS。
+
+用法（在仓库根目录）：
+    python -m benchmarks.bench_radar_reader --seconds 10 --rate 20
+"""
+import argparse
+import os
+import random
+import threading
+import time
+import tty
+
+import serial
+
+from micRadar3 import MicRadar
+from radar_parser import build_frame
+
+
+def feeder(master_fd, rate, stop, seed=0):
+    """以 rate 帧/秒 的速度向 pty 主端写入帧，模拟雷达输出节奏"""
+    rng = random.Random(seed)
+    kinds = [(0x85, 0x02), (0x81, 0x02), (0x80, 0x03)]
+    interval = 1.0 / rate
+    next_t = time.monotonic()
+    while not stop.is_set():
+        ctrl, cmd = rng.choice(kinds)
+        os.write(master_fd, build_frame(ctrl, cmd, bytes([rng.randint(40, 120)])))
+        next_t += interval
+        delay = next_t - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+def run_mode(mode, seconds, rate):
+    master_fd, slave_fd = os.openpty()
+    tty.setraw(master_fd)
+    slave_name = os.ttyname(slave_fd)
+
+    radar = MicRadar(port=slave_name, read_mode=mode)
+    # 跳过 connect() 里的开启命令握手，直接打开伪串口
+    radar.ser = serial.Serial(slave_name, radar.baudrate, timeout=0.1)
+    radar.handle_frame = lambda ctrl, cmd, payload: None  # 不打印，只测读线程本身
+
+    stop = threading.Event()
+    t = threading.Thread(target=feeder, args=(master_fd, rate, stop), daemon=True)
+    radar.start_continuous_reading()
+    t.start()
+    time.sleep(seconds)
+    stop.set()
+    t.join()
+    stats = radar.get_reader_stats()
+    radar.disconnect()
+    os.close(master_fd)
+    os.close(slave_fd)
+    return stats
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--seconds', type=float, default=10.0)
+    ap.add_argument('--rate', type=float, default=20.0, help='模拟雷达输出帧率（帧/秒）')
+    ap.add_argument('--modes', nargs='+', default=['legacy', 'event'])
+    args = ap.parse_args()
+
+    for mode in args.modes:
+        s = run_mode(mode, args.seconds, args.rate)
+        cpu_per_frame = f"{s['cpu_per_frame_us']:.1f} us" if s['cpu_per_frame_us'] is not None else 'n/a'
+        print(f"{s['mode']:<7} frames={s['frames']:<6} wakeups/s={s['wakeups_per_s']:8.1f}  "
+              f"cpu={s['cpu_s'] * 1000:7.1f} ms  cpu/frame={cpu_per_frame}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+传感器到界面的延迟：FSM 1 秒轮询 vs SampleBus 发布/订阅
+
+模拟雷达以随机间隔（平均 --rate 次/秒）产出心率，分别测量：
+- polling：原 FSM.state_monitor 的做法，每 --poll 秒读取一次设备最新属性再推给可视化器，
+  延迟 = 读取时刻 - 值产生时刻；同一个值可能被重复读取（统计为 duplicates）
+- bus：发布到 SampleBus，可视化器订阅者（与 DataVisualizer.attach_bus 相同的 batch_window）消费，
+  延迟 = 消费时刻 - 发布时刻
+
+用法（在仓库根目录）：
+    python -m benchmarks.bench_sample_bus --seconds 10
+"""
+import argparse
+import random
+import threading
+import time
+
+from sample_bus import SampleBus
+
+
+def producer(rate, stop, on_value, seed=0):
+    rng = random.Random(seed)
+    while not stop.is_set():
+        time.sleep(rng.expovariate(rate))
+        on_value(rng.randint(55, 95), time.monotonic())
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))] if values else float('nan')
+
+
+def report(name, latencies, extra=''):
+    ms = [x * 1000 for x in latencies]
+    print(f"{name:<8} n={len(ms):<5} p50={percentile(ms, 0.5):7.1f} ms  p95={percentile(ms, 0.95):7.1f} ms  "
+          f"max={max(ms) if ms else float('nan'):7.1f} ms  {extra}")
+
+
+def run_polling(seconds, rate, poll):
+    latest = {'value': None, 'mono': None}
+    stop = threading.Event()
+    t = threading.Thread(target=producer, args=(rate, stop, lambda v, m: latest.update(value=v, mono=m)),
+                         daemon=True)
+    t.start()
+    latencies, seen, duplicates = [], set(), 0
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        time.sleep(poll)
+        if latest['mono'] is None:
+            continue
+        if latest['mono'] in seen:
+            duplicates += 1
+            continue
+        seen.add(latest['mono'])
+        latencies.append(time.monotonic() - latest['mono'])
+    stop.set()
+    t.join()
+    report('polling', latencies, f'duplicates={duplicates}')
+
+
+def run_bus(seconds, rate, batch_window):
+    bus = SampleBus()
+    sub = bus.subscribe('visualizer')
+    stop = threading.Event()
+    t = threading.Thread(target=producer, args=(rate, stop, lambda v, m: bus.publish('hr', v, 'radar')),
+                         daemon=True)
+    t.start()
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        sub.get(timeout=0.5, batch_window=batch_window)
+    stop.set()
+    t.join()
+    s = sub.latency_stats()
+    print(f"{'bus':<8} n={s['count']:<5} p50={s['p50'] * 1000:7.1f} ms  p95={s['p95'] * 1000:7.1f} ms  "
+          f"max={s['max'] * 1000:7.1f} ms  dropped={sub.dropped}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--seconds', type=float, default=10.0)
+    ap.add_argument('--rate', type=float, default=1.0, help='平均每秒产生的样本数')
+    ap.add_argument('--poll', type=float, default=1.0, help='轮询周期（秒）')
+    ap.add_argument('--batch-window', type=float, default=0.05)
+    args = ap.parse_args()
+
+    run_polling(args.seconds, args.rate, args.poll)
+    run_bus(args.seconds, args.rate, args.batch_window)
+
+
+if __name__ == '__main__':
+    main()
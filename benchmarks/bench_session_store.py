@@ -0,0 +1,91 @@
+"""
+评分记录存储基准：personal_data.csv（每次重开文件 + DictWriter）vs SessionStore 二进制分段
+
+模拟 --days 天、每 5 秒一条的评分记录，比较单条写入耗时、磁盘占用，以及按时间随机定位一条记录的耗时
+（CSV 需要整文件解析后查找，SessionStore 选中当天分段后在时间戳列上二分）。
+
+用法（在仓库根目录）：
+    python -m benchmarks.bench_session_store --days 3
+"""
+import argparse
+import csv
+import os
+import random
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+
+from session_store import CSV_FIELDS, STAT_COLUMNS, TIME_FORMAT, SessionStore
+
+
+def legacy_save_to_csv(save_path, record):
+    """改动前 DataRecorder._save_to_csv 的写法"""
+    write_header = not os.path.exists(save_path)
+    with open(save_path, 'a', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDS)
+        if write_header:
+            writer.writeheader()
+        writer.writerow({k: ('' if v is None else v) for k, v in record.items()})
+
+
+def legacy_lookup(save_path, ts):
+    with open(save_path, 'r', encoding='utf-8') as csvfile:
+        rows = list(csv.DictReader(csvfile))
+    key = datetime.fromtimestamp(ts).strftime(TIME_FORMAT)
+    best = None
+    for row in rows:
+        if row['timestamp'] <= key:
+            best = row
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--days', type=float, default=3)
+    ap.add_argument('--lookups', type=int, default=20)
+    args = ap.parse_args()
+
+    rng = random.Random(0)
+    n = int(args.days * 86400 / 5)
+    start = time.time() - args.days * 86400
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, 'personal_data.csv')
+        store = SessionStore(os.path.join(tmp, 'sessions'))
+        csv_t, bin_t = [], []
+        for i in range(n):
+            ts = start + i * 5
+            record = {'timestamp': datetime.fromtimestamp(ts).strftime(TIME_FORMAT), 'data_source': 'both'}
+            for column in STAT_COLUMNS:
+                record[column] = round(rng.uniform(0, 120), 3)
+            t0 = time.perf_counter()
+            legacy_save_to_csv(csv_path, record)
+            t1 = time.perf_counter()
+            store.append(record, ts=ts)
+            t2 = time.perf_counter()
+            csv_t.append(t1 - t0)
+            bin_t.append(t2 - t1)
+        store.close()
+
+        csv_size = os.path.getsize(csv_path)
+        bin_size = sum(os.path.getsize(os.path.join(store.directory, f'{d}.bin')) for d in store.days())
+
+        targets = [start + rng.uniform(0, args.days * 86400) for _ in range(args.lookups)]
+        t0 = time.perf_counter()
+        for ts in targets:
+            legacy_lookup(csv_path, ts)
+        csv_lookup = (time.perf_counter() - t0) / len(targets)
+        t0 = time.perf_counter()
+        for ts in targets:
+            store.at(ts)
+        bin_lookup = (time.perf_counter() - t0) / len(targets)
+
+    print(f"records={n} ({args.days} days @ 5 s)")
+    print(f"append  : csv {np.median(csv_t) * 1e6:8.1f} us   store {np.median(bin_t) * 1e6:8.1f} us")
+    print(f"on disk : csv {csv_size / 1024:8.1f} KiB  store {bin_size / 1024:8.1f} KiB ({csv_size / bin_size:.1f}x smaller)")
+    print(f"lookup  : csv {csv_lookup * 1e3:8.2f} ms   store {bin_lookup * 1e3:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
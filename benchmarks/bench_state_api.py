@@ -0,0 +1,63 @@
+"""
+/api/state 轮询基准：每次全量 vs ?since=<seq> 增量 vs If-None-Match 304
+
+模拟前端每秒轮询一次、期间后端 update_data 一次（窗口已满 max_data_points 个点），
+用 Flask test client 统计单次请求的响应字节数和耗时。
+
+用法（在仓库根目录）：
+    python -m benchmarks.bench_state_api --polls 500
+"""
+import argparse
+import contextlib
+import io
+import time
+
+import numpy as np
+
+from data_visualizer import DataVisualizer
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--polls', type=int, default=500)
+    ap.add_argument('--points', type=int, default=100, help='max_data_points')
+    args = ap.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        viz = DataVisualizer(max_data_points=args.points)
+    client = viz.app.test_client()
+
+    def tick(i):
+        viz.update_data({'hr': 60 + i % 20, 'br': 15, 'LF': 1.2, 'HF': 0.8, 'SDNN': 45, 'spo2': 98})
+
+    for i in range(args.points):
+        tick(i)
+
+    results = {}
+    seq = client.get('/api/state').get_json()['seq']
+    etag = None
+    for mode in ('full', 'since', '304'):
+        sizes, times = [], []
+        for i in range(args.polls):
+            if mode != '304':
+                tick(i)
+            t0 = time.perf_counter()
+            if mode == 'full':
+                resp = client.get('/api/state')
+            elif mode == 'since':
+                resp = client.get(f'/api/state?since={seq}')
+                seq = resp.get_json()['seq']
+            else:
+                resp = client.get('/api/state', headers={'If-None-Match': etag} if etag else {})
+                etag = resp.headers.get('ETag')
+            times.append(time.perf_counter() - t0)
+            sizes.append(len(resp.data))
+        results[mode] = (np.median(sizes), np.median(times))
+
+    print(f"polls={args.polls} max_data_points={args.points}")
+    for mode, (size, t) in results.items():
+        print(f"{mode:<6}: {size:8.0f} bytes  {t * 1e6:8.1f} us/request")
+
+
+if __name__ == '__main__':
+    main()
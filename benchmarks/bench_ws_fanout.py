@@ -0,0 +1,106 @@
+"""
+SocketIO 状态流扇出基准：N 个模拟客户端订阅 state_update，测量 update_data 到各客户端收到的延迟
+
+在本机随机端口启动 DataVisualizer，按 --rate 调用 update_data，
+每个客户端收到消息后立即确认（--slow 个客户端在确认前额外等待 --slow-delay 秒，模拟慢客户端），
+统计扇出延迟（p50/p95/max）、每个客户端收到的消息数和单条消息最多合并的样本数。
+
+需要 python-socketio 的同步客户端依赖：pip install "python-socketio[client]"
+
+用法（在仓库根目录）：
+    python -m benchmarks.bench_ws_fanout --clients 20 --seconds 10
+"""
+import argparse
+import contextlib
+import io
+import logging
+import socket
+import time
+
+import numpy as np
+import socketio
+
+from data_visualizer import DataVisualizer
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+class SimClient:
+    def __init__(self, url, update_times, delay=0.0):
+        self.update_times = update_times
+        self.delay = delay
+        self.latencies = []
+        self.messages = 0
+        self.max_rows = 0
+        self.sio = socketio.Client()
+        self.sio.on('state_update', self.on_state)
+        self.sio.connect(url, transports=['websocket'])
+        self.sio.emit('subscribe_state', {})
+
+    def on_state(self, payload):
+        now = time.time()
+        self.messages += 1
+        self.max_rows = max(self.max_rows, len(payload['time']))
+        sent = self.update_times.get(payload['seq'])
+        if sent is not None:
+            self.latencies.append(now - sent)
+        if self.delay:
+            time.sleep(self.delay)
+        # 返回值即确认（ack），服务端收到后才会发送下一条
+        return True
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--clients', type=int, default=20)
+    ap.add_argument('--seconds', type=float, default=10)
+    ap.add_argument('--rate', type=float, default=5.0, help='每秒 update_data 次数')
+    ap.add_argument('--slow', type=int, default=2, help='慢客户端个数')
+    ap.add_argument('--slow-delay', type=float, default=1.0)
+    args = ap.parse_args()
+
+    # 关掉 werkzeug 的访问日志，避免混进结果输出
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    port = free_port()
+    with contextlib.redirect_stdout(io.StringIO()):
+        viz = DataVisualizer(port=port)
+        viz.start_server()
+    time.sleep(1.0)
+
+    update_times = {}
+    url = f'http://127.0.0.1:{port}'
+    clients = [SimClient(url, update_times, args.slow_delay if i < args.slow else 0.0)
+               for i in range(args.clients)]
+    time.sleep(0.5)
+
+    deadline = time.monotonic() + args.seconds
+    i = 0
+    while time.monotonic() < deadline:
+        update_times[viz.data_seq + 1] = time.time()
+        viz.update_data({'hr': 60 + i % 20, 'br': 15, 'LF': 1.2, 'HF': 0.8, 'SDNN': 45, 'spo2': 98})
+        i += 1
+        time.sleep(1.0 / args.rate)
+    time.sleep(args.slow_delay + 0.5)
+
+    for c in clients:
+        c.sio.disconnect()
+    viz.stop_server()
+
+    fast = [c for c in clients if not c.delay]
+    slow = [c for c in clients if c.delay]
+    print(f"clients={args.clients} (slow={args.slow}) updates={i} rate={args.rate}/s")
+    for name, group in (('fast', fast), ('slow', slow)):
+        if not group:
+            continue
+        lat = np.concatenate([c.latencies for c in group]) * 1e3
+        print(f"{name}: p50 {np.percentile(lat, 50):7.1f} ms  p95 {np.percentile(lat, 95):7.1f} ms  "
+              f"max {lat.max():7.1f} ms  messages/client {np.mean([c.messages for c in group]):6.1f}  "
+              f"max rows/message {max(c.max_rows for c in group)}")
+
+
+if __name__ == '__main__':
+    main()
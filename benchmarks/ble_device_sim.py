@@ -0,0 +1,111 @@
+"""
+可穿戴设备（BLE 外设）的主机端模拟器，不需要硬件即可生成两种格式的通知
+
+- 单帧格式（v1）：每个样本一次通知，10 字节帧 [FF] + 9 字节样本
+- 批量格式（v2）：收到 B=N 后每次通知打包 N 个样本，带序号和校验和（格式见 ble.py 的 BATCH_HEADER）
+
+SimulatedWearable 按收到的指令（B=N / p=1 / p=0）切换格式，并可按概率丢弃通知（模拟设备端缓冲区溢出，序号照常递增）。
+LinkModel 按 LE 1M PHY 估算一次通知占用的空口时间，以及给定连接间隔下每秒最多能送达的样本数。
+"""
+import math
+
+import numpy as np
+
+from ble import (ATT_NOTIFY_OVERHEAD, BATCH_HEADER, BATCH_VERSION, FRAME_DTYPE, FRAME_HEADER, SAMPLE_DTYPE,
+                 batch_capacity)
+
+
+def encode_frames(samples):
+    """单帧格式：每个样本一帧，返回 bytes 列表（一帧一次通知）"""
+    frames = np.zeros(len(samples), dtype=FRAME_DTYPE)
+    frames['header'] = FRAME_HEADER
+    for name in SAMPLE_DTYPE.names:
+        frames[name] = samples[name]
+    data = frames.tobytes()
+    size = FRAME_DTYPE.itemsize
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def encode_batch(seq, samples):
+    """批量格式：一个包（一次通知）"""
+    body = bytes([BATCH_HEADER, BATCH_VERSION, seq & 0xFF, (seq >> 8) & 0xFF, len(samples)]) + samples.tobytes()
+    return body + bytes([sum(body) & 0xFF])
+
+
+class SimulatedWearable:
+    """模拟设备：handle_command 接收主机写入的指令，notifications 生成接下来 n 个样本对应的通知"""
+
+    def __init__(self, mtu=247, loss=0.0, seed=0):
+        self.mtu = mtu
+        self.loss = loss
+        self.rng = np.random.default_rng(seed)
+        self.batch_size = 0
+        self.running = False
+        self.seq = 0
+        self.dropped = 0
+
+    def handle_command(self, command):
+        text = command.decode('ascii').strip()
+        key, _, value = text.partition('=')
+        if key == 'B':
+            # 超出 MTU 能容纳的样本数时按上限打包
+            self.batch_size = min(int(value), batch_capacity(self.mtu))
+        elif key == 'p':
+            self.running = value == '1'
+            self.seq = 0
+
+    def samples(self, n):
+        samples = np.zeros(n, dtype=SAMPLE_DTYPE)
+        samples['hr'] = self.rng.integers(55, 120, n)
+        samples['spo2'] = self.rng.integers(94, 100, n)
+        samples['sdnn'] = self.rng.integers(20, 80, n)
+        samples['rri'] = self.rng.integers(0, 256, (n, 3))  # 数据字节中也会出现 0xFE / 0xFF
+        samples['gyro'] = self.rng.integers(0, 4, n)
+        return samples
+
+    def notifications(self, n):
+        """返回 (实际送达主机的通知列表, 这 n 个样本本身)"""
+        samples = self.samples(n)
+        if self.batch_size > 1:
+            packets = []
+            for i in range(0, n, self.batch_size):
+                packets.append(encode_batch(self.seq, samples[i:i + self.batch_size]))
+                self.seq = (self.seq + 1) & 0xFFFF
+        else:
+            packets = encode_frames(samples)
+        if self.loss:
+            keep = self.rng.random(len(packets)) >= self.loss
+            self.dropped += int(len(packets) - keep.sum())
+            packets = [p for p, k in zip(packets, keep) if k]
+        return packets, samples
+
+
+class LinkModel:
+    """
+    LE 1M PHY 空口模型（未加密）
+    每个 LL 数据包：前导 1 + 接入地址 4 + LL 头 2 + 载荷 + CRC 3 字节，每字节 8 µs；
+    外设每发一个包，中心设备回一个空包（10 字节），中间各隔 150 µs（T_IFS）。
+    ATT 通知 = 载荷 + ATT 头 3 + L2CAP 头 4，超过 ll_payload（默认 27，未启用 DLE）时分片。
+    """
+
+    def __init__(self, conn_interval=0.030, max_packets_per_event=4, ll_payload=27):
+        self.conn_interval = conn_interval
+        self.max_packets_per_event = max_packets_per_event
+        self.ll_payload = ll_payload
+
+    def ll_packets(self, notify_len):
+        return math.ceil((notify_len + ATT_NOTIFY_OVERHEAD + 4) / self.ll_payload)
+
+    def airtime(self, notify_len):
+        """一次通知占用的空口时间（秒）"""
+        l2cap = notify_len + ATT_NOTIFY_OVERHEAD + 4
+        packets = self.ll_packets(notify_len)
+        peripheral_bytes = l2cap + packets * (1 + 4 + 2 + 3)
+        return (peripheral_bytes * 8 + packets * (10 * 8 + 2 * 150)) * 1e-6
+
+    def max_samples_per_second(self, notify_len, samples_per_notify):
+        """连接间隔限制下每秒最多送达的样本数（分片可以跨连接事件继续发送）"""
+        packets = self.ll_packets(notify_len)
+        per_packet = self.airtime(notify_len) / packets
+        per_event = min(self.max_packets_per_event, int(self.conn_interval // per_packet))
+        return per_event / packets * samples_per_notify / self.conn_interval
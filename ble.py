@@ -5,6 +5,260 @@ from bleak import BleakScanner, BleakClient
 import time
 import subprocess
 import os
+import json
+
+import numpy as np
+
+# 数据帧：[包头 FF] [HR] [SpO2] [SDNN] [RRI x3] [陀螺仪] [保留 x2]，共 10 字节
+FRAME_HEADER = 0xFF
+FRAME_DTYPE = np.dtype([
+    ('header', 'u1'),
+    ('hr', 'u1'),
+    ('spo2', 'u1'),
+    ('sdnn', 'u1'),
+    ('rri', 'u1', (3,)),
+    ('gyro', 'u1'),
+    ('reserved', 'u1', (2,)),
+])
+FRAME_SIZE = FRAME_DTYPE.itemsize
+HR_VALID_RANGE = (50, 190)  # 超出该范围的心率记为 0
+# 批量包（协议 v2，发送 B=N 协商后设备每次通知打包 N 个样本）：
+# [包头 FE] [版本 02] [序号 u16 小端] [样本数 n] [n x 9 字节样本（与上面的帧去掉包头相同）] [校验和]
+# 校验和为之前所有字节之和的低 8 位；序号每包加 1（0xFFFF 后回到 0），用于统计丢包
+BATCH_HEADER = 0xFE
+BATCH_VERSION = 2
+SAMPLE_DTYPE = np.dtype([(name, FRAME_DTYPE.fields[name][0]) for name in FRAME_DTYPE.names[1:]])
+SAMPLE_SIZE = SAMPLE_DTYPE.itemsize
+BATCH_PREFIX_SIZE = 5
+BATCH_OVERHEAD = BATCH_PREFIX_SIZE + 1  # 包头 + 版本 + 序号 + 样本数 + 校验和
+ATT_NOTIFY_OVERHEAD = 3  # ATT 通知头，单个通知最多 MTU - 3 字节
+BATCH_SIZE = 0  # 默认不启用批量模式（样本按 1 Hz 到达时，N 个一包会带来 N 秒延迟）
+# 心率查表：字节值 -> 记录值（超出 HR_VALID_RANGE 的为 0），小批量时比逐元素比较 + where 快
+_HR_TABLE = np.where((np.arange(256) < HR_VALID_RANGE[0]) | (np.arange(256) > HR_VALID_RANGE[1]),
+                     0, np.arange(256)).astype(np.uint8)
+
+
+def decode_frames(buffer, header_byte=FRAME_HEADER):
+    """
+    解析缓冲区中所有完整的数据帧
+
+    与逐帧解析的规则相同：找到包头后按 10 字节一帧连续向后解析，遇到不以包头开头的位置再重新查找包头。
+    帧对齐时（正常情况）整段只需一次 numpy.frombuffer，不逐帧切片。
+
+    Args:
+        buffer: 接收缓冲区（bytes / bytearray，不修改）
+        header_byte: 包头
+
+    Returns:
+        (frames, consumed): FRAME_DTYPE 结构化数组，以及应从缓冲区头部丢弃的字节数
+        （已解析的帧和包头之前的无效数据；末尾不足一帧的部分保留待下次拼接）
+    """
+    data = bytes(buffer)
+    header = bytes((header_byte,))
+    end = len(data)
+    chunks = []
+    pos = 0
+    while end - pos >= FRAME_SIZE:
+        start = data.find(header_byte, pos)
+        if start == -1:
+            # 没有包头，全部丢弃
+            pos = end
+            break
+        pos = start
+        count = (end - pos) // FRAME_SIZE
+        if count == 0:
+            break
+        # 只取从 pos 开始连续以包头开头的帧（按帧长步进取出各帧首字节，数开头连续的包头个数），
+        # 第一个错位的位置留给下一轮重新查找包头
+        heads = data[pos:pos + count * FRAME_SIZE:FRAME_SIZE]
+        count -= len(heads.lstrip(header))
+        chunks.append(np.frombuffer(data, dtype=FRAME_DTYPE, count=count, offset=pos))
+        pos += count * FRAME_SIZE
+    if not chunks:
+        return np.empty(0, dtype=FRAME_DTYPE), pos
+    return (chunks[0] if len(chunks) == 1 else np.concatenate(chunks)), pos
+
+
+# 指令队列：同一类指令（c=/v=/m=/s=...）未发出前被新的覆盖；相邻两次写入至少间隔 COMMAND_INTERVAL 秒
+COMMAND_INTERVAL = 0.5
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+
+
+def command_key(command):
+    """指令的合并键：'=' 之前的部分（b'c=1,2,3\n' -> 'c'）"""
+    text = command.decode('ascii') if isinstance(command, bytes) else command
+    return text.split('=', 1)[0].strip()
+
+
+class CommandHandle:
+    """放入 BLECommandQueue 的一条指令，调用方可据此查询或等待发送结果（不必等待）"""
+
+    PENDING = 'pending'
+    SENT = 'sent'
+    SUPERSEDED = 'superseded'  # 发出前被同类新指令覆盖
+    FAILED = 'failed'
+
+    def __init__(self, command, key, priority, seq):
+        self.command = command
+        self.key = key
+        self.priority = priority
+        self.seq = seq
+        self.status = self.PENDING
+        self.error = None
+        self._done = threading.Event()
+
+    def _finish(self, status, error=None):
+        self.status = status
+        self.error = error
+        self._done.set()
+
+    def done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        """等待指令发出或被覆盖/失败，返回是否已发出"""
+        self._done.wait(timeout)
+        return self.status == self.SENT
+
+    def __repr__(self):
+        return f"CommandHandle({self.command!r}, {self.status})"
+
+
+class BLECommandQueue:
+    """
+    BLE 控制指令队列，在 BLE 事件循环上由一个任务依次写入
+    - submit 线程安全、立即返回 CommandHandle，不阻塞调用线程
+    - 同一合并键的指令在发出前被新指令覆盖（只发最新的，并排到队尾以保持与其他指令的先后顺序）
+    - 优先级小的先发，同优先级按提交顺序
+    - 两次写入之间至少间隔 min_interval 秒；设备未连接时指令保留，连上后按队列发送
+    """
+
+    def __init__(self, write, is_connected, min_interval=COMMAND_INTERVAL):
+        """
+        Args:
+            write: 协程函数 write(command: bytes)，实际写入设备
+            is_connected: 返回设备当前是否已连接
+            min_interval: 相邻两次写入的最小间隔（秒）
+        """
+        self._write = write
+        self._is_connected = is_connected
+        self.min_interval = min_interval
+        self._pending = {}  # 合并键 -> CommandHandle（dict 保持插入顺序）
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._loop = None
+        self._task = None
+        self._wakeup = None
+        self._last_sent = None
+        self.sent = 0
+        self.coalesced = 0
+
+    def submit(self, command, priority=PRIORITY_NORMAL):
+        """放入一条指令（bytes 或 str），返回 CommandHandle"""
+        if isinstance(command, str):
+            command = command.encode('ascii')
+        key = command_key(command)
+        with self._lock:
+            self._seq += 1
+            handle = CommandHandle(command, key, priority, self._seq)
+            old = self._pending.pop(key, None)
+            self._pending[key] = handle
+        if old is not None:
+            self.coalesced += 1
+            old._finish(CommandHandle.SUPERSEDED)
+        self._notify()
+        return handle
+
+    def pending(self):
+        with self._lock:
+            return len(self._pending)
+
+    def attach(self, loop):
+        """在 BLE 事件循环上启动发送任务（需在该循环所在线程调用）"""
+        self._loop = loop
+        self._task = loop.create_task(self.run())
+
+    async def stop(self):
+        """取消发送任务（未发出的指令保留，重新 attach 后继续发送）"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self._wakeup = None
+
+    def _notify(self):
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(self._wake)
+            except RuntimeError:
+                pass  # 循环刚好关闭
+
+    def _wake(self):
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _pop(self):
+        with self._lock:
+            if not self._pending:
+                return None
+            handle = min(self._pending.values(), key=lambda h: (h.priority, h.seq))
+            del self._pending[handle.key]
+            return handle
+
+    async def run(self):
+        self._wakeup = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        while True:
+            self._wakeup.clear()
+            if not self.pending():
+                await self._wakeup.wait()
+                continue
+            if not self._is_connected():
+                await asyncio.sleep(0.5)
+                continue
+            # 间隔期间到达的同类指令仍可覆盖队列中的旧指令
+            if self._last_sent is not None:
+                delay = self._last_sent + self.min_interval - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            handle = self._pop()
+            if handle is None:
+                continue
+            try:
+                await self._write(handle.command)
+                self.sent += 1
+                handle._finish(CommandHandle.SENT)
+            except Exception as e:
+                print(f"[WARNING] 发送指令失败: {handle.command!r}: {e}")
+                handle._finish(CommandHandle.FAILED, e)
+            self._last_sent = loop.time()
+
+
+def decode_batch_packet(data):
+    """
+    解析一个批量包（一次通知恰好是一个完整的包）
+
+    Returns:
+        (seq, samples)：序号和 SAMPLE_DTYPE 结构化数组；不是合法的批量包（旧格式帧、长度或校验和不对）时返回 None
+    """
+    if len(data) < BATCH_OVERHEAD or data[0] != BATCH_HEADER or data[1] != BATCH_VERSION:
+        return None
+    count = data[4]
+    if len(data) != BATCH_OVERHEAD + count * SAMPLE_SIZE or sum(data[:-1]) & 0xFF != data[-1]:
+        return None
+    seq = data[2] | (data[3] << 8)
+    return seq, np.frombuffer(bytes(data), dtype=SAMPLE_DTYPE, count=count, offset=BATCH_PREFIX_SIZE)
+
+
+def batch_capacity(mtu):
+    """给定 ATT MTU，一次通知最多能装下的样本数"""
+    return max(0, min(255, (mtu - ATT_NOTIFY_OVERHEAD - BATCH_OVERHEAD) // SAMPLE_SIZE))
+
 
 def check_dbus_available():
     """检查 D-Bus 是否可用"""
@@ -86,6 +340,125 @@ def reset_bluetooth():
         print(f"重置蓝牙时出错: {e}")
         print("继续运行...")
 
+ADAPTER_PATH = '/org/bluez/hci0'
+ADAPTER_INTERFACE = 'org.bluez.Adapter1'
+
+
+async def _adapter_properties(bus, timeout):
+    """取适配器的 Properties 接口；开机时 bluetoothd 可能还没注册适配器，每 0.5 秒重试直到超时"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        try:
+            introspection = await bus.introspect('org.bluez', ADAPTER_PATH)
+        except Exception:
+            introspection = None  # org.bluez 服务还没启动
+        if introspection is not None and any(i.name == ADAPTER_INTERFACE for i in introspection.interfaces):
+            proxy = bus.get_proxy_object('org.bluez', ADAPTER_PATH, introspection)
+            return proxy.get_interface('org.freedesktop.DBus.Properties')
+        if loop.time() >= deadline:
+            raise asyncio.TimeoutError(f"{ADAPTER_PATH} 未就绪")
+        await asyncio.sleep(0.5)
+
+
+async def reset_bluetooth_async(timeout=10.0):
+    """
+    通过 D-Bus 重置蓝牙适配器（Powered off -> on），不阻塞事件循环
+    每一步等待 BlueZ 发出 Powered 的 PropertiesChanged 信号即继续，而不是固定 sleep；
+    没有 dbus-fast 时退回到在线程池中执行 reset_bluetooth()。
+
+    Returns:
+        是否重置成功
+    """
+    if not check_dbus_available():
+        print("警告: D-Bus socket 不可用，跳过蓝牙重置。")
+        print("如果在 Docker 中运行，请确保挂载了 /var/run/dbus")
+        return False
+    try:
+        from dbus_fast import BusType, Variant
+        from dbus_fast.aio import MessageBus
+    except ImportError:
+        await asyncio.get_running_loop().run_in_executor(None, reset_bluetooth)
+        return True
+
+    bus = None
+    try:
+        bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
+        properties = await _adapter_properties(bus, timeout)
+        powered = {}
+        changed = asyncio.Event()
+
+        def on_properties_changed(interface, changed_properties, invalidated):
+            if interface == ADAPTER_INTERFACE and 'Powered' in changed_properties:
+                powered['value'] = changed_properties['Powered'].value
+                changed.set()
+
+        properties.on_properties_changed(on_properties_changed)
+
+        async def set_powered(value):
+            powered['value'] = (await properties.call_get(ADAPTER_INTERFACE, 'Powered')).value
+            if powered['value'] == value:
+                return
+            await properties.call_set(ADAPTER_INTERFACE, 'Powered', Variant('b', value))
+            while powered['value'] != value:
+                changed.clear()
+                await asyncio.wait_for(changed.wait(), timeout)
+
+        print("重置蓝牙适配器...")
+        await set_powered(False)
+        await set_powered(True)
+        print("蓝牙适配器已重置。")
+        return True
+    except asyncio.TimeoutError:
+        print("重置蓝牙超时，继续运行...")
+    except Exception as e:
+        print(f"重置蓝牙时出错: {e}")
+        print("继续运行...")
+    finally:
+        if bus is not None:
+            bus.disconnect()
+    return False
+
+
+# 按设备名缓存最近一次连接成功的地址，重启后也能先直连而不必扫描
+BLE_ADDRESS_CACHE = os.environ.get('AROUND_BLE_CACHE', 'ble_devices.json')
+DIRECT_CONNECT_TIMEOUT = 5.0  # 直连已知设备 / 地址的超时，失败后退回按名称扫描
+SCAN_TIMEOUT = 10.0
+
+
+def load_cached_address(device_name, path=BLE_ADDRESS_CACHE):
+    """读取缓存的设备地址，没有则返回 None"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f).get(device_name)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def save_cached_address(device_name, address, path=BLE_ADDRESS_CACHE):
+    """写入设备地址缓存（先写临时文件再替换，避免写到一半断电留下损坏的文件）"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            cache = json.load(f)
+        if not isinstance(cache, dict):
+            cache = {}
+    except (OSError, ValueError):
+        cache = {}
+    cache[device_name] = address
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"[WARNING] 保存 BLE 设备地址缓存失败: {e}")
+
+
+def _is_in_progress(error):
+    error_str = str(error)
+    return "InProgress" in error_str or "already in progress" in error_str.lower()
+
+
 VOLTAGE_SOC_TABLE = [
     (4.20, 100.0),
     (4.15, 95.0),
@@ -113,21 +486,30 @@ VOLTAGE_SOC_TABLE = [
 class BLE():
     """BLE 数据读取器类"""
     
-    def __init__(self, device_name, max_buffer_size=120):
+    def __init__(self, device_name, max_buffer_size=120, log_frames=False, command_interval=COMMAND_INTERVAL,
+                 reset_adapter=True, address_cache=BLE_ADDRESS_CACHE, batch_size=BATCH_SIZE):
         """
         初始化 BLE 数据读取器
         
         Args:
             device_name: 要连接的设备名称
             max_buffer_size: deque 最大缓冲区大小
+            log_frames: 是否逐帧打印收到的数据（调试用，打印在 BLE 事件循环线程上执行）
+            command_interval: 控制指令之间的最小间隔（秒），由指令队列保证
+            reset_adapter: 开始读取前是否重置蓝牙适配器（在 BLE 线程中异步执行，不阻塞构造）
+            address_cache: 设备地址缓存文件，None 表示不读写缓存
+            batch_size: 大于 1 时在开始采集前发送 B=N，请求设备每次通知打包 N 个样本（受 MTU 限制）；
+                        不支持的旧固件会继续发送单帧，两种格式都能解析
         """
         
-        reset_bluetooth()
         self.device_name = device_name
         self.hr = deque(maxlen=max_buffer_size)  # 存储心率数据
         self.blood_oxygen = deque(maxlen=max_buffer_size)  # 存储血氧数据
         self.sdnn = deque(maxlen=max_buffer_size)  # 存储SDNN数据
         self.rri = deque(maxlen=max_buffer_size * 4)  # 存储RRI数据
+        self.rri_total = 0  # 累计收到的RRI个数（deque 会丢弃旧数据，消费方据此判断新增了多少）
+        self.rri_lock = threading.Lock()  # 保护 rri 与 rri_total 的同步更新，见 snapshot_rri()
+        self.frame_event = threading.Event()  # 每解析出一帧置位，消费方可据此立即处理而不必定时轮询
         self.voltage = None
         self.client = None
         self.is_running = False
@@ -136,6 +518,23 @@ class BLE():
         self.receive_buffer = bytearray()  # 用于接收数据的缓冲区
         self.touch = deque(maxlen=max_buffer_size)  # 存储触摸数据
         self.gyroscope = deque(maxlen=max_buffer_size)  # 存储晃动数据
+        self.log_frames = log_frames
+        self.reset_adapter = reset_adapter
+        self.address_cache = address_cache
+        # 重连时依次尝试：重用上次连上的 BleakClient（不扫描）-> 缓存的地址 -> 按名称扫描
+        self.address = load_cached_address(device_name, address_cache) if address_cache else None
+        self._known_client = None
+        self.connect_path = None  # 最近一次连接所用的方式：'client' / 'address' / 'scan'
+        self._link_lost = None  # 断线回调置位的 asyncio.Event
+        # 首帧耗时统计：[(原因 'boot' / 'reconnect', 连接方式, 秒数), ...]
+        self.first_sample_times = []
+        self._waiting_since = None
+        self._waiting_reason = None
+        # 批量模式与丢包统计（只有批量包带序号，单帧格式无法统计）
+        self.batch_size = batch_size
+        self.last_seq = None
+        self.packets_received = 0
+        self.packets_lost = 0
         
         # Threading 相关
         self.loop = None
@@ -144,8 +543,12 @@ class BLE():
         # 配置参数
         self.notify_characteristic_uuid = '6e400003-b5a3-f393-e0a9-e50e24dcca9e'
         self.write_characteristic_uuid = '6e400002-b5a3-f393-e0a9-e50e24dcca9e'
-        self.frame_size = 10  # 每帧数据包含9个字节
-        self.header_byte = 0xFF  # 包头校验位
+        # *_sync 控制指令统一进入该队列，在 BLE 事件循环上按间隔发送
+        self.commands = BLECommandQueue(self._write_command,
+                                        lambda: self.client is not None and self.client.is_connected,
+                                        min_interval=command_interval)
+        self.frame_size = FRAME_SIZE  # 每帧 10 字节（包头 + 9 字节数据）
+        self.header_byte = FRAME_HEADER  # 包头校验位
         
     def _notification_handler(self, sender, data: bytearray):
         """
@@ -155,60 +558,159 @@ class BLE():
             sender: 发送方
             data: 接收到的原始数据
         """
+        # 批量包每次通知恰好一个，单独解析，不进入单帧的拼接缓冲区
+        if data and data[0] == BATCH_HEADER:
+            packet = decode_batch_packet(data)
+            if packet is not None:
+                self._store_batch(*packet)
+                return
+
         # 将接收到的数据添加到缓冲区
         self.receive_buffer.extend(data)
-        
-        # 解析缓冲区中的完整帧
-        while len(self.receive_buffer) >= self.frame_size:
-            # 查找包头
-            header_index = self.receive_buffer.find(self.header_byte)
-            
-            if header_index == -1:
-                # 没有找到包头,清空缓冲区
-                self.receive_buffer.clear()
-                break
-            
-            # 丢弃包头之前的数据
-            if header_index > 0:
-                self.receive_buffer = self.receive_buffer[header_index:]
-            
-            # 检查是否有完整的一帧数据
-            if len(self.receive_buffer) >= self.frame_size:
-                # 提取一帧数据
-                frame = self.receive_buffer[:self.frame_size]
-                
-                # 验证包头
-                if frame[0] == self.header_byte:
-                    # 提取后8位有效数据，转换为整型
-                    valid_data = [int(b) for b in frame[1:10]]
-                    if valid_data[0] < 50 or valid_data[0] > 190:
-                        self.hr.append(0)
-                    else :
-                        self.hr.append(valid_data[0])
-                    self.blood_oxygen.append(valid_data[1])
-                    self.sdnn.append(valid_data[2])
-                    self.rri.extend(valid_data[3:6])
-                    # self.voltage = self.calculate_percentage_lookup(valid_data[6] / 10)
-                    self.gyroscope.append(valid_data[6])  # 低4位为shake
-                    # self.touch.append((valid_data[7]) & 0x0F)  # 高4位为touch
-
-                    self.data_valid = True
-                    print(f"收到数据帧: HR={valid_data[0]}, SpO2={valid_data[1]}, SDNN={valid_data[2]}, "\
-                          f"RRI={valid_data[3:6]},gyro={valid_data[6]}")
-
-                # 从缓冲区移除已处理的帧
-                self.receive_buffer = self.receive_buffer[self.frame_size:]
-            else:
-                break
+
+        # 一次解析缓冲区中的全部完整帧，再原地删除已处理的字节
+        frames, consumed = decode_frames(self.receive_buffer, self.header_byte)
+        if consumed:
+            del self.receive_buffer[:consumed]
+        if len(frames):
+            self._store_frames(frames)
+
+    def _store_batch(self, seq, samples):
+        """处理一个批量包：按序号统计丢包，再追加样本"""
+        if self.receive_buffer:
+            self.receive_buffer.clear()  # 刚从单帧切换到批量模式，残留的半帧已无法拼完整
+        if self.last_seq is not None:
+            gap = (seq - self.last_seq - 1) & 0xFFFF
+            # 序号倒退（差值过半圈）视为设备重新开始计数，不计入丢包
+            if gap < 0x8000:
+                self.packets_lost += gap
+        self.last_seq = seq
+        self.packets_received += 1
+        if len(samples):
+            self._store_frames(samples)
+
+    @property
+    def packet_loss_rate(self):
+        """批量包丢包率（丢失包数 / 应收包数）；尚未收到批量包时为 None"""
+        expected = self.packets_received + self.packets_lost
+        return self.packets_lost / expected if expected else None
+
+    async def _request_batch_mode(self):
+        """按 MTU 协商批量大小并发送 B=N；MTU 装不下 2 个样本时不启用"""
+        backend = getattr(self.client, '_backend', None)
+        if hasattr(backend, '_acquire_mtu'):
+            # BlueZ 下 bleak 不会自动取得协商后的 MTU
+            try:
+                await backend._acquire_mtu()
+            except Exception as e:
+                print(f"[WARNING] 获取 MTU 失败: {e}")
+        try:
+            mtu = self.client.mtu_size
+        except Exception:
+            mtu = 23
+        size = min(self.batch_size, batch_capacity(mtu))
+        if size < 2:
+            print(f"MTU={mtu} 太小，不启用批量模式")
+            return
+        await self.client.write_gatt_char(self.write_characteristic_uuid, f"B={size}\n".encode('ascii'))
+        print(f"已发送 B={size} 指令，请求每次通知打包 {size} 个样本（MTU={mtu}）")
+
+    def _store_frames(self, frames):
+        """把一批解析好的帧（或批量包中的样本）批量追加到各数据缓冲区"""
+        self.hr.extend(_HR_TABLE.take(frames['hr']).tolist())
+        self.blood_oxygen.extend(frames['spo2'].tolist())
+        self.sdnn.extend(frames['sdnn'].tolist())
+        rri = frames['rri'].ravel().tolist()
+        with self.rri_lock:
+            self.rri.extend(rri)
+            self.rri_total += len(rri)
+        # self.voltage = self.calculate_percentage_lookup(frames['gyro'][-1] / 10)
+        self.gyroscope.extend(frames['gyro'].tolist())  # 低4位为shake
+        # self.touch.extend((frames['reserved'][:, 0] & 0x0F).tolist())  # 高4位为touch
+
+        self.data_valid = True
+        self.frame_event.set()
+        if self._waiting_since is not None:
+            self._record_first_sample()
+        if self.log_frames:
+            for hr, spo2, sdnn, rri, gyro in zip(frames['hr'].tolist(), frames['spo2'].tolist(),
+                                                 frames['sdnn'].tolist(), frames['rri'].tolist(),
+                                                 frames['gyro'].tolist()):
+                print(f"收到数据帧: HR={hr}, SpO2={spo2}, SDNN={sdnn}, RRI={rri},gyro={gyro}")
     
+    def snapshot_rri(self):
+        """同一时刻的 rri 窗口副本（list）和累计计数 rri_total"""
+        with self.rri_lock:
+            return list(self.rri), self.rri_total
+
+    def _mark_waiting(self, reason):
+        """开始计时，直到下一个数据帧到达（reason: 'boot' 启动 / 'reconnect' 断线重连）"""
+        self._waiting_since = time.monotonic()
+        self._waiting_reason = reason
+
+    def _record_first_sample(self):
+        elapsed = time.monotonic() - self._waiting_since
+        self._waiting_since = None
+        self.first_sample_times.append((self._waiting_reason, self.connect_path, elapsed))
+        label = '启动' if self._waiting_reason == 'boot' else '断线'
+        print(f"[BLE] {label}后 {elapsed:.2f} s 收到首个数据帧（连接方式: {self.connect_path}）")
+
+    def _on_disconnected(self, client):
+        """BleakClient 断线回调（在 BLE 事件循环上执行）"""
+        if client is self.client and self._link_lost is not None:
+            self._link_lost.set()
+
+    async def _connect_to(self, target, timeout=None, client=None):
+        """连接 BLEDevice / 地址字符串（或重用已有的 client），成功后记住 client 和地址"""
+        address = getattr(target, 'address', target)
+        print(f"正在尝试连接到 {address}...")
+        kwargs = {} if timeout is None else {'timeout': timeout}
+        self._link_lost = asyncio.Event()
+        self.client = client or BleakClient(target, disconnected_callback=self._on_disconnected, **kwargs)
+        await self.client.connect(**kwargs)
+        if not self.client.is_connected:
+            return False
+        print(f"成功连接到 {address}")
+        self.is_connected = True
+        self._known_client = self.client
+        if self.client.address != self.address:
+            self.address = self.client.address
+            if self.address_cache:
+                save_cached_address(self.device_name, self.address, self.address_cache)
+        return True
+
+    async def _connect_known(self):
+        """
+        不扫描，直接连接已知设备；都失败返回 False
+        断线后先重用上次连上的 BleakClient（BlueZ 保留着设备对象，不需要重新发现），再试缓存的地址
+        """
+        attempts = []
+        if self._known_client is not None:
+            attempts.append(('client', self._known_client.address, self._known_client))
+        if self.address:
+            attempts.append(('address', self.address, None))
+        for path, address, client in attempts:
+            try:
+                if await self._connect_to(address, DIRECT_CONNECT_TIMEOUT, client):
+                    self.connect_path = path
+                    return True
+            except Exception as e:
+                if _is_in_progress(e):
+                    raise
+                print(f"直连 {address} 失败: {e}")
+        return False
+
     async def connect(self):
-        """连接到 BLE 设备，如果失败则持续重试。"""
+        """连接到 BLE 设备（先直连已知设备，失败再按名称扫描），如果失败则持续重试。"""
         while self.is_running: # 只要持续读取的标志位为True，就不断尝试
             device = None
             try:
+                if await self._connect_known():
+                    return True
+
                 print(f"正在扫描BLE设备，寻找 '{self.device_name}'...")
                 # 增加扫描超时，避免永久阻塞
-                device = await BleakScanner.find_device_by_name(self.device_name, timeout=10.0)
+                device = await BleakScanner.find_device_by_name(self.device_name, timeout=SCAN_TIMEOUT)
                 
                 if device is None:
                     print(f"找不到设备 '{self.device_name}'，将在5秒后重试...")
@@ -217,25 +719,18 @@ class BLE():
 
                 print(f"成功找到设备: 地址 {device.address}")
                 
-                self.client = BleakClient(device)
-                print(f"正在尝试连接到 {device.address}...")
-                await self.client.connect()
-                
-                if self.client.is_connected:
-                    print(f"成功连接到 {device.address}")
-                    self.is_connected = True
+                if await self._connect_to(device):
+                    self.connect_path = 'scan'
                     return True # 连接成功，退出connect方法
 
             except Exception as e:
-                error_str = str(e)
                 print(f"连接过程中发生错误: {e}")
                 
                 # 如果是 "Operation already in progress" 错误，等待更长时间让蓝牙服务就绪
-                if "InProgress" in error_str or "already in progress" in error_str.lower():
+                if _is_in_progress(e):
                     print("检测到蓝牙操作正在进行中，等待蓝牙服务完成...")
                     await asyncio.sleep(10)  # 等待更长时间
-                    reset_bluetooth()  # 重置蓝牙适配器
-                    await asyncio.sleep(3)
+                    await reset_bluetooth_async()  # 重置蓝牙适配器（等到 Powered 信号即返回）
                     continue
             
             # 如果代码执行到这里，说明发生了错误或连接未成功
@@ -264,6 +759,11 @@ class BLE():
         
         print("成功开始监听。")
         
+        # 序号从新的采集开始计算
+        self.last_seq = None
+        if self.batch_size > 1:
+            await self._request_batch_mode()
+
         # 发送 p=1 指令以触发数据采集
         print("发送 p=1 指令以启动数据采集...")
         await self.client.write_gatt_char(
@@ -274,13 +774,19 @@ class BLE():
         
         self.is_running = True
         
-        # 持续运行以接收数据，直到程序被中断
+        # 持续运行以接收数据，直到程序被中断；断线回调会立即唤醒，不必等到下一次轮询
+        if self._link_lost is None:
+            self._link_lost = asyncio.Event()  # client 不是经 connect() 建立的
         while self.is_running:
-            await asyncio.sleep(1.0)
+            try:
+                await asyncio.wait_for(self._link_lost.wait(), timeout=1.0)
+            except asyncio.TimeoutError:
+                pass
             
             if not self.client.is_connected:
                 print("设备已断开连接。")
                 self.is_connected = False
+                self._mark_waiting('reconnect')
                 break
     
     async def stop_reading(self):
@@ -324,13 +830,16 @@ class BLE():
         在独立线程中运行 asyncio 事件循环，支持自动重连
         """
         self.is_running = True
+        self._mark_waiting('boot')
         print("Starting continuous BLE data reading...")
         
         def async_thread():
             """在线程中运行 asyncio 事件循环"""
             self.loop = asyncio.new_event_loop()
             asyncio.set_event_loop(self.loop)
-            
+            self.commands.attach(self.loop)
+            if self.reset_adapter:
+                self.loop.run_until_complete(reset_bluetooth_async())
             
             while self.is_running:
                 # 在同一个事件循环中连接和读取
@@ -338,15 +847,14 @@ class BLE():
                 
                 if self.is_connected:
                     self.loop.run_until_complete(self.start_reading())
-                    # 如果退出 start_reading 是因为断开连接
-                    if self.is_running:
-                        time.sleep(2)
-                    else:
+                    # 断开连接后立即重连（先直连上次的设备），停止读取则退出
+                    if not self.is_running:
                         break
                 else:
                     time.sleep(2)
 
             # 清理
+            self.loop.run_until_complete(self.commands.stop())
             if self.client and self.client.is_connected:
                 self.loop.run_until_complete(self.disconnect())
             self.loop.close()
@@ -407,6 +915,11 @@ class BLE():
                 percentage = soc_low + (voltage - v_low) * (soc_high - soc_low) / (v_high - v_low)
                 return percentage
     
+    async def _write_command(self, command):
+        """指令队列的写入函数（在 BLE 事件循环上执行）"""
+        await self.client.write_gatt_char(self.write_characteristic_uuid, command)
+        print(f"已发送指令: {command.decode('ascii').strip()}")
+
     async def color(self, r, g, b):
         """
         设置LED颜色
@@ -421,37 +934,19 @@ class BLE():
             await self.client.write_gatt_char(self.write_characteristic_uuid, command)
             print(f"已发送颜色指令: RGB({r},{g},{b})")
     
-    def color_sync(self, r, g, b):
-        """同步版本的color方法"""
-        try:
-            if self.loop and self.loop.is_running():
-                future = asyncio.run_coroutine_threadsafe(self.color(r, g, b), self.loop)
-                future.result(timeout=5.0)
-            else:
-                asyncio.run(self.color(r, g, b))
-        except TimeoutError:
-            print(f"[WARNING] color_sync 超时: RGB({r},{g},{b})")
-        except Exception as e:
-            print(f"[WARNING] color_sync 失败: {e}")
-        
+    def color_sync(self, r, g, b, priority=PRIORITY_NORMAL):
+        """color 的同步调用版本：放入指令队列后立即返回 CommandHandle（不等待写入）"""
+        return self.commands.submit(f'c={r},{g},{b}\n', priority)
+
     async def jump(self,a):
         if self.client and self.client.is_connected:
             command = f'l={a}\n'.encode('ascii')#l = 0, 1, 2
             await self.client.write_gatt_char(self.write_characteristic_uuid, command)
             print(f"已发送跳跃指令: {a}")
     
-    def jump_sync(self, a):
-        """同步版本的jump方法"""
-        try:
-            if self.loop and self.loop.is_running():
-                future = asyncio.run_coroutine_threadsafe(self.jump(a), self.loop)
-                future.result(timeout=5.0)
-            else:
-                asyncio.run(self.jump(a))
-        except TimeoutError:
-            print(f"[WARNING] jump_sync 超时: {a}")
-        except Exception as e:
-            print(f"[WARNING] jump_sync 失败: {e}")
+    def jump_sync(self, a, priority=PRIORITY_NORMAL):
+        """jump 的同步调用版本：放入指令队列后立即返回 CommandHandle（不等待写入）"""
+        return self.commands.submit(f'l={a}\n', priority)
 
     async def bright(self, brightness):
         """
@@ -465,19 +960,10 @@ class BLE():
             await self.client.write_gatt_char(self.write_characteristic_uuid, command)
             print(f"已发送亮度指令: {brightness}")
     
-    def bright_sync(self, brightness):
-        """同步版本的bright方法"""
-        try:
-            if self.loop and self.loop.is_running():
-                future = asyncio.run_coroutine_threadsafe(self.bright(brightness), self.loop)
-                future.result(timeout=5.0)
-            else:
-                asyncio.run(self.bright(brightness))
-        except TimeoutError:
-            print(f"[WARNING] bright_sync 超时: {brightness}")
-        except Exception as e:
-            print(f"[WARNING] bright_sync 失败: {e}")
-    
+    def bright_sync(self, brightness, priority=PRIORITY_NORMAL):
+        """bright 的同步调用版本：放入指令队列后立即返回 CommandHandle（不等待写入）"""
+        return self.commands.submit(f'b={brightness}\n', priority)
+
     async def mode(self, mode):
         """
         设置模式
@@ -490,21 +976,10 @@ class BLE():
             await self.client.write_gatt_char(self.write_characteristic_uuid, command)
             print(f"已发送模式指令: {mode}")
 
-    def mode_sync(self, mode):
-        """同步版本的mode方法，可在非异步环境中调用"""
-        try:
-            if self.loop and self.loop.is_running():
-                # 如果事件循环在运行（即在后台线程中），在该循环中执行
-                future = asyncio.run_coroutine_threadsafe(self.mode(mode), self.loop)
-                future.result(timeout=5.0)  # 等待执行完成，最多5秒
-            else:
-                # 如果没有运行的事件循环，创建一个新的
-                asyncio.run(self.mode(mode))
-        except TimeoutError:
-            print(f"[WARNING] mode_sync 超时: {mode}")
-        except Exception as e:
-            print(f"[WARNING] mode_sync 失败: {e}")
-    
+    def mode_sync(self, mode, priority=PRIORITY_NORMAL):
+        """mode 的同步调用版本：放入指令队列后立即返回 CommandHandle（不等待写入）"""
+        return self.commands.submit(f'm={mode}\n', priority)
+
     async def shake(self, v=1):
         """
         震动控制
@@ -517,18 +992,9 @@ class BLE():
             await self.client.write_gatt_char(self.write_characteristic_uuid, command)
             print(f"已发送震动指令: {v}")
     
-    def shake_sync(self, v=1):
-        """同步版本的shake方法"""
-        try:
-            if self.loop and self.loop.is_running():
-                future = asyncio.run_coroutine_threadsafe(self.shake(v), self.loop)
-                future.result(timeout=5.0)
-            else:
-                asyncio.run(self.shake(v))
-        except TimeoutError:
-            print(f"[WARNING] shake_sync 超时: {v}")
-        except Exception as e:
-            print(f"[WARNING] shake_sync 失败: {e}")
+    def shake_sync(self, v=1, priority=PRIORITY_NORMAL):
+        """shake 的同步调用版本：放入指令队列后立即返回 CommandHandle（不等待写入）"""
+        return self.commands.submit(f'v={v}\n', priority)
 
     async def message(self, a):
         """
@@ -542,20 +1008,10 @@ class BLE():
             await self.client.write_gatt_char(self.write_characteristic_uuid, command)
             print(f"已发送指令: {a}")
     
-    def message_sync(self, a):
-        """同步版本的shake方法"""
-        try:
-            if self.loop and self.loop.is_running():
-                future = asyncio.run_coroutine_threadsafe(self.message(a), self.loop)
-                future.result(timeout=5.0)
-            else:
-                asyncio.run(self.message(a))
-        except TimeoutError:
-            print(f"[WARNING] shake_sync 超时: {a}")
-        except Exception as e:
-            print(f"[WARNING] shake_sync 失败: {e}")
-    
-    
+    def message_sync(self, a, priority=PRIORITY_NORMAL):
+        """message 的同步调用版本：放入指令队列后立即返回 CommandHandle（不等待写入）"""
+        return self.commands.submit(a, priority)
+
     async def ppg(self, p=0):
         """
         PPG数据采集控制
@@ -586,23 +1042,14 @@ class BLE():
             await self.client.write_gatt_char(self.write_characteristic_uuid, command)
             print(f"已发送频率呼吸灯指令: {f}")
 
-    def freq_light_sync(self, f=5):
-        """同步版本的freq_light方法"""
-        try:
-            if self.loop and self.loop.is_running():
-                future = asyncio.run_coroutine_threadsafe(self.freq_light(f), self.loop)
-                future.result(timeout=5.0)
-            else:
-                asyncio.run(self.freq_light(f))
-        except TimeoutError:
-            print(f"[WARNING] freq_light_sync 超时: {f}")
-        except Exception as e:
-            print(f"[WARNING] freq_light_sync 失败: {e}")
+    def freq_light_sync(self, f=5, priority=PRIORITY_NORMAL):
+        """freq_light 的同步调用版本：放入指令队列后立即返回 CommandHandle（不等待写入）"""
+        return self.commands.submit(f'F={f}\n', priority)
 
 
 if __name__ == "__main__":
-     # 在初始化时重置蓝牙
-    ble = BLE(device_name="demo6", max_buffer_size=120)
+    # 蓝牙适配器在 start_continuous_reading 的后台线程中异步重置
+    ble = BLE(device_name="demo6", max_buffer_size=120, log_frames=True)
     # 直接开始连续读取，connect 会在后台线程中自动执行
     ble.start_continuous_reading()
     time.sleep(0.5)
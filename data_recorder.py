@@ -1,32 +1,62 @@
 import time
-import csv
-import os
-import statistics
 from datetime import datetime
-import matplotlib.pyplot as plt
+from collections import deque
+from quadrant_plot import QuadrantRenderer
+from session_store import SessionStore
+
+# 内存中保留的最近评分条数（_plot_deviation 只画最近 10 条）
+HISTORY_CACHE_SIZE = 32
+# 评分步进（秒），每 5s 移动一次窗口
+RECORD_INTERVAL = 5.0
+# FSM.data 按事件追加（雷达约 1-3 s 一个值，PPG 每批 RRI 一个值），样本数对应的时长随数据源变化，
+# 因此评分窗口和统计窗口都按时间取
+SCORE_WINDOW = 30.0      # 评分使用最近 30 s 的均值
+MIN_DATA_SECONDS = 5.0   # sdnn / lf_hf 至少已有 5 s 的数据才评分
+STATS_WINDOW = 240.0     # 每条记录中各指标统计量覆盖最近 240 s
+# 评分记录的二进制分段目录（导出 CSV：python session_store.py export）
+SESSION_DIR = 'sessions'
+PLOT_PATH = 'personal_data.png'
+
 
 class DataRecorder:
-    def __init__(self, fsm_instance):
+    def __init__(self, fsm_instance, always_render=False, session_dir=SESSION_DIR):
         """
         初始化个人数据采集器
+        always_render: 每次评分都渲染象限图并写入 PNG；默认只在有人通过 /api/emotion_plot 取图时渲染
+        session_dir: 评分记录的存储目录（按天分段的二进制文件）
         """
         self.fsm = fsm_instance
         self.valence_score = None
         self.arousal_score = None
+        self.store = SessionStore(session_dir)
+        # 最近写入的 (valence, arousal) 评分，冷启动时从存储尾部加载一次，之后随写入追加
+        self._history = deque(maxlen=HISTORY_CACHE_SIZE)
+        self._history_loaded = False
+        # 象限图在后台线程渲染，评分节奏不受绘图耗时影响
+        self.renderer = QuadrantRenderer(always=always_render)
+        self._next_tick = None
 
     def record(self):
         """
-        采集个人基线数据并保存为CSV文件
+        采集个人基线数据并追加到会话存储
         """
-        save_path='personal_data.csv'
-        time.sleep(5) # 步进，每5s移动一次窗口
+        self._wait_next_tick()
         self.arousal_score, self.valence_score = self._calculate_emotion_scores()
         # 保存并绘制
         new_record = self._generate_statistics_record()
-        self._save_to_csv(save_path, new_record)
-        self._plot_deviation(save_path)
+        self._save_record(new_record)
+        self._plot_deviation(PLOT_PATH)
         return self.arousal_score, self.valence_score
 
+    def _wait_next_tick(self):
+        """按固定节奏步进：等到下一个 RECORD_INTERVAL 整点，而不是每次都再睡满 5s"""
+        now = time.monotonic()
+        if self._next_tick is None or now - self._next_tick > RECORD_INTERVAL:
+            # 第一次调用或落后超过一个周期时重新对齐
+            self._next_tick = now
+        self._next_tick += RECORD_INTERVAL
+        time.sleep(max(0.0, self._next_tick - now))
+
     def _generate_statistics_record(self):
         new_record = {
             'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
@@ -36,60 +66,22 @@ class DataRecorder:
         # 添加各指标的统计数据
         metrics = ['HF', 'LF', 'lf_hf', 'sdnn', 'hr', 'br', 'spo2']
         for metric in metrics:
-            # 通过将deque转换为list来创建一个快照，避免多线程迭代错误
-            data = list(self.fsm.data[metric])
-            
-            # 过滤掉 None 值和非数字值
-            filtered_data = [x for x in data if x is not None and isinstance(x, (int, float))]
-            
-            if filtered_data and len(filtered_data) > 0:
-                new_record[f'{metric}_mean'] = round(statistics.mean(filtered_data), 3)
-                new_record[f'{metric}_std'] = round(statistics.stdev(filtered_data), 3) if len(filtered_data) > 1 else None
-                new_record[f'{metric}_min'] = round(min(filtered_data), 3)
-                new_record[f'{metric}_max'] = round(max(filtered_data), 3)
-            else:
-                new_record[f'{metric}_mean'] = None
-                new_record[f'{metric}_std'] = None
-                new_record[f'{metric}_min'] = None
-                new_record[f'{metric}_max'] = None
+            # 在 MetricStore 锁内直接对环形缓冲区统计，不再复制整个 deque
+            for name, value in self.fsm.data.stats(metric, seconds=STATS_WINDOW).items():
+                new_record[f'{metric}_{name}'] = round(value, 3) if value is not None else None
     
         new_record['arousal_score'] = round(self.arousal_score, 3) if self.arousal_score is not None else None
         new_record['valence_score'] = round(self.valence_score, 3) if self.valence_score is not None else None
         
         return new_record
     
-    def _save_to_csv(self, save_path, record):
+    def _save_record(self, record):
         """
-        保存记录到CSV文件
+        追加一条记录到二进制会话存储（定长 float32 记录，不再每次重开 CSV 写一行文本）
         """
-        # 确保目录存在
-        csv_dir = os.path.dirname(save_path)
-        if csv_dir:
-            os.makedirs(csv_dir, exist_ok=True)
-        
-        # CSV字段顺序
-        fieldnames = [
-            'timestamp', 'data_source',
-            'HF_mean', 'HF_std', 'HF_min', 'HF_max',
-            'LF_mean', 'LF_std', 'LF_min', 'LF_max',
-            'lf_hf_mean', 'lf_hf_std', 'lf_hf_min', 'lf_hf_max',
-            'sdnn_mean', 'sdnn_std', 'sdnn_min', 'sdnn_max',
-            'hr_mean', 'hr_std', 'hr_min', 'hr_max',
-            'br_mean', 'br_std', 'br_min', 'br_max',
-            'spo2_mean', 'spo2_std', 'spo2_min', 'spo2_max',
-            'arousal_score', 'valence_score'
-        ]
-        
-        write_header = not os.path.exists(save_path)
-        
-        none_replacement = ''
-        with open(save_path, 'a', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            if write_header:
-                writer.writeheader()
-            writer.writerow({k: (none_replacement if v is None else v) for k, v in record.items()})
-        
-        # print(f'[INFO] 个人基线数据已追加到CSV: {save_path}')
+        self.store.append(record)
+        if self._history_loaded:
+            self._history.append((record.get('valence_score'), record.get('arousal_score')))
         return True
     
     def _get_norm_data(self):
@@ -97,11 +89,28 @@ class DataRecorder:
         norm_data = self.fsm.norms.get(norm_name)
         return norm_data
     
+    def _recent_means(self, seconds=SCORE_WINDOW):
+        """br / sdnn / hr / lf_hf 最近 seconds 秒内样本的均值，任一指标在窗口内没有数据时返回 None"""
+        means = [self.fsm.data.mean(metric, seconds=seconds) for metric in ('br', 'sdnn', 'hr', 'lf_hf')]
+        return None if None in means else means
+
+    def _has_enough_data(self):
+        """sdnn 和 lf_hf 最早的样本都已有 MIN_DATA_SECONDS 秒"""
+        for metric in ('sdnn', 'lf_hf'):
+            age = self.fsm.data.age(metric)
+            if age is None or age < MIN_DATA_SECONDS:
+                return False
+        return True
+
     def _calculate_emotion_scores(self):
         # 检查是否有足够的数据
-        if (len(self.fsm.data['sdnn']) < 5 or
-            len(self.fsm.data['lf_hf']) < 5):
+        if not self._has_enough_data():
+            return None, None
+        # 计算各指标，取最近 30 s 的均值
+        means = self._recent_means()
+        if means is None:
             return None, None
+        br_mean, sdnn_mean, hr_mean, lf_hf_mean = means
         
         # 获取常模数据
         norm_data = self._get_norm_data()
@@ -113,12 +122,6 @@ class DataRecorder:
         lf_hf_norm_std = norm_data['lf_hf_ratio']['std']
         br_norm_mean = norm_data['br']['mean'] 
         br_norm_std = norm_data['br']['std']
-        
-        # 计算各指标，取最近30个样本点的均值
-        br_mean = statistics.mean(list(self.fsm.data['br'])[-30:])
-        sdnn_mean = statistics.mean(list(self.fsm.data['sdnn'])[-30:])
-        hr_mean = statistics.mean(list(self.fsm.data['hr'])[-30:])
-        lf_hf_mean = statistics.mean(list(self.fsm.data['lf_hf'])[-30:])
 
         # 计算各指标的标准化偏差
         hr_deviation = (hr_mean - hr_norm_mean) / hr_norm_std
@@ -146,143 +149,55 @@ class DataRecorder:
         
         return arousal_score, valence_score
     
-    def _read_historical_data(self, save_path, num_records=3):
+    def _read_historical_data(self, num_records=3):
         """
-        从CSV文件中读取历史数据的arousal和valence分数
+        获取最近 num_records 条记录（包括当前正在记录的）的 arousal 和 valence 分数
+        第一次调用时从会话存储尾部加载，之后直接使用内存缓存（由 _save_record 追加）
         """
-        if not os.path.exists(save_path):
-            return []
-        
-        historical_points = []
+        if not self._history_loaded:
+            self._load_history()
+        records = list(self._history)[-num_records:]
+        return [(valence, arousal) for valence, arousal in records
+                if valence is not None and arousal is not None]
+
+    def _load_history(self):
+        """冷启动：只映射存储中最近 HISTORY_CACHE_SIZE 条记录填充缓存"""
+        self._history.clear()
+        self._history_loaded = True
         try:
-            with open(save_path, 'r', encoding='utf-8') as csvfile:
-                # 过滤掉NUL字符，防止csv解析错误
-                content = csvfile.read().replace('\x00', '')
-            
-            from io import StringIO
-            reader = csv.DictReader(StringIO(content))
-            rows = list(reader)
-            
-            # 获取最近的num_records条记录（包括当前正在记录的）
-            for row in rows[-num_records:]:
-                valence = row.get('valence_score', '')
-                arousal = row.get('arousal_score', '')
-                
-                if valence and arousal and valence != 'null' and arousal != 'null':
-                        valence_val = float(valence)
-                        arousal_val = float(arousal)
-                        historical_points.append((valence_val, arousal_val))
+            for row in map(self.store.to_row, self.store.tail(HISTORY_CACHE_SIZE)):
+                self._history.append((row['valence_score'], row['arousal_score']))
         except Exception as e:
             print(f'[WARNING] Failed to read historical data: {e}')
-            return []
-        
-        return historical_points
 
-    def _plot_deviation(self, save_path):
+    def _plot_deviation(self, plot_path):
         """
-        绘制Valence-Arousal Model图
+        提交 Valence-Arousal Model 图的渲染（由 QuadrantRenderer 在后台线程完成，不阻塞评分）
         """
-        # 设置中文字体
-        # plt.rcParams['font.sans-serif'] = ['SimHei', 'Microsoft YaHei', 'Arial']
-        # plt.rcParams['axes.unicode_minus'] = False
-
         if self.arousal_score is None or self.valence_score is None:
             print('[WARNING] Insufficient data.')
             return
-        
+
         # 计算各指标均值
-        br_mean = statistics.mean(list(self.fsm.data['br'])[-30:])
-        sdnn_mean = statistics.mean(list(self.fsm.data['sdnn'])[-30:])
-        hr_mean = statistics.mean(list(self.fsm.data['hr'])[-30:])
-        lf_hf_mean = statistics.mean(list(self.fsm.data['lf_hf'])[-30:])
-        
-        # 创建图表
-        fig, ax = plt.subplots(figsize=(10, 10))
-        
-        # 设置坐标轴范围
-        axis_limit = 3.0
-        ax.set_xlim(-axis_limit, axis_limit)
-        ax.set_ylim(-axis_limit, axis_limit)
-    
-        # 绘制四象限背景
-        ax.add_patch(plt.Rectangle((0, 0), axis_limit, axis_limit, 
-                                    facecolor='#FFD700', alpha=0.3, label='Joy'))
-        ax.add_patch(plt.Rectangle((-axis_limit, 0), axis_limit, axis_limit, 
-                                    facecolor='#FF6B6B', alpha=0.3, label='Tense'))
-        ax.add_patch(plt.Rectangle((-axis_limit, -axis_limit), axis_limit, axis_limit, 
-                                    facecolor='#87CEEB', alpha=0.3, label='Low'))
-        ax.add_patch(plt.Rectangle((0, -axis_limit), axis_limit, axis_limit, 
-                                    facecolor='#90EE90', alpha=0.3, label='Calm'))
-        
-        # 绘制坐标轴线
-        # ax.axhline(y=0, color='black', linewidth=1.5, alpha=0.5)
-        # ax.axvline(x=0, color='black', linewidth=1.5, alpha=0.5)
-        
-        # 绘制±1标准差参考圈
-        circle1 = plt.Circle((0, 0), 1.0, fill=False, color='gray', 
-                            linestyle='--', linewidth=1, alpha=0.5)
-        circle2 = plt.Circle((0, 0), 2.0, fill=False, color='gray', 
-                            linestyle=':', linewidth=1, alpha=0.3)
-        ax.add_patch(circle1)
-        ax.add_patch(circle2)
-        
-        # 读取并绘制历史数据点（前两个）
-        historical_points = self._read_historical_data(save_path, num_records=10)
-        if historical_points:
-            # 按照递减的透明度绘制历史点
-            num_history = len(historical_points)
-            for i, (val_score, aro_score) in enumerate(historical_points):
-                alpha = 0.2 + (i + 1) * (0.3 / (num_history + 1))
-                ax.scatter(val_score, aro_score, s=400, 
-                          marker='.', color='#096800', alpha=alpha,
-                          edgecolors='darkgray', linewidths=1,
-                          zorder=10, label=f'History Emotion' if i == 0 else '')
-        
-        # 绘制当前状态点
-        ax.scatter(self.valence_score, self.arousal_score, s=400, 
-                    marker='.', edgecolors='#096800',
-                    zorder=30, label='Current Emotion')
-        
-        # 设置标签
-        ax.set_xlabel('Valence (←Low valence| High valence→)', fontsize=12, fontweight='bold')
-        ax.set_ylabel('Arousal (←Low arousal| High arousal→)', fontsize=12, fontweight='bold')
-        ax.set_title('Emotional State Quadrant Chart', fontsize=16, fontweight='bold', pad=20)
-        
-        ax.set_xticks([])
-        ax.set_yticks([])
-        for spine in ax.spines.values():
-            spine.set_visible(False)
-        
-        # 添加象限标签
-        ax.text(1.5, 1.5, 'Joy', 
-                ha='center', va='center', fontsize=30, fontweight='bold',
-                bbox=dict(boxstyle='round', facecolor='white', alpha=0.3))
-        
-        ax.text(-1.5, 1.5, 'Tense', 
-                ha='center', va='center', fontsize=30, fontweight='bold',
-                bbox=dict(boxstyle='round', facecolor='white', alpha=0.3))
-        
-        ax.text(-1.5, -1.5, 'Low', 
-                ha='center', va='center', fontsize=30, fontweight='bold',
-                bbox=dict(boxstyle='round', facecolor='white', alpha=0.3))
-        
-        ax.text(1.5, -1.5, 'Calm',
-                ha='center', va='center', fontsize=30, fontweight='bold',
-                bbox=dict(boxstyle='round', facecolor='white', alpha=0.3))
-        
-        # 状态判断
+        means = self._recent_means()
+        if means is None:
+            return
+        self._report_state()
+
+        historical_points = self._read_historical_data(num_records=10)
+        self.renderer.submit(self.valence_score, self.arousal_score, historical_points, means,
+                             plot_path=plot_path)
+
+    def _report_state(self):
+        """根据当前评分打印情绪状态判断"""
         if self.arousal_score > 0 and self.valence_score > 0:
             state_name = 'Joy'
-            state_color = '#FFD700'
         elif self.arousal_score > 0 and self.valence_score <= 0:
             state_name = 'Tense'
-            state_color = '#FF6B6B'
         elif self.arousal_score <= 0 and self.valence_score <= 0:
             state_name = 'Low'
-            state_color = '#87CEEB'
         else:
             state_name = 'Calm'
-            state_color = '#90EE90'
 
         Degree = (self.arousal_score**2 + self.valence_score**2)**0.5
         if Degree < 1:
@@ -291,33 +206,3 @@ class DataRecorder:
             print('[INFO] You are probably feeling Mild', state_name)
         else:
             print('[INFO] You are probably feeling Moderate', state_name)
-
-        info_text = f'BR mean: {br_mean:.1f} bpm\n'
-        info_text += f'HR mean: {hr_mean:.1f} bpm\n'
-        info_text += f'SDNN mean: {sdnn_mean:.1f} ms\n'
-        info_text += f'LF/HF mean: {lf_hf_mean:.2f}\n'
-        info_text += f'-------------------\n'
-        info_text += f'Valence Score: {self.valence_score:.2f}\n'
-        info_text += f'Arousal Score: {self.arousal_score:.2f}'
-
-        label_color = "#096800"
-        props = dict(boxstyle='round', facecolor=label_color, alpha=0.5, edgecolor='black', linewidth=1)
-        ax.text(0.02, 0.98, info_text, transform=ax.transAxes, 
-                fontsize=11, verticalalignment='top', bbox=props,
-                fontweight='bold')
-        
-        # 添加图例
-        ax.legend(loc='upper right', fontsize=9, framealpha=0.9)
-        
-        # 设置纵横比为1:1
-        ax.set_aspect('equal', adjustable='box')
-        
-        # 调整布局
-        fig.tight_layout()
-        
-        # 保存图表
-        plot_path = save_path.replace('.csv', '.png')
-        fig.savefig(plot_path, dpi=150, bbox_inches='tight')
-        # print(f'[INFO] 生理状态四象限图已保存到: {plot_path}')
-        
-        plt.close(fig)
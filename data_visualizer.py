@@ -1,9 +1,12 @@
+import gzip
+import importlib.util
 import io
 import time
 import threading
 import os
 from collections import deque
-from flask import Flask, Response, render_template, jsonify, send_from_directory, request
+from functools import partial
+from flask import Flask, Response, render_template, jsonify, request, abort
 from flask_socketio import SocketIO, emit
 from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
 from matplotlib.figure import Figure
@@ -11,6 +14,9 @@ import matplotlib
 import matplotlib.pyplot as plt
 import numpy as np
 from scipy.interpolate import make_interp_spline
+
+from static_assets import COMPRESS_MIN_SIZE, COMPRESSIBLE_MIMETYPES, StaticAssetIndex, brotli
+
 matplotlib.use('Agg')
 
 # Configure matplotlib font preferences
@@ -28,11 +34,22 @@ OLD_FRONTEND_DIR = os.path.join(BASE_DIR, 'js')
 # 检查使用哪个前端
 USE_NEW_FRONTEND = os.path.exists(NEW_FRONTEND_DIR) and os.path.exists(os.path.join(NEW_FRONTEND_DIR, 'index.html'))
 
+# Web 服务模式：
+#   'threading'：Werkzeug 开发服务器（默认，每个连接一个线程）
+#   'gevent'   ：gevent pywsgi（HTTP/1.1 keep-alive + WebSocket），运行在服务器线程自己的 hub 上；
+#                不对标准库打补丁，BLE（bleak/asyncio）、雷达串口和计算线程仍是普通线程
+# 可通过环境变量 AROUND_SERVER_MODE 选择
+SERVER_MODES = ('threading', 'gevent')
+SERVER_MODE = os.environ.get('AROUND_SERVER_MODE', 'threading')
+
+# 总线指标名 -> update_data 使用的键
+BUS_METRIC_KEYS = {'hr': 'hr', 'br': 'br', 'spo2': 'spo2', 'LF': 'LF', 'HF': 'HF', 'sdnn': 'SDNN'}
+
 
 class DataVisualizer:
     """Real-time data visualizer"""
     
-    def __init__(self, max_data_points=100, plot_refresh_fps=10, port=5000):
+    def __init__(self, max_data_points=100, plot_refresh_fps=10, port=5000, server_mode=SERVER_MODE):
         """
         Initialize the data visualizer
 
@@ -40,10 +57,12 @@ class DataVisualizer:
             max_data_points: maximum number of data points shown on plots
             plot_refresh_fps: refresh rate of the animated plots (frames per second)
             port: Flask server port
+            server_mode: 'threading' (Werkzeug dev server) or 'gevent' (production server, see SERVER_MODE)
         """
         self.max_data_points = max_data_points
         self.plot_refresh_fps = plot_refresh_fps
         self.port = port
+        self.server_mode = self._check_server_mode(server_mode)
         
         # 使用线程锁来确保在读写数据时不会发生冲突
         self.data_lock = threading.Lock()
@@ -67,14 +86,16 @@ class DataVisualizer:
         self.is_abnormal_state = False  # 标记是否处于异常状态（用于改变心率呼吸图表颜色）
         
         self.start_time = time.time()
+        # 每次 update_data 追加一行（data_history 各列同时追加一个值），seq 随之加 1，供 /api/state?since= 增量查询
+        self.data_seq = 0
         
         # 创建Flask应用，根据前端类型配置目录
         if USE_NEW_FRONTEND:
             # 新的React前端 - 使用 around-front-master/dist 目录
             print(f"[INFO] 使用新的React前端: {NEW_FRONTEND_DIR}")
-            self.app = Flask(__name__, 
-                            static_folder=NEW_FRONTEND_DIR,
-                            static_url_path='')
+            # 静态文件由启动时建立的内存索引提供（预压缩 + 强 ETag），不使用 Flask 自带的 static 路由
+            self.app = Flask(__name__, static_folder=None)
+            self.static_index = StaticAssetIndex(NEW_FRONTEND_DIR)
             self.use_new_frontend = True
         else:
             # 旧的原生JS前端 - 使用 js 目录
@@ -85,7 +106,8 @@ class DataVisualizer:
             self.use_new_frontend = False
         
         # 创建 SocketIO 实例（支持 WebSocket）
-        self.socketio = SocketIO(self.app, cors_allowed_origins="*", async_mode='threading')
+        self.socketio = SocketIO(self.app, cors_allowed_origins="*", async_mode=self.server_mode)
+        self.app.after_request(self._compress_response)
         self._setup_routes()
         self._setup_socketio()
         
@@ -94,6 +116,40 @@ class DataVisualizer:
         self.running = False
         # WebSocket 推送线程
         self.ws_push_thread = None
+        # 样本总线订阅（attach_bus 后由消费线程驱动 update_data）
+        self.bus = None
+        self.bus_subscription = None
+        self.bus_thread = None
+        # SocketIO 状态流（state_update 事件）：sid -> 该客户端的游标和发送状态
+        self.stream_clients = {}
+        self.stream_lock = threading.Lock()
+        self.stream_event = threading.Event()
+        self.stream_thread = None
+        # gevent 模式下服务器线程的 hub，其他线程的 emit 经它转交（见 _emit）
+        self._gevent_hub = None
+        # 客户端超过这么久没有确认上一条消息，视为确认丢失，继续发送
+        self.stream_ack_timeout = 5.0
+    
+    def attach_bus(self, bus, batch_window=0.05):
+        """
+        订阅 SampleBus，新样本到达后立即更新可视化数据，替代 FSM 每秒轮询推送
+
+        Args:
+            bus: SampleBus 实例
+            batch_window: 收到第一个样本后再等待的时间（秒），把同时发布的 LF/HF 等合并成一次更新
+        """
+        self.bus = bus
+        self.bus_subscription = bus.subscribe('visualizer', metrics=BUS_METRIC_KEYS.keys())
+
+        def consume():
+            while self.running:
+                samples = self.bus_subscription.get(timeout=1.0, batch_window=batch_window)
+                if samples:
+                    # 同一批中同一指标只保留最新值
+                    self.update_data({BUS_METRIC_KEYS[s.metric]: s.value for s in samples})
+
+        self.bus_thread = threading.Thread(target=consume, daemon=True)
+        self.bus_thread.start()
     
     def update_data(self, data_dict):
         """
@@ -154,8 +210,105 @@ class DataVisualizer:
                 last_ratio = self.data_history['lf_hf_ratio'][-1] if len(self.data_history['lf_hf_ratio']) > 0 else 1.0
                 self.lf_hf_ratio = last_ratio
                 self.data_history['lf_hf_ratio'].append(last_ratio)
+            self.data_seq += 1
+        # 唤醒状态流线程推送给已订阅的 SocketIO 客户端
+        self.stream_event.set()
 
     
+    @staticmethod
+    def _check_server_mode(server_mode):
+        """gevent 模式需要已安装 gevent，否则回退到 threading"""
+        if server_mode not in SERVER_MODES:
+            print(f"[WARNING] Unknown server mode {server_mode!r}, falling back to 'threading'")
+            return 'threading'
+        if server_mode == 'gevent':
+            if importlib.util.find_spec('gevent') is None:
+                print("[WARNING] gevent is not installed, falling back to 'threading' server mode")
+                return 'threading'
+        return server_mode
+
+    def _serve_gevent(self):
+        """
+        gevent pywsgi 服务器：HTTP/1.1 keep-alive，WebSocket 由 gevent-websocket 处理
+        与 socketio.run 的 gevent 分支相同，只是连接上关闭 Nagle：pywsgi 分开发送响应头和响应体，
+        keep-alive 连接上会撞上客户端的延迟 ACK，每个请求固定多出约 40 ms
+        """
+        import socket
+        import gevent
+        from gevent import pywsgi
+        try:
+            from geventwebsocket.handler import WebSocketHandler as handler_class
+        except ImportError:
+            # 没有 gevent-websocket 时由 simple-websocket 提供 WebSocket
+            handler_class = pywsgi.WSGIHandler
+
+        class NoDelayHandler(handler_class):
+            def __init__(self, sock, *args, **kwargs):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                super().__init__(sock, *args, **kwargs)
+
+        server = pywsgi.WSGIServer(('0.0.0.0', self.port), self.app, handler_class=NoDelayHandler, log=None)
+        self._gevent_hub = gevent.get_hub()
+        server.serve_forever()
+
+    def _emit(self, event, data, **kwargs):
+        """
+        从推送线程发送 SocketIO 事件
+        gevent 模式下 SocketIO 的队列和 greenlet 都属于服务器线程的 hub，不能从别的线程直接操作，
+        通过 run_callback_threadsafe 交给该 hub 在新的 greenlet 里发送
+        """
+        hub = self._gevent_hub
+        if hub is None:
+            self.socketio.emit(event, data, **kwargs)
+        else:
+            import gevent
+            hub.loop.run_callback_threadsafe(gevent.spawn, partial(self.socketio.emit, event, data, **kwargs))
+
+    def _blocking(self, fn, *args, **kwargs):
+        """
+        在请求 / SocketIO 回调里调用可能阻塞的函数（等待普通线程的锁或条件变量）
+        gevent 模式不打补丁，直接调用会卡住整个 hub（所有 HTTP 请求、WebSocket 和 _emit），
+        因此交给 hub 的线程池执行，当前 greenlet 让出等待结果；threading 模式直接调用
+        """
+        hub = self._gevent_hub
+        if hub is None:
+            return fn(*args, **kwargs)
+        return hub.threadpool.apply(fn, args, kwargs)
+
+    def _compress_response(self, response):
+        """
+        按 Accept-Encoding 对文本类响应做 br / gzip 压缩（/api/state 等接口、旧前端的静态文件）
+        压缩后 ETag 改为弱 ETag（同一资源的不同编码），条件请求仍可命中 304
+        """
+        # 已按 Accept-Encoding 协商过的响应（静态资源索引）不再处理
+        if (response.status_code != 200 or response.mimetype not in COMPRESSIBLE_MIMETYPES
+                or 'Content-Encoding' in response.headers or 'accept-encoding' in response.vary):
+            return response
+        accept = request.accept_encodings
+        if brotli is not None and accept['br']:
+            encoding = 'br'
+        elif accept['gzip']:
+            encoding = 'gzip'
+        else:
+            return response
+        # 旧前端的静态文件是文件流，先读出来（只对上面这些文本类型）
+        response.direct_passthrough = False
+        data = response.get_data()
+        if len(data) < COMPRESS_MIN_SIZE:
+            return response
+        if encoding == 'br':
+            # 实时压缩用较低的质量等级，压缩率接近 gzip -9，速度快得多
+            data = brotli.compress(data, quality=5)
+        else:
+            data = gzip.compress(data, compresslevel=6)
+        response.set_data(data)
+        response.headers['Content-Encoding'] = encoding
+        response.vary.add('Accept-Encoding')
+        etag, weak = response.get_etag()
+        if etag:
+            response.set_etag(etag, weak=True)
+        return response
+
     def _setup_routes(self):
         """Setup Flask routes"""
         
@@ -163,7 +316,7 @@ class DataVisualizer:
         def index():
             if self.use_new_frontend:
                 # React SPA - 直接发送 index.html
-                return send_from_directory(NEW_FRONTEND_DIR, 'index.html')
+                return self.static_index.response('index.html', request)
             else:
                 # 旧的模板渲染
                 return render_template('index.html')
@@ -172,63 +325,57 @@ class DataVisualizer:
         if self.use_new_frontend:
             @self.app.route('/<path:path>')
             def serve_spa(path):
-                # 如果请求的是静态文件，直接返回
-                full_path = os.path.join(NEW_FRONTEND_DIR, path)
-                if os.path.exists(full_path) and os.path.isfile(full_path):
-                    return send_from_directory(NEW_FRONTEND_DIR, path)
+                # 如果请求的是静态文件，直接从索引返回
+                response = self.static_index.response(path, request)
+                if response is not None:
+                    return response
+                # 不存在的接口和打包资源不回退到页面
+                if path.startswith(('api/', 'assets/')):
+                    abort(404)
                 # 否则返回 index.html（SPA 路由）
-                return send_from_directory(NEW_FRONTEND_DIR, 'index.html')
+                return self.static_index.response('index.html', request)
 
         @self.app.route('/api/state')
         def api_state():
-            with self.data_lock:
-                payload = {k: list(v) for k, v in self.data_history.items()}
-                payload['lf_hf_status'] = self.lf_hf_status
-                payload['is_abnormal'] = self.is_abnormal_state
-                # 添加 lf_hf 作为 lf_hf_ratio 的别名，方便前端访问
-                payload['lf_hf'] = payload.get('lf_hf_ratio', [])
-                # 添加radar实例的情绪评分数据（通过fsm_instance访问）
-                if hasattr(self, 'fsm_instance') and self.fsm_instance:
-                    payload['arousal_score'] = self.fsm_instance.arousal_score
-                    payload['valence_score'] = self.fsm_instance.valence_score
-                    
-                    # 计算情绪状态（二分类：arousal和valence都只有0或1）
-                    arousal = self.fsm_instance.arousal_score
-                    valence = self.fsm_instance.valence_score
-                    
-                    if arousal is not None and valence is not None:
-                        # 根据2x2象限判断情绪状态
-                        # Arousal (唤醒度): 0=Low (平静/冥想), 1=High (压力/娱乐)
-                        # Valence (效价): 0=Negative/Neutral (压力/平静), 1=Positive (娱乐/冥想)
-                        if arousal == 1 and valence == 0:
-                            # 高唤醒 + 消极 = 压力
-                            emotion_state = 'Stress'
-                            emotion_intensity = 'High'
-                        elif arousal == 1 and valence == 1:
-                            # 高唤醒 + 积极 = 娱乐
-                            emotion_state = 'Entertainment'
-                            emotion_intensity = 'High'
-                        elif arousal == 0 and valence == 0:
-                            # 低唤醒 + 消极 = 平静
-                            emotion_state = 'Calm'
-                            emotion_intensity = 'Low'
-                        else:  # arousal == 0 and valence == 1
-                            # 低唤醒 + 积极 = 冥想
-                            emotion_state = 'Meditation'
-                            emotion_intensity = 'Low'
-                        
-                        payload['emotion_state'] = emotion_state
-                        payload['emotion_intensity'] = emotion_intensity
-                    else:
-                        payload['emotion_state'] = None
-                        payload['emotion_intensity'] = None
-                else:
-                    payload['arousal_score'] = None
-                    payload['valence_score'] = None
-                    payload['emotion_state'] = None
-                    payload['emotion_intensity'] = None
-            return jsonify(payload)
+            """
+            生理数据快照
+            ?since=<seq>：只返回 seq 之后新追加的样本（客户端落后太多或服务重启时返回全量并带 reset=true）
+            响应带 ETag，状态未变化时对 If-None-Match 返回 304
+            """
+            since = request.args.get('since', type=int)
+            etag, payload = self._blocking(self._state_snapshot, since, request.if_none_match)
+            if payload is None:
+                response = Response(status=304)
+                response.set_etag(etag)
+                return response
+            response = jsonify(payload)
+            response.set_etag(etag)
+            return response
         
+        @self.app.route('/api/bus_stats')
+        def api_bus_stats():
+            """样本总线统计：各订阅者从发布到被消费的延迟（秒）和丢弃数量"""
+            if self.bus is None:
+                return jsonify({'error': 'sample bus not attached'}), 404
+            return jsonify(self.bus.stats())
+
+        @self.app.route('/api/emotion_plot')
+        def api_emotion_plot():
+            """情绪象限图 PNG；有人请求时 DataRecorder 才会在后台渲染"""
+            recorder = getattr(getattr(self, 'fsm_instance', None), 'recorder', None)
+            if recorder is None:
+                return jsonify({'error': 'recorder not available'}), 404
+            png = self._blocking(recorder.renderer.latest_png, timeout=2.0)
+            if png is None:
+                # 还没有可用的评分，或首次渲染尚未完成
+                return Response(status=204)
+            return Response(png, mimetype='image/png', headers={'Cache-Control': 'no-cache'})
+
+        @self.app.route('/api/stream_stats')
+        def api_stream_stats():
+            """SocketIO 状态流各客户端的发送统计"""
+            return jsonify(self._blocking(self.stream_stats))
+
         @self.app.route('/api/special_mode', methods=['POST'])
         def api_special_mode():
             """
@@ -262,6 +409,94 @@ class DataVisualizer:
                     'message': str(e)
                 }), 500
     
+    def _state_snapshot(self, since, if_none_match):
+        """
+        /api/state 的 (etag, payload)；If-None-Match 命中时 payload 为 None
+        since 为 None 时返回全量历史，否则返回游标之后的增量
+        """
+        with self.data_lock:
+            seq = self.data_seq
+            summary = self._state_summary()
+            etag = self._state_etag(seq, summary)
+            if if_none_match.contains_weak(etag):
+                return etag, None
+            if since is None:
+                payload = {k: list(v) for k, v in self.data_history.items()}
+                # 添加 lf_hf 作为 lf_hf_ratio 的别名，方便前端访问
+                payload['lf_hf'] = payload.get('lf_hf_ratio', [])
+            else:
+                payload = self._history_since(since, seq)
+        payload.update(summary)
+        payload['seq'] = seq
+        # 服务启动标识：变化说明后端重启过，客户端应丢弃本地缓存重新取全量
+        payload['epoch'] = int(self.start_time * 1000)
+        return etag, payload
+
+    def _history_since(self, since, seq):
+        """data_history 中 seq 大于 since 的样本（调用方持有 data_lock）"""
+        count = len(self.data_history['time'])
+        new = seq - since
+        if since < 0 or new < 0 or new > count:
+            # 客户端游标已被淘汰出窗口，或来自上一次运行：返回全量
+            payload = {k: list(v) for k, v in self.data_history.items()}
+            payload['reset'] = True
+        else:
+            # deque 从尾部按下标访问很快，只取新增的几个值
+            payload = {k: [v[i] for i in range(-new, 0)] for k, v in self.data_history.items()}
+            payload['reset'] = False
+        payload['since'] = since
+        payload['max_points'] = self.max_data_points
+        return payload
+
+    def _state_summary(self):
+        """/api/state 中除历史序列外的状态字段（调用方持有 data_lock）"""
+        summary = {
+            'lf_hf_status': self.lf_hf_status,
+            'is_abnormal': self.is_abnormal_state,
+            'arousal_score': None,
+            'valence_score': None,
+            'emotion_state': None,
+            'emotion_intensity': None,
+        }
+        # 添加radar实例的情绪评分数据（通过fsm_instance访问）
+        if hasattr(self, 'fsm_instance') and self.fsm_instance:
+            summary['arousal_score'] = self.fsm_instance.arousal_score
+            summary['valence_score'] = self.fsm_instance.valence_score
+            
+            # 计算情绪状态（二分类：arousal和valence都只有0或1）
+            arousal = self.fsm_instance.arousal_score
+            valence = self.fsm_instance.valence_score
+            
+            if arousal is not None and valence is not None:
+                # 根据2x2象限判断情绪状态
+                # Arousal (唤醒度): 0=Low (平静/冥想), 1=High (压力/娱乐)
+                # Valence (效价): 0=Negative/Neutral (压力/平静), 1=Positive (娱乐/冥想)
+                if arousal == 1 and valence == 0:
+                    # 高唤醒 + 消极 = 压力
+                    emotion_state = 'Stress'
+                    emotion_intensity = 'High'
+                elif arousal == 1 and valence == 1:
+                    # 高唤醒 + 积极 = 娱乐
+                    emotion_state = 'Entertainment'
+                    emotion_intensity = 'High'
+                elif arousal == 0 and valence == 0:
+                    # 低唤醒 + 消极 = 平静
+                    emotion_state = 'Calm'
+                    emotion_intensity = 'Low'
+                else:  # arousal == 0 and valence == 1
+                    # 低唤醒 + 积极 = 冥想
+                    emotion_state = 'Meditation'
+                    emotion_intensity = 'Low'
+                
+                summary['emotion_state'] = emotion_state
+                summary['emotion_intensity'] = emotion_intensity
+        return summary
+
+    def _state_etag(self, seq, summary):
+        """数据序号 + 状态字段决定 ETag；带上启动时间，避免重启后 seq 从 0 重新计数时误判未变化"""
+        digest = hash(tuple(summary.values())) & 0xffffffff
+        return f'{int(self.start_time * 1000):x}-{seq}-{digest:08x}'
+
     def _setup_socketio(self):
         """Setup WebSocket event handlers"""
         
@@ -273,6 +508,19 @@ class DataVisualizer:
         @self.socketio.on('disconnect')
         def handle_disconnect():
             print("[INFO] WebSocket client disconnected")
+            self._blocking(self._stream_unsubscribe, request.sid)
+
+        @self.socketio.on('subscribe_state')
+        def handle_subscribe_state(data=None):
+            """
+            订阅 state_update 推送；data 可带 {since, epoch} 从上次的游标续传（epoch 不一致时从全量开始）
+            客户端需要对每条 state_update 回调确认，未确认前新数据在服务端合并成下一条消息
+            """
+            data = data or {}
+            since = data.get('since')
+            if data.get('epoch') != int(self.start_time * 1000) or not isinstance(since, int):
+                since = -1
+            self._blocking(self._stream_subscribe, request.sid, since)
     
     def _ws_push_breathing_rate(self):
         """后台线程：每秒推送呼吸频率数据"""
@@ -285,7 +533,7 @@ class DataVisualizer:
                         latest_time = self.data_history['time'][-1] if len(self.data_history['time']) > 0 else 0
                         
                         # 通过 WebSocket 推送数据
-                        self.socketio.emit('breathing_rate_update', {
+                        self._emit('breathing_rate_update', {
                             'br': latest_br,
                             'time': latest_time,
                             'timestamp': time.time()
@@ -295,6 +543,73 @@ class DataVisualizer:
                 print(f"[ERROR] WebSocket push error: {e}")
                 time.sleep(1.0)
         
+    def _ws_stream_state(self):
+        """
+        后台线程：update_data 有新数据时把增量推送给每个订阅的客户端（格式同 /api/state?since=）
+        每个客户端同一时间只有一条未确认的消息；慢客户端在确认前到来的数据会合并进下一条消息，
+        落后超出窗口时改发全量（reset=true），服务端不会为慢客户端无限堆积消息
+        """
+        while self.running:
+            # 超时唤醒用于发现评分等非 update_data 驱动的状态变化，以及确认超时
+            self.stream_event.wait(timeout=1.0)
+            self.stream_event.clear()
+            with self.stream_lock:
+                clients = list(self.stream_clients.items())
+            for sid, client in clients:
+                try:
+                    self._stream_to_client(sid, client)
+                except Exception as e:
+                    print(f"[ERROR] WebSocket stream error: {e}")
+
+    def _stream_to_client(self, sid, client):
+        now = time.monotonic()
+        if client['inflight'] is not None:
+            if now - client['inflight'] < self.stream_ack_timeout:
+                return
+            client['timeouts'] += 1
+        with self.data_lock:
+            seq = self.data_seq
+            summary = self._state_summary()
+            etag = self._state_etag(seq, summary)
+            if etag == client['etag']:
+                return
+            payload = self._history_since(client['seq'], seq)
+        payload.update(summary)
+        payload['seq'] = seq
+        payload['epoch'] = int(self.start_time * 1000)
+        payload['server_time'] = time.time()
+        rows = len(payload['time'])
+        with self.stream_lock:
+            client.update(seq=seq, etag=etag, inflight=now, sent=client['sent'] + 1,
+                          max_rows=max(client['max_rows'], rows))
+        self._emit('state_update', payload, to=sid, callback=partial(self._blocking, self._stream_ack, sid))
+
+    def _stream_subscribe(self, sid, since):
+        with self.stream_lock:
+            self.stream_clients[sid] = {
+                'seq': since, 'etag': None, 'inflight': None,
+                'sent': 0, 'max_rows': 0, 'timeouts': 0,
+            }
+        self.stream_event.set()
+
+    def _stream_unsubscribe(self, sid):
+        with self.stream_lock:
+            self.stream_clients.pop(sid, None)
+
+    def _stream_ack(self, sid, *args):
+        """客户端确认收到上一条 state_update，可以发送下一条（在服务器线程上经 _blocking 调用）"""
+        with self.stream_lock:
+            client = self.stream_clients.get(sid)
+            if client is not None:
+                client['inflight'] = None
+        self.stream_event.set()
+
+    def stream_stats(self):
+        """各订阅客户端的发送条数、单条消息最多合并的样本数和确认超时次数"""
+        with self.stream_lock:
+            return {sid: {k: c[k] for k in ('seq', 'sent', 'max_rows', 'timeouts')}
+                    for sid, c in self.stream_clients.items()}
+
     def start_server(self):
         """启动Flask服务器和WebSocket推送线程"""
         if not self.running:
@@ -307,20 +622,26 @@ class DataVisualizer:
             )
             self.ws_push_thread.start()
             print("[INFO] WebSocket breathing rate push thread started")
+
+            # 启动多指标状态流线程（state_update）
+            self.stream_thread = threading.Thread(target=self._ws_stream_state, daemon=True)
+            self.stream_thread.start()
             
             # 启动 Flask + SocketIO 服务器
-            self.server_thread = threading.Thread(
-                target=lambda: self.socketio.run(
+            if self.server_mode == 'gevent':
+                run = self._serve_gevent
+            else:
+                run = lambda: self.socketio.run(
                     self.app, 
                     host='0.0.0.0', 
                     port=self.port, 
                     debug=False,
                     allow_unsafe_werkzeug=True
-                ),
-                daemon=True
-            )
+                )
+            self.server_thread = threading.Thread(target=run, daemon=True)
             self.server_thread.start()
-            print(f"[INFO] Data visualizer server started with WebSocket support, access at: http://localhost:{self.port}")
+            print(f"[INFO] Data visualizer server started ({self.server_mode} mode) with WebSocket support, "
+                  f"access at: http://localhost:{self.port}")
 
     def set_lf_hf_assessment(self, ratio, status=None):
         """External interface: set LF/HF ratio and assessment status.
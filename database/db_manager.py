@@ -1,25 +1,84 @@
 from pysqlcipher3 import dbapi2 as sqlite3
 import os
+import threading
+import weakref
+
+
+class _ThreadConnection:
+    """放在 threading.local 里的连接持有者：线程结束时随线程局部数据一起被回收，触发 finalize 关闭连接"""
+    __slots__ = ('conn', '__weakref__')
+
+    def __init__(self, conn):
+        self.conn = conn
+
 
 class DBManager:
-    def __init__(self, db_path, password):
+    """
+    加密数据库连接管理：每个线程持有一条长连接
+    PRAGMA key 的密钥派生（PBKDF2，故意很慢）只在该线程第一次使用时做一次，之后的仓库操作都复用这条连接
+    线程结束后它的连接自动关闭并从 _connections 中移除，短生命周期的线程不会累积连接
+    """
+
+    # 页缓存（KiB）。页大小由 cipher_compatibility = 3 决定（1024 字节），改了会使已有数据库无法解密，所以只调缓存
+    CACHE_SIZE_KB = 4096
+
+    def __init__(self, db_path, password, wal=True):
         self.db_path = db_path
         self.password = password
+        # WAL：写入只追加日志、读写互不阻塞，配合 synchronous = NORMAL 每次提交不再 fsync 主库文件
+        self.wal = wal
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = set()
+
+    def _open_connection(self):
+        # 连接只在创建它的线程里使用，关掉线程检查是为了 close_all 能在退出时统一关闭
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
 
-    def get_connection(self):
-        """获取一个已解密的数据库连接"""
-        conn = sqlite3.connect(self.db_path)
-        
         # --- 核心加密逻辑 ---
-        # 在执行任何操作前，必须先输入密码
-        conn.execute(f"PRAGMA key = '{self.password}';")
+        # 在执行任何操作前，必须先输入密码（单引号需转义）
+        conn.execute("PRAGMA key = '{}';".format(self.password.replace("'", "''")))
         # 强制启用加密（可选，验证用）
         conn.execute("PRAGMA cipher_compatibility = 3;")
-        
+        conn.execute(f"PRAGMA cache_size = -{self.CACHE_SIZE_KB};")
+        conn.execute("PRAGMA temp_store = MEMORY;")
+        if self.wal:
+            # 第一次读库（这里）时才真正派生密钥，密码错误会在此抛出
+            conn.execute("PRAGMA journal_mode = WAL;")
+            conn.execute("PRAGMA synchronous = NORMAL;")
+
         # 设置返回字典类型的结果，方便通过列名访问
         conn.row_factory = sqlite3.Row
         return conn
 
+    def get_connection(self):
+        """获取当前线程的已解密数据库连接（首次调用时打开，之后复用）"""
+        holder = getattr(self._local, 'holder', None)
+        if holder is None or holder.conn not in self._connections:
+            conn = self._open_connection()
+            holder = _ThreadConnection(conn)
+            weakref.finalize(holder, self._release, conn)
+            self._local.holder = holder
+            with self._lock:
+                self._connections.add(conn)
+        return holder.conn
+
+    def _release(self, conn):
+        """线程结束（或该线程的连接被替换）时关闭连接；close_all 已关闭的不会重复处理"""
+        with self._lock:
+            if conn not in self._connections:
+                return
+            self._connections.discard(conn)
+        conn.close()
+
     def close_connection(self, conn):
+        """连接由 DBManager 复用，这里只回滚未提交的事务（出错时不把半个事务留给下一次操作）"""
         if conn:
+            conn.rollback()
+
+    def close_all(self):
+        """关闭所有线程的连接（程序退出时调用）；之后再使用会重新打开"""
+        with self._lock:
+            connections, self._connections = self._connections, set()
+        for conn in connections:
             conn.close()
\ No newline at end of file
@@ -45,5 +45,8 @@ def main():
     for log in logs:
         print(f"读取到记录: 时间={log['timestamp']}, 分数={log['score']}")
 
+    # 退出前关闭各线程复用的连接
+    manager.close_all()
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -2,6 +2,24 @@ import uuid
 import time
 import json
 
+BREATHING_LOG_SQL = """
+INSERT INTO breathing_logs (uuid, timestamp, duration_sec, score, detail_json)
+VALUES (?, ?, ?, ?, ?)
+"""
+EMOTION_SQL = "INSERT INTO emotion_history (uuid, timestamp, emotion_type) VALUES (?, ?, ?)"
+
+
+def breathing_log_row(duration, score, details=None):
+    """一条呼吸训练记录的插入参数（UUID 和时间戳在调用时生成）"""
+    json_details = json.dumps(details) if details else "{}"
+    return (str(uuid.uuid4()), int(time.time()), duration, score, json_details)
+
+
+def emotion_row(emotion_type):
+    """一条情绪记录的插入参数（UUID 和时间戳在调用时生成）"""
+    return (str(uuid.uuid4()), int(time.time()), emotion_type)
+
+
 class AyuanRepo:
     def __init__(self, db_manager):
         self.db = db_manager
@@ -11,20 +29,13 @@ class AyuanRepo:
         """
         [cite_start]插入一条呼吸训练记录 [cite: 261-265]
         """
-        new_id = str(uuid.uuid4())
-        now = int(time.time())
-        json_details = json.dumps(details) if details else "{}"
-        
-        sql = """
-        INSERT INTO breathing_logs (uuid, timestamp, duration_sec, score, detail_json)
-        VALUES (?, ?, ?, ?, ?)
-        """
+        row = breathing_log_row(duration, score, details)
         
         conn = self.db.get_connection()
         try:
-            conn.execute(sql, (new_id, now, duration, score, json_details))
+            conn.execute(BREATHING_LOG_SQL, row)
             conn.commit()
-            print(f"日志已加密保存: ID {new_id}")
+            print(f"日志已加密保存: ID {row[0]}")
         finally:
             self.db.close_connection(conn)
 
@@ -49,14 +60,25 @@ class AyuanRepo:
         [cite_start]记录实时情绪状态 [cite: 130-135]
         emotion_type: 'Calm', 'Stress', 'Meditation', 'Entertainment'
         """
-        new_id = str(uuid.uuid4())
-        now = int(time.time())
-        
-        sql = "INSERT INTO emotion_history (uuid, timestamp, emotion_type) VALUES (?, ?, ?)"
-        
         conn = self.db.get_connection()
         try:
-            conn.execute(sql, (new_id, now, emotion_type))
+            conn.execute(EMOTION_SQL, emotion_row(emotion_type))
+            conn.commit()
+        finally:
+            self.db.close_connection(conn)
+
+    # --- 批量写入（WriteBehindQueue 使用） ---
+    def insert_batch(self, breathing_rows=(), emotion_rows=()):
+        """
+        在一个事务里插入多条记录（只提交一次）
+        breathing_rows / emotion_rows: breathing_log_row() / emotion_row() 生成的参数元组
+        """
+        conn = self.db.get_connection()
+        try:
+            if breathing_rows:
+                conn.executemany(BREATHING_LOG_SQL, breathing_rows)
+            if emotion_rows:
+                conn.executemany(EMOTION_SQL, emotion_rows)
             conn.commit()
         finally:
             self.db.close_connection(conn)
\ No newline at end of file
@@ -0,0 +1,141 @@
+import atexit
+import threading
+import time
+
+from repo import breathing_log_row, emotion_row
+
+
+class WriteBehindQueue:
+    """
+    情绪 / 呼吸记录的延迟批量写入
+    调用方只把记录放进内存缓冲区立即返回；后台线程在缓冲条数达到 max_batch、或最早一条已等待 max_delay 秒时，
+    用一个事务把缓冲区全部写入（一次提交 = 一次 fsync），程序退出时（close / atexit）写完剩余记录。
+    以 record_emotion 每 5 秒一条计算，默认参数下 SD 卡提交次数约为逐条提交的 1/12。
+    """
+
+    def __init__(self, repo, max_batch=50, max_delay=60.0, max_pending=5000):
+        """
+        :param repo: AyuanRepo
+        :param max_batch: 缓冲条数达到该值时立即写入
+        :param max_delay: 最早一条记录最多等待的秒数
+        :param max_pending: 写入持续失败时最多保留的记录数，超出后丢弃最旧的记录
+        """
+        self.repo = repo
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.max_pending = max_pending
+        self._breathing = []
+        self._emotions = []
+        self._first_at = None
+        # 写入失败后下一次重试的时间（期间即使缓冲区已满也不重试）
+        self._retry_at = None
+        self._cond = threading.Condition()
+        self._running = True
+        self.flushes = 0
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def add_breathing_log(self, duration, score, details=None):
+        """与 AyuanRepo.add_breathing_log 相同，但只进缓冲区"""
+        self._enqueue(self._breathing, breathing_log_row(duration, score, details))
+
+    def record_emotion(self, emotion_type):
+        """与 AyuanRepo.record_emotion 相同，但只进缓冲区"""
+        self._enqueue(self._emotions, emotion_row(emotion_type))
+
+    def get_recent_logs(self, limit=10):
+        """先写入缓冲区里的记录，再查询（保证能读到刚加入的记录）"""
+        self.flush()
+        return self.repo.get_recent_logs(limit)
+
+    def pending(self):
+        with self._cond:
+            return len(self._breathing) + len(self._emotions)
+
+    def _enqueue(self, rows, row):
+        with self._cond:
+            if not self._running:
+                raise RuntimeError("WriteBehindQueue 已关闭")
+            rows.append(row)
+            if self._first_at is None:
+                self._first_at = time.monotonic()
+            if len(self._breathing) + len(self._emotions) >= self.max_batch:
+                self._cond.notify()
+
+    def _take(self):
+        """取走缓冲区全部记录（需持有锁）"""
+        breathing, emotions = self._breathing, self._emotions
+        self._breathing, self._emotions, self._first_at = [], [], None
+        return breathing, emotions
+
+    def flush(self):
+        """立即在当前线程写入缓冲区全部记录；写入失败时记录放回缓冲区并抛出异常"""
+        with self._cond:
+            breathing, emotions = self._take()
+        if not breathing and not emotions:
+            return
+        try:
+            self.repo.insert_batch(breathing, emotions)
+            self.flushes += 1
+            self._retry_at = None
+        except Exception:
+            self._restore(breathing, emotions)
+            raise
+
+    def _restore(self, breathing, emotions):
+        """写入失败的记录放回缓冲区前部，超过 max_pending 时丢弃最旧的"""
+        with self._cond:
+            self._breathing = breathing + self._breathing
+            self._emotions = emotions + self._emotions
+            overflow = len(self._breathing) + len(self._emotions) - self.max_pending
+            if overflow > 0:
+                drop_emotions = min(overflow, len(self._emotions))
+                del self._emotions[:drop_emotions]
+                del self._breathing[:overflow - drop_emotions]
+                self.dropped += overflow
+            if self._first_at is None:
+                self._first_at = time.monotonic()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._running:
+                    now = time.monotonic()
+                    if self._retry_at is not None and now < self._retry_at:
+                        self._cond.wait(self._retry_at - now)
+                        continue
+                    count = len(self._breathing) + len(self._emotions)
+                    if count >= self.max_batch:
+                        break
+                    if self._first_at is not None:
+                        remaining = self._first_at + self.max_delay - now
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                    else:
+                        self._cond.wait()
+                if not self._running:
+                    return
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"[ERROR] 批量写入数据库失败，{self.pending()} 条记录保留待重试: {e}")
+                # 失败后等一个 max_delay 再重试，避免数据库不可用时空转
+                with self._cond:
+                    self._retry_at = time.monotonic() + self.max_delay
+
+    def close(self):
+        """停止后台线程并写入剩余记录（可重复调用）"""
+        with self._cond:
+            if not self._running:
+                return
+            self._running = False
+            self._cond.notify()
+        self._thread.join(timeout=5)
+        try:
+            self.flush()
+        except Exception as e:
+            print(f"[ERROR] 退出时写入数据库失败，丢弃 {self.pending()} 条记录: {e}")
+        atexit.unregister(self.close)
\ No newline at end of file
@@ -185,12 +185,11 @@ class dot():
         # if self.is_levitating:
         #     self.guide_finished()
         #     return
+        # 指令间隔由 BLE 指令队列保证，这里不再等待
         self.ble.message_sync('s=0')  # 进入非省电状态
-        time.sleep(0.5)
         duration = 10
         start = time.time()
         self.ble.mode_sync(7)  # warm yellow flash
-        time.sleep(0.5)
         self.ble.shake_sync(2)
         while not self.is_levitating and (time.time() - start) < duration and self.state == 'guiding_mode1':
             time.sleep(0.5)
@@ -207,11 +206,9 @@ class dot():
     def mode2(self):
         print('mode2')
         self.ble.message_sync('s=0')  # 进入非省电状态
-        time.sleep(0.5)
         duration = 8.0
         start = time.time()
         self.ble.mode_sync(2)  # blue-purple slow flow
-        time.sleep(0.5)
         self.ble.shake_sync(1)
         while not self.is_levitating and (time.time() - start) < duration and self.state == 'guiding_mode2':
             time.sleep(0.5)
@@ -229,16 +226,12 @@ class dot():
         print('start breath guide')
         time.sleep(0.2)
         self.ble.message_sync('s=0')
-        time.sleep(0.5)
         self.ble.mode_sync(1)
-        time.sleep(0.5)
         self.ble.shake_sync(4)
         self.music('breath3.WAV', max_duration=180, loops=5)
         print("breath guide finished")
         self.ble.mode_sync(3)
-        time.sleep(0.5)
         self.ble.shake_sync(0)
-        time.sleep(0.5)
         # s=1 由 on_exit 的 stop_interaction 处理
         
         if self.state == 'guiding_fatigue':
@@ -248,11 +241,8 @@ class dot():
         time.sleep(1)
         pygame.mixer.music.stop() # 停止音乐
         self.ble.mode_sync(3)#关灯
-        time.sleep(0.5)
         self.ble.shake_sync(0)#关震动
-        time.sleep(0.5)
         self.ble.jump_sync(0)#关跳动
-        time.sleep(0.5)
         self.ble.message_sync('s=1')  # 进入省电状态
 
     def music(self, sound_file, max_duration=None, loops=0):
@@ -332,7 +322,6 @@ class dot():
         start = time.time()
         self._mark_interaction()
         self.ble.color_sync(78, 58, 158)
-        time.sleep(0.5)
         self.ble.message_sync('s=0')
         while self.state == 'engaged':
             
@@ -345,7 +334,6 @@ class dot():
                 self._mark_interaction()
                 if not self.is_levitating:
                     self.ble.mode_sync(2)
-                    time.sleep(0.5)
                 while not self.is_levitating:
                     print('start inspiration monitoring')
                     if self.ble.gyroscope[-1] == 1 and self.ble.gyroscope[-2] == 1:
@@ -389,12 +377,12 @@ class dot():
             return
         self.idle_mode_running = True
         self.ble.message_sync('s=0')  # 进入非省电状态
-        time.sleep(0.5)
         self.ble.color_sync(200, 220, 255)  # soft white steady
         idle_start = time.time()
         while self.state == 'desk_idle' and (time.time() - idle_start) < 300 and not self.is_levitating and self.is_here:
             # gentle pulse every 30s
-            self.ble.shake_sync(3)
+            # 震动 0.5 秒：等 v=3 真正发出后再计时，否则排队中的 v=3 会被随后的 v=0 覆盖
+            self.ble.shake_sync(3).wait(timeout=5)
             time.sleep(0.5)
             self.ble.shake_sync(0)
             for _ in range(30):
@@ -433,11 +421,9 @@ class dot():
     def mode3(self):
         print('mode3: intense shake response')
         self.ble.message_sync('s=0')  # 进入非省电状态
-        time.sleep(0.5)
         duration = 12.0
         start = time.time()
         self.ble.mode_sync(4)  # orange fast flow
-        time.sleep(0.5) 
         self.ble.shake_sync(3)
         while not self.is_levitating and (time.time() - start) < duration and self.state == 'guiding_mode3':
             time.sleep(0.25)
@@ -474,7 +460,6 @@ class dot():
 
         time.sleep(0.5)
         self.ble.message_sync('s=0')  # 进入非省电状态
-        time.sleep(0.5)
         # TODO: 在这里添加444呼吸模式的具体行为
         self.ble.message_sync('m=1')
         self.hall.write_string('platform_flag*1')
@@ -1,15 +1,18 @@
 import pandas as pd
 import numpy as np
 import pickle
-import neurokit2 as nk
 import glob
 import os
-import joblib
-from sklearn.preprocessing import StandardScaler
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.model_selection import LeaveOneGroupOut
-from sklearn.metrics import classification_report
-from scipy.stats import linregress
+import argparse
+import hashlib
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+from flat_forest import FlatForest, flatten_forest
+
+# 训练相关的重依赖（neurokit2 / sklearn / scipy.stats）在用到的函数里再导入，
+# 在线推断只加载扁平模型（.npz），不需要导入 sklearn
 
 # =========================================
 # 配置项
@@ -19,16 +22,33 @@ SAMPLING_RATE = 700
 WINDOW_SIZE = 60
 STEP_SIZE = 10
 MODEL_SAVE_PATH = 'stress_detection_model.pkl'  # 模型保存路径
+CACHE_DIR = 'wesad_cache'  # 每个受试者 1Hz 预处理结果的缓存目录（按原始文件哈希 + 参数命名）
+PREPROCESS_VERSION = 1     # 预处理算法改动时加 1，使旧缓存失效
+# 完整 LOSO 评估的候选模型 (n_estimators, max_depth)，第一个为当前训练保存的配置
+LOSO_CANDIDATES = [(100, 10), (50, 10), (50, 8), (25, 8), (25, 6), (10, 6)]
+PREPROCESS_WORKERS = None  # 并行预处理的进程数，默认 min(CPU 核数, 4)（每个进程要把整个受试者 pkl 读进内存）
+
+# 模型输入特征（顺序与训练时的 DataFrame 列一致）
+FEATURE_COLUMNS = ['HR_mean', 'HR_std', 'HR_range', 'RR_mean', 'RR_std', 'HR_slope', 'PRQ']
 
 # WESAD 所有受试者 ID (S12 数据通常有问题,一般排除)
 SUBJECT_IDS = ['S2', 'S3', 'S4', 'S5', 'S6', 'S7', 'S8', 'S9', 'S10', 'S11', 'S13', 'S14', 'S15', 'S16', 'S17']
 
 
-def radar_simulation_from_wesad(file_path):
+def radar_simulation_from_wesad(file_path, timings=None):
+    """
+    原始 700Hz 胸部信号 -> 1Hz 的 HR / RR / Label
+    timings: 传入 dict 时记录各阶段耗时（秒）：load / ecg / rsp / downsample
+    """
+    import neurokit2 as nk
+
+    timings = {} if timings is None else timings
     print(f"正在加载並处理数据: {file_path} ...")
     
+    t0 = time.perf_counter()
     with open(file_path, 'rb') as file:
         data = pickle.load(file, encoding='latin1')
+    timings['load'] = time.perf_counter() - t0
 
     # 提取原始信号
     ecg_signal = data['signal']['chest']['ECG'].flatten()
@@ -37,46 +57,171 @@ def radar_simulation_from_wesad(file_path):
 
     # --- A. 处理 ECG 得到心率 (HR) ---
     print("正在从 ECG 提取心率 (模拟雷达 HR)...")
+    t0 = time.perf_counter()
     # 清洗并找到 R 波
     ecg_cleaned = nk.ecg_clean(ecg_signal, sampling_rate=SAMPLING_RATE)
     peaks, _ = nk.ecg_peaks(ecg_cleaned, sampling_rate=SAMPLING_RATE)
     # 计算瞬时心率 (与原始信号长度一致)
     hr_series = nk.signal_rate(peaks, sampling_rate=SAMPLING_RATE, desired_length=len(ecg_signal))
+    timings['ecg'] = time.perf_counter() - t0
 
     # --- B. 处理 Resp 得到呼吸率 (RR) ---
     print("正在从 Resp 提取呼吸率 (模拟雷达 RR)...")
+    t0 = time.perf_counter()
     resp_cleaned = nk.rsp_clean(resp_signal, sampling_rate=SAMPLING_RATE)
     df_resp, _ = nk.rsp_process(resp_cleaned, sampling_rate=SAMPLING_RATE)
     # NeuroKit2 的 rsp_process 会直接输出 'RSP_Rate' 列
     rr_series = df_resp['RSP_Rate'].values
+    timings['rsp'] = time.perf_counter() - t0
 
     # --- C. 降采样到 1Hz (关键步骤) ---
-    # 创建一个临时 DataFrame 来对齐数据
-    df_raw = pd.DataFrame({
-        'HR': hr_series,
-        'RR': rr_series,
-        'Label': labels
-    })
-
-    # 每 700 个点 (1秒) 取一次平均，模拟雷达每秒输出一次数据
-    # 对于 Label，我们取该秒内的众数
-    df_1hz = df_raw.groupby(df_raw.index // SAMPLING_RATE).agg({
-        'HR': 'mean',
-        'RR': 'mean',
-        'Label': lambda x: x.mode()[0] if not x.mode().empty else 0
-    })
+    t0 = time.perf_counter()
+    df_1hz = downsample_1hz(hr_series, rr_series, labels)
+    timings['downsample'] = time.perf_counter() - t0
 
     print(f"预处理完成。1Hz 数据形状: {df_1hz.shape}")
     return df_1hz
 
+
+def _block_nanmean(values, starts, counts):
+    """按块求均值，忽略 NaN（与 pandas groupby().mean() 一致，整块都是 NaN 时为 NaN）"""
+    values = np.asarray(values, dtype=float)
+    valid = ~np.isnan(values)
+    sums = np.add.reduceat(np.where(valid, values, 0.0), starts)
+    n = np.add.reduceat(valid.astype(np.int64), starts)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(n > 0, sums / n, np.nan)
+
+
+def downsample_1hz(hr_series, rr_series, labels, sampling_rate=SAMPLING_RATE):
+    """
+    每 sampling_rate 个点 (1秒) 取一次平均，模拟雷达每秒输出一次数据；Label 取该秒内的众数（并列时取最小值）
+    结果与 groupby(index // sampling_rate) + mean / mode 相同，但不逐组调用 Python 函数
+    """
+    labels = np.asarray(labels).ravel().astype(np.int64)
+    n = len(labels)
+    starts = np.arange(0, n, sampling_rate)
+    counts = np.diff(np.append(starts, n))
+    # 每秒的标签直方图：组号 * 标签数 + 标签，一次 bincount
+    n_labels = int(labels.max()) + 1 if n else 1
+    group = np.repeat(np.arange(len(starts)), counts)
+    histogram = np.bincount(group * n_labels + labels, minlength=len(starts) * n_labels)
+    mode = histogram.reshape(len(starts), n_labels).argmax(axis=1)
+    return pd.DataFrame({
+        'HR': _block_nanmean(hr_series, starts, counts),
+        'RR': _block_nanmean(rr_series, starts, counts),
+        'Label': mode,
+    })
+
+
+def _file_hash(path, chunk_size=1 << 22):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def preprocess_subject(file_path, cache_dir=CACHE_DIR):
+    """
+    带磁盘缓存的 radar_simulation_from_wesad：缓存键为原始文件内容哈希 + 采样率 + PREPROCESS_VERSION，
+    命中时直接读 .npz，完全跳过 NeuroKit 处理
+
+    返回:
+        (df_1hz, timings)，timings 为各阶段耗时（秒），命中缓存时只有 hash / cache
+    """
+    timings = {}
+    t0 = time.perf_counter()
+    key = hashlib.sha1(f'{_file_hash(file_path)}-{SAMPLING_RATE}-{PREPROCESS_VERSION}'.encode()).hexdigest()[:16]
+    timings['hash'] = time.perf_counter() - t0
+    name = os.path.splitext(os.path.basename(file_path))[0]
+    cache_path = os.path.join(cache_dir, f'{name}-{key}.npz') if cache_dir else None
+
+    if cache_path and os.path.exists(cache_path):
+        t0 = time.perf_counter()
+        with np.load(cache_path) as cached:
+            df_1hz = pd.DataFrame({'HR': cached['HR'], 'RR': cached['RR'], 'Label': cached['Label']})
+        timings['cache'] = time.perf_counter() - t0
+        return df_1hz, timings
+
+    df_1hz = radar_simulation_from_wesad(file_path, timings)
+    if cache_path:
+        os.makedirs(cache_dir, exist_ok=True)
+        # 先写临时文件再改名，并行进程或中断不会留下半个缓存
+        tmp_path = cache_path[:-len('.npz')] + f'.{os.getpid()}.tmp.npz'
+        np.savez(tmp_path, HR=df_1hz['HR'].to_numpy(), RR=df_1hz['RR'].to_numpy(), Label=df_1hz['Label'].to_numpy())
+        os.replace(tmp_path, cache_path)
+    return df_1hz, timings
+
+
+def _preprocess_worker(args):
+    """进程池入口：出错时返回错误信息而不是抛出，其他受试者继续处理"""
+    subj_id, file_path, cache_dir = args
+    try:
+        df_1hz, timings = preprocess_subject(file_path, cache_dir)
+        return subj_id, df_1hz, timings, None
+    except Exception as e:
+        return subj_id, None, {}, str(e)
+
+def sliding_windows(series, size=WINDOW_SIZE, step=STEP_SIZE):
+    """
+    把 1Hz 序列切成滑动窗口，返回 (窗口数, size) 的只读视图（stride tricks，不拷贝数据）
+    用于回放录制的会话：sliding_windows(hr), sliding_windows(rr) 直接传给 EmotionDetector.predict_batch
+    """
+    series = np.asarray(series, dtype=float)
+    if len(series) < size:
+        return np.empty((0, size))
+    return np.lib.stride_tricks.sliding_window_view(series, size)[::step]
+
+
+def window_features(hr_windows, rr_windows, ddof=0):
+    """
+    批量计算窗口特征，训练（extract_features_dual_label）和在线推断（predict_batch）共用
+
+    参数:
+        hr_windows, rr_windows: 形状 (窗口数, 窗口长度) 的心率 / 呼吸率
+        ddof: 标准差的自由度修正；训练时与 pandas .std() 一致用 1，在线推断沿用 numpy 默认的 0
+    返回:
+        ndarray (窗口数, 7)，列顺序为 FEATURE_COLUMNS
+    """
+    hr = np.asarray(hr_windows, dtype=float)
+    rr = np.asarray(rr_windows, dtype=float)
+    hr_mean = hr.mean(axis=1)
+    rr_mean = rr.mean(axis=1)
+    # 最小二乘斜率的闭式解：sum((x - x̄) * y) / sum((x - x̄)^2)
+    x = np.arange(hr.shape[1]) - (hr.shape[1] - 1) / 2
+    slope = hr @ x / (x @ x)
+    return np.column_stack([
+        hr_mean,
+        hr.std(axis=1, ddof=ddof),
+        hr.max(axis=1) - hr.min(axis=1),
+        rr_mean,
+        rr.std(axis=1, ddof=ddof),
+        slope,
+        hr_mean / (rr_mean + 1e-5),
+    ])
+
+
+def window_mode(windows):
+    """每个窗口（行）中出现次数最多的非负整数值，并列时取最小值（与 pandas .mode()[0] 一致）"""
+    windows = np.asarray(windows).astype(np.int64)
+    n_windows, size = windows.shape
+    if n_windows == 0:
+        return np.empty(0, dtype=np.int64)
+    n_values = int(windows.max()) + 1
+    codes = windows + (np.arange(n_windows) * n_values)[:, np.newaxis]
+    histogram = np.bincount(codes.ravel(), minlength=n_windows * n_values).reshape(n_windows, n_values)
+    return histogram.argmax(axis=1)
+
+
 # =========================================
 # 2. 特徵工程：提取衍生数据 (Windowing & Stats)
 # =========================================
 def extract_features_dual_label(df_1hz):
-    X_features = []
-    y_arousal = []
-    y_valence = []
-
+    """
+    60 秒窗口、10 秒步长切窗后一次性计算全部窗口的特征和标签（窗口位置与原来的
+    for i in range(0, len(df_1hz) - 60, 10) 相同），不再逐窗口 iloc / mode / linregress
+    """
     # WESAD 原始标签: 1=Baseline, 2=Stress, 3=Amusement, 4=Meditation
     # 我们全部都要用
     valid_labels = [1, 2, 3, 4]
@@ -88,59 +233,68 @@ def extract_features_dual_label(df_1hz):
     # Valence (效价): 0=Negative/Neutral (压力/平静), 1=Positive (娱乐/冥想)
     map_valence = {1: 0, 2: 0, 3: 1, 4: 1}
 
-    for i in range(0, len(df_1hz) - 60, 10): # 窗口60，步长10
-        window = df_1hz.iloc[i : i + 60]
-        label = window['Label'].mode()[0]
-        
-        if label not in valid_labels:
-            continue
+    n_windows = len(range(0, len(df_1hz) - WINDOW_SIZE, STEP_SIZE))
+    hr_windows = sliding_windows(df_1hz['HR'].to_numpy())[:n_windows]
+    rr_windows = sliding_windows(df_1hz['RR'].to_numpy())[:n_windows]
+    labels = window_mode(sliding_windows(df_1hz['Label'].to_numpy())[:n_windows])
 
-        # --- 特征提取 (保持不变) ---
-        feat = {}
-        feat['HR_mean'] = window['HR'].mean()
-        feat['HR_std'] = window['HR'].std()
-        feat['HR_range'] = window['HR'].max() - window['HR'].min()
-        feat['RR_mean'] = window['RR'].mean()
-        feat['RR_std'] = window['RR'].std()
-        # 简单斜率
-        slope, _, _, _, _ = linregress(np.arange(len(window)), window['HR'].values)
-        feat['HR_slope'] = slope
-        # 脉搏呼吸商
-        feat['PRQ'] = feat['HR_mean'] / (feat['RR_mean'] + 1e-5)
-        
-        X_features.append(feat)
-        
-        # --- 使用固定映射进行二分类 ---
-        y_arousal.append(map_arousal[label])
-        y_valence.append(map_valence[label])
+    keep = np.isin(labels, valid_labels)
+    # --- 特征提取 (与原逐窗口算法一致：pandas 的 std 为 ddof=1) ---
+    features = window_features(hr_windows[keep], rr_windows[keep], ddof=1)
+    labels = labels[keep]
+
+    # --- 使用固定映射进行二分类 ---
+    y_arousal = np.array([map_arousal[label] for label in labels.tolist()], dtype=int)
+    y_valence = np.array([map_valence[label] for label in labels.tolist()], dtype=int)
 
-    return pd.DataFrame(X_features), np.array(y_arousal), np.array(y_valence)
+    return pd.DataFrame(features, columns=FEATURE_COLUMNS), y_arousal, y_valence
 
 # =========================================
 # 1. 升级版数据加载：循环 + 标准化
 # =========================================
-def load_and_preprocess_all_subjects(subject_ids):
+def load_and_preprocess_all_subjects(subject_ids, workers=PREPROCESS_WORKERS, cache_dir=CACHE_DIR):
+    """
+    各受试者的 NeuroKit 预处理在进程池中并行（结果按 subject_ids 顺序合并），1Hz 结果缓存在 cache_dir；
+    标准化和特征提取在主进程完成，最后打印各阶段耗时
+    workers: 进程数，1 表示在当前进程串行处理；cache_dir: None 表示不使用缓存
+    """
+    from sklearn.preprocessing import StandardScaler
+
     all_subjects_features = []
     all_subjects_arousal_labels = []
     all_subjects_valence_labels = []
     all_subjects_groups = [] # 用于记录这行数据属于哪个人
 
+    jobs = []
     for subj_id in subject_ids:
         file_path = os.path.join(WESAD_ROOT_DIR, subj_id, f'{subj_id}.pkl')
         
         if not os.path.exists(file_path):
             print(f"跳过: 找不到 {file_path}")
             continue
-            
-        print(f"正在处理受试者: {subj_id} ...")
-        
+        jobs.append((subj_id, file_path, cache_dir))
+
+    if workers is None:
+        workers = min(os.cpu_count() or 1, 4)
+    workers = max(1, min(workers, len(jobs)))
+    print(f"正在预处理 {len(jobs)} 名受试者（{workers} 个进程）...")
+    t_start = time.perf_counter()
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_preprocess_worker, jobs))
+    else:
+        results = [_preprocess_worker(job) for job in jobs]
+    preprocess_wall = time.perf_counter() - t_start
 
-        try:
-            df_1hz = radar_simulation_from_wesad(file_path)
-        except Exception as e:
-            print(f"处理 {subj_id} 出错: {e}")
+    stage_report = []
+    t_start = time.perf_counter()
+    for subj_id, df_1hz, timings, error in results:
+        if error is not None:
+            print(f"处理 {subj_id} 出错: {error}")
             continue
 
+        t0 = time.perf_counter()
+
         # --- B. 关键步骤：个体标准化 (Z-Score) ---
         # 目的：把 HR=60 变成 "-1.2" (相对值)，消除个体差异
         scaler = StandardScaler()
@@ -152,12 +306,18 @@ def load_and_preprocess_all_subjects(subject_ids):
         # 调用上一段代码定义的 extract_features
         X_df, y_arousal, y_valence = extract_features_dual_label(df_1hz)
         
+        timings['features'] = time.perf_counter() - t0
+        stage_report.append((subj_id, timings))
+        
         if len(X_df) > 0:
             all_subjects_features.append(X_df)
             all_subjects_arousal_labels.append(y_arousal)
             all_subjects_valence_labels.append(y_valence)
             # 记录这批数据属于当前这个受试者
             all_subjects_groups.append(np.full(len(X_df), subj_id))
+    features_wall = time.perf_counter() - t_start
+
+    _print_stage_report(stage_report, preprocess_wall, features_wall)
 
     # 合并所有人的数据
     if not all_subjects_features:
@@ -170,10 +330,25 @@ def load_and_preprocess_all_subjects(subject_ids):
     
     return X_final, y_arousal_final, y_valence_final, groups_final
 
+def _print_stage_report(stage_report, preprocess_wall, features_wall):
+    """各受试者各阶段耗时（秒）+ 两个阶段的总墙钟时间"""
+    stages = ['hash', 'cache', 'load', 'ecg', 'rsp', 'downsample', 'features']
+    print("\n各阶段耗时 (秒):")
+    print(f"{'受试者':<5}" + ''.join(f"{stage:>11}" for stage in stages))
+    for subj_id, timings in stage_report:
+        print(f"{subj_id:<8}" + ''.join(f"{timings[stage]:>11.2f}" if stage in timings else f"{'-':>11}"
+                                        for stage in stages))
+    print(f"预处理（并行）墙钟时间: {preprocess_wall:.2f} 秒，标准化 + 特征提取: {features_wall:.2f} 秒\n")
+
 # =========================================
 # 2. 升级版主程序：使用 LOSO 验证
 # =========================================
 def main_multi_user():
+    import joblib
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.model_selection import LeaveOneGroupOut
+    from sklearn.metrics import classification_report
+
     # 1. 加载所有数据
     print("开始加载多用户数据...")
     result = load_and_preprocess_all_subjects(SUBJECT_IDS)
@@ -226,6 +401,7 @@ def main_multi_user():
     arousal_model_path = MODEL_SAVE_PATH.replace('.pkl', '_arousal.pkl')
     print(f"正在保存 Arousal 模型到 {arousal_model_path}...")
     joblib.dump(clf_arousal, arousal_model_path)
+    flatten_forest(clf_arousal).save(flat_model_path(arousal_model_path))
     print("Arousal 模型保存成功!")
     
     # 评估 Arousal
@@ -253,6 +429,7 @@ def main_multi_user():
     valence_model_path = MODEL_SAVE_PATH.replace('.pkl', '_valence.pkl')
     print(f"正在保存 Valence 模型到 {valence_model_path}...")
     joblib.dump(clf_valence, valence_model_path)
+    flatten_forest(clf_valence).save(flat_model_path(valence_model_path))
     print("Valence 模型保存成功!")
     
     # 评估 Valence
@@ -264,6 +441,168 @@ def main_multi_user():
     print(f"预测标签分布: Negative={np.sum(y_valence_pred==0)}, Positive={np.sum(y_valence_pred==1)}")
     print(classification_report(y_valence_test, y_valence_pred, target_names=['Negative Valence (<5)', 'Positive Valence (>=5)'], zero_division=0))
 
+# =========================================
+# 3. 完整 LOSO 评估：所有折并行 + 候选模型的体积 / 加载时间 / 推断延迟
+# =========================================
+def _new_forest(n_estimators, max_depth, n_jobs=-1):
+    """与 main_multi_user 相同的随机森林配置（只改变树的数量和深度）"""
+    from sklearn.ensemble import RandomForestClassifier
+
+    return RandomForestClassifier(
+        n_estimators=n_estimators,
+        max_depth=max_depth,
+        random_state=42,
+        n_jobs=n_jobs,
+        class_weight='balanced'
+    )
+
+
+def _loso_fold(X, y_arousal, y_valence, train_idx, test_idx, n_estimators, max_depth):
+    """训练并评估一折（留出一名受试者），返回该受试者两个任务的指标"""
+    from sklearn.metrics import accuracy_score, balanced_accuracy_score, f1_score
+
+    metrics = {}
+    for target, y in (('arousal', y_arousal), ('valence', y_valence)):
+        # 并行在折之间，折内单线程
+        clf = _new_forest(n_estimators, max_depth, n_jobs=1).fit(X[train_idx], y[train_idx])
+        y_pred = clf.predict(X[test_idx])
+        with warnings.catch_warnings():
+            # 留出的受试者可能只有一个类别
+            warnings.simplefilter('ignore')
+            metrics[target] = {
+                'accuracy': accuracy_score(y[test_idx], y_pred),
+                'balanced_accuracy': balanced_accuracy_score(y[test_idx], y_pred),
+                'f1': f1_score(y[test_idx], y_pred, average='macro', zero_division=0),
+            }
+    return metrics
+
+
+def _model_footprint(X, y_arousal, y_valence, n_estimators, max_depth, repeats=200):
+    """
+    用全部数据训练候选配置的两个模型，测量 .pkl / .npz 文件大小、加载时间和单窗口推断延迟（两个模型合计）
+    """
+    import tempfile
+    import joblib
+
+    models = [_new_forest(n_estimators, max_depth).fit(X, y) for y in (y_arousal, y_valence)]
+    window = X.iloc[[0]]
+    result = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [os.path.join(tmp, f'{name}.pkl') for name in ('arousal', 'valence')]
+        for model, path in zip(models, paths):
+            joblib.dump(model, path)
+            flatten_forest(model).save(flat_model_path(path))
+        for kind, load in (('pkl', joblib.load), ('npz', FlatForest.load)):
+            files = paths if kind == 'pkl' else [flat_model_path(path) for path in paths]
+            t0 = time.perf_counter()
+            loaded = [load(path) for path in files]
+            result[f'{kind}_load'] = time.perf_counter() - t0
+            result[f'{kind}_size'] = sum(os.path.getsize(path) for path in files)
+            latencies = []
+            for _ in range(repeats):
+                t0 = time.perf_counter()
+                for model in loaded:
+                    model.predict(window)
+                latencies.append(time.perf_counter() - t0)
+            result[f'{kind}_latency'] = float(np.median(latencies))
+    return result
+
+
+def evaluate_loso(X, y_arousal, y_valence, groups, candidates=None, n_jobs=-1):
+    """
+    对每个候选 (n_estimators, max_depth) 跑完整的留一受试者交叉验证（所有折用 joblib 并行），
+    打印每名受试者的平衡准确率，以及各候选的平均指标、模型体积、加载时间和单窗口推断延迟
+
+    返回:
+        list[dict]，每个候选一项：n_estimators / max_depth / per_subject / 平均指标 / 体积与延迟
+    """
+    from joblib import Parallel, delayed
+    from sklearn.model_selection import LeaveOneGroupOut
+
+    candidates = LOSO_CANDIDATES if candidates is None else candidates
+    X_values = X.to_numpy()
+    folds = list(LeaveOneGroupOut().split(X_values, y_arousal, groups))
+    subjects = [groups[test_idx][0] for _, test_idx in folds]
+    print(f"\n完整 LOSO 评估：{len(folds)} 折，{len(candidates)} 个候选模型")
+
+    results = []
+    for n_estimators, max_depth in candidates:
+        t0 = time.perf_counter()
+        fold_metrics = Parallel(n_jobs=n_jobs)(
+            delayed(_loso_fold)(X_values, y_arousal, y_valence, train_idx, test_idx, n_estimators, max_depth)
+            for train_idx, test_idx in folds)
+        elapsed = time.perf_counter() - t0
+        result = {'n_estimators': n_estimators, 'max_depth': max_depth, 'loso_time': elapsed,
+                  'per_subject': dict(zip(subjects, fold_metrics))}
+        for target in ('arousal', 'valence'):
+            for metric in ('accuracy', 'balanced_accuracy', 'f1'):
+                values = [m[target][metric] for m in fold_metrics]
+                result[f'{target}_{metric}'] = float(np.mean(values))
+                result[f'{target}_{metric}_std'] = float(np.std(values))
+        result.update(_model_footprint(X, y_arousal, y_valence, n_estimators, max_depth))
+        results.append(result)
+        print(f"  n_estimators={n_estimators:<4} max_depth={max_depth:<3} 完成（LOSO {elapsed:.1f} 秒）")
+
+    _print_loso_report(results, subjects)
+    return results
+
+
+def _print_loso_report(results, subjects):
+    names = [f"{r['n_estimators']}x{r['max_depth']}" for r in results]
+    for target in ('arousal', 'valence'):
+        print(f"\n每名受试者的 {target.capitalize()} 平衡准确率（列为 n_estimators x max_depth）:")
+        print(f"{'受试者':<5}" + ''.join(f"{name:>10}" for name in names))
+        for subject in subjects:
+            print(f"{subject:<8}" + ''.join(f"{r['per_subject'][subject][target]['balanced_accuracy']:>10.3f}"
+                                            for r in results))
+    print("\n候选模型汇总（平衡准确率为各折均值 ± 标准差；大小、加载时间、延迟均为两个模型合计）:")
+    print(f"{'模型':<6}{'Arousal':>18}{'Valence':>18}{'pkl KB':>9}{'npz KB':>9}"
+          f"{'pkl 加载ms':>11}{'npz 加载ms':>11}{'pkl 延迟ms':>11}{'npz 延迟ms':>11}")
+    for name, r in zip(names, results):
+        print(f"{name:<8}"
+              f"{r['arousal_balanced_accuracy']:>10.3f} ± {r['arousal_balanced_accuracy_std']:.3f}"
+              f"{r['valence_balanced_accuracy']:>10.3f} ± {r['valence_balanced_accuracy_std']:.3f}"
+              f"{r['pkl_size'] / 1024:>9.0f}{r['npz_size'] / 1024:>9.0f}"
+              f"{r['pkl_load'] * 1e3:>13.1f}{r['npz_load'] * 1e3:>13.1f}"
+              f"{r['pkl_latency'] * 1e3:>13.2f}{r['npz_latency'] * 1e3:>13.3f}")
+
+
+def main_loso(candidates=None):
+    """加载全部受试者后只做完整 LOSO 评估，不保存模型"""
+    print("开始加载多用户数据...")
+    X, y_arousal, y_valence, groups = load_and_preprocess_all_subjects(SUBJECT_IDS)
+    if X is None:
+        print("未加载到数据。")
+        return None
+    return evaluate_loso(X, y_arousal, y_valence, groups, candidates)
+
+
+def _parse_candidates(text):
+    """'100x10,50x8' -> [(100, 10), (50, 8)]"""
+    return [tuple(int(v) for v in item.split('x')) for item in text.split(',') if item]
+
+
+def flat_model_path(model_path):
+    """sklearn 模型 .pkl 对应的扁平模型路径（同名 .npz）"""
+    return os.path.splitext(model_path)[0] + '.npz'
+
+
+def export_flat_models(model_paths=None):
+    """
+    把已保存的 sklearn 随机森林 .pkl 导出为扁平数组模型 .npz（EmotionDetector 优先加载）
+    训练结束时会自动导出；已有 .pkl 时单独运行：python emotion_dete.py --export-flat
+    """
+    import joblib
+
+    if model_paths is None:
+        model_paths = [MODEL_SAVE_PATH.replace('.pkl', '_arousal.pkl'), MODEL_SAVE_PATH.replace('.pkl', '_valence.pkl')]
+    for model_path in model_paths:
+        forest = flatten_forest(joblib.load(model_path))
+        out_path = flat_model_path(model_path)
+        forest.save(out_path)
+        print(f"已导出 {model_path} -> {out_path}（{len(forest.roots)} 棵树，{forest.node_count} 个节点）")
+
+
 class EmotionDetector:
     """
     情绪检测器类：用于预测 Arousal（唤醒度）和 Valence（效价）
@@ -277,6 +616,7 @@ class EmotionDetector:
         参数:
             arousal_model_path: Arousal模型路径，默认自动寻找
             valence_model_path: Valence模型路径，默认自动寻找
+        同名的扁平模型 .npz 存在时优先加载（不导入 sklearn，启动更快、内存更小）
         """
         # 设置默认路径
         if arousal_model_path is None:
@@ -291,6 +631,11 @@ class EmotionDetector:
         
         if self.arousal_model is None or self.valence_model is None:
             raise ValueError("模型加载失败，请检查模型文件路径")
+        for model in (self.arousal_model, self.valence_model):
+            # predict_batch 直接传 ndarray，列顺序必须与训练时一致
+            names = getattr(model, 'feature_names_in_', None)
+            if names is not None and list(names) != FEATURE_COLUMNS:
+                raise ValueError(f"模型特征列 {list(names)} 与 {FEATURE_COLUMNS} 不一致")
         
         print("情绪检测器初始化完成！\n")
     
@@ -305,11 +650,18 @@ class EmotionDetector:
         返回:
             加载的模型对象
         """
+        flat_path = flat_model_path(model_path)
+        if os.path.exists(flat_path):
+            print(f"  加载{model_name}模型: {flat_path}")
+            return FlatForest.load(flat_path)
+        
         if not os.path.exists(model_path):
             print(f"错误: {model_name}模型文件 {model_path} 不存在")
             return None
         
-        print(f"  加载{model_name}模型: {model_path}")
+        import joblib
+
+        print(f"  加载{model_name}模型: {model_path}（可运行 python emotion_dete.py --export-flat 导出扁平模型）")
         model = joblib.load(model_path)
         return model
     
@@ -342,6 +694,37 @@ class EmotionDetector:
         
         return result
     
+    @staticmethod
+    def _predict(model, X):
+        """对 ndarray 调用 predict（模型用 DataFrame 训练，列顺序已在初始化时校验，忽略缺少列名的警告）"""
+        with warnings.catch_warnings():
+            warnings.filterwarnings('ignore', message='X does not have valid feature names')
+            return model.predict(X)
+
+    def predict_batch(self, hr_windows, rr_windows):
+        """
+        批量预测多个窗口的 Arousal 和 Valence（两个模型各只调用一次 predict）
+
+        参数:
+            hr_windows: 心率窗口，形状 (窗口数, 60)；可用 sliding_windows() 从整段会话生成
+            rr_windows: 呼吸率窗口，形状与 hr_windows 相同
+
+        返回:
+            dict: {'arousal': ndarray(窗口数,), 'valence': ndarray(窗口数,)}，取值含义同 predict_from_features
+        """
+        hr_windows = np.atleast_2d(np.asarray(hr_windows, dtype=float))
+        rr_windows = np.atleast_2d(np.asarray(rr_windows, dtype=float))
+        if hr_windows.shape != rr_windows.shape:
+            raise ValueError(f"HR 窗口 {hr_windows.shape} 与 RR 窗口 {rr_windows.shape} 形状不一致")
+        if len(hr_windows) == 0:
+            empty = np.empty(0, dtype=int)
+            return {'arousal': empty, 'valence': empty.copy()}
+        X = window_features(hr_windows, rr_windows)
+        return {
+            'arousal': self._predict(self.arousal_model, X).astype(int),
+            'valence': self._predict(self.valence_model, X).astype(int),
+        }
+
     def predict_from_signals(self, hr_array, rr_array, verbose=True):
         """
         直接从60秒的心率和呼吸率数据预测 Arousal 和 Valence
@@ -369,32 +752,26 @@ class EmotionDetector:
             print(f"错误: 输入数据长度必须为60秒，当前 HR={len(hr_array)}, RR={len(rr_array)}")
             return None
         
-        # 提取特征
-        feat = {}
-        feat['HR_mean'] = hr_array.mean()
-        feat['HR_std'] = hr_array.std()
-        feat['HR_range'] = hr_array.max() - hr_array.min()
-        feat['RR_mean'] = rr_array.mean()
-        feat['RR_std'] = rr_array.std()
-        
-        # 计算心率斜率
-        slope, _, _, _, _ = linregress(np.arange(60), hr_array)
-        feat['HR_slope'] = slope
-        
-        # 计算脉搏呼吸商
-        feat['PRQ'] = feat['HR_mean'] / (feat['RR_mean'] + 1e-5)
+        # 单窗口走批量路径
+        batch = self.predict_batch(hr_array[np.newaxis], rr_array[np.newaxis])
+        arousal_pred, valence_pred = batch['arousal'][0], batch['valence'][0]
+        result = {
+            'arousal': int(arousal_pred),
+            'valence': int(valence_pred)
+        }
         
-        # 转换为DataFrame
-        X_new = pd.DataFrame([feat])
+        if verbose:
+            print(f"\n预测结果: Arousal={'High(>=5)' if arousal_pred == 1 else 'Low(<5)'}, Valence={'Positive(>=5)' if valence_pred == 1 else 'Negative(<5)'}")
         
-        # 调用预测函数
-        return self.predict_from_features(X_new, verbose=verbose)
+        return result
 
 # =========================================
 # 向后兼容的函数（已废弃，建议使用EmotionDetector类）
 # =========================================
 def load_model(model_path=MODEL_SAVE_PATH):
     """已废弃：建议使用 EmotionDetector 类"""
+    import joblib
+
     if not os.path.exists(model_path):
         print(f"错误: 模型文件 {model_path} 不存在")
         return None
@@ -407,4 +784,15 @@ def predict_from_signals(hr_array, rr_array, arousal_model_path=None, valence_mo
     return detector.predict_from_signals(hr_array, rr_array)
 
 if __name__ == "__main__":
-    main_multi_user()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='WESAD 情绪分类模型训练')
+    parser.add_argument('--export-flat', action='store_true', help='只把已保存的 .pkl 模型导出为扁平模型 .npz')
+    parser.add_argument('--loso', action='store_true', help='完整留一受试者交叉验证，比较候选模型（不保存模型）')
+    parser.add_argument('--candidates', type=_parse_candidates, default=None,
+                        help='候选模型，如 100x10,50x8（n_estimators x max_depth），默认 LOSO_CANDIDATES')
+    args = parser.parse_args()
+    if args.export_flat:
+        export_flat_models()
+    elif args.loso:
+        main_loso(args.candidates)
+    else:
+        main_multi_user()
\ No newline at end of file
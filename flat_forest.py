@@ -0,0 +1,109 @@
+"""
+随机森林分类器的扁平数组表示与纯 NumPy 推断（运行时不依赖 sklearn）
+
+所有树的节点首尾相接存成几个连续数组（.npz）：
+    feature   int32   (节点数,)       分裂特征下标（叶子为 0）
+    threshold float64 (节点数,)       分裂阈值，x[feature] <= threshold 走左子树（叶子为 +inf）
+    left      int32   (节点数,)       左子节点（全局下标，叶子指向自己）
+    right     int32   (节点数,)       右子节点（全局下标，叶子指向自己）
+    value     float64 (节点数, 类别数) 叶子上的类别概率
+    roots     int32   (树数,)         每棵树根节点的全局下标
+叶子节点自环，所有样本、所有树一起同步向下走 max_depth 步即可到达叶子，不需要逐节点判断是否为叶子。
+预测与 sklearn RandomForestClassifier.predict 一致：各树叶子概率取平均后 argmax。
+
+导出：emotion_dete.py --export-flat（或训练结束时自动导出）
+"""
+import numpy as np
+
+FORMAT_VERSION = 1
+
+
+def flatten_forest(model):
+    """
+    把已训练的 sklearn RandomForestClassifier 展平为 FlatForest（只读取属性，不导入 sklearn）
+    """
+    features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+    offset = 0
+    for estimator in model.estimators_:
+        tree = estimator.tree_
+        leaf = tree.children_left < 0
+        index = np.arange(tree.node_count)
+        roots.append(offset)
+        features.append(np.where(leaf, 0, tree.feature))
+        thresholds.append(np.where(leaf, np.inf, tree.threshold))
+        lefts.append(np.where(leaf, index, tree.children_left) + offset)
+        rights.append(np.where(leaf, index, tree.children_right) + offset)
+        # 旧版 sklearn 存的是（加权）样本数，新版是比例，统一归一化为概率
+        value = tree.value[:, 0, :].astype(np.float64)
+        values.append(value / value.sum(axis=1, keepdims=True))
+        offset += tree.node_count
+    names = getattr(model, 'feature_names_in_', None)
+    return FlatForest(
+        feature=np.concatenate(features).astype(np.int32),
+        threshold=np.concatenate(thresholds).astype(np.float64),
+        left=np.concatenate(lefts).astype(np.int32),
+        right=np.concatenate(rights).astype(np.int32),
+        value=np.concatenate(values),
+        roots=np.asarray(roots, dtype=np.int32),
+        classes=np.asarray(model.classes_),
+        max_depth=max(estimator.tree_.max_depth for estimator in model.estimators_),
+        feature_names=None if names is None else [str(n) for n in names],
+    )
+
+
+class FlatForest:
+    """扁平数组随机森林，接口与 sklearn 分类器的 predict / predict_proba 对齐"""
+
+    def __init__(self, feature, threshold, left, right, value, roots, classes, max_depth, feature_names=None):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.value = value
+        self.roots = roots
+        self.classes_ = classes
+        self.max_depth = int(max_depth)
+        self.feature_names_in_ = None if feature_names is None else np.asarray(feature_names, dtype=object)
+        # 左右子节点交错存放：children[2 * node + 0/1] 为左/右，一次 gather 完成分支
+        self._children = np.stack([left, right], axis=1).ravel()
+
+    @property
+    def node_count(self):
+        return len(self.feature)
+
+    def save(self, path):
+        """保存为未压缩的 .npz（加载时无需解压）"""
+        np.savez(path, version=FORMAT_VERSION, feature=self.feature, threshold=self.threshold,
+                 left=self.left, right=self.right, value=self.value, roots=self.roots,
+                 classes=self.classes_, max_depth=self.max_depth,
+                 feature_names=np.asarray([] if self.feature_names_in_ is None else self.feature_names_in_, dtype=str))
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            if int(data['version']) != FORMAT_VERSION:
+                raise ValueError(f'{path}: unsupported flat forest version {int(data["version"])}')
+            names = data['feature_names'].tolist()
+            return cls(data['feature'], data['threshold'], data['left'], data['right'], data['value'],
+                       data['roots'], data['classes'], data['max_depth'], names or None)
+
+    def _as_matrix(self, X):
+        if hasattr(X, 'columns') and self.feature_names_in_ is not None:
+            X = X[list(self.feature_names_in_)]
+        # 与 sklearn 相同：特征先转 float32 再与 float64 阈值比较
+        return np.atleast_2d(np.asarray(X, dtype=np.float32)).astype(np.float64)
+
+    def predict_proba(self, X):
+        X = self._as_matrix(X)
+        n_samples, n_features = X.shape
+        # 在展平的 X 上按 行偏移 + 特征下标 取值，比二维花式索引快
+        flat_x = X.ravel()
+        row_offset = (np.arange(n_samples) * n_features)[:, np.newaxis]
+        node = np.broadcast_to(self.roots, (n_samples, len(self.roots))).copy()
+        for _ in range(self.max_depth):
+            go_left = flat_x[row_offset + self.feature[node]] <= self.threshold[node]
+            node = self._children[2 * node + ~go_left]
+        return self.value[node].mean(axis=1)
+
+    def predict(self, X):
+        return self.classes_.take(np.argmax(self.predict_proba(X), axis=1))
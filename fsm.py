@@ -5,9 +5,14 @@ import threading
 import os
 from datetime import datetime
 from data_visualizer import DataVisualizer
-from collections import deque
 from data_recorder import DataRecorder
 from ble import BLE
+from sample_bus import SampleBus
+from metric_store import MetricStore
+
+# FSM.data 中融合的指标，与总线上发布的 metric 名一致
+FSM_METRICS = ('HF', 'LF', 'lf_hf', 'sdnn', 'hr', 'br', 'spo2')
+
 
 class FSM():
     def __init__(self, data_source='radar', enable_visualization=True, viz_port=5000, ble_instance=None):
@@ -23,16 +28,13 @@ class FSM():
         self.viz_port = viz_port
         self.state = None
         self.recorder = DataRecorder(self)
+        # 传感器样本总线：雷达/HRV/PPG 有新值时发布，FSM 和可视化器各自订阅
+        self.bus = SampleBus()
+        self.subscription = self.bus.subscribe('fsm', metrics=FSM_METRICS)
         
-        self.data = {
-            'HF' : deque(maxlen=240),
-            'LF' : deque(maxlen=240),
-            'lf_hf' : deque(maxlen=240),
-            'sdnn' : deque(maxlen=240),
-            'hr' : deque(maxlen=240),
-            'br' : deque(maxlen=240),
-            'spo2' : deque(maxlen=240),
-        }
+        # 每个指标保留最近 1024 个带时间戳的样本：样本按事件到达，
+        # 容量按最快约 4 Hz 的数据源留足 DataRecorder 的 240 s 统计窗口
+        self.data = MetricStore(FSM_METRICS, capacity=1024)
         # 常模数据库
         self.norms = {
             'young_male': {  # 年轻男性常模
@@ -70,65 +72,21 @@ class FSM():
         
         # 根据数据源初始化相应的设备
         if data_source in ['radar', 'both']:
-            self.radar = MicRadar(port ='/dev/ttyS3',window_size=20)
+            self.radar = MicRadar(port ='/dev/ttyS3',window_size=20, bus=self.bus)
         else:
             self.radar = None
             
         if data_source in ['ppg', 'both']:
             # 使用传入的ble_instance来初始化PPG
-            self.ppg_device = ppg.PPG(ble_instance=ble_instance)
+            self.ppg_device = ppg.PPG(ble_instance=ble_instance, bus=self.bus)
             self.ppg_device.connect()
         else:
             self.ppg_device = None
         
-    def update_current_data(self):
-        """从多种数据源获取实时数据并融合"""
-        # 从PPG获取数据
-        if self.data_source == 'ppg' or self.data_source == 'both':
-            # if self.ppg_device.SDNN is not None:
-            #     self.data['sdnn'].append(self.ppg_device.SDNN)
-            if self.ppg_device.HF is not None:
-                self.data['HF'].append(self.ppg_device.HF)
-            if self.ppg_device.LF is not None:
-                self.data['LF'].append(self.ppg_device.LF)
-            if self.ppg_device.blood_oxygen is not None and self.ppg_device.blood_oxygen > 0:
-                self.data['spo2'].append(self.ppg_device.blood_oxygen)
-        
-        # 从Radar获取数据   
-        if self.data_source == 'radar' or self.data_source == 'both':
-            if self.radar.HF is not None:
-                self.data['HF'].append(self.radar.HF)
-            if self.radar.LF is not None:
-                self.data['LF'].append(self.radar.LF)
-            if self.radar.LF_HF_ratio is not None:
-                self.data['lf_hf'].append(self.radar.LF_HF_ratio)
-            if self.radar.SDNN is not None:
-                self.data['sdnn'].append(self.radar.SDNN)
-            if self.radar.breath_rate and len(self.radar.breath_rate) > 0:
-                self.data['br'].append(self.radar.breath_rate[-1])
-            if self.radar.heart_rate and len(self.radar.heart_rate) > 0:
-                self.data['hr'].append(self.radar.heart_rate[-1])
-
-    def update_visualizer_only(self):
-        """更新可视化器"""
-        if self.visualizer and self.visualizer.is_running():
-            viz_data = {}
-            if self.data['hr'] and len(self.data['hr']) > 0:
-                viz_data['hr'] = self.data['hr'][-1]
-            if self.data['br'] and len(self.data['br']) > 0:
-                viz_data['br'] = self.data['br'][-1]
-            if self.data['LF'] and len(self.data['LF']) > 0:
-                viz_data['LF'] = self.data['LF'][-1]
-            if self.data['HF'] and len(self.data['HF']) > 0:
-                viz_data['HF'] = self.data['HF'][-1]
-            if self.data['spo2'] and len(self.data['spo2']) > 0:
-                viz_data['spo2'] = self.data['spo2'][-1]
-            if self.data['sdnn'] and len(self.data['sdnn']) > 0:
-                viz_data['SDNN'] = self.data['sdnn'][-1]
-            
-            # 只在有数据时更新
-            if viz_data:
-                self.visualizer.update_data(viz_data)
+    def update_current_data(self, samples):
+        """把总线上收到的样本按指标追加到 self.data（只追加真正的新样本，不再重复追加旧值）"""
+        if samples:
+            self.data.extend(samples)
 
     def emotion_monitor(self,):
         time.sleep(60)
@@ -166,13 +124,12 @@ class FSM():
             self.visualizer = DataVisualizer(port=self.viz_port)
             self.visualizer.fsm_instance = self
             self.visualizer.start_server()
+            self.visualizer.attach_bus(self.bus)
         else:
             self.visualizer = None
         while self.running:
-            self.update_current_data()
-            self.update_visualizer_only()
-            
-            time.sleep(1)  # 改为1秒，实现每秒更新可视化
+            # 有新样本立即处理；超时只是为了能及时响应 stop()
+            self.update_current_data(self.subscription.get(timeout=1.0))
     
     def stop(self):
         self.running = False
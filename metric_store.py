@@ -0,0 +1,143 @@
+import threading
+import time
+
+import numpy as np
+
+
+class MetricStore:
+    """
+    按指标分列的带时间戳环形缓冲区（取代 FSM.data 中的 deque(maxlen=240)）
+
+    每个指标一列 float64 数值 + 一列 float64 时间戳（time.time()），预分配、加锁写入。
+    每列按 2 * capacity 存两份（写入位置 i 和 i + capacity 同时写），
+    因此“最近 n 个”永远是一段连续内存，不需要拼接两段。
+
+    mean()/stats()/rolling() 在锁内直接对内部切片视图做归约，不拷贝；
+    window()/window_ts()/since() 返回副本（写满后下一次追加就会覆盖视图的第一个元素，视图不能带出锁外）。
+    """
+
+    def __init__(self, metrics, capacity=240):
+        """
+        :param metrics: 指标名列表（如 FSM_METRICS）
+        :param capacity: 每个指标保留的样本数
+        """
+        self.metrics = tuple(metrics)
+        self.capacity = capacity
+        self._col = {m: i for i, m in enumerate(self.metrics)}
+        self._values = np.zeros((len(self.metrics), 2 * capacity))
+        self._ts = np.zeros((len(self.metrics), 2 * capacity))
+        self._head = [0] * len(self.metrics)   # 下一次写入位置（0..capacity-1）
+        self._count = [0] * len(self.metrics)  # 已有样本数（不超过 capacity）
+        self._lock = threading.Lock()
+
+    def _append(self, col, value, ts):
+        h = self._head[col]
+        self._values[col, h] = self._values[col, h + self.capacity] = value
+        self._ts[col, h] = self._ts[col, h + self.capacity] = ts
+        self._head[col] = (h + 1) % self.capacity
+        if self._count[col] < self.capacity:
+            self._count[col] += 1
+
+    def append(self, metric, value, ts=None):
+        with self._lock:
+            self._append(self._col[metric], value, time.time() if ts is None else ts)
+
+    def extend(self, samples):
+        """批量追加总线样本（sample_bus.Sample），整批只加一次锁"""
+        with self._lock:
+            for s in samples:
+                self._append(self._col[s.metric], s.value, s.ts)
+
+    def count(self, metric):
+        return self._count[self._col[metric]]
+
+    def age(self, metric, now=None):
+        """最早一个保留样本距今的秒数，没有数据时返回 None"""
+        col = self._col[metric]
+        with self._lock:
+            if not self._count[col]:
+                return None
+            start, _ = self._span(col, None)
+            return (time.time() if now is None else now) - self._ts[col, start]
+
+    def _span(self, col, last):
+        n = self._count[col] if last is None else min(last, self._count[col])
+        end = self._head[col] + self.capacity
+        return end - n, end
+
+    def _window(self, col, last):
+        """最近 last 个样本的内部视图（需持有锁，且只在锁内读取）"""
+        start, end = self._span(col, last)
+        return self._values[col, start:end]
+
+    def _since(self, col, seconds, now):
+        """最近 seconds 秒内样本的内部视图（需持有锁，且只在锁内读取）"""
+        cutoff = (time.time() if now is None else now) - seconds
+        start, end = self._span(col, None)
+        ts = self._ts[col, start:end]
+        # 单个指标的时间戳按追加顺序递增，二分查找窗口起点
+        return self._values[col, start + int(np.searchsorted(ts, cutoff)):end]
+
+    def window(self, metric, last=None):
+        """最近 last 个样本（None 表示全部），按时间从旧到新的副本"""
+        col = self._col[metric]
+        with self._lock:
+            return self._window(col, last).copy()
+
+    def window_ts(self, metric, last=None):
+        """与 window() 对应的 (时间戳, 数值) 副本"""
+        col = self._col[metric]
+        with self._lock:
+            start, end = self._span(col, last)
+            return self._ts[col, start:end].copy(), self._values[col, start:end].copy()
+
+    def since(self, metric, seconds, now=None):
+        """最近 seconds 秒内的样本副本"""
+        col = self._col[metric]
+        with self._lock:
+            return self._since(col, seconds, now).copy()
+
+    def mean(self, metric, last=None, seconds=None):
+        """最近 last 个样本（或最近 seconds 秒，优先）的均值，没有数据时返回 None"""
+        col = self._col[metric]
+        with self._lock:
+            values = self._since(col, seconds, None) if seconds is not None else self._window(col, last)
+            return float(values.mean()) if len(values) else None
+
+    def stats(self, metric, last=None, seconds=None):
+        """
+        窗口内的 mean / std（样本标准差，与 statistics.stdev 一致）/ min / max
+        :param last: 最近多少个样本；seconds: 最近多少秒（优先）；都为 None 表示全部
+        :return: dict，没有数据的项为 None
+        """
+        col = self._col[metric]
+        with self._lock:
+            values = self._since(col, seconds, None) if seconds is not None else self._window(col, last)
+            n = len(values)
+            if not n:
+                return {'mean': None, 'std': None, 'min': None, 'max': None}
+            return {
+                'mean': float(values.mean()),
+                'std': float(values.std(ddof=1)) if n > 1 else None,
+                'min': float(values.min()),
+                'max': float(values.max()),
+            }
+
+    def rolling(self, metric, size, last=None):
+        """
+        滑动窗口统计（向量化），窗口长度 size，结果与最后 len - size + 1 个样本对齐
+        :return: dict(mean, std, min, max)，每项为 ndarray；样本不足 size 时为空数组
+        """
+        col = self._col[metric]
+        with self._lock:
+            values = self._window(col, last)
+            if len(values) < size:
+                empty = np.empty(0)
+                return {'mean': empty, 'std': empty, 'min': empty, 'max': empty}
+            segs = np.lib.stride_tricks.sliding_window_view(values, size)
+            return {
+                'mean': segs.mean(axis=1),
+                'std': segs.std(axis=1, ddof=1) if size > 1 else np.zeros(len(segs)),
+                'min': segs.min(axis=1),
+                'max': segs.max(axis=1),
+            }
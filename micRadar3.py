@@ -1,17 +1,34 @@
 import serial
-import struct
 import time
 import threading
+import os
+import selectors
 from collections import deque
 from HRVcalculate import HRVcalculate
+from radar_parser import RadarFrameParser, calc_checksum
 # from emotion_dete import EmotionDetector
 
 class MicRadar:
-    def __init__(self, port="COM14", baudrate=115200, window_size=40):
+    def __init__(self, port="COM14", baudrate=115200, window_size=40, read_mode='event', bus=None):
+        """
+        :param read_mode: 'event' 在串口 fd 上 select 阻塞，有数据才唤醒；
+                          'legacy' 为原来的 0.1s 超时轮询读取（不支持 fileno 的平台自动回退）
+        :param bus: SampleBus 实例，解析到心率/呼吸率（以及 HRV 结果）时发布样本
+        """
         self.port = port
+        self.bus = bus
         self.baudrate = baudrate
-        self.buffer = bytearray()
+        self.read_mode = read_mode
+        self.parser = RadarFrameParser()
         self.is_reading = False 
+        self._wakeup_pipe = None
+        self.active_read_mode = None
+
+        # 读线程统计：唤醒次数、读线程 CPU 时间
+        self.read_wakeups = 0
+        self.read_cpu_time = 0.0
+        self._read_cpu_start = 0.0
+        self._read_start_time = None
 
         self.window_size = window_size
         self.rri_mat = None
@@ -31,7 +48,7 @@ class MicRadar:
         self.HF = None
         self.LF_HF_ratio = None
 
-        self.hrv_calculator = HRVcalculate(self, None, window_size=self.window_size)
+        self.hrv_calculator = HRVcalculate(self, None, window_size=self.window_size, bus=bus)
         # self.emotion_detector = EmotionDetector()
         self.arousal = None
         self.valence = None
@@ -108,8 +125,14 @@ class MicRadar:
 
     def disconnect(self):
         self.is_reading = False
+        self._wake_reader()
         if self.read_thread and self.read_thread.is_alive():
             self.read_thread.join(timeout=1.0)  # 添加超时避免无限等待
+        if self._wakeup_pipe and not (self.read_thread and self.read_thread.is_alive()):
+            # 读线程已退出才关闭唤醒管道，否则它还在 select 这两个 fd
+            for fd in self._wakeup_pipe:
+                os.close(fd)
+            self._wakeup_pipe = None
         self.ser.close()
         print("已关闭串口连接")
         
@@ -118,77 +141,120 @@ class MicRadar:
         连续从串口读取并解析帧：
         帧结构：53 59 | CTRL(1) | CMD(1) | LEN(2) | PAYLOAD | CKSUM(1) | 54 43
         CTRL/CMD 均可动态判断，LEN 为 payload 长度
+        解析交给 RadarFrameParser，一次读到的所有整帧都会在本轮处理完
         """  
         while self.is_reading:
             chunk = self.ser.read(self.ser.in_waiting or 1)
-            if not chunk:
-                continue
-            self.buffer.extend(chunk)
-
-            # 找到帧头
-            idx = self.buffer.find(b'\x53\x59')
-            if idx < 0 or len(self.buffer) < idx + 8:
-                # 不足以读取 CTRL/CMD/LEN，再等数据
-                continue
-
-            # 读 CTRL(1)、CMD(1)、LEN(2)
-            ctrl, cmd, length = struct.unpack_from('>BBH', self.buffer, idx+2)
-            total_len = 2 + 1 + 1 + 2 + length + 1 + 2  # header+ctrl+cmd+len+payload+cksum+footer
+            self.read_wakeups += 1
+            if chunk:
+                for ctrl, cmd, payload in self.parser.feed(chunk):
+                    self.handle_frame(ctrl, cmd, payload)
+            self.read_cpu_time = time.thread_time() - self._read_cpu_start
 
-            # 判断缓存是否有整帧
-            if len(self.buffer) < idx + total_len:
-                continue
+    def read_events(self):
+        """
+        事件驱动读取：在串口 fd 上 select 阻塞，只有串口有数据（或 disconnect 唤醒）时才返回，
+        空闲时不再每 0.1s 醒来一次
+        """
+        selector = selectors.DefaultSelector()
+        selector.register(self.ser.fileno(), selectors.EVENT_READ, 'serial')
+        selector.register(self._wakeup_pipe[0], selectors.EVENT_READ, 'wakeup')
+        try:
+            while self.is_reading:
+                events = selector.select()
+                self.read_wakeups += 1
+                for key, _ in events:
+                    if key.data == 'wakeup':
+                        os.read(key.fd, 64)
+                        continue
+                    chunk = self.ser.read(self.ser.in_waiting or 1)
+                    for ctrl, cmd, payload in self.parser.feed(chunk):
+                        self.handle_frame(ctrl, cmd, payload)
+                self.read_cpu_time = time.thread_time() - self._read_cpu_start
+        finally:
+            selector.close()
 
-            frame = self.buffer[idx:idx+total_len]  
-            # 校验帧尾
-            if frame[-2:] != b'\x54\x43':
-                # 如果帧尾不对，跳过一个字节继续
-                self.buffer = self.buffer[idx+1:]
-                continue
+    def _use_event_reader(self):
+        if self.read_mode != 'event':
+            return False
+        try:
+            self.ser.fileno()
+        except (AttributeError, OSError, NotImplementedError):
+            # Windows 等平台的串口没有可 select 的 fd
+            return False
+        return hasattr(os, 'pipe')
 
-            # 验证校验和
-            core = frame[: 2+1+1+2+length]  # header…payload
-            if self.calc_checksum(core) != frame[2+1+1+2+length]:
-                # 校验失败则跳过
-                self.buffer = self.buffer[idx+1:]
-                continue
+    def _wake_reader(self):
+        if self._wakeup_pipe:
+            try:
+                os.write(self._wakeup_pipe[1], b'\0')
+            except OSError:
+                pass
 
-            # 根据 CTRL/CMD 分发处理
-            payload = frame[2+1+1+2 : 2+1+1+2+length]
-            if (ctrl, cmd) == (0x85, 0x02):
-                # 心率：payload[0] 单字节
-                hr = payload[0]
-                
-                if hr != 0:
-                    self.heart_rate.append(hr)
-                    self._last_hr_time = time.time()  # track latest valid HR for presence detection
-                    print(f"HR_Rad: {hr} BPM")
-            # elif (ctrl, cmd) == (0x85, 0x05):
-            #     # 心率波形：payload[5] 五个字节
-            #     hr_wave = list(payload[:5])
-            #     print(f"心率波形：{hr_wave} ")
-            elif (ctrl, cmd) == (0x81, 0x02):
-                # 呼吸率：payload[0] 单字节
-                br = payload[0]
-                self.breath_rate.append(br)
-                print(f"BR_Rad：{br} RPM")
-            elif (ctrl, cmd) == (0x80, 0x03):
-                # 体动参数：payload[0] 单字节
-                motion = payload[0]
-                self.motion_para.append(motion)
-                    # print(f"Motion：{motion}")
+    def get_reader_stats(self):
+        """读线程统计：每秒唤醒次数、每帧 CPU 时间"""
+        elapsed = time.time() - self._read_start_time if self._read_start_time else 0.0
+        frames = self.parser.frames
+        return {
+            'mode': self.active_read_mode,
+            'elapsed_s': elapsed,
+            'frames': frames,
+            'wakeups': self.read_wakeups,
+            'wakeups_per_s': self.read_wakeups / elapsed if elapsed > 0 else 0.0,
+            'cpu_s': self.read_cpu_time,
+            'cpu_per_frame_us': self.read_cpu_time / frames * 1e6 if frames else None,
+        }
 
-            # 丢弃已处理帧
-            self.buffer = self.buffer[idx+total_len:]
+    def handle_frame(self, ctrl, cmd, payload):
+        """根据 CTRL/CMD 分发处理一帧数据"""
+        if (ctrl, cmd) == (0x85, 0x02):
+            # 心率：payload[0] 单字节
+            hr = payload[0]
+            
+            if hr != 0:
+                self.heart_rate.append(hr)
+                self.hrv_calculator.push_hr(hr)
+                self._last_hr_time = time.time()  # track latest valid HR for presence detection
+                if self.bus:
+                    self.bus.publish('hr', hr, 'radar', self._last_hr_time)
+                print(f"HR_Rad: {hr} BPM")
+        # elif (ctrl, cmd) == (0x85, 0x05):
+        #     # 心率波形：payload[5] 五个字节
+        #     hr_wave = list(payload[:5])
+        #     print(f"心率波形：{hr_wave} ")
+        elif (ctrl, cmd) == (0x81, 0x02):
+            # 呼吸率：payload[0] 单字节
+            br = payload[0]
+            self.breath_rate.append(br)
+            if self.bus:
+                self.bus.publish('br', br, 'radar')
+            print(f"BR_Rad：{br} RPM")
+        elif (ctrl, cmd) == (0x80, 0x03):
+            # 体动参数：payload[0] 单字节
+            motion = payload[0]
+            self.motion_para.append(motion)
+                # print(f"Motion：{motion}")
 
-        
     def start_continuous_reading(self):
         self.is_reading = True
         print("Starting continuous radar data reading...")
         
+        if self._use_event_reader():
+            if self._wakeup_pipe is None:
+                self._wakeup_pipe = os.pipe()
+            read_once = self.read_events
+            self.active_read_mode = 'event'
+        else:
+            read_once = self.read_line
+            self.active_read_mode = 'legacy'
+        self.read_wakeups = 0
+        self._read_start_time = time.time()
+
         def read_loop():
+            # thread_time 只统计读线程自身的 CPU 时间
+            self._read_cpu_start = time.thread_time()
             while self.is_reading:
-                self.read_line()
+                read_once()
 
         def hrv_loop():
             while self.is_reading:
@@ -224,7 +290,7 @@ class MicRadar:
         return True
 
     def calc_checksum(self, data: bytes) -> int:
-        return sum(data) & 0xFF
+        return calc_checksum(data)
     
     def preprocess_data(self, hr=None, br=None, motion=None, rr=None):
         # 体动参数连续5次大于10
@@ -5,12 +5,19 @@ import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 import numpy as np
 from scipy.interpolate import interp1d
-from scipy.signal import welch
+from scipy.signal import get_window
 import json
 from datetime import datetime
 import os
+from functools import lru_cache
 
 from ble import BLE  # 导入BLE类
+from HRVcalculate import StreamingResampler
+
+RESAMPLE_RATE = 4.0
+VLF_BAND = (0.003, 0.04)
+LF_BAND = (0.04, 0.15)
+HF_BAND = (0.15, 0.4)
 
 def intervals_to_peaks_manual(rr_intervals):
     # ... (函数保持不变)
@@ -25,13 +32,7 @@ def hrv_frequency_manual(peaks, sampling_rate=1000):
     # 检查数据点是否足够
     if len(peaks) < 4:
         print(f"Not enough peaks for HRV analysis: {len(peaks)} (minimum 4 required)")
-        return {
-            "HRV_VLF": 0,
-            "HRV_LF": 0,
-            "HRV_HF": 0,
-            "HRV_LFHF": np.nan,
-            "HRV_TotalPower": 0
-        }
+        return _empty_hrv_result()
 
     rr_intervals_samples = np.diff(peaks)
     rr_intervals_s = rr_intervals_samples / sampling_rate
@@ -41,15 +42,9 @@ def hrv_frequency_manual(peaks, sampling_rate=1000):
     # 检查时间序列是否有效
     if len(rr_time_s) < 4 or rr_time_s[-1] - rr_time_s[0] < 1.0:
         print(f"Time series too short for HRV analysis: {rr_time_s[-1] - rr_time_s[0]:.2f}s")
-        return {
-            "HRV_VLF": 0,
-            "HRV_LF": 0,
-            "HRV_HF": 0,
-            "HRV_LFHF": np.nan,
-            "HRV_TotalPower": 0
-        }
-
-    resample_rate = 4.0
+        return _empty_hrv_result()
+
+    resample_rate = RESAMPLE_RATE
     
     # 创建插值函数，根据数据点数量选择插值方法
 
@@ -65,40 +60,66 @@ def hrv_frequency_manual(peaks, sampling_rate=1000):
     # 确保有足够的重采样点
     if len(new_time_axis) < 10:
         print(f"Not enough resampled points: {len(new_time_axis)}")
-        return {
-            "HRV_VLF": 0,
-            "HRV_LF": 0,
-            "HRV_HF": 0,
-            "HRV_LFHF": np.nan,
-            "HRV_TotalPower": 0
-        }
+        return _empty_hrv_result()
 
     resampled_rr = interp_func(new_time_axis)
+    return hrv_frequency_resampled(resampled_rr, resample_rate)
+
+
+def _empty_hrv_result():
+    return {
+        "HRV_VLF": 0,
+        "HRV_LF": 0,
+        "HRV_HF": 0,
+        "HRV_LFHF": np.nan,
+        "HRV_TotalPower": 0
+    }
+
 
-    # 根据信号长度动态调整Welch参数
-    signal_length = len(resampled_rr)
-    # nperseg应该小于信号长度，通常取信号长度的1/4到1/8
+def _trapz_weights(freqs, band):
+    """频带 [lo, hi) 内梯形积分的权重（频点等间隔，不足两个频点时功率记 0）"""
+    weights = np.zeros(len(freqs))
+    band_indices = np.where((freqs >= band[0]) & (freqs < band[1]))[0]
+    if len(band_indices) < 2:
+        return weights
+    df = freqs[1] - freqs[0]
+    weights[band_indices] = df
+    weights[band_indices[0]] = weights[band_indices[-1]] = df / 2
+    return weights
+
+
+@lru_cache(maxsize=64)
+def _welch_plan(signal_length, resample_rate):
+    """
+    按信号长度缓存 Welch 参数、Hann 窗、density 缩放系数和 VLF/LF/HF 梯形积分权重
+    nperseg 取信号长度的 1/4（8~256），noverlap 取 nperseg 的一半（不超过 128）
+    """
     nperseg = min(256, max(8, signal_length // 4))
-    # noverlap应该小于nperseg
     noverlap = min(128, nperseg // 2)
-    
-    freqs, psd = welch(x=resampled_rr, fs=resample_rate, nperseg=nperseg, noverlap=noverlap)
-
-    vlf_band = (0.003, 0.04)
-    lf_band = (0.04, 0.15)
-    hf_band = (0.15, 0.4)
-
-    def calculate_band_power(freqs, psd, band):
-        band_indices = np.where((freqs >= band[0]) & (freqs < band[1]))[0]
-        if len(band_indices) < 2:
-            return 0
-        # 使用梯形法则数值积分来获得功率
-        power = np.trapz(psd[band_indices], freqs[band_indices])
-        return power
-
-    vlf_power = calculate_band_power(freqs, psd, vlf_band)
-    lf_power = calculate_band_power(freqs, psd, lf_band)
-    hf_power = calculate_band_power(freqs, psd, hf_band)
+    window = get_window('hann', nperseg)
+    scale = 1.0 / (resample_rate * np.dot(window, window))
+    freqs = np.fft.rfftfreq(nperseg, 1 / resample_rate)
+    weights = np.array([_trapz_weights(freqs, band) for band in (VLF_BAND, LF_BAND, HF_BAND)])
+    return nperseg, nperseg - noverlap, window, scale, weights
+
+
+def hrv_frequency_resampled(resampled_rr, resample_rate=RESAMPLE_RATE):
+    """对已重采样的 RR 序列做 Welch 频域分析（与 scipy.signal.welch 默认参数结果一致）"""
+    # 确保有足够的重采样点
+    if len(resampled_rr) < 10:
+        print(f"Not enough resampled points: {len(resampled_rr)}")
+        return _empty_hrv_result()
+
+    nperseg, step, window, scale, weights = _welch_plan(len(resampled_rr), resample_rate)
+    segments = np.lib.stride_tricks.sliding_window_view(resampled_rr, nperseg)[::step]
+    spec = np.fft.rfft((segments - segments.mean(axis=1, keepdims=True)) * window, axis=1)
+    psd = (spec.real ** 2 + spec.imag ** 2).mean(axis=0) * scale
+    if nperseg % 2:
+        psd[1:] *= 2
+    else:
+        psd[1:-1] *= 2
+
+    vlf_power, lf_power, hf_power = (float(p) for p in weights @ psd)
     
     total_power = vlf_power + lf_power + hf_power
     
@@ -117,15 +138,18 @@ def hrv_frequency_manual(peaks, sampling_rate=1000):
     return results
 
 class PPG:
-    def __init__(self, ble_instance: BLE):
+    def __init__(self, ble_instance: BLE, bus=None):
         """
         Initialize PPG data reader, using a provided BLE instance.
+        bus: optional SampleBus; HF/LF/spo2 samples are published whenever a new BLE frame was processed.
         """
         if not ble_instance:
             raise ValueError("A BLE instance must be provided to PPG.")
         
         # 1. 使用传入的BLE实例
         self.ble = ble_instance
+        self.bus = bus
+        self._published_total = 0  # ble.rri_total at the last publish (each BLE frame adds 3 RRIs)
         
         self.is_reading = False
         
@@ -138,6 +162,9 @@ class PPG:
 
         # rra现在直接使用ble的rri数据
         self.rra = self.ble.rri
+        # 频域分析用的流式重采样：每秒只为新到的 RRI 补齐 4Hz 网格
+        self._resampler = StreamingResampler(fs=RESAMPLE_RATE, unit=1.0)
+        self._rri_seen = 0  # 已送入重采样器的 RRI 累计个数（对应 ble.rri_total）
         
         self.data_valid = False
 
@@ -189,9 +216,23 @@ class PPG:
         if self.data_valid:
             self.HRV()
             # self.print_data()
+            self._publish()
             return True
         return False
 
+    def _publish(self):
+        """Publish the latest values once per new BLE frame, so unchanged values are not re-sent every second."""
+        if not self.bus or self.ble.rri_total == self._published_total:
+            return
+        self._published_total = self.ble.rri_total
+        now = time.time()
+        if self.HF is not None:
+            self.bus.publish('HF', self.HF, 'ppg', now)
+        if self.LF is not None:
+            self.bus.publish('LF', self.LF, 'ppg', now)
+        if self.blood_oxygen is not None and self.blood_oxygen > 0:
+            self.bus.publish('spo2', self.blood_oxygen, 'ppg', now)
+
     def start_continuous_reading(self):
         """
         Start a thread to continuously update data from the BLE source.
@@ -206,7 +247,9 @@ class PPG:
         def sync_loop():
             while self.is_reading:
                 self.read_line()
-                time.sleep(1)  # Update data every second
+                # Process as soon as the next BLE frame arrives; fall back to the old 1 s cadence otherwise
+                if self.ble.frame_event.wait(timeout=1.0):
+                    self.ble.frame_event.clear()
         
         self.read_thread = threading.Thread(target=sync_loop)
         self.read_thread.daemon = True
@@ -225,7 +268,8 @@ class PPG:
             if len(self.rra) < 10:
                 return None
 
-            rr_intervals = np.array(self.rra, dtype=float)
+            rr_intervals, rri_total = self._snapshot_rri()
+            self._feed_resampler(rr_intervals, rri_total)
             
             if np.std(rr_intervals) < 0.01:
                 # print('RR intervals have insufficient variability for HRV analysis')
@@ -235,9 +279,7 @@ class PPG:
                 # print('RR intervals contain invalid values')
                 return None
             
-            peaks = intervals_to_peaks_manual(rr_intervals)
-            
-            hrv_freq_analysis = hrv_frequency_manual(peaks, sampling_rate=1000)
+            hrv_freq_analysis = self._hrv_frequency_streaming(rr_intervals, sampling_rate=1000)
             
             if isinstance(hrv_freq_analysis['HRV_LF'], (list, np.ndarray)):
                 self.LF = hrv_freq_analysis['HRV_LF'][0] if len(hrv_freq_analysis['HRV_LF']) > 0 and hrv_freq_analysis['HRV_LF'][0] < 1 else 0
@@ -249,6 +291,45 @@ class PPG:
             else:
                 self.HF = hrv_freq_analysis['HRV_HF'] if hrv_freq_analysis['HRV_HF'] < 1 else 0
 
+    def _snapshot_rri(self):
+        """复制 rri 窗口并取得对应的累计计数（在 BLE 的 rri_lock 下一起读取，与追加互斥）"""
+        rri, total = self.ble.snapshot_rri()
+        return np.array(rri, dtype=float), total
+
+    def _feed_resampler(self, rr_intervals, rri_total, sampling_rate=1000):
+        """把上次之后新到的 RRI 送入重采样器；遇到无效 RRI 或衔接不上时从下一个有效值重新开始"""
+        new = rri_total - self._rri_seen
+        if new < 0 or new > len(rr_intervals):
+            self._resampler = StreamingResampler(fs=RESAMPLE_RATE, unit=1.0)
+            new = len(rr_intervals)
+        fresh = rr_intervals[len(rr_intervals) - new:]
+        invalid = np.flatnonzero((fresh <= 0) | (fresh > 3000))
+        if len(invalid):
+            # 含无效值的窗口不会参与计算，丢弃之前的网格，从最后一个无效值之后重新开始
+            self._resampler = StreamingResampler(fs=RESAMPLE_RATE, unit=1.0)
+            fresh = fresh[invalid[-1] + 1:]
+        if len(fresh):
+            self._resampler.extend(fresh / sampling_rate)
+        self._rri_seen = rri_total
+
+    def _hrv_frequency_streaming(self, rr_intervals, sampling_rate=1000):
+        """
+        与 hrv_frequency_manual(intervals_to_peaks_manual(rr_intervals)) 相同的窗口和 Welch 参数，
+        只是重采样网格取自流式重采样器，不再对整段历史重新拟合三次插值
+        （网格按数据流起点对齐而非窗口起点，结果与整窗插值有小幅差异）
+        """
+        rr_intervals_s = rr_intervals / sampling_rate
+        # hrv_frequency_manual 由 peaks 差分得到间期，第一个 RRI 不参与插值
+        duration = rr_intervals_s[2:].sum()
+        if duration < 1.0:
+            print(f"Time series too short for HRV analysis: {duration:.2f}s")
+            return _empty_hrv_result()
+
+        t_start = self._resampler.t - duration
+        _, resampled_rr = self._resampler.window(t_start)
+        self._resampler.trim(t_start)
+        return hrv_frequency_resampled(resampled_rr, RESAMPLE_RATE)
+
     def stop_reading(self):
         """Stop the data synchronization thread"""
         self.is_reading = False
@@ -0,0 +1,195 @@
+import io
+import os
+import threading
+import time
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
+from matplotlib.colors import to_rgba
+from matplotlib.figure import Figure
+from matplotlib.patches import Circle, Rectangle
+from PIL import Image
+
+AXIS_LIMIT = 3.0
+# 四象限：名称 -> (左下角, 颜色, 标签位置)
+QUADRANTS = {
+    'Joy': ((0, 0), '#FFD700', (1.5, 1.5)),
+    'Tense': ((-AXIS_LIMIT, 0), '#FF6B6B', (-1.5, 1.5)),
+    'Low': ((-AXIS_LIMIT, -AXIS_LIMIT), '#87CEEB', (-1.5, -1.5)),
+    'Calm': ((0, -AXIS_LIMIT), '#90EE90', (1.5, -1.5)),
+}
+HISTORY_COLOR = '#096800'
+
+
+class QuadrantRenderer:
+    """
+    Valence-Arousal 情绪象限图的后台渲染器
+
+    - submit() 只保存最新一份快照并唤醒渲染线程，立即返回，评分线程不再等待 matplotlib
+    - Figure/Axes 只创建一次：象限背景、参考圈、文字标签、图例画好后缓存成位图（blit），
+      之后每次只恢复背景并重画历史点、当前点和信息框
+    - 只有最近 demand_ttl 秒内有人取过图（latest_png）时才渲染，没人看就不画；
+      always=True 时每份快照都渲染并写文件（与旧行为一致）
+    """
+
+    def __init__(self, demand_ttl=30.0, always=False, dpi=150):
+        self.demand_ttl = demand_ttl
+        self.always = always
+        self.dpi = dpi
+
+        self._cond = threading.Condition()
+        self._snapshot = None      # 最新快照
+        self._seq = 0              # 已提交的快照序号
+        self._rendered_seq = 0     # 已渲染的快照序号
+        self._png = None
+        self._last_demand = None
+        self._thread = None
+
+        # 只在渲染线程中访问
+        self._fig = None
+
+        # 统计信息
+        self.rendered = 0
+        self.skipped = 0
+        self.last_render_time = None
+
+    def submit(self, valence, arousal, history, means, plot_path=None):
+        """
+        提交一份待渲染的快照（非阻塞，未渲染的旧快照直接被覆盖）
+        :param history: [(valence, arousal), ...] 历史点，按时间从旧到新
+        :param means: (br_mean, sdnn_mean, hr_mean, lf_hf_mean)
+        :param plot_path: 渲染后写入的 PNG 路径，None 表示只保存在内存
+        """
+        with self._cond:
+            self._snapshot = (valence, arousal, list(history), tuple(means), plot_path)
+            self._seq += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def has_demand(self):
+        return self.always or (self._last_demand is not None and
+                               time.monotonic() - self._last_demand < self.demand_ttl)
+
+    def latest_png(self, timeout=2.0):
+        """
+        取最新的 PNG 字节（同时登记有人在看图）
+        当前快照还没渲染时最多等待 timeout 秒，超时返回上一次的结果（可能为 None）
+        """
+        with self._cond:
+            self._last_demand = time.monotonic()
+            self._cond.notify_all()
+            self._cond.wait_for(lambda: self._rendered_seq >= self._seq, timeout)
+            return self._png
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._rendered_seq < self._seq and self.has_demand())
+                seq, snapshot = self._seq, self._snapshot
+            t0 = time.perf_counter()
+            try:
+                png = self._render(*snapshot)
+            except Exception as e:
+                print(f'[WARNING] Failed to render emotion plot: {e}')
+                png = None
+            with self._cond:
+                if png is not None:
+                    self._png = png
+                    self.rendered += 1
+                    self.skipped += seq - self._rendered_seq - 1
+                    self.last_render_time = time.perf_counter() - t0
+                self._rendered_seq = seq
+                self._cond.notify_all()
+
+    def _setup(self):
+        """创建 Figure 并画好静态部分，缓存为背景位图"""
+        fig = Figure(figsize=(10, 10), dpi=self.dpi)
+        canvas = FigureCanvas(fig)
+        ax = fig.add_subplot()
+        ax.set_xlim(-AXIS_LIMIT, AXIS_LIMIT)
+        ax.set_ylim(-AXIS_LIMIT, AXIS_LIMIT)
+
+        for name, (corner, color, (tx, ty)) in QUADRANTS.items():
+            ax.add_patch(Rectangle(corner, AXIS_LIMIT, AXIS_LIMIT, facecolor=color, alpha=0.3, label=name))
+            ax.text(tx, ty, name, ha='center', va='center', fontsize=30, fontweight='bold',
+                    bbox=dict(boxstyle='round', facecolor='white', alpha=0.3))
+        # ±1、±2 标准差参考圈
+        ax.add_patch(Circle((0, 0), 1.0, fill=False, color='gray', linestyle='--', linewidth=1, alpha=0.5))
+        ax.add_patch(Circle((0, 0), 2.0, fill=False, color='gray', linestyle=':', linewidth=1, alpha=0.3))
+
+        ax.set_xlabel('Valence (←Low valence| High valence→)', fontsize=12, fontweight='bold')
+        ax.set_ylabel('Arousal (←Low arousal| High arousal→)', fontsize=12, fontweight='bold')
+        ax.set_title('Emotional State Quadrant Chart', fontsize=16, fontweight='bold', pad=20)
+        ax.set_xticks([])
+        ax.set_yticks([])
+        for spine in ax.spines.values():
+            spine.set_visible(False)
+
+        # 动态部分：历史点、当前点、信息框（animated=True，不参与背景绘制）
+        empty = np.empty((0, 2))
+        history = ax.scatter(empty[:, 0], empty[:, 1], s=400, marker='.', color=HISTORY_COLOR,
+                             edgecolors='darkgray', linewidths=1, zorder=10,
+                             label='History Emotion', animated=True)
+        current = ax.scatter(empty[:, 0], empty[:, 1], s=400, marker='.', edgecolors=HISTORY_COLOR,
+                             zorder=30, label='Current Emotion', animated=True)
+        info = ax.text(0.02, 0.98, '', transform=ax.transAxes, fontsize=11, verticalalignment='top',
+                       fontweight='bold', animated=True,
+                       bbox=dict(boxstyle='round', facecolor=HISTORY_COLOR, alpha=0.5,
+                                 edgecolor='black', linewidth=1))
+
+        ax.legend(loc='upper right', fontsize=9, framealpha=0.9)
+        ax.set_aspect('equal', adjustable='box')
+        fig.tight_layout()
+
+        canvas.draw()
+        self._fig = fig
+        self._canvas = canvas
+        self._ax = ax
+        self._background = canvas.copy_from_bbox(fig.bbox)
+        self._history, self._current, self._info = history, current, info
+
+    def _render(self, valence, arousal, history, means, plot_path):
+        if self._fig is None:
+            self._setup()
+        canvas, ax = self._canvas, self._ax
+        canvas.restore_region(self._background)
+
+        if history:
+            # 越新的点越不透明
+            n = len(history)
+            rgba = np.tile(to_rgba(HISTORY_COLOR), (n, 1))
+            rgba[:, 3] = 0.2 + np.arange(1, n + 1) * (0.3 / (n + 1))
+            self._history.set_offsets(np.array(history, dtype=float))
+            self._history.set_facecolors(rgba)
+            ax.draw_artist(self._history)
+
+        self._current.set_offsets([[valence, arousal]])
+        ax.draw_artist(self._current)
+
+        br_mean, sdnn_mean, hr_mean, lf_hf_mean = means
+        self._info.set_text(
+            f'BR mean: {br_mean:.1f} bpm\n'
+            f'HR mean: {hr_mean:.1f} bpm\n'
+            f'SDNN mean: {sdnn_mean:.1f} ms\n'
+            f'LF/HF mean: {lf_hf_mean:.2f}\n'
+            f'-------------------\n'
+            f'Valence Score: {valence:.2f}\n'
+            f'Arousal Score: {arousal:.2f}'
+        )
+        ax.draw_artist(self._info)
+
+        buf = io.BytesIO()
+        # 直接编码当前画布像素，不走 savefig（savefig 会整图重画）；
+        # 画布不透明，去掉 alpha 通道并用较低的压缩级别，编码耗时约减半
+        image = Image.fromarray(np.asarray(canvas.buffer_rgba())).convert('RGB')
+        image.save(buf, format='png', compress_level=3)
+        png = buf.getvalue()
+        if plot_path:
+            # 先写临时文件再替换，避免读取方看到写了一半的图片
+            tmp_path = plot_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(png)
+            os.replace(tmp_path, plot_path)
+        return png
@@ -0,0 +1,137 @@
+import struct
+
+HEADER = b'\x53\x59'
+FOOTER = b'\x54\x43'
+# header(2) + ctrl(1) + cmd(1) + len(2)
+PREFIX_LEN = 6
+# header(2) + ctrl(1) + cmd(1) + len(2) + cksum(1) + footer(2)
+OVERHEAD_LEN = 9
+HEADER_0, FOOTER_0, FOOTER_1 = HEADER[0], FOOTER[0], FOOTER[1]
+_unpack_prefix = struct.Struct('>BBH').unpack_from
+
+
+class RadarFrameParser:
+    """
+    雷达串口帧解析器（预分配缓冲区 + memoryview 偏移解析）
+    帧结构：53 59 | CTRL(1) | CMD(1) | LEN(2) | PAYLOAD | CKSUM(1) | 54 43
+
+    缓冲区只分配一次，解析过程中只移动读写偏移，不再对剩余数据做切片拷贝；
+    只有当尾部空间不够写入新数据时才把未消费的字节整体挪回开头（压缩）。
+    """
+
+    def __init__(self, capacity=4096):
+        """
+        :param capacity: 缓冲区大小（字节），需大于最长帧
+        """
+        self.capacity = capacity
+        self._buf = bytearray(capacity)
+        self._view = memoryview(self._buf)
+        self._start = 0  # 未消费数据起点
+        self._end = 0    # 已写入数据终点
+
+        # 统计信息
+        self.frames = 0
+        self.bad_frames = 0
+        self.compactions = 0
+        self.dropped_bytes = 0
+
+    def __len__(self):
+        return self._end - self._start
+
+    def reset(self):
+        self._start = 0
+        self._end = 0
+
+    def feed(self, data):
+        """
+        写入新数据并逐帧产出 (ctrl, cmd, payload)
+        payload 是指向内部缓冲区的 memoryview，只在下一次 feed 之前有效，需要保留请自行 bytes() 拷贝
+        """
+        src = memoryview(data)
+        while len(src):
+            n = self._write(src)
+            src = src[n:]
+            yield from self._parse()
+
+    def _write(self, src):
+        free = self.capacity - self._end
+        if free < len(src) and self._start > 0:
+            self._compact()
+            free = self.capacity - self._end
+        if free == 0:
+            # 缓冲区被一段无法成帧的数据占满，丢弃后重新同步
+            self.dropped_bytes += self._end - self._start
+            self.reset()
+            free = self.capacity
+        n = min(free, len(src))
+        self._view[self._end:self._end + n] = src[:n]
+        self._end += n
+        return n
+
+    def _compact(self):
+        remain = self._end - self._start
+        if remain:
+            self._view[:remain] = self._view[self._start:self._end]
+        self._start = 0
+        self._end = remain
+        self.compactions += 1
+
+    def _parse(self):
+        buf = self._buf
+        view = self._view
+        find = buf.find
+        capacity = self.capacity
+        start, end = self._start, self._end
+        while start < end:
+            # 找到帧头
+            idx = find(HEADER, start, end)
+            if idx < 0:
+                # 保留末尾可能是半个帧头的字节
+                start = end - 1 if buf[end - 1] == HEADER_0 else end
+                break
+            if end - idx < PREFIX_LEN:
+                # 不足以读取 CTRL/CMD/LEN，再等数据
+                start = idx
+                break
+
+            ctrl, cmd, length = _unpack_prefix(buf, idx + 2)
+            total_len = OVERHEAD_LEN + length
+            if total_len > capacity:
+                # 长度字段明显不合理，跳过一个字节继续找帧头
+                self.bad_frames += 1
+                start = idx + 1
+                continue
+            if end - idx < total_len:
+                # 判断缓存是否有整帧
+                start = idx
+                break
+
+            cksum_pos = idx + PREFIX_LEN + length
+            # 校验帧尾和校验和（帧很短，直接对 memoryview 求和，不拷贝）
+            if (buf[cksum_pos + 1] != FOOTER_0 or buf[cksum_pos + 2] != FOOTER_1 or
+                    sum(view[idx:cksum_pos]) & 0xFF != buf[cksum_pos]):
+                self.bad_frames += 1
+                start = idx + 1
+                continue
+
+            # 先推进偏移再产出，调用方中途停止迭代也不会重复解析同一帧
+            start = idx + total_len
+            self._start = start
+            self.frames += 1
+            yield ctrl, cmd, view[idx + PREFIX_LEN:cksum_pos]
+            # 产出期间 feed 不会写入，end 不变
+
+        if start == end:
+            # 数据已全部消费，偏移归零，不需要拷贝
+            start = end = self._end = 0
+        self._start = start
+
+
+def calc_checksum(data) -> int:
+    return sum(data) & 0xFF
+
+
+def build_frame(ctrl, cmd, payload=b'') -> bytes:
+    """按协议拼出一帧，主要用于回放/测试"""
+    core = HEADER + struct.pack('>BBH', ctrl, cmd, len(payload)) + bytes(payload)
+    return core + bytes([calc_checksum(core)]) + FOOTER
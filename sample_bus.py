@@ -0,0 +1,115 @@
+import threading
+import time
+from collections import deque, namedtuple
+
+# metric: 指标名（与 FSM.data 的键一致，如 'hr'、'br'、'HF'、'LF'、'lf_hf'、'sdnn'、'spo2'）
+# ts: 采样时刻 time.time()；mono: 发布时刻 time.monotonic()，用于统计端到端延迟
+Sample = namedtuple('Sample', ['metric', 'value', 'source', 'ts', 'mono'])
+
+
+class Subscription:
+    """
+    单个订阅者的有界队列
+    队列满时丢弃最旧的样本（只计数，不阻塞发布方），消费方用 get() 阻塞等待新样本
+    """
+
+    def __init__(self, bus, name, metrics=None, maxlen=256, latency_window=1000):
+        """
+        :param metrics: 只接收这些指标，None 表示全部
+        :param maxlen: 队列上限
+        :param latency_window: 保留最近多少个样本的延迟用于统计
+        """
+        self.bus = bus
+        self.name = name
+        self.metrics = frozenset(metrics) if metrics else None
+        self._queue = deque(maxlen=maxlen)
+        self._cond = threading.Condition()
+        self.received = 0
+        self.dropped = 0
+        self._latency = deque(maxlen=latency_window)
+
+    def _put(self, sample):
+        with self._cond:
+            if len(self._queue) == self._queue.maxlen:
+                self.dropped += 1
+            self._queue.append(sample)
+            self.received += 1
+            self._cond.notify()
+
+    def get(self, timeout=None, batch_window=0.0):
+        """
+        取出队列中全部样本；队列为空时最多阻塞 timeout 秒
+        :param batch_window: 取到第一个样本后再等待这么久，把同一时刻附近发布的样本合并成一批
+        :return: 样本列表（超时返回空列表）
+        """
+        with self._cond:
+            if not self._queue and not self._cond.wait_for(lambda: self._queue, timeout):
+                return []
+        if batch_window > 0:
+            time.sleep(batch_window)
+        with self._cond:
+            samples = list(self._queue)
+            self._queue.clear()
+        now = time.monotonic()
+        self._latency.extend(now - s.mono for s in samples)
+        return samples
+
+    def latency_stats(self):
+        """发布到被消费的延迟统计（秒）"""
+        values = sorted(self._latency)
+        if not values:
+            return {'count': 0, 'mean': None, 'p50': None, 'p95': None, 'max': None}
+        n = len(values)
+        return {
+            'count': n,
+            'mean': sum(values) / n,
+            'p50': values[n // 2],
+            'p95': values[min(n - 1, int(n * 0.95))],
+            'max': values[-1],
+        }
+
+    def close(self):
+        self.bus.unsubscribe(self)
+
+
+class SampleBus:
+    """
+    传感器样本发布/订阅总线
+    MicRadar / HRVcalculate / PPG 在得到新值时 publish，FSM、DataVisualizer 等订阅后按需消费，
+    取代按固定周期轮询各设备属性（同一个值重复追加、新值最多等一个轮询周期的问题）
+    """
+
+    def __init__(self):
+        self._subs = []
+        self._lock = threading.Lock()
+        self.published = 0
+
+    def subscribe(self, name, metrics=None, maxlen=256):
+        sub = Subscription(self, name, metrics, maxlen)
+        with self._lock:
+            # 复制后替换，publish 遍历时无需加锁
+            self._subs = self._subs + [sub]
+        return sub
+
+    def unsubscribe(self, sub):
+        with self._lock:
+            self._subs = [s for s in self._subs if s is not sub]
+
+    def publish(self, metric, value, source, ts=None):
+        if value is None:
+            return
+        sample = Sample(metric, value, source, time.time() if ts is None else ts, time.monotonic())
+        self.published += 1
+        for sub in self._subs:
+            if sub.metrics is None or metric in sub.metrics:
+                sub._put(sample)
+
+    def stats(self):
+        """各订阅者的接收/丢弃数量和延迟统计"""
+        return {
+            'published': self.published,
+            'subscribers': {
+                s.name: dict(received=s.received, dropped=s.dropped, latency=s.latency_stats())
+                for s in self._subs
+            },
+        }
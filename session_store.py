@@ -0,0 +1,299 @@
+"""
+情绪记录的二进制会话存储（取代 personal_data.csv）
+
+每天一个分段文件 <目录>/YYYYMMDD.bin：64 字节文件头 + 定长记录，只追加写入。
+每条记录 = 时间戳(float64) + 数据源编码(uint32) + 30 个 float32 统计值（缺失为 NaN），
+读取时用 np.memmap 直接映射，按时间定位只需选中当天分段再在时间戳列上二分查找。
+追加时不检查时间顺序：系统时钟回拨（开机后 NTP 校时、手动改时间）后写入的记录可能早于已有记录，
+读取分段时发现时间戳乱序就按时间戳排序后再返回。
+
+导出为与旧 personal_data.csv 相同格式的 CSV：
+    python session_store.py export --out personal_data.csv [--start 2024-01-01] [--end 2024-01-31]
+导入旧 CSV：
+    python session_store.py import-csv personal_data.csv
+查看各分段：
+    python session_store.py info
+"""
+import argparse
+import csv
+import os
+import struct
+import threading
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+METRICS = ('HF', 'LF', 'lf_hf', 'sdnn', 'hr', 'br', 'spo2')
+STAT_COLUMNS = [f'{m}_{s}' for m in METRICS for s in ('mean', 'std', 'min', 'max')] + ['arousal_score', 'valence_score']
+# 与旧 personal_data.csv 的列顺序一致
+CSV_FIELDS = ['timestamp', 'data_source'] + STAT_COLUMNS
+DATA_SOURCES = ('radar', 'ppg', 'both')
+UNKNOWN_SOURCE = 255
+
+RECORD_DTYPE = np.dtype([('ts', '<f8'), ('source', '<u4'), ('values', '<f4', (len(STAT_COLUMNS),))])
+MAGIC = b'ASSN'
+VERSION = 1
+# magic(4) + version(2) + record_size(2) + columns(2) + day(4)，补齐到 64 字节
+_header = struct.Struct('<4sHHHI')
+HEADER_SIZE = 64
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def _day_of(ts):
+    return time.strftime('%Y%m%d', time.localtime(ts))
+
+
+def _header_bytes(day):
+    return _header.pack(MAGIC, VERSION, RECORD_DTYPE.itemsize, len(STAT_COLUMNS), int(day)).ljust(HEADER_SIZE, b'\x00')
+
+
+class SessionStore:
+    """按天分段的定长二进制记录存储，写入线程安全"""
+
+    def __init__(self, directory='sessions'):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._file = None
+        self._day = None
+
+    def _segment_path(self, day):
+        return os.path.join(self.directory, f'{day}.bin')
+
+    def _open_segment(self, day):
+        """打开（必要时创建）当天分段用于追加；截掉上次异常退出留下的半条记录"""
+        if self._file:
+            self._file.close()
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._segment_path(day)
+        f = open(path, 'r+b' if os.path.exists(path) else 'w+b')
+        size = f.seek(0, os.SEEK_END)
+        if size < HEADER_SIZE:
+            f.seek(0)
+            f.truncate()
+            f.write(_header_bytes(day))
+        else:
+            self._check_header(f, path)
+            whole = HEADER_SIZE + (size - HEADER_SIZE) // RECORD_DTYPE.itemsize * RECORD_DTYPE.itemsize
+            if whole != size:
+                f.truncate(whole)
+            f.seek(whole)
+        self._file, self._day = f, day
+
+    @staticmethod
+    def _check_header(f, path):
+        f.seek(0)
+        magic, version, record_size, columns, _ = _header.unpack(f.read(_header.size))
+        if magic != MAGIC or version != VERSION or record_size != RECORD_DTYPE.itemsize:
+            raise ValueError(f'{path}: unsupported session segment (magic={magic!r}, version={version})')
+
+    def append(self, record, ts=None):
+        """
+        追加一条记录
+        :param record: DataRecorder._generate_statistics_record() 的结果（缺失值为 None）
+        :param ts: 记录时间（time.time()），默认当前时间
+        """
+        ts = time.time() if ts is None else ts
+        row = self._pack(record, ts)
+        day = _day_of(ts)
+        with self._lock:
+            if day != self._day:
+                self._open_segment(day)
+            self._file.write(row.tobytes())
+            self._file.flush()
+
+    @staticmethod
+    def _pack(record, ts):
+        row = np.zeros(1, dtype=RECORD_DTYPE)
+        row['ts'] = ts
+        source = record.get('data_source')
+        row['source'] = DATA_SOURCES.index(source) if source in DATA_SOURCES else UNKNOWN_SOURCE
+        row['values'] = [np.nan if record.get(c) is None else record[c] for c in STAT_COLUMNS]
+        return row
+
+    def _merge_into_segment(self, day, rows):
+        """
+        把 rows 与当天分段已有的记录按时间戳合并后整段重写（range()/at() 的二分查找要求时间戳有序）
+        先写临时文件再替换；时间戳相同的记录已有的在前
+        """
+        with self._lock:
+            if self._day == day:
+                # 当前追加句柄指向旧文件，关闭后下一次 append 重新打开
+                self._file.close()
+                self._file, self._day = None, None
+            existing = np.array(self.read_day(day))
+            merged = np.concatenate([existing, rows]) if len(existing) else rows
+            merged = merged[np.argsort(merged['ts'], kind='stable')]
+            os.makedirs(self.directory, exist_ok=True)
+            path = self._segment_path(day)
+            tmp_path = f'{path}.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(_header_bytes(day))
+                f.write(merged.tobytes())
+            os.replace(tmp_path, path)
+
+    def close(self):
+        with self._lock:
+            if self._file:
+                self._file.close()
+            self._file, self._day = None, None
+
+    def days(self):
+        """已有分段的日期（YYYYMMDD），按时间排序"""
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(name[:-4] for name in os.listdir(self.directory)
+                      if name.endswith('.bin') and name[:-4].isdigit())
+
+    def read_day(self, day):
+        """某一天的全部记录，按时间排序（通常是只读 memmap，不拷贝；时钟回拨导致乱序时返回排好序的副本）"""
+        path = self._segment_path(day)
+        if not os.path.exists(path):
+            return np.empty(0, dtype=RECORD_DTYPE)
+        count = (os.path.getsize(path) - HEADER_SIZE) // RECORD_DTYPE.itemsize
+        if count <= 0:
+            return np.empty(0, dtype=RECORD_DTYPE)
+        with open(path, 'rb') as f:
+            self._check_header(f, path)
+        records = np.memmap(path, dtype=RECORD_DTYPE, mode='r', offset=HEADER_SIZE, shape=(count,))
+        ts = records['ts']
+        if np.any(ts[1:] < ts[:-1]):
+            # range()/at()/tail() 依赖有序的时间戳列；时间戳相同的记录保持写入顺序
+            return records[np.argsort(ts, kind='stable')]
+        return records
+
+    def range(self, start=None, end=None):
+        """时间在 [start, end) 内的记录（跨天时拼接），start/end 为 time.time() 时间戳"""
+        first = _day_of(start) if start is not None else None
+        last = _day_of(end) if end is not None else None
+        parts = []
+        for day in self.days():
+            if (first and day < first) or (last and day > last):
+                continue
+            records = self.read_day(day)
+            lo = np.searchsorted(records['ts'], start) if start is not None else 0
+            hi = np.searchsorted(records['ts'], end) if end is not None else len(records)
+            if hi > lo:
+                parts.append(records[lo:hi])
+        if not parts:
+            return np.empty(0, dtype=RECORD_DTYPE)
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+    def at(self, ts):
+        """ts 时刻（含）之前最近的一条记录，没有则返回 None"""
+        for day in reversed([d for d in self.days() if d <= _day_of(ts)]):
+            records = self.read_day(day)
+            i = np.searchsorted(records['ts'], ts, side='right')
+            if i:
+                return records[i - 1]
+        return None
+
+    def tail(self, n):
+        """最近 n 条记录，按时间从旧到新"""
+        if n <= 0:
+            return np.empty(0, dtype=RECORD_DTYPE)
+        parts, remaining = [], n
+        for day in reversed(self.days()):
+            records = self.read_day(day)
+            if len(records):
+                parts.append(records[-remaining:])
+                remaining -= len(parts[-1])
+            if remaining <= 0:
+                break
+        if not parts:
+            return np.empty(0, dtype=RECORD_DTYPE)
+        return np.concatenate(parts[::-1])
+
+    @staticmethod
+    def to_row(record):
+        """记录 -> 与旧 CSV 一致的字典（统计值保留 3 位小数，缺失为 None）"""
+        source = int(record['source'])
+        row = {
+            'timestamp': datetime.fromtimestamp(float(record['ts'])).strftime(TIME_FORMAT),
+            'data_source': DATA_SOURCES[source] if source < len(DATA_SOURCES) else None,
+        }
+        for column, value in zip(STAT_COLUMNS, record['values'].tolist()):
+            row[column] = None if np.isnan(value) else round(value, 3)
+        return row
+
+    def export_csv(self, out_path, start=None, end=None):
+        """导出为 CSV（格式与旧 personal_data.csv 相同），返回导出的记录数"""
+        records = self.range(start, end)
+        with open(out_path, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            for record in records:
+                writer.writerow({k: ('' if v is None else v) for k, v in self.to_row(record).items()})
+        return len(records)
+
+    def import_csv(self, csv_path):
+        """
+        导入旧 personal_data.csv（按原时间戳落到对应日期的分段），返回导入的记录数
+        CSV 不要求按时间排序；已有记录的日期会与导入的记录按时间戳合并后重写该分段，
+        因此导入期间不要让主程序同时向同一天的分段追加记录。
+        """
+        rows = []
+        with open(csv_path, 'r', encoding='utf-8') as csvfile:
+            for row in csv.DictReader(line.replace('\x00', '') for line in csvfile):
+                try:
+                    ts = datetime.strptime(row['timestamp'], TIME_FORMAT).timestamp()
+                except (KeyError, TypeError, ValueError):
+                    continue
+                record = {'data_source': row.get('data_source')}
+                for column in STAT_COLUMNS:
+                    value = row.get(column) or ''
+                    try:
+                        record[column] = float(value) if value and value != 'null' else None
+                    except ValueError:
+                        record[column] = None
+                rows.append(self._pack(record, ts))
+        if not rows:
+            return 0
+        records = np.concatenate(rows)
+        days = np.array([_day_of(ts) for ts in records['ts'].tolist()])
+        for day in np.unique(days):
+            self._merge_into_segment(str(day), records[days == day])
+        return len(records)
+
+
+def _parse_date(text, end=False):
+    if text is None:
+        return None
+    day = datetime.strptime(text, '%Y-%m-%d')
+    return (day + timedelta(days=1) if end else day).timestamp()
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--dir', default='sessions', help='分段文件目录')
+    sub = ap.add_subparsers(dest='command', required=True)
+    export = sub.add_parser('export', help='导出为 CSV')
+    export.add_argument('--out', default='personal_data.csv')
+    export.add_argument('--start', help='起始日期 YYYY-MM-DD（含）')
+    export.add_argument('--end', help='结束日期 YYYY-MM-DD（含）')
+    importer = sub.add_parser('import-csv', help='导入旧 CSV')
+    importer.add_argument('csv_path')
+    sub.add_parser('info', help='列出各分段的记录数和时间范围')
+    args = ap.parse_args()
+
+    store = SessionStore(args.dir)
+    if args.command == 'export':
+        n = store.export_csv(args.out, _parse_date(args.start), _parse_date(args.end, end=True))
+        print(f'[INFO] 已导出 {n} 条记录到 {args.out}')
+    elif args.command == 'import-csv':
+        n = store.import_csv(args.csv_path)
+        store.close()
+        print(f'[INFO] 已导入 {n} 条记录到 {args.dir}/')
+    else:
+        for day in store.days():
+            records = store.read_day(day)
+            if len(records):
+                span = ' ~ '.join(datetime.fromtimestamp(float(t)).strftime(TIME_FORMAT)
+                                  for t in (records['ts'][0], records['ts'][-1]))
+            else:
+                span = '-'
+            print(f'{day}: {len(records):6d} records  {span}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""
+前端打包产物（around-front-master/dist）的内存静态资源索引
+
+启动时扫描一次目录：读入每个文件并按内容计算强 ETag，文本类资源再预先生成 gzip / br 压缩版本，
+请求时只查字典返回内存中的字节，不再逐请求 stat 文件，也不再实时压缩。
+- Vite 输出的 assets/ 下文件名带内容哈希，返回一年的 immutable 缓存；其他文件（index.html、图片等）
+  返回 no-cache，浏览器每次用 If-None-Match 协商，未变化时 304
+- br 用最高压缩等级（大的 js 需要秒级时间），放在后台线程生成，完成之前先用 gzip
+- dist 重新构建后需要重启服务才会生效
+"""
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+import threading
+
+from flask import Response
+
+try:
+    import brotli
+except ImportError:  # 可选依赖：没有时只提供 gzip（data_visualizer 也从这里导入）
+    brotli = None
+
+COMPRESSIBLE_MIMETYPES = {
+    'application/json', 'application/javascript', 'text/javascript',
+    'text/html', 'text/css', 'text/plain', 'image/svg+xml',
+}
+COMPRESS_MIN_SIZE = 1024
+BROTLI_QUALITY = 11
+GZIP_LEVEL = 9
+# Vite 产物文件名：name-<8 位十六进制哈希>.ext
+HASHED_NAME = re.compile(r'-[0-9a-f]{8,}\.[A-Za-z0-9]+$')
+IMMUTABLE_CACHE = 'public, max-age=31536000, immutable'
+REVALIDATE_CACHE = 'no-cache'
+
+
+class StaticAsset:
+    """一个静态文件：原始字节 + 各编码版本 + 强 ETag + 缓存策略"""
+
+    __slots__ = ('path', 'mimetype', 'etag', 'cache_control', 'compressible', 'variants')
+
+    def __init__(self, path, data):
+        self.path = path
+        self.mimetype = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        self.etag = hashlib.sha1(data).hexdigest()[:20]
+        hashed = path.startswith('assets/') and HASHED_NAME.search(path)
+        self.cache_control = IMMUTABLE_CACHE if hashed else REVALIDATE_CACHE
+        self.compressible = self.mimetype in COMPRESSIBLE_MIMETYPES and len(data) >= COMPRESS_MIN_SIZE
+        self.variants = {'identity': data}
+
+    def add_variant(self, encoding, data):
+        # 压缩后没有变小就不保留
+        if len(data) < len(self.variants['identity']):
+            self.variants[encoding] = data
+
+    def negotiate(self, accept_encodings):
+        for encoding in ('br', 'gzip'):
+            if encoding in self.variants and accept_encodings[encoding]:
+                return encoding
+        return 'identity'
+
+
+class StaticAssetIndex:
+    """目录下全部文件的索引，路径为相对 root 的 '/' 分隔路径"""
+
+    def __init__(self, root, precompress_brotli=True):
+        self.root = root
+        self.assets = {}
+        self._scan()
+        self.brotli_thread = None
+        if precompress_brotli and brotli is not None:
+            self.brotli_thread = threading.Thread(target=self._precompress_brotli, daemon=True)
+            self.brotli_thread.start()
+
+    def _scan(self):
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                full_path = os.path.join(dirpath, name)
+                path = os.path.relpath(full_path, self.root).replace(os.sep, '/')
+                with open(full_path, 'rb') as f:
+                    asset = StaticAsset(path, f.read())
+                if asset.compressible:
+                    asset.add_variant('gzip', gzip.compress(asset.variants['identity'], GZIP_LEVEL, mtime=0))
+                self.assets[path] = asset
+
+    def _precompress_brotli(self):
+        for asset in list(self.assets.values()):
+            if asset.compressible:
+                asset.add_variant('br', brotli.compress(asset.variants['identity'], quality=BROTLI_QUALITY))
+
+    def __contains__(self, path):
+        return path in self.assets
+
+    def response(self, path, request):
+        """
+        构造 path 对应的响应（按 Accept-Encoding 选编码，If-None-Match 命中时 304）
+        :return: Response；索引里没有该路径时返回 None
+        """
+        asset = self.assets.get(path)
+        if asset is None:
+            return None
+        encoding = asset.negotiate(request.accept_encodings)
+        # 强 ETag 按编码区分：不同编码是不同的字节序列
+        etag = asset.etag if encoding == 'identity' else f'{asset.etag}-{encoding}'
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        else:
+            response = Response(asset.variants[encoding], mimetype=asset.mimetype)
+            if encoding != 'identity':
+                response.headers['Content-Encoding'] = encoding
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = asset.cache_control
+        if asset.compressible:
+            response.vary.add('Accept-Encoding')
+        return response